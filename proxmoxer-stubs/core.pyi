@@ -21,6 +21,7 @@ class ResourceException(Exception):
     status_message: Incomplete
     content: Incomplete
     errors: Incomplete
+
     def __init__(
         self,
         status_code: Incomplete,
@@ -49,7 +50,7 @@ class ProxmoxAPI:
         host: Incomplete | None = None,
         backend: str = "https",
         service: str = "PVE",
-        **kwargs: Incomplete
+        **kwargs: Incomplete,
     ) -> None: ...
     def get_tokens(self) -> Incomplete: ...
     @cached_property
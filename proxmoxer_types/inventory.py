@@ -0,0 +1,210 @@
+import re
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Optional
+
+from .watch import Event, Watcher
+
+if TYPE_CHECKING:
+    from .v9 import ProxmoxAPI
+
+    Resource = ProxmoxAPI.Cluster.Resources._Get.TypedDict
+    Model = ProxmoxAPI.Cluster.Resources._Get.Model
+
+__all__ = ["Inventory"]
+
+GUESTS = ("qemu", "lxc", "openvz")
+# Fields of a storage whose changes can change its content listing, `disk` changes on almost every poll
+CONTENT = ("content", "status", "shared")
+
+
+def tags(value: Optional[str]) -> set[str]:
+    return {tag for tag in re.split("[;, ]+", value or "") if tag}
+
+
+@dataclass
+class Inventory:
+    api: "ProxmoxAPI"
+    # Also index guests by the storages holding their volumes, one content listing per changed storage
+    storages: bool = False
+    watcher: Optional[Watcher] = None
+    resources: dict[str, "Model"] = field(default_factory=dict)
+    by_vmid: dict[int, str] = field(default_factory=dict)
+    by_node: dict[str, set[str]] = field(default_factory=dict)
+    by_pool: dict[str, set[str]] = field(default_factory=dict)
+    by_tag: dict[str, set[str]] = field(default_factory=dict)
+    by_type: dict[str, set[str]] = field(default_factory=dict)
+    by_storage: dict[str, set[int]] = field(default_factory=dict)
+    # Storage resource id -> vmids of the guests with volumes on it
+    volumes: dict[str, set[int]] = field(default_factory=dict)
+    # Seconds after which the pool members are listed again, /cluster/resources only shows the pools of guests
+    pool_interval: float = 300.0
+
+    def __post_init__(self) -> None:
+        self.lock = threading.RLock()
+        # time.monotonic() of the last pool listing, None to list them after the next poll
+        self.pools_at: Optional[float] = None
+        if self.watcher is None:
+            self.watcher = Watcher(self.api)
+        self.watcher.subscribe(self.apply)
+        self.watcher.hooks.append(self.after_poll)
+
+    def refresh(self, pools: bool = True) -> None:
+        """Poll the watcher, `pools` lists the pool members again even if no guest changed its pool."""
+        assert self.watcher is not None
+        if pools:
+            self.pools_at = None
+        self.watcher.poll()
+
+    def start(self) -> None:
+        assert self.watcher is not None
+        self.refresh()
+        self.watcher.start()
+
+    def stop(self) -> None:
+        assert self.watcher is not None
+        self.watcher.stop()
+
+    def apply(self, event: Event) -> None:
+        storage = (
+            self.storages
+            and event.resource["type"] == "storage"
+            and (
+                event.kind != "changed" or any(key in event.changes for key in CONTENT)
+            )
+        )
+        # Listed before taking the lock, lookups do not wait for the server
+        content = self._content(event) if storage else None
+        with self.lock:
+            if event.resource["type"] in GUESTS and (
+                event.kind != "changed" or "pool" in event.changes
+            ):
+                self.pools_at = None
+            if event.kind != "added":
+                self._unindex(event.id)
+            if event.kind != "removed":
+                self._index(event.resource)
+            if storage:
+                self._volumes(event, content)
+
+    def after_poll(self, events: list[Event]) -> None:
+        if (
+            self.pools_at is None
+            or time.monotonic() - self.pools_at >= self.pool_interval
+        ):
+            self.refresh_pools()
+
+    def _keys(
+        self, model: "Model"
+    ) -> Iterable[tuple[dict[str, set[str]], Optional[str]]]:
+        yield self.by_node, model.node
+        yield self.by_type, model.type
+        for tag in tags(model.tags):
+            yield self.by_tag, tag
+
+    def _index(self, resource: "Resource") -> None:
+        from .v9 import ProxmoxAPI
+
+        model = ProxmoxAPI.Cluster.Resources._Get.Model.model_validate(resource)
+        self.resources[model.id] = model
+        if model.vmid is not None:
+            self.by_vmid[model.vmid] = model.id
+        for index, key in self._keys(model):
+            if key is not None:
+                index.setdefault(key, set()).add(model.id)
+
+    def _unindex(self, id: str) -> None:
+        model = self.resources.pop(id, None)
+        if model is None:
+            return
+        if model.vmid is not None and self.by_vmid.get(model.vmid) == id:
+            del self.by_vmid[model.vmid]
+        for index, key in self._keys(model):
+            if key is not None and key in index:
+                index[key].discard(id)
+                if not index[key]:
+                    del index[key]
+
+    def _content(self, event: Event) -> Optional[list[Any]]:
+        storage = event.resource.get("storage")
+        node = event.resource.get("node")
+        if storage is None or node is None or event.kind == "removed":
+            return None
+        if event.resource.get("status") != "available":
+            return None
+        return list(self.api.nodes(node).storage(storage).content.get())
+
+    def _volumes(self, event: Event, content: Optional[list[Any]]) -> None:
+        storage = event.resource.get("storage")
+        self.volumes.pop(event.id, None)
+        if storage is None:
+            return
+        if content is not None:
+            self.volumes[event.id] = {
+                volume["vmid"]
+                for volume in content
+                if volume.get("content") in ("images", "rootdir") and "vmid" in volume
+            }
+        # Shared storages show up once per node, a guest stays indexed while any node lists it
+        vmids: set[int] = set().union(
+            *(
+                vmids
+                for id, vmids in self.volumes.items()
+                if id.rsplit("/", 1)[-1] == storage
+            )
+        )
+        if vmids:
+            self.by_storage[storage] = vmids
+        else:
+            self.by_storage.pop(storage, None)
+
+    def refresh_pools(self) -> None:
+        """List the members of every pool, the only source of the pool index."""
+        members: dict[str, list[Any]] = {}
+        for pool in self.api.pools.get():
+            if "members" in pool:
+                members[pool["poolid"]] = list(pool["members"])
+            else:
+                members[pool["poolid"]] = list(
+                    self.api.pools(pool["poolid"]).get()["members"]
+                )
+        with self.lock:
+            # Members not seen by the watcher yet are skipped by the lookups
+            self.by_pool = {
+                poolid: {member["id"] for member in items}
+                for poolid, items in members.items()
+            }
+            self.pools_at = time.monotonic()
+
+    def _lookup(self, ids: Iterable[str]) -> list["Model"]:
+        with self.lock:
+            return [self.resources[id] for id in sorted(ids) if id in self.resources]
+
+    def vmid(self, vmid: int) -> Optional["Model"]:
+        with self.lock:
+            id = self.by_vmid.get(vmid)
+            return None if id is None else self.resources.get(id)
+
+    def node(self, node: str) -> list["Model"]:
+        return self._lookup(self.by_node.get(node, ()))
+
+    def pool(self, pool: str) -> list["Model"]:
+        return self._lookup(self.by_pool.get(pool, ()))
+
+    def tag(self, tag: str) -> list["Model"]:
+        return self._lookup(self.by_tag.get(tag, ()))
+
+    def type(self, type: str) -> list["Model"]:
+        return self._lookup(self.by_type.get(type, ()))
+
+    def storage(self, storage: str) -> list["Model"]:
+        with self.lock:
+            vmids = self.by_storage.get(storage, set())
+            return self._lookup(
+                self.by_vmid[vmid] for vmid in vmids if vmid in self.by_vmid
+            )
+
+    def guests(self) -> list["Model"]:
+        return self._lookup(id for type in GUESTS for id in self.by_type.get(type, ()))
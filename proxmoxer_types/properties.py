@@ -0,0 +1,235 @@
+"""Parsers and serializers of PVE property strings, the values of parameters like net[n].
+
+`config.get()` returns values like `virtio=BC:24:11:2E:6A:10,bridge=vmbr0,firewall=1`
+for the parameters whose schema `format` lists the keys of a property string.
+The table of a version keeps those as a Format, a PropertyString compiled from
+it parses such a value into a frozen model of typed values and dumps a model or
+a mapping back. Parsed values are memoized, the configs of many guests share
+most of theirs.
+"""
+
+import importlib
+import keyword
+import re
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Literal, Optional
+
+import pydantic
+
+from .schema import Format
+
+if TYPE_CHECKING:
+    from .v9 import ProxmoxAPI
+
+__all__ = ["PropertyString", "compiled", "dump", "parse", "parse_all"]
+
+TYPES: dict[str, Any] = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+}
+BOOLEANS = {
+    **dict.fromkeys(("1", "on", "yes", "true"), True),
+    **dict.fromkeys(("0", "off", "no", "false"), False),
+}
+# Parts of a property string, quoted values may contain commas
+PARTS = re.compile(r'(?:[^,"]|"(?:[^"\\]|\\.)*")+')
+# Values PVE only reads back quoted, those without a key also with a `=`
+QUOTED = re.compile(r'[,"]')
+UNKEYED = re.compile(r'[,"=]')
+# Configs have net0, net1, ... for the parameter net[n]
+INDEXED = re.compile(r"(.+?)\d+")
+# Parsed values kept per PropertyString
+MEMO = 1 << 16
+
+
+class Model(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(
+        extra="allow", frozen=True, populate_by_name=True, protected_namespaces=()
+    )
+
+
+def attribute(name: str) -> str:
+    """Attribute of a key in the models, like the generated models name their fields."""
+    ret = re.sub(r"[^a-zA-Z0-9-_]", "", name).replace("-", "_")
+    ret = re.sub("([a-z])([A-Z])", r"\1_\2", ret).lower()
+    while keyword.iskeyword(ret) or ret in pydantic.BaseModel.__dict__:
+        ret += "_"
+    return ret
+
+
+def unquote(value: str) -> str:
+    if value.startswith('"') and value.endswith('"') and len(value) > 1:
+        return re.sub(r"\\(.)", r"\1", value[1:-1])
+    return value
+
+
+def text(value: Any, quoted: re.Pattern[str] = QUOTED) -> str:
+    if isinstance(value, bool):
+        ret = "1" if value else "0"
+    elif isinstance(value, float) and value.is_integer():
+        ret = str(int(value))
+    else:
+        ret = str(value)
+    if quoted.search(ret):
+        return '"' + ret.replace("\\", "\\\\").replace('"', '\\"') + '"'
+    return ret
+
+
+class PropertyString:
+    """Parses and dumps the values of one Format."""
+
+    def __init__(self, format: Format) -> None:
+        self.format = format
+        self.attributes = {name: attribute(name) for name in format.keys}
+        # Keys by attribute, for mappings using those
+        self.names = {attribute: name for name, attribute in self.attributes.items()}
+        fields: dict[str, Any] = {}
+        for name, param in format.keys.items():
+            kind = Literal[param.enum] if param.enum else TYPES.get(param.type, str)
+            fields[self.attributes[name]] = (
+                Optional[kind],
+                pydantic.Field(default=None, alias=name),
+            )
+        self.model: type[Model] = pydantic.create_model(
+            "PropertyString", __base__=Model, **fields
+        )
+        self.parse = lru_cache(maxsize=MEMO)(self._parse)
+
+    def convert(self, key: str, value: str, source: str) -> Any:
+        param = self.format.keys.get(key)
+        # Keys missing from the schema are kept as they are, like the models keep unknown fields
+        if param is None or param.type not in TYPES or param.type == "string":
+            return value
+        try:
+            if param.type == "boolean":
+                return BOOLEANS[value.lower()]
+            return TYPES[param.type](value)
+        except (KeyError, ValueError):
+            raise ValueError(
+                f"{key}={value!r} in {source!r} is not a {param.type}"
+            ) from None
+
+    def values(self, source: str) -> dict[str, Any]:
+        """Values of a property string by key, converted to the types of their keys."""
+        ret: dict[str, Any] = {}
+        for part in PARTS.findall(source):
+            key, eq, value = part.partition("=")
+            if not eq or key.startswith('"'):
+                if self.format.default_key is None:
+                    raise ValueError(f"{part!r} in {source!r} has no key")
+                key, value = self.format.default_key, part
+            elif key in self.format.aliases:
+                if key in self.format.key_aliases:
+                    ret[self.format.key_aliases[key]] = key
+                key = self.format.aliases[key]
+            if key in ret:
+                raise ValueError(f"{key!r} is given twice in {source!r}")
+            ret[key] = self.convert(key, unquote(value), source)
+        return ret
+
+    def _parse(self, source: str) -> Any:
+        values = self.values(source)
+        return self.model.model_construct(
+            **{self.attributes.get(key, key): value for key, value in values.items()}
+        )
+
+    def __call__(self, source: str) -> Any:
+        """The model of a property string, shared by every caller parsing the same string."""
+        return self.parse(source)
+
+    def dump(self, values: "Mapping[str, Any] | pydantic.BaseModel") -> str:
+        """The property string of a model or of values by key or attribute, the inverse of parsing it."""
+        if isinstance(values, pydantic.BaseModel):
+            values = values.model_dump(by_alias=True)
+        pending = {
+            self.names.get(key, key): value
+            for key, value in values.items()
+            if value is not None
+        }
+        parts: list[str] = []
+        # virtio=<mac> rather than model=virtio,macaddr=<mac>, like PVE writes it
+        for alias, key in self.format.key_aliases.items():
+            if pending.get(key) == alias and self.format.aliases[alias] in pending:
+                del pending[key]
+                parts.append(f"{alias}={text(pending.pop(self.format.aliases[alias]))}")
+                break
+        else:
+            if self.format.default_key in pending:
+                parts.append(text(pending.pop(self.format.default_key), UNKEYED))
+        parts.extend(f"{key}={text(value)}" for key, value in sorted(pending.items()))
+        return ",".join(parts)
+
+
+# Formats are dicts and cannot be hashed, each is compiled once by identity and kept alive with its PropertyString
+_compiled: dict[int, tuple[Format, PropertyString]] = {}
+
+
+def compiled(format: Format) -> PropertyString:
+    entry = _compiled.get(id(format))
+    if entry is None:
+        entry = _compiled.setdefault(id(format), (format, PropertyString(format)))
+    return entry[1]
+
+
+class Config:
+    """Parses the property strings of the configs of one endpoint, e.g. /nodes/{node}/qemu/{vmid}/config."""
+
+    def __init__(self, module: str, path: str) -> None:
+        table = importlib.import_module(module.rpartition(".")[0] + ".table").ENDPOINTS
+        # The parameters of the methods writing a config describe what reading it returns
+        self.strings: dict[str, PropertyString] = {}
+        for method in table[path].values():
+            for name, param in method.params.items():
+                if isinstance(param.format, Format):
+                    self.strings.setdefault(name, compiled(param.format))
+        self.keys: dict[str, Optional[PropertyString]] = {}
+
+    def lookup(self, key: str) -> Optional[PropertyString]:
+        """The PropertyString of a key of a config, net0 is one of net[n]."""
+        if key not in self.keys:
+            match = INDEXED.fullmatch(key)
+            self.keys[key] = self.strings.get(key) or (
+                self.strings.get(match.group(1) + "[n]") if match else None
+            )
+        return self.keys[key]
+
+    def __call__(self, config: Mapping[str, Any]) -> dict[str, Any]:
+        ret = dict(config)
+        for key, value in config.items():
+            if isinstance(value, str) and (string := self.lookup(key)) is not None:
+                ret[key] = string(value)
+        return ret
+
+
+@lru_cache(maxsize=None)
+def config(module: str, path: str) -> Config:
+    return Config(module, path)
+
+
+def parse(api: "ProxmoxAPI", path: str, data: Mapping[str, Any]) -> dict[str, Any]:
+    """`data` returned by `path` with the values of its property strings parsed into models."""
+    return config(type(api).__module__, path)(data)
+
+
+def parse_all(
+    api: "ProxmoxAPI", path: str, data: Iterable[Mapping[str, Any]]
+) -> list[dict[str, Any]]:
+    """Like `parse` for the configs of many guests, the property strings are only looked up once per key."""
+    parser = config(type(api).__module__, path)
+    return [parser(each) for each in data]
+
+
+def dump(
+    api: "ProxmoxAPI",
+    path: str,
+    key: str,
+    values: "Mapping[str, Any] | pydantic.BaseModel",
+) -> str:
+    """The property string to write as `key` of `path`, e.g. net0, from a model or mapping."""
+    string = config(type(api).__module__, path).lookup(key)
+    if string is None:
+        raise ValueError(f"{key} of {path} is not a property string")
+    return string.dump(values)
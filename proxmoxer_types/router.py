@@ -0,0 +1,115 @@
+"""Typed handles for paths given as strings.
+
+proxmoxer also accepts `api("cluster/replication/some-id")` and
+`api("cluster")("replication")("some-id")`, which bypass the generated classes.
+`resolve` walks a trie of the version's endpoint manifest instead, one segment
+at a time, and returns the same handle as `api.cluster.replication("some-id")`.
+"""
+
+import importlib
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Optional
+
+from .schema import Method
+
+if TYPE_CHECKING:
+    from . import runtime
+    from .v9 import ProxmoxAPI
+
+__all__ = ["Route", "Router", "resolve", "router"]
+
+# Path parameters are passed to the handles as the generated classes annotate them
+CONVERTERS: dict[str, Callable[[str], Any]] = {"integer": int}
+
+
+@dataclass
+class Trie:
+    # Path with its parameters as in the manifest, e.g. /nodes/{node}/qemu
+    path: str
+    # Attribute of each segment from the API root, "" for a parameter
+    steps: tuple[str, ...]
+    children: dict[str, "Trie"] = field(default_factory=dict)
+    param: Optional["Trie"] = None
+    # Name and type of the parameter this node matches
+    name: str = ""
+    convert: Callable[[str], Any] = str
+
+
+@dataclass(frozen=True)
+class Route:
+    path: str
+    steps: tuple[str, ...]
+    # Parameter name -> value from the concrete path, in path order
+    params: dict[str, Any]
+
+    def handle(self, api: "ProxmoxAPI | runtime.ProxmoxAPI") -> Any:
+        ret: Any = api
+        params = iter(self.params.values())
+        for attribute in self.steps:
+            ret = getattr(ret, attribute) if attribute else ret(next(params))
+        return ret
+
+
+class Router:
+    """Routes of one API version, concrete paths are matched once and then memoized."""
+
+    def __init__(
+        self,
+        endpoints: Any,
+        table: Mapping[str, Mapping[str, Method]] = {},
+        maxsize: Optional[int] = 4096,
+    ) -> None:
+        self.root = Trie("", ())
+        nodes = {"": self.root}
+        # The manifest lists parents before their children
+        for path, attribute, _ in endpoints:
+            parent, _, segment = path.rpartition("/")
+            node = nodes[parent]
+            child = Trie(path, node.steps + (attribute,))
+            if attribute:
+                node.children[segment] = child
+            else:
+                node.param = child
+                child.name = segment.strip("{}")
+                for method in table.get(path, {}).values():
+                    if child.name in method.params:
+                        child.convert = CONVERTERS.get(
+                            method.params[child.name].type, str
+                        )
+                        break
+            nodes[path] = child
+        self.match = lru_cache(maxsize=maxsize)(self._match)
+
+    def _match(self, path: str) -> Route:
+        node = self.root
+        params: dict[str, Any] = {}
+        for segment in path.strip("/").split("/") if path.strip("/") else ():
+            # Fixed segments win over parameters, like on the server
+            child = node.children.get(segment)
+            if child is None and node.param is not None:
+                child = node.param
+                params[child.name] = child.convert(segment)
+            if child is None:
+                raise ValueError(f"No endpoint matches {path!r}")
+            node = child
+        return Route(node.path, node.steps, params)
+
+
+@lru_cache(maxsize=None)
+def router(package: str) -> Router:
+    """The router of an API version package, e.g. proxmoxer_types.v9."""
+    return Router(
+        importlib.import_module(package + ".endpoints").ENDPOINTS,
+        importlib.import_module(package + ".table").ENDPOINTS,
+    )
+
+
+def resolve(api: "ProxmoxAPI | runtime.ProxmoxAPI", *path: Any) -> Any:
+    """The handle of `api` for a path given like proxmoxer's `api(...)` takes it.
+
+    `resolve(api, "nodes/pve1/qemu")` and `resolve(api, "nodes", "pve1", "qemu")`
+    both return `api.nodes("pve1").qemu`.
+    """
+    package = type(api).__module__.rpartition(".")[0]
+    return router(package).match("/".join(map(str, path))).handle(api)
@@ -0,0 +1,263 @@
+"""Runs operations on many guests without tripping over their locks.
+
+PVE takes the config lock of a guest for snapshots, clones, migrations and
+most other changes, another operation on it fails with `VM 100 is locked`
+until the task holding the lock is done. Scheduler runs the jobs of different
+guests in parallel and the jobs of one guest one after the other, waiting for
+the task (UPID) each job starts. It caps the jobs running per node and per
+storage, and checks `lock` of `status/current` before starting a job: a locked
+guest is retried after `backoff` instead of failing on the server.
+"""
+
+import re
+import time
+from collections import Counter, deque
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from functools import partial
+from typing import TYPE_CHECKING, Any, Optional
+
+from .router import resolve
+
+if TYPE_CHECKING:
+    from .v9 import ProxmoxAPI
+
+__all__ = ["Job", "Result", "Scheduler", "wait_for"]
+
+# Errors of calls on a guest locked by another operation
+LOCKED = re.compile(r"\bis locked\b")
+
+
+@dataclass
+class Job:
+    """One operation on a guest, `call` returns the UPID of its task or its result."""
+
+    node: str
+    vmid: int
+    call: Callable[[], Any]
+    type: str = "qemu"
+    name: str = ""
+    # Storages the operation reads or writes, each job counts against their caps
+    storages: tuple[str, ...] = ()
+    # Node a migration moves the guest to, the job counts against its cap too
+    target: Optional[str] = None
+    # Times the guest was found locked
+    attempts: int = 0
+
+    @property
+    def nodes(self) -> tuple[str, ...]:
+        return (self.node,) if self.target is None else (self.node, self.target)
+
+    def __str__(self) -> str:
+        return f"{self.name or 'job'} of {self.type}/{self.vmid} on {self.node}"
+
+
+@dataclass
+class Result:
+    job: Job
+    # What the call returned, the final status of its task for a UPID
+    value: Any = None
+    error: Optional[BaseException] = None
+
+
+class Locked(Exception):
+    pass
+
+
+def wait_for(
+    api: "ProxmoxAPI", upid: str, interval: float = 1.0, timeout: Optional[float] = None
+) -> Mapping[str, Any]:
+    """The status of the task `upid` once it stopped, RuntimeError if it failed.
+
+    Tasks that stopped with `WARNINGS: <count>` succeeded, like those with `OK`.
+    """
+    # UPID:<node>:<pid>:<pstart>:<starttime>:<type>:<id>:<user>:
+    status = resolve(api, "nodes", upid.split(":")[1], "tasks", upid, "status").get
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        ret: Mapping[str, Any] = status()
+        if ret.get("status") == "stopped":
+            exitstatus = str(ret.get("exitstatus"))
+            if exitstatus != "OK" and not exitstatus.startswith("WARNINGS"):
+                raise RuntimeError(f"Task {upid} failed: {ret.get('exitstatus')}")
+            return ret
+        if deadline is not None and time.monotonic() > deadline:
+            raise TimeoutError(f"Task {upid} is still running")
+        time.sleep(interval)
+
+
+@dataclass
+class Scheduler:
+    api: "ProxmoxAPI"
+    workers: int = 16
+    # Jobs running at once per node and per storage, unless the limits by name have
+    # another cap for it, a node and a storage can share a name
+    node_limit: int = 4
+    storage_limit: int = 2
+    node_limits: dict[str, int] = field(default_factory=dict)
+    storage_limits: dict[str, int] = field(default_factory=dict)
+    # Seconds before a locked guest is checked again, and how many times
+    backoff: float = 5.0
+    retries: int = 60
+    # Seconds between polls of a running task
+    interval: float = 1.0
+    jobs: list[Job] = field(default_factory=list)
+
+    def submit(self, job: Job) -> Job:
+        self.jobs.append(job)
+        return job
+
+    def guest(self, node: str, vmid: int, type: str, *path: str) -> Any:
+        return resolve(self.api, "nodes", node, type, vmid, *path)
+
+    def snapshot(
+        self,
+        node: str,
+        vmid: int,
+        snapname: str,
+        type: str = "qemu",
+        storages: tuple[str, ...] = (),
+        **params: Any,
+    ) -> Job:
+        handle = self.guest(node, vmid, type, "snapshot")
+        call = partial(handle.post, snapname=snapname, **params)
+        return self.submit(Job(node, vmid, call, type, "snapshot", storages))
+
+    def clone(
+        self,
+        node: str,
+        vmid: int,
+        newid: int,
+        type: str = "qemu",
+        storages: tuple[str, ...] = (),
+        **params: Any,
+    ) -> Job:
+        handle = self.guest(node, vmid, type, "clone")
+        call = partial(handle.post, newid=newid, **params)
+        storages += tuple(params[key] for key in ("storage",) if key in params)
+        return self.submit(Job(node, vmid, call, type, "clone", storages))
+
+    def migrate(
+        self,
+        node: str,
+        vmid: int,
+        target: str,
+        type: str = "qemu",
+        storages: tuple[str, ...] = (),
+        **params: Any,
+    ) -> Job:
+        handle = self.guest(node, vmid, type, "migrate")
+        call = partial(handle.post, target=target, **params)
+        storages += tuple(
+            params[key] for key in ("targetstorage", "target-storage") if key in params
+        )
+        return self.submit(Job(node, vmid, call, type, "migrate", storages, target))
+
+    def resize(
+        self,
+        node: str,
+        vmid: int,
+        disk: str,
+        size: str,
+        type: str = "qemu",
+        storages: tuple[str, ...] = (),
+        **params: Any,
+    ) -> Job:
+        handle = self.guest(node, vmid, type, "resize")
+        call = partial(handle.put, disk=disk, size=size, **params)
+        return self.submit(Job(node, vmid, call, type, "resize", storages))
+
+    def update(self, node: str, vmid: int, type: str = "qemu", **values: Any) -> Job:
+        """Write the values that differ from the config, see proxmoxer_types.writes."""
+        handle = self.guest(node, vmid, type, "config")
+        call = partial(handle.put.update, **values)
+        return self.submit(Job(node, vmid, call, type, "update"))
+
+    def admits(self, job: Job, nodes: Counter[str], storages: Counter[str]) -> bool:
+        return all(
+            nodes[node] < self.node_limits.get(node, self.node_limit)
+            for node in job.nodes
+        ) and all(
+            storages[storage] < self.storage_limits.get(storage, self.storage_limit)
+            for storage in job.storages
+        )
+
+    def execute(self, job: Job) -> Any:
+        status = self.guest(job.node, job.vmid, job.type, "status", "current").get()
+        if status.get("lock"):
+            raise Locked(status["lock"])
+        try:
+            ret = job.call()
+        except Exception as error:
+            # Locked by an operation started after the check
+            if LOCKED.search(str(error)):
+                raise Locked(str(error)) from error
+            raise
+        if isinstance(ret, str) and ret.startswith("UPID:"):
+            return wait_for(self.api, ret, self.interval)
+        return ret
+
+    def run(self, jobs: Iterable[Job] = ()) -> list[Result]:
+        """Run `jobs` and the submitted ones, the results are in the order of the jobs."""
+        for job in jobs:
+            self.submit(job)
+        queued, self.jobs = self.jobs, []
+        results: list[Optional[Result]] = [None] * len(queued)
+        # Jobs by guest, in order, the first of each is the next to run
+        queues: dict[int, deque[int]] = {}
+        for index, job in enumerate(queued):
+            queues.setdefault(job.vmid, deque()).append(index)
+        # Guests found locked, by the time they are checked again
+        locked: dict[int, float] = {}
+        nodes: Counter[str] = Counter()
+        storages: Counter[str] = Counter()
+        running: dict[Future[Any], int] = {}
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            while queues or running:
+                now = time.monotonic()
+                busy = {queued[index].vmid for index in running.values()}
+                for guest, queue in list(queues.items()):
+                    job = queued[queue[0]]
+                    if len(running) >= self.workers:
+                        break
+                    if guest in busy or locked.get(guest, 0) > now:
+                        continue
+                    if not self.admits(job, nodes, storages):
+                        continue
+                    running[pool.submit(self.execute, job)] = queue.popleft()
+                    if not queue:
+                        del queues[guest]
+                    locked.pop(guest, None)
+                    nodes.update(job.nodes)
+                    storages.update(job.storages)
+                # Until the next locked guest is checked again, or a job finished
+                retry = [when - now for when in locked.values() if when > now]
+                timeout = min(retry) if retry else None
+                if not running and timeout is None:
+                    raise ValueError(
+                        f"{queued[next(iter(queues.values()))[0]]} exceeds the limits"
+                    )
+                if not running:
+                    time.sleep(timeout or 0)
+                    continue
+                done, _ = wait(running, timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    job = queued[index]
+                    nodes.subtract(job.nodes)
+                    storages.subtract(job.storages)
+                    error = future.exception()
+                    if isinstance(error, Locked) and job.attempts < self.retries:
+                        job.attempts += 1
+                        locked[job.vmid] = time.monotonic() + self.backoff
+                        queues.setdefault(job.vmid, deque()).appendleft(index)
+                    elif isinstance(error, Locked):
+                        results[index] = Result(
+                            job, error=RuntimeError(f"{job} stayed locked: {error}")
+                        )
+                    elif error is not None:
+                        results[index] = Result(job, error=error)
+                    else:
+                        results[index] = Result(job, future.result())
+        return [result for result in results if result is not None]
@@ -0,0 +1,35 @@
+from typing import NamedTuple, Optional
+
+
+class Param(NamedTuple):
+    type: str
+    optional: bool = False
+    enum: Optional[tuple[str | int, ...]] = None
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+    # Named format like pve-vmid or pve-configid-list, or the keys of a property string
+    format: "Optional[str | Format]" = None
+    # Value PVE applies when the parameter is not set, configs leave such keys out
+    default: Optional[str | int | float] = None
+
+
+class Format(NamedTuple):
+    """Keys of a property string like `virtio=BC:24:11:2E:6A:10,bridge=vmbr0,firewall=1`."""
+
+    keys: dict[str, Param]
+    # Key of a value given without one, e.g. `virtio` for model=virtio
+    default_key: Optional[str] = None
+    # Other names of keys, e.g. bps_rd_length for bps_rd_max_length
+    aliases: dict[str, str] = {}
+    # Aliases that are a value of another key themselves, e.g. virtio=<mac> is model=virtio,macaddr=<mac>
+    key_aliases: dict[str, str] = {}
+
+
+class Method(NamedTuple):
+    params: dict[str, Param]
+    # JSON schema type of the returned data
+    returns: str
+    # Properties of the returned object, or of each item of a returned array
+    fields: tuple[str, ...]
+    # Whether parameters besides `params` are accepted
+    additional: bool = False
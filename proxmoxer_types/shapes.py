@@ -0,0 +1,7099 @@
+# This file is autogenerated from apidata
+
+import pydantic
+import typing
+from typing import Any, Literal, Optional, NotRequired
+
+
+class BaseModel(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(extra="allow")
+
+
+class _Shape_463cb77526f6:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "disable": bool,
+            "id": str,
+            "port": int,
+            "server": str,
+            "type": str,
+        },
+    )
+
+    class Model(BaseModel):
+        disable: bool
+        id: str
+        port: int
+        server: str
+        type: str
+
+
+class _Shape_0afd01c3d5a7:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "corosync_authkey": str,
+            "corosync_conf": str,
+            "warnings": list[str],
+        },
+    )
+
+    class Model(BaseModel):
+        corosync_authkey: str
+        corosync_conf: str
+        warnings: list[str]
+
+
+class _Shape_2ec0018584cb:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "node": str,
+        },
+    )
+
+    class Model(BaseModel):
+        node: str
+
+
+class _Shape_728fd6efe35e:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "name": str,
+            "nodeid": NotRequired[int],
+            "pve_addr": str,
+            "pve_fp": str,
+            "quorum_votes": int,
+            "ring0_addr": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        name: str
+        nodeid: Optional[int] = None
+        pve_addr: str
+        pve_fp: str
+        quorum_votes: int
+        ring0_addr: Optional[str] = None
+
+
+class _Shape_7e5fdbf08cb2:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "action": str,
+            "comment": NotRequired[str],
+            "dest": NotRequired[str],
+            "dport": NotRequired[str],
+            "enable": NotRequired[int],
+            "icmp-type": NotRequired[str],
+            "iface": NotRequired[str],
+            "ipversion": NotRequired[int],
+            "log": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]],
+            "macro": NotRequired[str],
+            "pos": int,
+            "proto": NotRequired[str],
+            "source": NotRequired[str],
+            "sport": NotRequired[str],
+            "type": str,
+        },
+    )
+
+    class Model(BaseModel):
+        action: str
+        comment: Optional[str] = None
+        dest: Optional[str] = None
+        dport: Optional[str] = None
+        enable: Optional[int] = None
+        icmp_type: Optional[str] = pydantic.Field(alias="icmp-type", default=None)
+        iface: Optional[str] = None
+        ipversion: Optional[int] = None
+        log: Optional[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]] = None
+        macro: Optional[str] = None
+        pos: int
+        proto: Optional[str] = None
+        source: Optional[str] = None
+        sport: Optional[str] = None
+        type: str
+
+
+class _Shape_5877922db5f2:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "pos": int,
+        },
+    )
+
+    class Model(BaseModel):
+        pos: int
+
+
+class _Shape_a4d6230c98e6:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "comment": NotRequired[str],
+            "digest": str,
+            "group": str,
+        },
+    )
+
+    class Model(BaseModel):
+        comment: Optional[str] = None
+        digest: str
+        group: str
+
+
+class _Shape_f6b6fb110821:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "cidr": str,
+            "comment": NotRequired[str],
+            "digest": str,
+            "nomatch": NotRequired[bool],
+        },
+    )
+
+    class Model(BaseModel):
+        cidr: str
+        comment: Optional[str] = None
+        digest: str
+        nomatch: Optional[bool] = None
+
+
+class _Shape_709bdb2a6f84:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "comment": NotRequired[str],
+            "digest": str,
+            "name": str,
+        },
+    )
+
+    class Model(BaseModel):
+        comment: Optional[str] = None
+        digest: str
+        name: str
+
+
+class _Shape_af6cfdcc96b3:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "cidr": str,
+            "comment": NotRequired[str],
+            "digest": str,
+            "name": str,
+        },
+    )
+
+    class Model(BaseModel):
+        cidr: str
+        comment: Optional[str] = None
+        digest: str
+        name: str
+
+
+class _Shape_11d2129eade7:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "ebtables": NotRequired[bool],
+            "enable": NotRequired[int],
+            "log_ratelimit": NotRequired[str],
+            "policy_in": NotRequired[Literal["ACCEPT", "REJECT", "DROP"]],
+            "policy_out": NotRequired[Literal["ACCEPT", "REJECT", "DROP"]],
+        },
+    )
+
+    class Model(BaseModel):
+        ebtables: Optional[bool] = None
+        enable: Optional[int] = None
+        log_ratelimit: Optional[str] = None
+        policy_in: Optional[Literal["ACCEPT", "REJECT", "DROP"]] = None
+        policy_out: Optional[Literal["ACCEPT", "REJECT", "DROP"]] = None
+
+
+class _Shape_fb0f0ac4229c:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "descr": str,
+            "macro": str,
+        },
+    )
+
+    class Model(BaseModel):
+        descr: str
+        macro: str
+
+
+class _Shape_61654cb31981:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "comment": NotRequired[str],
+            "name": str,
+            "ref": str,
+            "type": Literal["alias", "ipset"],
+        },
+    )
+
+    class Model(BaseModel):
+        comment: Optional[str] = None
+        name: str
+        ref: str
+        type: Literal["alias", "ipset"]
+
+
+class _Shape_182f498e7915:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "id": str,
+            "included": bool,
+            "name": str,
+            "reason": str,
+        },
+    )
+
+    class Model(BaseModel):
+        id: str
+        included: bool
+        name: str
+        reason: str
+
+
+class _Shape_702e4ae1eff6:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "id": str,
+        },
+    )
+
+    class Model(BaseModel):
+        id: str
+
+
+class _Shape_b52d36c601b1:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "name": NotRequired[str],
+            "type": Literal["qemu", "lxc"],
+            "vmid": int,
+        },
+    )
+
+    class Model(BaseModel):
+        name: Optional[str] = None
+        type: Literal["qemu", "lxc"]
+        vmid: int
+
+
+class _Shape_b0fbd9b90b6c:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "comment": NotRequired[str],
+            "digest": str,
+            "group": NotRequired[str],
+            "max_relocate": NotRequired[int],
+            "max_restart": NotRequired[int],
+            "sid": str,
+            "state": NotRequired[Literal["started", "stopped", "enabled", "disabled", "ignored"]],
+            "type": str,
+        },
+    )
+
+    class Model(BaseModel):
+        comment: Optional[str] = None
+        digest: str
+        group: Optional[str] = None
+        max_relocate: Optional[int] = None
+        max_restart: Optional[int] = None
+        sid: str
+        state: Optional[Literal["started", "stopped", "enabled", "disabled", "ignored"]] = None
+        type: str
+
+
+class _Shape_13540329cbed:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "sid": str,
+        },
+    )
+
+    class Model(BaseModel):
+        sid: str
+
+
+class _Shape_b54c46139989:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "group": str,
+        },
+    )
+
+    class Model(BaseModel):
+        group: str
+
+
+class _Shape_55277d366b6f:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "plugin": str,
+        },
+    )
+
+    class Model(BaseModel):
+        plugin: str
+
+
+class _Shape_556bfff24545:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "account": NotRequired[dict[str, Any]],
+            "directory": NotRequired[str],
+            "location": NotRequired[str],
+            "tos": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        account: Optional[dict[str, Any]] = None
+        directory: Optional[str] = None
+        location: Optional[str] = None
+        tos: Optional[str] = None
+
+
+class _Shape_96a6222a23e9:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "name": str,
+            "url": str,
+        },
+    )
+
+    class Model(BaseModel):
+        name: str
+        url: str
+
+
+class _Shape_37b1d34686c6:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "id": str,
+            "name": str,
+            "schema": dict[str, Any],
+            "type": str,
+        },
+    )
+
+    class Model(BaseModel):
+        id: str
+        name: str
+        schema_: dict[str, Any] = pydantic.Field(alias="schema")
+        type: str
+
+
+class _Shape_1f8c107093e1:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "name": Literal["nobackfill", "nodeep-scrub", "nodown", "noin", "noout", "norebalance", "norecover", "noscrub", "notieragent", "noup", "pause"],
+        },
+    )
+
+    class Model(BaseModel):
+        name: Literal["nobackfill", "nodeep-scrub", "nodown", "noin", "noout", "norebalance", "norecover", "noscrub", "notieragent", "noup", "pause"]
+
+
+class _Shape_13d3d707cdf1:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "dns": NotRequired[str],
+            "dnszone": NotRequired[str],
+            "ipam": NotRequired[str],
+            "mtu": NotRequired[int],
+            "nodes": NotRequired[str],
+            "pending": NotRequired[dict[str, Any]],
+            "reversedns": NotRequired[str],
+            "state": NotRequired[str],
+            "type": str,
+            "zone": str,
+        },
+    )
+
+    class Model(BaseModel):
+        dns: Optional[str] = None
+        dnszone: Optional[str] = None
+        ipam: Optional[str] = None
+        mtu: Optional[int] = None
+        nodes: Optional[str] = None
+        pending: Optional[dict[str, Any]] = None
+        reversedns: Optional[str] = None
+        state: Optional[str] = None
+        type: str
+        zone: str
+
+
+class _Shape_355dc8c0da3b:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "controller": str,
+            "pending": NotRequired[dict[str, Any]],
+            "state": NotRequired[str],
+            "type": str,
+        },
+    )
+
+    class Model(BaseModel):
+        controller: str
+        pending: Optional[dict[str, Any]] = None
+        state: Optional[str] = None
+        type: str
+
+
+class _Shape_0d387c9c35df:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "ipam": str,
+            "type": str,
+        },
+    )
+
+    class Model(BaseModel):
+        ipam: str
+        type: str
+
+
+class _Shape_c0902bf1a75b:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "dns": str,
+            "type": str,
+        },
+    )
+
+    class Model(BaseModel):
+        dns: str
+        type: str
+
+
+class _Shape_f9cf3945d6fa:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "content": NotRequired[str],
+            "cpu": NotRequired[float],
+            "disk": NotRequired[str],
+            "hastate": NotRequired[str],
+            "id": str,
+            "level": NotRequired[str],
+            "maxcpu": NotRequired[float],
+            "maxdisk": NotRequired[int],
+            "maxmem": NotRequired[int],
+            "mem": NotRequired[str],
+            "node": NotRequired[str],
+            "plugintype": NotRequired[str],
+            "pool": NotRequired[str],
+            "status": NotRequired[str],
+            "storage": NotRequired[str],
+            "type": Literal["node", "storage", "pool", "qemu", "lxc", "openvz", "sdn"],
+            "uptime": NotRequired[int],
+        },
+    )
+
+    class Model(BaseModel):
+        content: Optional[str] = None
+        cpu: Optional[float] = None
+        disk: Optional[str] = None
+        hastate: Optional[str] = None
+        id: str
+        level: Optional[str] = None
+        maxcpu: Optional[float] = None
+        maxdisk: Optional[int] = None
+        maxmem: Optional[int] = None
+        mem: Optional[str] = None
+        node: Optional[str] = None
+        plugintype: Optional[str] = None
+        pool: Optional[str] = None
+        status: Optional[str] = None
+        storage: Optional[str] = None
+        type: Literal["node", "storage", "pool", "qemu", "lxc", "openvz", "sdn"]
+        uptime: Optional[int] = None
+
+
+class _Shape_009180aaaa13:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "upid": str,
+        },
+    )
+
+    class Model(BaseModel):
+        upid: str
+
+
+class _Shape_e3f29b9e2a71:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "id": str,
+            "ip": NotRequired[str],
+            "level": NotRequired[str],
+            "local": NotRequired[bool],
+            "name": str,
+            "nodeid": NotRequired[int],
+            "nodes": NotRequired[int],
+            "online": NotRequired[bool],
+            "quorate": NotRequired[bool],
+            "type": Literal["cluster", "node"],
+            "version": NotRequired[int],
+        },
+    )
+
+    class Model(BaseModel):
+        id: str
+        ip: Optional[str] = None
+        level: Optional[str] = None
+        local: Optional[bool] = None
+        name: str
+        nodeid: Optional[int] = None
+        nodes: Optional[int] = None
+        online: Optional[bool] = None
+        quorate: Optional[bool] = None
+        type: Literal["cluster", "node"]
+        version: Optional[int] = None
+
+
+class _Shape_26fca3d62f57:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "dhcp": NotRequired[bool],
+            "enable": NotRequired[bool],
+            "ipfilter": NotRequired[bool],
+            "log_level_in": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]],
+            "log_level_out": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]],
+            "macfilter": NotRequired[bool],
+            "ndp": NotRequired[bool],
+            "policy_in": NotRequired[Literal["ACCEPT", "REJECT", "DROP"]],
+            "policy_out": NotRequired[Literal["ACCEPT", "REJECT", "DROP"]],
+            "radv": NotRequired[bool],
+        },
+    )
+
+    class Model(BaseModel):
+        dhcp: Optional[bool] = None
+        enable: Optional[bool] = None
+        ipfilter: Optional[bool] = None
+        log_level_in: Optional[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]] = None
+        log_level_out: Optional[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]] = None
+        macfilter: Optional[bool] = None
+        ndp: Optional[bool] = None
+        policy_in: Optional[Literal["ACCEPT", "REJECT", "DROP"]] = None
+        policy_out: Optional[Literal["ACCEPT", "REJECT", "DROP"]] = None
+        radv: Optional[bool] = None
+
+
+class _Shape_b560f719f833:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "n": int,
+            "t": str,
+        },
+    )
+
+    class Model(BaseModel):
+        n: int
+        t: str
+
+
+class _Shape_9fe4c3fe6fcb:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "comment": NotRequired[str],
+            "name": str,
+            "type": Literal["alias", "ipset"],
+        },
+    )
+
+    class Model(BaseModel):
+        comment: Optional[str] = None
+        name: str
+        type: Literal["alias", "ipset"]
+
+
+class _Shape_d2ff7a5eb279:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "pid": int,
+        },
+    )
+
+    class Model(BaseModel):
+        pid: int
+
+
+class _Shape_74c7f5ae864e:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "err-data": NotRequired[str],
+            "err-truncated": NotRequired[bool],
+            "exitcode": NotRequired[int],
+            "exited": bool,
+            "out-data": NotRequired[str],
+            "out-truncated": NotRequired[bool],
+            "signal": NotRequired[int],
+        },
+    )
+
+    class Model(BaseModel):
+        err_data: Optional[str] = pydantic.Field(alias="err-data", default=None)
+        err_truncated: Optional[bool] = pydantic.Field(alias="err-truncated", default=None)
+        exitcode: Optional[int] = None
+        exited: bool
+        out_data: Optional[str] = pydantic.Field(alias="out-data", default=None)
+        out_truncated: Optional[bool] = pydantic.Field(alias="out-truncated", default=None)
+        signal: Optional[int] = None
+
+
+class _Shape_ee3bafa3e01e:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "content": str,
+            "truncated": NotRequired[bool],
+        },
+    )
+
+    class Model(BaseModel):
+        content: str
+        truncated: Optional[bool] = None
+
+
+class _Shape_195e3c884669:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "filename": str,
+        },
+    )
+
+    class Model(BaseModel):
+        filename: str
+
+
+class _Shape_5da43161e6de:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "acpi": NotRequired[bool],
+            "agent": NotRequired[str],
+            "arch": NotRequired[Literal["x86_64", "aarch64"]],
+            "args": NotRequired[str],
+            "audio0": NotRequired[str],
+            "autostart": NotRequired[bool],
+            "balloon": NotRequired[int],
+            "bios": NotRequired[Literal["seabios", "ovmf"]],
+            "boot": NotRequired[str],
+            "bootdisk": NotRequired[str],
+            "cdrom": NotRequired[str],
+            "cicustom": NotRequired[str],
+            "cipassword": NotRequired[str],
+            "citype": NotRequired[Literal["configdrive2", "nocloud", "opennebula"]],
+            "ciuser": NotRequired[str],
+            "cores": NotRequired[int],
+            "cpu": NotRequired[str],
+            "cpulimit": NotRequired[float],
+            "cpuunits": NotRequired[int],
+            "description": NotRequired[str],
+            "digest": str,
+            "efidisk0": NotRequired[str],
+            "freeze": NotRequired[bool],
+            "hookscript": NotRequired[str],
+            "hostpci[n]": NotRequired[str],
+            "hotplug": NotRequired[str],
+            "hugepages": NotRequired[Literal["any", "2", "1024"]],
+            "ide[n]": NotRequired[str],
+            "ipconfig[n]": NotRequired[str],
+            "ivshmem": NotRequired[str],
+            "keephugepages": NotRequired[bool],
+            "keyboard": NotRequired[Literal["de", "de-ch", "da", "en-gb", "en-us", "es", "fi", "fr", "fr-be", "fr-ca", "fr-ch", "hu", "is", "it", "ja", "lt", "mk", "nl", "no", "pl", "pt", "pt-br", "sv", "sl", "tr"]],
+            "kvm": NotRequired[bool],
+            "localtime": NotRequired[bool],
+            "lock": NotRequired[Literal["backup", "clone", "create", "migrate", "rollback", "snapshot", "snapshot-delete", "suspending", "suspended"]],
+            "machine": NotRequired[str],
+            "memory": NotRequired[int],
+            "migrate_downtime": NotRequired[float],
+            "migrate_speed": NotRequired[int],
+            "name": NotRequired[str],
+            "nameserver": NotRequired[str],
+            "net[n]": NotRequired[str],
+            "numa": NotRequired[bool],
+            "numa[n]": NotRequired[str],
+            "onboot": NotRequired[bool],
+            "ostype": NotRequired[Literal["other", "wxp", "w2k", "w2k3", "w2k8", "wvista", "win7", "win8", "win10", "l24", "l26", "solaris"]],
+            "parallel[n]": NotRequired[str],
+            "protection": NotRequired[bool],
+            "reboot": NotRequired[bool],
+            "rng0": NotRequired[str],
+            "sata[n]": NotRequired[str],
+            "scsi[n]": NotRequired[str],
+            "scsihw": NotRequired[Literal["lsi", "lsi53c810", "virtio-scsi-pci", "virtio-scsi-single", "megasas", "pvscsi"]],
+            "searchdomain": NotRequired[str],
+            "serial[n]": NotRequired[str],
+            "shares": NotRequired[int],
+            "smbios1": NotRequired[str],
+            "smp": NotRequired[int],
+            "sockets": NotRequired[int],
+            "spice_enhancements": NotRequired[str],
+            "sshkeys": NotRequired[str],
+            "startdate": NotRequired[str],
+            "startup": NotRequired[str],
+            "tablet": NotRequired[bool],
+            "tags": NotRequired[str],
+            "tdf": NotRequired[bool],
+            "template": NotRequired[bool],
+            "unused[n]": NotRequired[str],
+            "usb[n]": NotRequired[str],
+            "vcpus": NotRequired[int],
+            "vga": NotRequired[str],
+            "virtio[n]": NotRequired[str],
+            "vmgenid": NotRequired[str],
+            "vmstatestorage": NotRequired[str],
+            "watchdog": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        acpi: Optional[bool] = None
+        agent: Optional[str] = None
+        arch: Optional[Literal["x86_64", "aarch64"]] = None
+        args: Optional[str] = None
+        audio0: Optional[str] = None
+        autostart: Optional[bool] = None
+        balloon: Optional[int] = None
+        bios: Optional[Literal["seabios", "ovmf"]] = None
+        boot: Optional[str] = None
+        bootdisk: Optional[str] = None
+        cdrom: Optional[str] = None
+        cicustom: Optional[str] = None
+        cipassword: Optional[str] = None
+        citype: Optional[Literal["configdrive2", "nocloud", "opennebula"]] = None
+        ciuser: Optional[str] = None
+        cores: Optional[int] = None
+        cpu: Optional[str] = None
+        cpulimit: Optional[float] = None
+        cpuunits: Optional[int] = None
+        description: Optional[str] = None
+        digest: str
+        efidisk0: Optional[str] = None
+        freeze: Optional[bool] = None
+        hookscript: Optional[str] = None
+        hostpcin: Optional[str] = pydantic.Field(alias="hostpci[n]", default=None)
+        hotplug: Optional[str] = None
+        hugepages: Optional[Literal["any", "2", "1024"]] = None
+        iden: Optional[str] = pydantic.Field(alias="ide[n]", default=None)
+        ipconfign: Optional[str] = pydantic.Field(alias="ipconfig[n]", default=None)
+        ivshmem: Optional[str] = None
+        keephugepages: Optional[bool] = None
+        keyboard: Optional[Literal["de", "de-ch", "da", "en-gb", "en-us", "es", "fi", "fr", "fr-be", "fr-ca", "fr-ch", "hu", "is", "it", "ja", "lt", "mk", "nl", "no", "pl", "pt", "pt-br", "sv", "sl", "tr"]] = None
+        kvm: Optional[bool] = None
+        localtime: Optional[bool] = None
+        lock: Optional[Literal["backup", "clone", "create", "migrate", "rollback", "snapshot", "snapshot-delete", "suspending", "suspended"]] = None
+        machine: Optional[str] = None
+        memory: Optional[int] = None
+        migrate_downtime: Optional[float] = None
+        migrate_speed: Optional[int] = None
+        name: Optional[str] = None
+        nameserver: Optional[str] = None
+        netn: Optional[str] = pydantic.Field(alias="net[n]", default=None)
+        numa: Optional[bool] = None
+        numan: Optional[str] = pydantic.Field(alias="numa[n]", default=None)
+        onboot: Optional[bool] = None
+        ostype: Optional[Literal["other", "wxp", "w2k", "w2k3", "w2k8", "wvista", "win7", "win8", "win10", "l24", "l26", "solaris"]] = None
+        paralleln: Optional[str] = pydantic.Field(alias="parallel[n]", default=None)
+        protection: Optional[bool] = None
+        reboot: Optional[bool] = None
+        rng0: Optional[str] = None
+        satan: Optional[str] = pydantic.Field(alias="sata[n]", default=None)
+        scsin: Optional[str] = pydantic.Field(alias="scsi[n]", default=None)
+        scsihw: Optional[Literal["lsi", "lsi53c810", "virtio-scsi-pci", "virtio-scsi-single", "megasas", "pvscsi"]] = None
+        searchdomain: Optional[str] = None
+        serialn: Optional[str] = pydantic.Field(alias="serial[n]", default=None)
+        shares: Optional[int] = None
+        smbios1: Optional[str] = None
+        smp: Optional[int] = None
+        sockets: Optional[int] = None
+        spice_enhancements: Optional[str] = None
+        sshkeys: Optional[str] = None
+        startdate: Optional[str] = None
+        startup: Optional[str] = None
+        tablet: Optional[bool] = None
+        tags: Optional[str] = None
+        tdf: Optional[bool] = None
+        template: Optional[bool] = None
+        unusedn: Optional[str] = pydantic.Field(alias="unused[n]", default=None)
+        usbn: Optional[str] = pydantic.Field(alias="usb[n]", default=None)
+        vcpus: Optional[int] = None
+        vga: Optional[str] = None
+        virtion: Optional[str] = pydantic.Field(alias="virtio[n]", default=None)
+        vmgenid: Optional[str] = None
+        vmstatestorage: Optional[str] = None
+        watchdog: Optional[str] = None
+
+
+class _Shape_bacc4da88340:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "delete": NotRequired[int],
+            "key": str,
+            "pending": NotRequired[str],
+            "value": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        delete: Optional[int] = None
+        key: str
+        pending: Optional[str] = None
+        value: Optional[str] = None
+
+
+class _Shape_9dfb272673ea:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "cert": str,
+            "password": NotRequired[str],
+            "port": int,
+            "ticket": str,
+            "upid": str,
+            "user": str,
+        },
+    )
+
+    class Model(BaseModel):
+        cert: str
+        password: Optional[str] = None
+        port: int
+        ticket: str
+        upid: str
+        user: str
+
+
+class _Shape_c3611ee60687:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "port": int,
+            "ticket": str,
+            "upid": str,
+            "user": str,
+        },
+    )
+
+    class Model(BaseModel):
+        port: int
+        ticket: str
+        upid: str
+        user: str
+
+
+class _Shape_12b5d7d6b00b:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "port": str,
+        },
+    )
+
+    class Model(BaseModel):
+        port: str
+
+
+class _Shape_dc8364425177:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "host": str,
+            "password": str,
+            "proxy": str,
+            "tls-port": int,
+            "type": str,
+        },
+    )
+
+    class Model(BaseModel):
+        host: str
+        password: str
+        proxy: str
+        tls_port: int = pydantic.Field(alias="tls-port")
+        type: str
+
+
+class _Shape_bd30e27327f0:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "agent": NotRequired[bool],
+            "cpus": NotRequired[float],
+            "ha": dict[str, Any],
+            "lock": NotRequired[str],
+            "maxdisk": NotRequired[int],
+            "maxmem": NotRequired[int],
+            "name": NotRequired[str],
+            "pid": NotRequired[int],
+            "qmpstatus": NotRequired[str],
+            "running-machine": NotRequired[str],
+            "running-qemu": NotRequired[str],
+            "spice": NotRequired[bool],
+            "status": Literal["stopped", "running"],
+            "tags": NotRequired[str],
+            "uptime": NotRequired[int],
+            "vmid": int,
+        },
+    )
+
+    class Model(BaseModel):
+        agent: Optional[bool] = None
+        cpus: Optional[float] = None
+        ha: dict[str, Any]
+        lock: Optional[str] = None
+        maxdisk: Optional[int] = None
+        maxmem: Optional[int] = None
+        name: Optional[str] = None
+        pid: Optional[int] = None
+        qmpstatus: Optional[str] = None
+        running_machine: Optional[str] = pydantic.Field(alias="running-machine", default=None)
+        running_qemu: Optional[str] = pydantic.Field(alias="running-qemu", default=None)
+        spice: Optional[bool] = None
+        status: Literal["stopped", "running"]
+        tags: Optional[str] = None
+        uptime: Optional[int] = None
+        vmid: int
+
+
+class _Shape_21168c7817dc:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "subdir": str,
+        },
+    )
+
+    class Model(BaseModel):
+        subdir: str
+
+
+class _Shape_c2b9a11aac23:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "hasFeature": bool,
+            "nodes": list[str],
+        },
+    )
+
+    class Model(BaseModel):
+        has_feature: bool = pydantic.Field(alias="hasFeature")
+        nodes: list[str]
+
+
+class _Shape_94ab2a265bfa:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "allowed_nodes": NotRequired[list[Any]],
+            "local_disks": list[Any],
+            "local_resources": list[Any],
+            "not_allowed_nodes": NotRequired[dict[str, Any]],
+            "running": bool,
+        },
+    )
+
+    class Model(BaseModel):
+        allowed_nodes: Optional[list[Any]] = None
+        local_disks: list[Any]
+        local_resources: list[Any]
+        not_allowed_nodes: Optional[dict[str, Any]] = None
+        running: bool
+
+
+class _Shape_0fbc3a242dc5:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "description": str,
+            "name": str,
+            "parent": NotRequired[str],
+            "snaptime": NotRequired[int],
+            "vmstate": NotRequired[bool],
+        },
+    )
+
+    class Model(BaseModel):
+        description: str
+        name: str
+        parent: Optional[str] = None
+        snaptime: Optional[int] = None
+        vmstate: Optional[bool] = None
+
+
+class _Shape_9c21c3f5ba24:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "cpus": NotRequired[float],
+            "lock": NotRequired[str],
+            "maxdisk": NotRequired[int],
+            "maxmem": NotRequired[int],
+            "name": NotRequired[str],
+            "pid": NotRequired[int],
+            "qmpstatus": NotRequired[str],
+            "running-machine": NotRequired[str],
+            "running-qemu": NotRequired[str],
+            "status": Literal["stopped", "running"],
+            "tags": NotRequired[str],
+            "uptime": NotRequired[int],
+            "vmid": int,
+        },
+    )
+
+    class Model(BaseModel):
+        cpus: Optional[float] = None
+        lock: Optional[str] = None
+        maxdisk: Optional[int] = None
+        maxmem: Optional[int] = None
+        name: Optional[str] = None
+        pid: Optional[int] = None
+        qmpstatus: Optional[str] = None
+        running_machine: Optional[str] = pydantic.Field(alias="running-machine", default=None)
+        running_qemu: Optional[str] = pydantic.Field(alias="running-qemu", default=None)
+        status: Literal["stopped", "running"]
+        tags: Optional[str] = None
+        uptime: Optional[int] = None
+        vmid: int
+
+
+class _Shape_d0fc20c5567f:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "custom": bool,
+            "name": str,
+            "vendor": str,
+        },
+    )
+
+    class Model(BaseModel):
+        custom: bool
+        name: str
+        vendor: str
+
+
+class _Shape_cdb3e4b69b19:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "arch": NotRequired[Literal["amd64", "i386", "arm64", "armhf"]],
+            "cmode": NotRequired[Literal["shell", "console", "tty"]],
+            "console": NotRequired[bool],
+            "cores": NotRequired[int],
+            "cpulimit": NotRequired[float],
+            "cpuunits": NotRequired[int],
+            "debug": NotRequired[bool],
+            "description": NotRequired[str],
+            "digest": str,
+            "features": NotRequired[str],
+            "hookscript": NotRequired[str],
+            "hostname": NotRequired[str],
+            "lock": NotRequired[Literal["backup", "create", "destroyed", "disk", "fstrim", "migrate", "mounted", "rollback", "snapshot", "snapshot-delete"]],
+            "lxc": NotRequired[list[list[str]]],
+            "memory": NotRequired[int],
+            "mp[n]": NotRequired[str],
+            "nameserver": NotRequired[str],
+            "net[n]": NotRequired[str],
+            "onboot": NotRequired[bool],
+            "ostype": NotRequired[Literal["debian", "devuan", "ubuntu", "centos", "fedora", "opensuse", "archlinux", "alpine", "gentoo", "unmanaged"]],
+            "protection": NotRequired[bool],
+            "rootfs": NotRequired[str],
+            "searchdomain": NotRequired[str],
+            "startup": NotRequired[str],
+            "swap": NotRequired[int],
+            "tags": NotRequired[str],
+            "template": NotRequired[bool],
+            "timezone": NotRequired[str],
+            "tty": NotRequired[int],
+            "unprivileged": NotRequired[bool],
+            "unused[n]": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        arch: Optional[Literal["amd64", "i386", "arm64", "armhf"]] = None
+        cmode: Optional[Literal["shell", "console", "tty"]] = None
+        console: Optional[bool] = None
+        cores: Optional[int] = None
+        cpulimit: Optional[float] = None
+        cpuunits: Optional[int] = None
+        debug: Optional[bool] = None
+        description: Optional[str] = None
+        digest: str
+        features: Optional[str] = None
+        hookscript: Optional[str] = None
+        hostname: Optional[str] = None
+        lock: Optional[Literal["backup", "create", "destroyed", "disk", "fstrim", "migrate", "mounted", "rollback", "snapshot", "snapshot-delete"]] = None
+        lxc: Optional[list[list[str]]] = None
+        memory: Optional[int] = None
+        mpn: Optional[str] = pydantic.Field(alias="mp[n]", default=None)
+        nameserver: Optional[str] = None
+        netn: Optional[str] = pydantic.Field(alias="net[n]", default=None)
+        onboot: Optional[bool] = None
+        ostype: Optional[Literal["debian", "devuan", "ubuntu", "centos", "fedora", "opensuse", "archlinux", "alpine", "gentoo", "unmanaged"]] = None
+        protection: Optional[bool] = None
+        rootfs: Optional[str] = None
+        searchdomain: Optional[str] = None
+        startup: Optional[str] = None
+        swap: Optional[int] = None
+        tags: Optional[str] = None
+        template: Optional[bool] = None
+        timezone: Optional[str] = None
+        tty: Optional[int] = None
+        unprivileged: Optional[bool] = None
+        unusedn: Optional[str] = pydantic.Field(alias="unused[n]", default=None)
+
+
+class _Shape_781f26b56c72:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "cpus": NotRequired[float],
+            "ha": dict[str, Any],
+            "lock": NotRequired[str],
+            "maxdisk": NotRequired[int],
+            "maxmem": NotRequired[int],
+            "maxswap": NotRequired[int],
+            "name": NotRequired[str],
+            "status": Literal["stopped", "running"],
+            "tags": NotRequired[str],
+            "uptime": NotRequired[int],
+            "vmid": int,
+        },
+    )
+
+    class Model(BaseModel):
+        cpus: Optional[float] = None
+        ha: dict[str, Any]
+        lock: Optional[str] = None
+        maxdisk: Optional[int] = None
+        maxmem: Optional[int] = None
+        maxswap: Optional[int] = None
+        name: Optional[str] = None
+        status: Literal["stopped", "running"]
+        tags: Optional[str] = None
+        uptime: Optional[int] = None
+        vmid: int
+
+
+class _Shape_920bdb96bf0e:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "description": str,
+            "name": str,
+            "parent": NotRequired[str],
+            "snaptime": NotRequired[int],
+        },
+    )
+
+    class Model(BaseModel):
+        description: str
+        name: str
+        parent: Optional[str] = None
+        snaptime: Optional[int] = None
+
+
+class _Shape_4e7fdf7cf155:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "cert": str,
+            "port": int,
+            "ticket": str,
+            "upid": str,
+            "user": str,
+        },
+    )
+
+    class Model(BaseModel):
+        cert: str
+        port: int
+        ticket: str
+        upid: str
+        user: str
+
+
+class _Shape_05b47b521e27:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "hasFeature": bool,
+        },
+    )
+
+    class Model(BaseModel):
+        has_feature: bool = pydantic.Field(alias="hasFeature")
+
+
+class _Shape_02317be49d66:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "cpus": NotRequired[float],
+            "lock": NotRequired[str],
+            "maxdisk": NotRequired[int],
+            "maxmem": NotRequired[int],
+            "maxswap": NotRequired[int],
+            "name": NotRequired[str],
+            "status": Literal["stopped", "running"],
+            "tags": NotRequired[str],
+            "uptime": NotRequired[int],
+            "vmid": int,
+        },
+    )
+
+    class Model(BaseModel):
+        cpus: Optional[float] = None
+        lock: Optional[str] = None
+        maxdisk: Optional[int] = None
+        maxmem: Optional[int] = None
+        maxswap: Optional[int] = None
+        name: Optional[str] = None
+        status: Literal["stopped", "running"]
+        tags: Optional[str] = None
+        uptime: Optional[int] = None
+        vmid: int
+
+
+class _Shape_1e2723a34102:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "addr": NotRequired[str],
+            "host": NotRequired[str],
+            "name": dict[str, Any],
+            "rank": NotRequired[int],
+            "standby_replay": NotRequired[bool],
+            "state": str,
+        },
+    )
+
+    class Model(BaseModel):
+        addr: Optional[str] = None
+        host: Optional[str] = None
+        name: dict[str, Any]
+        rank: Optional[int] = None
+        standby_replay: Optional[bool] = None
+        state: str
+
+
+class _Shape_ad6c326538dd:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "addr": NotRequired[str],
+            "host": NotRequired[str],
+            "name": dict[str, Any],
+            "state": str,
+        },
+    )
+
+    class Model(BaseModel):
+        addr: Optional[str] = None
+        host: Optional[str] = None
+        name: dict[str, Any]
+        state: str
+
+
+class _Shape_bc149fed9db0:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "addr": NotRequired[str],
+            "host": NotRequired[str],
+            "name": str,
+        },
+    )
+
+    class Model(BaseModel):
+        addr: Optional[str] = None
+        host: Optional[str] = None
+        name: str
+
+
+class _Shape_dfc500b7464e:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "data_pool": str,
+            "metadata_pool": str,
+            "name": str,
+        },
+    )
+
+    class Model(BaseModel):
+        data_pool: str
+        metadata_pool: str
+        name: str
+
+
+class _Shape_7835b5fa0cd8:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "application": NotRequired[Literal["rbd", "cephfs", "rgw"]],
+            "application_list": NotRequired[list[Any]],
+            "autoscale_status": NotRequired[dict[str, Any]],
+            "crush_rule": NotRequired[str],
+            "fast_read": bool,
+            "hashpspool": bool,
+            "id": int,
+            "min_size": NotRequired[int],
+            "name": str,
+            "nodeep-scrub": bool,
+            "nodelete": bool,
+            "nopgchange": bool,
+            "noscrub": bool,
+            "nosizechange": bool,
+            "pg_autoscale_mode": NotRequired[Literal["on", "off", "warn"]],
+            "pg_num": NotRequired[int],
+            "pg_num_min": NotRequired[int],
+            "pgp_num": int,
+            "size": NotRequired[int],
+            "statistics": NotRequired[dict[str, Any]],
+            "target_size": NotRequired[str],
+            "target_size_ratio": NotRequired[float],
+            "use_gmt_hitset": bool,
+            "write_fadvise_dontneed": bool,
+        },
+    )
+
+    class Model(BaseModel):
+        application: Optional[Literal["rbd", "cephfs", "rgw"]] = None
+        application_list: Optional[list[Any]] = None
+        autoscale_status: Optional[dict[str, Any]] = None
+        crush_rule: Optional[str] = None
+        fast_read: bool
+        hashpspool: bool
+        id: int
+        min_size: Optional[int] = None
+        name: str
+        nodeep_scrub: bool = pydantic.Field(alias="nodeep-scrub")
+        nodelete: bool
+        nopgchange: bool
+        noscrub: bool
+        nosizechange: bool
+        pg_autoscale_mode: Optional[Literal["on", "off", "warn"]] = None
+        pg_num: Optional[int] = None
+        pg_num_min: Optional[int] = None
+        pgp_num: int
+        size: Optional[int] = None
+        statistics: Optional[dict[str, Any]] = None
+        target_size: Optional[str] = None
+        target_size_ratio: Optional[float] = None
+        use_gmt_hitset: bool
+        write_fadvise_dontneed: bool
+
+
+class _Shape_89d068b751be:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "autoscale_status": NotRequired[dict[str, Any]],
+            "bytes_used": int,
+            "crush_rule": int,
+            "crush_rule_name": str,
+            "min_size": int,
+            "percent_used": float,
+            "pg_autoscale_mode": NotRequired[str],
+            "pg_num": int,
+            "pg_num_final": NotRequired[int],
+            "pg_num_min": NotRequired[int],
+            "pool": int,
+            "pool_name": str,
+            "size": int,
+            "target_size": NotRequired[int],
+            "target_size_ratio": NotRequired[float],
+        },
+    )
+
+    class Model(BaseModel):
+        autoscale_status: Optional[dict[str, Any]] = None
+        bytes_used: int
+        crush_rule: int
+        crush_rule_name: str
+        min_size: int
+        percent_used: float
+        pg_autoscale_mode: Optional[str] = None
+        pg_num: int
+        pg_num_final: Optional[int] = None
+        pg_num_min: Optional[int] = None
+        pool: int
+        pool_name: str
+        size: int
+        target_size: Optional[int] = None
+        target_size_ratio: Optional[float] = None
+
+
+class _Shape_cad795fccfbf:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "dev": str,
+            "gpt": bool,
+            "model": NotRequired[str],
+            "osdid": int,
+            "serial": NotRequired[str],
+            "size": int,
+            "used": NotRequired[str],
+            "vendor": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        dev: str
+        gpt: bool
+        model: Optional[str] = None
+        osdid: int
+        serial: Optional[str] = None
+        size: int
+        used: Optional[str] = None
+        vendor: Optional[str] = None
+
+
+class _Shape_b45bfead8f69:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "can_update_at_runtime": bool,
+            "level": str,
+            "mask": str,
+            "name": str,
+            "section": str,
+            "value": str,
+        },
+    )
+
+    class Model(BaseModel):
+        can_update_at_runtime: bool
+        level: str
+        mask: str
+        name: str
+        section: str
+        value: str
+
+
+class _Shape_901c75769c7c:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "all": NotRequired[bool],
+            "bwlimit": NotRequired[int],
+            "compress": NotRequired[Literal["0", "1", "gzip", "lzo", "zstd"]],
+            "dumpdir": NotRequired[str],
+            "exclude": NotRequired[str],
+            "exclude-path": NotRequired[str],
+            "ionice": NotRequired[int],
+            "lockwait": NotRequired[int],
+            "mailnotification": NotRequired[Literal["always", "failure"]],
+            "mailto": NotRequired[str],
+            "maxfiles": NotRequired[int],
+            "mode": NotRequired[Literal["snapshot", "suspend", "stop"]],
+            "node": NotRequired[str],
+            "pigz": NotRequired[int],
+            "pool": NotRequired[str],
+            "prune-backups": NotRequired[str],
+            "quiet": NotRequired[bool],
+            "remove": NotRequired[bool],
+            "script": NotRequired[str],
+            "size": NotRequired[int],
+            "stdexcludes": NotRequired[bool],
+            "stop": NotRequired[bool],
+            "stopwait": NotRequired[int],
+            "storage": NotRequired[str],
+            "tmpdir": NotRequired[str],
+            "vmid": NotRequired[str],
+            "zstd": NotRequired[int],
+        },
+    )
+
+    class Model(BaseModel):
+        all: Optional[bool] = None
+        bwlimit: Optional[int] = None
+        compress: Optional[Literal["0", "1", "gzip", "lzo", "zstd"]] = None
+        dumpdir: Optional[str] = None
+        exclude: Optional[str] = None
+        exclude_path: Optional[str] = pydantic.Field(alias="exclude-path", default=None)
+        ionice: Optional[int] = None
+        lockwait: Optional[int] = None
+        mailnotification: Optional[Literal["always", "failure"]] = None
+        mailto: Optional[str] = None
+        maxfiles: Optional[int] = None
+        mode: Optional[Literal["snapshot", "suspend", "stop"]] = None
+        node: Optional[str] = None
+        pigz: Optional[int] = None
+        pool: Optional[str] = None
+        prune_backups: Optional[str] = pydantic.Field(alias="prune-backups", default=None)
+        quiet: Optional[bool] = None
+        remove: Optional[bool] = None
+        script: Optional[str] = None
+        size: Optional[int] = None
+        stdexcludes: Optional[bool] = None
+        stop: Optional[bool] = None
+        stopwait: Optional[int] = None
+        storage: Optional[str] = None
+        tmpdir: Optional[str] = None
+        vmid: Optional[str] = None
+        zstd: Optional[int] = None
+
+
+class _Shape_f597eedfb756:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "method": str,
+            "type": str,
+        },
+    )
+
+    class Model(BaseModel):
+        method: str
+        type: str
+
+
+class _Shape_30637af26e82:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "pid": int,
+            "status": Literal["running", "stopped"],
+        },
+    )
+
+    class Model(BaseModel):
+        pid: int
+        status: Literal["running", "stopped"]
+
+
+class _Shape_d1c6fdcbf70a:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "endtime": NotRequired[int],
+            "id": str,
+            "node": str,
+            "pid": int,
+            "pstart": int,
+            "starttime": int,
+            "status": NotRequired[str],
+            "type": str,
+            "upid": str,
+            "user": str,
+        },
+    )
+
+    class Model(BaseModel):
+        endtime: Optional[int] = None
+        id: str
+        node: str
+        pid: int
+        pstart: int
+        starttime: int
+        status: Optional[str] = None
+        type: str
+        upid: str
+        user: str
+
+
+class _Shape_951dee2df0f3:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "options": str,
+            "path": str,
+        },
+    )
+
+    class Model(BaseModel):
+        options: str
+        path: str
+
+
+class _Shape_22a5085494a7:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "description": str,
+            "share": str,
+        },
+    )
+
+    class Model(BaseModel):
+        description: str
+        share: str
+
+
+class _Shape_efbe411c27ec:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "comment": NotRequired[str],
+            "store": str,
+        },
+    )
+
+    class Model(BaseModel):
+        comment: Optional[str] = None
+        store: str
+
+
+class _Shape_6468d58335f5:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "volname": str,
+        },
+    )
+
+    class Model(BaseModel):
+        volname: str
+
+
+class _Shape_ecfc80a86311:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "portal": str,
+            "target": str,
+        },
+    )
+
+    class Model(BaseModel):
+        portal: str
+        target: str
+
+
+class _Shape_87fefc2fe99d:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "vg": str,
+        },
+    )
+
+    class Model(BaseModel):
+        vg: str
+
+
+class _Shape_af650ad299f1:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "lv": str,
+        },
+    )
+
+    class Model(BaseModel):
+        lv: str
+
+
+class _Shape_63523fe267a3:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "pool": str,
+        },
+    )
+
+    class Model(BaseModel):
+        pool: str
+
+
+class _Shape_18883e24957c:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "busnum": int,
+            "class": int,
+            "devnum": int,
+            "level": int,
+            "manufacturer": NotRequired[str],
+            "port": int,
+            "prodid": str,
+            "product": NotRequired[str],
+            "serial": NotRequired[str],
+            "speed": str,
+            "usbpath": NotRequired[str],
+            "vendid": str,
+        },
+    )
+
+    class Model(BaseModel):
+        busnum: int
+        class_: int = pydantic.Field(alias="class")
+        devnum: int
+        level: int
+        manufacturer: Optional[str] = None
+        port: int
+        prodid: str
+        product: Optional[str] = None
+        serial: Optional[str] = None
+        speed: str
+        usbpath: Optional[str] = None
+        vendid: str
+
+
+class _Shape_a03b820fd42d:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "method": str,
+        },
+    )
+
+    class Model(BaseModel):
+        method: str
+
+
+class _Shape_a1a3da066d57:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "available": int,
+            "description": str,
+            "type": str,
+        },
+    )
+
+    class Model(BaseModel):
+        available: int
+        description: str
+        type: str
+
+
+class _Shape_419343aad6c2:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "class": str,
+            "device": str,
+            "device_name": NotRequired[str],
+            "id": str,
+            "iommugroup": int,
+            "mdev": NotRequired[bool],
+            "subsystem_device": NotRequired[str],
+            "subsystem_device_name": NotRequired[str],
+            "subsystem_vendor": NotRequired[str],
+            "subsystem_vendor_name": NotRequired[str],
+            "vendor": str,
+            "vendor_name": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        class_: str = pydantic.Field(alias="class")
+        device: str
+        device_name: Optional[str] = None
+        id: str
+        iommugroup: int
+        mdev: Optional[bool] = None
+        subsystem_device: Optional[str] = None
+        subsystem_device_name: Optional[str] = None
+        subsystem_vendor: Optional[str] = None
+        subsystem_vendor_name: Optional[str] = None
+        vendor: str
+        vendor_name: Optional[str] = None
+
+
+class _Shape_0eaf87bf66e4:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "type": str,
+        },
+    )
+
+    class Model(BaseModel):
+        type: str
+
+
+class _Shape_978ba93a5918:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "id": str,
+            "type": Literal["q35", "i440fx"],
+            "version": str,
+        },
+    )
+
+    class Model(BaseModel):
+        id: str
+        type: Literal["q35", "i440fx"]
+        version: str
+
+
+class _Shape_3b67878eec8a:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "ctime": int,
+            "mark": str,
+            "type": str,
+            "vmid": NotRequired[int],
+            "volid": str,
+        },
+    )
+
+    class Model(BaseModel):
+        ctime: int
+        mark: str
+        type: str
+        vmid: Optional[int] = None
+        volid: str
+
+
+class _Shape_bfd65f10708a:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "format": str,
+            "notes": NotRequired[str],
+            "path": str,
+            "size": int,
+            "used": int,
+        },
+    )
+
+    class Model(BaseModel):
+        format: str
+        notes: Optional[str] = None
+        path: str
+        size: int
+        used: int
+
+
+class _Shape_8127656f62a8:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "state": str,
+            "upid": str,
+        },
+    )
+
+    class Model(BaseModel):
+        state: str
+        upid: str
+
+
+class _Shape_20568a4b38fb:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "filepath": str,
+            "leaf": bool,
+            "mtime": NotRequired[int],
+            "size": NotRequired[int],
+            "text": str,
+            "type": str,
+        },
+    )
+
+    class Model(BaseModel):
+        filepath: str
+        leaf: bool
+        mtime: Optional[int] = None
+        size: Optional[int] = None
+        text: str
+        type: str
+
+
+class _Shape_6ecd47a77999:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "active": NotRequired[bool],
+            "avail": NotRequired[int],
+            "content": str,
+            "enabled": NotRequired[bool],
+            "shared": NotRequired[bool],
+            "storage": str,
+            "total": NotRequired[int],
+            "type": str,
+            "used": NotRequired[int],
+            "used_fraction": NotRequired[float],
+        },
+    )
+
+    class Model(BaseModel):
+        active: Optional[bool] = None
+        avail: Optional[int] = None
+        content: str
+        enabled: Optional[bool] = None
+        shared: Optional[bool] = None
+        storage: str
+        total: Optional[int] = None
+        type: str
+        used: Optional[int] = None
+        used_fraction: Optional[float] = None
+
+
+class _Shape_21db667278d3:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "free": int,
+            "leaf": bool,
+            "name": str,
+            "size": int,
+        },
+    )
+
+    class Model(BaseModel):
+        free: int
+        leaf: bool
+        name: str
+        size: int
+
+
+class _Shape_1f4302db1f7b:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "lv": str,
+            "lv_size": int,
+            "metadata_size": int,
+            "metadata_used": int,
+            "used": int,
+        },
+    )
+
+    class Model(BaseModel):
+        lv: str
+        lv_size: int
+        metadata_size: int
+        metadata_used: int
+        used: int
+
+
+class _Shape_b2ed40ab5d55:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "device": str,
+            "options": str,
+            "path": str,
+            "type": str,
+            "unitfile": str,
+        },
+    )
+
+    class Model(BaseModel):
+        device: str
+        options: str
+        path: str
+        type: str
+        unitfile: str
+
+
+class _Shape_41cc8b5da1b3:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "cksum": NotRequired[float],
+            "msg": str,
+            "name": str,
+            "read": NotRequired[float],
+            "state": NotRequired[str],
+            "write": NotRequired[float],
+        },
+    )
+
+    class Model(BaseModel):
+        cksum: Optional[float] = None
+        msg: str
+        name: str
+        read: Optional[float] = None
+        state: Optional[str] = None
+        write: Optional[float] = None
+
+
+class _Shape_c314c8f1fa2e:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "alloc": int,
+            "dedup": float,
+            "frag": int,
+            "free": int,
+            "health": str,
+            "name": str,
+            "size": int,
+        },
+    )
+
+    class Model(BaseModel):
+        alloc: int
+        dedup: float
+        frag: int
+        free: int
+        health: str
+        name: str
+        size: int
+
+
+class _Shape_ea2a97ee69ac:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "devpath": str,
+            "gpt": bool,
+            "health": NotRequired[str],
+            "model": NotRequired[str],
+            "osdid": int,
+            "parent": NotRequired[str],
+            "serial": NotRequired[str],
+            "size": int,
+            "used": NotRequired[str],
+            "vendor": NotRequired[str],
+            "wwn": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        devpath: str
+        gpt: bool
+        health: Optional[str] = None
+        model: Optional[str] = None
+        osdid: int
+        parent: Optional[str] = None
+        serial: Optional[str] = None
+        size: int
+        used: Optional[str] = None
+        vendor: Optional[str] = None
+        wwn: Optional[str] = None
+
+
+class _Shape_ea3b1d934b75:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "attributes": NotRequired[list[Any]],
+            "health": str,
+            "text": NotRequired[str],
+            "type": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        attributes: Optional[list[Any]] = None
+        health: str
+        text: Optional[str] = None
+        type: Optional[str] = None
+
+
+class _Shape_2476a3ff7fe8:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "enable": NotRequired[bool],
+            "log_level_in": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]],
+            "log_level_out": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]],
+            "log_nf_conntrack": NotRequired[bool],
+            "ndp": NotRequired[bool],
+            "nf_conntrack_allow_invalid": NotRequired[bool],
+            "nf_conntrack_max": NotRequired[int],
+            "nf_conntrack_tcp_timeout_established": NotRequired[int],
+            "nf_conntrack_tcp_timeout_syn_recv": NotRequired[int],
+            "nosmurfs": NotRequired[bool],
+            "protection_synflood": NotRequired[bool],
+            "protection_synflood_burst": NotRequired[int],
+            "protection_synflood_rate": NotRequired[int],
+            "smurf_log_level": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]],
+            "tcp_flags_log_level": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]],
+            "tcpflags": NotRequired[bool],
+        },
+    )
+
+    class Model(BaseModel):
+        enable: Optional[bool] = None
+        log_level_in: Optional[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]] = None
+        log_level_out: Optional[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]] = None
+        log_nf_conntrack: Optional[bool] = None
+        ndp: Optional[bool] = None
+        nf_conntrack_allow_invalid: Optional[bool] = None
+        nf_conntrack_max: Optional[int] = None
+        nf_conntrack_tcp_timeout_established: Optional[int] = None
+        nf_conntrack_tcp_timeout_syn_recv: Optional[int] = None
+        nosmurfs: Optional[bool] = None
+        protection_synflood: Optional[bool] = None
+        protection_synflood_burst: Optional[int] = None
+        protection_synflood_rate: Optional[int] = None
+        smurf_log_level: Optional[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]] = None
+        tcp_flags_log_level: Optional[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]] = None
+        tcpflags: Optional[bool] = None
+
+
+class _Shape_58ab2e2fa2d1:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "filename": NotRequired[str],
+            "fingerprint": NotRequired[str],
+            "issuer": NotRequired[str],
+            "notafter": NotRequired[int],
+            "notbefore": NotRequired[int],
+            "pem": NotRequired[str],
+            "public-key-bits": NotRequired[int],
+            "public-key-type": NotRequired[str],
+            "san": NotRequired[list[str]],
+            "subject": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        filename: Optional[str] = None
+        fingerprint: Optional[str] = None
+        issuer: Optional[str] = None
+        notafter: Optional[int] = None
+        notbefore: Optional[int] = None
+        pem: Optional[str] = None
+        public_key_bits: Optional[int] = pydantic.Field(alias="public-key-bits", default=None)
+        public_key_type: Optional[str] = pydantic.Field(alias="public-key-type", default=None)
+        san: Optional[list[str]] = None
+        subject: Optional[str] = None
+
+
+class _Shape_8995825a45a7:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "status": NotRequired[str],
+            "statusmsg": NotRequired[str],
+            "vnet": str,
+        },
+    )
+
+    class Model(BaseModel):
+        status: Optional[str] = None
+        statusmsg: Optional[str] = None
+        vnet: str
+
+
+class _Shape_d504837c3718:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "status": Literal["available", "pending", "error"],
+            "zone": str,
+        },
+    )
+
+    class Model(BaseModel):
+        status: Literal["available", "pending", "error"]
+        zone: str
+
+
+class _Shape_baee350ed80d:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "release": str,
+            "repoid": str,
+            "version": str,
+        },
+    )
+
+    class Model(BaseModel):
+        release: str
+        repoid: str
+        version: str
+
+
+class _Shape_e0e1c8b9f8bf:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "dns1": NotRequired[str],
+            "dns2": NotRequired[str],
+            "dns3": NotRequired[str],
+            "search": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        dns1: Optional[str] = None
+        dns2: Optional[str] = None
+        dns3: Optional[str] = None
+        search: Optional[str] = None
+
+
+class _Shape_186ba101f850:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "localtime": int,
+            "time": int,
+            "timezone": str,
+        },
+    )
+
+    class Model(BaseModel):
+        localtime: int
+        time: int
+        timezone: str
+
+
+class _Shape_56515a7944bc:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "data": str,
+            "digest": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        data: str
+        digest: Optional[str] = None
+
+
+class _Shape_867ed03f1f46:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "cpu": NotRequired[float],
+            "level": NotRequired[str],
+            "maxcpu": NotRequired[int],
+            "maxmem": NotRequired[int],
+            "mem": NotRequired[int],
+            "node": str,
+            "ssl_fingerprint": NotRequired[str],
+            "status": Literal["unknown", "online", "offline"],
+            "uptime": NotRequired[int],
+        },
+    )
+
+    class Model(BaseModel):
+        cpu: Optional[float] = None
+        level: Optional[str] = None
+        maxcpu: Optional[int] = None
+        maxmem: Optional[int] = None
+        mem: Optional[int] = None
+        node: str
+        ssl_fingerprint: Optional[str] = None
+        status: Literal["unknown", "online", "offline"]
+        uptime: Optional[int] = None
+
+
+class _Shape_fe9b69a05735:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "encryption-key": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        encryption_key: Optional[str] = pydantic.Field(alias="encryption-key", default=None)
+
+
+class _Shape_9a9d76fce64f:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "storage": str,
+        },
+    )
+
+    class Model(BaseModel):
+        storage: str
+
+
+class _Shape_e2b8a05a87fa:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "realm": NotRequired[Literal["oath", "yubico"]],
+            "user": NotRequired[Literal["oath", "u2f"]],
+        },
+    )
+
+    class Model(BaseModel):
+        realm: Optional[Literal["oath", "yubico"]] = None
+        user: Optional[Literal["oath", "u2f"]] = None
+
+
+class _Shape_93f23838fd43:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "comment": NotRequired[str],
+            "expire": NotRequired[int],
+            "privsep": NotRequired[bool],
+        },
+    )
+
+    class Model(BaseModel):
+        comment: Optional[str] = None
+        expire: Optional[int] = None
+        privsep: Optional[bool] = None
+
+
+class _Shape_af70406a9c0c:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "comment": NotRequired[str],
+            "expire": NotRequired[int],
+            "privsep": NotRequired[bool],
+            "tokenid": str,
+        },
+    )
+
+    class Model(BaseModel):
+        comment: Optional[str] = None
+        expire: Optional[int] = None
+        privsep: Optional[bool] = None
+        tokenid: str
+
+
+class _Shape_b028974f88f3:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "comment": NotRequired[str],
+            "email": NotRequired[str],
+            "enable": NotRequired[bool],
+            "expire": NotRequired[int],
+            "firstname": NotRequired[str],
+            "groups": NotRequired[list[str]],
+            "keys": NotRequired[str],
+            "lastname": NotRequired[str],
+            "tokens": NotRequired[dict[str, Any]],
+        },
+    )
+
+    class Model(BaseModel):
+        comment: Optional[str] = None
+        email: Optional[str] = None
+        enable: Optional[bool] = None
+        expire: Optional[int] = None
+        firstname: Optional[str] = None
+        groups: Optional[list[str]] = None
+        keys: Optional[str] = None
+        lastname: Optional[str] = None
+        tokens: Optional[dict[str, Any]] = None
+
+
+class _Shape_76b1caeaf614:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "comment": NotRequired[str],
+            "members": list[str],
+        },
+    )
+
+    class Model(BaseModel):
+        comment: Optional[str] = None
+        members: list[str]
+
+
+class _Shape_070300131d0a:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "comment": NotRequired[str],
+            "groupid": str,
+            "users": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        comment: Optional[str] = None
+        groupid: str
+        users: Optional[str] = None
+
+
+class _Shape_368864b683ee:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "Datastore.Allocate": NotRequired[bool],
+            "Datastore.AllocateSpace": NotRequired[bool],
+            "Datastore.AllocateTemplate": NotRequired[bool],
+            "Datastore.Audit": NotRequired[bool],
+            "Group.Allocate": NotRequired[bool],
+            "Permissions.Modify": NotRequired[bool],
+            "Pool.Allocate": NotRequired[bool],
+            "Realm.Allocate": NotRequired[bool],
+            "Realm.AllocateUser": NotRequired[bool],
+            "SDN.Allocate": NotRequired[bool],
+            "SDN.Audit": NotRequired[bool],
+            "Sys.Audit": NotRequired[bool],
+            "Sys.Console": NotRequired[bool],
+            "Sys.Modify": NotRequired[bool],
+            "Sys.PowerMgmt": NotRequired[bool],
+            "Sys.Syslog": NotRequired[bool],
+            "User.Modify": NotRequired[bool],
+            "VM.Allocate": NotRequired[bool],
+            "VM.Audit": NotRequired[bool],
+            "VM.Backup": NotRequired[bool],
+            "VM.Clone": NotRequired[bool],
+            "VM.Config.CDROM": NotRequired[bool],
+            "VM.Config.CPU": NotRequired[bool],
+            "VM.Config.Cloudinit": NotRequired[bool],
+            "VM.Config.Disk": NotRequired[bool],
+            "VM.Config.HWType": NotRequired[bool],
+            "VM.Config.Memory": NotRequired[bool],
+            "VM.Config.Network": NotRequired[bool],
+            "VM.Config.Options": NotRequired[bool],
+            "VM.Console": NotRequired[bool],
+            "VM.Migrate": NotRequired[bool],
+            "VM.Monitor": NotRequired[bool],
+            "VM.PowerMgmt": NotRequired[bool],
+            "VM.Snapshot": NotRequired[bool],
+            "VM.Snapshot.Rollback": NotRequired[bool],
+        },
+    )
+
+    class Model(BaseModel):
+        datastore_allocate: Optional[bool] = pydantic.Field(alias="Datastore.Allocate", default=None)
+        datastore_allocate_space: Optional[bool] = pydantic.Field(alias="Datastore.AllocateSpace", default=None)
+        datastore_allocate_template: Optional[bool] = pydantic.Field(alias="Datastore.AllocateTemplate", default=None)
+        datastore_audit: Optional[bool] = pydantic.Field(alias="Datastore.Audit", default=None)
+        group_allocate: Optional[bool] = pydantic.Field(alias="Group.Allocate", default=None)
+        permissions_modify: Optional[bool] = pydantic.Field(alias="Permissions.Modify", default=None)
+        pool_allocate: Optional[bool] = pydantic.Field(alias="Pool.Allocate", default=None)
+        realm_allocate: Optional[bool] = pydantic.Field(alias="Realm.Allocate", default=None)
+        realm_allocate_user: Optional[bool] = pydantic.Field(alias="Realm.AllocateUser", default=None)
+        sdnallocate: Optional[bool] = pydantic.Field(alias="SDN.Allocate", default=None)
+        sdnaudit: Optional[bool] = pydantic.Field(alias="SDN.Audit", default=None)
+        sys_audit: Optional[bool] = pydantic.Field(alias="Sys.Audit", default=None)
+        sys_console: Optional[bool] = pydantic.Field(alias="Sys.Console", default=None)
+        sys_modify: Optional[bool] = pydantic.Field(alias="Sys.Modify", default=None)
+        sys_power_mgmt: Optional[bool] = pydantic.Field(alias="Sys.PowerMgmt", default=None)
+        sys_syslog: Optional[bool] = pydantic.Field(alias="Sys.Syslog", default=None)
+        user_modify: Optional[bool] = pydantic.Field(alias="User.Modify", default=None)
+        vmallocate: Optional[bool] = pydantic.Field(alias="VM.Allocate", default=None)
+        vmaudit: Optional[bool] = pydantic.Field(alias="VM.Audit", default=None)
+        vmbackup: Optional[bool] = pydantic.Field(alias="VM.Backup", default=None)
+        vmclone: Optional[bool] = pydantic.Field(alias="VM.Clone", default=None)
+        vmconfig_cdrom: Optional[bool] = pydantic.Field(alias="VM.Config.CDROM", default=None)
+        vmconfig_cpu: Optional[bool] = pydantic.Field(alias="VM.Config.CPU", default=None)
+        vmconfig_cloudinit: Optional[bool] = pydantic.Field(alias="VM.Config.Cloudinit", default=None)
+        vmconfig_disk: Optional[bool] = pydantic.Field(alias="VM.Config.Disk", default=None)
+        vmconfig_hwtype: Optional[bool] = pydantic.Field(alias="VM.Config.HWType", default=None)
+        vmconfig_memory: Optional[bool] = pydantic.Field(alias="VM.Config.Memory", default=None)
+        vmconfig_network: Optional[bool] = pydantic.Field(alias="VM.Config.Network", default=None)
+        vmconfig_options: Optional[bool] = pydantic.Field(alias="VM.Config.Options", default=None)
+        vmconsole: Optional[bool] = pydantic.Field(alias="VM.Console", default=None)
+        vmmigrate: Optional[bool] = pydantic.Field(alias="VM.Migrate", default=None)
+        vmmonitor: Optional[bool] = pydantic.Field(alias="VM.Monitor", default=None)
+        vmpower_mgmt: Optional[bool] = pydantic.Field(alias="VM.PowerMgmt", default=None)
+        vmsnapshot: Optional[bool] = pydantic.Field(alias="VM.Snapshot", default=None)
+        vmsnapshot_rollback: Optional[bool] = pydantic.Field(alias="VM.Snapshot.Rollback", default=None)
+
+
+class _Shape_2497f36a10fe:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "privs": NotRequired[str],
+            "roleid": str,
+            "special": NotRequired[bool],
+        },
+    )
+
+    class Model(BaseModel):
+        privs: Optional[str] = None
+        roleid: str
+        special: Optional[bool] = None
+
+
+class _Shape_5dbfbf17504e:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "path": str,
+            "propagate": NotRequired[bool],
+            "roleid": str,
+            "type": Literal["user", "group", "token"],
+            "ugid": str,
+        },
+    )
+
+    class Model(BaseModel):
+        path: str
+        propagate: Optional[bool] = None
+        roleid: str
+        type: Literal["user", "group", "token"]
+        ugid: str
+
+
+class _Shape_e5c39a307fd9:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "comment": NotRequired[str],
+            "realm": str,
+            "tfa": NotRequired[Literal["yubico", "oath"]],
+            "type": str,
+        },
+    )
+
+    class Model(BaseModel):
+        comment: Optional[str] = None
+        realm: str
+        tfa: Optional[Literal["yubico", "oath"]] = None
+        type: str
+
+
+class _Shape_6c06835384ca:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "CSRFPreventionToken": NotRequired[str],
+            "clustername": NotRequired[str],
+            "ticket": NotRequired[str],
+            "username": str,
+        },
+    )
+
+    class Model(BaseModel):
+        csrfprevention_token: Optional[str] = pydantic.Field(alias="CSRFPreventionToken", default=None)
+        clustername: Optional[str] = None
+        ticket: Optional[str] = None
+        username: str
+
+
+class _Shape_389a53d40a35:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "ticket": str,
+        },
+    )
+
+    class Model(BaseModel):
+        ticket: str
+
+
+class _Shape_de9df6c83931:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "id": str,
+            "node": str,
+            "storage": NotRequired[str],
+            "type": Literal["qemu", "lxc", "openvz", "storage"],
+            "vmid": NotRequired[int],
+        },
+    )
+
+    class Model(BaseModel):
+        id: str
+        node: str
+        storage: Optional[str] = None
+        type: Literal["qemu", "lxc", "openvz", "storage"]
+        vmid: Optional[int] = None
+
+
+class _Shape_d971ba613d4f:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "poolid": str,
+        },
+    )
+
+    class Model(BaseModel):
+        poolid: str
+
+
+class _Shape_f7ba3b1bf24d:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "addr": str,
+            "ceph_release": str,
+            "ceph_version": str,
+            "ceph_version_short": str,
+            "hostname": str,
+            "mem_swap_kb": int,
+            "mem_total_kb": int,
+            "name": str,
+        },
+    )
+
+    class Model(BaseModel):
+        addr: str
+        ceph_release: str
+        ceph_version: str
+        ceph_version_short: str
+        hostname: str
+        mem_swap_kb: int
+        mem_total_kb: int
+        name: str
+
+
+class _Shape_0614073e3be8:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "addrs": str,
+            "ceph_release": str,
+            "ceph_version": str,
+            "ceph_version_short": str,
+            "hostname": str,
+            "mem_swap_kb": int,
+            "mem_total_kb": int,
+            "name": str,
+        },
+    )
+
+    class Model(BaseModel):
+        addrs: str
+        ceph_release: str
+        ceph_version: str
+        ceph_version_short: str
+        hostname: str
+        mem_swap_kb: int
+        mem_total_kb: int
+        name: str
+
+
+class _Shape_b11033e1fa8d:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "parts": list[Any],
+            "str": str,
+        },
+    )
+
+    class Model(BaseModel):
+        parts: list[Any]
+        str: str
+
+
+class _Shape_0e3824cb199e:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "description": str,
+            "name": Literal["nobackfill", "nodeep-scrub", "nodown", "noin", "noout", "norebalance", "norecover", "noscrub", "notieragent", "noup", "pause"],
+            "value": bool,
+        },
+    )
+
+    class Model(BaseModel):
+        description: str
+        name: Literal["nobackfill", "nodeep-scrub", "nodown", "noin", "noout", "norebalance", "norecover", "noscrub", "notieragent", "noup", "pause"]
+        value: bool
+
+
+class _Shape_b5f0ee8b1fbc:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "timestamp": int,
+            "utc": str,
+        },
+    )
+
+    class Model(BaseModel):
+        timestamp: int
+        utc: str
+
+
+class _Shape_fffc6b1a745c:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "cgroup-mode": NotRequired[int],
+            "content": NotRequired[str],
+            "cpu": NotRequired[float],
+            "disk": NotRequired[int],
+            "hastate": NotRequired[str],
+            "id": str,
+            "level": NotRequired[str],
+            "maxcpu": NotRequired[float],
+            "maxdisk": NotRequired[int],
+            "maxmem": NotRequired[int],
+            "mem": NotRequired[int],
+            "name": NotRequired[str],
+            "node": NotRequired[str],
+            "plugintype": NotRequired[str],
+            "pool": NotRequired[str],
+            "status": NotRequired[str],
+            "storage": NotRequired[str],
+            "type": Literal["node", "storage", "pool", "qemu", "lxc", "openvz", "sdn"],
+            "uptime": NotRequired[int],
+            "vmid": NotRequired[int],
+        },
+    )
+
+    class Model(BaseModel):
+        cgroup_mode: Optional[int] = pydantic.Field(alias="cgroup-mode", default=None)
+        content: Optional[str] = None
+        cpu: Optional[float] = None
+        disk: Optional[int] = None
+        hastate: Optional[str] = None
+        id: str
+        level: Optional[str] = None
+        maxcpu: Optional[float] = None
+        maxdisk: Optional[int] = None
+        maxmem: Optional[int] = None
+        mem: Optional[int] = None
+        name: Optional[str] = None
+        node: Optional[str] = None
+        plugintype: Optional[str] = None
+        pool: Optional[str] = None
+        status: Optional[str] = None
+        storage: Optional[str] = None
+        type: Literal["node", "storage", "pool", "qemu", "lxc", "openvz", "sdn"]
+        uptime: Optional[int] = None
+        vmid: Optional[int] = None
+
+
+class _Shape_044561fde191:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "acpi": NotRequired[bool],
+            "affinity": NotRequired[str],
+            "agent": NotRequired[str],
+            "arch": NotRequired[Literal["x86_64", "aarch64"]],
+            "args": NotRequired[str],
+            "audio0": NotRequired[str],
+            "autostart": NotRequired[bool],
+            "balloon": NotRequired[int],
+            "bios": NotRequired[Literal["seabios", "ovmf"]],
+            "boot": NotRequired[str],
+            "bootdisk": NotRequired[str],
+            "cdrom": NotRequired[str],
+            "cicustom": NotRequired[str],
+            "cipassword": NotRequired[str],
+            "citype": NotRequired[Literal["configdrive2", "nocloud", "opennebula"]],
+            "ciuser": NotRequired[str],
+            "cores": NotRequired[int],
+            "cpu": NotRequired[str],
+            "cpulimit": NotRequired[float],
+            "cpuunits": NotRequired[int],
+            "description": NotRequired[str],
+            "digest": str,
+            "efidisk0": NotRequired[str],
+            "freeze": NotRequired[bool],
+            "hookscript": NotRequired[str],
+            "hostpci[n]": NotRequired[str],
+            "hotplug": NotRequired[str],
+            "hugepages": NotRequired[Literal["any", "2", "1024"]],
+            "ide[n]": NotRequired[str],
+            "ipconfig[n]": NotRequired[str],
+            "ivshmem": NotRequired[str],
+            "keephugepages": NotRequired[bool],
+            "keyboard": NotRequired[Literal["de", "de-ch", "da", "en-gb", "en-us", "es", "fi", "fr", "fr-be", "fr-ca", "fr-ch", "hu", "is", "it", "ja", "lt", "mk", "nl", "no", "pl", "pt", "pt-br", "sv", "sl", "tr"]],
+            "kvm": NotRequired[bool],
+            "localtime": NotRequired[bool],
+            "lock": NotRequired[Literal["backup", "clone", "create", "migrate", "rollback", "snapshot", "snapshot-delete", "suspending", "suspended"]],
+            "machine": NotRequired[str],
+            "memory": NotRequired[int],
+            "migrate_downtime": NotRequired[float],
+            "migrate_speed": NotRequired[int],
+            "name": NotRequired[str],
+            "nameserver": NotRequired[str],
+            "net[n]": NotRequired[str],
+            "numa": NotRequired[bool],
+            "numa[n]": NotRequired[str],
+            "onboot": NotRequired[bool],
+            "ostype": NotRequired[Literal["other", "wxp", "w2k", "w2k3", "w2k8", "wvista", "win7", "win8", "win10", "win11", "l24", "l26", "solaris"]],
+            "parallel[n]": NotRequired[str],
+            "protection": NotRequired[bool],
+            "reboot": NotRequired[bool],
+            "rng0": NotRequired[str],
+            "sata[n]": NotRequired[str],
+            "scsi[n]": NotRequired[str],
+            "scsihw": NotRequired[Literal["lsi", "lsi53c810", "virtio-scsi-pci", "virtio-scsi-single", "megasas", "pvscsi"]],
+            "searchdomain": NotRequired[str],
+            "serial[n]": NotRequired[str],
+            "shares": NotRequired[int],
+            "smbios1": NotRequired[str],
+            "smp": NotRequired[int],
+            "sockets": NotRequired[int],
+            "spice_enhancements": NotRequired[str],
+            "sshkeys": NotRequired[str],
+            "startdate": NotRequired[str],
+            "startup": NotRequired[str],
+            "tablet": NotRequired[bool],
+            "tags": NotRequired[str],
+            "tdf": NotRequired[bool],
+            "template": NotRequired[bool],
+            "tpmstate0": NotRequired[str],
+            "unused[n]": NotRequired[str],
+            "usb[n]": NotRequired[str],
+            "vcpus": NotRequired[int],
+            "vga": NotRequired[str],
+            "virtio[n]": NotRequired[str],
+            "vmgenid": NotRequired[str],
+            "vmstatestorage": NotRequired[str],
+            "watchdog": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        acpi: Optional[bool] = None
+        affinity: Optional[str] = None
+        agent: Optional[str] = None
+        arch: Optional[Literal["x86_64", "aarch64"]] = None
+        args: Optional[str] = None
+        audio0: Optional[str] = None
+        autostart: Optional[bool] = None
+        balloon: Optional[int] = None
+        bios: Optional[Literal["seabios", "ovmf"]] = None
+        boot: Optional[str] = None
+        bootdisk: Optional[str] = None
+        cdrom: Optional[str] = None
+        cicustom: Optional[str] = None
+        cipassword: Optional[str] = None
+        citype: Optional[Literal["configdrive2", "nocloud", "opennebula"]] = None
+        ciuser: Optional[str] = None
+        cores: Optional[int] = None
+        cpu: Optional[str] = None
+        cpulimit: Optional[float] = None
+        cpuunits: Optional[int] = None
+        description: Optional[str] = None
+        digest: str
+        efidisk0: Optional[str] = None
+        freeze: Optional[bool] = None
+        hookscript: Optional[str] = None
+        hostpcin: Optional[str] = pydantic.Field(alias="hostpci[n]", default=None)
+        hotplug: Optional[str] = None
+        hugepages: Optional[Literal["any", "2", "1024"]] = None
+        iden: Optional[str] = pydantic.Field(alias="ide[n]", default=None)
+        ipconfign: Optional[str] = pydantic.Field(alias="ipconfig[n]", default=None)
+        ivshmem: Optional[str] = None
+        keephugepages: Optional[bool] = None
+        keyboard: Optional[Literal["de", "de-ch", "da", "en-gb", "en-us", "es", "fi", "fr", "fr-be", "fr-ca", "fr-ch", "hu", "is", "it", "ja", "lt", "mk", "nl", "no", "pl", "pt", "pt-br", "sv", "sl", "tr"]] = None
+        kvm: Optional[bool] = None
+        localtime: Optional[bool] = None
+        lock: Optional[Literal["backup", "clone", "create", "migrate", "rollback", "snapshot", "snapshot-delete", "suspending", "suspended"]] = None
+        machine: Optional[str] = None
+        memory: Optional[int] = None
+        migrate_downtime: Optional[float] = None
+        migrate_speed: Optional[int] = None
+        name: Optional[str] = None
+        nameserver: Optional[str] = None
+        netn: Optional[str] = pydantic.Field(alias="net[n]", default=None)
+        numa: Optional[bool] = None
+        numan: Optional[str] = pydantic.Field(alias="numa[n]", default=None)
+        onboot: Optional[bool] = None
+        ostype: Optional[Literal["other", "wxp", "w2k", "w2k3", "w2k8", "wvista", "win7", "win8", "win10", "win11", "l24", "l26", "solaris"]] = None
+        paralleln: Optional[str] = pydantic.Field(alias="parallel[n]", default=None)
+        protection: Optional[bool] = None
+        reboot: Optional[bool] = None
+        rng0: Optional[str] = None
+        satan: Optional[str] = pydantic.Field(alias="sata[n]", default=None)
+        scsin: Optional[str] = pydantic.Field(alias="scsi[n]", default=None)
+        scsihw: Optional[Literal["lsi", "lsi53c810", "virtio-scsi-pci", "virtio-scsi-single", "megasas", "pvscsi"]] = None
+        searchdomain: Optional[str] = None
+        serialn: Optional[str] = pydantic.Field(alias="serial[n]", default=None)
+        shares: Optional[int] = None
+        smbios1: Optional[str] = None
+        smp: Optional[int] = None
+        sockets: Optional[int] = None
+        spice_enhancements: Optional[str] = None
+        sshkeys: Optional[str] = None
+        startdate: Optional[str] = None
+        startup: Optional[str] = None
+        tablet: Optional[bool] = None
+        tags: Optional[str] = None
+        tdf: Optional[bool] = None
+        template: Optional[bool] = None
+        tpmstate0: Optional[str] = None
+        unusedn: Optional[str] = pydantic.Field(alias="unused[n]", default=None)
+        usbn: Optional[str] = pydantic.Field(alias="usb[n]", default=None)
+        vcpus: Optional[int] = None
+        vga: Optional[str] = None
+        virtion: Optional[str] = pydantic.Field(alias="virtio[n]", default=None)
+        vmgenid: Optional[str] = None
+        vmstatestorage: Optional[str] = None
+        watchdog: Optional[str] = None
+
+
+class _Shape_a7863d601e3b:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "key": str,
+            "new": NotRequired[str],
+            "old": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        key: str
+        new: Optional[str] = None
+        old: Optional[str] = None
+
+
+class _Shape_4cc707acfd15:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "socket": str,
+            "ticket": str,
+            "upid": str,
+        },
+    )
+
+    class Model(BaseModel):
+        socket: str
+        ticket: str
+        upid: str
+
+
+class _Shape_c2b2dde606ed:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "port": NotRequired[str],
+            "socket": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        port: Optional[str] = None
+        socket: Optional[str] = None
+
+
+class _Shape_6bf535accd55:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "arch": NotRequired[Literal["amd64", "i386", "arm64", "armhf", "riscv32", "riscv64"]],
+            "cmode": NotRequired[Literal["shell", "console", "tty"]],
+            "console": NotRequired[bool],
+            "cores": NotRequired[int],
+            "cpulimit": NotRequired[float],
+            "cpuunits": NotRequired[int],
+            "debug": NotRequired[bool],
+            "description": NotRequired[str],
+            "digest": str,
+            "features": NotRequired[str],
+            "hookscript": NotRequired[str],
+            "hostname": NotRequired[str],
+            "lock": NotRequired[Literal["backup", "create", "destroyed", "disk", "fstrim", "migrate", "mounted", "rollback", "snapshot", "snapshot-delete"]],
+            "lxc": NotRequired[list[list[str]]],
+            "memory": NotRequired[int],
+            "mp[n]": NotRequired[str],
+            "nameserver": NotRequired[str],
+            "net[n]": NotRequired[str],
+            "onboot": NotRequired[bool],
+            "ostype": NotRequired[Literal["debian", "devuan", "ubuntu", "centos", "fedora", "opensuse", "archlinux", "alpine", "gentoo", "nixos", "unmanaged"]],
+            "protection": NotRequired[bool],
+            "rootfs": NotRequired[str],
+            "searchdomain": NotRequired[str],
+            "startup": NotRequired[str],
+            "swap": NotRequired[int],
+            "tags": NotRequired[str],
+            "template": NotRequired[bool],
+            "timezone": NotRequired[str],
+            "tty": NotRequired[int],
+            "unprivileged": NotRequired[bool],
+            "unused[n]": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        arch: Optional[Literal["amd64", "i386", "arm64", "armhf", "riscv32", "riscv64"]] = None
+        cmode: Optional[Literal["shell", "console", "tty"]] = None
+        console: Optional[bool] = None
+        cores: Optional[int] = None
+        cpulimit: Optional[float] = None
+        cpuunits: Optional[int] = None
+        debug: Optional[bool] = None
+        description: Optional[str] = None
+        digest: str
+        features: Optional[str] = None
+        hookscript: Optional[str] = None
+        hostname: Optional[str] = None
+        lock: Optional[Literal["backup", "create", "destroyed", "disk", "fstrim", "migrate", "mounted", "rollback", "snapshot", "snapshot-delete"]] = None
+        lxc: Optional[list[list[str]]] = None
+        memory: Optional[int] = None
+        mpn: Optional[str] = pydantic.Field(alias="mp[n]", default=None)
+        nameserver: Optional[str] = None
+        netn: Optional[str] = pydantic.Field(alias="net[n]", default=None)
+        onboot: Optional[bool] = None
+        ostype: Optional[Literal["debian", "devuan", "ubuntu", "centos", "fedora", "opensuse", "archlinux", "alpine", "gentoo", "nixos", "unmanaged"]] = None
+        protection: Optional[bool] = None
+        rootfs: Optional[str] = None
+        searchdomain: Optional[str] = None
+        startup: Optional[str] = None
+        swap: Optional[int] = None
+        tags: Optional[str] = None
+        template: Optional[bool] = None
+        timezone: Optional[str] = None
+        tty: Optional[int] = None
+        unprivileged: Optional[bool] = None
+        unusedn: Optional[str] = pydantic.Field(alias="unused[n]", default=None)
+
+
+class _Shape_c878c26ec1c0:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "dev_node": str,
+            "device": Literal["block", "db", "wal"],
+            "devices": str,
+            "size": int,
+            "support_discard": bool,
+            "type": str,
+        },
+    )
+
+    class Model(BaseModel):
+        dev_node: str
+        device: Literal["block", "db", "wal"]
+        devices: str
+        size: int
+        support_discard: bool
+        type: str
+
+
+class _Shape_e5ada466df01:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "back_addr": str,
+            "front_addr": str,
+            "hb_back_addr": str,
+            "hb_front_addr": str,
+            "hostname": str,
+            "id": int,
+            "mem_usage": int,
+            "osd_data": str,
+            "osd_objectstore": str,
+            "pid": int,
+            "version": str,
+        },
+    )
+
+    class Model(BaseModel):
+        back_addr: str
+        front_addr: str
+        hb_back_addr: str
+        hb_front_addr: str
+        hostname: str
+        id: int
+        mem_usage: int
+        osd_data: str
+        osd_objectstore: str
+        pid: int
+        version: str
+
+
+class _Shape_2af89e151d82:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "creation_time": str,
+            "lv_name": str,
+            "lv_path": str,
+            "lv_size": int,
+            "lv_uuid": str,
+            "vg_name": str,
+        },
+    )
+
+    class Model(BaseModel):
+        creation_time: str
+        lv_name: str
+        lv_path: str
+        lv_size: int
+        lv_uuid: str
+        vg_name: str
+
+
+class _Shape_0aa8c9ab0cf3:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "addr": NotRequired[str],
+            "ceph_version": NotRequired[str],
+            "ceph_version_short": NotRequired[str],
+            "direxists": NotRequired[str],
+            "host": NotRequired[bool],
+            "name": str,
+            "quorum": NotRequired[bool],
+            "rank": NotRequired[int],
+            "service": NotRequired[int],
+            "state": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        addr: Optional[str] = None
+        ceph_version: Optional[str] = None
+        ceph_version_short: Optional[str] = None
+        direxists: Optional[str] = None
+        host: Optional[bool] = None
+        name: str
+        quorum: Optional[bool] = None
+        rank: Optional[int] = None
+        service: Optional[int] = None
+        state: Optional[str] = None
+
+
+class _Shape_c5362201c150:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "application_metadata": NotRequired[dict[str, Any]],
+            "autoscale_status": NotRequired[dict[str, Any]],
+            "bytes_used": int,
+            "crush_rule": int,
+            "crush_rule_name": str,
+            "min_size": int,
+            "percent_used": float,
+            "pg_autoscale_mode": NotRequired[str],
+            "pg_num": int,
+            "pg_num_final": NotRequired[int],
+            "pg_num_min": NotRequired[int],
+            "pool": int,
+            "pool_name": str,
+            "size": int,
+            "target_size": NotRequired[int],
+            "target_size_ratio": NotRequired[float],
+            "type": Literal["replicated", "erasure", "unknown"],
+        },
+    )
+
+    class Model(BaseModel):
+        application_metadata: Optional[dict[str, Any]] = None
+        autoscale_status: Optional[dict[str, Any]] = None
+        bytes_used: int
+        crush_rule: int
+        crush_rule_name: str
+        min_size: int
+        percent_used: float
+        pg_autoscale_mode: Optional[str] = None
+        pg_num: int
+        pg_num_final: Optional[int] = None
+        pg_num_min: Optional[int] = None
+        pool: int
+        pool_name: str
+        size: int
+        target_size: Optional[int] = None
+        target_size_ratio: Optional[float] = None
+        type: Literal["replicated", "erasure", "unknown"]
+
+
+class _Shape_7e076d4d2657:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "name": str,
+        },
+    )
+
+    class Model(BaseModel):
+        name: str
+
+
+class _Shape_26bae438332d:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "safe": bool,
+            "status": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        safe: bool
+        status: Optional[str] = None
+
+
+class _Shape_5a1d72923938:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "all": NotRequired[bool],
+            "bwlimit": NotRequired[int],
+            "compress": NotRequired[Literal["0", "1", "gzip", "lzo", "zstd"]],
+            "dumpdir": NotRequired[str],
+            "exclude": NotRequired[str],
+            "exclude-path": NotRequired[str],
+            "ionice": NotRequired[int],
+            "lockwait": NotRequired[int],
+            "mailnotification": NotRequired[Literal["always", "failure"]],
+            "mailto": NotRequired[str],
+            "maxfiles": NotRequired[int],
+            "mode": NotRequired[Literal["snapshot", "suspend", "stop"]],
+            "node": NotRequired[str],
+            "notes-template": NotRequired[str],
+            "performance": NotRequired[str],
+            "pigz": NotRequired[int],
+            "pool": NotRequired[str],
+            "protected": NotRequired[bool],
+            "prune-backups": NotRequired[str],
+            "quiet": NotRequired[bool],
+            "remove": NotRequired[bool],
+            "script": NotRequired[str],
+            "stdexcludes": NotRequired[bool],
+            "stop": NotRequired[bool],
+            "stopwait": NotRequired[int],
+            "storage": NotRequired[str],
+            "tmpdir": NotRequired[str],
+            "vmid": NotRequired[str],
+            "zstd": NotRequired[int],
+        },
+    )
+
+    class Model(BaseModel):
+        all: Optional[bool] = None
+        bwlimit: Optional[int] = None
+        compress: Optional[Literal["0", "1", "gzip", "lzo", "zstd"]] = None
+        dumpdir: Optional[str] = None
+        exclude: Optional[str] = None
+        exclude_path: Optional[str] = pydantic.Field(alias="exclude-path", default=None)
+        ionice: Optional[int] = None
+        lockwait: Optional[int] = None
+        mailnotification: Optional[Literal["always", "failure"]] = None
+        mailto: Optional[str] = None
+        maxfiles: Optional[int] = None
+        mode: Optional[Literal["snapshot", "suspend", "stop"]] = None
+        node: Optional[str] = None
+        notes_template: Optional[str] = pydantic.Field(alias="notes-template", default=None)
+        performance: Optional[str] = None
+        pigz: Optional[int] = None
+        pool: Optional[str] = None
+        protected: Optional[bool] = None
+        prune_backups: Optional[str] = pydantic.Field(alias="prune-backups", default=None)
+        quiet: Optional[bool] = None
+        remove: Optional[bool] = None
+        script: Optional[str] = None
+        stdexcludes: Optional[bool] = None
+        stop: Optional[bool] = None
+        stopwait: Optional[int] = None
+        storage: Optional[str] = None
+        tmpdir: Optional[str] = None
+        vmid: Optional[str] = None
+        zstd: Optional[int] = None
+
+
+class _Shape_0f99954aa8f3:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "exitstatus": NotRequired[str],
+            "id": str,
+            "node": str,
+            "pid": int,
+            "starttime": float,
+            "status": Literal["running", "stopped"],
+            "type": str,
+            "upid": str,
+            "user": str,
+        },
+    )
+
+    class Model(BaseModel):
+        exitstatus: Optional[str] = None
+        id: str
+        node: str
+        pid: int
+        starttime: float
+        status: Literal["running", "stopped"]
+        type: str
+        upid: str
+        user: str
+
+
+class _Shape_2c35ca4d4ce2:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "ctime": int,
+            "mark": Literal["keep", "remove", "protected", "renamed"],
+            "type": str,
+            "vmid": NotRequired[int],
+            "volid": str,
+        },
+    )
+
+    class Model(BaseModel):
+        ctime: int
+        mark: Literal["keep", "remove", "protected", "renamed"]
+        type: str
+        vmid: Optional[int] = None
+        volid: str
+
+
+class _Shape_b9422774550e:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "format": str,
+            "notes": NotRequired[str],
+            "path": str,
+            "protected": NotRequired[bool],
+            "size": int,
+            "used": int,
+        },
+    )
+
+    class Model(BaseModel):
+        format: str
+        notes: Optional[str] = None
+        path: str
+        protected: Optional[bool] = None
+        size: int
+        used: int
+
+
+class _Shape_5e9d3b631702:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "lv": str,
+            "lv_size": int,
+            "metadata_size": int,
+            "metadata_used": int,
+            "used": int,
+            "vg": str,
+        },
+    )
+
+    class Model(BaseModel):
+        lv: str
+        lv_size: int
+        metadata_size: int
+        metadata_used: int
+        used: int
+        vg: str
+
+
+class _Shape_ea402d50634b:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "devpath": str,
+            "gpt": bool,
+            "health": NotRequired[str],
+            "model": NotRequired[str],
+            "mounted": bool,
+            "osdid": int,
+            "parent": NotRequired[str],
+            "serial": NotRequired[str],
+            "size": int,
+            "used": NotRequired[str],
+            "vendor": NotRequired[str],
+            "wwn": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        devpath: str
+        gpt: bool
+        health: Optional[str] = None
+        model: Optional[str] = None
+        mounted: bool
+        osdid: int
+        parent: Optional[str] = None
+        serial: Optional[str] = None
+        size: int
+        used: Optional[str] = None
+        vendor: Optional[str] = None
+        wwn: Optional[str] = None
+
+
+class _Shape_3ce1a87b05d2:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "error": str,
+            "path": str,
+        },
+    )
+
+    class Model(BaseModel):
+        error: str
+        path: str
+
+
+class _Shape_1c53eea58c6c:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "Key": str,
+            "Values": list[str],
+        },
+    )
+
+    class Model(BaseModel):
+        key: str = pydantic.Field(alias="Key")
+        values: list[str] = pydantic.Field(alias="Values")
+
+
+class _Shape_7e5a751f69a7:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "index": str,
+            "kind": str,
+            "message": str,
+            "path": str,
+            "property": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        index: str
+        kind: str
+        message: str
+        path: str
+        property: Optional[str] = None
+
+
+class _Shape_4f4c2003f26f:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "handle": str,
+            "name": str,
+            "status": NotRequired[bool],
+        },
+    )
+
+    class Model(BaseModel):
+        handle: str
+        name: str
+        status: Optional[bool] = None
+
+
+class _Shape_efdd4563c08f:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "enable": NotRequired[bool],
+            "log_level_in": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]],
+            "log_level_out": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]],
+            "log_nf_conntrack": NotRequired[bool],
+            "ndp": NotRequired[bool],
+            "nf_conntrack_allow_invalid": NotRequired[bool],
+            "nf_conntrack_helpers": NotRequired[str],
+            "nf_conntrack_max": NotRequired[int],
+            "nf_conntrack_tcp_timeout_established": NotRequired[int],
+            "nf_conntrack_tcp_timeout_syn_recv": NotRequired[int],
+            "nosmurfs": NotRequired[bool],
+            "protection_synflood": NotRequired[bool],
+            "protection_synflood_burst": NotRequired[int],
+            "protection_synflood_rate": NotRequired[int],
+            "smurf_log_level": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]],
+            "tcp_flags_log_level": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]],
+            "tcpflags": NotRequired[bool],
+        },
+    )
+
+    class Model(BaseModel):
+        enable: Optional[bool] = None
+        log_level_in: Optional[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]] = None
+        log_level_out: Optional[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]] = None
+        log_nf_conntrack: Optional[bool] = None
+        ndp: Optional[bool] = None
+        nf_conntrack_allow_invalid: Optional[bool] = None
+        nf_conntrack_helpers: Optional[str] = None
+        nf_conntrack_max: Optional[int] = None
+        nf_conntrack_tcp_timeout_established: Optional[int] = None
+        nf_conntrack_tcp_timeout_syn_recv: Optional[int] = None
+        nosmurfs: Optional[bool] = None
+        protection_synflood: Optional[bool] = None
+        protection_synflood_burst: Optional[int] = None
+        protection_synflood_rate: Optional[int] = None
+        smurf_log_level: Optional[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]] = None
+        tcp_flags_log_level: Optional[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]] = None
+        tcpflags: Optional[bool] = None
+
+
+class _Shape_1cc52a7485fa:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "acme": NotRequired[str],
+            "acmedomain[n]": NotRequired[str],
+            "description": NotRequired[str],
+            "digest": NotRequired[str],
+            "startall-onboot-delay": NotRequired[int],
+            "wakeonlan": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        acme: Optional[str] = None
+        acmedomainn: Optional[str] = pydantic.Field(alias="acmedomain[n]", default=None)
+        description: Optional[str] = None
+        digest: Optional[str] = None
+        startall_onboot_delay: Optional[int] = pydantic.Field(alias="startall-onboot-delay", default=None)
+        wakeonlan: Optional[str] = None
+
+
+class _Shape_93b6fbad9fd6:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "filename": NotRequired[str],
+            "mimetype": NotRequired[str],
+            "size": NotRequired[int],
+        },
+    )
+
+    class Model(BaseModel):
+        filename: Optional[str] = None
+        mimetype: Optional[str] = None
+        size: Optional[int] = None
+
+
+class _Shape_35673131a7bf:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "realm": NotRequired[Literal["oath", "yubico"]],
+            "types": NotRequired[list[Literal["totp", "u2f", "yubico", "webauthn", "recovedry"]]],
+            "user": NotRequired[Literal["oath", "u2f"]],
+        },
+    )
+
+    class Model(BaseModel):
+        realm: Optional[Literal["oath", "yubico"]] = None
+        types: Optional[list[Literal["totp", "u2f", "yubico", "webauthn", "recovedry"]]] = None
+        user: Optional[Literal["oath", "u2f"]] = None
+
+
+class _Shape_41e71c1b3513:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "Datastore.Allocate": NotRequired[bool],
+            "Datastore.AllocateSpace": NotRequired[bool],
+            "Datastore.AllocateTemplate": NotRequired[bool],
+            "Datastore.Audit": NotRequired[bool],
+            "Group.Allocate": NotRequired[bool],
+            "Permissions.Modify": NotRequired[bool],
+            "Pool.Allocate": NotRequired[bool],
+            "Pool.Audit": NotRequired[bool],
+            "Realm.Allocate": NotRequired[bool],
+            "Realm.AllocateUser": NotRequired[bool],
+            "SDN.Allocate": NotRequired[bool],
+            "SDN.Audit": NotRequired[bool],
+            "Sys.Audit": NotRequired[bool],
+            "Sys.Console": NotRequired[bool],
+            "Sys.Incoming": NotRequired[bool],
+            "Sys.Modify": NotRequired[bool],
+            "Sys.PowerMgmt": NotRequired[bool],
+            "Sys.Syslog": NotRequired[bool],
+            "User.Modify": NotRequired[bool],
+            "VM.Allocate": NotRequired[bool],
+            "VM.Audit": NotRequired[bool],
+            "VM.Backup": NotRequired[bool],
+            "VM.Clone": NotRequired[bool],
+            "VM.Config.CDROM": NotRequired[bool],
+            "VM.Config.CPU": NotRequired[bool],
+            "VM.Config.Cloudinit": NotRequired[bool],
+            "VM.Config.Disk": NotRequired[bool],
+            "VM.Config.HWType": NotRequired[bool],
+            "VM.Config.Memory": NotRequired[bool],
+            "VM.Config.Network": NotRequired[bool],
+            "VM.Config.Options": NotRequired[bool],
+            "VM.Console": NotRequired[bool],
+            "VM.Migrate": NotRequired[bool],
+            "VM.Monitor": NotRequired[bool],
+            "VM.PowerMgmt": NotRequired[bool],
+            "VM.Snapshot": NotRequired[bool],
+            "VM.Snapshot.Rollback": NotRequired[bool],
+        },
+    )
+
+    class Model(BaseModel):
+        datastore_allocate: Optional[bool] = pydantic.Field(alias="Datastore.Allocate", default=None)
+        datastore_allocate_space: Optional[bool] = pydantic.Field(alias="Datastore.AllocateSpace", default=None)
+        datastore_allocate_template: Optional[bool] = pydantic.Field(alias="Datastore.AllocateTemplate", default=None)
+        datastore_audit: Optional[bool] = pydantic.Field(alias="Datastore.Audit", default=None)
+        group_allocate: Optional[bool] = pydantic.Field(alias="Group.Allocate", default=None)
+        permissions_modify: Optional[bool] = pydantic.Field(alias="Permissions.Modify", default=None)
+        pool_allocate: Optional[bool] = pydantic.Field(alias="Pool.Allocate", default=None)
+        pool_audit: Optional[bool] = pydantic.Field(alias="Pool.Audit", default=None)
+        realm_allocate: Optional[bool] = pydantic.Field(alias="Realm.Allocate", default=None)
+        realm_allocate_user: Optional[bool] = pydantic.Field(alias="Realm.AllocateUser", default=None)
+        sdnallocate: Optional[bool] = pydantic.Field(alias="SDN.Allocate", default=None)
+        sdnaudit: Optional[bool] = pydantic.Field(alias="SDN.Audit", default=None)
+        sys_audit: Optional[bool] = pydantic.Field(alias="Sys.Audit", default=None)
+        sys_console: Optional[bool] = pydantic.Field(alias="Sys.Console", default=None)
+        sys_incoming: Optional[bool] = pydantic.Field(alias="Sys.Incoming", default=None)
+        sys_modify: Optional[bool] = pydantic.Field(alias="Sys.Modify", default=None)
+        sys_power_mgmt: Optional[bool] = pydantic.Field(alias="Sys.PowerMgmt", default=None)
+        sys_syslog: Optional[bool] = pydantic.Field(alias="Sys.Syslog", default=None)
+        user_modify: Optional[bool] = pydantic.Field(alias="User.Modify", default=None)
+        vmallocate: Optional[bool] = pydantic.Field(alias="VM.Allocate", default=None)
+        vmaudit: Optional[bool] = pydantic.Field(alias="VM.Audit", default=None)
+        vmbackup: Optional[bool] = pydantic.Field(alias="VM.Backup", default=None)
+        vmclone: Optional[bool] = pydantic.Field(alias="VM.Clone", default=None)
+        vmconfig_cdrom: Optional[bool] = pydantic.Field(alias="VM.Config.CDROM", default=None)
+        vmconfig_cpu: Optional[bool] = pydantic.Field(alias="VM.Config.CPU", default=None)
+        vmconfig_cloudinit: Optional[bool] = pydantic.Field(alias="VM.Config.Cloudinit", default=None)
+        vmconfig_disk: Optional[bool] = pydantic.Field(alias="VM.Config.Disk", default=None)
+        vmconfig_hwtype: Optional[bool] = pydantic.Field(alias="VM.Config.HWType", default=None)
+        vmconfig_memory: Optional[bool] = pydantic.Field(alias="VM.Config.Memory", default=None)
+        vmconfig_network: Optional[bool] = pydantic.Field(alias="VM.Config.Network", default=None)
+        vmconfig_options: Optional[bool] = pydantic.Field(alias="VM.Config.Options", default=None)
+        vmconsole: Optional[bool] = pydantic.Field(alias="VM.Console", default=None)
+        vmmigrate: Optional[bool] = pydantic.Field(alias="VM.Migrate", default=None)
+        vmmonitor: Optional[bool] = pydantic.Field(alias="VM.Monitor", default=None)
+        vmpower_mgmt: Optional[bool] = pydantic.Field(alias="VM.PowerMgmt", default=None)
+        vmsnapshot: Optional[bool] = pydantic.Field(alias="VM.Snapshot", default=None)
+        vmsnapshot_rollback: Optional[bool] = pydantic.Field(alias="VM.Snapshot.Rollback", default=None)
+
+
+class _Shape_d13dd09b3bf1:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "CSRFPreventionToken": str,
+            "cap": dict[str, Any],
+            "clustername": NotRequired[str],
+            "ticket": str,
+            "username": str,
+        },
+    )
+
+    class Model(BaseModel):
+        csrfprevention_token: str = pydantic.Field(alias="CSRFPreventionToken")
+        cap: dict[str, Any]
+        clustername: Optional[str] = None
+        ticket: str
+        username: str
+
+
+class _Shape_809c16077bea:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "created": int,
+            "description": str,
+            "enable": NotRequired[bool],
+            "id": str,
+            "type": Literal["totp", "u2f", "webauthn", "recovery", "yubico"],
+        },
+    )
+
+    class Model(BaseModel):
+        created: int
+        description: str
+        enable: Optional[bool] = None
+        id: str
+        type: Literal["totp", "u2f", "webauthn", "recovery", "yubico"]
+
+
+class _Shape_99c983b71887:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "challenge": NotRequired[str],
+            "id": str,
+            "recovery": NotRequired[list[str]],
+        },
+    )
+
+    class Model(BaseModel):
+        challenge: Optional[str] = None
+        id: str
+        recovery: Optional[list[str]] = None
+
+
+class _Shape_a1e8e1ea0f3c:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "console": NotRequired[Literal["applet", "vv", "html5", "xtermjs"]],
+            "release": str,
+            "repoid": str,
+            "version": str,
+        },
+    )
+
+    class Model(BaseModel):
+        console: Optional[Literal["applet", "vv", "html5", "xtermjs"]] = None
+        release: str
+        repoid: str
+        version: str
+
+
+class _Shape_edea002acdb6:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "id": str,
+            "metric": str,
+            "timestamp": int,
+            "type": Literal["gauge", "counter", "derive"],
+            "value": float,
+        },
+    )
+
+    class Model(BaseModel):
+        id: str
+        metric: str
+        timestamp: int
+        type: Literal["gauge", "counter", "derive"]
+        value: float
+
+
+class _Shape_9007792d8ac7:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "comment": NotRequired[str],
+            "field": str,
+            "value": str,
+        },
+    )
+
+    class Model(BaseModel):
+        comment: Optional[str] = None
+        field: str
+        value: str
+
+
+class _Shape_72db08b30812:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "author": NotRequired[str],
+            "comment": NotRequired[str],
+            "digest": NotRequired[str],
+            "disable": NotRequired[bool],
+            "from-address": NotRequired[str],
+            "mailto": NotRequired[list[str]],
+            "mailto-user": NotRequired[list[str]],
+            "name": str,
+        },
+    )
+
+    class Model(BaseModel):
+        author: Optional[str] = None
+        comment: Optional[str] = None
+        digest: Optional[str] = None
+        disable: Optional[bool] = None
+        from_address: Optional[str] = pydantic.Field(alias="from-address", default=None)
+        mailto: Optional[list[str]] = None
+        mailto_user: Optional[list[str]] = pydantic.Field(alias="mailto-user", default=None)
+        name: str
+
+
+class _Shape_8d4b95494c0c:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "author": NotRequired[str],
+            "comment": NotRequired[str],
+            "disable": NotRequired[bool],
+            "from-address": NotRequired[str],
+            "mailto": NotRequired[list[str]],
+            "mailto-user": NotRequired[list[str]],
+            "name": str,
+            "origin": Literal["user-created", "builtin", "modified-builtin"],
+        },
+    )
+
+    class Model(BaseModel):
+        author: Optional[str] = None
+        comment: Optional[str] = None
+        disable: Optional[bool] = None
+        from_address: Optional[str] = pydantic.Field(alias="from-address", default=None)
+        mailto: Optional[list[str]] = None
+        mailto_user: Optional[list[str]] = pydantic.Field(alias="mailto-user", default=None)
+        name: str
+        origin: Literal["user-created", "builtin", "modified-builtin"]
+
+
+class _Shape_e74999d13f12:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "comment": NotRequired[str],
+            "digest": NotRequired[str],
+            "disable": NotRequired[bool],
+            "name": str,
+            "server": str,
+        },
+    )
+
+    class Model(BaseModel):
+        comment: Optional[str] = None
+        digest: Optional[str] = None
+        disable: Optional[bool] = None
+        name: str
+        server: str
+
+
+class _Shape_d5a2e3de7e1a:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "comment": NotRequired[str],
+            "disable": NotRequired[bool],
+            "name": str,
+            "origin": Literal["user-created", "builtin", "modified-builtin"],
+            "server": str,
+        },
+    )
+
+    class Model(BaseModel):
+        comment: Optional[str] = None
+        disable: Optional[bool] = None
+        name: str
+        origin: Literal["user-created", "builtin", "modified-builtin"]
+        server: str
+
+
+class _Shape_e44e0648d3a1:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "author": NotRequired[str],
+            "comment": NotRequired[str],
+            "digest": NotRequired[str],
+            "disable": NotRequired[bool],
+            "from-address": str,
+            "mailto": NotRequired[list[str]],
+            "mailto-user": NotRequired[list[str]],
+            "mode": NotRequired[Literal["insecure", "starttls", "tls"]],
+            "name": str,
+            "port": NotRequired[int],
+            "server": str,
+            "username": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        author: Optional[str] = None
+        comment: Optional[str] = None
+        digest: Optional[str] = None
+        disable: Optional[bool] = None
+        from_address: str = pydantic.Field(alias="from-address")
+        mailto: Optional[list[str]] = None
+        mailto_user: Optional[list[str]] = pydantic.Field(alias="mailto-user", default=None)
+        mode: Optional[Literal["insecure", "starttls", "tls"]] = None
+        name: str
+        port: Optional[int] = None
+        server: str
+        username: Optional[str] = None
+
+
+class _Shape_9b7935286c62:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "author": NotRequired[str],
+            "comment": NotRequired[str],
+            "disable": NotRequired[bool],
+            "from-address": str,
+            "mailto": NotRequired[list[str]],
+            "mailto-user": NotRequired[list[str]],
+            "mode": NotRequired[Literal["insecure", "starttls", "tls"]],
+            "name": str,
+            "origin": Literal["user-created", "builtin", "modified-builtin"],
+            "port": NotRequired[int],
+            "server": str,
+            "username": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        author: Optional[str] = None
+        comment: Optional[str] = None
+        disable: Optional[bool] = None
+        from_address: str = pydantic.Field(alias="from-address")
+        mailto: Optional[list[str]] = None
+        mailto_user: Optional[list[str]] = pydantic.Field(alias="mailto-user", default=None)
+        mode: Optional[Literal["insecure", "starttls", "tls"]] = None
+        name: str
+        origin: Literal["user-created", "builtin", "modified-builtin"]
+        port: Optional[int] = None
+        server: str
+        username: Optional[str] = None
+
+
+class _Shape_cce369b4a917:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "body": NotRequired[str],
+            "comment": NotRequired[str],
+            "digest": NotRequired[str],
+            "disable": NotRequired[bool],
+            "header": NotRequired[list[str]],
+            "method": Literal["post", "put", "get"],
+            "name": str,
+            "secret": NotRequired[list[str]],
+            "url": str,
+        },
+    )
+
+    class Model(BaseModel):
+        body: Optional[str] = None
+        comment: Optional[str] = None
+        digest: Optional[str] = None
+        disable: Optional[bool] = None
+        header: Optional[list[str]] = None
+        method: Literal["post", "put", "get"]
+        name: str
+        secret: Optional[list[str]] = None
+        url: str
+
+
+class _Shape_cb704681a388:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "body": NotRequired[str],
+            "comment": NotRequired[str],
+            "disable": NotRequired[bool],
+            "header": NotRequired[list[str]],
+            "method": Literal["post", "put", "get"],
+            "name": str,
+            "origin": Literal["user-created", "builtin", "modified-builtin"],
+            "secret": NotRequired[list[str]],
+            "url": str,
+        },
+    )
+
+    class Model(BaseModel):
+        body: Optional[str] = None
+        comment: Optional[str] = None
+        disable: Optional[bool] = None
+        header: Optional[list[str]] = None
+        method: Literal["post", "put", "get"]
+        name: str
+        origin: Literal["user-created", "builtin", "modified-builtin"]
+        secret: Optional[list[str]] = None
+        url: str
+
+
+class _Shape_4fe707541d5e:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "comment": NotRequired[str],
+            "disable": NotRequired[bool],
+            "name": str,
+            "origin": Literal["user-created", "builtin", "modified-builtin"],
+            "type": Literal["sendmail", "gotify", "smtp", "webhook"],
+        },
+    )
+
+    class Model(BaseModel):
+        comment: Optional[str] = None
+        disable: Optional[bool] = None
+        name: str
+        origin: Literal["user-created", "builtin", "modified-builtin"]
+        type: Literal["sendmail", "gotify", "smtp", "webhook"]
+
+
+class _Shape_9eab753b0163:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "comment": NotRequired[str],
+            "digest": NotRequired[str],
+            "disable": NotRequired[bool],
+            "invert-match": NotRequired[bool],
+            "match-calendar": NotRequired[list[str]],
+            "match-field": NotRequired[list[str]],
+            "match-severity": NotRequired[list[str]],
+            "mode": NotRequired[Literal["all", "any"]],
+            "name": str,
+            "target": NotRequired[list[str]],
+        },
+    )
+
+    class Model(BaseModel):
+        comment: Optional[str] = None
+        digest: Optional[str] = None
+        disable: Optional[bool] = None
+        invert_match: Optional[bool] = pydantic.Field(alias="invert-match", default=None)
+        match_calendar: Optional[list[str]] = pydantic.Field(alias="match-calendar", default=None)
+        match_field: Optional[list[str]] = pydantic.Field(alias="match-field", default=None)
+        match_severity: Optional[list[str]] = pydantic.Field(alias="match-severity", default=None)
+        mode: Optional[Literal["all", "any"]] = None
+        name: str
+        target: Optional[list[str]] = None
+
+
+class _Shape_184746e77819:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "comment": NotRequired[str],
+            "disable": NotRequired[bool],
+            "invert-match": NotRequired[bool],
+            "match-calendar": NotRequired[list[str]],
+            "match-field": NotRequired[list[str]],
+            "match-severity": NotRequired[list[str]],
+            "mode": NotRequired[Literal["all", "any"]],
+            "name": str,
+            "origin": Literal["user-created", "builtin", "modified-builtin"],
+            "target": NotRequired[list[str]],
+        },
+    )
+
+    class Model(BaseModel):
+        comment: Optional[str] = None
+        disable: Optional[bool] = None
+        invert_match: Optional[bool] = pydantic.Field(alias="invert-match", default=None)
+        match_calendar: Optional[list[str]] = pydantic.Field(alias="match-calendar", default=None)
+        match_field: Optional[list[str]] = pydantic.Field(alias="match-field", default=None)
+        match_severity: Optional[list[str]] = pydantic.Field(alias="match-severity", default=None)
+        mode: Optional[Literal["all", "any"]] = None
+        name: str
+        origin: Literal["user-created", "builtin", "modified-builtin"]
+        target: Optional[list[str]] = None
+
+
+class _Shape_f2025d055959:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "ebtables": NotRequired[bool],
+            "enable": NotRequired[int],
+            "log_ratelimit": NotRequired[str],
+            "policy_forward": NotRequired[Literal["ACCEPT", "DROP"]],
+            "policy_in": NotRequired[Literal["ACCEPT", "REJECT", "DROP"]],
+            "policy_out": NotRequired[Literal["ACCEPT", "REJECT", "DROP"]],
+        },
+    )
+
+    class Model(BaseModel):
+        ebtables: Optional[bool] = None
+        enable: Optional[int] = None
+        log_ratelimit: Optional[str] = None
+        policy_forward: Optional[Literal["ACCEPT", "DROP"]] = None
+        policy_in: Optional[Literal["ACCEPT", "REJECT", "DROP"]] = None
+        policy_out: Optional[Literal["ACCEPT", "REJECT", "DROP"]] = None
+
+
+class _Shape_3ff2000df841:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "comment": NotRequired[str],
+            "name": str,
+            "ref": str,
+            "scope": str,
+            "type": Literal["alias", "ipset"],
+        },
+    )
+
+    class Model(BaseModel):
+        comment: Optional[str] = None
+        name: str
+        ref: str
+        scope: str
+        type: Literal["alias", "ipset"]
+
+
+class _Shape_05f3a7af0b41:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "crm_state": NotRequired[str],
+            "id": str,
+            "max_relocate": NotRequired[int],
+            "max_restart": NotRequired[int],
+            "node": str,
+            "quorate": NotRequired[bool],
+            "request_state": NotRequired[str],
+            "sid": NotRequired[str],
+            "state": NotRequired[str],
+            "status": str,
+            "timestamp": NotRequired[int],
+            "type": dict[str, Any],
+        },
+    )
+
+    class Model(BaseModel):
+        crm_state: Optional[str] = None
+        id: str
+        max_relocate: Optional[int] = None
+        max_restart: Optional[int] = None
+        node: str
+        quorate: Optional[bool] = None
+        request_state: Optional[str] = None
+        sid: Optional[str] = None
+        state: Optional[str] = None
+        status: str
+        timestamp: Optional[int] = None
+        type: dict[str, Any]
+
+
+class _Shape_828eb08e8829:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "caaIdentities": NotRequired[list[str]],
+            "externalAccountRequired": NotRequired[bool],
+            "termsOfService": NotRequired[str],
+            "website": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        caa_identities: Optional[list[str]] = pydantic.Field(alias="caaIdentities", default=None)
+        external_account_required: Optional[bool] = pydantic.Field(alias="externalAccountRequired", default=None)
+        terms_of_service: Optional[str] = pydantic.Field(alias="termsOfService", default=None)
+        website: Optional[str] = None
+
+
+class _Shape_d20c95931ae1:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "comment": NotRequired[str],
+            "enabled": bool,
+            "id": str,
+            "last-run": NotRequired[int],
+            "next-run": NotRequired[int],
+            "realm": str,
+            "remove-vanished": NotRequired[str],
+            "schedule": str,
+            "scope": NotRequired[Literal["users", "groups", "both"]],
+        },
+    )
+
+    class Model(BaseModel):
+        comment: Optional[str] = None
+        enabled: bool
+        id: str
+        last_run: Optional[int] = pydantic.Field(alias="last-run", default=None)
+        next_run: Optional[int] = pydantic.Field(alias="next-run", default=None)
+        realm: str
+        remove_vanished: Optional[str] = pydantic.Field(alias="remove-vanished", default=None)
+        schedule: str
+        scope: Optional[Literal["users", "groups", "both"]] = None
+
+
+class _Shape_52b1051abd4d:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "message": str,
+            "severity": Literal["warning", "error"],
+        },
+    )
+
+    class Model(BaseModel):
+        message: str
+        severity: Literal["warning", "error"]
+
+
+class _Shape_94b8f7ef149b:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "description": str,
+            "error": dict[str, Any],
+            "id": str,
+            "map": list[str],
+        },
+    )
+
+    class Model(BaseModel):
+        description: str
+        error: dict[str, Any]
+        id: str
+        map: list[str]
+
+
+class _Shape_7afe7635fdbf:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "enable": NotRequired[bool],
+            "log_level_forward": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]],
+            "policy_forward": NotRequired[Literal["ACCEPT", "DROP"]],
+        },
+    )
+
+    class Model(BaseModel):
+        enable: Optional[bool] = None
+        log_level_forward: Optional[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]] = None
+        policy_forward: Optional[Literal["ACCEPT", "DROP"]] = None
+
+
+class _Shape_652ec69e6eb1:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "dhcp": NotRequired[str],
+            "dns": NotRequired[str],
+            "dnszone": NotRequired[str],
+            "ipam": NotRequired[str],
+            "mtu": NotRequired[int],
+            "nodes": NotRequired[str],
+            "pending": NotRequired[bool],
+            "reversedns": NotRequired[str],
+            "state": NotRequired[str],
+            "type": str,
+            "zone": str,
+        },
+    )
+
+    class Model(BaseModel):
+        dhcp: Optional[str] = None
+        dns: Optional[str] = None
+        dnszone: Optional[str] = None
+        ipam: Optional[str] = None
+        mtu: Optional[int] = None
+        nodes: Optional[str] = None
+        pending: Optional[bool] = None
+        reversedns: Optional[str] = None
+        state: Optional[str] = None
+        type: str
+        zone: str
+
+
+class _Shape_d0c81dc06c17:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "controller": str,
+            "pending": NotRequired[bool],
+            "state": NotRequired[str],
+            "type": str,
+        },
+    )
+
+    class Model(BaseModel):
+        controller: str
+        pending: Optional[bool] = None
+        state: Optional[str] = None
+        type: str
+
+
+class _Shape_796474334f3c:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "cgroup-mode": NotRequired[int],
+            "content": NotRequired[str],
+            "cpu": NotRequired[float],
+            "disk": NotRequired[int],
+            "diskread": NotRequired[int],
+            "diskwrite": NotRequired[int],
+            "hastate": NotRequired[str],
+            "id": str,
+            "level": NotRequired[str],
+            "lock": NotRequired[str],
+            "maxcpu": NotRequired[float],
+            "maxdisk": NotRequired[int],
+            "maxmem": NotRequired[int],
+            "mem": NotRequired[int],
+            "name": NotRequired[str],
+            "netin": NotRequired[int],
+            "netout": NotRequired[int],
+            "node": NotRequired[str],
+            "plugintype": NotRequired[str],
+            "pool": NotRequired[str],
+            "status": NotRequired[str],
+            "storage": NotRequired[str],
+            "tags": NotRequired[str],
+            "template": NotRequired[bool],
+            "type": Literal["node", "storage", "pool", "qemu", "lxc", "openvz", "sdn"],
+            "uptime": NotRequired[int],
+            "vmid": NotRequired[int],
+        },
+    )
+
+    class Model(BaseModel):
+        cgroup_mode: Optional[int] = pydantic.Field(alias="cgroup-mode", default=None)
+        content: Optional[str] = None
+        cpu: Optional[float] = None
+        disk: Optional[int] = None
+        diskread: Optional[int] = None
+        diskwrite: Optional[int] = None
+        hastate: Optional[str] = None
+        id: str
+        level: Optional[str] = None
+        lock: Optional[str] = None
+        maxcpu: Optional[float] = None
+        maxdisk: Optional[int] = None
+        maxmem: Optional[int] = None
+        mem: Optional[int] = None
+        name: Optional[str] = None
+        netin: Optional[int] = None
+        netout: Optional[int] = None
+        node: Optional[str] = None
+        plugintype: Optional[str] = None
+        pool: Optional[str] = None
+        status: Optional[str] = None
+        storage: Optional[str] = None
+        tags: Optional[str] = None
+        template: Optional[bool] = None
+        type: Literal["node", "storage", "pool", "qemu", "lxc", "openvz", "sdn"]
+        uptime: Optional[int] = None
+        vmid: Optional[int] = None
+
+
+class _Shape_bb2cfb6ce9cf:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "acpi": NotRequired[bool],
+            "affinity": NotRequired[str],
+            "agent": NotRequired[str],
+            "amd-sev": NotRequired[str],
+            "arch": NotRequired[Literal["x86_64", "aarch64"]],
+            "args": NotRequired[str],
+            "audio0": NotRequired[str],
+            "autostart": NotRequired[bool],
+            "balloon": NotRequired[int],
+            "bios": NotRequired[Literal["seabios", "ovmf"]],
+            "boot": NotRequired[str],
+            "bootdisk": NotRequired[str],
+            "cdrom": NotRequired[str],
+            "cicustom": NotRequired[str],
+            "cipassword": NotRequired[str],
+            "citype": NotRequired[Literal["configdrive2", "nocloud", "opennebula"]],
+            "ciupgrade": NotRequired[bool],
+            "ciuser": NotRequired[str],
+            "cores": NotRequired[int],
+            "cpu": NotRequired[str],
+            "cpulimit": NotRequired[float],
+            "cpuunits": NotRequired[int],
+            "description": NotRequired[str],
+            "digest": str,
+            "efidisk0": NotRequired[str],
+            "freeze": NotRequired[bool],
+            "hookscript": NotRequired[str],
+            "hostpci[n]": NotRequired[str],
+            "hotplug": NotRequired[str],
+            "hugepages": NotRequired[Literal["any", "2", "1024"]],
+            "ide[n]": NotRequired[str],
+            "ipconfig[n]": NotRequired[str],
+            "ivshmem": NotRequired[str],
+            "keephugepages": NotRequired[bool],
+            "keyboard": NotRequired[Literal["de", "de-ch", "da", "en-gb", "en-us", "es", "fi", "fr", "fr-be", "fr-ca", "fr-ch", "hu", "is", "it", "ja", "lt", "mk", "nl", "no", "pl", "pt", "pt-br", "sv", "sl", "tr"]],
+            "kvm": NotRequired[bool],
+            "localtime": NotRequired[bool],
+            "lock": NotRequired[Literal["backup", "clone", "create", "migrate", "rollback", "snapshot", "snapshot-delete", "suspending", "suspended"]],
+            "machine": NotRequired[str],
+            "memory": NotRequired[str],
+            "migrate_downtime": NotRequired[float],
+            "migrate_speed": NotRequired[int],
+            "name": NotRequired[str],
+            "nameserver": NotRequired[str],
+            "net[n]": NotRequired[str],
+            "numa": NotRequired[bool],
+            "numa[n]": NotRequired[str],
+            "onboot": NotRequired[bool],
+            "ostype": NotRequired[Literal["other", "wxp", "w2k", "w2k3", "w2k8", "wvista", "win7", "win8", "win10", "win11", "l24", "l26", "solaris"]],
+            "parallel[n]": NotRequired[str],
+            "protection": NotRequired[bool],
+            "reboot": NotRequired[bool],
+            "rng0": NotRequired[str],
+            "sata[n]": NotRequired[str],
+            "scsi[n]": NotRequired[str],
+            "scsihw": NotRequired[Literal["lsi", "lsi53c810", "virtio-scsi-pci", "virtio-scsi-single", "megasas", "pvscsi"]],
+            "searchdomain": NotRequired[str],
+            "serial[n]": NotRequired[str],
+            "shares": NotRequired[int],
+            "smbios1": NotRequired[str],
+            "smp": NotRequired[int],
+            "sockets": NotRequired[int],
+            "spice_enhancements": NotRequired[str],
+            "sshkeys": NotRequired[str],
+            "startdate": NotRequired[str],
+            "startup": NotRequired[str],
+            "tablet": NotRequired[bool],
+            "tags": NotRequired[str],
+            "tdf": NotRequired[bool],
+            "template": NotRequired[bool],
+            "tpmstate0": NotRequired[str],
+            "unused[n]": NotRequired[str],
+            "usb[n]": NotRequired[str],
+            "vcpus": NotRequired[int],
+            "vga": NotRequired[str],
+            "virtio[n]": NotRequired[str],
+            "virtiofs[n]": NotRequired[str],
+            "vmgenid": NotRequired[str],
+            "vmstatestorage": NotRequired[str],
+            "watchdog": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        acpi: Optional[bool] = None
+        affinity: Optional[str] = None
+        agent: Optional[str] = None
+        amd_sev: Optional[str] = pydantic.Field(alias="amd-sev", default=None)
+        arch: Optional[Literal["x86_64", "aarch64"]] = None
+        args: Optional[str] = None
+        audio0: Optional[str] = None
+        autostart: Optional[bool] = None
+        balloon: Optional[int] = None
+        bios: Optional[Literal["seabios", "ovmf"]] = None
+        boot: Optional[str] = None
+        bootdisk: Optional[str] = None
+        cdrom: Optional[str] = None
+        cicustom: Optional[str] = None
+        cipassword: Optional[str] = None
+        citype: Optional[Literal["configdrive2", "nocloud", "opennebula"]] = None
+        ciupgrade: Optional[bool] = None
+        ciuser: Optional[str] = None
+        cores: Optional[int] = None
+        cpu: Optional[str] = None
+        cpulimit: Optional[float] = None
+        cpuunits: Optional[int] = None
+        description: Optional[str] = None
+        digest: str
+        efidisk0: Optional[str] = None
+        freeze: Optional[bool] = None
+        hookscript: Optional[str] = None
+        hostpcin: Optional[str] = pydantic.Field(alias="hostpci[n]", default=None)
+        hotplug: Optional[str] = None
+        hugepages: Optional[Literal["any", "2", "1024"]] = None
+        iden: Optional[str] = pydantic.Field(alias="ide[n]", default=None)
+        ipconfign: Optional[str] = pydantic.Field(alias="ipconfig[n]", default=None)
+        ivshmem: Optional[str] = None
+        keephugepages: Optional[bool] = None
+        keyboard: Optional[Literal["de", "de-ch", "da", "en-gb", "en-us", "es", "fi", "fr", "fr-be", "fr-ca", "fr-ch", "hu", "is", "it", "ja", "lt", "mk", "nl", "no", "pl", "pt", "pt-br", "sv", "sl", "tr"]] = None
+        kvm: Optional[bool] = None
+        localtime: Optional[bool] = None
+        lock: Optional[Literal["backup", "clone", "create", "migrate", "rollback", "snapshot", "snapshot-delete", "suspending", "suspended"]] = None
+        machine: Optional[str] = None
+        memory: Optional[str] = None
+        migrate_downtime: Optional[float] = None
+        migrate_speed: Optional[int] = None
+        name: Optional[str] = None
+        nameserver: Optional[str] = None
+        netn: Optional[str] = pydantic.Field(alias="net[n]", default=None)
+        numa: Optional[bool] = None
+        numan: Optional[str] = pydantic.Field(alias="numa[n]", default=None)
+        onboot: Optional[bool] = None
+        ostype: Optional[Literal["other", "wxp", "w2k", "w2k3", "w2k8", "wvista", "win7", "win8", "win10", "win11", "l24", "l26", "solaris"]] = None
+        paralleln: Optional[str] = pydantic.Field(alias="parallel[n]", default=None)
+        protection: Optional[bool] = None
+        reboot: Optional[bool] = None
+        rng0: Optional[str] = None
+        satan: Optional[str] = pydantic.Field(alias="sata[n]", default=None)
+        scsin: Optional[str] = pydantic.Field(alias="scsi[n]", default=None)
+        scsihw: Optional[Literal["lsi", "lsi53c810", "virtio-scsi-pci", "virtio-scsi-single", "megasas", "pvscsi"]] = None
+        searchdomain: Optional[str] = None
+        serialn: Optional[str] = pydantic.Field(alias="serial[n]", default=None)
+        shares: Optional[int] = None
+        smbios1: Optional[str] = None
+        smp: Optional[int] = None
+        sockets: Optional[int] = None
+        spice_enhancements: Optional[str] = None
+        sshkeys: Optional[str] = None
+        startdate: Optional[str] = None
+        startup: Optional[str] = None
+        tablet: Optional[bool] = None
+        tags: Optional[str] = None
+        tdf: Optional[bool] = None
+        template: Optional[bool] = None
+        tpmstate0: Optional[str] = None
+        unusedn: Optional[str] = pydantic.Field(alias="unused[n]", default=None)
+        usbn: Optional[str] = pydantic.Field(alias="usb[n]", default=None)
+        vcpus: Optional[int] = None
+        vga: Optional[str] = None
+        virtion: Optional[str] = pydantic.Field(alias="virtio[n]", default=None)
+        virtiofsn: Optional[str] = pydantic.Field(alias="virtiofs[n]", default=None)
+        vmgenid: Optional[str] = None
+        vmstatestorage: Optional[str] = None
+        watchdog: Optional[str] = None
+
+
+class _Shape_51908da40163:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "agent": NotRequired[bool],
+            "clipboard": NotRequired[Literal["vnc"]],
+            "cpu": NotRequired[float],
+            "cpus": NotRequired[float],
+            "diskread": NotRequired[int],
+            "diskwrite": NotRequired[int],
+            "ha": dict[str, Any],
+            "lock": NotRequired[str],
+            "maxdisk": NotRequired[int],
+            "maxmem": NotRequired[int],
+            "mem": NotRequired[int],
+            "name": NotRequired[str],
+            "netin": NotRequired[int],
+            "netout": NotRequired[int],
+            "pid": NotRequired[int],
+            "qmpstatus": NotRequired[str],
+            "running-machine": NotRequired[str],
+            "running-qemu": NotRequired[str],
+            "serial": NotRequired[bool],
+            "spice": NotRequired[bool],
+            "status": Literal["stopped", "running"],
+            "tags": NotRequired[str],
+            "template": NotRequired[bool],
+            "uptime": NotRequired[int],
+            "vmid": int,
+        },
+    )
+
+    class Model(BaseModel):
+        agent: Optional[bool] = None
+        clipboard: Optional[Literal["vnc"]] = None
+        cpu: Optional[float] = None
+        cpus: Optional[float] = None
+        diskread: Optional[int] = None
+        diskwrite: Optional[int] = None
+        ha: dict[str, Any]
+        lock: Optional[str] = None
+        maxdisk: Optional[int] = None
+        maxmem: Optional[int] = None
+        mem: Optional[int] = None
+        name: Optional[str] = None
+        netin: Optional[int] = None
+        netout: Optional[int] = None
+        pid: Optional[int] = None
+        qmpstatus: Optional[str] = None
+        running_machine: Optional[str] = pydantic.Field(alias="running-machine", default=None)
+        running_qemu: Optional[str] = pydantic.Field(alias="running-qemu", default=None)
+        serial: Optional[bool] = None
+        spice: Optional[bool] = None
+        status: Literal["stopped", "running"]
+        tags: Optional[str] = None
+        template: Optional[bool] = None
+        uptime: Optional[int] = None
+        vmid: int
+
+
+class _Shape_35a0b7250f26:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "cdrom": bool,
+            "is_unused": bool,
+            "size": int,
+            "volid": str,
+        },
+    )
+
+    class Model(BaseModel):
+        cdrom: bool
+        is_unused: bool
+        size: int
+        volid: str
+
+
+class _Shape_86de687815b6:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "unavailable_storages": NotRequired[list[str]],
+        },
+    )
+
+    class Model(BaseModel):
+        unavailable_storages: Optional[list[str]] = None
+
+
+class _Shape_80eb5f2591b3:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "cpu": NotRequired[float],
+            "cpus": NotRequired[float],
+            "diskread": NotRequired[int],
+            "diskwrite": NotRequired[int],
+            "lock": NotRequired[str],
+            "maxdisk": NotRequired[int],
+            "maxmem": NotRequired[int],
+            "mem": NotRequired[int],
+            "name": NotRequired[str],
+            "netin": NotRequired[int],
+            "netout": NotRequired[int],
+            "pid": NotRequired[int],
+            "qmpstatus": NotRequired[str],
+            "running-machine": NotRequired[str],
+            "running-qemu": NotRequired[str],
+            "serial": NotRequired[bool],
+            "status": Literal["stopped", "running"],
+            "tags": NotRequired[str],
+            "template": NotRequired[bool],
+            "uptime": NotRequired[int],
+            "vmid": int,
+        },
+    )
+
+    class Model(BaseModel):
+        cpu: Optional[float] = None
+        cpus: Optional[float] = None
+        diskread: Optional[int] = None
+        diskwrite: Optional[int] = None
+        lock: Optional[str] = None
+        maxdisk: Optional[int] = None
+        maxmem: Optional[int] = None
+        mem: Optional[int] = None
+        name: Optional[str] = None
+        netin: Optional[int] = None
+        netout: Optional[int] = None
+        pid: Optional[int] = None
+        qmpstatus: Optional[str] = None
+        running_machine: Optional[str] = pydantic.Field(alias="running-machine", default=None)
+        running_qemu: Optional[str] = pydantic.Field(alias="running-qemu", default=None)
+        serial: Optional[bool] = None
+        status: Literal["stopped", "running"]
+        tags: Optional[str] = None
+        template: Optional[bool] = None
+        uptime: Optional[int] = None
+        vmid: int
+
+
+class _Shape_d71defb238ab:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "arch": NotRequired[Literal["amd64", "i386", "arm64", "armhf", "riscv32", "riscv64"]],
+            "cmode": NotRequired[Literal["shell", "console", "tty"]],
+            "console": NotRequired[bool],
+            "cores": NotRequired[int],
+            "cpulimit": NotRequired[float],
+            "cpuunits": NotRequired[int],
+            "debug": NotRequired[bool],
+            "description": NotRequired[str],
+            "dev[n]": NotRequired[str],
+            "digest": str,
+            "features": NotRequired[str],
+            "hookscript": NotRequired[str],
+            "hostname": NotRequired[str],
+            "lock": NotRequired[Literal["backup", "create", "destroyed", "disk", "fstrim", "migrate", "mounted", "rollback", "snapshot", "snapshot-delete"]],
+            "lxc": NotRequired[list[list[str]]],
+            "memory": NotRequired[int],
+            "mp[n]": NotRequired[str],
+            "nameserver": NotRequired[str],
+            "net[n]": NotRequired[str],
+            "onboot": NotRequired[bool],
+            "ostype": NotRequired[Literal["debian", "devuan", "ubuntu", "centos", "fedora", "opensuse", "archlinux", "alpine", "gentoo", "nixos", "unmanaged"]],
+            "protection": NotRequired[bool],
+            "rootfs": NotRequired[str],
+            "searchdomain": NotRequired[str],
+            "startup": NotRequired[str],
+            "swap": NotRequired[int],
+            "tags": NotRequired[str],
+            "template": NotRequired[bool],
+            "timezone": NotRequired[str],
+            "tty": NotRequired[int],
+            "unprivileged": NotRequired[bool],
+            "unused[n]": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        arch: Optional[Literal["amd64", "i386", "arm64", "armhf", "riscv32", "riscv64"]] = None
+        cmode: Optional[Literal["shell", "console", "tty"]] = None
+        console: Optional[bool] = None
+        cores: Optional[int] = None
+        cpulimit: Optional[float] = None
+        cpuunits: Optional[int] = None
+        debug: Optional[bool] = None
+        description: Optional[str] = None
+        devn: Optional[str] = pydantic.Field(alias="dev[n]", default=None)
+        digest: str
+        features: Optional[str] = None
+        hookscript: Optional[str] = None
+        hostname: Optional[str] = None
+        lock: Optional[Literal["backup", "create", "destroyed", "disk", "fstrim", "migrate", "mounted", "rollback", "snapshot", "snapshot-delete"]] = None
+        lxc: Optional[list[list[str]]] = None
+        memory: Optional[int] = None
+        mpn: Optional[str] = pydantic.Field(alias="mp[n]", default=None)
+        nameserver: Optional[str] = None
+        netn: Optional[str] = pydantic.Field(alias="net[n]", default=None)
+        onboot: Optional[bool] = None
+        ostype: Optional[Literal["debian", "devuan", "ubuntu", "centos", "fedora", "opensuse", "archlinux", "alpine", "gentoo", "nixos", "unmanaged"]] = None
+        protection: Optional[bool] = None
+        rootfs: Optional[str] = None
+        searchdomain: Optional[str] = None
+        startup: Optional[str] = None
+        swap: Optional[int] = None
+        tags: Optional[str] = None
+        template: Optional[bool] = None
+        timezone: Optional[str] = None
+        tty: Optional[int] = None
+        unprivileged: Optional[bool] = None
+        unusedn: Optional[str] = pydantic.Field(alias="unused[n]", default=None)
+
+
+class _Shape_810be4c1e563:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "cpu": NotRequired[float],
+            "cpus": NotRequired[float],
+            "disk": NotRequired[int],
+            "diskread": NotRequired[int],
+            "diskwrite": NotRequired[int],
+            "ha": dict[str, Any],
+            "lock": NotRequired[str],
+            "maxdisk": NotRequired[int],
+            "maxmem": NotRequired[int],
+            "maxswap": NotRequired[int],
+            "mem": NotRequired[int],
+            "name": NotRequired[str],
+            "netin": NotRequired[int],
+            "netout": NotRequired[int],
+            "status": Literal["stopped", "running"],
+            "tags": NotRequired[str],
+            "template": NotRequired[bool],
+            "uptime": NotRequired[int],
+            "vmid": int,
+        },
+    )
+
+    class Model(BaseModel):
+        cpu: Optional[float] = None
+        cpus: Optional[float] = None
+        disk: Optional[int] = None
+        diskread: Optional[int] = None
+        diskwrite: Optional[int] = None
+        ha: dict[str, Any]
+        lock: Optional[str] = None
+        maxdisk: Optional[int] = None
+        maxmem: Optional[int] = None
+        maxswap: Optional[int] = None
+        mem: Optional[int] = None
+        name: Optional[str] = None
+        netin: Optional[int] = None
+        netout: Optional[int] = None
+        status: Literal["stopped", "running"]
+        tags: Optional[str] = None
+        template: Optional[bool] = None
+        uptime: Optional[int] = None
+        vmid: int
+
+
+class _Shape_69dcd3c4fa4b:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "ip-address": NotRequired[str],
+            "ip-address-type": NotRequired[str],
+            "prefix": NotRequired[int],
+        },
+    )
+
+    class Model(BaseModel):
+        ip_address: Optional[str] = pydantic.Field(alias="ip-address", default=None)
+        ip_address_type: Optional[str] = pydantic.Field(alias="ip-address-type", default=None)
+        prefix: Optional[int] = None
+
+
+class _Shape_04f5bfc18ba2:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "cpu": NotRequired[float],
+            "cpus": NotRequired[float],
+            "disk": NotRequired[int],
+            "diskread": NotRequired[int],
+            "diskwrite": NotRequired[int],
+            "lock": NotRequired[str],
+            "maxdisk": NotRequired[int],
+            "maxmem": NotRequired[int],
+            "maxswap": NotRequired[int],
+            "mem": NotRequired[int],
+            "name": NotRequired[str],
+            "netin": NotRequired[int],
+            "netout": NotRequired[int],
+            "status": Literal["stopped", "running"],
+            "tags": NotRequired[str],
+            "template": NotRequired[bool],
+            "uptime": NotRequired[int],
+            "vmid": int,
+        },
+    )
+
+    class Model(BaseModel):
+        cpu: Optional[float] = None
+        cpus: Optional[float] = None
+        disk: Optional[int] = None
+        diskread: Optional[int] = None
+        diskwrite: Optional[int] = None
+        lock: Optional[str] = None
+        maxdisk: Optional[int] = None
+        maxmem: Optional[int] = None
+        maxswap: Optional[int] = None
+        mem: Optional[int] = None
+        name: Optional[str] = None
+        netin: Optional[int] = None
+        netout: Optional[int] = None
+        status: Literal["stopped", "running"]
+        tags: Optional[str] = None
+        template: Optional[bool] = None
+        uptime: Optional[int] = None
+        vmid: int
+
+
+class _Shape_ccc760b74e6d:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "all": NotRequired[bool],
+            "bwlimit": NotRequired[int],
+            "compress": NotRequired[Literal["0", "1", "gzip", "lzo", "zstd"]],
+            "dumpdir": NotRequired[str],
+            "exclude": NotRequired[str],
+            "exclude-path": NotRequired[list[str]],
+            "fleecing": NotRequired[str],
+            "ionice": NotRequired[int],
+            "lockwait": NotRequired[int],
+            "mailnotification": NotRequired[Literal["always", "failure"]],
+            "mailto": NotRequired[str],
+            "maxfiles": NotRequired[int],
+            "mode": NotRequired[Literal["snapshot", "suspend", "stop"]],
+            "node": NotRequired[str],
+            "notes-template": NotRequired[str],
+            "notification-mode": NotRequired[Literal["auto", "legacy-sendmail", "notification-system"]],
+            "notification-policy": NotRequired[Literal["always", "failure", "never"]],
+            "notification-target": NotRequired[str],
+            "pbs-change-detection-mode": NotRequired[Literal["legacy", "data", "metadata"]],
+            "performance": NotRequired[str],
+            "pigz": NotRequired[int],
+            "pool": NotRequired[str],
+            "protected": NotRequired[bool],
+            "prune-backups": NotRequired[str],
+            "quiet": NotRequired[bool],
+            "remove": NotRequired[bool],
+            "script": NotRequired[str],
+            "stdexcludes": NotRequired[bool],
+            "stop": NotRequired[bool],
+            "stopwait": NotRequired[int],
+            "storage": NotRequired[str],
+            "tmpdir": NotRequired[str],
+            "vmid": NotRequired[str],
+            "zstd": NotRequired[int],
+        },
+    )
+
+    class Model(BaseModel):
+        all: Optional[bool] = None
+        bwlimit: Optional[int] = None
+        compress: Optional[Literal["0", "1", "gzip", "lzo", "zstd"]] = None
+        dumpdir: Optional[str] = None
+        exclude: Optional[str] = None
+        exclude_path: Optional[list[str]] = pydantic.Field(alias="exclude-path", default=None)
+        fleecing: Optional[str] = None
+        ionice: Optional[int] = None
+        lockwait: Optional[int] = None
+        mailnotification: Optional[Literal["always", "failure"]] = None
+        mailto: Optional[str] = None
+        maxfiles: Optional[int] = None
+        mode: Optional[Literal["snapshot", "suspend", "stop"]] = None
+        node: Optional[str] = None
+        notes_template: Optional[str] = pydantic.Field(alias="notes-template", default=None)
+        notification_mode: Optional[Literal["auto", "legacy-sendmail", "notification-system"]] = pydantic.Field(alias="notification-mode", default=None)
+        notification_policy: Optional[Literal["always", "failure", "never"]] = pydantic.Field(alias="notification-policy", default=None)
+        notification_target: Optional[str] = pydantic.Field(alias="notification-target", default=None)
+        pbs_change_detection_mode: Optional[Literal["legacy", "data", "metadata"]] = pydantic.Field(alias="pbs-change-detection-mode", default=None)
+        performance: Optional[str] = None
+        pigz: Optional[int] = None
+        pool: Optional[str] = None
+        protected: Optional[bool] = None
+        prune_backups: Optional[str] = pydantic.Field(alias="prune-backups", default=None)
+        quiet: Optional[bool] = None
+        remove: Optional[bool] = None
+        script: Optional[str] = None
+        stdexcludes: Optional[bool] = None
+        stop: Optional[bool] = None
+        stopwait: Optional[int] = None
+        storage: Optional[str] = None
+        tmpdir: Optional[str] = None
+        vmid: Optional[str] = None
+        zstd: Optional[int] = None
+
+
+class _Shape_63204c9b844c:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "checktime": NotRequired[int],
+            "key": NotRequired[str],
+            "level": NotRequired[str],
+            "message": NotRequired[str],
+            "nextduedate": NotRequired[str],
+            "productname": NotRequired[str],
+            "regdate": NotRequired[str],
+            "serverid": NotRequired[str],
+            "signature": NotRequired[str],
+            "sockets": NotRequired[int],
+            "status": Literal["new", "notfound", "active", "invalid", "expired", "suspended"],
+            "url": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        checktime: Optional[int] = None
+        key: Optional[str] = None
+        level: Optional[str] = None
+        message: Optional[str] = None
+        nextduedate: Optional[str] = None
+        productname: Optional[str] = None
+        regdate: Optional[str] = None
+        serverid: Optional[str] = None
+        signature: Optional[str] = None
+        sockets: Optional[int] = None
+        status: Literal["new", "notfound", "active", "invalid", "expired", "suspended"]
+        url: Optional[str] = None
+
+
+class _Shape_8aea3955945c:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "active": NotRequired[bool],
+            "address": NotRequired[str],
+            "address6": NotRequired[str],
+            "autostart": NotRequired[bool],
+            "bond-primary": NotRequired[str],
+            "bond_mode": NotRequired[Literal["balance-rr", "active-backup", "balance-xor", "broadcast", "802.3ad", "balance-tlb", "balance-alb", "balance-slb", "lacp-balance-slb", "lacp-balance-tcp"]],
+            "bond_xmit_hash_policy": NotRequired[Literal["layer2", "layer2+3", "layer3+4"]],
+            "bridge-access": NotRequired[int],
+            "bridge-arp-nd-suppress": NotRequired[bool],
+            "bridge-learning": NotRequired[bool],
+            "bridge-multicast-flood": NotRequired[bool],
+            "bridge-unicast-flood": NotRequired[bool],
+            "bridge_ports": NotRequired[str],
+            "bridge_vids": NotRequired[str],
+            "bridge_vlan_aware": NotRequired[bool],
+            "cidr": NotRequired[str],
+            "cidr6": NotRequired[str],
+            "comments": NotRequired[str],
+            "comments6": NotRequired[str],
+            "exists": NotRequired[bool],
+            "families": NotRequired[list[Literal["inet", "inet6"]]],
+            "gateway": NotRequired[str],
+            "gateway6": NotRequired[str],
+            "iface": str,
+            "link-type": NotRequired[str],
+            "method": NotRequired[Literal["loopback", "dhcp", "manual", "static", "auto"]],
+            "method6": NotRequired[Literal["loopback", "dhcp", "manual", "static", "auto"]],
+            "mtu": NotRequired[int],
+            "netmask": NotRequired[str],
+            "netmask6": NotRequired[int],
+            "options": NotRequired[list[str]],
+            "options6": NotRequired[list[str]],
+            "ovs_bonds": NotRequired[str],
+            "ovs_bridge": NotRequired[str],
+            "ovs_options": NotRequired[str],
+            "ovs_ports": NotRequired[str],
+            "ovs_tag": NotRequired[int],
+            "priority": NotRequired[int],
+            "slaves": NotRequired[str],
+            "type": Literal["bridge", "bond", "eth", "alias", "vlan", "OVSBridge", "OVSBond", "OVSPort", "OVSIntPort", "vnet", "unknown"],
+            "uplink-id": NotRequired[str],
+            "vlan-id": NotRequired[int],
+            "vlan-protocol": NotRequired[Literal["802.1ad", "802.1q"]],
+            "vlan-raw-device": NotRequired[str],
+            "vxlan-id": NotRequired[int],
+            "vxlan-local-tunnelip": NotRequired[str],
+            "vxlan-physdev": NotRequired[str],
+            "vxlan-svcnodeip": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        active: Optional[bool] = None
+        address: Optional[str] = None
+        address6: Optional[str] = None
+        autostart: Optional[bool] = None
+        bond_primary: Optional[str] = pydantic.Field(alias="bond-primary", default=None)
+        bond_mode: Optional[Literal["balance-rr", "active-backup", "balance-xor", "broadcast", "802.3ad", "balance-tlb", "balance-alb", "balance-slb", "lacp-balance-slb", "lacp-balance-tcp"]] = None
+        bond_xmit_hash_policy: Optional[Literal["layer2", "layer2+3", "layer3+4"]] = None
+        bridge_access: Optional[int] = pydantic.Field(alias="bridge-access", default=None)
+        bridge_arp_nd_suppress: Optional[bool] = pydantic.Field(alias="bridge-arp-nd-suppress", default=None)
+        bridge_learning: Optional[bool] = pydantic.Field(alias="bridge-learning", default=None)
+        bridge_multicast_flood: Optional[bool] = pydantic.Field(alias="bridge-multicast-flood", default=None)
+        bridge_unicast_flood: Optional[bool] = pydantic.Field(alias="bridge-unicast-flood", default=None)
+        bridge_ports: Optional[str] = None
+        bridge_vids: Optional[str] = None
+        bridge_vlan_aware: Optional[bool] = None
+        cidr: Optional[str] = None
+        cidr6: Optional[str] = None
+        comments: Optional[str] = None
+        comments6: Optional[str] = None
+        exists: Optional[bool] = None
+        families: Optional[list[Literal["inet", "inet6"]]] = None
+        gateway: Optional[str] = None
+        gateway6: Optional[str] = None
+        iface: str
+        link_type: Optional[str] = pydantic.Field(alias="link-type", default=None)
+        method: Optional[Literal["loopback", "dhcp", "manual", "static", "auto"]] = None
+        method6: Optional[Literal["loopback", "dhcp", "manual", "static", "auto"]] = None
+        mtu: Optional[int] = None
+        netmask: Optional[str] = None
+        netmask6: Optional[int] = None
+        options: Optional[list[str]] = None
+        options6: Optional[list[str]] = None
+        ovs_bonds: Optional[str] = None
+        ovs_bridge: Optional[str] = None
+        ovs_options: Optional[str] = None
+        ovs_ports: Optional[str] = None
+        ovs_tag: Optional[int] = None
+        priority: Optional[int] = None
+        slaves: Optional[str] = None
+        type: Literal["bridge", "bond", "eth", "alias", "vlan", "OVSBridge", "OVSBond", "OVSPort", "OVSIntPort", "vnet", "unknown"]
+        uplink_id: Optional[str] = pydantic.Field(alias="uplink-id", default=None)
+        vlan_id: Optional[int] = pydantic.Field(alias="vlan-id", default=None)
+        vlan_protocol: Optional[Literal["802.1ad", "802.1q"]] = pydantic.Field(alias="vlan-protocol", default=None)
+        vlan_raw_device: Optional[str] = pydantic.Field(alias="vlan-raw-device", default=None)
+        vxlan_id: Optional[int] = pydantic.Field(alias="vxlan-id", default=None)
+        vxlan_local_tunnelip: Optional[str] = pydantic.Field(alias="vxlan-local-tunnelip", default=None)
+        vxlan_physdev: Optional[str] = pydantic.Field(alias="vxlan-physdev", default=None)
+        vxlan_svcnodeip: Optional[str] = pydantic.Field(alias="vxlan-svcnodeip", default=None)
+
+
+class _Shape_3c7a0d330e61:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "exitstatus": NotRequired[str],
+            "id": str,
+            "node": str,
+            "pid": int,
+            "pstart": int,
+            "starttime": int,
+            "status": Literal["running", "stopped"],
+            "type": str,
+            "upid": str,
+            "user": str,
+        },
+    )
+
+    class Model(BaseModel):
+        exitstatus: Optional[str] = None
+        id: str
+        node: str
+        pid: int
+        pstart: int
+        starttime: int
+        status: Literal["running", "stopped"]
+        type: str
+        upid: str
+        user: str
+
+
+class _Shape_4d905ab9c16d:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "available": int,
+            "description": str,
+            "name": NotRequired[str],
+            "type": str,
+        },
+    )
+
+    class Model(BaseModel):
+        available: int
+        description: str
+        name: Optional[str] = None
+        type: str
+
+
+class _Shape_d03b35974d06:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "changes": NotRequired[str],
+            "id": str,
+            "type": Literal["q35", "i440fx"],
+            "version": str,
+        },
+    )
+
+    class Model(BaseModel):
+        changes: Optional[str] = None
+        id: str
+        type: Literal["q35", "i440fx"]
+        version: str
+
+
+class _Shape_25f687097d19:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "key": NotRequired[str],
+            "type": Literal["cdrom-image-ignored", "efi-state-lost", "guest-is-running", "nvme-unsupported", "ova-needs-extracting", "ovmf-with-lsi-unsupported", "serial-port-socket-only"],
+            "value": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        key: Optional[str] = None
+        type: Literal["cdrom-image-ignored", "efi-state-lost", "guest-is-running", "nvme-unsupported", "ova-needs-extracting", "ovmf-with-lsi-unsupported", "serial-port-socket-only"]
+        value: Optional[str] = None
+
+
+class _Shape_a55192fb2e36:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "devpath": str,
+            "gpt": bool,
+            "health": NotRequired[str],
+            "model": NotRequired[str],
+            "mounted": bool,
+            "osdid": int,
+            "osdid-list": list[int],
+            "parent": NotRequired[str],
+            "serial": NotRequired[str],
+            "size": int,
+            "used": NotRequired[str],
+            "vendor": NotRequired[str],
+            "wwn": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        devpath: str
+        gpt: bool
+        health: Optional[str] = None
+        model: Optional[str] = None
+        mounted: bool
+        osdid: int
+        osdid_list: list[int] = pydantic.Field(alias="osdid-list")
+        parent: Optional[str] = None
+        serial: Optional[str] = None
+        size: int
+        used: Optional[str] = None
+        vendor: Optional[str] = None
+        wwn: Optional[str] = None
+
+
+class _Shape_46f44f5be7cc:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "enable": NotRequired[bool],
+            "log_level_forward": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]],
+            "log_level_in": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]],
+            "log_level_out": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]],
+            "log_nf_conntrack": NotRequired[bool],
+            "ndp": NotRequired[bool],
+            "nf_conntrack_allow_invalid": NotRequired[bool],
+            "nf_conntrack_helpers": NotRequired[str],
+            "nf_conntrack_max": NotRequired[int],
+            "nf_conntrack_tcp_timeout_established": NotRequired[int],
+            "nf_conntrack_tcp_timeout_syn_recv": NotRequired[int],
+            "nftables": NotRequired[bool],
+            "nosmurfs": NotRequired[bool],
+            "protection_synflood": NotRequired[bool],
+            "protection_synflood_burst": NotRequired[int],
+            "protection_synflood_rate": NotRequired[int],
+            "smurf_log_level": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]],
+            "tcp_flags_log_level": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]],
+            "tcpflags": NotRequired[bool],
+        },
+    )
+
+    class Model(BaseModel):
+        enable: Optional[bool] = None
+        log_level_forward: Optional[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]] = None
+        log_level_in: Optional[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]] = None
+        log_level_out: Optional[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]] = None
+        log_nf_conntrack: Optional[bool] = None
+        ndp: Optional[bool] = None
+        nf_conntrack_allow_invalid: Optional[bool] = None
+        nf_conntrack_helpers: Optional[str] = None
+        nf_conntrack_max: Optional[int] = None
+        nf_conntrack_tcp_timeout_established: Optional[int] = None
+        nf_conntrack_tcp_timeout_syn_recv: Optional[int] = None
+        nftables: Optional[bool] = None
+        nosmurfs: Optional[bool] = None
+        protection_synflood: Optional[bool] = None
+        protection_synflood_burst: Optional[int] = None
+        protection_synflood_rate: Optional[int] = None
+        smurf_log_level: Optional[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]] = None
+        tcp_flags_log_level: Optional[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]] = None
+        tcpflags: Optional[bool] = None
+
+
+class _Shape_953e1743ce1d:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "acme": NotRequired[str],
+            "acmedomain[n]": NotRequired[str],
+            "ballooning-target": NotRequired[int],
+            "description": NotRequired[str],
+            "digest": NotRequired[str],
+            "startall-onboot-delay": NotRequired[int],
+            "wakeonlan": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        acme: Optional[str] = None
+        acmedomainn: Optional[str] = pydantic.Field(alias="acmedomain[n]", default=None)
+        ballooning_target: Optional[int] = pydantic.Field(alias="ballooning-target", default=None)
+        description: Optional[str] = None
+        digest: Optional[str] = None
+        startall_onboot_delay: Optional[int] = pydantic.Field(alias="startall-onboot-delay", default=None)
+        wakeonlan: Optional[str] = None
+
+
+class _Shape_b9b46f83b7ec:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "mode": Literal["efi", "legacy-bios"],
+            "secureboot": NotRequired[bool],
+        },
+    )
+
+    class Model(BaseModel):
+        mode: Literal["efi", "legacy-bios"]
+        secureboot: Optional[bool] = None
+
+
+class _Shape_896adc7701b3:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "cores": int,
+            "cpus": int,
+            "model": str,
+            "sockets": int,
+        },
+    )
+
+    class Model(BaseModel):
+        cores: int
+        cpus: int
+        model: str
+        sockets: int
+
+
+class _Shape_d67ac64c1a1c:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "machine": str,
+            "release": str,
+            "sysname": str,
+            "version": str,
+        },
+    )
+
+    class Model(BaseModel):
+        machine: str
+        release: str
+        sysname: str
+        version: str
+
+
+class _Shape_02ab1788fc9c:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "free": int,
+            "total": int,
+            "used": int,
+        },
+    )
+
+    class Model(BaseModel):
+        free: int
+        total: int
+        used: int
+
+
+class _Shape_4cce9616f8de:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "avail": int,
+            "free": int,
+            "total": int,
+            "used": int,
+        },
+    )
+
+    class Model(BaseModel):
+        avail: int
+        free: int
+        total: int
+        used: int
+
+
+class _Shape_34002748bd30:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "Datastore.Allocate": NotRequired[bool],
+            "Datastore.AllocateSpace": NotRequired[bool],
+            "Datastore.AllocateTemplate": NotRequired[bool],
+            "Datastore.Audit": NotRequired[bool],
+            "Group.Allocate": NotRequired[bool],
+            "Mapping.Audit": NotRequired[bool],
+            "Mapping.Modify": NotRequired[bool],
+            "Mapping.Use": NotRequired[bool],
+            "Permissions.Modify": NotRequired[bool],
+            "Pool.Allocate": NotRequired[bool],
+            "Pool.Audit": NotRequired[bool],
+            "Realm.Allocate": NotRequired[bool],
+            "Realm.AllocateUser": NotRequired[bool],
+            "SDN.Allocate": NotRequired[bool],
+            "SDN.Audit": NotRequired[bool],
+            "SDN.Use": NotRequired[bool],
+            "Sys.AccessNetwork": NotRequired[bool],
+            "Sys.Audit": NotRequired[bool],
+            "Sys.Console": NotRequired[bool],
+            "Sys.Incoming": NotRequired[bool],
+            "Sys.Modify": NotRequired[bool],
+            "Sys.PowerMgmt": NotRequired[bool],
+            "Sys.Syslog": NotRequired[bool],
+            "User.Modify": NotRequired[bool],
+            "VM.Allocate": NotRequired[bool],
+            "VM.Audit": NotRequired[bool],
+            "VM.Backup": NotRequired[bool],
+            "VM.Clone": NotRequired[bool],
+            "VM.Config.CDROM": NotRequired[bool],
+            "VM.Config.CPU": NotRequired[bool],
+            "VM.Config.Cloudinit": NotRequired[bool],
+            "VM.Config.Disk": NotRequired[bool],
+            "VM.Config.HWType": NotRequired[bool],
+            "VM.Config.Memory": NotRequired[bool],
+            "VM.Config.Network": NotRequired[bool],
+            "VM.Config.Options": NotRequired[bool],
+            "VM.Console": NotRequired[bool],
+            "VM.Migrate": NotRequired[bool],
+            "VM.Monitor": NotRequired[bool],
+            "VM.PowerMgmt": NotRequired[bool],
+            "VM.Snapshot": NotRequired[bool],
+            "VM.Snapshot.Rollback": NotRequired[bool],
+        },
+    )
+
+    class Model(BaseModel):
+        datastore_allocate: Optional[bool] = pydantic.Field(alias="Datastore.Allocate", default=None)
+        datastore_allocate_space: Optional[bool] = pydantic.Field(alias="Datastore.AllocateSpace", default=None)
+        datastore_allocate_template: Optional[bool] = pydantic.Field(alias="Datastore.AllocateTemplate", default=None)
+        datastore_audit: Optional[bool] = pydantic.Field(alias="Datastore.Audit", default=None)
+        group_allocate: Optional[bool] = pydantic.Field(alias="Group.Allocate", default=None)
+        mapping_audit: Optional[bool] = pydantic.Field(alias="Mapping.Audit", default=None)
+        mapping_modify: Optional[bool] = pydantic.Field(alias="Mapping.Modify", default=None)
+        mapping_use: Optional[bool] = pydantic.Field(alias="Mapping.Use", default=None)
+        permissions_modify: Optional[bool] = pydantic.Field(alias="Permissions.Modify", default=None)
+        pool_allocate: Optional[bool] = pydantic.Field(alias="Pool.Allocate", default=None)
+        pool_audit: Optional[bool] = pydantic.Field(alias="Pool.Audit", default=None)
+        realm_allocate: Optional[bool] = pydantic.Field(alias="Realm.Allocate", default=None)
+        realm_allocate_user: Optional[bool] = pydantic.Field(alias="Realm.AllocateUser", default=None)
+        sdnallocate: Optional[bool] = pydantic.Field(alias="SDN.Allocate", default=None)
+        sdnaudit: Optional[bool] = pydantic.Field(alias="SDN.Audit", default=None)
+        sdnuse: Optional[bool] = pydantic.Field(alias="SDN.Use", default=None)
+        sys_access_network: Optional[bool] = pydantic.Field(alias="Sys.AccessNetwork", default=None)
+        sys_audit: Optional[bool] = pydantic.Field(alias="Sys.Audit", default=None)
+        sys_console: Optional[bool] = pydantic.Field(alias="Sys.Console", default=None)
+        sys_incoming: Optional[bool] = pydantic.Field(alias="Sys.Incoming", default=None)
+        sys_modify: Optional[bool] = pydantic.Field(alias="Sys.Modify", default=None)
+        sys_power_mgmt: Optional[bool] = pydantic.Field(alias="Sys.PowerMgmt", default=None)
+        sys_syslog: Optional[bool] = pydantic.Field(alias="Sys.Syslog", default=None)
+        user_modify: Optional[bool] = pydantic.Field(alias="User.Modify", default=None)
+        vmallocate: Optional[bool] = pydantic.Field(alias="VM.Allocate", default=None)
+        vmaudit: Optional[bool] = pydantic.Field(alias="VM.Audit", default=None)
+        vmbackup: Optional[bool] = pydantic.Field(alias="VM.Backup", default=None)
+        vmclone: Optional[bool] = pydantic.Field(alias="VM.Clone", default=None)
+        vmconfig_cdrom: Optional[bool] = pydantic.Field(alias="VM.Config.CDROM", default=None)
+        vmconfig_cpu: Optional[bool] = pydantic.Field(alias="VM.Config.CPU", default=None)
+        vmconfig_cloudinit: Optional[bool] = pydantic.Field(alias="VM.Config.Cloudinit", default=None)
+        vmconfig_disk: Optional[bool] = pydantic.Field(alias="VM.Config.Disk", default=None)
+        vmconfig_hwtype: Optional[bool] = pydantic.Field(alias="VM.Config.HWType", default=None)
+        vmconfig_memory: Optional[bool] = pydantic.Field(alias="VM.Config.Memory", default=None)
+        vmconfig_network: Optional[bool] = pydantic.Field(alias="VM.Config.Network", default=None)
+        vmconfig_options: Optional[bool] = pydantic.Field(alias="VM.Config.Options", default=None)
+        vmconsole: Optional[bool] = pydantic.Field(alias="VM.Console", default=None)
+        vmmigrate: Optional[bool] = pydantic.Field(alias="VM.Migrate", default=None)
+        vmmonitor: Optional[bool] = pydantic.Field(alias="VM.Monitor", default=None)
+        vmpower_mgmt: Optional[bool] = pydantic.Field(alias="VM.PowerMgmt", default=None)
+        vmsnapshot: Optional[bool] = pydantic.Field(alias="VM.Snapshot", default=None)
+        vmsnapshot_rollback: Optional[bool] = pydantic.Field(alias="VM.Snapshot.Rollback", default=None)
+
+
+class _Shape_91de349bb711:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "comment": NotRequired[str],
+            "digest": NotRequired[str],
+            "disable": NotRequired[bool],
+            "guest": int,
+            "id": str,
+            "jobnum": int,
+            "rate": NotRequired[float],
+            "remove_job": NotRequired[Literal["local", "full"]],
+            "schedule": NotRequired[str],
+            "source": NotRequired[str],
+            "target": str,
+            "type": Literal["local"],
+        },
+    )
+
+    class Model(BaseModel):
+        comment: Optional[str] = None
+        digest: Optional[str] = None
+        disable: Optional[bool] = None
+        guest: int
+        id: str
+        jobnum: int
+        rate: Optional[float] = None
+        remove_job: Optional[Literal["local", "full"]] = None
+        schedule: Optional[str] = None
+        source: Optional[str] = None
+        target: str
+        type: Literal["local"]
+
+
+class _Shape_58377c861d4d:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "comment": NotRequired[str],
+            "disable": NotRequired[bool],
+            "guest": int,
+            "id": str,
+            "jobnum": int,
+            "rate": NotRequired[float],
+            "remove_job": NotRequired[Literal["local", "full"]],
+            "schedule": NotRequired[str],
+            "source": NotRequired[str],
+            "target": str,
+            "type": Literal["local"],
+        },
+    )
+
+    class Model(BaseModel):
+        comment: Optional[str] = None
+        disable: Optional[bool] = None
+        guest: int
+        id: str
+        jobnum: int
+        rate: Optional[float] = None
+        remove_job: Optional[Literal["local", "full"]] = None
+        schedule: Optional[str] = None
+        source: Optional[str] = None
+        target: str
+        type: Literal["local"]
+
+
+class _Shape_00be1f850bca:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "cause": Literal["resource-affinity"],
+            "sid": str,
+        },
+    )
+
+    class Model(BaseModel):
+        cause: Literal["resource-affinity"]
+        sid: str
+
+
+class _Shape_c07e2eb80b91:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "comment": NotRequired[str],
+            "digest": str,
+            "failback": NotRequired[bool],
+            "group": NotRequired[str],
+            "max_relocate": NotRequired[int],
+            "max_restart": NotRequired[int],
+            "sid": str,
+            "state": NotRequired[Literal["started", "stopped", "enabled", "disabled", "ignored"]],
+            "type": str,
+        },
+    )
+
+    class Model(BaseModel):
+        comment: Optional[str] = None
+        digest: str
+        failback: Optional[bool] = None
+        group: Optional[str] = None
+        max_relocate: Optional[int] = None
+        max_restart: Optional[int] = None
+        sid: str
+        state: Optional[Literal["started", "stopped", "enabled", "disabled", "ignored"]] = None
+        type: str
+
+
+class _Shape_c517946479b6:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "rule": str,
+            "type": Literal["node-affinity", "resource-affinity"],
+        },
+    )
+
+    class Model(BaseModel):
+        rule: str
+        type: Literal["node-affinity", "resource-affinity"]
+
+
+class _Shape_2400e6e44df3:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "rule": str,
+            "affinity": NotRequired[str],
+            "disable": NotRequired[bool],
+            "strict": NotRequired[bool],
+            "nodes": NotRequired[str],
+            "resources": NotRequired[str],
+            "type": str,
+        },
+    )
+
+    class Model(BaseModel):
+        rule: str
+        affinity: Optional[str] = None
+        disable: Optional[bool] = None
+        strict: Optional[bool] = None
+        nodes: Optional[str] = None
+        resources: Optional[str] = None
+        type: str
+
+
+class _Shape_49c089124aba:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "crm_state": NotRequired[str],
+            "failback": NotRequired[bool],
+            "id": str,
+            "max_relocate": NotRequired[int],
+            "max_restart": NotRequired[int],
+            "node": str,
+            "quorate": NotRequired[bool],
+            "request_state": NotRequired[str],
+            "sid": NotRequired[str],
+            "state": NotRequired[str],
+            "status": str,
+            "timestamp": NotRequired[int],
+            "type": Literal["quorum", "master", "lrm", "service"],
+        },
+    )
+
+    class Model(BaseModel):
+        crm_state: Optional[str] = None
+        failback: Optional[bool] = None
+        id: str
+        max_relocate: Optional[int] = None
+        max_restart: Optional[int] = None
+        node: str
+        quorate: Optional[bool] = None
+        request_state: Optional[str] = None
+        sid: Optional[str] = None
+        state: Optional[str] = None
+        status: str
+        timestamp: Optional[int] = None
+        type: Literal["quorum", "master", "lrm", "service"]
+
+
+class _Shape_c20c913de4fd:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "api": NotRequired[Literal["1984hosting", "acmedns", "acmeproxy", "active24", "ad", "ali", "alviy", "anx", "artfiles", "arvan", "aurora", "autodns", "aws", "azion", "azure", "beget", "bookmyname", "bunny", "cf", "clouddns", "cloudns", "cn", "conoha", "constellix", "cpanel", "curanet", "cyon", "da", "ddnss", "desec", "df", "dgon", "dnsexit", "dnshome", "dnsimple", "dnsservices", "doapi", "domeneshop", "dp", "dpi", "dreamhost", "duckdns", "durabledns", "dyn", "dynu", "dynv6", "easydns", "edgecenter", "edgedns", "euserv", "exoscale", "fornex", "freedns", "freemyip", "gandi_livedns", "gcloud", "gcore", "gd", "geoscaling", "googledomains", "he", "he_ddns", "hetzner", "hexonet", "hostingde", "huaweicloud", "infoblox", "infomaniak", "internetbs", "inwx", "ionos", "ionos_cloud", "ipv64", "ispconfig", "jd", "joker", "kappernet", "kas", "kinghost", "knot", "la", "leaseweb", "lexicon", "limacity", "linode", "linode_v4", "loopia", "lua", "maradns", "me", "miab", "mijnhost", "misaka", "myapi", "mydevil", "mydnsjp", "mythic_beasts", "namecheap", "namecom", "namesilo", "nanelo", "nederhost", "neodigit", "netcup", "netlify", "nic", "njalla", "nm", "nsd", "nsone", "nsupdate", "nw", "oci", "omglol", "one", "online", "openprovider", "openstack", "opnsense", "ovh", "pdns", "pleskxml", "pointhq", "porkbun", "rackcorp", "rackspace", "rage4", "rcode0", "regru", "scaleway", "schlundtech", "selectel", "selfhost", "servercow", "simply", "technitium", "tele3", "tencent", "timeweb", "transip", "udr", "ultra", "unoeuro", "variomedia", "veesp", "vercel", "vscale", "vultr", "websupport", "west_cn", "world4you", "yandex360", "yc", "zilore", "zone", "zoneedit", "zonomi"]],
+            "data": NotRequired[str],
+            "digest": NotRequired[str],
+            "disable": NotRequired[bool],
+            "nodes": NotRequired[str],
+            "plugin": str,
+            "type": Literal["dns", "standalone"],
+            "validation-delay": NotRequired[int],
+        },
+    )
+
+    class Model(BaseModel):
+        api: Optional[Literal["1984hosting", "acmedns", "acmeproxy", "active24", "ad", "ali", "alviy", "anx", "artfiles", "arvan", "aurora", "autodns", "aws", "azion", "azure", "beget", "bookmyname", "bunny", "cf", "clouddns", "cloudns", "cn", "conoha", "constellix", "cpanel", "curanet", "cyon", "da", "ddnss", "desec", "df", "dgon", "dnsexit", "dnshome", "dnsimple", "dnsservices", "doapi", "domeneshop", "dp", "dpi", "dreamhost", "duckdns", "durabledns", "dyn", "dynu", "dynv6", "easydns", "edgecenter", "edgedns", "euserv", "exoscale", "fornex", "freedns", "freemyip", "gandi_livedns", "gcloud", "gcore", "gd", "geoscaling", "googledomains", "he", "he_ddns", "hetzner", "hexonet", "hostingde", "huaweicloud", "infoblox", "infomaniak", "internetbs", "inwx", "ionos", "ionos_cloud", "ipv64", "ispconfig", "jd", "joker", "kappernet", "kas", "kinghost", "knot", "la", "leaseweb", "lexicon", "limacity", "linode", "linode_v4", "loopia", "lua", "maradns", "me", "miab", "mijnhost", "misaka", "myapi", "mydevil", "mydnsjp", "mythic_beasts", "namecheap", "namecom", "namesilo", "nanelo", "nederhost", "neodigit", "netcup", "netlify", "nic", "njalla", "nm", "nsd", "nsone", "nsupdate", "nw", "oci", "omglol", "one", "online", "openprovider", "openstack", "opnsense", "ovh", "pdns", "pleskxml", "pointhq", "porkbun", "rackcorp", "rackspace", "rage4", "rcode0", "regru", "scaleway", "schlundtech", "selectel", "selfhost", "servercow", "simply", "technitium", "tele3", "tencent", "timeweb", "transip", "udr", "ultra", "unoeuro", "variomedia", "veesp", "vercel", "vscale", "vultr", "websupport", "west_cn", "world4you", "yandex360", "yc", "zilore", "zone", "zoneedit", "zonomi"]] = None
+        data: Optional[str] = None
+        digest: Optional[str] = None
+        disable: Optional[bool] = None
+        nodes: Optional[str] = None
+        plugin: str
+        type: Literal["dns", "standalone"]
+        validation_delay: Optional[int] = pydantic.Field(alias="validation-delay", default=None)
+
+
+class _Shape_ba24fd2418a7:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "alias": NotRequired[str],
+            "isolate-ports": NotRequired[bool],
+            "tag": NotRequired[int],
+            "vlanaware": NotRequired[bool],
+            "zone": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        alias: Optional[str] = None
+        isolate_ports: Optional[bool] = pydantic.Field(alias="isolate-ports", default=None)
+        tag: Optional[int] = None
+        vlanaware: Optional[bool] = None
+        zone: Optional[str] = None
+
+
+class _Shape_d000d4e630ee:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "advertise-subnets": NotRequired[bool],
+            "bridge": NotRequired[str],
+            "bridge-disable-mac-learning": NotRequired[bool],
+            "controller": NotRequired[str],
+            "dhcp": NotRequired[Literal["dnsmasq"]],
+            "disable-arp-nd-suppression": NotRequired[bool],
+            "dns": NotRequired[str],
+            "dnszone": NotRequired[str],
+            "exitnodes": NotRequired[str],
+            "exitnodes-local-routing": NotRequired[bool],
+            "exitnodes-primary": NotRequired[str],
+            "ipam": NotRequired[str],
+            "mac": NotRequired[str],
+            "mtu": NotRequired[int],
+            "nodes": NotRequired[str],
+            "peers": NotRequired[str],
+            "reversedns": NotRequired[str],
+            "rt-import": NotRequired[str],
+            "tag": NotRequired[int],
+            "vlan-protocol": NotRequired[Literal["802.1q", "802.1ad"]],
+            "vrf-vxlan": NotRequired[int],
+            "vxlan-port": NotRequired[int],
+        },
+    )
+
+    class Model(BaseModel):
+        advertise_subnets: Optional[bool] = pydantic.Field(alias="advertise-subnets", default=None)
+        bridge: Optional[str] = None
+        bridge_disable_mac_learning: Optional[bool] = pydantic.Field(alias="bridge-disable-mac-learning", default=None)
+        controller: Optional[str] = None
+        dhcp: Optional[Literal["dnsmasq"]] = None
+        disable_arp_nd_suppression: Optional[bool] = pydantic.Field(alias="disable-arp-nd-suppression", default=None)
+        dns: Optional[str] = None
+        dnszone: Optional[str] = None
+        exitnodes: Optional[str] = None
+        exitnodes_local_routing: Optional[bool] = pydantic.Field(alias="exitnodes-local-routing", default=None)
+        exitnodes_primary: Optional[str] = pydantic.Field(alias="exitnodes-primary", default=None)
+        ipam: Optional[str] = None
+        mac: Optional[str] = None
+        mtu: Optional[int] = None
+        nodes: Optional[str] = None
+        peers: Optional[str] = None
+        reversedns: Optional[str] = None
+        rt_import: Optional[str] = pydantic.Field(alias="rt-import", default=None)
+        tag: Optional[int] = None
+        vlan_protocol: Optional[Literal["802.1q", "802.1ad"]] = pydantic.Field(alias="vlan-protocol", default=None)
+        vrf_vxlan: Optional[int] = pydantic.Field(alias="vrf-vxlan", default=None)
+        vxlan_port: Optional[int] = pydantic.Field(alias="vxlan-port", default=None)
+
+
+class _Shape_2ca333dd6fba:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "asn": NotRequired[int],
+            "bgp-multipath-as-relax": NotRequired[bool],
+            "ebgp": NotRequired[bool],
+            "ebgp-multihop": NotRequired[int],
+            "isis-domain": NotRequired[str],
+            "isis-ifaces": NotRequired[str],
+            "isis-net": NotRequired[str],
+            "loopback": NotRequired[str],
+            "node": NotRequired[str],
+            "peers": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        asn: Optional[int] = None
+        bgp_multipath_as_relax: Optional[bool] = pydantic.Field(alias="bgp-multipath-as-relax", default=None)
+        ebgp: Optional[bool] = None
+        ebgp_multihop: Optional[int] = pydantic.Field(alias="ebgp-multihop", default=None)
+        isis_domain: Optional[str] = pydantic.Field(alias="isis-domain", default=None)
+        isis_ifaces: Optional[str] = pydantic.Field(alias="isis-ifaces", default=None)
+        isis_net: Optional[str] = pydantic.Field(alias="isis-net", default=None)
+        loopback: Optional[str] = None
+        node: Optional[str] = None
+        peers: Optional[str] = None
+
+
+class _Shape_54d0a842ae8e:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "area": NotRequired[str],
+            "csnp_interval": NotRequired[float],
+            "digest": NotRequired[str],
+            "hello_interval": NotRequired[float],
+            "id": str,
+            "ip6_prefix": NotRequired[str],
+            "ip_prefix": NotRequired[str],
+            "lock-token": NotRequired[str],
+            "protocol": Literal["openfabric", "ospf"],
+        },
+    )
+
+    class Model(BaseModel):
+        area: Optional[str] = None
+        csnp_interval: Optional[float] = None
+        digest: Optional[str] = None
+        hello_interval: Optional[float] = None
+        id: str
+        ip6_prefix: Optional[str] = None
+        ip_prefix: Optional[str] = None
+        lock_token: Optional[str] = pydantic.Field(alias="lock-token", default=None)
+        protocol: Literal["openfabric", "ospf"]
+
+
+class _Shape_566ce605bae1:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "digest": NotRequired[str],
+            "fabric_id": str,
+            "interfaces": list[Any],
+            "ip": NotRequired[str],
+            "ip6": NotRequired[str],
+            "lock-token": NotRequired[str],
+            "node_id": str,
+            "protocol": Literal["openfabric", "ospf"],
+        },
+    )
+
+    class Model(BaseModel):
+        digest: Optional[str] = None
+        fabric_id: str
+        interfaces: list[Any]
+        ip: Optional[str] = None
+        ip6: Optional[str] = None
+        lock_token: Optional[str] = pydantic.Field(alias="lock-token", default=None)
+        node_id: str
+        protocol: Literal["openfabric", "ospf"]
+
+
+class _Shape_784f71f2a911:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "cgroup-mode": NotRequired[int],
+            "content": NotRequired[str],
+            "cpu": NotRequired[float],
+            "disk": NotRequired[int],
+            "diskread": NotRequired[int],
+            "diskwrite": NotRequired[int],
+            "hastate": NotRequired[str],
+            "id": str,
+            "level": NotRequired[str],
+            "lock": NotRequired[str],
+            "maxcpu": NotRequired[float],
+            "maxdisk": NotRequired[int],
+            "maxmem": NotRequired[int],
+            "mem": NotRequired[int],
+            "memhost": NotRequired[int],
+            "name": NotRequired[str],
+            "netin": NotRequired[int],
+            "netout": NotRequired[int],
+            "network": NotRequired[str],
+            "network-type": NotRequired[Literal["fabric", "zone"]],
+            "node": NotRequired[str],
+            "plugintype": NotRequired[str],
+            "pool": NotRequired[str],
+            "protocol": NotRequired[str],
+            "sdn": NotRequired[str],
+            "status": NotRequired[str],
+            "storage": NotRequired[str],
+            "tags": NotRequired[str],
+            "template": NotRequired[bool],
+            "type": Literal["node", "storage", "pool", "qemu", "lxc", "openvz", "sdn", "network"],
+            "uptime": NotRequired[int],
+            "vmid": NotRequired[int],
+            "zone-type": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        cgroup_mode: Optional[int] = pydantic.Field(alias="cgroup-mode", default=None)
+        content: Optional[str] = None
+        cpu: Optional[float] = None
+        disk: Optional[int] = None
+        diskread: Optional[int] = None
+        diskwrite: Optional[int] = None
+        hastate: Optional[str] = None
+        id: str
+        level: Optional[str] = None
+        lock: Optional[str] = None
+        maxcpu: Optional[float] = None
+        maxdisk: Optional[int] = None
+        maxmem: Optional[int] = None
+        mem: Optional[int] = None
+        memhost: Optional[int] = None
+        name: Optional[str] = None
+        netin: Optional[int] = None
+        netout: Optional[int] = None
+        network: Optional[str] = None
+        network_type: Optional[Literal["fabric", "zone"]] = pydantic.Field(alias="network-type", default=None)
+        node: Optional[str] = None
+        plugintype: Optional[str] = None
+        pool: Optional[str] = None
+        protocol: Optional[str] = None
+        sdn: Optional[str] = None
+        status: Optional[str] = None
+        storage: Optional[str] = None
+        tags: Optional[str] = None
+        template: Optional[bool] = None
+        type: Literal["node", "storage", "pool", "qemu", "lxc", "openvz", "sdn", "network"]
+        uptime: Optional[int] = None
+        vmid: Optional[int] = None
+        zone_type: Optional[str] = pydantic.Field(alias="zone-type", default=None)
+
+
+class _Shape_361c4ca3b0ac:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "acpi": NotRequired[bool],
+            "affinity": NotRequired[str],
+            "agent": NotRequired[str],
+            "allow-ksm": NotRequired[bool],
+            "amd-sev": NotRequired[str],
+            "arch": NotRequired[Literal["x86_64", "aarch64"]],
+            "args": NotRequired[str],
+            "audio0": NotRequired[str],
+            "autostart": NotRequired[bool],
+            "balloon": NotRequired[int],
+            "bios": NotRequired[Literal["seabios", "ovmf"]],
+            "boot": NotRequired[str],
+            "bootdisk": NotRequired[str],
+            "cdrom": NotRequired[str],
+            "cicustom": NotRequired[str],
+            "cipassword": NotRequired[str],
+            "citype": NotRequired[Literal["configdrive2", "nocloud", "opennebula"]],
+            "ciupgrade": NotRequired[bool],
+            "ciuser": NotRequired[str],
+            "cores": NotRequired[int],
+            "cpu": NotRequired[str],
+            "cpulimit": NotRequired[float],
+            "cpuunits": NotRequired[int],
+            "description": NotRequired[str],
+            "digest": str,
+            "efidisk0": NotRequired[str],
+            "freeze": NotRequired[bool],
+            "hookscript": NotRequired[str],
+            "hostpci[n]": NotRequired[str],
+            "hotplug": NotRequired[str],
+            "hugepages": NotRequired[Literal["any", "2", "1024"]],
+            "ide[n]": NotRequired[str],
+            "intel-tdx": NotRequired[str],
+            "ipconfig[n]": NotRequired[str],
+            "ivshmem": NotRequired[str],
+            "keephugepages": NotRequired[bool],
+            "keyboard": NotRequired[Literal["de", "de-ch", "da", "en-gb", "en-us", "es", "fi", "fr", "fr-be", "fr-ca", "fr-ch", "hu", "is", "it", "ja", "lt", "mk", "nl", "no", "pl", "pt", "pt-br", "sv", "sl", "tr"]],
+            "kvm": NotRequired[bool],
+            "localtime": NotRequired[bool],
+            "lock": NotRequired[Literal["backup", "clone", "create", "migrate", "rollback", "snapshot", "snapshot-delete", "suspending", "suspended"]],
+            "machine": NotRequired[str],
+            "memory": NotRequired[str],
+            "meta": NotRequired[str],
+            "migrate_downtime": NotRequired[float],
+            "migrate_speed": NotRequired[int],
+            "name": NotRequired[str],
+            "nameserver": NotRequired[str],
+            "net[n]": NotRequired[str],
+            "numa": NotRequired[bool],
+            "numa[n]": NotRequired[str],
+            "onboot": NotRequired[bool],
+            "ostype": NotRequired[Literal["other", "wxp", "w2k", "w2k3", "w2k8", "wvista", "win7", "win8", "win10", "win11", "l24", "l26", "solaris"]],
+            "parallel[n]": NotRequired[str],
+            "parent": NotRequired[str],
+            "protection": NotRequired[bool],
+            "reboot": NotRequired[bool],
+            "rng0": NotRequired[str],
+            "running-nets-host-mtu": NotRequired[str],
+            "runningcpu": NotRequired[str],
+            "runningmachine": NotRequired[str],
+            "sata[n]": NotRequired[str],
+            "scsi[n]": NotRequired[str],
+            "scsihw": NotRequired[Literal["lsi", "lsi53c810", "virtio-scsi-pci", "virtio-scsi-single", "megasas", "pvscsi"]],
+            "searchdomain": NotRequired[str],
+            "serial[n]": NotRequired[str],
+            "shares": NotRequired[int],
+            "smbios1": NotRequired[str],
+            "smp": NotRequired[int],
+            "snaptime": NotRequired[int],
+            "sockets": NotRequired[int],
+            "spice_enhancements": NotRequired[str],
+            "sshkeys": NotRequired[str],
+            "startdate": NotRequired[str],
+            "startup": NotRequired[str],
+            "tablet": NotRequired[bool],
+            "tags": NotRequired[str],
+            "tdf": NotRequired[bool],
+            "template": NotRequired[bool],
+            "tpmstate0": NotRequired[str],
+            "unused[n]": NotRequired[str],
+            "usb[n]": NotRequired[str],
+            "vcpus": NotRequired[int],
+            "vga": NotRequired[str],
+            "virtio[n]": NotRequired[str],
+            "virtiofs[n]": NotRequired[str],
+            "vmgenid": NotRequired[str],
+            "vmstate": NotRequired[str],
+            "vmstatestorage": NotRequired[str],
+            "watchdog": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        acpi: Optional[bool] = None
+        affinity: Optional[str] = None
+        agent: Optional[str] = None
+        allow_ksm: Optional[bool] = pydantic.Field(alias="allow-ksm", default=None)
+        amd_sev: Optional[str] = pydantic.Field(alias="amd-sev", default=None)
+        arch: Optional[Literal["x86_64", "aarch64"]] = None
+        args: Optional[str] = None
+        audio0: Optional[str] = None
+        autostart: Optional[bool] = None
+        balloon: Optional[int] = None
+        bios: Optional[Literal["seabios", "ovmf"]] = None
+        boot: Optional[str] = None
+        bootdisk: Optional[str] = None
+        cdrom: Optional[str] = None
+        cicustom: Optional[str] = None
+        cipassword: Optional[str] = None
+        citype: Optional[Literal["configdrive2", "nocloud", "opennebula"]] = None
+        ciupgrade: Optional[bool] = None
+        ciuser: Optional[str] = None
+        cores: Optional[int] = None
+        cpu: Optional[str] = None
+        cpulimit: Optional[float] = None
+        cpuunits: Optional[int] = None
+        description: Optional[str] = None
+        digest: str
+        efidisk0: Optional[str] = None
+        freeze: Optional[bool] = None
+        hookscript: Optional[str] = None
+        hostpcin: Optional[str] = pydantic.Field(alias="hostpci[n]", default=None)
+        hotplug: Optional[str] = None
+        hugepages: Optional[Literal["any", "2", "1024"]] = None
+        iden: Optional[str] = pydantic.Field(alias="ide[n]", default=None)
+        intel_tdx: Optional[str] = pydantic.Field(alias="intel-tdx", default=None)
+        ipconfign: Optional[str] = pydantic.Field(alias="ipconfig[n]", default=None)
+        ivshmem: Optional[str] = None
+        keephugepages: Optional[bool] = None
+        keyboard: Optional[Literal["de", "de-ch", "da", "en-gb", "en-us", "es", "fi", "fr", "fr-be", "fr-ca", "fr-ch", "hu", "is", "it", "ja", "lt", "mk", "nl", "no", "pl", "pt", "pt-br", "sv", "sl", "tr"]] = None
+        kvm: Optional[bool] = None
+        localtime: Optional[bool] = None
+        lock: Optional[Literal["backup", "clone", "create", "migrate", "rollback", "snapshot", "snapshot-delete", "suspending", "suspended"]] = None
+        machine: Optional[str] = None
+        memory: Optional[str] = None
+        meta: Optional[str] = None
+        migrate_downtime: Optional[float] = None
+        migrate_speed: Optional[int] = None
+        name: Optional[str] = None
+        nameserver: Optional[str] = None
+        netn: Optional[str] = pydantic.Field(alias="net[n]", default=None)
+        numa: Optional[bool] = None
+        numan: Optional[str] = pydantic.Field(alias="numa[n]", default=None)
+        onboot: Optional[bool] = None
+        ostype: Optional[Literal["other", "wxp", "w2k", "w2k3", "w2k8", "wvista", "win7", "win8", "win10", "win11", "l24", "l26", "solaris"]] = None
+        paralleln: Optional[str] = pydantic.Field(alias="parallel[n]", default=None)
+        parent: Optional[str] = None
+        protection: Optional[bool] = None
+        reboot: Optional[bool] = None
+        rng0: Optional[str] = None
+        running_nets_host_mtu: Optional[str] = pydantic.Field(alias="running-nets-host-mtu", default=None)
+        runningcpu: Optional[str] = None
+        runningmachine: Optional[str] = None
+        satan: Optional[str] = pydantic.Field(alias="sata[n]", default=None)
+        scsin: Optional[str] = pydantic.Field(alias="scsi[n]", default=None)
+        scsihw: Optional[Literal["lsi", "lsi53c810", "virtio-scsi-pci", "virtio-scsi-single", "megasas", "pvscsi"]] = None
+        searchdomain: Optional[str] = None
+        serialn: Optional[str] = pydantic.Field(alias="serial[n]", default=None)
+        shares: Optional[int] = None
+        smbios1: Optional[str] = None
+        smp: Optional[int] = None
+        snaptime: Optional[int] = None
+        sockets: Optional[int] = None
+        spice_enhancements: Optional[str] = None
+        sshkeys: Optional[str] = None
+        startdate: Optional[str] = None
+        startup: Optional[str] = None
+        tablet: Optional[bool] = None
+        tags: Optional[str] = None
+        tdf: Optional[bool] = None
+        template: Optional[bool] = None
+        tpmstate0: Optional[str] = None
+        unusedn: Optional[str] = pydantic.Field(alias="unused[n]", default=None)
+        usbn: Optional[str] = pydantic.Field(alias="usb[n]", default=None)
+        vcpus: Optional[int] = None
+        vga: Optional[str] = None
+        virtion: Optional[str] = pydantic.Field(alias="virtio[n]", default=None)
+        virtiofsn: Optional[str] = pydantic.Field(alias="virtiofs[n]", default=None)
+        vmgenid: Optional[str] = None
+        vmstate: Optional[str] = None
+        vmstatestorage: Optional[str] = None
+        watchdog: Optional[str] = None
+
+
+class _Shape_f1a2a3638112:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "agent": NotRequired[bool],
+            "clipboard": NotRequired[Literal["vnc"]],
+            "cpu": NotRequired[float],
+            "cpus": NotRequired[float],
+            "diskread": NotRequired[int],
+            "diskwrite": NotRequired[int],
+            "ha": dict[str, Any],
+            "lock": NotRequired[str],
+            "maxdisk": NotRequired[int],
+            "maxmem": NotRequired[int],
+            "mem": NotRequired[int],
+            "memhost": NotRequired[int],
+            "name": NotRequired[str],
+            "netin": NotRequired[int],
+            "netout": NotRequired[int],
+            "pid": NotRequired[int],
+            "pressurecpufull": NotRequired[float],
+            "pressurecpusome": NotRequired[float],
+            "pressureiofull": NotRequired[float],
+            "pressureiosome": NotRequired[float],
+            "pressurememoryfull": NotRequired[float],
+            "pressurememorysome": NotRequired[float],
+            "qmpstatus": NotRequired[str],
+            "running-machine": NotRequired[str],
+            "running-qemu": NotRequired[str],
+            "serial": NotRequired[bool],
+            "spice": NotRequired[bool],
+            "status": Literal["stopped", "running"],
+            "tags": NotRequired[str],
+            "template": NotRequired[bool],
+            "uptime": NotRequired[int],
+            "vmid": int,
+        },
+    )
+
+    class Model(BaseModel):
+        agent: Optional[bool] = None
+        clipboard: Optional[Literal["vnc"]] = None
+        cpu: Optional[float] = None
+        cpus: Optional[float] = None
+        diskread: Optional[int] = None
+        diskwrite: Optional[int] = None
+        ha: dict[str, Any]
+        lock: Optional[str] = None
+        maxdisk: Optional[int] = None
+        maxmem: Optional[int] = None
+        mem: Optional[int] = None
+        memhost: Optional[int] = None
+        name: Optional[str] = None
+        netin: Optional[int] = None
+        netout: Optional[int] = None
+        pid: Optional[int] = None
+        pressurecpufull: Optional[float] = None
+        pressurecpusome: Optional[float] = None
+        pressureiofull: Optional[float] = None
+        pressureiosome: Optional[float] = None
+        pressurememoryfull: Optional[float] = None
+        pressurememorysome: Optional[float] = None
+        qmpstatus: Optional[str] = None
+        running_machine: Optional[str] = pydantic.Field(alias="running-machine", default=None)
+        running_qemu: Optional[str] = pydantic.Field(alias="running-qemu", default=None)
+        serial: Optional[bool] = None
+        spice: Optional[bool] = None
+        status: Literal["stopped", "running"]
+        tags: Optional[str] = None
+        template: Optional[bool] = None
+        uptime: Optional[int] = None
+        vmid: int
+
+
+class _Shape_21325a09318e:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "cpu": NotRequired[float],
+            "cpus": NotRequired[float],
+            "diskread": NotRequired[int],
+            "diskwrite": NotRequired[int],
+            "lock": NotRequired[str],
+            "maxdisk": NotRequired[int],
+            "maxmem": NotRequired[int],
+            "mem": NotRequired[int],
+            "memhost": NotRequired[int],
+            "name": NotRequired[str],
+            "netin": NotRequired[int],
+            "netout": NotRequired[int],
+            "pid": NotRequired[int],
+            "pressurecpufull": NotRequired[float],
+            "pressurecpusome": NotRequired[float],
+            "pressureiofull": NotRequired[float],
+            "pressureiosome": NotRequired[float],
+            "pressurememoryfull": NotRequired[float],
+            "pressurememorysome": NotRequired[float],
+            "qmpstatus": NotRequired[str],
+            "running-machine": NotRequired[str],
+            "running-qemu": NotRequired[str],
+            "serial": NotRequired[bool],
+            "status": Literal["stopped", "running"],
+            "tags": NotRequired[str],
+            "template": NotRequired[bool],
+            "uptime": NotRequired[int],
+            "vmid": int,
+            "disk": NotRequired[int],
+        },
+    )
+
+    class Model(BaseModel):
+        cpu: Optional[float] = None
+        cpus: Optional[float] = None
+        diskread: Optional[int] = None
+        diskwrite: Optional[int] = None
+        lock: Optional[str] = None
+        maxdisk: Optional[int] = None
+        maxmem: Optional[int] = None
+        mem: Optional[int] = None
+        memhost: Optional[int] = None
+        name: Optional[str] = None
+        netin: Optional[int] = None
+        netout: Optional[int] = None
+        pid: Optional[int] = None
+        pressurecpufull: Optional[float] = None
+        pressurecpusome: Optional[float] = None
+        pressureiofull: Optional[float] = None
+        pressureiosome: Optional[float] = None
+        pressurememoryfull: Optional[float] = None
+        pressurememorysome: Optional[float] = None
+        qmpstatus: Optional[str] = None
+        running_machine: Optional[str] = pydantic.Field(alias="running-machine", default=None)
+        running_qemu: Optional[str] = pydantic.Field(alias="running-qemu", default=None)
+        serial: Optional[bool] = None
+        status: Literal["stopped", "running"]
+        tags: Optional[str] = None
+        template: Optional[bool] = None
+        uptime: Optional[int] = None
+        vmid: int
+        disk: Optional[int] = None
+
+
+class _Shape_22198a38f7d9:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "arch": NotRequired[Literal["amd64", "i386", "arm64", "armhf", "riscv32", "riscv64"]],
+            "cmode": NotRequired[Literal["shell", "console", "tty"]],
+            "console": NotRequired[bool],
+            "cores": NotRequired[int],
+            "cpulimit": NotRequired[float],
+            "cpuunits": NotRequired[int],
+            "debug": NotRequired[bool],
+            "description": NotRequired[str],
+            "dev[n]": NotRequired[str],
+            "digest": str,
+            "entrypoint": NotRequired[str],
+            "env": NotRequired[str],
+            "features": NotRequired[str],
+            "hookscript": NotRequired[str],
+            "hostname": NotRequired[str],
+            "lock": NotRequired[Literal["backup", "create", "destroyed", "disk", "fstrim", "migrate", "mounted", "rollback", "snapshot", "snapshot-delete"]],
+            "lxc": NotRequired[list[list[str]]],
+            "memory": NotRequired[int],
+            "mp[n]": NotRequired[str],
+            "nameserver": NotRequired[str],
+            "net[n]": NotRequired[str],
+            "onboot": NotRequired[bool],
+            "ostype": NotRequired[Literal["debian", "devuan", "ubuntu", "centos", "fedora", "opensuse", "archlinux", "alpine", "gentoo", "nixos", "unmanaged"]],
+            "protection": NotRequired[bool],
+            "rootfs": NotRequired[str],
+            "searchdomain": NotRequired[str],
+            "startup": NotRequired[str],
+            "swap": NotRequired[int],
+            "tags": NotRequired[str],
+            "template": NotRequired[bool],
+            "timezone": NotRequired[str],
+            "tty": NotRequired[int],
+            "unprivileged": NotRequired[bool],
+            "unused[n]": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        arch: Optional[Literal["amd64", "i386", "arm64", "armhf", "riscv32", "riscv64"]] = None
+        cmode: Optional[Literal["shell", "console", "tty"]] = None
+        console: Optional[bool] = None
+        cores: Optional[int] = None
+        cpulimit: Optional[float] = None
+        cpuunits: Optional[int] = None
+        debug: Optional[bool] = None
+        description: Optional[str] = None
+        devn: Optional[str] = pydantic.Field(alias="dev[n]", default=None)
+        digest: str
+        entrypoint: Optional[str] = None
+        env: Optional[str] = None
+        features: Optional[str] = None
+        hookscript: Optional[str] = None
+        hostname: Optional[str] = None
+        lock: Optional[Literal["backup", "create", "destroyed", "disk", "fstrim", "migrate", "mounted", "rollback", "snapshot", "snapshot-delete"]] = None
+        lxc: Optional[list[list[str]]] = None
+        memory: Optional[int] = None
+        mpn: Optional[str] = pydantic.Field(alias="mp[n]", default=None)
+        nameserver: Optional[str] = None
+        netn: Optional[str] = pydantic.Field(alias="net[n]", default=None)
+        onboot: Optional[bool] = None
+        ostype: Optional[Literal["debian", "devuan", "ubuntu", "centos", "fedora", "opensuse", "archlinux", "alpine", "gentoo", "nixos", "unmanaged"]] = None
+        protection: Optional[bool] = None
+        rootfs: Optional[str] = None
+        searchdomain: Optional[str] = None
+        startup: Optional[str] = None
+        swap: Optional[int] = None
+        tags: Optional[str] = None
+        template: Optional[bool] = None
+        timezone: Optional[str] = None
+        tty: Optional[int] = None
+        unprivileged: Optional[bool] = None
+        unusedn: Optional[str] = pydantic.Field(alias="unused[n]", default=None)
+
+
+class _Shape_fa394be9f0d4:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "cpu": NotRequired[float],
+            "cpus": NotRequired[float],
+            "disk": NotRequired[int],
+            "diskread": NotRequired[int],
+            "diskwrite": NotRequired[int],
+            "ha": dict[str, Any],
+            "lock": NotRequired[str],
+            "maxdisk": NotRequired[int],
+            "maxmem": NotRequired[int],
+            "maxswap": NotRequired[int],
+            "mem": NotRequired[int],
+            "name": NotRequired[str],
+            "netin": NotRequired[int],
+            "netout": NotRequired[int],
+            "pressurecpusome": NotRequired[float],
+            "pressureiofull": NotRequired[float],
+            "pressureiosome": NotRequired[float],
+            "pressurememoryfull": NotRequired[float],
+            "pressurememorysome": NotRequired[float],
+            "status": Literal["stopped", "running"],
+            "tags": NotRequired[str],
+            "template": NotRequired[bool],
+            "uptime": NotRequired[int],
+            "vmid": int,
+        },
+    )
+
+    class Model(BaseModel):
+        cpu: Optional[float] = None
+        cpus: Optional[float] = None
+        disk: Optional[int] = None
+        diskread: Optional[int] = None
+        diskwrite: Optional[int] = None
+        ha: dict[str, Any]
+        lock: Optional[str] = None
+        maxdisk: Optional[int] = None
+        maxmem: Optional[int] = None
+        maxswap: Optional[int] = None
+        mem: Optional[int] = None
+        name: Optional[str] = None
+        netin: Optional[int] = None
+        netout: Optional[int] = None
+        pressurecpusome: Optional[float] = None
+        pressureiofull: Optional[float] = None
+        pressureiosome: Optional[float] = None
+        pressurememoryfull: Optional[float] = None
+        pressurememorysome: Optional[float] = None
+        status: Literal["stopped", "running"]
+        tags: Optional[str] = None
+        template: Optional[bool] = None
+        uptime: Optional[int] = None
+        vmid: int
+
+
+class _Shape_513ed09e5540:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "cpu": NotRequired[float],
+            "cpus": NotRequired[float],
+            "disk": NotRequired[int],
+            "diskread": NotRequired[int],
+            "diskwrite": NotRequired[int],
+            "lock": NotRequired[str],
+            "maxdisk": NotRequired[int],
+            "maxmem": NotRequired[int],
+            "maxswap": NotRequired[int],
+            "mem": NotRequired[int],
+            "name": NotRequired[str],
+            "netin": NotRequired[int],
+            "netout": NotRequired[int],
+            "pressurecpusome": NotRequired[float],
+            "pressureiofull": NotRequired[float],
+            "pressureiosome": NotRequired[float],
+            "pressurememoryfull": NotRequired[float],
+            "pressurememorysome": NotRequired[float],
+            "status": Literal["stopped", "running"],
+            "tags": NotRequired[str],
+            "template": NotRequired[bool],
+            "uptime": NotRequired[int],
+            "vmid": int,
+        },
+    )
+
+    class Model(BaseModel):
+        cpu: Optional[float] = None
+        cpus: Optional[float] = None
+        disk: Optional[int] = None
+        diskread: Optional[int] = None
+        diskwrite: Optional[int] = None
+        lock: Optional[str] = None
+        maxdisk: Optional[int] = None
+        maxmem: Optional[int] = None
+        maxswap: Optional[int] = None
+        mem: Optional[int] = None
+        name: Optional[str] = None
+        netin: Optional[int] = None
+        netout: Optional[int] = None
+        pressurecpusome: Optional[float] = None
+        pressureiofull: Optional[float] = None
+        pressureiosome: Optional[float] = None
+        pressurememoryfull: Optional[float] = None
+        pressurememorysome: Optional[float] = None
+        status: Literal["stopped", "running"]
+        tags: Optional[str] = None
+        template: Optional[bool] = None
+        uptime: Optional[int] = None
+        vmid: int
+
+
+class _Shape_b71081d55dcf:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "addr": NotRequired[str],
+            "host": NotRequired[str],
+            "name": str,
+            "rank": NotRequired[int],
+            "standby_replay": NotRequired[bool],
+            "state": str,
+        },
+    )
+
+    class Model(BaseModel):
+        addr: Optional[str] = None
+        host: Optional[str] = None
+        name: str
+        rank: Optional[int] = None
+        standby_replay: Optional[bool] = None
+        state: str
+
+
+class _Shape_d9a34ed9e509:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "addr": NotRequired[str],
+            "host": NotRequired[str],
+            "name": str,
+            "state": str,
+        },
+    )
+
+    class Model(BaseModel):
+        addr: Optional[str] = None
+        host: Optional[str] = None
+        name: str
+        state: str
+
+
+class _Shape_b3d72d75ab2e:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "all": NotRequired[bool],
+            "bwlimit": NotRequired[int],
+            "compress": NotRequired[Literal["0", "1", "gzip", "lzo", "zstd"]],
+            "dumpdir": NotRequired[str],
+            "exclude": NotRequired[str],
+            "exclude-path": NotRequired[list[str]],
+            "fleecing": NotRequired[str],
+            "ionice": NotRequired[int],
+            "lockwait": NotRequired[int],
+            "mailnotification": NotRequired[Literal["always", "failure"]],
+            "mailto": NotRequired[str],
+            "maxfiles": NotRequired[int],
+            "mode": NotRequired[Literal["snapshot", "suspend", "stop"]],
+            "node": NotRequired[str],
+            "notes-template": NotRequired[str],
+            "notification-mode": NotRequired[Literal["auto", "legacy-sendmail", "notification-system"]],
+            "pbs-change-detection-mode": NotRequired[Literal["legacy", "data", "metadata"]],
+            "performance": NotRequired[str],
+            "pigz": NotRequired[int],
+            "pool": NotRequired[str],
+            "protected": NotRequired[bool],
+            "prune-backups": NotRequired[str],
+            "quiet": NotRequired[bool],
+            "remove": NotRequired[bool],
+            "script": NotRequired[str],
+            "stdexcludes": NotRequired[bool],
+            "stop": NotRequired[bool],
+            "stopwait": NotRequired[int],
+            "storage": NotRequired[str],
+            "tmpdir": NotRequired[str],
+            "vmid": NotRequired[str],
+            "zstd": NotRequired[int],
+        },
+    )
+
+    class Model(BaseModel):
+        all: Optional[bool] = None
+        bwlimit: Optional[int] = None
+        compress: Optional[Literal["0", "1", "gzip", "lzo", "zstd"]] = None
+        dumpdir: Optional[str] = None
+        exclude: Optional[str] = None
+        exclude_path: Optional[list[str]] = pydantic.Field(alias="exclude-path", default=None)
+        fleecing: Optional[str] = None
+        ionice: Optional[int] = None
+        lockwait: Optional[int] = None
+        mailnotification: Optional[Literal["always", "failure"]] = None
+        mailto: Optional[str] = None
+        maxfiles: Optional[int] = None
+        mode: Optional[Literal["snapshot", "suspend", "stop"]] = None
+        node: Optional[str] = None
+        notes_template: Optional[str] = pydantic.Field(alias="notes-template", default=None)
+        notification_mode: Optional[Literal["auto", "legacy-sendmail", "notification-system"]] = pydantic.Field(alias="notification-mode", default=None)
+        pbs_change_detection_mode: Optional[Literal["legacy", "data", "metadata"]] = pydantic.Field(alias="pbs-change-detection-mode", default=None)
+        performance: Optional[str] = None
+        pigz: Optional[int] = None
+        pool: Optional[str] = None
+        protected: Optional[bool] = None
+        prune_backups: Optional[str] = pydantic.Field(alias="prune-backups", default=None)
+        quiet: Optional[bool] = None
+        remove: Optional[bool] = None
+        script: Optional[str] = None
+        stdexcludes: Optional[bool] = None
+        stop: Optional[bool] = None
+        stopwait: Optional[int] = None
+        storage: Optional[str] = None
+        tmpdir: Optional[str] = None
+        vmid: Optional[str] = None
+        zstd: Optional[int] = None
+
+
+class _Shape_f4c88d2d1631:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "active-state": Literal["active", "inactive", "failed", "activating", "deactivating", "maintenance", "reloading", "refreshing", "unknown"],
+            "desc": str,
+            "name": str,
+            "service": str,
+            "state": Literal["dead", "condition", "start-pre", "start", "start-post", "running", "exited", "reload", "reload-signal", "reload-notify", "mounting", "stop", "stop-watchdog", "stop-sigterm", "stop-sigkill", "stop-post", "final-watchdog", "final-sigterm", "final-sigkill", "failed", "dead-before-auto-restart", "failed-before-auto-restart", "dead-resources-pinned", "auto-restart", "auto-restart-queued", "cleaning", "unknown"],
+            "unit-state": Literal["enabled", "enabled-runtime", "linked", "linked-runtime", "alias", "masked", "masked-runtime", "static", "disabled", "indirect", "generated", "transient", "bad", "not-found", "unknown"],
+        },
+    )
+
+    class Model(BaseModel):
+        active_state: Literal["active", "inactive", "failed", "activating", "deactivating", "maintenance", "reloading", "refreshing", "unknown"] = pydantic.Field(alias="active-state")
+        desc: str
+        name: str
+        service: str
+        state: Literal["dead", "condition", "start-pre", "start", "start-post", "running", "exited", "reload", "reload-signal", "reload-notify", "mounting", "stop", "stop-watchdog", "stop-sigterm", "stop-sigkill", "stop-post", "final-watchdog", "final-sigterm", "final-sigkill", "failed", "dead-before-auto-restart", "failed-before-auto-restart", "dead-resources-pinned", "auto-restart", "auto-restart-queued", "cleaning", "unknown"]
+        unit_state: Literal["enabled", "enabled-runtime", "linked", "linked-runtime", "alias", "masked", "masked-runtime", "static", "disabled", "indirect", "generated", "transient", "bad", "not-found", "unknown"] = pydantic.Field(alias="unit-state")
+
+
+class _Shape_da9965f9bfe9:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "active": NotRequired[bool],
+            "address": NotRequired[str],
+            "address6": NotRequired[str],
+            "autostart": NotRequired[bool],
+            "bond-primary": NotRequired[str],
+            "bond_mode": NotRequired[Literal["balance-rr", "active-backup", "balance-xor", "broadcast", "802.3ad", "balance-tlb", "balance-alb", "balance-slb", "lacp-balance-slb", "lacp-balance-tcp"]],
+            "bond_xmit_hash_policy": NotRequired[Literal["layer2", "layer2+3", "layer3+4"]],
+            "bridge-access": NotRequired[int],
+            "bridge-arp-nd-suppress": NotRequired[bool],
+            "bridge-learning": NotRequired[bool],
+            "bridge-multicast-flood": NotRequired[bool],
+            "bridge-unicast-flood": NotRequired[bool],
+            "bridge_ports": NotRequired[str],
+            "bridge_vids": NotRequired[str],
+            "bridge_vlan_aware": NotRequired[bool],
+            "cidr": NotRequired[str],
+            "cidr6": NotRequired[str],
+            "comments": NotRequired[str],
+            "comments6": NotRequired[str],
+            "exists": NotRequired[bool],
+            "families": NotRequired[list[Literal["inet", "inet6"]]],
+            "gateway": NotRequired[str],
+            "gateway6": NotRequired[str],
+            "iface": str,
+            "link-type": NotRequired[str],
+            "method": NotRequired[Literal["loopback", "dhcp", "manual", "static", "auto"]],
+            "method6": NotRequired[Literal["loopback", "dhcp", "manual", "static", "auto"]],
+            "mtu": NotRequired[int],
+            "netmask": NotRequired[str],
+            "netmask6": NotRequired[int],
+            "options": NotRequired[list[str]],
+            "options6": NotRequired[list[str]],
+            "ovs_bonds": NotRequired[str],
+            "ovs_bridge": NotRequired[str],
+            "ovs_options": NotRequired[str],
+            "ovs_ports": NotRequired[str],
+            "ovs_tag": NotRequired[int],
+            "priority": NotRequired[int],
+            "slaves": NotRequired[str],
+            "type": Literal["bridge", "bond", "eth", "alias", "vlan", "fabric", "OVSBridge", "OVSBond", "OVSPort", "OVSIntPort", "vnet", "unknown"],
+            "uplink-id": NotRequired[str],
+            "vlan-id": NotRequired[int],
+            "vlan-protocol": NotRequired[Literal["802.1ad", "802.1q"]],
+            "vlan-raw-device": NotRequired[str],
+            "vxlan-id": NotRequired[int],
+            "vxlan-local-tunnelip": NotRequired[str],
+            "vxlan-physdev": NotRequired[str],
+            "vxlan-svcnodeip": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        active: Optional[bool] = None
+        address: Optional[str] = None
+        address6: Optional[str] = None
+        autostart: Optional[bool] = None
+        bond_primary: Optional[str] = pydantic.Field(alias="bond-primary", default=None)
+        bond_mode: Optional[Literal["balance-rr", "active-backup", "balance-xor", "broadcast", "802.3ad", "balance-tlb", "balance-alb", "balance-slb", "lacp-balance-slb", "lacp-balance-tcp"]] = None
+        bond_xmit_hash_policy: Optional[Literal["layer2", "layer2+3", "layer3+4"]] = None
+        bridge_access: Optional[int] = pydantic.Field(alias="bridge-access", default=None)
+        bridge_arp_nd_suppress: Optional[bool] = pydantic.Field(alias="bridge-arp-nd-suppress", default=None)
+        bridge_learning: Optional[bool] = pydantic.Field(alias="bridge-learning", default=None)
+        bridge_multicast_flood: Optional[bool] = pydantic.Field(alias="bridge-multicast-flood", default=None)
+        bridge_unicast_flood: Optional[bool] = pydantic.Field(alias="bridge-unicast-flood", default=None)
+        bridge_ports: Optional[str] = None
+        bridge_vids: Optional[str] = None
+        bridge_vlan_aware: Optional[bool] = None
+        cidr: Optional[str] = None
+        cidr6: Optional[str] = None
+        comments: Optional[str] = None
+        comments6: Optional[str] = None
+        exists: Optional[bool] = None
+        families: Optional[list[Literal["inet", "inet6"]]] = None
+        gateway: Optional[str] = None
+        gateway6: Optional[str] = None
+        iface: str
+        link_type: Optional[str] = pydantic.Field(alias="link-type", default=None)
+        method: Optional[Literal["loopback", "dhcp", "manual", "static", "auto"]] = None
+        method6: Optional[Literal["loopback", "dhcp", "manual", "static", "auto"]] = None
+        mtu: Optional[int] = None
+        netmask: Optional[str] = None
+        netmask6: Optional[int] = None
+        options: Optional[list[str]] = None
+        options6: Optional[list[str]] = None
+        ovs_bonds: Optional[str] = None
+        ovs_bridge: Optional[str] = None
+        ovs_options: Optional[str] = None
+        ovs_ports: Optional[str] = None
+        ovs_tag: Optional[int] = None
+        priority: Optional[int] = None
+        slaves: Optional[str] = None
+        type: Literal["bridge", "bond", "eth", "alias", "vlan", "fabric", "OVSBridge", "OVSBond", "OVSPort", "OVSIntPort", "vnet", "unknown"]
+        uplink_id: Optional[str] = pydantic.Field(alias="uplink-id", default=None)
+        vlan_id: Optional[int] = pydantic.Field(alias="vlan-id", default=None)
+        vlan_protocol: Optional[Literal["802.1ad", "802.1q"]] = pydantic.Field(alias="vlan-protocol", default=None)
+        vlan_raw_device: Optional[str] = pydantic.Field(alias="vlan-raw-device", default=None)
+        vxlan_id: Optional[int] = pydantic.Field(alias="vxlan-id", default=None)
+        vxlan_local_tunnelip: Optional[str] = pydantic.Field(alias="vxlan-local-tunnelip", default=None)
+        vxlan_physdev: Optional[str] = pydantic.Field(alias="vxlan-physdev", default=None)
+        vxlan_svcnodeip: Optional[str] = pydantic.Field(alias="vxlan-svcnodeip", default=None)
+
+
+class _Shape_f6e8efdf3533:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "description": str,
+            "name": str,
+        },
+    )
+
+    class Model(BaseModel):
+        description: str
+        name: str
+
+
+class _Shape_f463c140f029:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "has-dbus-vmstate": bool,
+        },
+    )
+
+    class Model(BaseModel):
+        has_dbus_vmstate: bool = pydantic.Field(alias="has-dbus-vmstate")
+
+
+class _Shape_77544343d297:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "active": NotRequired[bool],
+            "avail": NotRequired[int],
+            "content": str,
+            "enabled": NotRequired[bool],
+            "shared": NotRequired[bool],
+            "total": NotRequired[int],
+            "type": str,
+            "used": NotRequired[int],
+        },
+    )
+
+    class Model(BaseModel):
+        active: Optional[bool] = None
+        avail: Optional[int] = None
+        content: str
+        enabled: Optional[bool] = None
+        shared: Optional[bool] = None
+        total: Optional[int] = None
+        type: str
+        used: Optional[int] = None
+
+
+class _Shape_d925e9523e08:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "default": Literal["qcow2", "raw", "subvol", "vmdk"],
+            "supported": list[Literal["qcow2", "raw", "subvol", "vmdk"]],
+        },
+    )
+
+    class Model(BaseModel):
+        default: Literal["qcow2", "raw", "subvol", "vmdk"]
+        supported: list[Literal["qcow2", "raw", "subvol", "vmdk"]]
+
+
+class _Shape_e068ed707793:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "Arch": Literal["armhf", "arm64", "amd64", "ppc64el", "risc64", "s390x", "all"],
+            "Description": str,
+            "NotifyStatus": NotRequired[str],
+            "OldVersion": NotRequired[str],
+            "Origin": str,
+            "Package": str,
+            "Priority": str,
+            "Section": str,
+            "Title": str,
+            "Version": str,
+        },
+    )
+
+    class Model(BaseModel):
+        arch: Literal["armhf", "arm64", "amd64", "ppc64el", "risc64", "s390x", "all"] = pydantic.Field(alias="Arch")
+        description: str = pydantic.Field(alias="Description")
+        notify_status: Optional[str] = pydantic.Field(alias="NotifyStatus", default=None)
+        old_version: Optional[str] = pydantic.Field(alias="OldVersion", default=None)
+        origin: str = pydantic.Field(alias="Origin")
+        package: str = pydantic.Field(alias="Package")
+        priority: str = pydantic.Field(alias="Priority")
+        section: str = pydantic.Field(alias="Section")
+        title: str = pydantic.Field(alias="Title")
+        version: str = pydantic.Field(alias="Version")
+
+
+class _Shape_cfbbab9bf3c6:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "index": int,
+            "kind": str,
+            "message": str,
+            "path": str,
+            "property": NotRequired[str],
+        },
+    )
+
+    class Model(BaseModel):
+        index: int
+        kind: str
+        message: str
+        path: str
+        property: Optional[str] = None
+
+
+class _Shape_95e040a8b0bf:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "Arch": Literal["armhf", "arm64", "amd64", "ppc64el", "risc64", "s390x", "all"],
+            "CurrentState": Literal["Installed", "NotInstalled", "UnPacked", "HalfConfigured", "HalfInstalled", "ConfigFiles"],
+            "Description": str,
+            "ManagerVersion": NotRequired[str],
+            "NotifyStatus": NotRequired[str],
+            "OldVersion": NotRequired[str],
+            "Origin": str,
+            "Package": str,
+            "Priority": str,
+            "RunningKernel": NotRequired[str],
+            "Section": str,
+            "Title": str,
+            "Version": str,
+        },
+    )
+
+    class Model(BaseModel):
+        arch: Literal["armhf", "arm64", "amd64", "ppc64el", "risc64", "s390x", "all"] = pydantic.Field(alias="Arch")
+        current_state: Literal["Installed", "NotInstalled", "UnPacked", "HalfConfigured", "HalfInstalled", "ConfigFiles"] = pydantic.Field(alias="CurrentState")
+        description: str = pydantic.Field(alias="Description")
+        manager_version: Optional[str] = pydantic.Field(alias="ManagerVersion", default=None)
+        notify_status: Optional[str] = pydantic.Field(alias="NotifyStatus", default=None)
+        old_version: Optional[str] = pydantic.Field(alias="OldVersion", default=None)
+        origin: str = pydantic.Field(alias="Origin")
+        package: str = pydantic.Field(alias="Package")
+        priority: str = pydantic.Field(alias="Priority")
+        running_kernel: Optional[str] = pydantic.Field(alias="RunningKernel", default=None)
+        section: str = pydantic.Field(alias="Section")
+        title: str = pydantic.Field(alias="Title")
+        version: str = pydantic.Field(alias="Version")
+
+
+class _Shape_9f5e420fa70f:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "route": str,
+            "via": list[str],
+        },
+    )
+
+    class Model(BaseModel):
+        route: str
+        via: list[str]
+
+
+class _Shape_e4e3839dc65e:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "neighbor": str,
+            "status": str,
+            "uptime": str,
+        },
+    )
+
+    class Model(BaseModel):
+        neighbor: str
+        status: str
+        uptime: str
+
+
+class _Shape_8748487fd610:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "name": str,
+            "state": str,
+            "type": str,
+        },
+    )
+
+    class Model(BaseModel):
+        name: str
+        state: str
+        type: str
+
+
+class _Shape_81abe9c235e3:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "index": NotRequired[str],
+            "name": str,
+            "primary_vlan": NotRequired[float],
+            "vlans": NotRequired[list[str]],
+            "vmid": NotRequired[float],
+        },
+    )
+
+    class Model(BaseModel):
+        index: Optional[str] = None
+        name: str
+        primary_vlan: Optional[float] = None
+        vlans: Optional[list[str]] = None
+        vmid: Optional[float] = None
+
+
+class _Shape_db62e95281c1:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "ip": str,
+            "metric": int,
+            "nexthops": list[str],
+            "protocol": str,
+        },
+    )
+
+    class Model(BaseModel):
+        ip: str
+        metric: int
+        nexthops: list[str]
+        protocol: str
+
+
+class _Shape_84208e6714d3:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "ip": str,
+            "mac": str,
+            "nexthop": str,
+        },
+    )
+
+    class Model(BaseModel):
+        ip: str
+        mac: str
+        nexthop: str
+
+
+class _Shape_08323d727910:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "available": int,
+            "free": int,
+            "total": int,
+            "used": int,
+        },
+    )
+
+    class Model(BaseModel):
+        available: int
+        free: int
+        total: int
+        used: int
+
+
+class _Shape_1a83d69a5199:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "cpu": NotRequired[float],
+            "level": NotRequired[str],
+            "maxcpu": NotRequired[int],
+            "maxmem": NotRequired[int],
+            "mem": NotRequired[int],
+            "node": str,
+            "ssl_fingerprint": NotRequired[str],
+            "status": Literal["unknown", "online", "offline"],
+            "uptime": NotRequired[int],
+            "disk": NotRequired[int],
+            "maxdisk": NotRequired[int],
+        },
+    )
+
+    class Model(BaseModel):
+        cpu: Optional[float] = None
+        level: Optional[str] = None
+        maxcpu: Optional[int] = None
+        maxmem: Optional[int] = None
+        mem: Optional[int] = None
+        node: str
+        ssl_fingerprint: Optional[str] = None
+        status: Literal["unknown", "online", "offline"]
+        uptime: Optional[int] = None
+        disk: Optional[int] = None
+        maxdisk: Optional[int] = None
+
+
+class _Shape_4a4489771dea:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "Datastore.Allocate": NotRequired[bool],
+            "Datastore.AllocateSpace": NotRequired[bool],
+            "Datastore.AllocateTemplate": NotRequired[bool],
+            "Datastore.Audit": NotRequired[bool],
+            "Group.Allocate": NotRequired[bool],
+            "Mapping.Audit": NotRequired[bool],
+            "Mapping.Modify": NotRequired[bool],
+            "Mapping.Use": NotRequired[bool],
+            "Permissions.Modify": NotRequired[bool],
+            "Pool.Allocate": NotRequired[bool],
+            "Pool.Audit": NotRequired[bool],
+            "Realm.Allocate": NotRequired[bool],
+            "Realm.AllocateUser": NotRequired[bool],
+            "SDN.Allocate": NotRequired[bool],
+            "SDN.Audit": NotRequired[bool],
+            "SDN.Use": NotRequired[bool],
+            "Sys.AccessNetwork": NotRequired[bool],
+            "Sys.Audit": NotRequired[bool],
+            "Sys.Console": NotRequired[bool],
+            "Sys.Incoming": NotRequired[bool],
+            "Sys.Modify": NotRequired[bool],
+            "Sys.PowerMgmt": NotRequired[bool],
+            "Sys.Syslog": NotRequired[bool],
+            "User.Modify": NotRequired[bool],
+            "VM.Allocate": NotRequired[bool],
+            "VM.Audit": NotRequired[bool],
+            "VM.Backup": NotRequired[bool],
+            "VM.Clone": NotRequired[bool],
+            "VM.Config.CDROM": NotRequired[bool],
+            "VM.Config.CPU": NotRequired[bool],
+            "VM.Config.Cloudinit": NotRequired[bool],
+            "VM.Config.Disk": NotRequired[bool],
+            "VM.Config.HWType": NotRequired[bool],
+            "VM.Config.Memory": NotRequired[bool],
+            "VM.Config.Network": NotRequired[bool],
+            "VM.Config.Options": NotRequired[bool],
+            "VM.Console": NotRequired[bool],
+            "VM.GuestAgent.Audit": NotRequired[bool],
+            "VM.GuestAgent.FileRead": NotRequired[bool],
+            "VM.GuestAgent.FileSystemMgmt": NotRequired[bool],
+            "VM.GuestAgent.FileWrite": NotRequired[bool],
+            "VM.GuestAgent.Unrestricted": NotRequired[bool],
+            "VM.Migrate": NotRequired[bool],
+            "VM.PowerMgmt": NotRequired[bool],
+            "VM.Replicate": NotRequired[bool],
+            "VM.Snapshot": NotRequired[bool],
+            "VM.Snapshot.Rollback": NotRequired[bool],
+        },
+    )
+
+    class Model(BaseModel):
+        datastore_allocate: Optional[bool] = pydantic.Field(alias="Datastore.Allocate", default=None)
+        datastore_allocate_space: Optional[bool] = pydantic.Field(alias="Datastore.AllocateSpace", default=None)
+        datastore_allocate_template: Optional[bool] = pydantic.Field(alias="Datastore.AllocateTemplate", default=None)
+        datastore_audit: Optional[bool] = pydantic.Field(alias="Datastore.Audit", default=None)
+        group_allocate: Optional[bool] = pydantic.Field(alias="Group.Allocate", default=None)
+        mapping_audit: Optional[bool] = pydantic.Field(alias="Mapping.Audit", default=None)
+        mapping_modify: Optional[bool] = pydantic.Field(alias="Mapping.Modify", default=None)
+        mapping_use: Optional[bool] = pydantic.Field(alias="Mapping.Use", default=None)
+        permissions_modify: Optional[bool] = pydantic.Field(alias="Permissions.Modify", default=None)
+        pool_allocate: Optional[bool] = pydantic.Field(alias="Pool.Allocate", default=None)
+        pool_audit: Optional[bool] = pydantic.Field(alias="Pool.Audit", default=None)
+        realm_allocate: Optional[bool] = pydantic.Field(alias="Realm.Allocate", default=None)
+        realm_allocate_user: Optional[bool] = pydantic.Field(alias="Realm.AllocateUser", default=None)
+        sdnallocate: Optional[bool] = pydantic.Field(alias="SDN.Allocate", default=None)
+        sdnaudit: Optional[bool] = pydantic.Field(alias="SDN.Audit", default=None)
+        sdnuse: Optional[bool] = pydantic.Field(alias="SDN.Use", default=None)
+        sys_access_network: Optional[bool] = pydantic.Field(alias="Sys.AccessNetwork", default=None)
+        sys_audit: Optional[bool] = pydantic.Field(alias="Sys.Audit", default=None)
+        sys_console: Optional[bool] = pydantic.Field(alias="Sys.Console", default=None)
+        sys_incoming: Optional[bool] = pydantic.Field(alias="Sys.Incoming", default=None)
+        sys_modify: Optional[bool] = pydantic.Field(alias="Sys.Modify", default=None)
+        sys_power_mgmt: Optional[bool] = pydantic.Field(alias="Sys.PowerMgmt", default=None)
+        sys_syslog: Optional[bool] = pydantic.Field(alias="Sys.Syslog", default=None)
+        user_modify: Optional[bool] = pydantic.Field(alias="User.Modify", default=None)
+        vmallocate: Optional[bool] = pydantic.Field(alias="VM.Allocate", default=None)
+        vmaudit: Optional[bool] = pydantic.Field(alias="VM.Audit", default=None)
+        vmbackup: Optional[bool] = pydantic.Field(alias="VM.Backup", default=None)
+        vmclone: Optional[bool] = pydantic.Field(alias="VM.Clone", default=None)
+        vmconfig_cdrom: Optional[bool] = pydantic.Field(alias="VM.Config.CDROM", default=None)
+        vmconfig_cpu: Optional[bool] = pydantic.Field(alias="VM.Config.CPU", default=None)
+        vmconfig_cloudinit: Optional[bool] = pydantic.Field(alias="VM.Config.Cloudinit", default=None)
+        vmconfig_disk: Optional[bool] = pydantic.Field(alias="VM.Config.Disk", default=None)
+        vmconfig_hwtype: Optional[bool] = pydantic.Field(alias="VM.Config.HWType", default=None)
+        vmconfig_memory: Optional[bool] = pydantic.Field(alias="VM.Config.Memory", default=None)
+        vmconfig_network: Optional[bool] = pydantic.Field(alias="VM.Config.Network", default=None)
+        vmconfig_options: Optional[bool] = pydantic.Field(alias="VM.Config.Options", default=None)
+        vmconsole: Optional[bool] = pydantic.Field(alias="VM.Console", default=None)
+        vmguest_agent_audit: Optional[bool] = pydantic.Field(alias="VM.GuestAgent.Audit", default=None)
+        vmguest_agent_file_read: Optional[bool] = pydantic.Field(alias="VM.GuestAgent.FileRead", default=None)
+        vmguest_agent_file_system_mgmt: Optional[bool] = pydantic.Field(alias="VM.GuestAgent.FileSystemMgmt", default=None)
+        vmguest_agent_file_write: Optional[bool] = pydantic.Field(alias="VM.GuestAgent.FileWrite", default=None)
+        vmguest_agent_unrestricted: Optional[bool] = pydantic.Field(alias="VM.GuestAgent.Unrestricted", default=None)
+        vmmigrate: Optional[bool] = pydantic.Field(alias="VM.Migrate", default=None)
+        vmpower_mgmt: Optional[bool] = pydantic.Field(alias="VM.PowerMgmt", default=None)
+        vmreplicate: Optional[bool] = pydantic.Field(alias="VM.Replicate", default=None)
+        vmsnapshot: Optional[bool] = pydantic.Field(alias="VM.Snapshot", default=None)
+        vmsnapshot_rollback: Optional[bool] = pydantic.Field(alias="VM.Snapshot.Rollback", default=None)
+
+
+class _Shape_634ae54d9185:
+    TypedDict = typing.TypedDict(
+        "TypedDict",
+        {
+            "id": str,
+            "node": str,
+            "storage": NotRequired[str],
+            "type": Literal["qemu", "lxc", "openvz", "storage"],
+            "vmid": NotRequired[int],
+            "name": str,
+        },
+    )
+
+    class Model(BaseModel):
+        id: str
+        node: str
+        storage: Optional[str] = None
+        type: Literal["qemu", "lxc", "openvz", "storage"]
+        vmid: Optional[int] = None
+        name: str
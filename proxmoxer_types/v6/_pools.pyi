@@ -0,0 +1,135 @@
+# This file is autogenerated from apidata/apidata-v6.json
+
+import builtins
+import proxmoxer
+import pydantic
+import typing
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Optional, NotRequired, TYPE_CHECKING, Unpack
+if TYPE_CHECKING:
+    from ..v6 import ProxmoxAPI as ProxmoxerProxmoxAPI
+else:
+    from proxmoxer import ProxmoxAPI as ProxmoxerProxmoxAPI
+from ..shapes import BaseModel, _Shape_de9df6c83931, _Shape_d971ba613d4f
+
+class ProxmoxAPI:
+    @dataclass
+    class Pools:
+        @dataclass
+        class Poolid:
+            @dataclass
+            class _Delete:
+                proxmox_api: ProxmoxerProxmoxAPI
+                poolid: str
+                Params = typing.TypedDict("Params", {})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> None: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> None: ...
+
+            @dataclass
+            class _Get:
+                @dataclass
+                class _Members:
+                    class TypedDict(_Shape_de9df6c83931.TypedDict):
+                        pass
+
+                    class Model(_Shape_de9df6c83931.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Pools.Poolid._Get._Members"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    poolid: str
+                TypedDict = typing.TypedDict("TypedDict", {"comment": NotRequired[str], "members": list["ProxmoxAPI.Pools.Poolid._Get._Members.TypedDict"]})
+
+                class Model(BaseModel):
+                    comment: Optional[str] = None
+                    members: list["ProxmoxAPI.Pools.Poolid._Get._Members.Model"]
+                Model.__name__ = "ProxmoxAPI.Pools.Poolid._Get"
+                proxmox_api: ProxmoxerProxmoxAPI
+                poolid: str
+                Params = typing.TypedDict("Params", {})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> "ProxmoxAPI.Pools.Poolid._Get.TypedDict": ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> "ProxmoxAPI.Pools.Poolid._Get.Model": ...
+
+            @dataclass
+            class _Put:
+                proxmox_api: ProxmoxerProxmoxAPI
+                poolid: str
+                Params = typing.TypedDict("Params", {"comment": NotRequired[str], "delete": NotRequired[bool], "storage": NotRequired[str], "vms": NotRequired[str]})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> None: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> None: ...
+
+            @cached_property
+            def delete(self) -> _Delete: ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+
+            @cached_property
+            def put(self) -> _Put: ...
+
+            @property
+            def set(self) -> _Put: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+            poolid: str
+
+        def __call__(self, poolid: str) -> Poolid: ...
+
+        @dataclass
+        class _Get:
+            class TypedDict(_Shape_d971ba613d4f.TypedDict):
+                pass
+
+            class Model(_Shape_d971ba613d4f.Model):
+                pass
+            Model.__name__ = "ProxmoxAPI.Pools._Get"
+            proxmox_api: ProxmoxerProxmoxAPI
+            Params = typing.TypedDict("Params", {})
+
+            def __call__(
+                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+            ) -> list["ProxmoxAPI.Pools._Get.TypedDict"]: ...
+
+            def model(
+                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+            ) -> list["ProxmoxAPI.Pools._Get.Model"]: ...
+
+        @dataclass
+        class _Post:
+            proxmox_api: ProxmoxerProxmoxAPI
+            Params = typing.TypedDict("Params", {"comment": NotRequired[str], "poolid": str})
+
+            def __call__(
+                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+            ) -> None: ...
+
+            def model(
+                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+            ) -> None: ...
+
+        @cached_property
+        def get(self) -> _Get: ...
+
+        @cached_property
+        def post(self) -> _Post: ...
+
+        @property
+        def create(self) -> _Post: ...
+        proxmox_api: ProxmoxerProxmoxAPI
\ No newline at end of file
@@ -0,0 +1,152 @@
+# This file is autogenerated from apidata/apidata-v6.json
+
+import builtins
+import proxmoxer
+import pydantic
+import typing
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Literal, Optional, NotRequired, TYPE_CHECKING, Unpack
+if TYPE_CHECKING:
+    from ..v6 import ProxmoxAPI as ProxmoxerProxmoxAPI
+else:
+    from proxmoxer import ProxmoxAPI as ProxmoxerProxmoxAPI
+from ..shapes import BaseModel, _Shape_fe9b69a05735, _Shape_9a9d76fce64f
+
+class ProxmoxAPI:
+    @dataclass
+    class Storage:
+        @dataclass
+        class Storage:
+            @dataclass
+            class _Delete:
+                proxmox_api: ProxmoxerProxmoxAPI
+                storage: str
+                Params = typing.TypedDict("Params", {})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> None: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> None: ...
+
+            @dataclass
+            class _Get:
+                proxmox_api: ProxmoxerProxmoxAPI
+                storage: str
+                Params = typing.TypedDict("Params", {})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> dict[str, Any]: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> dict[str, Any]: ...
+
+            @dataclass
+            class _Put:
+                @dataclass
+                class _Config:
+                    class TypedDict(_Shape_fe9b69a05735.TypedDict):
+                        pass
+
+                    class Model(_Shape_fe9b69a05735.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Storage.Storage._Put._Config"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    storage: str
+                TypedDict = typing.TypedDict("TypedDict", {"config": NotRequired["ProxmoxAPI.Storage.Storage._Put._Config.TypedDict"], "storage": str, "type": Literal["cephfs", "cifs", "dir", "drbd", "glusterfs", "iscsi", "iscsidirect", "lvm", "lvmthin", "nfs", "pbs", "rbd", "zfs", "zfspool"]})
+
+                class Model(BaseModel):
+                    config: Optional["ProxmoxAPI.Storage.Storage._Put._Config.Model"] = None
+                    storage: str
+                    type: Literal["cephfs", "cifs", "dir", "drbd", "glusterfs", "iscsi", "iscsidirect", "lvm", "lvmthin", "nfs", "pbs", "rbd", "zfs", "zfspool"]
+                Model.__name__ = "ProxmoxAPI.Storage.Storage._Put"
+                proxmox_api: ProxmoxerProxmoxAPI
+                storage: str
+                Params = typing.TypedDict("Params", {"blocksize": NotRequired[str], "bwlimit": NotRequired[str], "comstar_hg": NotRequired[str], "comstar_tg": NotRequired[str], "content": NotRequired[str], "delete": NotRequired[str], "digest": NotRequired[str], "disable": NotRequired[bool], "domain": NotRequired[str], "encryption-key": NotRequired[str], "fingerprint": NotRequired[str], "format": NotRequired[str], "fuse": NotRequired[bool], "is_mountpoint": NotRequired[str], "krbd": NotRequired[bool], "lio_tpg": NotRequired[str], "master-pubkey": NotRequired[str], "maxfiles": NotRequired[int], "mkdir": NotRequired[bool], "monhost": NotRequired[str], "mountpoint": NotRequired[str], "namespace": NotRequired[str], "nodes": NotRequired[str], "nowritecache": NotRequired[bool], "options": NotRequired[str], "password": NotRequired[str], "pool": NotRequired[str], "port": NotRequired[int], "prune-backups": NotRequired[str], "redundancy": NotRequired[int], "saferemove": NotRequired[bool], "saferemove_throughput": NotRequired[str], "server": NotRequired[str], "server2": NotRequired[str], "shared": NotRequired[bool], "smbversion": NotRequired[Literal["2.0", "2.1", "3.0"]], "sparse": NotRequired[bool], "subdir": NotRequired[str], "tagged_only": NotRequired[bool], "transport": NotRequired[Literal["tcp", "rdma", "unix"]], "username": NotRequired[str]})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> "ProxmoxAPI.Storage.Storage._Put.TypedDict": ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> "ProxmoxAPI.Storage.Storage._Put.Model": ...
+
+            @cached_property
+            def delete(self) -> _Delete: ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+
+            @cached_property
+            def put(self) -> _Put: ...
+
+            @property
+            def set(self) -> _Put: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+            storage: str
+
+        def __call__(self, storage: str) -> Storage: ...
+
+        @dataclass
+        class _Get:
+            class TypedDict(_Shape_9a9d76fce64f.TypedDict):
+                pass
+
+            class Model(_Shape_9a9d76fce64f.Model):
+                pass
+            Model.__name__ = "ProxmoxAPI.Storage._Get"
+            proxmox_api: ProxmoxerProxmoxAPI
+            Params = typing.TypedDict("Params", {"type": NotRequired[Literal["cephfs", "cifs", "dir", "drbd", "glusterfs", "iscsi", "iscsidirect", "lvm", "lvmthin", "nfs", "pbs", "rbd", "zfs", "zfspool"]]})
+
+            def __call__(
+                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+            ) -> list["ProxmoxAPI.Storage._Get.TypedDict"]: ...
+
+            def model(
+                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+            ) -> list["ProxmoxAPI.Storage._Get.Model"]: ...
+
+        @dataclass
+        class _Post:
+            @dataclass
+            class _Config:
+                class TypedDict(_Shape_fe9b69a05735.TypedDict):
+                    pass
+
+                class Model(_Shape_fe9b69a05735.Model):
+                    pass
+                Model.__name__ = "ProxmoxAPI.Storage._Post._Config"
+                proxmox_api: ProxmoxerProxmoxAPI
+            TypedDict = typing.TypedDict("TypedDict", {"config": NotRequired["ProxmoxAPI.Storage._Post._Config.TypedDict"], "storage": str, "type": Literal["cephfs", "cifs", "dir", "drbd", "glusterfs", "iscsi", "iscsidirect", "lvm", "lvmthin", "nfs", "pbs", "rbd", "zfs", "zfspool"]})
+
+            class Model(BaseModel):
+                config: Optional["ProxmoxAPI.Storage._Post._Config.Model"] = None
+                storage: str
+                type: Literal["cephfs", "cifs", "dir", "drbd", "glusterfs", "iscsi", "iscsidirect", "lvm", "lvmthin", "nfs", "pbs", "rbd", "zfs", "zfspool"]
+            Model.__name__ = "ProxmoxAPI.Storage._Post"
+            proxmox_api: ProxmoxerProxmoxAPI
+            Params = typing.TypedDict("Params", {"authsupported": NotRequired[str], "base": NotRequired[str], "blocksize": NotRequired[str], "bwlimit": NotRequired[str], "comstar_hg": NotRequired[str], "comstar_tg": NotRequired[str], "content": NotRequired[str], "datastore": NotRequired[str], "disable": NotRequired[bool], "domain": NotRequired[str], "encryption-key": NotRequired[str], "export": NotRequired[str], "fingerprint": NotRequired[str], "format": NotRequired[str], "fuse": NotRequired[bool], "is_mountpoint": NotRequired[str], "iscsiprovider": NotRequired[str], "krbd": NotRequired[bool], "lio_tpg": NotRequired[str], "master-pubkey": NotRequired[str], "maxfiles": NotRequired[int], "mkdir": NotRequired[bool], "monhost": NotRequired[str], "mountpoint": NotRequired[str], "namespace": NotRequired[str], "nodes": NotRequired[str], "nowritecache": NotRequired[bool], "options": NotRequired[str], "password": NotRequired[str], "path": NotRequired[str], "pool": NotRequired[str], "port": NotRequired[int], "portal": NotRequired[str], "prune-backups": NotRequired[str], "redundancy": NotRequired[int], "saferemove": NotRequired[bool], "saferemove_throughput": NotRequired[str], "server": NotRequired[str], "server2": NotRequired[str], "share": NotRequired[str], "shared": NotRequired[bool], "smbversion": NotRequired[Literal["2.0", "2.1", "3.0"]], "sparse": NotRequired[bool], "storage": str, "subdir": NotRequired[str], "tagged_only": NotRequired[bool], "target": NotRequired[str], "thinpool": NotRequired[str], "transport": NotRequired[Literal["tcp", "rdma", "unix"]], "type": Literal["cephfs", "cifs", "dir", "drbd", "glusterfs", "iscsi", "iscsidirect", "lvm", "lvmthin", "nfs", "pbs", "rbd", "zfs", "zfspool"], "username": NotRequired[str], "vgname": NotRequired[str], "volume": NotRequired[str]})
+
+            def __call__(
+                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+            ) -> "ProxmoxAPI.Storage._Post.TypedDict": ...
+
+            def model(
+                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+            ) -> "ProxmoxAPI.Storage._Post.Model": ...
+
+        @cached_property
+        def get(self) -> _Get: ...
+
+        @cached_property
+        def post(self) -> _Post: ...
+
+        @property
+        def create(self) -> _Post: ...
+        proxmox_api: ProxmoxerProxmoxAPI
\ No newline at end of file
@@ -0,0 +1,40 @@
+# This file is autogenerated from apidata/apidata-v6.json
+
+import builtins
+import proxmoxer
+import pydantic
+import typing
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, TYPE_CHECKING, Unpack
+if TYPE_CHECKING:
+    from ..v6 import ProxmoxAPI as ProxmoxerProxmoxAPI
+else:
+    from proxmoxer import ProxmoxAPI as ProxmoxerProxmoxAPI
+from ..shapes import _Shape_baee350ed80d
+
+class ProxmoxAPI:
+    @dataclass
+    class Version:
+        @dataclass
+        class _Get:
+            class TypedDict(_Shape_baee350ed80d.TypedDict):
+                pass
+
+            class Model(_Shape_baee350ed80d.Model):
+                pass
+            Model.__name__ = "ProxmoxAPI.Version._Get"
+            proxmox_api: ProxmoxerProxmoxAPI
+            Params = typing.TypedDict("Params", {})
+
+            def __call__(
+                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+            ) -> "ProxmoxAPI.Version._Get.TypedDict": ...
+
+            def model(
+                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+            ) -> "ProxmoxAPI.Version._Get.Model": ...
+
+        @cached_property
+        def get(self) -> _Get: ...
+        proxmox_api: ProxmoxerProxmoxAPI
\ No newline at end of file
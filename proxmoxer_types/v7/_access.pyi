@@ -0,0 +1,1118 @@
+# This file is autogenerated from apidata/apidata-v7.json
+
+import builtins
+import proxmoxer
+import pydantic
+import typing
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Literal, Optional, NotRequired, TYPE_CHECKING, Unpack
+if TYPE_CHECKING:
+    from ..v7 import ProxmoxAPI as ProxmoxerProxmoxAPI
+else:
+    from proxmoxer import ProxmoxAPI as ProxmoxerProxmoxAPI
+from ..shapes import BaseModel, _Shape_21168c7817dc, _Shape_35673131a7bf, _Shape_93f23838fd43, _Shape_af70406a9c0c, _Shape_b028974f88f3, _Shape_76b1caeaf614, _Shape_070300131d0a, _Shape_41e71c1b3513, _Shape_2497f36a10fe, _Shape_5dbfbf17504e, _Shape_e5c39a307fd9, _Shape_d13dd09b3bf1, _Shape_809c16077bea, _Shape_99c983b71887, _Shape_389a53d40a35, _Shape_6c06835384ca
+
+class ProxmoxAPI:
+    @dataclass
+    class Access:
+        @dataclass
+        class Users:
+            @dataclass
+            class Userid:
+                @dataclass
+                class Tfa:
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_35673131a7bf.TypedDict):
+                            pass
+
+                        class Model(_Shape_35673131a7bf.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Access.Users.Userid.Tfa._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        userid: str
+                        Params = typing.TypedDict("Params", {"multiple": NotRequired[bool]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> "ProxmoxAPI.Access.Users.Userid.Tfa._Get.TypedDict": ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> "ProxmoxAPI.Access.Users.Userid.Tfa._Get.Model": ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    userid: str
+
+                @cached_property
+                def tfa(self) -> Tfa: ...
+
+                @dataclass
+                class Token:
+                    @dataclass
+                    class Tokenid:
+                        @dataclass
+                        class _Delete:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            userid: str
+                            tokenid: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_93f23838fd43.TypedDict):
+                                pass
+
+                            class Model(_Shape_93f23838fd43.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Access.Users.Userid.Token.Tokenid._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            userid: str
+                            tokenid: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Access.Users.Userid.Token.Tokenid._Get.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Access.Users.Userid.Token.Tokenid._Get.Model": ...
+
+                        @dataclass
+                        class _Post:
+                            @dataclass
+                            class _Info:
+                                class TypedDict(_Shape_93f23838fd43.TypedDict):
+                                    pass
+
+                                class Model(_Shape_93f23838fd43.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Access.Users.Userid.Token.Tokenid._Post._Info"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                userid: str
+                                tokenid: str
+                            TypedDict = typing.TypedDict("TypedDict", {"full-tokenid": str, "info": "ProxmoxAPI.Access.Users.Userid.Token.Tokenid._Post._Info.TypedDict", "value": str})
+
+                            class Model(BaseModel):
+                                full_tokenid: str = pydantic.Field(alias="full-tokenid")
+                                info: "ProxmoxAPI.Access.Users.Userid.Token.Tokenid._Post._Info.Model"
+                                value: str
+                            Model.__name__ = "ProxmoxAPI.Access.Users.Userid.Token.Tokenid._Post"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            userid: str
+                            tokenid: str
+                            Params = typing.TypedDict("Params", {"comment": NotRequired[str], "expire": NotRequired[int], "privsep": NotRequired[bool]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Access.Users.Userid.Token.Tokenid._Post.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Access.Users.Userid.Token.Tokenid._Post.Model": ...
+
+                        @dataclass
+                        class _Put:
+                            class TypedDict(_Shape_93f23838fd43.TypedDict):
+                                pass
+
+                            class Model(_Shape_93f23838fd43.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Access.Users.Userid.Token.Tokenid._Put"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            userid: str
+                            tokenid: str
+                            Params = typing.TypedDict("Params", {"comment": NotRequired[str], "expire": NotRequired[int], "privsep": NotRequired[bool]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Access.Users.Userid.Token.Tokenid._Put.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Access.Users.Userid.Token.Tokenid._Put.Model": ...
+
+                        @cached_property
+                        def delete(self) -> _Delete: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+
+                        @cached_property
+                        def put(self) -> _Put: ...
+
+                        @property
+                        def set(self) -> _Put: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        userid: str
+                        tokenid: str
+
+                    def __call__(self, tokenid: str) -> Tokenid: ...
+
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_af70406a9c0c.TypedDict):
+                            pass
+
+                        class Model(_Shape_af70406a9c0c.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Access.Users.Userid.Token._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        userid: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Access.Users.Userid.Token._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Access.Users.Userid.Token._Get.Model"]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    userid: str
+
+                @cached_property
+                def token(self) -> Token: ...
+
+                @dataclass
+                class _Delete:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    userid: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_b028974f88f3.TypedDict):
+                        pass
+
+                    class Model(_Shape_b028974f88f3.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Access.Users.Userid._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    userid: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Access.Users.Userid._Get.TypedDict": ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Access.Users.Userid._Get.Model": ...
+
+                @dataclass
+                class _Put:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    userid: str
+                    Params = typing.TypedDict("Params", {"append": NotRequired[bool], "comment": NotRequired[str], "email": NotRequired[str], "enable": NotRequired[bool], "expire": NotRequired[int], "firstname": NotRequired[str], "groups": NotRequired[str], "keys": NotRequired[str], "lastname": NotRequired[str]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @cached_property
+                def delete(self) -> _Delete: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def put(self) -> _Put: ...
+
+                @property
+                def set(self) -> _Put: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                userid: str
+
+            def __call__(self, userid: str) -> Userid: ...
+
+            @dataclass
+            class _Get:
+                @dataclass
+                class _Tokens:
+                    class TypedDict(_Shape_af70406a9c0c.TypedDict):
+                        pass
+
+                    class Model(_Shape_af70406a9c0c.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Access.Users._Get._Tokens"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                TypedDict = typing.TypedDict("TypedDict", {"comment": NotRequired[str], "email": NotRequired[str], "enable": NotRequired[bool], "expire": NotRequired[int], "firstname": NotRequired[str], "groups": NotRequired[str], "keys": NotRequired[str], "lastname": NotRequired[str], "realm-type": NotRequired[str], "tokens": NotRequired[list["ProxmoxAPI.Access.Users._Get._Tokens.TypedDict"]], "userid": str})
+
+                class Model(BaseModel):
+                    comment: Optional[str] = None
+                    email: Optional[str] = None
+                    enable: Optional[bool] = None
+                    expire: Optional[int] = None
+                    firstname: Optional[str] = None
+                    groups: Optional[str] = None
+                    keys: Optional[str] = None
+                    lastname: Optional[str] = None
+                    realm_type: Optional[str] = pydantic.Field(alias="realm-type", default=None)
+                    tokens: Optional[list["ProxmoxAPI.Access.Users._Get._Tokens.Model"]] = None
+                    userid: str
+                Model.__name__ = "ProxmoxAPI.Access.Users._Get"
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {"enabled": NotRequired[bool], "full": NotRequired[bool]})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list["ProxmoxAPI.Access.Users._Get.TypedDict"]: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list["ProxmoxAPI.Access.Users._Get.Model"]: ...
+
+            @dataclass
+            class _Post:
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {"comment": NotRequired[str], "email": NotRequired[str], "enable": NotRequired[bool], "expire": NotRequired[int], "firstname": NotRequired[str], "groups": NotRequired[str], "keys": NotRequired[str], "lastname": NotRequired[str], "password": NotRequired[str], "userid": str})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> None: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> None: ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+
+            @cached_property
+            def post(self) -> _Post: ...
+
+            @property
+            def create(self) -> _Post: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+
+        @cached_property
+        def users(self) -> Users: ...
+
+        @dataclass
+        class Groups:
+            @dataclass
+            class Groupid:
+                @dataclass
+                class _Delete:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    groupid: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_76b1caeaf614.TypedDict):
+                        pass
+
+                    class Model(_Shape_76b1caeaf614.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Access.Groups.Groupid._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    groupid: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Access.Groups.Groupid._Get.TypedDict": ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Access.Groups.Groupid._Get.Model": ...
+
+                @dataclass
+                class _Put:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    groupid: str
+                    Params = typing.TypedDict("Params", {"comment": NotRequired[str]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @cached_property
+                def delete(self) -> _Delete: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def put(self) -> _Put: ...
+
+                @property
+                def set(self) -> _Put: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                groupid: str
+
+            def __call__(self, groupid: str) -> Groupid: ...
+
+            @dataclass
+            class _Get:
+                class TypedDict(_Shape_070300131d0a.TypedDict):
+                    pass
+
+                class Model(_Shape_070300131d0a.Model):
+                    pass
+                Model.__name__ = "ProxmoxAPI.Access.Groups._Get"
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list["ProxmoxAPI.Access.Groups._Get.TypedDict"]: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list["ProxmoxAPI.Access.Groups._Get.Model"]: ...
+
+            @dataclass
+            class _Post:
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {"comment": NotRequired[str], "groupid": str})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> None: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> None: ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+
+            @cached_property
+            def post(self) -> _Post: ...
+
+            @property
+            def create(self) -> _Post: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+
+        @cached_property
+        def groups(self) -> Groups: ...
+
+        @dataclass
+        class Roles:
+            @dataclass
+            class Roleid:
+                @dataclass
+                class _Delete:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    roleid: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_41e71c1b3513.TypedDict):
+                        pass
+
+                    class Model(_Shape_41e71c1b3513.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Access.Roles.Roleid._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    roleid: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Access.Roles.Roleid._Get.TypedDict": ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Access.Roles.Roleid._Get.Model": ...
+
+                @dataclass
+                class _Put:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    roleid: str
+                    Params = typing.TypedDict("Params", {"append": NotRequired[bool], "privs": NotRequired[str]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @cached_property
+                def delete(self) -> _Delete: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def put(self) -> _Put: ...
+
+                @property
+                def set(self) -> _Put: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                roleid: str
+
+            def __call__(self, roleid: str) -> Roleid: ...
+
+            @dataclass
+            class _Get:
+                class TypedDict(_Shape_2497f36a10fe.TypedDict):
+                    pass
+
+                class Model(_Shape_2497f36a10fe.Model):
+                    pass
+                Model.__name__ = "ProxmoxAPI.Access.Roles._Get"
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list["ProxmoxAPI.Access.Roles._Get.TypedDict"]: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list["ProxmoxAPI.Access.Roles._Get.Model"]: ...
+
+            @dataclass
+            class _Post:
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {"privs": NotRequired[str], "roleid": str})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> None: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> None: ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+
+            @cached_property
+            def post(self) -> _Post: ...
+
+            @property
+            def create(self) -> _Post: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+
+        @cached_property
+        def roles(self) -> Roles: ...
+
+        @dataclass
+        class Acl:
+            @dataclass
+            class _Get:
+                class TypedDict(_Shape_5dbfbf17504e.TypedDict):
+                    pass
+
+                class Model(_Shape_5dbfbf17504e.Model):
+                    pass
+                Model.__name__ = "ProxmoxAPI.Access.Acl._Get"
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list["ProxmoxAPI.Access.Acl._Get.TypedDict"]: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list["ProxmoxAPI.Access.Acl._Get.Model"]: ...
+
+            @dataclass
+            class _Put:
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {"delete": NotRequired[bool], "groups": NotRequired[str], "path": str, "propagate": NotRequired[bool], "roles": str, "tokens": NotRequired[str], "users": NotRequired[str]})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> None: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> None: ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+
+            @cached_property
+            def put(self) -> _Put: ...
+
+            @property
+            def set(self) -> _Put: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+
+        @cached_property
+        def acl(self) -> Acl: ...
+
+        @dataclass
+        class Domains:
+            @dataclass
+            class Realm:
+                @dataclass
+                class Sync:
+                    @dataclass
+                    class _Post:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        realm: str
+                        Params = typing.TypedDict("Params", {"dry-run": NotRequired[bool], "enable-new": NotRequired[bool], "full": NotRequired[bool], "purge": NotRequired[bool], "remove-vanished": NotRequired[str], "scope": NotRequired[Literal["users", "groups", "both"]]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                    @cached_property
+                    def post(self) -> _Post: ...
+
+                    @property
+                    def create(self) -> _Post: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    realm: str
+
+                @cached_property
+                def sync(self) -> Sync: ...
+
+                @dataclass
+                class _Delete:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    realm: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @dataclass
+                class _Get:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    realm: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> dict[str, Any]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> dict[str, Any]: ...
+
+                @dataclass
+                class _Put:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    realm: str
+                    Params = typing.TypedDict("Params", {"acr-values": NotRequired[str], "autocreate": NotRequired[bool], "base_dn": NotRequired[str], "bind_dn": NotRequired[str], "capath": NotRequired[str], "case-sensitive": NotRequired[bool], "cert": NotRequired[str], "certkey": NotRequired[str], "client-id": NotRequired[str], "client-key": NotRequired[str], "comment": NotRequired[str], "default": NotRequired[bool], "delete": NotRequired[str], "digest": NotRequired[str], "domain": NotRequired[str], "filter": NotRequired[str], "group_classes": NotRequired[str], "group_dn": NotRequired[str], "group_filter": NotRequired[str], "group_name_attr": NotRequired[str], "issuer-url": NotRequired[str], "mode": NotRequired[Literal["ldap", "ldaps", "ldap+starttls"]], "password": NotRequired[str], "port": NotRequired[int], "prompt": NotRequired[str], "scopes": NotRequired[str], "secure": NotRequired[bool], "server1": NotRequired[str], "server2": NotRequired[str], "sslversion": NotRequired[Literal["tlsv1", "tlsv1_1", "tlsv1_2", "tlsv1_3"]], "sync-defaults-options": NotRequired[str], "sync_attributes": NotRequired[str], "tfa": NotRequired[str], "user_attr": NotRequired[str], "user_classes": NotRequired[str], "verify": NotRequired[bool]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @cached_property
+                def delete(self) -> _Delete: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def put(self) -> _Put: ...
+
+                @property
+                def set(self) -> _Put: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                realm: str
+
+            def __call__(self, realm: str) -> Realm: ...
+
+            @dataclass
+            class _Get:
+                class TypedDict(_Shape_e5c39a307fd9.TypedDict):
+                    pass
+
+                class Model(_Shape_e5c39a307fd9.Model):
+                    pass
+                Model.__name__ = "ProxmoxAPI.Access.Domains._Get"
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list["ProxmoxAPI.Access.Domains._Get.TypedDict"]: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list["ProxmoxAPI.Access.Domains._Get.Model"]: ...
+
+            @dataclass
+            class _Post:
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {"acr-values": NotRequired[str], "autocreate": NotRequired[bool], "base_dn": NotRequired[str], "bind_dn": NotRequired[str], "capath": NotRequired[str], "case-sensitive": NotRequired[bool], "cert": NotRequired[str], "certkey": NotRequired[str], "client-id": NotRequired[str], "client-key": NotRequired[str], "comment": NotRequired[str], "default": NotRequired[bool], "domain": NotRequired[str], "filter": NotRequired[str], "group_classes": NotRequired[str], "group_dn": NotRequired[str], "group_filter": NotRequired[str], "group_name_attr": NotRequired[str], "issuer-url": NotRequired[str], "mode": NotRequired[Literal["ldap", "ldaps", "ldap+starttls"]], "password": NotRequired[str], "port": NotRequired[int], "prompt": NotRequired[str], "realm": str, "scopes": NotRequired[str], "secure": NotRequired[bool], "server1": NotRequired[str], "server2": NotRequired[str], "sslversion": NotRequired[Literal["tlsv1", "tlsv1_1", "tlsv1_2", "tlsv1_3"]], "sync-defaults-options": NotRequired[str], "sync_attributes": NotRequired[str], "tfa": NotRequired[str], "type": Literal["ad", "ldap", "openid", "pam", "pve"], "user_attr": NotRequired[str], "user_classes": NotRequired[str], "username-claim": NotRequired[str], "verify": NotRequired[bool]})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> None: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> None: ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+
+            @cached_property
+            def post(self) -> _Post: ...
+
+            @property
+            def create(self) -> _Post: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+
+        @cached_property
+        def domains(self) -> Domains: ...
+
+        @dataclass
+        class Openid:
+            @dataclass
+            class AuthUrl:
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"realm": str, "redirect-url": str})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> str: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> str: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def auth_url(self) -> AuthUrl: ...
+
+            @dataclass
+            class Login:
+                @dataclass
+                class _Post:
+                    class TypedDict(_Shape_d13dd09b3bf1.TypedDict):
+                        pass
+
+                    class Model(_Shape_d13dd09b3bf1.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Access.Openid.Login._Post"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"code": str, "redirect-url": str, "state": str})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Access.Openid.Login._Post.TypedDict": ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Access.Openid.Login._Post.Model": ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def login(self) -> Login: ...
+
+            @dataclass
+            class _Get:
+                class TypedDict(_Shape_21168c7817dc.TypedDict):
+                    pass
+
+                class Model(_Shape_21168c7817dc.Model):
+                    pass
+                Model.__name__ = "ProxmoxAPI.Access.Openid._Get"
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list["ProxmoxAPI.Access.Openid._Get.TypedDict"]: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list["ProxmoxAPI.Access.Openid._Get.Model"]: ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+
+        @cached_property
+        def openid(self) -> Openid: ...
+
+        @dataclass
+        class Tfa:
+            @dataclass
+            class Userid:
+                @dataclass
+                class Id:
+                    @dataclass
+                    class _Delete:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        userid: str
+                        id: str
+                        Params = typing.TypedDict("Params", {"password": NotRequired[str]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_809c16077bea.TypedDict):
+                            pass
+
+                        class Model(_Shape_809c16077bea.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Access.Tfa.Userid.Id._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        userid: str
+                        id: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> "ProxmoxAPI.Access.Tfa.Userid.Id._Get.TypedDict": ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> "ProxmoxAPI.Access.Tfa.Userid.Id._Get.Model": ...
+
+                    @dataclass
+                    class _Put:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        userid: str
+                        id: str
+                        Params = typing.TypedDict("Params", {"description": NotRequired[str], "enable": NotRequired[bool], "password": NotRequired[str]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @cached_property
+                    def delete(self) -> _Delete: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def put(self) -> _Put: ...
+
+                    @property
+                    def set(self) -> _Put: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    userid: str
+                    id: str
+
+                def __call__(self, id: str) -> Id: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_809c16077bea.TypedDict):
+                        pass
+
+                    class Model(_Shape_809c16077bea.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Access.Tfa.Userid._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    userid: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Access.Tfa.Userid._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Access.Tfa.Userid._Get.Model"]: ...
+
+                @dataclass
+                class _Post:
+                    class TypedDict(_Shape_99c983b71887.TypedDict):
+                        pass
+
+                    class Model(_Shape_99c983b71887.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Access.Tfa.Userid._Post"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    userid: str
+                    Params = typing.TypedDict("Params", {"challenge": NotRequired[str], "description": NotRequired[str], "password": NotRequired[str], "totp": NotRequired[str], "type": Literal["totp", "u2f", "webauthn", "recovery", "yubico"], "value": NotRequired[str]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Access.Tfa.Userid._Post.TypedDict": ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Access.Tfa.Userid._Post.Model": ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                userid: str
+
+            def __call__(self, userid: str) -> Userid: ...
+
+            @dataclass
+            class _Get:
+                @dataclass
+                class _Entries:
+                    class TypedDict(_Shape_809c16077bea.TypedDict):
+                        pass
+
+                    class Model(_Shape_809c16077bea.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Access.Tfa._Get._Entries"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                TypedDict = typing.TypedDict("TypedDict", {"entries": list["ProxmoxAPI.Access.Tfa._Get._Entries.TypedDict"], "userid": str})
+
+                class Model(BaseModel):
+                    entries: list["ProxmoxAPI.Access.Tfa._Get._Entries.Model"]
+                    userid: str
+                Model.__name__ = "ProxmoxAPI.Access.Tfa._Get"
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list["ProxmoxAPI.Access.Tfa._Get.TypedDict"]: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list["ProxmoxAPI.Access.Tfa._Get.Model"]: ...
+
+            @dataclass
+            class _Post:
+                class TypedDict(_Shape_389a53d40a35.TypedDict):
+                    pass
+
+                class Model(_Shape_389a53d40a35.Model):
+                    pass
+                Model.__name__ = "ProxmoxAPI.Access.Tfa._Post"
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {"response": str})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> "ProxmoxAPI.Access.Tfa._Post.TypedDict": ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> "ProxmoxAPI.Access.Tfa._Post.Model": ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+
+            @cached_property
+            def post(self) -> _Post: ...
+
+            @property
+            def create(self) -> _Post: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+
+        @cached_property
+        def tfa(self) -> Tfa: ...
+
+        @dataclass
+        class Ticket:
+            @dataclass
+            class _Get:
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> None: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> None: ...
+
+            @dataclass
+            class _Post:
+                class TypedDict(_Shape_6c06835384ca.TypedDict):
+                    pass
+
+                class Model(_Shape_6c06835384ca.Model):
+                    pass
+                Model.__name__ = "ProxmoxAPI.Access.Ticket._Post"
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {"new-format": NotRequired[bool], "otp": NotRequired[str], "password": str, "path": NotRequired[str], "privs": NotRequired[str], "realm": NotRequired[str], "tfa-challenge": NotRequired[str], "username": str})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> "ProxmoxAPI.Access.Ticket._Post.TypedDict": ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> "ProxmoxAPI.Access.Ticket._Post.Model": ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+
+            @cached_property
+            def post(self) -> _Post: ...
+
+            @property
+            def create(self) -> _Post: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+
+        @cached_property
+        def ticket(self) -> Ticket: ...
+
+        @dataclass
+        class Password:
+            @dataclass
+            class _Put:
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {"password": str, "userid": str})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> None: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> None: ...
+
+            @cached_property
+            def put(self) -> _Put: ...
+
+            @property
+            def set(self) -> _Put: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+
+        @cached_property
+        def password(self) -> Password: ...
+
+        @dataclass
+        class Permissions:
+            @dataclass
+            class _Get:
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {"path": NotRequired[str], "userid": NotRequired[str]})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> dict[str, Any]: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> dict[str, Any]: ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+
+        @cached_property
+        def permissions(self) -> Permissions: ...
+
+        @dataclass
+        class _Get:
+            class TypedDict(_Shape_21168c7817dc.TypedDict):
+                pass
+
+            class Model(_Shape_21168c7817dc.Model):
+                pass
+            Model.__name__ = "ProxmoxAPI.Access._Get"
+            proxmox_api: ProxmoxerProxmoxAPI
+            Params = typing.TypedDict("Params", {})
+
+            def __call__(
+                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+            ) -> list["ProxmoxAPI.Access._Get.TypedDict"]: ...
+
+            def model(
+                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+            ) -> list["ProxmoxAPI.Access._Get.Model"]: ...
+
+        @cached_property
+        def get(self) -> _Get: ...
+        proxmox_api: ProxmoxerProxmoxAPI
\ No newline at end of file
@@ -0,0 +1,371 @@
+# This file is autogenerated from apidata/apidata-v7.json
+
+# Path, attribute of its last segment or "" for a parameter and the returned
+# type of each method, read by proxmoxer_types.runtime
+ENDPOINTS = (
+    ("/cluster", "cluster", (("get", ("array", ("object",))),)),
+    ("/cluster/replication", "replication", (("get", ("array", ("object",))), ("post", ("null",)))),
+    ("/cluster/replication/{id}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/cluster/metrics", "metrics", (("get", ("array", ("object",))),)),
+    ("/cluster/metrics/server", "server", (("get", ("array", ("object", (("disable", False, ("boolean",)), ("id", False, ("string",)), ("port", False, ("integer",)), ("server", False, ("string",)), ("type", False, ("string",)))))),)),
+    ("/cluster/metrics/server/{id}", "", (("delete", ("null",)), ("get", ("object",)), ("post", ("null",)), ("put", ("null",)))),
+    ("/cluster/config", "config", (("get", ("array", ("object",))), ("post", ("string",)))),
+    ("/cluster/config/apiversion", "apiversion", (("get", ("integer",)),)),
+    ("/cluster/config/nodes", "nodes", (("get", ("array", ("object", (("node", False, ("string",)),)))),)),
+    ("/cluster/config/nodes/{node}", "", (("delete", ("null",)), ("post", ("object", (("corosync_authkey", False, ("string",)), ("corosync_conf", False, ("string",)), ("warnings", False, ("array", ("string",)))))))),
+    ("/cluster/config/join", "join", (("get", ("object", (("config_digest", False, ("string",)), ("nodelist", False, ("array", ("object", (("name", False, ("string",)), ("nodeid", True, ("integer",)), ("pve_addr", False, ("string",)), ("pve_fp", False, ("string",)), ("quorum_votes", False, ("integer",)), ("ring0_addr", True, ("string",)))))), ("preferred_node", False, ("string",)), ("totem", False, ("object",))))), ("post", ("string",)))),
+    ("/cluster/config/totem", "totem", (("get", ("object",)),)),
+    ("/cluster/config/qdevice", "qdevice", (("get", ("object",)),)),
+    ("/cluster/firewall", "firewall", (("get", ("array", ("object",))),)),
+    ("/cluster/firewall/groups", "groups", (("get", ("array", ("object", (("comment", True, ("string",)), ("digest", False, ("string",)), ("group", False, ("string",)))))), ("post", ("null",)))),
+    ("/cluster/firewall/groups/{group}", "", (("delete", ("null",)), ("get", ("array", ("object", (("pos", False, ("integer",)),)))), ("post", ("null",)))),
+    ("/cluster/firewall/groups/{group}/{pos}", "", (("delete", ("null",)), ("get", ("object", (("action", False, ("string",)), ("comment", True, ("string",)), ("dest", True, ("string",)), ("dport", True, ("string",)), ("enable", True, ("integer",)), ("icmp-type", True, ("string",), "icmp_type"), ("iface", True, ("string",)), ("ipversion", True, ("integer",)), ("log", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("macro", True, ("string",)), ("pos", False, ("integer",)), ("proto", True, ("string",)), ("source", True, ("string",)), ("sport", True, ("string",)), ("type", False, ("string",))))), ("put", ("null",)))),
+    ("/cluster/firewall/rules", "rules", (("get", ("array", ("object", (("pos", False, ("integer",)),)))), ("post", ("null",)))),
+    ("/cluster/firewall/rules/{pos}", "", (("delete", ("null",)), ("get", ("object", (("action", False, ("string",)), ("comment", True, ("string",)), ("dest", True, ("string",)), ("dport", True, ("string",)), ("enable", True, ("integer",)), ("icmp-type", True, ("string",), "icmp_type"), ("iface", True, ("string",)), ("ipversion", True, ("integer",)), ("log", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("macro", True, ("string",)), ("pos", False, ("integer",)), ("proto", True, ("string",)), ("source", True, ("string",)), ("sport", True, ("string",)), ("type", False, ("string",))))), ("put", ("null",)))),
+    ("/cluster/firewall/ipset", "ipset", (("get", ("array", ("object", (("comment", True, ("string",)), ("digest", False, ("string",)), ("name", False, ("string",)))))), ("post", ("null",)))),
+    ("/cluster/firewall/ipset/{name}", "", (("delete", ("null",)), ("get", ("array", ("object", (("cidr", False, ("string",)), ("comment", True, ("string",)), ("digest", False, ("string",)), ("nomatch", True, ("boolean",)))))), ("post", ("null",)))),
+    ("/cluster/firewall/ipset/{name}/{cidr}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/cluster/firewall/aliases", "aliases", (("get", ("array", ("object", (("cidr", False, ("string",)), ("comment", True, ("string",)), ("digest", False, ("string",)), ("name", False, ("string",)))))), ("post", ("null",)))),
+    ("/cluster/firewall/aliases/{name}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/cluster/firewall/options", "options", (("get", ("object", (("ebtables", True, ("boolean",)), ("enable", True, ("integer",)), ("log_ratelimit", True, ("string",)), ("policy_in", True, ("string", ("ACCEPT", "REJECT", "DROP"))), ("policy_out", True, ("string", ("ACCEPT", "REJECT", "DROP")))))), ("put", ("null",)))),
+    ("/cluster/firewall/macros", "macros", (("get", ("array", ("object", (("descr", False, ("string",)), ("macro", False, ("string",)))))),)),
+    ("/cluster/firewall/refs", "refs", (("get", ("array", ("object", (("comment", True, ("string",)), ("name", False, ("string",)), ("ref", False, ("string",)), ("type", False, ("string", ("alias", "ipset"))))))),)),
+    ("/cluster/backup", "backup", (("get", ("array", ("object", (("id", False, ("string",)),)))), ("post", ("null",)))),
+    ("/cluster/backup/{id}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/cluster/backup/{id}/included_volumes", "included_volumes", (("get", ("object", (("children", False, ("array", ("object", (("children", True, ("array", ("object", (("id", False, ("string",)), ("included", False, ("boolean",)), ("name", False, ("string",)), ("reason", False, ("string",)))))), ("id", False, ("integer",)), ("name", True, ("string",)), ("type", False, ("string", ("qemu", "lxc", "unknown"))))))),))),)),
+    ("/cluster/backup-info", "backup_info", (("get", ("array", ("object", (("subdir", False, ("string",)),)))),)),
+    ("/cluster/backup-info/not-backed-up", "not_backed_up", (("get", ("array", ("object", (("name", True, ("string",)), ("type", False, ("string", ("qemu", "lxc"))), ("vmid", False, ("integer",)))))),)),
+    ("/cluster/ha", "ha", (("get", ("array", ("object", (("id", False, ("string",)),)))),)),
+    ("/cluster/ha/resources", "resources", (("get", ("array", ("object", (("sid", False, ("string",)),)))), ("post", ("null",)))),
+    ("/cluster/ha/resources/{sid}", "", (("delete", ("null",)), ("get", ("object", (("comment", True, ("string",)), ("digest", False, ("string",)), ("group", True, ("string",)), ("max_relocate", True, ("integer",)), ("max_restart", True, ("integer",)), ("sid", False, ("string",)), ("state", True, ("string", ("started", "stopped", "enabled", "disabled", "ignored"))), ("type", False, ("string",))))), ("put", ("null",)))),
+    ("/cluster/ha/resources/{sid}/migrate", "migrate", (("post", ("null",)),)),
+    ("/cluster/ha/resources/{sid}/relocate", "relocate", (("post", ("null",)),)),
+    ("/cluster/ha/groups", "groups", (("get", ("array", ("object", (("group", False, ("string",)),)))), ("post", ("null",)))),
+    ("/cluster/ha/groups/{group}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/cluster/ha/status", "status", (("get", ("array", ("object",))),)),
+    ("/cluster/ha/status/current", "current", (("get", ("array",)),)),
+    ("/cluster/ha/status/manager_status", "manager_status", (("get", ("object",)),)),
+    ("/cluster/acme", "acme", (("get", ("array", ("object",))),)),
+    ("/cluster/acme/plugins", "plugins", (("get", ("array", ("object", (("plugin", False, ("string",)),)))), ("post", ("null",)))),
+    ("/cluster/acme/plugins/{id}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/cluster/acme/account", "account", (("get", ("array", ("object",))), ("post", ("string",)))),
+    ("/cluster/acme/account/{name}", "", (("delete", ("string",)), ("get", ("object", (("account", True, ("object",)), ("directory", True, ("string",)), ("location", True, ("string",)), ("tos", True, ("string",))))), ("put", ("string",)))),
+    ("/cluster/acme/tos", "tos", (("get", ("string",)),)),
+    ("/cluster/acme/directories", "directories", (("get", ("array", ("object", (("name", False, ("string",)), ("url", False, ("string",)))))),)),
+    ("/cluster/acme/challenge-schema", "challenge_schema", (("get", ("array", ("object", (("id", False, ("string",)), ("name", False, ("string",)), ("schema", False, ("object",), "schema_"), ("type", False, ("string",)))))),)),
+    ("/cluster/ceph", "ceph", (("get", ("array", ("object",))),)),
+    ("/cluster/ceph/metadata", "metadata", (("get", ("object", (("mds", False, ("object", (("{id}", False, ("object", (("addr", False, ("string",)), ("ceph_release", False, ("string",)), ("ceph_version", False, ("string",)), ("ceph_version_short", False, ("string",)), ("hostname", False, ("string",)), ("mem_swap_kb", False, ("integer",)), ("mem_total_kb", False, ("integer",)), ("name", False, ("string",)))), "id"),))), ("mgr", False, ("object", (("{id}", False, ("object", (("addr", False, ("string",)), ("ceph_release", False, ("string",)), ("ceph_version", False, ("string",)), ("ceph_version_short", False, ("string",)), ("hostname", False, ("string",)), ("mem_swap_kb", False, ("integer",)), ("mem_total_kb", False, ("integer",)), ("name", False, ("string",)))), "id"),))), ("mon", False, ("object", (("{id}", False, ("object", (("addrs", False, ("string",)), ("ceph_release", False, ("string",)), ("ceph_version", False, ("string",)), ("ceph_version_short", False, ("string",)), ("hostname", False, ("string",)), ("mem_swap_kb", False, ("integer",)), ("mem_total_kb", False, ("integer",)), ("name", False, ("string",)))), "id"),))), ("node", False, ("object", (("{node}", False, ("object", (("buildcommit", False, ("string",)), ("version", False, ("object", (("parts", False, ("array",)), ("str", False, ("string",))))))), "node"),))), ("osd", False, ("array",))))),)),
+    ("/cluster/ceph/status", "status", (("get", ("object",)),)),
+    ("/cluster/ceph/flags", "flags", (("get", ("array", ("object", (("description", False, ("string",)), ("name", False, ("string", ("nobackfill", "nodeep-scrub", "nodown", "noin", "noout", "norebalance", "norecover", "noscrub", "notieragent", "noup", "pause"))), ("value", False, ("boolean",)))))), ("put", ("string",)))),
+    ("/cluster/ceph/flags/{flag}", "", (("get", ("boolean",)), ("put", ("null",)))),
+    ("/cluster/jobs", "jobs", (("get", ("array", ("object", (("subdir", False, ("string",)),)))),)),
+    ("/cluster/jobs/schedule-analyze", "schedule_analyze", (("get", ("array", ("object", (("timestamp", False, ("integer",)), ("utc", False, ("string",)))))),)),
+    ("/cluster/sdn", "sdn", (("get", ("array", ("object", (("id", False, ("string",)),)))), ("put", ("string",)))),
+    ("/cluster/sdn/vnets", "vnets", (("get", ("array", ("object",))), ("post", ("null",)))),
+    ("/cluster/sdn/vnets/{vnet}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/cluster/sdn/vnets/{vnet}/subnets", "subnets", (("get", ("array", ("object",))), ("post", ("null",)))),
+    ("/cluster/sdn/vnets/{vnet}/subnets/{subnet}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/cluster/sdn/zones", "zones", (("get", ("array", ("object", (("dns", True, ("string",)), ("dnszone", True, ("string",)), ("ipam", True, ("string",)), ("mtu", True, ("integer",)), ("nodes", True, ("string",)), ("pending", True, ("object",)), ("reversedns", True, ("string",)), ("state", True, ("string",)), ("type", False, ("string",)), ("zone", False, ("string",)))))), ("post", ("null",)))),
+    ("/cluster/sdn/zones/{zone}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/cluster/sdn/controllers", "controllers", (("get", ("array", ("object", (("controller", False, ("string",)), ("pending", True, ("object",)), ("state", True, ("string",)), ("type", False, ("string",)))))), ("post", ("null",)))),
+    ("/cluster/sdn/controllers/{controller}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/cluster/sdn/ipams", "ipams", (("get", ("array", ("object", (("ipam", False, ("string",)), ("type", False, ("string",)))))), ("post", ("null",)))),
+    ("/cluster/sdn/ipams/{ipam}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/cluster/sdn/dns", "dns", (("get", ("array", ("object", (("dns", False, ("string",)), ("type", False, ("string",)))))), ("post", ("null",)))),
+    ("/cluster/sdn/dns/{dns}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/cluster/log", "log", (("get", ("array", ("object",))),)),
+    ("/cluster/resources", "resources", (("get", ("array", ("object", (("cgroup-mode", True, ("integer",), "cgroup_mode"), ("content", True, ("string",)), ("cpu", True, ("number",)), ("disk", True, ("integer",)), ("hastate", True, ("string",)), ("id", False, ("string",)), ("level", True, ("string",)), ("maxcpu", True, ("number",)), ("maxdisk", True, ("integer",)), ("maxmem", True, ("integer",)), ("mem", True, ("integer",)), ("name", True, ("string",)), ("node", True, ("string",)), ("plugintype", True, ("string",)), ("pool", True, ("string",)), ("status", True, ("string",)), ("storage", True, ("string",)), ("type", False, ("string", ("node", "storage", "pool", "qemu", "lxc", "openvz", "sdn"))), ("uptime", True, ("integer",)), ("vmid", True, ("integer",)))))),)),
+    ("/cluster/tasks", "tasks", (("get", ("array", ("object", (("upid", False, ("string",)),)))),)),
+    ("/cluster/options", "options", (("get", ("object",)), ("put", ("null",)))),
+    ("/cluster/status", "status", (("get", ("array", ("object", (("id", False, ("string",)), ("ip", True, ("string",)), ("level", True, ("string",)), ("local", True, ("boolean",)), ("name", False, ("string",)), ("nodeid", True, ("integer",)), ("nodes", True, ("integer",)), ("online", True, ("boolean",)), ("quorate", True, ("boolean",)), ("type", False, ("string", ("cluster", "node"))), ("version", True, ("integer",)))))),)),
+    ("/cluster/nextid", "nextid", (("get", ("integer",)),)),
+    ("/nodes", "nodes", (("get", ("array", ("object", (("cpu", True, ("number",)), ("level", True, ("string",)), ("maxcpu", True, ("integer",)), ("maxmem", True, ("integer",)), ("mem", True, ("integer",)), ("node", False, ("string",)), ("ssl_fingerprint", True, ("string",)), ("status", False, ("string", ("unknown", "online", "offline"))), ("uptime", True, ("integer",)))))),)),
+    ("/nodes/{node}", "", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/qemu", "qemu", (("get", ("array", ("object", (("cpus", True, ("number",)), ("lock", True, ("string",)), ("maxdisk", True, ("integer",)), ("maxmem", True, ("integer",)), ("name", True, ("string",)), ("pid", True, ("integer",)), ("qmpstatus", True, ("string",)), ("running-machine", True, ("string",), "running_machine"), ("running-qemu", True, ("string",), "running_qemu"), ("status", False, ("string", ("stopped", "running"))), ("tags", True, ("string",)), ("uptime", True, ("integer",)), ("vmid", False, ("integer",)))))), ("post", ("string",)))),
+    ("/nodes/{node}/qemu/{vmid}", "", (("delete", ("string",)), ("get", ("array", ("object", (("subdir", False, ("string",)),)))))),
+    ("/nodes/{node}/qemu/{vmid}/firewall", "firewall", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/qemu/{vmid}/firewall/rules", "rules", (("get", ("array", ("object", (("pos", False, ("integer",)),)))), ("post", ("null",)))),
+    ("/nodes/{node}/qemu/{vmid}/firewall/rules/{pos}", "", (("delete", ("null",)), ("get", ("object", (("action", False, ("string",)), ("comment", True, ("string",)), ("dest", True, ("string",)), ("dport", True, ("string",)), ("enable", True, ("integer",)), ("icmp-type", True, ("string",), "icmp_type"), ("iface", True, ("string",)), ("ipversion", True, ("integer",)), ("log", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("macro", True, ("string",)), ("pos", False, ("integer",)), ("proto", True, ("string",)), ("source", True, ("string",)), ("sport", True, ("string",)), ("type", False, ("string",))))), ("put", ("null",)))),
+    ("/nodes/{node}/qemu/{vmid}/firewall/aliases", "aliases", (("get", ("array", ("object", (("cidr", False, ("string",)), ("comment", True, ("string",)), ("digest", False, ("string",)), ("name", False, ("string",)))))), ("post", ("null",)))),
+    ("/nodes/{node}/qemu/{vmid}/firewall/aliases/{name}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/nodes/{node}/qemu/{vmid}/firewall/ipset", "ipset", (("get", ("array", ("object", (("comment", True, ("string",)), ("digest", False, ("string",)), ("name", False, ("string",)))))), ("post", ("null",)))),
+    ("/nodes/{node}/qemu/{vmid}/firewall/ipset/{name}", "", (("delete", ("null",)), ("get", ("array", ("object", (("cidr", False, ("string",)), ("comment", True, ("string",)), ("digest", False, ("string",)), ("nomatch", True, ("boolean",)))))), ("post", ("null",)))),
+    ("/nodes/{node}/qemu/{vmid}/firewall/ipset/{name}/{cidr}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/nodes/{node}/qemu/{vmid}/firewall/options", "options", (("get", ("object", (("dhcp", True, ("boolean",)), ("enable", True, ("boolean",)), ("ipfilter", True, ("boolean",)), ("log_level_in", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("log_level_out", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("macfilter", True, ("boolean",)), ("ndp", True, ("boolean",)), ("policy_in", True, ("string", ("ACCEPT", "REJECT", "DROP"))), ("policy_out", True, ("string", ("ACCEPT", "REJECT", "DROP"))), ("radv", True, ("boolean",))))), ("put", ("null",)))),
+    ("/nodes/{node}/qemu/{vmid}/firewall/log", "log", (("get", ("array", ("object", (("n", False, ("integer",)), ("t", False, ("string",)))))),)),
+    ("/nodes/{node}/qemu/{vmid}/firewall/refs", "refs", (("get", ("array", ("object", (("comment", True, ("string",)), ("name", False, ("string",)), ("type", False, ("string", ("alias", "ipset"))))))),)),
+    ("/nodes/{node}/qemu/{vmid}/agent", "agent", (("get", ("array", ("object",))), ("post", ("object",)))),
+    ("/nodes/{node}/qemu/{vmid}/agent/fsfreeze-freeze", "fsfreeze_freeze", (("post", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/fsfreeze-status", "fsfreeze_status", (("post", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/fsfreeze-thaw", "fsfreeze_thaw", (("post", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/fstrim", "fstrim", (("post", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/get-fsinfo", "get_fsinfo", (("get", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/get-host-name", "get_host_name", (("get", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/get-memory-block-info", "get_memory_block_info", (("get", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/get-memory-blocks", "get_memory_blocks", (("get", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/get-osinfo", "get_osinfo", (("get", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/get-time", "get_time", (("get", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/get-timezone", "get_timezone", (("get", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/get-users", "get_users", (("get", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/get-vcpus", "get_vcpus", (("get", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/info", "info", (("get", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/network-get-interfaces", "network_get_interfaces", (("get", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/ping", "ping", (("post", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/shutdown", "shutdown", (("post", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/suspend-disk", "suspend_disk", (("post", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/suspend-hybrid", "suspend_hybrid", (("post", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/suspend-ram", "suspend_ram", (("post", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/set-user-password", "set_user_password", (("post", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/exec", "exec", (("post", ("object", (("pid", False, ("integer",)),))),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/exec-status", "exec_status", (("get", ("object", (("err-data", True, ("string",), "err_data"), ("err-truncated", True, ("boolean",), "err_truncated"), ("exitcode", True, ("integer",)), ("exited", False, ("boolean",)), ("out-data", True, ("string",), "out_data"), ("out-truncated", True, ("boolean",), "out_truncated"), ("signal", True, ("integer",))))),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/file-read", "file_read", (("get", ("object", (("content", False, ("string",)), ("truncated", True, ("boolean",))))),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/file-write", "file_write", (("post", ("null",)),)),
+    ("/nodes/{node}/qemu/{vmid}/rrd", "rrd", (("get", ("object", (("filename", False, ("string",)),))),)),
+    ("/nodes/{node}/qemu/{vmid}/rrddata", "rrddata", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/qemu/{vmid}/config", "config", (("get", ("object", (("acpi", True, ("boolean",)), ("affinity", True, ("string",)), ("agent", True, ("string",)), ("arch", True, ("string", ("x86_64", "aarch64"))), ("args", True, ("string",)), ("audio0", True, ("string",)), ("autostart", True, ("boolean",)), ("balloon", True, ("integer",)), ("bios", True, ("string", ("seabios", "ovmf"))), ("boot", True, ("string",)), ("bootdisk", True, ("string",)), ("cdrom", True, ("string",)), ("cicustom", True, ("string",)), ("cipassword", True, ("string",)), ("citype", True, ("string", ("configdrive2", "nocloud", "opennebula"))), ("ciuser", True, ("string",)), ("cores", True, ("integer",)), ("cpu", True, ("string",)), ("cpulimit", True, ("number",)), ("cpuunits", True, ("integer",)), ("description", True, ("string",)), ("digest", False, ("string",)), ("efidisk0", True, ("string",)), ("freeze", True, ("boolean",)), ("hookscript", True, ("string",)), ("hostpci[n]", True, ("string",), "hostpcin"), ("hotplug", True, ("string",)), ("hugepages", True, ("string", ("any", "2", "1024"))), ("ide[n]", True, ("string",), "iden"), ("ipconfig[n]", True, ("string",), "ipconfign"), ("ivshmem", True, ("string",)), ("keephugepages", True, ("boolean",)), ("keyboard", True, ("string", ("de", "de-ch", "da", "en-gb", "en-us", "es", "fi", "fr", "fr-be", "fr-ca", "fr-ch", "hu", "is", "it", "ja", "lt", "mk", "nl", "no", "pl", "pt", "pt-br", "sv", "sl", "tr"))), ("kvm", True, ("boolean",)), ("localtime", True, ("boolean",)), ("lock", True, ("string", ("backup", "clone", "create", "migrate", "rollback", "snapshot", "snapshot-delete", "suspending", "suspended"))), ("machine", True, ("string",)), ("memory", True, ("integer",)), ("migrate_downtime", True, ("number",)), ("migrate_speed", True, ("integer",)), ("name", True, ("string",)), ("nameserver", True, ("string",)), ("net[n]", True, ("string",), "netn"), ("numa", True, ("boolean",)), ("numa[n]", True, ("string",), "numan"), ("onboot", True, ("boolean",)), ("ostype", True, ("string", ("other", "wxp", "w2k", "w2k3", "w2k8", "wvista", "win7", "win8", "win10", "win11", "l24", "l26", "solaris"))), ("parallel[n]", True, ("string",), "paralleln"), ("protection", True, ("boolean",)), ("reboot", True, ("boolean",)), ("rng0", True, ("string",)), ("sata[n]", True, ("string",), "satan"), ("scsi[n]", True, ("string",), "scsin"), ("scsihw", True, ("string", ("lsi", "lsi53c810", "virtio-scsi-pci", "virtio-scsi-single", "megasas", "pvscsi"))), ("searchdomain", True, ("string",)), ("serial[n]", True, ("string",), "serialn"), ("shares", True, ("integer",)), ("smbios1", True, ("string",)), ("smp", True, ("integer",)), ("sockets", True, ("integer",)), ("spice_enhancements", True, ("string",)), ("sshkeys", True, ("string",)), ("startdate", True, ("string",)), ("startup", True, ("string",)), ("tablet", True, ("boolean",)), ("tags", True, ("string",)), ("tdf", True, ("boolean",)), ("template", True, ("boolean",)), ("tpmstate0", True, ("string",)), ("unused[n]", True, ("string",), "unusedn"), ("usb[n]", True, ("string",), "usbn"), ("vcpus", True, ("integer",)), ("vga", True, ("string",)), ("virtio[n]", True, ("string",), "virtion"), ("vmgenid", True, ("string",)), ("vmstatestorage", True, ("string",)), ("watchdog", True, ("string",))))), ("post", ("string",)), ("put", ("null",)))),
+    ("/nodes/{node}/qemu/{vmid}/pending", "pending", (("get", ("array", ("object", (("delete", True, ("integer",)), ("key", False, ("string",)), ("pending", True, ("string",)), ("value", True, ("string",)))))),)),
+    ("/nodes/{node}/qemu/{vmid}/cloudinit", "cloudinit", (("get", ("array", ("object", (("key", False, ("string",)), ("new", True, ("string",)), ("old", True, ("string",)))))), ("put", ("null",)))),
+    ("/nodes/{node}/qemu/{vmid}/cloudinit/dump", "dump", (("get", ("string",)),)),
+    ("/nodes/{node}/qemu/{vmid}/unlink", "unlink", (("put", ("null",)),)),
+    ("/nodes/{node}/qemu/{vmid}/vncproxy", "vncproxy", (("post", ("object", (("cert", False, ("string",)), ("password", True, ("string",)), ("port", False, ("integer",)), ("ticket", False, ("string",)), ("upid", False, ("string",)), ("user", False, ("string",))))),)),
+    ("/nodes/{node}/qemu/{vmid}/termproxy", "termproxy", (("post", ("object", (("port", False, ("integer",)), ("ticket", False, ("string",)), ("upid", False, ("string",)), ("user", False, ("string",))))),)),
+    ("/nodes/{node}/qemu/{vmid}/vncwebsocket", "vncwebsocket", (("get", ("object", (("port", False, ("string",)),))),)),
+    ("/nodes/{node}/qemu/{vmid}/spiceproxy", "spiceproxy", (("post", ("object", (("host", False, ("string",)), ("password", False, ("string",)), ("proxy", False, ("string",)), ("tls-port", False, ("integer",), "tls_port"), ("type", False, ("string",))))),)),
+    ("/nodes/{node}/qemu/{vmid}/status", "status", (("get", ("array", ("object", (("subdir", False, ("string",)),)))),)),
+    ("/nodes/{node}/qemu/{vmid}/status/current", "current", (("get", ("object", (("agent", True, ("boolean",)), ("cpus", True, ("number",)), ("ha", False, ("object",)), ("lock", True, ("string",)), ("maxdisk", True, ("integer",)), ("maxmem", True, ("integer",)), ("name", True, ("string",)), ("pid", True, ("integer",)), ("qmpstatus", True, ("string",)), ("running-machine", True, ("string",), "running_machine"), ("running-qemu", True, ("string",), "running_qemu"), ("spice", True, ("boolean",)), ("status", False, ("string", ("stopped", "running"))), ("tags", True, ("string",)), ("uptime", True, ("integer",)), ("vmid", False, ("integer",))))),)),
+    ("/nodes/{node}/qemu/{vmid}/status/start", "start", (("post", ("string",)),)),
+    ("/nodes/{node}/qemu/{vmid}/status/stop", "stop", (("post", ("string",)),)),
+    ("/nodes/{node}/qemu/{vmid}/status/reset", "reset", (("post", ("string",)),)),
+    ("/nodes/{node}/qemu/{vmid}/status/shutdown", "shutdown", (("post", ("string",)),)),
+    ("/nodes/{node}/qemu/{vmid}/status/reboot", "reboot", (("post", ("string",)),)),
+    ("/nodes/{node}/qemu/{vmid}/status/suspend", "suspend", (("post", ("string",)),)),
+    ("/nodes/{node}/qemu/{vmid}/status/resume", "resume", (("post", ("string",)),)),
+    ("/nodes/{node}/qemu/{vmid}/sendkey", "sendkey", (("put", ("null",)),)),
+    ("/nodes/{node}/qemu/{vmid}/feature", "feature", (("get", ("object", (("hasFeature", False, ("boolean",), "has_feature"), ("nodes", False, ("array", ("string",)))))),)),
+    ("/nodes/{node}/qemu/{vmid}/clone", "clone", (("post", ("string",)),)),
+    ("/nodes/{node}/qemu/{vmid}/move_disk", "move_disk", (("post", ("string",)),)),
+    ("/nodes/{node}/qemu/{vmid}/migrate", "migrate", (("get", ("object", (("allowed_nodes", True, ("array",)), ("local_disks", False, ("array",)), ("local_resources", False, ("array",)), ("not_allowed_nodes", True, ("object",)), ("running", False, ("boolean",))))), ("post", ("string",)))),
+    ("/nodes/{node}/qemu/{vmid}/remote_migrate", "remote_migrate", (("post", ("string",)),)),
+    ("/nodes/{node}/qemu/{vmid}/monitor", "monitor", (("post", ("string",)),)),
+    ("/nodes/{node}/qemu/{vmid}/resize", "resize", (("put", ("null",)),)),
+    ("/nodes/{node}/qemu/{vmid}/snapshot", "snapshot", (("get", ("array", ("object", (("description", False, ("string",)), ("name", False, ("string",)), ("parent", True, ("string",)), ("snaptime", True, ("integer",)), ("vmstate", True, ("boolean",)))))), ("post", ("string",)))),
+    ("/nodes/{node}/qemu/{vmid}/snapshot/{snapname}", "", (("delete", ("string",)), ("get", ("array", ("object",))))),
+    ("/nodes/{node}/qemu/{vmid}/snapshot/{snapname}/config", "config", (("get", ("object",)), ("put", ("null",)))),
+    ("/nodes/{node}/qemu/{vmid}/snapshot/{snapname}/rollback", "rollback", (("post", ("string",)),)),
+    ("/nodes/{node}/qemu/{vmid}/template", "template", (("post", ("string",)),)),
+    ("/nodes/{node}/qemu/{vmid}/mtunnel", "mtunnel", (("post", ("object", (("socket", False, ("string",)), ("ticket", False, ("string",)), ("upid", False, ("string",))))),)),
+    ("/nodes/{node}/qemu/{vmid}/mtunnelwebsocket", "mtunnelwebsocket", (("get", ("object", (("port", True, ("string",)), ("socket", True, ("string",))))),)),
+    ("/nodes/{node}/lxc", "lxc", (("get", ("array", ("object", (("cpus", True, ("number",)), ("lock", True, ("string",)), ("maxdisk", True, ("integer",)), ("maxmem", True, ("integer",)), ("maxswap", True, ("integer",)), ("name", True, ("string",)), ("status", False, ("string", ("stopped", "running"))), ("tags", True, ("string",)), ("uptime", True, ("integer",)), ("vmid", False, ("integer",)))))), ("post", ("string",)))),
+    ("/nodes/{node}/lxc/{vmid}", "", (("delete", ("string",)), ("get", ("array", ("object", (("subdir", False, ("string",)),)))))),
+    ("/nodes/{node}/lxc/{vmid}/config", "config", (("get", ("object", (("arch", True, ("string", ("amd64", "i386", "arm64", "armhf", "riscv32", "riscv64"))), ("cmode", True, ("string", ("shell", "console", "tty"))), ("console", True, ("boolean",)), ("cores", True, ("integer",)), ("cpulimit", True, ("number",)), ("cpuunits", True, ("integer",)), ("debug", True, ("boolean",)), ("description", True, ("string",)), ("digest", False, ("string",)), ("features", True, ("string",)), ("hookscript", True, ("string",)), ("hostname", True, ("string",)), ("lock", True, ("string", ("backup", "create", "destroyed", "disk", "fstrim", "migrate", "mounted", "rollback", "snapshot", "snapshot-delete"))), ("lxc", True, ("array", ("array", ("string",)))), ("memory", True, ("integer",)), ("mp[n]", True, ("string",), "mpn"), ("nameserver", True, ("string",)), ("net[n]", True, ("string",), "netn"), ("onboot", True, ("boolean",)), ("ostype", True, ("string", ("debian", "devuan", "ubuntu", "centos", "fedora", "opensuse", "archlinux", "alpine", "gentoo", "nixos", "unmanaged"))), ("protection", True, ("boolean",)), ("rootfs", True, ("string",)), ("searchdomain", True, ("string",)), ("startup", True, ("string",)), ("swap", True, ("integer",)), ("tags", True, ("string",)), ("template", True, ("boolean",)), ("timezone", True, ("string",)), ("tty", True, ("integer",)), ("unprivileged", True, ("boolean",)), ("unused[n]", True, ("string",), "unusedn")))), ("put", ("null",)))),
+    ("/nodes/{node}/lxc/{vmid}/status", "status", (("get", ("array", ("object", (("subdir", False, ("string",)),)))),)),
+    ("/nodes/{node}/lxc/{vmid}/status/current", "current", (("get", ("object", (("cpus", True, ("number",)), ("ha", False, ("object",)), ("lock", True, ("string",)), ("maxdisk", True, ("integer",)), ("maxmem", True, ("integer",)), ("maxswap", True, ("integer",)), ("name", True, ("string",)), ("status", False, ("string", ("stopped", "running"))), ("tags", True, ("string",)), ("uptime", True, ("integer",)), ("vmid", False, ("integer",))))),)),
+    ("/nodes/{node}/lxc/{vmid}/status/start", "start", (("post", ("string",)),)),
+    ("/nodes/{node}/lxc/{vmid}/status/stop", "stop", (("post", ("string",)),)),
+    ("/nodes/{node}/lxc/{vmid}/status/shutdown", "shutdown", (("post", ("string",)),)),
+    ("/nodes/{node}/lxc/{vmid}/status/suspend", "suspend", (("post", ("string",)),)),
+    ("/nodes/{node}/lxc/{vmid}/status/resume", "resume", (("post", ("string",)),)),
+    ("/nodes/{node}/lxc/{vmid}/status/reboot", "reboot", (("post", ("string",)),)),
+    ("/nodes/{node}/lxc/{vmid}/snapshot", "snapshot", (("get", ("array", ("object", (("description", False, ("string",)), ("name", False, ("string",)), ("parent", True, ("string",)), ("snaptime", True, ("integer",)))))), ("post", ("string",)))),
+    ("/nodes/{node}/lxc/{vmid}/snapshot/{snapname}", "", (("delete", ("string",)), ("get", ("array", ("object",))))),
+    ("/nodes/{node}/lxc/{vmid}/snapshot/{snapname}/rollback", "rollback", (("post", ("string",)),)),
+    ("/nodes/{node}/lxc/{vmid}/snapshot/{snapname}/config", "config", (("get", ("object",)), ("put", ("null",)))),
+    ("/nodes/{node}/lxc/{vmid}/firewall", "firewall", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/lxc/{vmid}/firewall/rules", "rules", (("get", ("array", ("object", (("pos", False, ("integer",)),)))), ("post", ("null",)))),
+    ("/nodes/{node}/lxc/{vmid}/firewall/rules/{pos}", "", (("delete", ("null",)), ("get", ("object", (("action", False, ("string",)), ("comment", True, ("string",)), ("dest", True, ("string",)), ("dport", True, ("string",)), ("enable", True, ("integer",)), ("icmp-type", True, ("string",), "icmp_type"), ("iface", True, ("string",)), ("ipversion", True, ("integer",)), ("log", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("macro", True, ("string",)), ("pos", False, ("integer",)), ("proto", True, ("string",)), ("source", True, ("string",)), ("sport", True, ("string",)), ("type", False, ("string",))))), ("put", ("null",)))),
+    ("/nodes/{node}/lxc/{vmid}/firewall/aliases", "aliases", (("get", ("array", ("object", (("cidr", False, ("string",)), ("comment", True, ("string",)), ("digest", False, ("string",)), ("name", False, ("string",)))))), ("post", ("null",)))),
+    ("/nodes/{node}/lxc/{vmid}/firewall/aliases/{name}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/nodes/{node}/lxc/{vmid}/firewall/ipset", "ipset", (("get", ("array", ("object", (("comment", True, ("string",)), ("digest", False, ("string",)), ("name", False, ("string",)))))), ("post", ("null",)))),
+    ("/nodes/{node}/lxc/{vmid}/firewall/ipset/{name}", "", (("delete", ("null",)), ("get", ("array", ("object", (("cidr", False, ("string",)), ("comment", True, ("string",)), ("digest", False, ("string",)), ("nomatch", True, ("boolean",)))))), ("post", ("null",)))),
+    ("/nodes/{node}/lxc/{vmid}/firewall/ipset/{name}/{cidr}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/nodes/{node}/lxc/{vmid}/firewall/options", "options", (("get", ("object", (("dhcp", True, ("boolean",)), ("enable", True, ("boolean",)), ("ipfilter", True, ("boolean",)), ("log_level_in", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("log_level_out", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("macfilter", True, ("boolean",)), ("ndp", True, ("boolean",)), ("policy_in", True, ("string", ("ACCEPT", "REJECT", "DROP"))), ("policy_out", True, ("string", ("ACCEPT", "REJECT", "DROP"))), ("radv", True, ("boolean",))))), ("put", ("null",)))),
+    ("/nodes/{node}/lxc/{vmid}/firewall/log", "log", (("get", ("array", ("object", (("n", False, ("integer",)), ("t", False, ("string",)))))),)),
+    ("/nodes/{node}/lxc/{vmid}/firewall/refs", "refs", (("get", ("array", ("object", (("comment", True, ("string",)), ("name", False, ("string",)), ("type", False, ("string", ("alias", "ipset"))))))),)),
+    ("/nodes/{node}/lxc/{vmid}/rrd", "rrd", (("get", ("object", (("filename", False, ("string",)),))),)),
+    ("/nodes/{node}/lxc/{vmid}/rrddata", "rrddata", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/lxc/{vmid}/vncproxy", "vncproxy", (("post", ("object", (("cert", False, ("string",)), ("port", False, ("integer",)), ("ticket", False, ("string",)), ("upid", False, ("string",)), ("user", False, ("string",))))),)),
+    ("/nodes/{node}/lxc/{vmid}/termproxy", "termproxy", (("post", ("object", (("port", False, ("integer",)), ("ticket", False, ("string",)), ("upid", False, ("string",)), ("user", False, ("string",))))),)),
+    ("/nodes/{node}/lxc/{vmid}/vncwebsocket", "vncwebsocket", (("get", ("object", (("port", False, ("string",)),))),)),
+    ("/nodes/{node}/lxc/{vmid}/spiceproxy", "spiceproxy", (("post", ("object", (("host", False, ("string",)), ("password", False, ("string",)), ("proxy", False, ("string",)), ("tls-port", False, ("integer",), "tls_port"), ("type", False, ("string",))))),)),
+    ("/nodes/{node}/lxc/{vmid}/remote_migrate", "remote_migrate", (("post", ("string",)),)),
+    ("/nodes/{node}/lxc/{vmid}/migrate", "migrate", (("post", ("string",)),)),
+    ("/nodes/{node}/lxc/{vmid}/feature", "feature", (("get", ("object", (("hasFeature", False, ("boolean",), "has_feature"),))),)),
+    ("/nodes/{node}/lxc/{vmid}/template", "template", (("post", ("null",)),)),
+    ("/nodes/{node}/lxc/{vmid}/clone", "clone", (("post", ("string",)),)),
+    ("/nodes/{node}/lxc/{vmid}/resize", "resize", (("put", ("string",)),)),
+    ("/nodes/{node}/lxc/{vmid}/move_volume", "move_volume", (("post", ("string",)),)),
+    ("/nodes/{node}/lxc/{vmid}/pending", "pending", (("get", ("array", ("object", (("delete", True, ("integer",)), ("key", False, ("string",)), ("pending", True, ("string",)), ("value", True, ("string",)))))),)),
+    ("/nodes/{node}/lxc/{vmid}/mtunnel", "mtunnel", (("post", ("object", (("socket", False, ("string",)), ("ticket", False, ("string",)), ("upid", False, ("string",))))),)),
+    ("/nodes/{node}/lxc/{vmid}/mtunnelwebsocket", "mtunnelwebsocket", (("get", ("object", (("port", True, ("string",)), ("socket", True, ("string",))))),)),
+    ("/nodes/{node}/ceph", "ceph", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/ceph/cfg", "cfg", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/ceph/cfg/raw", "raw", (("get", ("string",)),)),
+    ("/nodes/{node}/ceph/cfg/db", "db", (("get", ("array", ("object", (("can_update_at_runtime", False, ("boolean",)), ("level", False, ("string",)), ("mask", False, ("string",)), ("name", False, ("string",)), ("section", False, ("string",)), ("value", False, ("string",)))))),)),
+    ("/nodes/{node}/ceph/osd", "osd", (("get", ("object",)), ("post", ("string",)))),
+    ("/nodes/{node}/ceph/osd/{osdid}", "", (("delete", ("string",)), ("get", ("array", ("object",))))),
+    ("/nodes/{node}/ceph/osd/{osdid}/metadata", "metadata", (("get", ("object", (("devices", False, ("array", ("object", (("dev_node", False, ("string",)), ("device", False, ("string", ("block", "db", "wal"))), ("devices", False, ("string",)), ("size", False, ("integer",)), ("support_discard", False, ("boolean",)), ("type", False, ("string",)))))), ("osd", False, ("object", (("back_addr", False, ("string",)), ("front_addr", False, ("string",)), ("hb_back_addr", False, ("string",)), ("hb_front_addr", False, ("string",)), ("hostname", False, ("string",)), ("id", False, ("integer",)), ("mem_usage", False, ("integer",)), ("osd_data", False, ("string",)), ("osd_objectstore", False, ("string",)), ("pid", False, ("integer",)), ("version", False, ("string",)))))))),)),
+    ("/nodes/{node}/ceph/osd/{osdid}/lv-info", "lv_info", (("get", ("object", (("creation_time", False, ("string",)), ("lv_name", False, ("string",)), ("lv_path", False, ("string",)), ("lv_size", False, ("integer",)), ("lv_uuid", False, ("string",)), ("vg_name", False, ("string",))))),)),
+    ("/nodes/{node}/ceph/osd/{osdid}/in", "in_", (("post", ("null",)),)),
+    ("/nodes/{node}/ceph/osd/{osdid}/out", "out", (("post", ("null",)),)),
+    ("/nodes/{node}/ceph/osd/{osdid}/scrub", "scrub", (("post", ("null",)),)),
+    ("/nodes/{node}/ceph/mds", "mds", (("get", ("array", ("object", (("addr", True, ("string",)), ("host", True, ("string",)), ("name", False, ("object",)), ("rank", True, ("integer",)), ("standby_replay", True, ("boolean",)), ("state", False, ("string",)))))),)),
+    ("/nodes/{node}/ceph/mds/{name}", "", (("delete", ("string",)), ("post", ("string",)))),
+    ("/nodes/{node}/ceph/mgr", "mgr", (("get", ("array", ("object", (("addr", True, ("string",)), ("host", True, ("string",)), ("name", False, ("object",)), ("state", False, ("string",)))))),)),
+    ("/nodes/{node}/ceph/mgr/{id}", "", (("delete", ("string",)), ("post", ("string",)))),
+    ("/nodes/{node}/ceph/mon", "mon", (("get", ("array", ("object", (("addr", True, ("string",)), ("ceph_version", True, ("string",)), ("ceph_version_short", True, ("string",)), ("direxists", True, ("string",)), ("host", True, ("boolean",)), ("name", False, ("string",)), ("quorum", True, ("boolean",)), ("rank", True, ("integer",)), ("service", True, ("integer",)), ("state", True, ("string",)))))),)),
+    ("/nodes/{node}/ceph/mon/{monid}", "", (("delete", ("string",)), ("post", ("string",)))),
+    ("/nodes/{node}/ceph/fs", "fs", (("get", ("array", ("object", (("data_pool", False, ("string",)), ("metadata_pool", False, ("string",)), ("name", False, ("string",)))))),)),
+    ("/nodes/{node}/ceph/fs/{name}", "", (("post", ("string",)),)),
+    ("/nodes/{node}/ceph/pool", "pool", (("get", ("array", ("object", (("application_metadata", True, ("object",)), ("autoscale_status", True, ("object",)), ("bytes_used", False, ("integer",)), ("crush_rule", False, ("integer",)), ("crush_rule_name", False, ("string",)), ("min_size", False, ("integer",)), ("percent_used", False, ("number",)), ("pg_autoscale_mode", True, ("string",)), ("pg_num", False, ("integer",)), ("pg_num_final", True, ("integer",)), ("pg_num_min", True, ("integer",)), ("pool", False, ("integer",)), ("pool_name", False, ("string",)), ("size", False, ("integer",)), ("target_size", True, ("integer",)), ("target_size_ratio", True, ("number",)), ("type", False, ("string", ("replicated", "erasure", "unknown"))))))), ("post", ("string",)))),
+    ("/nodes/{node}/ceph/pool/{name}", "", (("delete", ("string",)), ("get", ("array", ("object",))), ("put", ("string",)))),
+    ("/nodes/{node}/ceph/pool/{name}/status", "status", (("get", ("object", (("application", True, ("string", ("rbd", "cephfs", "rgw"))), ("application_list", True, ("array",)), ("autoscale_status", True, ("object",)), ("crush_rule", True, ("string",)), ("fast_read", False, ("boolean",)), ("hashpspool", False, ("boolean",)), ("id", False, ("integer",)), ("min_size", True, ("integer",)), ("name", False, ("string",)), ("nodeep-scrub", False, ("boolean",), "nodeep_scrub"), ("nodelete", False, ("boolean",)), ("nopgchange", False, ("boolean",)), ("noscrub", False, ("boolean",)), ("nosizechange", False, ("boolean",)), ("pg_autoscale_mode", True, ("string", ("on", "off", "warn"))), ("pg_num", True, ("integer",)), ("pg_num_min", True, ("integer",)), ("pgp_num", False, ("integer",)), ("size", True, ("integer",)), ("statistics", True, ("object",)), ("target_size", True, ("string",)), ("target_size_ratio", True, ("number",)), ("use_gmt_hitset", False, ("boolean",)), ("write_fadvise_dontneed", False, ("boolean",))))),)),
+    ("/nodes/{node}/ceph/pools", "pools", (("get", ("array", ("object", (("application_metadata", True, ("object",)), ("autoscale_status", True, ("object",)), ("bytes_used", False, ("integer",)), ("crush_rule", False, ("integer",)), ("crush_rule_name", False, ("string",)), ("min_size", False, ("integer",)), ("percent_used", False, ("number",)), ("pg_autoscale_mode", True, ("string",)), ("pg_num", False, ("integer",)), ("pg_num_final", True, ("integer",)), ("pg_num_min", True, ("integer",)), ("pool", False, ("integer",)), ("pool_name", False, ("string",)), ("size", False, ("integer",)), ("target_size", True, ("integer",)), ("target_size_ratio", True, ("number",)), ("type", False, ("string", ("replicated", "erasure", "unknown"))))))), ("post", ("string",)))),
+    ("/nodes/{node}/ceph/pools/{name}", "", (("delete", ("string",)), ("get", ("object", (("application", True, ("string", ("rbd", "cephfs", "rgw"))), ("application_list", True, ("array",)), ("autoscale_status", True, ("object",)), ("crush_rule", True, ("string",)), ("fast_read", False, ("boolean",)), ("hashpspool", False, ("boolean",)), ("id", False, ("integer",)), ("min_size", True, ("integer",)), ("name", False, ("string",)), ("nodeep-scrub", False, ("boolean",), "nodeep_scrub"), ("nodelete", False, ("boolean",)), ("nopgchange", False, ("boolean",)), ("noscrub", False, ("boolean",)), ("nosizechange", False, ("boolean",)), ("pg_autoscale_mode", True, ("string", ("on", "off", "warn"))), ("pg_num", True, ("integer",)), ("pg_num_min", True, ("integer",)), ("pgp_num", False, ("integer",)), ("size", True, ("integer",)), ("statistics", True, ("object",)), ("target_size", True, ("string",)), ("target_size_ratio", True, ("number",)), ("use_gmt_hitset", False, ("boolean",)), ("write_fadvise_dontneed", False, ("boolean",))))), ("put", ("string",)))),
+    ("/nodes/{node}/ceph/config", "config", (("get", ("string",)),)),
+    ("/nodes/{node}/ceph/configdb", "configdb", (("get", ("array", ("object", (("can_update_at_runtime", False, ("boolean",)), ("level", False, ("string",)), ("mask", False, ("string",)), ("name", False, ("string",)), ("section", False, ("string",)), ("value", False, ("string",)))))),)),
+    ("/nodes/{node}/ceph/init", "init", (("post", ("null",)),)),
+    ("/nodes/{node}/ceph/stop", "stop", (("post", ("string",)),)),
+    ("/nodes/{node}/ceph/start", "start", (("post", ("string",)),)),
+    ("/nodes/{node}/ceph/restart", "restart", (("post", ("string",)),)),
+    ("/nodes/{node}/ceph/status", "status", (("get", ("object",)),)),
+    ("/nodes/{node}/ceph/crush", "crush", (("get", ("string",)),)),
+    ("/nodes/{node}/ceph/log", "log", (("get", ("array", ("object", (("n", False, ("integer",)), ("t", False, ("string",)))))),)),
+    ("/nodes/{node}/ceph/rules", "rules", (("get", ("array", ("object", (("name", False, ("string",)),)))),)),
+    ("/nodes/{node}/ceph/cmd-safety", "cmd_safety", (("get", ("object", (("safe", False, ("boolean",)), ("status", True, ("string",))))),)),
+    ("/nodes/{node}/vzdump", "vzdump", (("post", ("string",)),)),
+    ("/nodes/{node}/vzdump/defaults", "defaults", (("get", ("object", (("all", True, ("boolean",)), ("bwlimit", True, ("integer",)), ("compress", True, ("string", ("0", "1", "gzip", "lzo", "zstd"))), ("dumpdir", True, ("string",)), ("exclude", True, ("string",)), ("exclude-path", True, ("string",), "exclude_path"), ("ionice", True, ("integer",)), ("lockwait", True, ("integer",)), ("mailnotification", True, ("string", ("always", "failure"))), ("mailto", True, ("string",)), ("maxfiles", True, ("integer",)), ("mode", True, ("string", ("snapshot", "suspend", "stop"))), ("node", True, ("string",)), ("notes-template", True, ("string",), "notes_template"), ("performance", True, ("string",)), ("pigz", True, ("integer",)), ("pool", True, ("string",)), ("protected", True, ("boolean",)), ("prune-backups", True, ("string",), "prune_backups"), ("quiet", True, ("boolean",)), ("remove", True, ("boolean",)), ("script", True, ("string",)), ("stdexcludes", True, ("boolean",)), ("stop", True, ("boolean",)), ("stopwait", True, ("integer",)), ("storage", True, ("string",)), ("tmpdir", True, ("string",)), ("vmid", True, ("string",)), ("zstd", True, ("integer",))))),)),
+    ("/nodes/{node}/vzdump/extractconfig", "extractconfig", (("get", ("string",)),)),
+    ("/nodes/{node}/services", "services", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/services/{service}", "", (("get", ("array", ("object", (("subdir", False, ("string",)),)))),)),
+    ("/nodes/{node}/services/{service}/state", "state", (("get", ("object",)),)),
+    ("/nodes/{node}/services/{service}/start", "start", (("post", ("string",)),)),
+    ("/nodes/{node}/services/{service}/stop", "stop", (("post", ("string",)),)),
+    ("/nodes/{node}/services/{service}/restart", "restart", (("post", ("string",)),)),
+    ("/nodes/{node}/services/{service}/reload", "reload", (("post", ("string",)),)),
+    ("/nodes/{node}/subscription", "subscription", (("delete", ("null",)), ("get", ("object",)), ("post", ("null",)), ("put", ("null",)))),
+    ("/nodes/{node}/network", "network", (("delete", ("null",)), ("get", ("array", ("object",))), ("post", ("null",)), ("put", ("string",)))),
+    ("/nodes/{node}/network/{iface}", "", (("delete", ("null",)), ("get", ("object", (("method", False, ("string",)), ("type", False, ("string",))))), ("put", ("null",)))),
+    ("/nodes/{node}/tasks", "tasks", (("get", ("array", ("object", (("endtime", True, ("integer",)), ("id", False, ("string",)), ("node", False, ("string",)), ("pid", False, ("integer",)), ("pstart", False, ("integer",)), ("starttime", False, ("integer",)), ("status", True, ("string",)), ("type", False, ("string",)), ("upid", False, ("string",)), ("user", False, ("string",)))))),)),
+    ("/nodes/{node}/tasks/{upid}", "", (("delete", ("null",)), ("get", ("array", ("object",))))),
+    ("/nodes/{node}/tasks/{upid}/log", "log", (("get", ("array", ("object", (("n", False, ("integer",)), ("t", False, ("string",)))))),)),
+    ("/nodes/{node}/tasks/{upid}/status", "status", (("get", ("object", (("exitstatus", True, ("string",)), ("id", False, ("string",)), ("node", False, ("string",)), ("pid", False, ("integer",)), ("starttime", False, ("number",)), ("status", False, ("string", ("running", "stopped"))), ("type", False, ("string",)), ("upid", False, ("string",)), ("user", False, ("string",))))),)),
+    ("/nodes/{node}/scan", "scan", (("get", ("array", ("object", (("method", False, ("string",)),)))),)),
+    ("/nodes/{node}/scan/nfs", "nfs", (("get", ("array", ("object", (("options", False, ("string",)), ("path", False, ("string",)))))),)),
+    ("/nodes/{node}/scan/cifs", "cifs", (("get", ("array", ("object", (("description", False, ("string",)), ("share", False, ("string",)))))),)),
+    ("/nodes/{node}/scan/pbs", "pbs", (("get", ("array", ("object", (("comment", True, ("string",)), ("store", False, ("string",)))))),)),
+    ("/nodes/{node}/scan/glusterfs", "glusterfs", (("get", ("array", ("object", (("volname", False, ("string",)),)))),)),
+    ("/nodes/{node}/scan/iscsi", "iscsi", (("get", ("array", ("object", (("portal", False, ("string",)), ("target", False, ("string",)))))),)),
+    ("/nodes/{node}/scan/lvm", "lvm", (("get", ("array", ("object", (("vg", False, ("string",)),)))),)),
+    ("/nodes/{node}/scan/lvmthin", "lvmthin", (("get", ("array", ("object", (("lv", False, ("string",)),)))),)),
+    ("/nodes/{node}/scan/zfs", "zfs", (("get", ("array", ("object", (("pool", False, ("string",)),)))),)),
+    ("/nodes/{node}/hardware", "hardware", (("get", ("array", ("object", (("type", False, ("string",)),)))),)),
+    ("/nodes/{node}/hardware/pci", "pci", (("get", ("array", ("object", (("class", False, ("string",), "class_"), ("device", False, ("string",)), ("device_name", True, ("string",)), ("id", False, ("string",)), ("iommugroup", False, ("integer",)), ("mdev", True, ("boolean",)), ("subsystem_device", True, ("string",)), ("subsystem_device_name", True, ("string",)), ("subsystem_vendor", True, ("string",)), ("subsystem_vendor_name", True, ("string",)), ("vendor", False, ("string",)), ("vendor_name", True, ("string",)))))),)),
+    ("/nodes/{node}/hardware/pci/{pciid}", "", (("get", ("array", ("object", (("method", False, ("string",)),)))),)),
+    ("/nodes/{node}/hardware/pci/{pciid}/mdev", "mdev", (("get", ("array", ("object", (("available", False, ("integer",)), ("description", False, ("string",)), ("type", False, ("string",)))))),)),
+    ("/nodes/{node}/hardware/usb", "usb", (("get", ("array", ("object", (("busnum", False, ("integer",)), ("class", False, ("integer",), "class_"), ("devnum", False, ("integer",)), ("level", False, ("integer",)), ("manufacturer", True, ("string",)), ("port", False, ("integer",)), ("prodid", False, ("string",)), ("product", True, ("string",)), ("serial", True, ("string",)), ("speed", False, ("string",)), ("usbpath", True, ("string",)), ("vendid", False, ("string",)))))),)),
+    ("/nodes/{node}/capabilities", "capabilities", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/capabilities/qemu", "qemu", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/capabilities/qemu/cpu", "cpu", (("get", ("array", ("object", (("custom", False, ("boolean",)), ("name", False, ("string",)), ("vendor", False, ("string",)))))),)),
+    ("/nodes/{node}/capabilities/qemu/machines", "machines", (("get", ("array", ("object", (("id", False, ("string",)), ("type", False, ("string", ("q35", "i440fx"))), ("version", False, ("string",)))))),)),
+    ("/nodes/{node}/storage", "storage", (("get", ("array", ("object", (("active", True, ("boolean",)), ("avail", True, ("integer",)), ("content", False, ("string",)), ("enabled", True, ("boolean",)), ("shared", True, ("boolean",)), ("storage", False, ("string",)), ("total", True, ("integer",)), ("type", False, ("string",)), ("used", True, ("integer",)), ("used_fraction", True, ("number",)))))),)),
+    ("/nodes/{node}/storage/{storage}", "", (("get", ("array", ("object", (("subdir", False, ("string",)),)))),)),
+    ("/nodes/{node}/storage/{storage}/prunebackups", "prunebackups", (("delete", ("string",)), ("get", ("array", ("object", (("ctime", False, ("integer",)), ("mark", False, ("string", ("keep", "remove", "protected", "renamed"))), ("type", False, ("string",)), ("vmid", True, ("integer",)), ("volid", False, ("string",)))))))),
+    ("/nodes/{node}/storage/{storage}/content", "content", (("get", ("array", ("object", (("ctime", True, ("integer",)), ("encrypted", True, ("string",)), ("format", False, ("string",)), ("notes", True, ("string",)), ("parent", True, ("string",)), ("protected", True, ("boolean",)), ("size", False, ("integer",)), ("used", True, ("integer",)), ("verification", True, ("object", (("state", False, ("string",)), ("upid", False, ("string",))))), ("vmid", True, ("integer",)), ("volid", False, ("string",)))))), ("post", ("string",)))),
+    ("/nodes/{node}/storage/{storage}/content/{volume}", "", (("delete", ("string",)), ("get", ("object", (("format", False, ("string",)), ("notes", True, ("string",)), ("path", False, ("string",)), ("protected", True, ("boolean",)), ("size", False, ("integer",)), ("used", False, ("integer",))))), ("post", ("string",)), ("put", ("null",)))),
+    ("/nodes/{node}/storage/{storage}/file-restore", "file_restore", ()),
+    ("/nodes/{node}/storage/{storage}/file-restore/list", "list", (("get", ("array", ("object", (("filepath", False, ("string",)), ("leaf", False, ("boolean",)), ("mtime", True, ("integer",)), ("size", True, ("integer",)), ("text", False, ("string",)), ("type", False, ("string",)))))),)),
+    ("/nodes/{node}/storage/{storage}/file-restore/download", "download", (("get", ("any",)),)),
+    ("/nodes/{node}/storage/{storage}/status", "status", (("get", ("object",)),)),
+    ("/nodes/{node}/storage/{storage}/rrd", "rrd", (("get", ("object", (("filename", False, ("string",)),))),)),
+    ("/nodes/{node}/storage/{storage}/rrddata", "rrddata", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/storage/{storage}/upload", "upload", (("post", ("string",)),)),
+    ("/nodes/{node}/storage/{storage}/download-url", "download_url", (("post", ("string",)),)),
+    ("/nodes/{node}/disks", "disks", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/disks/lvm", "lvm", (("get", ("object", (("children", False, ("array", ("object", (("children", True, ("array", ("object", (("free", False, ("integer",)), ("leaf", False, ("boolean",)), ("name", False, ("string",)), ("size", False, ("integer",)))))), ("free", False, ("integer",)), ("leaf", False, ("boolean",)), ("name", False, ("string",)), ("size", False, ("integer",)))))), ("leaf", False, ("boolean",))))), ("post", ("string",)))),
+    ("/nodes/{node}/disks/lvm/{name}", "", (("delete", ("string",)),)),
+    ("/nodes/{node}/disks/lvmthin", "lvmthin", (("get", ("array", ("object", (("lv", False, ("string",)), ("lv_size", False, ("integer",)), ("metadata_size", False, ("integer",)), ("metadata_used", False, ("integer",)), ("used", False, ("integer",)), ("vg", False, ("string",)))))), ("post", ("string",)))),
+    ("/nodes/{node}/disks/lvmthin/{name}", "", (("delete", ("string",)),)),
+    ("/nodes/{node}/disks/directory", "directory", (("get", ("array", ("object", (("device", False, ("string",)), ("options", False, ("string",)), ("path", False, ("string",)), ("type", False, ("string",)), ("unitfile", False, ("string",)))))), ("post", ("string",)))),
+    ("/nodes/{node}/disks/directory/{name}", "", (("delete", ("string",)),)),
+    ("/nodes/{node}/disks/zfs", "zfs", (("get", ("array", ("object", (("alloc", False, ("integer",)), ("dedup", False, ("number",)), ("frag", False, ("integer",)), ("free", False, ("integer",)), ("health", False, ("string",)), ("name", False, ("string",)), ("size", False, ("integer",)))))), ("post", ("string",)))),
+    ("/nodes/{node}/disks/zfs/{name}", "", (("delete", ("string",)), ("get", ("object", (("action", True, ("string",)), ("children", False, ("array", ("object", (("cksum", True, ("number",)), ("msg", False, ("string",)), ("name", False, ("string",)), ("read", True, ("number",)), ("state", True, ("string",)), ("write", True, ("number",)))))), ("errors", False, ("string",)), ("name", False, ("string",)), ("scan", True, ("string",)), ("state", False, ("string",)), ("status", True, ("string",))))))),
+    ("/nodes/{node}/disks/list", "list", (("get", ("array", ("object", (("devpath", False, ("string",)), ("gpt", False, ("boolean",)), ("health", True, ("string",)), ("model", True, ("string",)), ("mounted", False, ("boolean",)), ("osdid", False, ("integer",)), ("parent", True, ("string",)), ("serial", True, ("string",)), ("size", False, ("integer",)), ("used", True, ("string",)), ("vendor", True, ("string",)), ("wwn", True, ("string",)))))),)),
+    ("/nodes/{node}/disks/smart", "smart", (("get", ("object", (("attributes", True, ("array",)), ("health", False, ("string",)), ("text", True, ("string",)), ("type", True, ("string",))))),)),
+    ("/nodes/{node}/disks/initgpt", "initgpt", (("post", ("string",)),)),
+    ("/nodes/{node}/disks/wipedisk", "wipedisk", (("put", ("string",)),)),
+    ("/nodes/{node}/apt", "apt", (("get", ("array", ("object", (("id", False, ("string",)),)))),)),
+    ("/nodes/{node}/apt/update", "update", (("get", ("array", ("object",))), ("post", ("string",)))),
+    ("/nodes/{node}/apt/changelog", "changelog", (("get", ("string",)),)),
+    ("/nodes/{node}/apt/repositories", "repositories", (("get", ("object", (("digest", False, ("string",)), ("errors", False, ("array", ("object", (("error", False, ("string",)), ("path", False, ("string",)))))), ("files", False, ("array", ("object", (("digest", False, ("array", ("integer",))), ("file-type", False, ("string", ("list", "sources")), "file_type"), ("path", False, ("string",)), ("repositories", False, ("array", ("object", (("Comment", True, ("string",), "comment"), ("Components", True, ("array", ("string",)), "components"), ("Enabled", False, ("boolean",), "enabled"), ("FileType", False, ("string", ("list", "sources")), "file_type"), ("Options", True, ("array", ("object", (("Key", False, ("string",), "key"), ("Values", False, ("array", ("string",)), "values")))), "options"), ("Suites", False, ("array", ("string",)), "suites"), ("Types", False, ("array", ("string", ("deb", "deb-src"))), "types"), ("URIs", False, ("array", ("string",)), "uris"))))))))), ("infos", False, ("array", ("object", (("index", False, ("string",)), ("kind", False, ("string",)), ("message", False, ("string",)), ("path", False, ("string",)), ("property", True, ("string",)))))), ("standard-repos", False, ("array", ("object", (("handle", False, ("string",)), ("name", False, ("string",)), ("status", True, ("boolean",))))), "standard_repos")))), ("post", ("null",)), ("put", ("null",)))),
+    ("/nodes/{node}/apt/versions", "versions", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/firewall", "firewall", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/firewall/rules", "rules", (("get", ("array", ("object", (("pos", False, ("integer",)),)))), ("post", ("null",)))),
+    ("/nodes/{node}/firewall/rules/{pos}", "", (("delete", ("null",)), ("get", ("object", (("action", False, ("string",)), ("comment", True, ("string",)), ("dest", True, ("string",)), ("dport", True, ("string",)), ("enable", True, ("integer",)), ("icmp-type", True, ("string",), "icmp_type"), ("iface", True, ("string",)), ("ipversion", True, ("integer",)), ("log", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("macro", True, ("string",)), ("pos", False, ("integer",)), ("proto", True, ("string",)), ("source", True, ("string",)), ("sport", True, ("string",)), ("type", False, ("string",))))), ("put", ("null",)))),
+    ("/nodes/{node}/firewall/options", "options", (("get", ("object", (("enable", True, ("boolean",)), ("log_level_in", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("log_level_out", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("log_nf_conntrack", True, ("boolean",)), ("ndp", True, ("boolean",)), ("nf_conntrack_allow_invalid", True, ("boolean",)), ("nf_conntrack_helpers", True, ("string",)), ("nf_conntrack_max", True, ("integer",)), ("nf_conntrack_tcp_timeout_established", True, ("integer",)), ("nf_conntrack_tcp_timeout_syn_recv", True, ("integer",)), ("nosmurfs", True, ("boolean",)), ("protection_synflood", True, ("boolean",)), ("protection_synflood_burst", True, ("integer",)), ("protection_synflood_rate", True, ("integer",)), ("smurf_log_level", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("tcp_flags_log_level", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("tcpflags", True, ("boolean",))))), ("put", ("null",)))),
+    ("/nodes/{node}/firewall/log", "log", (("get", ("array", ("object", (("n", False, ("integer",)), ("t", False, ("string",)))))),)),
+    ("/nodes/{node}/replication", "replication", (("get", ("array", ("object", (("id", False, ("string",)),)))),)),
+    ("/nodes/{node}/replication/{id}", "", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/replication/{id}/status", "status", (("get", ("object",)),)),
+    ("/nodes/{node}/replication/{id}/log", "log", (("get", ("array", ("object", (("n", False, ("integer",)), ("t", False, ("string",)))))),)),
+    ("/nodes/{node}/replication/{id}/schedule_now", "schedule_now", (("post", ("string",)),)),
+    ("/nodes/{node}/certificates", "certificates", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/certificates/acme", "acme", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/certificates/acme/certificate", "certificate", (("delete", ("string",)), ("post", ("string",)), ("put", ("string",)))),
+    ("/nodes/{node}/certificates/info", "info", (("get", ("array", ("object", (("filename", True, ("string",)), ("fingerprint", True, ("string",)), ("issuer", True, ("string",)), ("notafter", True, ("integer",)), ("notbefore", True, ("integer",)), ("pem", True, ("string",)), ("public-key-bits", True, ("integer",), "public_key_bits"), ("public-key-type", True, ("string",), "public_key_type"), ("san", True, ("array", ("string",))), ("subject", True, ("string",)))))),)),
+    ("/nodes/{node}/certificates/custom", "custom", (("delete", ("null",)), ("post", ("object", (("filename", True, ("string",)), ("fingerprint", True, ("string",)), ("issuer", True, ("string",)), ("notafter", True, ("integer",)), ("notbefore", True, ("integer",)), ("pem", True, ("string",)), ("public-key-bits", True, ("integer",), "public_key_bits"), ("public-key-type", True, ("string",), "public_key_type"), ("san", True, ("array", ("string",))), ("subject", True, ("string",))))))),
+    ("/nodes/{node}/config", "config", (("get", ("object", (("acme", True, ("string",)), ("acmedomain[n]", True, ("string",), "acmedomainn"), ("description", True, ("string",)), ("digest", True, ("string",)), ("startall-onboot-delay", True, ("integer",), "startall_onboot_delay"), ("wakeonlan", True, ("string",))))), ("put", ("null",)))),
+    ("/nodes/{node}/sdn", "sdn", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/sdn/zones", "zones", (("get", ("array", ("object", (("status", False, ("string", ("available", "pending", "error"))), ("zone", False, ("string",)))))),)),
+    ("/nodes/{node}/sdn/zones/{zone}", "", (("get", ("array", ("object", (("subdir", False, ("string",)),)))),)),
+    ("/nodes/{node}/sdn/zones/{zone}/content", "content", (("get", ("array", ("object", (("status", True, ("string",)), ("statusmsg", True, ("string",)), ("vnet", False, ("string",)))))),)),
+    ("/nodes/{node}/version", "version", (("get", ("object", (("release", False, ("string",)), ("repoid", False, ("string",)), ("version", False, ("string",))))),)),
+    ("/nodes/{node}/status", "status", (("get", ("object",)), ("post", ("null",)))),
+    ("/nodes/{node}/netstat", "netstat", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/execute", "execute", (("post", ("array", ("object",))),)),
+    ("/nodes/{node}/wakeonlan", "wakeonlan", (("post", ("string",)),)),
+    ("/nodes/{node}/rrd", "rrd", (("get", ("object", (("filename", False, ("string",)),))),)),
+    ("/nodes/{node}/rrddata", "rrddata", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/syslog", "syslog", (("get", ("array", ("object", (("n", False, ("integer",)), ("t", False, ("string",)))))),)),
+    ("/nodes/{node}/journal", "journal", (("get", ("array", ("string",))),)),
+    ("/nodes/{node}/vncshell", "vncshell", (("post", ("object", (("cert", False, ("string",)), ("port", False, ("integer",)), ("ticket", False, ("string",)), ("upid", False, ("string",)), ("user", False, ("string",))))),)),
+    ("/nodes/{node}/termproxy", "termproxy", (("post", ("object", (("port", False, ("integer",)), ("ticket", False, ("string",)), ("upid", False, ("string",)), ("user", False, ("string",))))),)),
+    ("/nodes/{node}/vncwebsocket", "vncwebsocket", (("get", ("object", (("port", False, ("string",)),))),)),
+    ("/nodes/{node}/spiceshell", "spiceshell", (("post", ("object", (("host", False, ("string",)), ("password", False, ("string",)), ("proxy", False, ("string",)), ("tls-port", False, ("integer",), "tls_port"), ("type", False, ("string",))))),)),
+    ("/nodes/{node}/dns", "dns", (("get", ("object", (("dns1", True, ("string",)), ("dns2", True, ("string",)), ("dns3", True, ("string",)), ("search", True, ("string",))))), ("put", ("null",)))),
+    ("/nodes/{node}/time", "time", (("get", ("object", (("localtime", False, ("integer",)), ("time", False, ("integer",)), ("timezone", False, ("string",))))), ("put", ("null",)))),
+    ("/nodes/{node}/aplinfo", "aplinfo", (("get", ("array", ("object",))), ("post", ("string",)))),
+    ("/nodes/{node}/query-url-metadata", "query_url_metadata", (("get", ("object", (("filename", True, ("string",)), ("mimetype", True, ("string",)), ("size", True, ("integer",))))),)),
+    ("/nodes/{node}/report", "report", (("get", ("string",)),)),
+    ("/nodes/{node}/startall", "startall", (("post", ("string",)),)),
+    ("/nodes/{node}/stopall", "stopall", (("post", ("string",)),)),
+    ("/nodes/{node}/migrateall", "migrateall", (("post", ("string",)),)),
+    ("/nodes/{node}/hosts", "hosts", (("get", ("object", (("data", False, ("string",)), ("digest", True, ("string",))))), ("post", ("null",)))),
+    ("/storage", "storage", (("get", ("array", ("object", (("storage", False, ("string",)),)))), ("post", ("object", (("config", True, ("object", (("encryption-key", True, ("string",), "encryption_key"),))), ("storage", False, ("string",)), ("type", False, ("string", ("btrfs", "cephfs", "cifs", "dir", "glusterfs", "iscsi", "iscsidirect", "lvm", "lvmthin", "nfs", "pbs", "rbd", "zfs", "zfspool")))))))),
+    ("/storage/{storage}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("object", (("config", True, ("object", (("encryption-key", True, ("string",), "encryption_key"),))), ("storage", False, ("string",)), ("type", False, ("string", ("btrfs", "cephfs", "cifs", "dir", "glusterfs", "iscsi", "iscsidirect", "lvm", "lvmthin", "nfs", "pbs", "rbd", "zfs", "zfspool")))))))),
+    ("/access", "access", (("get", ("array", ("object", (("subdir", False, ("string",)),)))),)),
+    ("/access/users", "users", (("get", ("array", ("object", (("comment", True, ("string",)), ("email", True, ("string",)), ("enable", True, ("boolean",)), ("expire", True, ("integer",)), ("firstname", True, ("string",)), ("groups", True, ("string",)), ("keys", True, ("string",)), ("lastname", True, ("string",)), ("realm-type", True, ("string",), "realm_type"), ("tokens", True, ("array", ("object", (("comment", True, ("string",)), ("expire", True, ("integer",)), ("privsep", True, ("boolean",)), ("tokenid", False, ("string",)))))), ("userid", False, ("string",)))))), ("post", ("null",)))),
+    ("/access/users/{userid}", "", (("delete", ("null",)), ("get", ("object", (("comment", True, ("string",)), ("email", True, ("string",)), ("enable", True, ("boolean",)), ("expire", True, ("integer",)), ("firstname", True, ("string",)), ("groups", True, ("array", ("string",))), ("keys", True, ("string",)), ("lastname", True, ("string",)), ("tokens", True, ("object",))))), ("put", ("null",)))),
+    ("/access/users/{userid}/tfa", "tfa", (("get", ("object", (("realm", True, ("string", ("oath", "yubico"))), ("types", True, ("array", ("string", ("totp", "u2f", "yubico", "webauthn", "recovedry")))), ("user", True, ("string", ("oath", "u2f")))))),)),
+    ("/access/users/{userid}/token", "token", (("get", ("array", ("object", (("comment", True, ("string",)), ("expire", True, ("integer",)), ("privsep", True, ("boolean",)), ("tokenid", False, ("string",)))))),)),
+    ("/access/users/{userid}/token/{tokenid}", "", (("delete", ("null",)), ("get", ("object", (("comment", True, ("string",)), ("expire", True, ("integer",)), ("privsep", True, ("boolean",))))), ("post", ("object", (("full-tokenid", False, ("string",), "full_tokenid"), ("info", False, ("object", (("comment", True, ("string",)), ("expire", True, ("integer",)), ("privsep", True, ("boolean",))))), ("value", False, ("string",))))), ("put", ("object", (("comment", True, ("string",)), ("expire", True, ("integer",)), ("privsep", True, ("boolean",))))))),
+    ("/access/groups", "groups", (("get", ("array", ("object", (("comment", True, ("string",)), ("groupid", False, ("string",)), ("users", True, ("string",)))))), ("post", ("null",)))),
+    ("/access/groups/{groupid}", "", (("delete", ("null",)), ("get", ("object", (("comment", True, ("string",)), ("members", False, ("array", ("string",)))))), ("put", ("null",)))),
+    ("/access/roles", "roles", (("get", ("array", ("object", (("privs", True, ("string",)), ("roleid", False, ("string",)), ("special", True, ("boolean",)))))), ("post", ("null",)))),
+    ("/access/roles/{roleid}", "", (("delete", ("null",)), ("get", ("object", (("Datastore.Allocate", True, ("boolean",), "datastore_allocate"), ("Datastore.AllocateSpace", True, ("boolean",), "datastore_allocate_space"), ("Datastore.AllocateTemplate", True, ("boolean",), "datastore_allocate_template"), ("Datastore.Audit", True, ("boolean",), "datastore_audit"), ("Group.Allocate", True, ("boolean",), "group_allocate"), ("Permissions.Modify", True, ("boolean",), "permissions_modify"), ("Pool.Allocate", True, ("boolean",), "pool_allocate"), ("Pool.Audit", True, ("boolean",), "pool_audit"), ("Realm.Allocate", True, ("boolean",), "realm_allocate"), ("Realm.AllocateUser", True, ("boolean",), "realm_allocate_user"), ("SDN.Allocate", True, ("boolean",), "sdnallocate"), ("SDN.Audit", True, ("boolean",), "sdnaudit"), ("Sys.Audit", True, ("boolean",), "sys_audit"), ("Sys.Console", True, ("boolean",), "sys_console"), ("Sys.Incoming", True, ("boolean",), "sys_incoming"), ("Sys.Modify", True, ("boolean",), "sys_modify"), ("Sys.PowerMgmt", True, ("boolean",), "sys_power_mgmt"), ("Sys.Syslog", True, ("boolean",), "sys_syslog"), ("User.Modify", True, ("boolean",), "user_modify"), ("VM.Allocate", True, ("boolean",), "vmallocate"), ("VM.Audit", True, ("boolean",), "vmaudit"), ("VM.Backup", True, ("boolean",), "vmbackup"), ("VM.Clone", True, ("boolean",), "vmclone"), ("VM.Config.CDROM", True, ("boolean",), "vmconfig_cdrom"), ("VM.Config.CPU", True, ("boolean",), "vmconfig_cpu"), ("VM.Config.Cloudinit", True, ("boolean",), "vmconfig_cloudinit"), ("VM.Config.Disk", True, ("boolean",), "vmconfig_disk"), ("VM.Config.HWType", True, ("boolean",), "vmconfig_hwtype"), ("VM.Config.Memory", True, ("boolean",), "vmconfig_memory"), ("VM.Config.Network", True, ("boolean",), "vmconfig_network"), ("VM.Config.Options", True, ("boolean",), "vmconfig_options"), ("VM.Console", True, ("boolean",), "vmconsole"), ("VM.Migrate", True, ("boolean",), "vmmigrate"), ("VM.Monitor", True, ("boolean",), "vmmonitor"), ("VM.PowerMgmt", True, ("boolean",), "vmpower_mgmt"), ("VM.Snapshot", True, ("boolean",), "vmsnapshot"), ("VM.Snapshot.Rollback", True, ("boolean",), "vmsnapshot_rollback")))), ("put", ("null",)))),
+    ("/access/acl", "acl", (("get", ("array", ("object", (("path", False, ("string",)), ("propagate", True, ("boolean",)), ("roleid", False, ("string",)), ("type", False, ("string", ("user", "group", "token"))), ("ugid", False, ("string",)))))), ("put", ("null",)))),
+    ("/access/domains", "domains", (("get", ("array", ("object", (("comment", True, ("string",)), ("realm", False, ("string",)), ("tfa", True, ("string", ("yubico", "oath"))), ("type", False, ("string",)))))), ("post", ("null",)))),
+    ("/access/domains/{realm}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/access/domains/{realm}/sync", "sync", (("post", ("string",)),)),
+    ("/access/openid", "openid", (("get", ("array", ("object", (("subdir", False, ("string",)),)))),)),
+    ("/access/openid/auth-url", "auth_url", (("post", ("string",)),)),
+    ("/access/openid/login", "login", (("post", ("object", (("CSRFPreventionToken", False, ("string",), "csrfprevention_token"), ("cap", False, ("object",)), ("clustername", True, ("string",)), ("ticket", False, ("string",)), ("username", False, ("string",))))),)),
+    ("/access/tfa", "tfa", (("get", ("array", ("object", (("entries", False, ("array", ("object", (("created", False, ("integer",)), ("description", False, ("string",)), ("enable", True, ("boolean",)), ("id", False, ("string",)), ("type", False, ("string", ("totp", "u2f", "webauthn", "recovery", "yubico"))))))), ("userid", False, ("string",)))))), ("post", ("object", (("ticket", False, ("string",)),))))),
+    ("/access/tfa/{userid}", "", (("get", ("array", ("object", (("created", False, ("integer",)), ("description", False, ("string",)), ("enable", True, ("boolean",)), ("id", False, ("string",)), ("type", False, ("string", ("totp", "u2f", "webauthn", "recovery", "yubico"))))))), ("post", ("object", (("challenge", True, ("string",)), ("id", False, ("string",)), ("recovery", True, ("array", ("string",)))))))),
+    ("/access/tfa/{userid}/{id}", "", (("delete", ("null",)), ("get", ("object", (("created", False, ("integer",)), ("description", False, ("string",)), ("enable", True, ("boolean",)), ("id", False, ("string",)), ("type", False, ("string", ("totp", "u2f", "webauthn", "recovery", "yubico")))))), ("put", ("null",)))),
+    ("/access/ticket", "ticket", (("get", ("null",)), ("post", ("object", (("CSRFPreventionToken", True, ("string",), "csrfprevention_token"), ("clustername", True, ("string",)), ("ticket", True, ("string",)), ("username", False, ("string",))))))),
+    ("/access/password", "password", (("put", ("null",)),)),
+    ("/access/permissions", "permissions", (("get", ("object",)),)),
+    ("/pools", "pools", (("get", ("array", ("object", (("poolid", False, ("string",)),)))), ("post", ("null",)))),
+    ("/pools/{poolid}", "", (("delete", ("null",)), ("get", ("object", (("comment", True, ("string",)), ("members", False, ("array", ("object", (("id", False, ("string",)), ("node", False, ("string",)), ("storage", True, ("string",)), ("type", False, ("string", ("qemu", "lxc", "openvz", "storage"))), ("vmid", True, ("integer",))))))))), ("put", ("null",)))),
+    ("/version", "version", (("get", ("object", (("console", True, ("string", ("applet", "vv", "html5", "xtermjs"))), ("release", False, ("string",)), ("repoid", False, ("string",)), ("version", False, ("string",))))),)),
+)
@@ -0,0 +1,4813 @@
+# This file is autogenerated from apidata/apidata-v8.json
+
+import builtins
+import proxmoxer
+import pydantic
+import typing
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Literal, Optional, NotRequired, TYPE_CHECKING, Unpack
+if TYPE_CHECKING:
+    from ..v8 import ProxmoxAPI as ProxmoxerProxmoxAPI
+else:
+    from proxmoxer import ProxmoxAPI as ProxmoxerProxmoxAPI
+from ..shapes import BaseModel, _Shape_463cb77526f6, _Shape_edea002acdb6, _Shape_7e076d4d2657, _Shape_9007792d8ac7, _Shape_72db08b30812, _Shape_8d4b95494c0c, _Shape_e74999d13f12, _Shape_d5a2e3de7e1a, _Shape_e44e0648d3a1, _Shape_9b7935286c62, _Shape_cce369b4a917, _Shape_cb704681a388, _Shape_4fe707541d5e, _Shape_9eab753b0163, _Shape_184746e77819, _Shape_0afd01c3d5a7, _Shape_2ec0018584cb, _Shape_728fd6efe35e, _Shape_7e5fdbf08cb2, _Shape_5877922db5f2, _Shape_a4d6230c98e6, _Shape_f6b6fb110821, _Shape_709bdb2a6f84, _Shape_af6cfdcc96b3, _Shape_f2025d055959, _Shape_fb0f0ac4229c, _Shape_3ff2000df841, _Shape_182f498e7915, _Shape_702e4ae1eff6, _Shape_b52d36c601b1, _Shape_21168c7817dc, _Shape_b0fbd9b90b6c, _Shape_13540329cbed, _Shape_b54c46139989, _Shape_05f3a7af0b41, _Shape_55277d366b6f, _Shape_556bfff24545, _Shape_828eb08e8829, _Shape_96a6222a23e9, _Shape_37b1d34686c6, _Shape_f7ba3b1bf24d, _Shape_0614073e3be8, _Shape_b11033e1fa8d, _Shape_0e3824cb199e, _Shape_d20c95931ae1, _Shape_b5f0ee8b1fbc, _Shape_52b1051abd4d, _Shape_94b8f7ef149b, _Shape_7afe7635fdbf, _Shape_652ec69e6eb1, _Shape_d0c81dc06c17, _Shape_0d387c9c35df, _Shape_c0902bf1a75b, _Shape_796474334f3c, _Shape_009180aaaa13, _Shape_e3f29b9e2a71
+
+class ProxmoxAPI:
+    @dataclass
+    class Cluster:
+        @dataclass
+        class Replication:
+            @dataclass
+            class Id:
+                @dataclass
+                class _Delete:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    id: str
+                    Params = typing.TypedDict("Params", {"force": NotRequired[bool], "keep": NotRequired[bool]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @dataclass
+                class _Get:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    id: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> dict[str, Any]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> dict[str, Any]: ...
+
+                @dataclass
+                class _Put:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    id: str
+                    Params = typing.TypedDict("Params", {"comment": NotRequired[str], "delete": NotRequired[str], "digest": NotRequired[str], "disable": NotRequired[bool], "rate": NotRequired[float], "remove_job": NotRequired[Literal["local", "full"]], "schedule": NotRequired[str], "source": NotRequired[str]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @cached_property
+                def delete(self) -> _Delete: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def put(self) -> _Put: ...
+
+                @property
+                def set(self) -> _Put: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                id: str
+
+            def __call__(self, id: str) -> Id: ...
+
+            @dataclass
+            class _Get:
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list[dict[str, Any]]: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list[dict[str, Any]]: ...
+
+            @dataclass
+            class _Post:
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {"comment": NotRequired[str], "disable": NotRequired[bool], "id": str, "rate": NotRequired[float], "remove_job": NotRequired[Literal["local", "full"]], "schedule": NotRequired[str], "source": NotRequired[str], "target": str, "type": Literal["local"]})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> None: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> None: ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+
+            @cached_property
+            def post(self) -> _Post: ...
+
+            @property
+            def create(self) -> _Post: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+
+        @cached_property
+        def replication(self) -> Replication: ...
+
+        @dataclass
+        class Metrics:
+            @dataclass
+            class Server:
+                @dataclass
+                class Id:
+                    @dataclass
+                    class _Delete:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        id: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @dataclass
+                    class _Get:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        id: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                    @dataclass
+                    class _Post:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        id: str
+                        Params = typing.TypedDict("Params", {"api-path-prefix": NotRequired[str], "bucket": NotRequired[str], "disable": NotRequired[bool], "influxdbproto": NotRequired[Literal["udp", "http", "https"]], "max-body-size": NotRequired[int], "mtu": NotRequired[int], "organization": NotRequired[str], "path": NotRequired[str], "port": int, "proto": NotRequired[Literal["udp", "tcp"]], "server": str, "timeout": NotRequired[int], "token": NotRequired[str], "type": Literal["graphite", "influxdb"], "verify-certificate": NotRequired[bool]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @dataclass
+                    class _Put:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        id: str
+                        Params = typing.TypedDict("Params", {"api-path-prefix": NotRequired[str], "bucket": NotRequired[str], "delete": NotRequired[str], "digest": NotRequired[str], "disable": NotRequired[bool], "influxdbproto": NotRequired[Literal["udp", "http", "https"]], "max-body-size": NotRequired[int], "mtu": NotRequired[int], "organization": NotRequired[str], "path": NotRequired[str], "port": int, "proto": NotRequired[Literal["udp", "tcp"]], "server": str, "timeout": NotRequired[int], "token": NotRequired[str], "verify-certificate": NotRequired[bool]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @cached_property
+                    def delete(self) -> _Delete: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def post(self) -> _Post: ...
+
+                    @property
+                    def create(self) -> _Post: ...
+
+                    @cached_property
+                    def put(self) -> _Put: ...
+
+                    @property
+                    def set(self) -> _Put: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    id: str
+
+                def __call__(self, id: str) -> Id: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_463cb77526f6.TypedDict):
+                        pass
+
+                    class Model(_Shape_463cb77526f6.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Cluster.Metrics.Server._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Metrics.Server._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Metrics.Server._Get.Model"]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def server(self) -> Server: ...
+
+            @dataclass
+            class Export:
+                @dataclass
+                class _Get:
+                    @dataclass
+                    class _Data:
+                        class TypedDict(_Shape_edea002acdb6.TypedDict):
+                            pass
+
+                        class Model(_Shape_edea002acdb6.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Cluster.Metrics.Export._Get._Data"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                    TypedDict = typing.TypedDict("TypedDict", {"data": list["ProxmoxAPI.Cluster.Metrics.Export._Get._Data.TypedDict"]})
+
+                    class Model(BaseModel):
+                        data: list["ProxmoxAPI.Cluster.Metrics.Export._Get._Data.Model"]
+                    Model.__name__ = "ProxmoxAPI.Cluster.Metrics.Export._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"history": NotRequired[bool], "local-only": NotRequired[bool], "start-time": NotRequired[int]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Cluster.Metrics.Export._Get.TypedDict": ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Cluster.Metrics.Export._Get.Model": ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def export(self) -> Export: ...
+
+            @dataclass
+            class _Get:
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list[dict[str, Any]]: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list[dict[str, Any]]: ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+
+        @cached_property
+        def metrics(self) -> Metrics: ...
+
+        @dataclass
+        class Notifications:
+            @dataclass
+            class MatcherFields:
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_7e076d4d2657.TypedDict):
+                        pass
+
+                    class Model(_Shape_7e076d4d2657.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Cluster.Notifications.MatcherFields._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Notifications.MatcherFields._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Notifications.MatcherFields._Get.Model"]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def matcher_fields(self) -> MatcherFields: ...
+
+            @dataclass
+            class MatcherFieldValues:
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_9007792d8ac7.TypedDict):
+                        pass
+
+                    class Model(_Shape_9007792d8ac7.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Cluster.Notifications.MatcherFieldValues._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Notifications.MatcherFieldValues._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Notifications.MatcherFieldValues._Get.Model"]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def matcher_field_values(self) -> MatcherFieldValues: ...
+
+            @dataclass
+            class Endpoints:
+                @dataclass
+                class Sendmail:
+                    @dataclass
+                    class Name:
+                        @dataclass
+                        class _Delete:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            name: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_72db08b30812.TypedDict):
+                                pass
+
+                            class Model(_Shape_72db08b30812.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Cluster.Notifications.Endpoints.Sendmail.Name._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            name: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Cluster.Notifications.Endpoints.Sendmail.Name._Get.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Cluster.Notifications.Endpoints.Sendmail.Name._Get.Model": ...
+
+                        @dataclass
+                        class _Put:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            name: str
+                            Params = typing.TypedDict("Params", {"author": NotRequired[str], "comment": NotRequired[str], "delete": NotRequired[list[Any]], "digest": NotRequired[str], "disable": NotRequired[bool], "from-address": NotRequired[str], "mailto": NotRequired[list[Any]], "mailto-user": NotRequired[list[Any]]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                        @cached_property
+                        def delete(self) -> _Delete: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+
+                        @cached_property
+                        def put(self) -> _Put: ...
+
+                        @property
+                        def set(self) -> _Put: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        name: str
+
+                    def __call__(self, name: str) -> Name: ...
+
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_8d4b95494c0c.TypedDict):
+                            pass
+
+                        class Model(_Shape_8d4b95494c0c.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Cluster.Notifications.Endpoints.Sendmail._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Cluster.Notifications.Endpoints.Sendmail._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Cluster.Notifications.Endpoints.Sendmail._Get.Model"]: ...
+
+                    @dataclass
+                    class _Post:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        Params = typing.TypedDict("Params", {"author": NotRequired[str], "comment": NotRequired[str], "disable": NotRequired[bool], "from-address": NotRequired[str], "mailto": NotRequired[list[Any]], "mailto-user": NotRequired[list[Any]], "name": str})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def post(self) -> _Post: ...
+
+                    @property
+                    def create(self) -> _Post: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+
+                @cached_property
+                def sendmail(self) -> Sendmail: ...
+
+                @dataclass
+                class Gotify:
+                    @dataclass
+                    class Name:
+                        @dataclass
+                        class _Delete:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            name: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_e74999d13f12.TypedDict):
+                                pass
+
+                            class Model(_Shape_e74999d13f12.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Cluster.Notifications.Endpoints.Gotify.Name._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            name: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Cluster.Notifications.Endpoints.Gotify.Name._Get.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Cluster.Notifications.Endpoints.Gotify.Name._Get.Model": ...
+
+                        @dataclass
+                        class _Put:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            name: str
+                            Params = typing.TypedDict("Params", {"comment": NotRequired[str], "delete": NotRequired[list[Any]], "digest": NotRequired[str], "disable": NotRequired[bool], "server": NotRequired[str], "token": NotRequired[str]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                        @cached_property
+                        def delete(self) -> _Delete: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+
+                        @cached_property
+                        def put(self) -> _Put: ...
+
+                        @property
+                        def set(self) -> _Put: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        name: str
+
+                    def __call__(self, name: str) -> Name: ...
+
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_d5a2e3de7e1a.TypedDict):
+                            pass
+
+                        class Model(_Shape_d5a2e3de7e1a.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Cluster.Notifications.Endpoints.Gotify._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Cluster.Notifications.Endpoints.Gotify._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Cluster.Notifications.Endpoints.Gotify._Get.Model"]: ...
+
+                    @dataclass
+                    class _Post:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        Params = typing.TypedDict("Params", {"comment": NotRequired[str], "disable": NotRequired[bool], "name": str, "server": str, "token": str})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def post(self) -> _Post: ...
+
+                    @property
+                    def create(self) -> _Post: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+
+                @cached_property
+                def gotify(self) -> Gotify: ...
+
+                @dataclass
+                class Smtp:
+                    @dataclass
+                    class Name:
+                        @dataclass
+                        class _Delete:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            name: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_e44e0648d3a1.TypedDict):
+                                pass
+
+                            class Model(_Shape_e44e0648d3a1.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Cluster.Notifications.Endpoints.Smtp.Name._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            name: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Cluster.Notifications.Endpoints.Smtp.Name._Get.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Cluster.Notifications.Endpoints.Smtp.Name._Get.Model": ...
+
+                        @dataclass
+                        class _Put:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            name: str
+                            Params = typing.TypedDict("Params", {"author": NotRequired[str], "comment": NotRequired[str], "delete": NotRequired[list[Any]], "digest": NotRequired[str], "disable": NotRequired[bool], "from-address": NotRequired[str], "mailto": NotRequired[list[Any]], "mailto-user": NotRequired[list[Any]], "mode": NotRequired[Literal["insecure", "starttls", "tls"]], "password": NotRequired[str], "port": NotRequired[int], "server": NotRequired[str], "username": NotRequired[str]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                        @cached_property
+                        def delete(self) -> _Delete: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+
+                        @cached_property
+                        def put(self) -> _Put: ...
+
+                        @property
+                        def set(self) -> _Put: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        name: str
+
+                    def __call__(self, name: str) -> Name: ...
+
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_9b7935286c62.TypedDict):
+                            pass
+
+                        class Model(_Shape_9b7935286c62.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Cluster.Notifications.Endpoints.Smtp._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Cluster.Notifications.Endpoints.Smtp._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Cluster.Notifications.Endpoints.Smtp._Get.Model"]: ...
+
+                    @dataclass
+                    class _Post:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        Params = typing.TypedDict("Params", {"author": NotRequired[str], "comment": NotRequired[str], "disable": NotRequired[bool], "from-address": str, "mailto": NotRequired[list[Any]], "mailto-user": NotRequired[list[Any]], "mode": NotRequired[Literal["insecure", "starttls", "tls"]], "name": str, "password": NotRequired[str], "port": NotRequired[int], "server": str, "username": NotRequired[str]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def post(self) -> _Post: ...
+
+                    @property
+                    def create(self) -> _Post: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+
+                @cached_property
+                def smtp(self) -> Smtp: ...
+
+                @dataclass
+                class Webhook:
+                    @dataclass
+                    class Name:
+                        @dataclass
+                        class _Delete:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            name: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_cce369b4a917.TypedDict):
+                                pass
+
+                            class Model(_Shape_cce369b4a917.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Cluster.Notifications.Endpoints.Webhook.Name._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            name: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Cluster.Notifications.Endpoints.Webhook.Name._Get.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Cluster.Notifications.Endpoints.Webhook.Name._Get.Model": ...
+
+                        @dataclass
+                        class _Put:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            name: str
+                            Params = typing.TypedDict("Params", {"body": NotRequired[str], "comment": NotRequired[str], "delete": NotRequired[list[Any]], "digest": NotRequired[str], "disable": NotRequired[bool], "header": NotRequired[list[Any]], "method": NotRequired[Literal["post", "put", "get"]], "secret": NotRequired[list[Any]], "url": NotRequired[str]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                        @cached_property
+                        def delete(self) -> _Delete: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+
+                        @cached_property
+                        def put(self) -> _Put: ...
+
+                        @property
+                        def set(self) -> _Put: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        name: str
+
+                    def __call__(self, name: str) -> Name: ...
+
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_cb704681a388.TypedDict):
+                            pass
+
+                        class Model(_Shape_cb704681a388.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Cluster.Notifications.Endpoints.Webhook._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Cluster.Notifications.Endpoints.Webhook._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Cluster.Notifications.Endpoints.Webhook._Get.Model"]: ...
+
+                    @dataclass
+                    class _Post:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        Params = typing.TypedDict("Params", {"body": NotRequired[str], "comment": NotRequired[str], "disable": NotRequired[bool], "header": NotRequired[list[Any]], "method": Literal["post", "put", "get"], "name": str, "secret": NotRequired[list[Any]], "url": str})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def post(self) -> _Post: ...
+
+                    @property
+                    def create(self) -> _Post: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+
+                @cached_property
+                def webhook(self) -> Webhook: ...
+
+                @dataclass
+                class _Get:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[dict[str, Any]]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[dict[str, Any]]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def endpoints(self) -> Endpoints: ...
+
+            @dataclass
+            class Targets:
+                @dataclass
+                class Name:
+                    @dataclass
+                    class Test:
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            name: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        name: str
+
+                    @cached_property
+                    def test(self) -> Test: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    name: str
+
+                def __call__(self, name: str) -> Name: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_4fe707541d5e.TypedDict):
+                        pass
+
+                    class Model(_Shape_4fe707541d5e.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Cluster.Notifications.Targets._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Notifications.Targets._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Notifications.Targets._Get.Model"]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def targets(self) -> Targets: ...
+
+            @dataclass
+            class Matchers:
+                @dataclass
+                class Name:
+                    @dataclass
+                    class _Delete:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        name: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_9eab753b0163.TypedDict):
+                            pass
+
+                        class Model(_Shape_9eab753b0163.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Cluster.Notifications.Matchers.Name._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        name: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> "ProxmoxAPI.Cluster.Notifications.Matchers.Name._Get.TypedDict": ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> "ProxmoxAPI.Cluster.Notifications.Matchers.Name._Get.Model": ...
+
+                    @dataclass
+                    class _Put:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        name: str
+                        Params = typing.TypedDict("Params", {"comment": NotRequired[str], "delete": NotRequired[list[Any]], "digest": NotRequired[str], "disable": NotRequired[bool], "invert-match": NotRequired[bool], "match-calendar": NotRequired[list[Any]], "match-field": NotRequired[list[Any]], "match-severity": NotRequired[list[Any]], "mode": NotRequired[Literal["all", "any"]], "target": NotRequired[list[Any]]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @cached_property
+                    def delete(self) -> _Delete: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def put(self) -> _Put: ...
+
+                    @property
+                    def set(self) -> _Put: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    name: str
+
+                def __call__(self, name: str) -> Name: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_184746e77819.TypedDict):
+                        pass
+
+                    class Model(_Shape_184746e77819.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Cluster.Notifications.Matchers._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Notifications.Matchers._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Notifications.Matchers._Get.Model"]: ...
+
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"comment": NotRequired[str], "disable": NotRequired[bool], "invert-match": NotRequired[bool], "match-calendar": NotRequired[list[Any]], "match-field": NotRequired[list[Any]], "match-severity": NotRequired[list[Any]], "mode": NotRequired[Literal["all", "any"]], "name": str, "target": NotRequired[list[Any]]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def matchers(self) -> Matchers: ...
+
+            @dataclass
+            class _Get:
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list[dict[str, Any]]: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list[dict[str, Any]]: ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+
+        @cached_property
+        def notifications(self) -> Notifications: ...
+
+        @dataclass
+        class Config:
+            @dataclass
+            class Apiversion:
+                @dataclass
+                class _Get:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> int: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> int: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def apiversion(self) -> Apiversion: ...
+
+            @dataclass
+            class Nodes:
+                @dataclass
+                class Node:
+                    @dataclass
+                    class _Delete:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @dataclass
+                    class _Post:
+                        class TypedDict(_Shape_0afd01c3d5a7.TypedDict):
+                            pass
+
+                        class Model(_Shape_0afd01c3d5a7.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Cluster.Config.Nodes.Node._Post"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"apiversion": NotRequired[int], "force": NotRequired[bool], "new_node_ip": NotRequired[str], "nodeid": NotRequired[int], "votes": NotRequired[int]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Any
+                        ) -> "ProxmoxAPI.Cluster.Config.Nodes.Node._Post.TypedDict": ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Any
+                        ) -> "ProxmoxAPI.Cluster.Config.Nodes.Node._Post.Model": ...
+
+                    @cached_property
+                    def delete(self) -> _Delete: ...
+
+                    @cached_property
+                    def post(self) -> _Post: ...
+
+                    @property
+                    def create(self) -> _Post: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                def __call__(self, node: str) -> Node: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_2ec0018584cb.TypedDict):
+                        pass
+
+                    class Model(_Shape_2ec0018584cb.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Cluster.Config.Nodes._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Config.Nodes._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Config.Nodes._Get.Model"]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def nodes(self) -> Nodes: ...
+
+            @dataclass
+            class Join:
+                @dataclass
+                class _Get:
+                    @dataclass
+                    class _Nodelist:
+                        class TypedDict(_Shape_728fd6efe35e.TypedDict):
+                            pass
+
+                        class Model(_Shape_728fd6efe35e.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Cluster.Config.Join._Get._Nodelist"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                    TypedDict = typing.TypedDict("TypedDict", {"config_digest": str, "nodelist": list["ProxmoxAPI.Cluster.Config.Join._Get._Nodelist.TypedDict"], "preferred_node": str, "totem": dict[str, Any]})
+
+                    class Model(BaseModel):
+                        config_digest: str
+                        nodelist: list["ProxmoxAPI.Cluster.Config.Join._Get._Nodelist.Model"]
+                        preferred_node: str
+                        totem: dict[str, Any]
+                    Model.__name__ = "ProxmoxAPI.Cluster.Config.Join._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"node": NotRequired[str]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Cluster.Config.Join._Get.TypedDict": ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Cluster.Config.Join._Get.Model": ...
+
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"fingerprint": str, "force": NotRequired[bool], "hostname": str, "nodeid": NotRequired[int], "password": str, "votes": NotRequired[int]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Any
+                    ) -> str: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Any
+                    ) -> str: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def join(self) -> Join: ...
+
+            @dataclass
+            class Totem:
+                @dataclass
+                class _Get:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> dict[str, Any]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> dict[str, Any]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def totem(self) -> Totem: ...
+
+            @dataclass
+            class Qdevice:
+                @dataclass
+                class _Get:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> dict[str, Any]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> dict[str, Any]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def qdevice(self) -> Qdevice: ...
+
+            @dataclass
+            class _Get:
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list[dict[str, Any]]: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list[dict[str, Any]]: ...
+
+            @dataclass
+            class _Post:
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {"clustername": str, "nodeid": NotRequired[int], "votes": NotRequired[int]})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Any
+                ) -> str: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Any
+                ) -> str: ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+
+            @cached_property
+            def post(self) -> _Post: ...
+
+            @property
+            def create(self) -> _Post: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+
+        @cached_property
+        def config(self) -> Config: ...
+
+        @dataclass
+        class Firewall:
+            @dataclass
+            class Groups:
+                @dataclass
+                class Group:
+                    @dataclass
+                    class Pos:
+                        @dataclass
+                        class _Delete:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            group: str
+                            pos: int
+                            Params = typing.TypedDict("Params", {"digest": NotRequired[str]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_7e5fdbf08cb2.TypedDict):
+                                pass
+
+                            class Model(_Shape_7e5fdbf08cb2.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Cluster.Firewall.Groups.Group.Pos._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            group: str
+                            pos: int
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Cluster.Firewall.Groups.Group.Pos._Get.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Cluster.Firewall.Groups.Group.Pos._Get.Model": ...
+
+                        @dataclass
+                        class _Put:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            group: str
+                            pos: int
+                            Params = typing.TypedDict("Params", {"action": NotRequired[str], "comment": NotRequired[str], "delete": NotRequired[str], "dest": NotRequired[str], "digest": NotRequired[str], "dport": NotRequired[str], "enable": NotRequired[int], "icmp-type": NotRequired[str], "iface": NotRequired[str], "log": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]], "macro": NotRequired[str], "moveto": NotRequired[int], "proto": NotRequired[str], "source": NotRequired[str], "sport": NotRequired[str], "type": NotRequired[Literal["in", "out", "forward", "group"]]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                        @cached_property
+                        def delete(self) -> _Delete: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+
+                        @cached_property
+                        def put(self) -> _Put: ...
+
+                        @property
+                        def set(self) -> _Put: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        group: str
+                        pos: int
+
+                    def __call__(self, pos: int) -> Pos: ...
+
+                    @dataclass
+                    class _Delete:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        group: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_5877922db5f2.TypedDict):
+                            pass
+
+                        class Model(_Shape_5877922db5f2.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Cluster.Firewall.Groups.Group._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        group: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Cluster.Firewall.Groups.Group._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Cluster.Firewall.Groups.Group._Get.Model"]: ...
+
+                    @dataclass
+                    class _Post:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        group: str
+                        Params = typing.TypedDict("Params", {"action": str, "comment": NotRequired[str], "dest": NotRequired[str], "digest": NotRequired[str], "dport": NotRequired[str], "enable": NotRequired[int], "icmp-type": NotRequired[str], "iface": NotRequired[str], "log": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]], "macro": NotRequired[str], "pos": NotRequired[int], "proto": NotRequired[str], "source": NotRequired[str], "sport": NotRequired[str], "type": Literal["in", "out", "forward", "group"]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @cached_property
+                    def delete(self) -> _Delete: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def post(self) -> _Post: ...
+
+                    @property
+                    def create(self) -> _Post: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    group: str
+
+                def __call__(self, group: str) -> Group: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_a4d6230c98e6.TypedDict):
+                        pass
+
+                    class Model(_Shape_a4d6230c98e6.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Cluster.Firewall.Groups._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Firewall.Groups._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Firewall.Groups._Get.Model"]: ...
+
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"comment": NotRequired[str], "digest": NotRequired[str], "group": str, "rename": NotRequired[str]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def groups(self) -> Groups: ...
+
+            @dataclass
+            class Rules:
+                @dataclass
+                class Pos:
+                    @dataclass
+                    class _Delete:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        pos: int
+                        Params = typing.TypedDict("Params", {"digest": NotRequired[str]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_7e5fdbf08cb2.TypedDict):
+                            pass
+
+                        class Model(_Shape_7e5fdbf08cb2.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Cluster.Firewall.Rules.Pos._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        pos: int
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> "ProxmoxAPI.Cluster.Firewall.Rules.Pos._Get.TypedDict": ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> "ProxmoxAPI.Cluster.Firewall.Rules.Pos._Get.Model": ...
+
+                    @dataclass
+                    class _Put:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        pos: int
+                        Params = typing.TypedDict("Params", {"action": NotRequired[str], "comment": NotRequired[str], "delete": NotRequired[str], "dest": NotRequired[str], "digest": NotRequired[str], "dport": NotRequired[str], "enable": NotRequired[int], "icmp-type": NotRequired[str], "iface": NotRequired[str], "log": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]], "macro": NotRequired[str], "moveto": NotRequired[int], "proto": NotRequired[str], "source": NotRequired[str], "sport": NotRequired[str], "type": NotRequired[Literal["in", "out", "forward", "group"]]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @cached_property
+                    def delete(self) -> _Delete: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def put(self) -> _Put: ...
+
+                    @property
+                    def set(self) -> _Put: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    pos: int
+
+                def __call__(self, pos: int) -> Pos: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_5877922db5f2.TypedDict):
+                        pass
+
+                    class Model(_Shape_5877922db5f2.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Cluster.Firewall.Rules._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Firewall.Rules._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Firewall.Rules._Get.Model"]: ...
+
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"action": str, "comment": NotRequired[str], "dest": NotRequired[str], "digest": NotRequired[str], "dport": NotRequired[str], "enable": NotRequired[int], "icmp-type": NotRequired[str], "iface": NotRequired[str], "log": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]], "macro": NotRequired[str], "pos": NotRequired[int], "proto": NotRequired[str], "source": NotRequired[str], "sport": NotRequired[str], "type": Literal["in", "out", "forward", "group"]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def rules(self) -> Rules: ...
+
+            @dataclass
+            class Ipset:
+                @dataclass
+                class Name:
+                    @dataclass
+                    class Cidr:
+                        @dataclass
+                        class _Delete:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            name: str
+                            cidr: str
+                            Params = typing.TypedDict("Params", {"digest": NotRequired[str]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                        @dataclass
+                        class _Get:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            name: str
+                            cidr: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> dict[str, Any]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> dict[str, Any]: ...
+
+                        @dataclass
+                        class _Put:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            name: str
+                            cidr: str
+                            Params = typing.TypedDict("Params", {"comment": NotRequired[str], "digest": NotRequired[str], "nomatch": NotRequired[bool]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                        @cached_property
+                        def delete(self) -> _Delete: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+
+                        @cached_property
+                        def put(self) -> _Put: ...
+
+                        @property
+                        def set(self) -> _Put: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        name: str
+                        cidr: str
+
+                    def __call__(self, cidr: str) -> Cidr: ...
+
+                    @dataclass
+                    class _Delete:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        name: str
+                        Params = typing.TypedDict("Params", {"force": NotRequired[bool]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_f6b6fb110821.TypedDict):
+                            pass
+
+                        class Model(_Shape_f6b6fb110821.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Cluster.Firewall.Ipset.Name._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        name: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Cluster.Firewall.Ipset.Name._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Cluster.Firewall.Ipset.Name._Get.Model"]: ...
+
+                    @dataclass
+                    class _Post:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        name: str
+                        Params = typing.TypedDict("Params", {"cidr": str, "comment": NotRequired[str], "nomatch": NotRequired[bool]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @cached_property
+                    def delete(self) -> _Delete: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def post(self) -> _Post: ...
+
+                    @property
+                    def create(self) -> _Post: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    name: str
+
+                def __call__(self, name: str) -> Name: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_709bdb2a6f84.TypedDict):
+                        pass
+
+                    class Model(_Shape_709bdb2a6f84.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Cluster.Firewall.Ipset._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Firewall.Ipset._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Firewall.Ipset._Get.Model"]: ...
+
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"comment": NotRequired[str], "digest": NotRequired[str], "name": str, "rename": NotRequired[str]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def ipset(self) -> Ipset: ...
+
+            @dataclass
+            class Aliases:
+                @dataclass
+                class Name:
+                    @dataclass
+                    class _Delete:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        name: str
+                        Params = typing.TypedDict("Params", {"digest": NotRequired[str]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @dataclass
+                    class _Get:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        name: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                    @dataclass
+                    class _Put:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        name: str
+                        Params = typing.TypedDict("Params", {"cidr": str, "comment": NotRequired[str], "digest": NotRequired[str], "rename": NotRequired[str]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @cached_property
+                    def delete(self) -> _Delete: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def put(self) -> _Put: ...
+
+                    @property
+                    def set(self) -> _Put: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    name: str
+
+                def __call__(self, name: str) -> Name: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_af6cfdcc96b3.TypedDict):
+                        pass
+
+                    class Model(_Shape_af6cfdcc96b3.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Cluster.Firewall.Aliases._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Firewall.Aliases._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Firewall.Aliases._Get.Model"]: ...
+
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"cidr": str, "comment": NotRequired[str], "name": str})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def aliases(self) -> Aliases: ...
+
+            @dataclass
+            class Options:
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_f2025d055959.TypedDict):
+                        pass
+
+                    class Model(_Shape_f2025d055959.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Cluster.Firewall.Options._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Cluster.Firewall.Options._Get.TypedDict": ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Cluster.Firewall.Options._Get.Model": ...
+
+                @dataclass
+                class _Put:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"delete": NotRequired[str], "digest": NotRequired[str], "ebtables": NotRequired[bool], "enable": NotRequired[int], "log_ratelimit": NotRequired[str], "policy_forward": NotRequired[Literal["ACCEPT", "DROP"]], "policy_in": NotRequired[Literal["ACCEPT", "REJECT", "DROP"]], "policy_out": NotRequired[Literal["ACCEPT", "REJECT", "DROP"]]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def put(self) -> _Put: ...
+
+                @property
+                def set(self) -> _Put: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def options(self) -> Options: ...
+
+            @dataclass
+            class Macros:
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_fb0f0ac4229c.TypedDict):
+                        pass
+
+                    class Model(_Shape_fb0f0ac4229c.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Cluster.Firewall.Macros._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Firewall.Macros._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Firewall.Macros._Get.Model"]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def macros(self) -> Macros: ...
+
+            @dataclass
+            class Refs:
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_3ff2000df841.TypedDict):
+                        pass
+
+                    class Model(_Shape_3ff2000df841.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Cluster.Firewall.Refs._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"type": NotRequired[Literal["alias", "ipset"]]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Firewall.Refs._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Firewall.Refs._Get.Model"]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def refs(self) -> Refs: ...
+
+            @dataclass
+            class _Get:
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list[dict[str, Any]]: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list[dict[str, Any]]: ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+
+        @cached_property
+        def firewall(self) -> Firewall: ...
+
+        @dataclass
+        class Backup:
+            @dataclass
+            class Id:
+                @dataclass
+                class IncludedVolumes:
+                    @dataclass
+                    class _Get:
+                        @dataclass
+                        class _Children:
+                            @dataclass
+                            class _Children:
+                                class TypedDict(_Shape_182f498e7915.TypedDict):
+                                    pass
+
+                                class Model(_Shape_182f498e7915.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Cluster.Backup.Id.IncludedVolumes._Get._Children._Children"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                id: str
+                            TypedDict = typing.TypedDict("TypedDict", {"children": NotRequired[list["ProxmoxAPI.Cluster.Backup.Id.IncludedVolumes._Get._Children._Children.TypedDict"]], "id": int, "name": NotRequired[str], "type": Literal["qemu", "lxc", "unknown"]})
+
+                            class Model(BaseModel):
+                                children: Optional[list["ProxmoxAPI.Cluster.Backup.Id.IncludedVolumes._Get._Children._Children.Model"]] = None
+                                id: int
+                                name: Optional[str] = None
+                                type: Literal["qemu", "lxc", "unknown"]
+                            Model.__name__ = "ProxmoxAPI.Cluster.Backup.Id.IncludedVolumes._Get._Children"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            id: str
+                        TypedDict = typing.TypedDict("TypedDict", {"children": list["ProxmoxAPI.Cluster.Backup.Id.IncludedVolumes._Get._Children.TypedDict"]})
+
+                        class Model(BaseModel):
+                            children: list["ProxmoxAPI.Cluster.Backup.Id.IncludedVolumes._Get._Children.Model"]
+                        Model.__name__ = "ProxmoxAPI.Cluster.Backup.Id.IncludedVolumes._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        id: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> "ProxmoxAPI.Cluster.Backup.Id.IncludedVolumes._Get.TypedDict": ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> "ProxmoxAPI.Cluster.Backup.Id.IncludedVolumes._Get.Model": ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    id: str
+
+                @cached_property
+                def included_volumes(self) -> IncludedVolumes: ...
+
+                @dataclass
+                class _Delete:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    id: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @dataclass
+                class _Get:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    id: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> dict[str, Any]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> dict[str, Any]: ...
+
+                @dataclass
+                class _Put:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    id: str
+                    Params = typing.TypedDict("Params", {"all": NotRequired[bool], "bwlimit": NotRequired[int], "comment": NotRequired[str], "compress": NotRequired[Literal["0", "1", "gzip", "lzo", "zstd"]], "delete": NotRequired[str], "dow": NotRequired[str], "dumpdir": NotRequired[str], "enabled": NotRequired[bool], "exclude": NotRequired[str], "exclude-path": NotRequired[list[Any]], "fleecing": NotRequired[str], "ionice": NotRequired[int], "lockwait": NotRequired[int], "mailnotification": NotRequired[Literal["always", "failure"]], "mailto": NotRequired[str], "maxfiles": NotRequired[int], "mode": NotRequired[Literal["snapshot", "suspend", "stop"]], "node": NotRequired[str], "notes-template": NotRequired[str], "notification-mode": NotRequired[Literal["auto", "legacy-sendmail", "notification-system"]], "notification-policy": NotRequired[Literal["always", "failure", "never"]], "notification-target": NotRequired[str], "pbs-change-detection-mode": NotRequired[Literal["legacy", "data", "metadata"]], "performance": NotRequired[str], "pigz": NotRequired[int], "pool": NotRequired[str], "protected": NotRequired[bool], "prune-backups": NotRequired[str], "quiet": NotRequired[bool], "remove": NotRequired[bool], "repeat-missed": NotRequired[bool], "schedule": NotRequired[str], "script": NotRequired[str], "starttime": NotRequired[str], "stdexcludes": NotRequired[bool], "stop": NotRequired[bool], "stopwait": NotRequired[int], "storage": NotRequired[str], "tmpdir": NotRequired[str], "vmid": NotRequired[str], "zstd": NotRequired[int]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @cached_property
+                def delete(self) -> _Delete: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def put(self) -> _Put: ...
+
+                @property
+                def set(self) -> _Put: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                id: str
+
+            def __call__(self, id: str) -> Id: ...
+
+            @dataclass
+            class _Get:
+                class TypedDict(_Shape_702e4ae1eff6.TypedDict):
+                    pass
+
+                class Model(_Shape_702e4ae1eff6.Model):
+                    pass
+                Model.__name__ = "ProxmoxAPI.Cluster.Backup._Get"
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list["ProxmoxAPI.Cluster.Backup._Get.TypedDict"]: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list["ProxmoxAPI.Cluster.Backup._Get.Model"]: ...
+
+            @dataclass
+            class _Post:
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {"all": NotRequired[bool], "bwlimit": NotRequired[int], "comment": NotRequired[str], "compress": NotRequired[Literal["0", "1", "gzip", "lzo", "zstd"]], "dow": NotRequired[str], "dumpdir": NotRequired[str], "enabled": NotRequired[bool], "exclude": NotRequired[str], "exclude-path": NotRequired[list[Any]], "fleecing": NotRequired[str], "id": NotRequired[str], "ionice": NotRequired[int], "lockwait": NotRequired[int], "mailnotification": NotRequired[Literal["always", "failure"]], "mailto": NotRequired[str], "maxfiles": NotRequired[int], "mode": NotRequired[Literal["snapshot", "suspend", "stop"]], "node": NotRequired[str], "notes-template": NotRequired[str], "notification-mode": NotRequired[Literal["auto", "legacy-sendmail", "notification-system"]], "notification-policy": NotRequired[Literal["always", "failure", "never"]], "notification-target": NotRequired[str], "pbs-change-detection-mode": NotRequired[Literal["legacy", "data", "metadata"]], "performance": NotRequired[str], "pigz": NotRequired[int], "pool": NotRequired[str], "protected": NotRequired[bool], "prune-backups": NotRequired[str], "quiet": NotRequired[bool], "remove": NotRequired[bool], "repeat-missed": NotRequired[bool], "schedule": NotRequired[str], "script": NotRequired[str], "starttime": NotRequired[str], "stdexcludes": NotRequired[bool], "stop": NotRequired[bool], "stopwait": NotRequired[int], "storage": NotRequired[str], "tmpdir": NotRequired[str], "vmid": NotRequired[str], "zstd": NotRequired[int]})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> None: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> None: ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+
+            @cached_property
+            def post(self) -> _Post: ...
+
+            @property
+            def create(self) -> _Post: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+
+        @cached_property
+        def backup(self) -> Backup: ...
+
+        @dataclass
+        class BackupInfo:
+            @dataclass
+            class NotBackedUp:
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_b52d36c601b1.TypedDict):
+                        pass
+
+                    class Model(_Shape_b52d36c601b1.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Cluster.BackupInfo.NotBackedUp._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.BackupInfo.NotBackedUp._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.BackupInfo.NotBackedUp._Get.Model"]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def not_backed_up(self) -> NotBackedUp: ...
+
+            @dataclass
+            class _Get:
+                class TypedDict(_Shape_21168c7817dc.TypedDict):
+                    pass
+
+                class Model(_Shape_21168c7817dc.Model):
+                    pass
+                Model.__name__ = "ProxmoxAPI.Cluster.BackupInfo._Get"
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list["ProxmoxAPI.Cluster.BackupInfo._Get.TypedDict"]: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list["ProxmoxAPI.Cluster.BackupInfo._Get.Model"]: ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+
+        @cached_property
+        def backup_info(self) -> BackupInfo: ...
+
+        @dataclass
+        class Ha:
+            @dataclass
+            class Resources:
+                @dataclass
+                class Sid:
+                    @dataclass
+                    class Migrate:
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            sid: str
+                            Params = typing.TypedDict("Params", {"node": str})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        sid: str
+
+                    @cached_property
+                    def migrate(self) -> Migrate: ...
+
+                    @dataclass
+                    class Relocate:
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            sid: str
+                            Params = typing.TypedDict("Params", {"node": str})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        sid: str
+
+                    @cached_property
+                    def relocate(self) -> Relocate: ...
+
+                    @dataclass
+                    class _Delete:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        sid: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_b0fbd9b90b6c.TypedDict):
+                            pass
+
+                        class Model(_Shape_b0fbd9b90b6c.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Cluster.Ha.Resources.Sid._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        sid: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> "ProxmoxAPI.Cluster.Ha.Resources.Sid._Get.TypedDict": ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> "ProxmoxAPI.Cluster.Ha.Resources.Sid._Get.Model": ...
+
+                    @dataclass
+                    class _Put:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        sid: str
+                        Params = typing.TypedDict("Params", {"comment": NotRequired[str], "delete": NotRequired[str], "digest": NotRequired[str], "group": NotRequired[str], "max_relocate": NotRequired[int], "max_restart": NotRequired[int], "state": NotRequired[Literal["started", "stopped", "enabled", "disabled", "ignored"]]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @cached_property
+                    def delete(self) -> _Delete: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def put(self) -> _Put: ...
+
+                    @property
+                    def set(self) -> _Put: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    sid: str
+
+                def __call__(self, sid: str) -> Sid: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_13540329cbed.TypedDict):
+                        pass
+
+                    class Model(_Shape_13540329cbed.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Cluster.Ha.Resources._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"type": NotRequired[Literal["ct", "vm"]]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Ha.Resources._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Ha.Resources._Get.Model"]: ...
+
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"comment": NotRequired[str], "group": NotRequired[str], "max_relocate": NotRequired[int], "max_restart": NotRequired[int], "sid": str, "state": NotRequired[Literal["started", "stopped", "enabled", "disabled", "ignored"]], "type": NotRequired[Literal["ct", "vm"]]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def resources(self) -> Resources: ...
+
+            @dataclass
+            class Groups:
+                @dataclass
+                class Group:
+                    @dataclass
+                    class _Delete:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        group: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @dataclass
+                    class _Get:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        group: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                    @dataclass
+                    class _Put:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        group: str
+                        Params = typing.TypedDict("Params", {"comment": NotRequired[str], "delete": NotRequired[str], "digest": NotRequired[str], "nodes": NotRequired[str], "nofailback": NotRequired[bool], "restricted": NotRequired[bool]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @cached_property
+                    def delete(self) -> _Delete: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def put(self) -> _Put: ...
+
+                    @property
+                    def set(self) -> _Put: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    group: str
+
+                def __call__(self, group: str) -> Group: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_b54c46139989.TypedDict):
+                        pass
+
+                    class Model(_Shape_b54c46139989.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Cluster.Ha.Groups._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Ha.Groups._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Ha.Groups._Get.Model"]: ...
+
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"comment": NotRequired[str], "group": str, "nodes": str, "nofailback": NotRequired[bool], "restricted": NotRequired[bool], "type": NotRequired[Literal["group"]]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def groups(self) -> Groups: ...
+
+            @dataclass
+            class Status:
+                @dataclass
+                class Current:
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_05f3a7af0b41.TypedDict):
+                            pass
+
+                        class Model(_Shape_05f3a7af0b41.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Cluster.Ha.Status.Current._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Cluster.Ha.Status.Current._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Cluster.Ha.Status.Current._Get.Model"]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+
+                @cached_property
+                def current(self) -> Current: ...
+
+                @dataclass
+                class ManagerStatus:
+                    @dataclass
+                    class _Get:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+
+                @cached_property
+                def manager_status(self) -> ManagerStatus: ...
+
+                @dataclass
+                class _Get:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[dict[str, Any]]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[dict[str, Any]]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def status(self) -> Status: ...
+
+            @dataclass
+            class _Get:
+                class TypedDict(_Shape_702e4ae1eff6.TypedDict):
+                    pass
+
+                class Model(_Shape_702e4ae1eff6.Model):
+                    pass
+                Model.__name__ = "ProxmoxAPI.Cluster.Ha._Get"
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list["ProxmoxAPI.Cluster.Ha._Get.TypedDict"]: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list["ProxmoxAPI.Cluster.Ha._Get.Model"]: ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+
+        @cached_property
+        def ha(self) -> Ha: ...
+
+        @dataclass
+        class Acme:
+            @dataclass
+            class Plugins:
+                @dataclass
+                class Id:
+                    @dataclass
+                    class _Delete:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        id: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @dataclass
+                    class _Get:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        id: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                    @dataclass
+                    class _Put:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        id: str
+                        Params = typing.TypedDict("Params", {"api": NotRequired[Literal["1984hosting", "acmedns", "acmeproxy", "active24", "ad", "ali", "alviy", "anx", "artfiles", "arvan", "aurora", "autodns", "aws", "azion", "azure", "bookmyname", "bunny", "cf", "clouddns", "cloudns", "cn", "conoha", "constellix", "cpanel", "curanet", "cyon", "da", "ddnss", "desec", "df", "dgon", "dnsexit", "dnshome", "dnsimple", "dnsservices", "doapi", "domeneshop", "dp", "dpi", "dreamhost", "duckdns", "durabledns", "dyn", "dynu", "dynv6", "easydns", "edgedns", "euserv", "exoscale", "fornex", "freedns", "gandi_livedns", "gcloud", "gcore", "gd", "geoscaling", "googledomains", "he", "hetzner", "hexonet", "hostingde", "huaweicloud", "infoblox", "infomaniak", "internetbs", "inwx", "ionos", "ionos_cloud", "ipv64", "ispconfig", "jd", "joker", "kappernet", "kas", "kinghost", "knot", "la", "leaseweb", "lexicon", "limacity", "linode", "linode_v4", "loopia", "lua", "maradns", "me", "miab", "misaka", "myapi", "mydevil", "mydnsjp", "mythic_beasts", "namecheap", "namecom", "namesilo", "nanelo", "nederhost", "neodigit", "netcup", "netlify", "nic", "njalla", "nm", "nsd", "nsone", "nsupdate", "nw", "oci", "omglol", "one", "online", "openprovider", "openstack", "opnsense", "ovh", "pdns", "pleskxml", "pointhq", "porkbun", "rackcorp", "rackspace", "rage4", "rcode0", "regru", "scaleway", "schlundtech", "selectel", "selfhost", "servercow", "simply", "technitium", "tele3", "tencent", "timeweb", "transip", "udr", "ultra", "unoeuro", "variomedia", "veesp", "vercel", "vscale", "vultr", "websupport", "west_cn", "world4you", "yandex360", "yc", "zilore", "zone", "zoneedit", "zonomi"]], "data": NotRequired[str], "delete": NotRequired[str], "digest": NotRequired[str], "disable": NotRequired[bool], "nodes": NotRequired[str], "validation-delay": NotRequired[int]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @cached_property
+                    def delete(self) -> _Delete: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def put(self) -> _Put: ...
+
+                    @property
+                    def set(self) -> _Put: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    id: str
+
+                def __call__(self, id: str) -> Id: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_55277d366b6f.TypedDict):
+                        pass
+
+                    class Model(_Shape_55277d366b6f.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Cluster.Acme.Plugins._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"type": NotRequired[Literal["dns", "standalone"]]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Acme.Plugins._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Acme.Plugins._Get.Model"]: ...
+
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"api": NotRequired[Literal["1984hosting", "acmedns", "acmeproxy", "active24", "ad", "ali", "alviy", "anx", "artfiles", "arvan", "aurora", "autodns", "aws", "azion", "azure", "bookmyname", "bunny", "cf", "clouddns", "cloudns", "cn", "conoha", "constellix", "cpanel", "curanet", "cyon", "da", "ddnss", "desec", "df", "dgon", "dnsexit", "dnshome", "dnsimple", "dnsservices", "doapi", "domeneshop", "dp", "dpi", "dreamhost", "duckdns", "durabledns", "dyn", "dynu", "dynv6", "easydns", "edgedns", "euserv", "exoscale", "fornex", "freedns", "gandi_livedns", "gcloud", "gcore", "gd", "geoscaling", "googledomains", "he", "hetzner", "hexonet", "hostingde", "huaweicloud", "infoblox", "infomaniak", "internetbs", "inwx", "ionos", "ionos_cloud", "ipv64", "ispconfig", "jd", "joker", "kappernet", "kas", "kinghost", "knot", "la", "leaseweb", "lexicon", "limacity", "linode", "linode_v4", "loopia", "lua", "maradns", "me", "miab", "misaka", "myapi", "mydevil", "mydnsjp", "mythic_beasts", "namecheap", "namecom", "namesilo", "nanelo", "nederhost", "neodigit", "netcup", "netlify", "nic", "njalla", "nm", "nsd", "nsone", "nsupdate", "nw", "oci", "omglol", "one", "online", "openprovider", "openstack", "opnsense", "ovh", "pdns", "pleskxml", "pointhq", "porkbun", "rackcorp", "rackspace", "rage4", "rcode0", "regru", "scaleway", "schlundtech", "selectel", "selfhost", "servercow", "simply", "technitium", "tele3", "tencent", "timeweb", "transip", "udr", "ultra", "unoeuro", "variomedia", "veesp", "vercel", "vscale", "vultr", "websupport", "west_cn", "world4you", "yandex360", "yc", "zilore", "zone", "zoneedit", "zonomi"]], "data": NotRequired[str], "disable": NotRequired[bool], "id": str, "nodes": NotRequired[str], "type": Literal["dns", "standalone"], "validation-delay": NotRequired[int]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def plugins(self) -> Plugins: ...
+
+            @dataclass
+            class Account:
+                @dataclass
+                class Name:
+                    @dataclass
+                    class _Delete:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        name: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_556bfff24545.TypedDict):
+                            pass
+
+                        class Model(_Shape_556bfff24545.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Cluster.Acme.Account.Name._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        name: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> "ProxmoxAPI.Cluster.Acme.Account.Name._Get.TypedDict": ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> "ProxmoxAPI.Cluster.Acme.Account.Name._Get.Model": ...
+
+                    @dataclass
+                    class _Put:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        name: str
+                        Params = typing.TypedDict("Params", {"contact": NotRequired[str]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                    @cached_property
+                    def delete(self) -> _Delete: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def put(self) -> _Put: ...
+
+                    @property
+                    def set(self) -> _Put: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    name: str
+
+                def __call__(self, name: str) -> Name: ...
+
+                @dataclass
+                class _Get:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[dict[str, Any]]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[dict[str, Any]]: ...
+
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"contact": str, "directory": NotRequired[str], "eab-hmac-key": NotRequired[str], "eab-kid": NotRequired[str], "name": NotRequired[str], "tos_url": NotRequired[str]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> str: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> str: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def account(self) -> Account: ...
+
+            @dataclass
+            class Tos:
+                @dataclass
+                class _Get:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"directory": NotRequired[str]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> str: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> str: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def tos(self) -> Tos: ...
+
+            @dataclass
+            class Meta:
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_828eb08e8829.TypedDict):
+                        pass
+
+                    class Model(_Shape_828eb08e8829.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Cluster.Acme.Meta._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"directory": NotRequired[str]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Cluster.Acme.Meta._Get.TypedDict": ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Cluster.Acme.Meta._Get.Model": ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def meta(self) -> Meta: ...
+
+            @dataclass
+            class Directories:
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_96a6222a23e9.TypedDict):
+                        pass
+
+                    class Model(_Shape_96a6222a23e9.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Cluster.Acme.Directories._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Acme.Directories._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Acme.Directories._Get.Model"]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def directories(self) -> Directories: ...
+
+            @dataclass
+            class ChallengeSchema:
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_37b1d34686c6.TypedDict):
+                        pass
+
+                    class Model(_Shape_37b1d34686c6.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Cluster.Acme.ChallengeSchema._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Acme.ChallengeSchema._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Acme.ChallengeSchema._Get.Model"]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def challenge_schema(self) -> ChallengeSchema: ...
+
+            @dataclass
+            class _Get:
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list[dict[str, Any]]: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list[dict[str, Any]]: ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+
+        @cached_property
+        def acme(self) -> Acme: ...
+
+        @dataclass
+        class Ceph:
+            @dataclass
+            class Metadata:
+                @dataclass
+                class _Get:
+                    @dataclass
+                    class _Mds:
+                        @dataclass
+                        class _Id:
+                            class TypedDict(_Shape_f7ba3b1bf24d.TypedDict):
+                                pass
+
+                            class Model(_Shape_f7ba3b1bf24d.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Cluster.Ceph.Metadata._Get._Mds._Id"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                        TypedDict = typing.TypedDict("TypedDict", {"{id}": "ProxmoxAPI.Cluster.Ceph.Metadata._Get._Mds._Id.TypedDict"})
+
+                        class Model(BaseModel):
+                            id: "ProxmoxAPI.Cluster.Ceph.Metadata._Get._Mds._Id.Model" = pydantic.Field(alias="{id}")
+                        Model.__name__ = "ProxmoxAPI.Cluster.Ceph.Metadata._Get._Mds"
+                        proxmox_api: ProxmoxerProxmoxAPI
+
+                    @dataclass
+                    class _Mgr:
+                        @dataclass
+                        class _Id:
+                            class TypedDict(_Shape_f7ba3b1bf24d.TypedDict):
+                                pass
+
+                            class Model(_Shape_f7ba3b1bf24d.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Cluster.Ceph.Metadata._Get._Mgr._Id"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                        TypedDict = typing.TypedDict("TypedDict", {"{id}": "ProxmoxAPI.Cluster.Ceph.Metadata._Get._Mgr._Id.TypedDict"})
+
+                        class Model(BaseModel):
+                            id: "ProxmoxAPI.Cluster.Ceph.Metadata._Get._Mgr._Id.Model" = pydantic.Field(alias="{id}")
+                        Model.__name__ = "ProxmoxAPI.Cluster.Ceph.Metadata._Get._Mgr"
+                        proxmox_api: ProxmoxerProxmoxAPI
+
+                    @dataclass
+                    class _Mon:
+                        @dataclass
+                        class _Id:
+                            class TypedDict(_Shape_0614073e3be8.TypedDict):
+                                pass
+
+                            class Model(_Shape_0614073e3be8.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Cluster.Ceph.Metadata._Get._Mon._Id"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                        TypedDict = typing.TypedDict("TypedDict", {"{id}": "ProxmoxAPI.Cluster.Ceph.Metadata._Get._Mon._Id.TypedDict"})
+
+                        class Model(BaseModel):
+                            id: "ProxmoxAPI.Cluster.Ceph.Metadata._Get._Mon._Id.Model" = pydantic.Field(alias="{id}")
+                        Model.__name__ = "ProxmoxAPI.Cluster.Ceph.Metadata._Get._Mon"
+                        proxmox_api: ProxmoxerProxmoxAPI
+
+                    @dataclass
+                    class _Node:
+                        @dataclass
+                        class _Node:
+                            @dataclass
+                            class _Version:
+                                class TypedDict(_Shape_b11033e1fa8d.TypedDict):
+                                    pass
+
+                                class Model(_Shape_b11033e1fa8d.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Cluster.Ceph.Metadata._Get._Node._Node._Version"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                            TypedDict = typing.TypedDict("TypedDict", {"buildcommit": str, "version": "ProxmoxAPI.Cluster.Ceph.Metadata._Get._Node._Node._Version.TypedDict"})
+
+                            class Model(BaseModel):
+                                buildcommit: str
+                                version: "ProxmoxAPI.Cluster.Ceph.Metadata._Get._Node._Node._Version.Model"
+                            Model.__name__ = "ProxmoxAPI.Cluster.Ceph.Metadata._Get._Node._Node"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                        TypedDict = typing.TypedDict("TypedDict", {"{node}": "ProxmoxAPI.Cluster.Ceph.Metadata._Get._Node._Node.TypedDict"})
+
+                        class Model(BaseModel):
+                            node: "ProxmoxAPI.Cluster.Ceph.Metadata._Get._Node._Node.Model" = pydantic.Field(alias="{node}")
+                        Model.__name__ = "ProxmoxAPI.Cluster.Ceph.Metadata._Get._Node"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                    TypedDict = typing.TypedDict("TypedDict", {"mds": "ProxmoxAPI.Cluster.Ceph.Metadata._Get._Mds.TypedDict", "mgr": "ProxmoxAPI.Cluster.Ceph.Metadata._Get._Mgr.TypedDict", "mon": "ProxmoxAPI.Cluster.Ceph.Metadata._Get._Mon.TypedDict", "node": "ProxmoxAPI.Cluster.Ceph.Metadata._Get._Node.TypedDict", "osd": list[Any]})
+
+                    class Model(BaseModel):
+                        mds: "ProxmoxAPI.Cluster.Ceph.Metadata._Get._Mds.Model"
+                        mgr: "ProxmoxAPI.Cluster.Ceph.Metadata._Get._Mgr.Model"
+                        mon: "ProxmoxAPI.Cluster.Ceph.Metadata._Get._Mon.Model"
+                        node: "ProxmoxAPI.Cluster.Ceph.Metadata._Get._Node.Model"
+                        osd: list[Any]
+                    Model.__name__ = "ProxmoxAPI.Cluster.Ceph.Metadata._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"scope": NotRequired[Literal["all", "versions"]]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Cluster.Ceph.Metadata._Get.TypedDict": ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Cluster.Ceph.Metadata._Get.Model": ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def metadata(self) -> Metadata: ...
+
+            @dataclass
+            class Status:
+                @dataclass
+                class _Get:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> dict[str, Any]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> dict[str, Any]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def status(self) -> Status: ...
+
+            @dataclass
+            class Flags:
+                @dataclass
+                class Flag:
+                    @dataclass
+                    class _Get:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        flag: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> bool: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> bool: ...
+
+                    @dataclass
+                    class _Put:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        flag: str
+                        Params = typing.TypedDict("Params", {"value": bool})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def put(self) -> _Put: ...
+
+                    @property
+                    def set(self) -> _Put: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    flag: str
+
+                def __call__(self, flag: str) -> Flag: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_0e3824cb199e.TypedDict):
+                        pass
+
+                    class Model(_Shape_0e3824cb199e.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Cluster.Ceph.Flags._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Ceph.Flags._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Ceph.Flags._Get.Model"]: ...
+
+                @dataclass
+                class _Put:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"nobackfill": NotRequired[bool], "nodeep-scrub": NotRequired[bool], "nodown": NotRequired[bool], "noin": NotRequired[bool], "noout": NotRequired[bool], "norebalance": NotRequired[bool], "norecover": NotRequired[bool], "noscrub": NotRequired[bool], "notieragent": NotRequired[bool], "noup": NotRequired[bool], "pause": NotRequired[bool]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> str: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> str: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def put(self) -> _Put: ...
+
+                @property
+                def set(self) -> _Put: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def flags(self) -> Flags: ...
+
+            @dataclass
+            class _Get:
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list[dict[str, Any]]: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list[dict[str, Any]]: ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+
+        @cached_property
+        def ceph(self) -> Ceph: ...
+
+        @dataclass
+        class Jobs:
+            @dataclass
+            class RealmSync:
+                @dataclass
+                class Id:
+                    @dataclass
+                    class _Delete:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        id: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @dataclass
+                    class _Get:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        id: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                    @dataclass
+                    class _Post:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        id: str
+                        Params = typing.TypedDict("Params", {"comment": NotRequired[str], "enable-new": NotRequired[bool], "enabled": NotRequired[bool], "realm": NotRequired[str], "remove-vanished": NotRequired[str], "schedule": str, "scope": NotRequired[Literal["users", "groups", "both"]]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @dataclass
+                    class _Put:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        id: str
+                        Params = typing.TypedDict("Params", {"comment": NotRequired[str], "delete": NotRequired[str], "enable-new": NotRequired[bool], "enabled": NotRequired[bool], "remove-vanished": NotRequired[str], "schedule": str, "scope": NotRequired[Literal["users", "groups", "both"]]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @cached_property
+                    def delete(self) -> _Delete: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def post(self) -> _Post: ...
+
+                    @property
+                    def create(self) -> _Post: ...
+
+                    @cached_property
+                    def put(self) -> _Put: ...
+
+                    @property
+                    def set(self) -> _Put: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    id: str
+
+                def __call__(self, id: str) -> Id: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_d20c95931ae1.TypedDict):
+                        pass
+
+                    class Model(_Shape_d20c95931ae1.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Cluster.Jobs.RealmSync._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Jobs.RealmSync._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Jobs.RealmSync._Get.Model"]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def realm_sync(self) -> RealmSync: ...
+
+            @dataclass
+            class ScheduleAnalyze:
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_b5f0ee8b1fbc.TypedDict):
+                        pass
+
+                    class Model(_Shape_b5f0ee8b1fbc.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Cluster.Jobs.ScheduleAnalyze._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"iterations": NotRequired[int], "schedule": str, "starttime": NotRequired[int]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Jobs.ScheduleAnalyze._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Jobs.ScheduleAnalyze._Get.Model"]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def schedule_analyze(self) -> ScheduleAnalyze: ...
+
+            @dataclass
+            class _Get:
+                class TypedDict(_Shape_21168c7817dc.TypedDict):
+                    pass
+
+                class Model(_Shape_21168c7817dc.Model):
+                    pass
+                Model.__name__ = "ProxmoxAPI.Cluster.Jobs._Get"
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list["ProxmoxAPI.Cluster.Jobs._Get.TypedDict"]: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list["ProxmoxAPI.Cluster.Jobs._Get.Model"]: ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+
+        @cached_property
+        def jobs(self) -> Jobs: ...
+
+        @dataclass
+        class Mapping:
+            @dataclass
+            class Dir:
+                @dataclass
+                class Id:
+                    @dataclass
+                    class _Delete:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        id: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @dataclass
+                    class _Get:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        id: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                    @dataclass
+                    class _Put:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        id: str
+                        Params = typing.TypedDict("Params", {"delete": NotRequired[str], "description": NotRequired[str], "digest": NotRequired[str], "map": NotRequired[list[Any]]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @cached_property
+                    def delete(self) -> _Delete: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def put(self) -> _Put: ...
+
+                    @property
+                    def set(self) -> _Put: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    id: str
+
+                def __call__(self, id: str) -> Id: ...
+
+                @dataclass
+                class _Get:
+                    @dataclass
+                    class _Checks:
+                        class TypedDict(_Shape_52b1051abd4d.TypedDict):
+                            pass
+
+                        class Model(_Shape_52b1051abd4d.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Cluster.Mapping.Dir._Get._Checks"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                    TypedDict = typing.TypedDict("TypedDict", {"checks": NotRequired[list["ProxmoxAPI.Cluster.Mapping.Dir._Get._Checks.TypedDict"]], "description": str, "id": str, "map": list[str]})
+
+                    class Model(BaseModel):
+                        checks: Optional[list["ProxmoxAPI.Cluster.Mapping.Dir._Get._Checks.Model"]] = None
+                        description: str
+                        id: str
+                        map: list[str]
+                    Model.__name__ = "ProxmoxAPI.Cluster.Mapping.Dir._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"check-node": NotRequired[str]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Mapping.Dir._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Mapping.Dir._Get.Model"]: ...
+
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"description": NotRequired[str], "id": str, "map": list[Any]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def dir(self) -> Dir: ...
+
+            @dataclass
+            class Pci:
+                @dataclass
+                class Id:
+                    @dataclass
+                    class _Delete:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        id: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @dataclass
+                    class _Get:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        id: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                    @dataclass
+                    class _Put:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        id: str
+                        Params = typing.TypedDict("Params", {"delete": NotRequired[str], "description": NotRequired[str], "digest": NotRequired[str], "live-migration-capable": NotRequired[bool], "map": NotRequired[list[Any]], "mdev": NotRequired[bool]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @cached_property
+                    def delete(self) -> _Delete: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def put(self) -> _Put: ...
+
+                    @property
+                    def set(self) -> _Put: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    id: str
+
+                def __call__(self, id: str) -> Id: ...
+
+                @dataclass
+                class _Get:
+                    @dataclass
+                    class _Checks:
+                        class TypedDict(_Shape_52b1051abd4d.TypedDict):
+                            pass
+
+                        class Model(_Shape_52b1051abd4d.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Cluster.Mapping.Pci._Get._Checks"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                    TypedDict = typing.TypedDict("TypedDict", {"checks": NotRequired[list["ProxmoxAPI.Cluster.Mapping.Pci._Get._Checks.TypedDict"]], "description": str, "id": str, "map": list[str]})
+
+                    class Model(BaseModel):
+                        checks: Optional[list["ProxmoxAPI.Cluster.Mapping.Pci._Get._Checks.Model"]] = None
+                        description: str
+                        id: str
+                        map: list[str]
+                    Model.__name__ = "ProxmoxAPI.Cluster.Mapping.Pci._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"check-node": NotRequired[str]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Mapping.Pci._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Mapping.Pci._Get.Model"]: ...
+
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"description": NotRequired[str], "id": str, "live-migration-capable": NotRequired[bool], "map": list[Any], "mdev": NotRequired[bool]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def pci(self) -> Pci: ...
+
+            @dataclass
+            class Usb:
+                @dataclass
+                class Id:
+                    @dataclass
+                    class _Delete:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        id: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @dataclass
+                    class _Get:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        id: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                    @dataclass
+                    class _Put:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        id: str
+                        Params = typing.TypedDict("Params", {"delete": NotRequired[str], "description": NotRequired[str], "digest": NotRequired[str], "map": list[Any]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @cached_property
+                    def delete(self) -> _Delete: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def put(self) -> _Put: ...
+
+                    @property
+                    def set(self) -> _Put: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    id: str
+
+                def __call__(self, id: str) -> Id: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_94b8f7ef149b.TypedDict):
+                        pass
+
+                    class Model(_Shape_94b8f7ef149b.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Cluster.Mapping.Usb._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"check-node": NotRequired[str]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Mapping.Usb._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Mapping.Usb._Get.Model"]: ...
+
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"description": NotRequired[str], "id": str, "map": list[Any]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def usb(self) -> Usb: ...
+
+            @dataclass
+            class _Get:
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list[dict[str, Any]]: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list[dict[str, Any]]: ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+
+        @cached_property
+        def mapping(self) -> Mapping: ...
+
+        @dataclass
+        class Sdn:
+            @dataclass
+            class Vnets:
+                @dataclass
+                class Vnet:
+                    @dataclass
+                    class Firewall:
+                        @dataclass
+                        class Rules:
+                            @dataclass
+                            class Pos:
+                                @dataclass
+                                class _Delete:
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    vnet: str
+                                    pos: int
+                                    Params = typing.TypedDict("Params", {"digest": NotRequired[str]})
+
+                                    def __call__(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                    def model(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                @dataclass
+                                class _Get:
+                                    class TypedDict(_Shape_7e5fdbf08cb2.TypedDict):
+                                        pass
+
+                                    class Model(_Shape_7e5fdbf08cb2.Model):
+                                        pass
+                                    Model.__name__ = "ProxmoxAPI.Cluster.Sdn.Vnets.Vnet.Firewall.Rules.Pos._Get"
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    vnet: str
+                                    pos: int
+                                    Params = typing.TypedDict("Params", {})
+
+                                    def __call__(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> "ProxmoxAPI.Cluster.Sdn.Vnets.Vnet.Firewall.Rules.Pos._Get.TypedDict": ...
+
+                                    def model(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> "ProxmoxAPI.Cluster.Sdn.Vnets.Vnet.Firewall.Rules.Pos._Get.Model": ...
+
+                                @dataclass
+                                class _Put:
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    vnet: str
+                                    pos: int
+                                    Params = typing.TypedDict("Params", {"action": NotRequired[str], "comment": NotRequired[str], "delete": NotRequired[str], "dest": NotRequired[str], "digest": NotRequired[str], "dport": NotRequired[str], "enable": NotRequired[int], "icmp-type": NotRequired[str], "iface": NotRequired[str], "log": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]], "macro": NotRequired[str], "moveto": NotRequired[int], "proto": NotRequired[str], "source": NotRequired[str], "sport": NotRequired[str], "type": NotRequired[Literal["in", "out", "forward", "group"]]})
+
+                                    def __call__(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                    def model(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                @cached_property
+                                def delete(self) -> _Delete: ...
+
+                                @cached_property
+                                def get(self) -> _Get: ...
+
+                                @cached_property
+                                def put(self) -> _Put: ...
+
+                                @property
+                                def set(self) -> _Put: ...
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                vnet: str
+                                pos: int
+
+                            def __call__(self, pos: int) -> Pos: ...
+
+                            @dataclass
+                            class _Get:
+                                class TypedDict(_Shape_5877922db5f2.TypedDict):
+                                    pass
+
+                                class Model(_Shape_5877922db5f2.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Cluster.Sdn.Vnets.Vnet.Firewall.Rules._Get"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                vnet: str
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list["ProxmoxAPI.Cluster.Sdn.Vnets.Vnet.Firewall.Rules._Get.TypedDict"]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list["ProxmoxAPI.Cluster.Sdn.Vnets.Vnet.Firewall.Rules._Get.Model"]: ...
+
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                vnet: str
+                                Params = typing.TypedDict("Params", {"action": str, "comment": NotRequired[str], "dest": NotRequired[str], "digest": NotRequired[str], "dport": NotRequired[str], "enable": NotRequired[int], "icmp-type": NotRequired[str], "iface": NotRequired[str], "log": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]], "macro": NotRequired[str], "pos": NotRequired[int], "proto": NotRequired[str], "source": NotRequired[str], "sport": NotRequired[str], "type": Literal["in", "out", "forward", "group"]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            vnet: str
+
+                        @cached_property
+                        def rules(self) -> Rules: ...
+
+                        @dataclass
+                        class Options:
+                            @dataclass
+                            class _Get:
+                                class TypedDict(_Shape_7afe7635fdbf.TypedDict):
+                                    pass
+
+                                class Model(_Shape_7afe7635fdbf.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Cluster.Sdn.Vnets.Vnet.Firewall.Options._Get"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                vnet: str
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> "ProxmoxAPI.Cluster.Sdn.Vnets.Vnet.Firewall.Options._Get.TypedDict": ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> "ProxmoxAPI.Cluster.Sdn.Vnets.Vnet.Firewall.Options._Get.Model": ...
+
+                            @dataclass
+                            class _Put:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                vnet: str
+                                Params = typing.TypedDict("Params", {"delete": NotRequired[str], "digest": NotRequired[str], "enable": NotRequired[bool], "log_level_forward": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]], "policy_forward": NotRequired[Literal["ACCEPT", "DROP"]]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+
+                            @cached_property
+                            def put(self) -> _Put: ...
+
+                            @property
+                            def set(self) -> _Put: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            vnet: str
+
+                        @cached_property
+                        def options(self) -> Options: ...
+
+                        @dataclass
+                        class _Get:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            vnet: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list[dict[str, Any]]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list[dict[str, Any]]: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        vnet: str
+
+                    @cached_property
+                    def firewall(self) -> Firewall: ...
+
+                    @dataclass
+                    class Subnets:
+                        @dataclass
+                        class Subnet:
+                            @dataclass
+                            class _Delete:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                vnet: str
+                                subnet: str
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                            @dataclass
+                            class _Get:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                vnet: str
+                                subnet: str
+                                Params = typing.TypedDict("Params", {"pending": NotRequired[bool], "running": NotRequired[bool]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                            @dataclass
+                            class _Put:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                vnet: str
+                                subnet: str
+                                Params = typing.TypedDict("Params", {"delete": NotRequired[str], "dhcp-dns-server": NotRequired[str], "dhcp-range": NotRequired[list[Any]], "digest": NotRequired[str], "dnszoneprefix": NotRequired[str], "gateway": NotRequired[str], "snat": NotRequired[bool]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                            @cached_property
+                            def delete(self) -> _Delete: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+
+                            @cached_property
+                            def put(self) -> _Put: ...
+
+                            @property
+                            def set(self) -> _Put: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            vnet: str
+                            subnet: str
+
+                        def __call__(self, subnet: str) -> Subnet: ...
+
+                        @dataclass
+                        class _Get:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            vnet: str
+                            Params = typing.TypedDict("Params", {"pending": NotRequired[bool], "running": NotRequired[bool]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list[dict[str, Any]]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list[dict[str, Any]]: ...
+
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            vnet: str
+                            Params = typing.TypedDict("Params", {"dhcp-dns-server": NotRequired[str], "dhcp-range": NotRequired[list[Any]], "dnszoneprefix": NotRequired[str], "gateway": NotRequired[str], "snat": NotRequired[bool], "subnet": str, "type": Literal["subnet"]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        vnet: str
+
+                    @cached_property
+                    def subnets(self) -> Subnets: ...
+
+                    @dataclass
+                    class Ips:
+                        @dataclass
+                        class _Delete:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            vnet: str
+                            Params = typing.TypedDict("Params", {"ip": str, "mac": NotRequired[str], "zone": str})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            vnet: str
+                            Params = typing.TypedDict("Params", {"ip": str, "mac": NotRequired[str], "zone": str})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                        @dataclass
+                        class _Put:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            vnet: str
+                            Params = typing.TypedDict("Params", {"ip": str, "mac": NotRequired[str], "vmid": NotRequired[int], "zone": str})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                        @cached_property
+                        def delete(self) -> _Delete: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+
+                        @cached_property
+                        def put(self) -> _Put: ...
+
+                        @property
+                        def set(self) -> _Put: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        vnet: str
+
+                    @cached_property
+                    def ips(self) -> Ips: ...
+
+                    @dataclass
+                    class _Delete:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        vnet: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @dataclass
+                    class _Get:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        vnet: str
+                        Params = typing.TypedDict("Params", {"pending": NotRequired[bool], "running": NotRequired[bool]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                    @dataclass
+                    class _Put:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        vnet: str
+                        Params = typing.TypedDict("Params", {"alias": NotRequired[str], "delete": NotRequired[str], "digest": NotRequired[str], "isolate-ports": NotRequired[bool], "tag": NotRequired[int], "vlanaware": NotRequired[bool], "zone": NotRequired[str]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @cached_property
+                    def delete(self) -> _Delete: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def put(self) -> _Put: ...
+
+                    @property
+                    def set(self) -> _Put: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    vnet: str
+
+                def __call__(self, vnet: str) -> Vnet: ...
+
+                @dataclass
+                class _Get:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"pending": NotRequired[bool], "running": NotRequired[bool]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[dict[str, Any]]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[dict[str, Any]]: ...
+
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"alias": NotRequired[str], "isolate-ports": NotRequired[bool], "tag": NotRequired[int], "type": NotRequired[Literal["vnet"]], "vlanaware": NotRequired[bool], "vnet": str, "zone": str})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def vnets(self) -> Vnets: ...
+
+            @dataclass
+            class Zones:
+                @dataclass
+                class Zone:
+                    @dataclass
+                    class _Delete:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        zone: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @dataclass
+                    class _Get:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        zone: str
+                        Params = typing.TypedDict("Params", {"pending": NotRequired[bool], "running": NotRequired[bool]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                    @dataclass
+                    class _Put:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        zone: str
+                        Params = typing.TypedDict("Params", {"advertise-subnets": NotRequired[bool], "bridge": NotRequired[str], "bridge-disable-mac-learning": NotRequired[bool], "controller": NotRequired[str], "delete": NotRequired[str], "dhcp": NotRequired[Literal["dnsmasq"]], "digest": NotRequired[str], "disable-arp-nd-suppression": NotRequired[bool], "dns": NotRequired[str], "dnszone": NotRequired[str], "dp-id": NotRequired[int], "exitnodes": NotRequired[str], "exitnodes-local-routing": NotRequired[bool], "exitnodes-primary": NotRequired[str], "ipam": NotRequired[str], "mac": NotRequired[str], "mtu": NotRequired[int], "nodes": NotRequired[str], "peers": NotRequired[str], "reversedns": NotRequired[str], "rt-import": NotRequired[str], "tag": NotRequired[int], "vlan-protocol": NotRequired[Literal["802.1q", "802.1ad"]], "vrf-vxlan": NotRequired[int], "vxlan-port": NotRequired[int]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @cached_property
+                    def delete(self) -> _Delete: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def put(self) -> _Put: ...
+
+                    @property
+                    def set(self) -> _Put: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    zone: str
+
+                def __call__(self, zone: str) -> Zone: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_652ec69e6eb1.TypedDict):
+                        pass
+
+                    class Model(_Shape_652ec69e6eb1.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Cluster.Sdn.Zones._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"pending": NotRequired[bool], "running": NotRequired[bool], "type": NotRequired[Literal["evpn", "faucet", "qinq", "simple", "vlan", "vxlan"]]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Sdn.Zones._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Sdn.Zones._Get.Model"]: ...
+
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"advertise-subnets": NotRequired[bool], "bridge": NotRequired[str], "bridge-disable-mac-learning": NotRequired[bool], "controller": NotRequired[str], "dhcp": NotRequired[Literal["dnsmasq"]], "disable-arp-nd-suppression": NotRequired[bool], "dns": NotRequired[str], "dnszone": NotRequired[str], "dp-id": NotRequired[int], "exitnodes": NotRequired[str], "exitnodes-local-routing": NotRequired[bool], "exitnodes-primary": NotRequired[str], "ipam": NotRequired[str], "mac": NotRequired[str], "mtu": NotRequired[int], "nodes": NotRequired[str], "peers": NotRequired[str], "reversedns": NotRequired[str], "rt-import": NotRequired[str], "tag": NotRequired[int], "type": Literal["evpn", "faucet", "qinq", "simple", "vlan", "vxlan"], "vlan-protocol": NotRequired[Literal["802.1q", "802.1ad"]], "vrf-vxlan": NotRequired[int], "vxlan-port": NotRequired[int], "zone": str})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def zones(self) -> Zones: ...
+
+            @dataclass
+            class Controllers:
+                @dataclass
+                class Controller:
+                    @dataclass
+                    class _Delete:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        controller: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @dataclass
+                    class _Get:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        controller: str
+                        Params = typing.TypedDict("Params", {"pending": NotRequired[bool], "running": NotRequired[bool]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                    @dataclass
+                    class _Put:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        controller: str
+                        Params = typing.TypedDict("Params", {"asn": NotRequired[int], "bgp-multipath-as-path-relax": NotRequired[bool], "delete": NotRequired[str], "digest": NotRequired[str], "ebgp": NotRequired[bool], "ebgp-multihop": NotRequired[int], "isis-domain": NotRequired[str], "isis-ifaces": NotRequired[str], "isis-net": NotRequired[str], "loopback": NotRequired[str], "node": NotRequired[str], "peers": NotRequired[str]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @cached_property
+                    def delete(self) -> _Delete: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def put(self) -> _Put: ...
+
+                    @property
+                    def set(self) -> _Put: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    controller: str
+
+                def __call__(self, controller: str) -> Controller: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_d0c81dc06c17.TypedDict):
+                        pass
+
+                    class Model(_Shape_d0c81dc06c17.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Cluster.Sdn.Controllers._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"pending": NotRequired[bool], "running": NotRequired[bool], "type": NotRequired[Literal["bgp", "evpn", "faucet", "isis"]]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Sdn.Controllers._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Sdn.Controllers._Get.Model"]: ...
+
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"asn": NotRequired[int], "bgp-multipath-as-path-relax": NotRequired[bool], "controller": str, "ebgp": NotRequired[bool], "ebgp-multihop": NotRequired[int], "isis-domain": NotRequired[str], "isis-ifaces": NotRequired[str], "isis-net": NotRequired[str], "loopback": NotRequired[str], "node": NotRequired[str], "peers": NotRequired[str], "type": Literal["bgp", "evpn", "faucet", "isis"]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def controllers(self) -> Controllers: ...
+
+            @dataclass
+            class Ipams:
+                @dataclass
+                class Ipam:
+                    @dataclass
+                    class Status:
+                        @dataclass
+                        class _Get:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            ipam: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list[Any]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list[Any]: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        ipam: str
+
+                    @cached_property
+                    def status(self) -> Status: ...
+
+                    @dataclass
+                    class _Delete:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        ipam: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @dataclass
+                    class _Get:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        ipam: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                    @dataclass
+                    class _Put:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        ipam: str
+                        Params = typing.TypedDict("Params", {"delete": NotRequired[str], "digest": NotRequired[str], "fingerprint": NotRequired[str], "section": NotRequired[int], "token": NotRequired[str], "url": NotRequired[str]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @cached_property
+                    def delete(self) -> _Delete: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def put(self) -> _Put: ...
+
+                    @property
+                    def set(self) -> _Put: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    ipam: str
+
+                def __call__(self, ipam: str) -> Ipam: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_0d387c9c35df.TypedDict):
+                        pass
+
+                    class Model(_Shape_0d387c9c35df.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Cluster.Sdn.Ipams._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"type": NotRequired[Literal["netbox", "phpipam", "pve"]]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Sdn.Ipams._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Sdn.Ipams._Get.Model"]: ...
+
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"fingerprint": NotRequired[str], "ipam": str, "section": NotRequired[int], "token": NotRequired[str], "type": Literal["netbox", "phpipam", "pve"], "url": NotRequired[str]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def ipams(self) -> Ipams: ...
+
+            @dataclass
+            class Dns:
+                @dataclass
+                class Dns:
+                    @dataclass
+                    class _Delete:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        dns: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @dataclass
+                    class _Get:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        dns: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                    @dataclass
+                    class _Put:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        dns: str
+                        Params = typing.TypedDict("Params", {"delete": NotRequired[str], "digest": NotRequired[str], "fingerprint": NotRequired[str], "key": NotRequired[str], "reversemaskv6": NotRequired[int], "ttl": NotRequired[int], "url": NotRequired[str]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @cached_property
+                    def delete(self) -> _Delete: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def put(self) -> _Put: ...
+
+                    @property
+                    def set(self) -> _Put: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    dns: str
+
+                def __call__(self, dns: str) -> Dns: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_c0902bf1a75b.TypedDict):
+                        pass
+
+                    class Model(_Shape_c0902bf1a75b.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Cluster.Sdn.Dns._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"type": NotRequired[Literal["powerdns"]]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Sdn.Dns._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Cluster.Sdn.Dns._Get.Model"]: ...
+
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    Params = typing.TypedDict("Params", {"dns": str, "fingerprint": NotRequired[str], "key": str, "reversemaskv6": NotRequired[int], "reversev6mask": NotRequired[int], "ttl": NotRequired[int], "type": Literal["powerdns"], "url": str})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+
+            @cached_property
+            def dns(self) -> Dns: ...
+
+            @dataclass
+            class _Get:
+                class TypedDict(_Shape_702e4ae1eff6.TypedDict):
+                    pass
+
+                class Model(_Shape_702e4ae1eff6.Model):
+                    pass
+                Model.__name__ = "ProxmoxAPI.Cluster.Sdn._Get"
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list["ProxmoxAPI.Cluster.Sdn._Get.TypedDict"]: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list["ProxmoxAPI.Cluster.Sdn._Get.Model"]: ...
+
+            @dataclass
+            class _Put:
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> str: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> str: ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+
+            @cached_property
+            def put(self) -> _Put: ...
+
+            @property
+            def set(self) -> _Put: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+
+        @cached_property
+        def sdn(self) -> Sdn: ...
+
+        @dataclass
+        class Log:
+            @dataclass
+            class _Get:
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {"max": NotRequired[int]})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list[dict[str, Any]]: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list[dict[str, Any]]: ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+
+        @cached_property
+        def log(self) -> Log: ...
+
+        @dataclass
+        class Resources:
+            @dataclass
+            class _Get:
+                class TypedDict(_Shape_796474334f3c.TypedDict):
+                    pass
+
+                class Model(_Shape_796474334f3c.Model):
+                    pass
+                Model.__name__ = "ProxmoxAPI.Cluster.Resources._Get"
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {"type": NotRequired[Literal["vm", "storage", "node", "sdn"]]})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list["ProxmoxAPI.Cluster.Resources._Get.TypedDict"]: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list["ProxmoxAPI.Cluster.Resources._Get.Model"]: ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+
+        @cached_property
+        def resources(self) -> Resources: ...
+
+        @dataclass
+        class Tasks:
+            @dataclass
+            class _Get:
+                class TypedDict(_Shape_009180aaaa13.TypedDict):
+                    pass
+
+                class Model(_Shape_009180aaaa13.Model):
+                    pass
+                Model.__name__ = "ProxmoxAPI.Cluster.Tasks._Get"
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list["ProxmoxAPI.Cluster.Tasks._Get.TypedDict"]: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list["ProxmoxAPI.Cluster.Tasks._Get.Model"]: ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+
+        @cached_property
+        def tasks(self) -> Tasks: ...
+
+        @dataclass
+        class Options:
+            @dataclass
+            class _Get:
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> dict[str, Any]: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> dict[str, Any]: ...
+
+            @dataclass
+            class _Put:
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {"bwlimit": NotRequired[str], "consent-text": NotRequired[str], "console": NotRequired[Literal["applet", "vv", "html5", "xtermjs"]], "crs": NotRequired[str], "delete": NotRequired[str], "description": NotRequired[str], "email_from": NotRequired[str], "fencing": NotRequired[Literal["watchdog", "hardware", "both"]], "ha": NotRequired[str], "http_proxy": NotRequired[str], "keyboard": NotRequired[Literal["de", "de-ch", "da", "en-gb", "en-us", "es", "fi", "fr", "fr-be", "fr-ca", "fr-ch", "hu", "is", "it", "ja", "lt", "mk", "nl", "no", "pl", "pt", "pt-br", "sv", "sl", "tr"]], "language": NotRequired[Literal["ar", "ca", "da", "de", "en", "es", "eu", "fa", "fr", "hr", "he", "it", "ja", "ka", "kr", "nb", "nl", "nn", "pl", "pt_BR", "ru", "sl", "sv", "tr", "ukr", "zh_CN", "zh_TW"]], "mac_prefix": NotRequired[str], "max_workers": NotRequired[int], "migration": NotRequired[str], "migration_unsecure": NotRequired[bool], "next-id": NotRequired[str], "notify": NotRequired[str], "registered-tags": NotRequired[str], "tag-style": NotRequired[str], "u2f": NotRequired[str], "user-tag-access": NotRequired[str], "webauthn": NotRequired[str]})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> None: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> None: ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+
+            @cached_property
+            def put(self) -> _Put: ...
+
+            @property
+            def set(self) -> _Put: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+
+        @cached_property
+        def options(self) -> Options: ...
+
+        @dataclass
+        class Status:
+            @dataclass
+            class _Get:
+                class TypedDict(_Shape_e3f29b9e2a71.TypedDict):
+                    pass
+
+                class Model(_Shape_e3f29b9e2a71.Model):
+                    pass
+                Model.__name__ = "ProxmoxAPI.Cluster.Status._Get"
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list["ProxmoxAPI.Cluster.Status._Get.TypedDict"]: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list["ProxmoxAPI.Cluster.Status._Get.Model"]: ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+
+        @cached_property
+        def status(self) -> Status: ...
+
+        @dataclass
+        class Nextid:
+            @dataclass
+            class _Get:
+                proxmox_api: ProxmoxerProxmoxAPI
+                Params = typing.TypedDict("Params", {"vmid": NotRequired[int]})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> int: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> int: ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+
+        @cached_property
+        def nextid(self) -> Nextid: ...
+
+        @dataclass
+        class _Get:
+            proxmox_api: ProxmoxerProxmoxAPI
+            Params = typing.TypedDict("Params", {})
+
+            def __call__(
+                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+            ) -> list[dict[str, Any]]: ...
+
+            def model(
+                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+            ) -> list[dict[str, Any]]: ...
+
+        @cached_property
+        def get(self) -> _Get: ...
+        proxmox_api: ProxmoxerProxmoxAPI
\ No newline at end of file
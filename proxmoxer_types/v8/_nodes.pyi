@@ -0,0 +1,9558 @@
+# This file is autogenerated from apidata/apidata-v8.json
+
+import builtins
+import proxmoxer
+import pydantic
+import typing
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Literal, Optional, NotRequired, TYPE_CHECKING, Unpack
+if TYPE_CHECKING:
+    from ..v8 import ProxmoxAPI as ProxmoxerProxmoxAPI
+else:
+    from proxmoxer import ProxmoxAPI as ProxmoxerProxmoxAPI
+from ..shapes import BaseModel, _Shape_7e076d4d2657, _Shape_7e5fdbf08cb2, _Shape_5877922db5f2, _Shape_f6b6fb110821, _Shape_709bdb2a6f84, _Shape_af6cfdcc96b3, _Shape_3ff2000df841, _Shape_702e4ae1eff6, _Shape_21168c7817dc, _Shape_26fca3d62f57, _Shape_b560f719f833, _Shape_d2ff7a5eb279, _Shape_74c7f5ae864e, _Shape_ee3bafa3e01e, _Shape_195e3c884669, _Shape_bb2cfb6ce9cf, _Shape_bacc4da88340, _Shape_9dfb272673ea, _Shape_c3611ee60687, _Shape_12b5d7d6b00b, _Shape_dc8364425177, _Shape_51908da40163, _Shape_c2b9a11aac23, _Shape_35a0b7250f26, _Shape_86de687815b6, _Shape_0fbc3a242dc5, _Shape_4cc707acfd15, _Shape_c2b2dde606ed, _Shape_80eb5f2591b3, _Shape_d71defb238ab, _Shape_810be4c1e563, _Shape_920bdb96bf0e, _Shape_4e7fdf7cf155, _Shape_05b47b521e27, _Shape_69dcd3c4fa4b, _Shape_04f5bfc18ba2, _Shape_b45bfead8f69, _Shape_c878c26ec1c0, _Shape_e5ada466df01, _Shape_2af89e151d82, _Shape_1e2723a34102, _Shape_ad6c326538dd, _Shape_0aa8c9ab0cf3, _Shape_dfc500b7464e, _Shape_7835b5fa0cd8, _Shape_c5362201c150, _Shape_26bae438332d, _Shape_ccc760b74e6d, _Shape_63204c9b844c, _Shape_f597eedfb756, _Shape_8aea3955945c, _Shape_3c7a0d330e61, _Shape_d1c6fdcbf70a, _Shape_951dee2df0f3, _Shape_22a5085494a7, _Shape_efbe411c27ec, _Shape_6468d58335f5, _Shape_ecfc80a86311, _Shape_87fefc2fe99d, _Shape_af650ad299f1, _Shape_63523fe267a3, _Shape_a03b820fd42d, _Shape_4d905ab9c16d, _Shape_419343aad6c2, _Shape_18883e24957c, _Shape_0eaf87bf66e4, _Shape_d0fc20c5567f, _Shape_d03b35974d06, _Shape_2c35ca4d4ce2, _Shape_b9422774550e, _Shape_8127656f62a8, _Shape_20568a4b38fb, _Shape_25f687097d19, _Shape_6ecd47a77999, _Shape_21db667278d3, _Shape_5e9d3b631702, _Shape_b2ed40ab5d55, _Shape_41cc8b5da1b3, _Shape_c314c8f1fa2e, _Shape_a55192fb2e36, _Shape_ea3b1d934b75, _Shape_3ce1a87b05d2, _Shape_1c53eea58c6c, _Shape_7e5a751f69a7, _Shape_4f4c2003f26f, _Shape_46f44f5be7cc, _Shape_58ab2e2fa2d1, _Shape_953e1743ce1d, _Shape_8995825a45a7, _Shape_d504837c3718, _Shape_baee350ed80d, _Shape_b9b46f83b7ec, _Shape_896adc7701b3, _Shape_d67ac64c1a1c, _Shape_02ab1788fc9c, _Shape_4cce9616f8de, _Shape_e0e1c8b9f8bf, _Shape_186ba101f850, _Shape_93b6fbad9fd6, _Shape_56515a7944bc, _Shape_867ed03f1f46
+
+class ProxmoxAPI:
+    @dataclass
+    class Nodes:
+        @dataclass
+        class Node:
+            @dataclass
+            class Qemu:
+                @dataclass
+                class Vmid:
+                    @dataclass
+                    class Firewall:
+                        @dataclass
+                        class Rules:
+                            @dataclass
+                            class Pos:
+                                @dataclass
+                                class _Delete:
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    node: str
+                                    vmid: int
+                                    pos: int
+                                    Params = typing.TypedDict("Params", {"digest": NotRequired[str]})
+
+                                    def __call__(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                    def model(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                @dataclass
+                                class _Get:
+                                    class TypedDict(_Shape_7e5fdbf08cb2.TypedDict):
+                                        pass
+
+                                    class Model(_Shape_7e5fdbf08cb2.Model):
+                                        pass
+                                    Model.__name__ = "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Firewall.Rules.Pos._Get"
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    node: str
+                                    vmid: int
+                                    pos: int
+                                    Params = typing.TypedDict("Params", {})
+
+                                    def __call__(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Firewall.Rules.Pos._Get.TypedDict": ...
+
+                                    def model(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Firewall.Rules.Pos._Get.Model": ...
+
+                                @dataclass
+                                class _Put:
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    node: str
+                                    vmid: int
+                                    pos: int
+                                    Params = typing.TypedDict("Params", {"action": NotRequired[str], "comment": NotRequired[str], "delete": NotRequired[str], "dest": NotRequired[str], "digest": NotRequired[str], "dport": NotRequired[str], "enable": NotRequired[int], "icmp-type": NotRequired[str], "iface": NotRequired[str], "log": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]], "macro": NotRequired[str], "moveto": NotRequired[int], "proto": NotRequired[str], "source": NotRequired[str], "sport": NotRequired[str], "type": NotRequired[Literal["in", "out", "forward", "group"]]})
+
+                                    def __call__(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                    def model(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                @cached_property
+                                def delete(self) -> _Delete: ...
+
+                                @cached_property
+                                def get(self) -> _Get: ...
+
+                                @cached_property
+                                def put(self) -> _Put: ...
+
+                                @property
+                                def set(self) -> _Put: ...
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                pos: int
+
+                            def __call__(self, pos: int) -> Pos: ...
+
+                            @dataclass
+                            class _Get:
+                                class TypedDict(_Shape_5877922db5f2.TypedDict):
+                                    pass
+
+                                class Model(_Shape_5877922db5f2.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Firewall.Rules._Get"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list["ProxmoxAPI.Nodes.Node.Qemu.Vmid.Firewall.Rules._Get.TypedDict"]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list["ProxmoxAPI.Nodes.Node.Qemu.Vmid.Firewall.Rules._Get.Model"]: ...
+
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {"action": str, "comment": NotRequired[str], "dest": NotRequired[str], "digest": NotRequired[str], "dport": NotRequired[str], "enable": NotRequired[int], "icmp-type": NotRequired[str], "iface": NotRequired[str], "log": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]], "macro": NotRequired[str], "pos": NotRequired[int], "proto": NotRequired[str], "source": NotRequired[str], "sport": NotRequired[str], "type": Literal["in", "out", "forward", "group"]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def rules(self) -> Rules: ...
+
+                        @dataclass
+                        class Aliases:
+                            @dataclass
+                            class Name:
+                                @dataclass
+                                class _Delete:
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    node: str
+                                    vmid: int
+                                    name: str
+                                    Params = typing.TypedDict("Params", {"digest": NotRequired[str]})
+
+                                    def __call__(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                    def model(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                @dataclass
+                                class _Get:
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    node: str
+                                    vmid: int
+                                    name: str
+                                    Params = typing.TypedDict("Params", {})
+
+                                    def __call__(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> dict[str, Any]: ...
+
+                                    def model(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> dict[str, Any]: ...
+
+                                @dataclass
+                                class _Put:
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    node: str
+                                    vmid: int
+                                    name: str
+                                    Params = typing.TypedDict("Params", {"cidr": str, "comment": NotRequired[str], "digest": NotRequired[str], "rename": NotRequired[str]})
+
+                                    def __call__(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                    def model(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                @cached_property
+                                def delete(self) -> _Delete: ...
+
+                                @cached_property
+                                def get(self) -> _Get: ...
+
+                                @cached_property
+                                def put(self) -> _Put: ...
+
+                                @property
+                                def set(self) -> _Put: ...
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                name: str
+
+                            def __call__(self, name: str) -> Name: ...
+
+                            @dataclass
+                            class _Get:
+                                class TypedDict(_Shape_af6cfdcc96b3.TypedDict):
+                                    pass
+
+                                class Model(_Shape_af6cfdcc96b3.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Firewall.Aliases._Get"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list["ProxmoxAPI.Nodes.Node.Qemu.Vmid.Firewall.Aliases._Get.TypedDict"]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list["ProxmoxAPI.Nodes.Node.Qemu.Vmid.Firewall.Aliases._Get.Model"]: ...
+
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {"cidr": str, "comment": NotRequired[str], "name": str})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def aliases(self) -> Aliases: ...
+
+                        @dataclass
+                        class Ipset:
+                            @dataclass
+                            class Name:
+                                @dataclass
+                                class Cidr:
+                                    @dataclass
+                                    class _Delete:
+                                        proxmox_api: ProxmoxerProxmoxAPI
+                                        node: str
+                                        vmid: int
+                                        name: str
+                                        cidr: str
+                                        Params = typing.TypedDict("Params", {"digest": NotRequired[str]})
+
+                                        def __call__(
+                                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                        ) -> None: ...
+
+                                        def model(
+                                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                        ) -> None: ...
+
+                                    @dataclass
+                                    class _Get:
+                                        proxmox_api: ProxmoxerProxmoxAPI
+                                        node: str
+                                        vmid: int
+                                        name: str
+                                        cidr: str
+                                        Params = typing.TypedDict("Params", {})
+
+                                        def __call__(
+                                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                        ) -> dict[str, Any]: ...
+
+                                        def model(
+                                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                        ) -> dict[str, Any]: ...
+
+                                    @dataclass
+                                    class _Put:
+                                        proxmox_api: ProxmoxerProxmoxAPI
+                                        node: str
+                                        vmid: int
+                                        name: str
+                                        cidr: str
+                                        Params = typing.TypedDict("Params", {"comment": NotRequired[str], "digest": NotRequired[str], "nomatch": NotRequired[bool]})
+
+                                        def __call__(
+                                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                        ) -> None: ...
+
+                                        def model(
+                                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                        ) -> None: ...
+
+                                    @cached_property
+                                    def delete(self) -> _Delete: ...
+
+                                    @cached_property
+                                    def get(self) -> _Get: ...
+
+                                    @cached_property
+                                    def put(self) -> _Put: ...
+
+                                    @property
+                                    def set(self) -> _Put: ...
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    node: str
+                                    vmid: int
+                                    name: str
+                                    cidr: str
+
+                                def __call__(self, cidr: str) -> Cidr: ...
+
+                                @dataclass
+                                class _Delete:
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    node: str
+                                    vmid: int
+                                    name: str
+                                    Params = typing.TypedDict("Params", {"force": NotRequired[bool]})
+
+                                    def __call__(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                    def model(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                @dataclass
+                                class _Get:
+                                    class TypedDict(_Shape_f6b6fb110821.TypedDict):
+                                        pass
+
+                                    class Model(_Shape_f6b6fb110821.Model):
+                                        pass
+                                    Model.__name__ = "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Firewall.Ipset.Name._Get"
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    node: str
+                                    vmid: int
+                                    name: str
+                                    Params = typing.TypedDict("Params", {})
+
+                                    def __call__(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> list["ProxmoxAPI.Nodes.Node.Qemu.Vmid.Firewall.Ipset.Name._Get.TypedDict"]: ...
+
+                                    def model(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> list["ProxmoxAPI.Nodes.Node.Qemu.Vmid.Firewall.Ipset.Name._Get.Model"]: ...
+
+                                @dataclass
+                                class _Post:
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    node: str
+                                    vmid: int
+                                    name: str
+                                    Params = typing.TypedDict("Params", {"cidr": str, "comment": NotRequired[str], "nomatch": NotRequired[bool]})
+
+                                    def __call__(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                    def model(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                @cached_property
+                                def delete(self) -> _Delete: ...
+
+                                @cached_property
+                                def get(self) -> _Get: ...
+
+                                @cached_property
+                                def post(self) -> _Post: ...
+
+                                @property
+                                def create(self) -> _Post: ...
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                name: str
+
+                            def __call__(self, name: str) -> Name: ...
+
+                            @dataclass
+                            class _Get:
+                                class TypedDict(_Shape_709bdb2a6f84.TypedDict):
+                                    pass
+
+                                class Model(_Shape_709bdb2a6f84.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Firewall.Ipset._Get"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list["ProxmoxAPI.Nodes.Node.Qemu.Vmid.Firewall.Ipset._Get.TypedDict"]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list["ProxmoxAPI.Nodes.Node.Qemu.Vmid.Firewall.Ipset._Get.Model"]: ...
+
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {"comment": NotRequired[str], "digest": NotRequired[str], "name": str, "rename": NotRequired[str]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def ipset(self) -> Ipset: ...
+
+                        @dataclass
+                        class Options:
+                            @dataclass
+                            class _Get:
+                                class TypedDict(_Shape_26fca3d62f57.TypedDict):
+                                    pass
+
+                                class Model(_Shape_26fca3d62f57.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Firewall.Options._Get"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Firewall.Options._Get.TypedDict": ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Firewall.Options._Get.Model": ...
+
+                            @dataclass
+                            class _Put:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {"delete": NotRequired[str], "dhcp": NotRequired[bool], "digest": NotRequired[str], "enable": NotRequired[bool], "ipfilter": NotRequired[bool], "log_level_in": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]], "log_level_out": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]], "macfilter": NotRequired[bool], "ndp": NotRequired[bool], "policy_in": NotRequired[Literal["ACCEPT", "REJECT", "DROP"]], "policy_out": NotRequired[Literal["ACCEPT", "REJECT", "DROP"]], "radv": NotRequired[bool]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+
+                            @cached_property
+                            def put(self) -> _Put: ...
+
+                            @property
+                            def set(self) -> _Put: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def options(self) -> Options: ...
+
+                        @dataclass
+                        class Log:
+                            @dataclass
+                            class _Get:
+                                class TypedDict(_Shape_b560f719f833.TypedDict):
+                                    pass
+
+                                class Model(_Shape_b560f719f833.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Firewall.Log._Get"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {"limit": NotRequired[int], "since": NotRequired[int], "start": NotRequired[int], "until": NotRequired[int]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list["ProxmoxAPI.Nodes.Node.Qemu.Vmid.Firewall.Log._Get.TypedDict"]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list["ProxmoxAPI.Nodes.Node.Qemu.Vmid.Firewall.Log._Get.Model"]: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def log(self) -> Log: ...
+
+                        @dataclass
+                        class Refs:
+                            @dataclass
+                            class _Get:
+                                class TypedDict(_Shape_3ff2000df841.TypedDict):
+                                    pass
+
+                                class Model(_Shape_3ff2000df841.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Firewall.Refs._Get"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {"type": NotRequired[Literal["alias", "ipset"]]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list["ProxmoxAPI.Nodes.Node.Qemu.Vmid.Firewall.Refs._Get.TypedDict"]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list["ProxmoxAPI.Nodes.Node.Qemu.Vmid.Firewall.Refs._Get.Model"]: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def refs(self) -> Refs: ...
+
+                        @dataclass
+                        class _Get:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list[dict[str, Any]]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list[dict[str, Any]]: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def firewall(self) -> Firewall: ...
+
+                    @dataclass
+                    class Agent:
+                        @dataclass
+                        class FsfreezeFreeze:
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def fsfreeze_freeze(self) -> FsfreezeFreeze: ...
+
+                        @dataclass
+                        class FsfreezeStatus:
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def fsfreeze_status(self) -> FsfreezeStatus: ...
+
+                        @dataclass
+                        class FsfreezeThaw:
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def fsfreeze_thaw(self) -> FsfreezeThaw: ...
+
+                        @dataclass
+                        class Fstrim:
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def fstrim(self) -> Fstrim: ...
+
+                        @dataclass
+                        class GetFsinfo:
+                            @dataclass
+                            class _Get:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def get_fsinfo(self) -> GetFsinfo: ...
+
+                        @dataclass
+                        class GetHostName:
+                            @dataclass
+                            class _Get:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def get_host_name(self) -> GetHostName: ...
+
+                        @dataclass
+                        class GetMemoryBlockInfo:
+                            @dataclass
+                            class _Get:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def get_memory_block_info(self) -> GetMemoryBlockInfo: ...
+
+                        @dataclass
+                        class GetMemoryBlocks:
+                            @dataclass
+                            class _Get:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def get_memory_blocks(self) -> GetMemoryBlocks: ...
+
+                        @dataclass
+                        class GetOsinfo:
+                            @dataclass
+                            class _Get:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def get_osinfo(self) -> GetOsinfo: ...
+
+                        @dataclass
+                        class GetTime:
+                            @dataclass
+                            class _Get:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def get_time(self) -> GetTime: ...
+
+                        @dataclass
+                        class GetTimezone:
+                            @dataclass
+                            class _Get:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def get_timezone(self) -> GetTimezone: ...
+
+                        @dataclass
+                        class GetUsers:
+                            @dataclass
+                            class _Get:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def get_users(self) -> GetUsers: ...
+
+                        @dataclass
+                        class GetVcpus:
+                            @dataclass
+                            class _Get:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def get_vcpus(self) -> GetVcpus: ...
+
+                        @dataclass
+                        class Info:
+                            @dataclass
+                            class _Get:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def info(self) -> Info: ...
+
+                        @dataclass
+                        class NetworkGetInterfaces:
+                            @dataclass
+                            class _Get:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def network_get_interfaces(self) -> NetworkGetInterfaces: ...
+
+                        @dataclass
+                        class Ping:
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def ping(self) -> Ping: ...
+
+                        @dataclass
+                        class Shutdown:
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def shutdown(self) -> Shutdown: ...
+
+                        @dataclass
+                        class SuspendDisk:
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def suspend_disk(self) -> SuspendDisk: ...
+
+                        @dataclass
+                        class SuspendHybrid:
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def suspend_hybrid(self) -> SuspendHybrid: ...
+
+                        @dataclass
+                        class SuspendRam:
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def suspend_ram(self) -> SuspendRam: ...
+
+                        @dataclass
+                        class SetUserPassword:
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {"crypted": NotRequired[bool], "password": str, "username": str})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> dict[str, Any]: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def set_user_password(self) -> SetUserPassword: ...
+
+                        @dataclass
+                        class Exec:
+                            @dataclass
+                            class _Post:
+                                class TypedDict(_Shape_d2ff7a5eb279.TypedDict):
+                                    pass
+
+                                class Model(_Shape_d2ff7a5eb279.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Agent.Exec._Post"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {"command": list[Any], "input-data": NotRequired[str]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Agent.Exec._Post.TypedDict": ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Agent.Exec._Post.Model": ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def exec(self) -> Exec: ...
+
+                        @dataclass
+                        class ExecStatus:
+                            @dataclass
+                            class _Get:
+                                class TypedDict(_Shape_74c7f5ae864e.TypedDict):
+                                    pass
+
+                                class Model(_Shape_74c7f5ae864e.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Agent.ExecStatus._Get"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {"pid": int})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Agent.ExecStatus._Get.TypedDict": ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Agent.ExecStatus._Get.Model": ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def exec_status(self) -> ExecStatus: ...
+
+                        @dataclass
+                        class FileRead:
+                            @dataclass
+                            class _Get:
+                                class TypedDict(_Shape_ee3bafa3e01e.TypedDict):
+                                    pass
+
+                                class Model(_Shape_ee3bafa3e01e.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Agent.FileRead._Get"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {"file": str})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Agent.FileRead._Get.TypedDict": ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Agent.FileRead._Get.Model": ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def file_read(self) -> FileRead: ...
+
+                        @dataclass
+                        class FileWrite:
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {"content": str, "encode": NotRequired[bool], "file": str})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def file_write(self) -> FileWrite: ...
+
+                        @dataclass
+                        class _Get:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Any
+                            ) -> list[dict[str, Any]]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Any
+                            ) -> list[dict[str, Any]]: ...
+
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"command": Literal["fsfreeze-freeze", "fsfreeze-status", "fsfreeze-thaw", "fstrim", "get-fsinfo", "get-host-name", "get-memory-block-info", "get-memory-blocks", "get-osinfo", "get-time", "get-timezone", "get-users", "get-vcpus", "info", "network-get-interfaces", "ping", "shutdown", "suspend-disk", "suspend-hybrid", "suspend-ram"]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> dict[str, Any]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> dict[str, Any]: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def agent(self) -> Agent: ...
+
+                    @dataclass
+                    class Rrd:
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_195e3c884669.TypedDict):
+                                pass
+
+                            class Model(_Shape_195e3c884669.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Rrd._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"cf": NotRequired[Literal["AVERAGE", "MAX"]], "ds": str, "timeframe": Literal["hour", "day", "week", "month", "year"]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Rrd._Get.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Rrd._Get.Model": ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def rrd(self) -> Rrd: ...
+
+                    @dataclass
+                    class Rrddata:
+                        @dataclass
+                        class _Get:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"cf": NotRequired[Literal["AVERAGE", "MAX"]], "timeframe": Literal["hour", "day", "week", "month", "year"]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list[dict[str, Any]]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list[dict[str, Any]]: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def rrddata(self) -> Rrddata: ...
+
+                    @dataclass
+                    class Config:
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_bb2cfb6ce9cf.TypedDict):
+                                pass
+
+                            class Model(_Shape_bb2cfb6ce9cf.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Config._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"current": NotRequired[bool], "snapshot": NotRequired[str]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Config._Get.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Config._Get.Model": ...
+
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"acpi": NotRequired[bool], "affinity": NotRequired[str], "agent": NotRequired[str], "amd-sev": NotRequired[str], "arch": NotRequired[Literal["x86_64", "aarch64"]], "args": NotRequired[str], "audio0": NotRequired[str], "autostart": NotRequired[bool], "background_delay": NotRequired[int], "balloon": NotRequired[int], "bios": NotRequired[Literal["seabios", "ovmf"]], "boot": NotRequired[str], "bootdisk": NotRequired[str], "cdrom": NotRequired[str], "cicustom": NotRequired[str], "cipassword": NotRequired[str], "citype": NotRequired[Literal["configdrive2", "nocloud", "opennebula"]], "ciupgrade": NotRequired[bool], "ciuser": NotRequired[str], "cores": NotRequired[int], "cpu": NotRequired[str], "cpulimit": NotRequired[float], "cpuunits": NotRequired[int], "delete": NotRequired[str], "description": NotRequired[str], "digest": NotRequired[str], "efidisk0": NotRequired[str], "force": NotRequired[bool], "freeze": NotRequired[bool], "hookscript": NotRequired[str], "hotplug": NotRequired[str], "hugepages": NotRequired[Literal["any", "2", "1024"]], "import-working-storage": NotRequired[str], "ivshmem": NotRequired[str], "keephugepages": NotRequired[bool], "keyboard": NotRequired[Literal["de", "de-ch", "da", "en-gb", "en-us", "es", "fi", "fr", "fr-be", "fr-ca", "fr-ch", "hu", "is", "it", "ja", "lt", "mk", "nl", "no", "pl", "pt", "pt-br", "sv", "sl", "tr"]], "kvm": NotRequired[bool], "localtime": NotRequired[bool], "lock": NotRequired[Literal["backup", "clone", "create", "migrate", "rollback", "snapshot", "snapshot-delete", "suspending", "suspended"]], "machine": NotRequired[str], "memory": NotRequired[str], "migrate_downtime": NotRequired[float], "migrate_speed": NotRequired[int], "name": NotRequired[str], "nameserver": NotRequired[str], "numa": NotRequired[bool], "onboot": NotRequired[bool], "ostype": NotRequired[Literal["other", "wxp", "w2k", "w2k3", "w2k8", "wvista", "win7", "win8", "win10", "win11", "l24", "l26", "solaris"]], "protection": NotRequired[bool], "reboot": NotRequired[bool], "revert": NotRequired[str], "rng0": NotRequired[str], "scsihw": NotRequired[Literal["lsi", "lsi53c810", "virtio-scsi-pci", "virtio-scsi-single", "megasas", "pvscsi"]], "searchdomain": NotRequired[str], "shares": NotRequired[int], "skiplock": NotRequired[bool], "smbios1": NotRequired[str], "smp": NotRequired[int], "sockets": NotRequired[int], "spice_enhancements": NotRequired[str], "sshkeys": NotRequired[str], "startdate": NotRequired[str], "startup": NotRequired[str], "tablet": NotRequired[bool], "tags": NotRequired[str], "tdf": NotRequired[bool], "template": NotRequired[bool], "tpmstate0": NotRequired[str], "vcpus": NotRequired[int], "vga": NotRequired[str], "vmgenid": NotRequired[str], "vmstatestorage": NotRequired[str], "watchdog": NotRequired[str]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Any
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Any
+                            ) -> str: ...
+
+                            def update(
+                                self, *, current: Optional[typing.Mapping[str, Any]] = None, check: bool = True, **kwargs: Any
+                            ) -> Optional[str]: ...
+
+                        @dataclass
+                        class _Put:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"acpi": NotRequired[bool], "affinity": NotRequired[str], "agent": NotRequired[str], "amd-sev": NotRequired[str], "arch": NotRequired[Literal["x86_64", "aarch64"]], "args": NotRequired[str], "audio0": NotRequired[str], "autostart": NotRequired[bool], "balloon": NotRequired[int], "bios": NotRequired[Literal["seabios", "ovmf"]], "boot": NotRequired[str], "bootdisk": NotRequired[str], "cdrom": NotRequired[str], "cicustom": NotRequired[str], "cipassword": NotRequired[str], "citype": NotRequired[Literal["configdrive2", "nocloud", "opennebula"]], "ciupgrade": NotRequired[bool], "ciuser": NotRequired[str], "cores": NotRequired[int], "cpu": NotRequired[str], "cpulimit": NotRequired[float], "cpuunits": NotRequired[int], "delete": NotRequired[str], "description": NotRequired[str], "digest": NotRequired[str], "efidisk0": NotRequired[str], "force": NotRequired[bool], "freeze": NotRequired[bool], "hookscript": NotRequired[str], "hotplug": NotRequired[str], "hugepages": NotRequired[Literal["any", "2", "1024"]], "ivshmem": NotRequired[str], "keephugepages": NotRequired[bool], "keyboard": NotRequired[Literal["de", "de-ch", "da", "en-gb", "en-us", "es", "fi", "fr", "fr-be", "fr-ca", "fr-ch", "hu", "is", "it", "ja", "lt", "mk", "nl", "no", "pl", "pt", "pt-br", "sv", "sl", "tr"]], "kvm": NotRequired[bool], "localtime": NotRequired[bool], "lock": NotRequired[Literal["backup", "clone", "create", "migrate", "rollback", "snapshot", "snapshot-delete", "suspending", "suspended"]], "machine": NotRequired[str], "memory": NotRequired[str], "migrate_downtime": NotRequired[float], "migrate_speed": NotRequired[int], "name": NotRequired[str], "nameserver": NotRequired[str], "numa": NotRequired[bool], "onboot": NotRequired[bool], "ostype": NotRequired[Literal["other", "wxp", "w2k", "w2k3", "w2k8", "wvista", "win7", "win8", "win10", "win11", "l24", "l26", "solaris"]], "protection": NotRequired[bool], "reboot": NotRequired[bool], "revert": NotRequired[str], "rng0": NotRequired[str], "scsihw": NotRequired[Literal["lsi", "lsi53c810", "virtio-scsi-pci", "virtio-scsi-single", "megasas", "pvscsi"]], "searchdomain": NotRequired[str], "shares": NotRequired[int], "skiplock": NotRequired[bool], "smbios1": NotRequired[str], "smp": NotRequired[int], "sockets": NotRequired[int], "spice_enhancements": NotRequired[str], "sshkeys": NotRequired[str], "startdate": NotRequired[str], "startup": NotRequired[str], "tablet": NotRequired[bool], "tags": NotRequired[str], "tdf": NotRequired[bool], "template": NotRequired[bool], "tpmstate0": NotRequired[str], "vcpus": NotRequired[int], "vga": NotRequired[str], "vmgenid": NotRequired[str], "vmstatestorage": NotRequired[str], "watchdog": NotRequired[str]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Any
+                            ) -> None: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Any
+                            ) -> None: ...
+
+                            def update(
+                                self, *, current: Optional[typing.Mapping[str, Any]] = None, check: bool = True, **kwargs: Any
+                            ) -> None: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+
+                        @cached_property
+                        def put(self) -> _Put: ...
+
+                        @property
+                        def set(self) -> _Put: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def config(self) -> Config: ...
+
+                    @dataclass
+                    class Pending:
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_bacc4da88340.TypedDict):
+                                pass
+
+                            class Model(_Shape_bacc4da88340.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Pending._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Qemu.Vmid.Pending._Get.TypedDict"]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Qemu.Vmid.Pending._Get.Model"]: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def pending(self) -> Pending: ...
+
+                    @dataclass
+                    class Cloudinit:
+                        @dataclass
+                        class Dump:
+                            @dataclass
+                            class _Get:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {"type": Literal["user", "network", "meta"]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def dump(self) -> Dump: ...
+
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_bacc4da88340.TypedDict):
+                                pass
+
+                            class Model(_Shape_bacc4da88340.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Cloudinit._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Qemu.Vmid.Cloudinit._Get.TypedDict"]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Qemu.Vmid.Cloudinit._Get.Model"]: ...
+
+                        @dataclass
+                        class _Put:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+
+                        @cached_property
+                        def put(self) -> _Put: ...
+
+                        @property
+                        def set(self) -> _Put: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def cloudinit(self) -> Cloudinit: ...
+
+                    @dataclass
+                    class Unlink:
+                        @dataclass
+                        class _Put:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"force": NotRequired[bool], "idlist": str})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                        @cached_property
+                        def put(self) -> _Put: ...
+
+                        @property
+                        def set(self) -> _Put: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def unlink(self) -> Unlink: ...
+
+                    @dataclass
+                    class Vncproxy:
+                        @dataclass
+                        class _Post:
+                            class TypedDict(_Shape_9dfb272673ea.TypedDict):
+                                pass
+
+                            class Model(_Shape_9dfb272673ea.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Vncproxy._Post"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"generate-password": NotRequired[bool], "websocket": NotRequired[bool]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Vncproxy._Post.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Vncproxy._Post.Model": ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def vncproxy(self) -> Vncproxy: ...
+
+                    @dataclass
+                    class Termproxy:
+                        @dataclass
+                        class _Post:
+                            class TypedDict(_Shape_c3611ee60687.TypedDict):
+                                pass
+
+                            class Model(_Shape_c3611ee60687.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Termproxy._Post"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"serial": NotRequired[Literal["serial0", "serial1", "serial2", "serial3"]]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Termproxy._Post.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Termproxy._Post.Model": ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def termproxy(self) -> Termproxy: ...
+
+                    @dataclass
+                    class Vncwebsocket:
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_12b5d7d6b00b.TypedDict):
+                                pass
+
+                            class Model(_Shape_12b5d7d6b00b.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Vncwebsocket._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"port": int, "vncticket": str})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Vncwebsocket._Get.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Vncwebsocket._Get.Model": ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def vncwebsocket(self) -> Vncwebsocket: ...
+
+                    @dataclass
+                    class Spiceproxy:
+                        @dataclass
+                        class _Post:
+                            class TypedDict(_Shape_dc8364425177.TypedDict):
+                                pass
+
+                            class Model(_Shape_dc8364425177.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Spiceproxy._Post"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"proxy": NotRequired[str]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Spiceproxy._Post.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Spiceproxy._Post.Model": ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def spiceproxy(self) -> Spiceproxy: ...
+
+                    @dataclass
+                    class Status:
+                        @dataclass
+                        class Current:
+                            @dataclass
+                            class _Get:
+                                class TypedDict(_Shape_51908da40163.TypedDict):
+                                    pass
+
+                                class Model(_Shape_51908da40163.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Status.Current._Get"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Status.Current._Get.TypedDict": ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Status.Current._Get.Model": ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def current(self) -> Current: ...
+
+                        @dataclass
+                        class Start:
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {"force-cpu": NotRequired[str], "machine": NotRequired[str], "migratedfrom": NotRequired[str], "migration_network": NotRequired[str], "migration_type": NotRequired[Literal["secure", "insecure"]], "skiplock": NotRequired[bool], "stateuri": NotRequired[str], "targetstorage": NotRequired[str], "timeout": NotRequired[int]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def start(self) -> Start: ...
+
+                        @dataclass
+                        class Stop:
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {"keepActive": NotRequired[bool], "migratedfrom": NotRequired[str], "overrule-shutdown": NotRequired[bool], "skiplock": NotRequired[bool], "timeout": NotRequired[int]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def stop(self) -> Stop: ...
+
+                        @dataclass
+                        class Reset:
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {"skiplock": NotRequired[bool]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def reset(self) -> Reset: ...
+
+                        @dataclass
+                        class Shutdown:
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {"forceStop": NotRequired[bool], "keepActive": NotRequired[bool], "skiplock": NotRequired[bool], "timeout": NotRequired[int]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def shutdown(self) -> Shutdown: ...
+
+                        @dataclass
+                        class Reboot:
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {"timeout": NotRequired[int]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def reboot(self) -> Reboot: ...
+
+                        @dataclass
+                        class Suspend:
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {"skiplock": NotRequired[bool], "statestorage": NotRequired[str], "todisk": NotRequired[bool]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def suspend(self) -> Suspend: ...
+
+                        @dataclass
+                        class Resume:
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {"nocheck": NotRequired[bool], "skiplock": NotRequired[bool]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def resume(self) -> Resume: ...
+
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_21168c7817dc.TypedDict):
+                                pass
+
+                            class Model(_Shape_21168c7817dc.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Status._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Qemu.Vmid.Status._Get.TypedDict"]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Qemu.Vmid.Status._Get.Model"]: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def status(self) -> Status: ...
+
+                    @dataclass
+                    class Sendkey:
+                        @dataclass
+                        class _Put:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"key": str, "skiplock": NotRequired[bool]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                        @cached_property
+                        def put(self) -> _Put: ...
+
+                        @property
+                        def set(self) -> _Put: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def sendkey(self) -> Sendkey: ...
+
+                    @dataclass
+                    class Feature:
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_c2b9a11aac23.TypedDict):
+                                pass
+
+                            class Model(_Shape_c2b9a11aac23.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Feature._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"feature": Literal["snapshot", "clone", "copy"], "snapname": NotRequired[str]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Feature._Get.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Feature._Get.Model": ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def feature(self) -> Feature: ...
+
+                    @dataclass
+                    class Clone:
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"bwlimit": NotRequired[int], "description": NotRequired[str], "format": NotRequired[Literal["raw", "qcow2", "vmdk"]], "full": NotRequired[bool], "name": NotRequired[str], "newid": int, "pool": NotRequired[str], "snapname": NotRequired[str], "storage": NotRequired[str], "target": NotRequired[str]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def clone(self) -> Clone: ...
+
+                    @dataclass
+                    class MoveDisk:
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"bwlimit": NotRequired[int], "delete": NotRequired[bool], "digest": NotRequired[str], "disk": Literal["ide0", "ide1", "ide2", "ide3", "scsi0", "scsi1", "scsi2", "scsi3", "scsi4", "scsi5", "scsi6", "scsi7", "scsi8", "scsi9", "scsi10", "scsi11", "scsi12", "scsi13", "scsi14", "scsi15", "scsi16", "scsi17", "scsi18", "scsi19", "scsi20", "scsi21", "scsi22", "scsi23", "scsi24", "scsi25", "scsi26", "scsi27", "scsi28", "scsi29", "scsi30", "virtio0", "virtio1", "virtio2", "virtio3", "virtio4", "virtio5", "virtio6", "virtio7", "virtio8", "virtio9", "virtio10", "virtio11", "virtio12", "virtio13", "virtio14", "virtio15", "sata0", "sata1", "sata2", "sata3", "sata4", "sata5", "efidisk0", "tpmstate0", "unused0", "unused1", "unused2", "unused3", "unused4", "unused5", "unused6", "unused7", "unused8", "unused9", "unused10", "unused11", "unused12", "unused13", "unused14", "unused15", "unused16", "unused17", "unused18", "unused19", "unused20", "unused21", "unused22", "unused23", "unused24", "unused25", "unused26", "unused27", "unused28", "unused29", "unused30", "unused31", "unused32", "unused33", "unused34", "unused35", "unused36", "unused37", "unused38", "unused39", "unused40", "unused41", "unused42", "unused43", "unused44", "unused45", "unused46", "unused47", "unused48", "unused49", "unused50", "unused51", "unused52", "unused53", "unused54", "unused55", "unused56", "unused57", "unused58", "unused59", "unused60", "unused61", "unused62", "unused63", "unused64", "unused65", "unused66", "unused67", "unused68", "unused69", "unused70", "unused71", "unused72", "unused73", "unused74", "unused75", "unused76", "unused77", "unused78", "unused79", "unused80", "unused81", "unused82", "unused83", "unused84", "unused85", "unused86", "unused87", "unused88", "unused89", "unused90", "unused91", "unused92", "unused93", "unused94", "unused95", "unused96", "unused97", "unused98", "unused99", "unused100", "unused101", "unused102", "unused103", "unused104", "unused105", "unused106", "unused107", "unused108", "unused109", "unused110", "unused111", "unused112", "unused113", "unused114", "unused115", "unused116", "unused117", "unused118", "unused119", "unused120", "unused121", "unused122", "unused123", "unused124", "unused125", "unused126", "unused127", "unused128", "unused129", "unused130", "unused131", "unused132", "unused133", "unused134", "unused135", "unused136", "unused137", "unused138", "unused139", "unused140", "unused141", "unused142", "unused143", "unused144", "unused145", "unused146", "unused147", "unused148", "unused149", "unused150", "unused151", "unused152", "unused153", "unused154", "unused155", "unused156", "unused157", "unused158", "unused159", "unused160", "unused161", "unused162", "unused163", "unused164", "unused165", "unused166", "unused167", "unused168", "unused169", "unused170", "unused171", "unused172", "unused173", "unused174", "unused175", "unused176", "unused177", "unused178", "unused179", "unused180", "unused181", "unused182", "unused183", "unused184", "unused185", "unused186", "unused187", "unused188", "unused189", "unused190", "unused191", "unused192", "unused193", "unused194", "unused195", "unused196", "unused197", "unused198", "unused199", "unused200", "unused201", "unused202", "unused203", "unused204", "unused205", "unused206", "unused207", "unused208", "unused209", "unused210", "unused211", "unused212", "unused213", "unused214", "unused215", "unused216", "unused217", "unused218", "unused219", "unused220", "unused221", "unused222", "unused223", "unused224", "unused225", "unused226", "unused227", "unused228", "unused229", "unused230", "unused231", "unused232", "unused233", "unused234", "unused235", "unused236", "unused237", "unused238", "unused239", "unused240", "unused241", "unused242", "unused243", "unused244", "unused245", "unused246", "unused247", "unused248", "unused249", "unused250", "unused251", "unused252", "unused253", "unused254", "unused255"], "format": NotRequired[Literal["raw", "qcow2", "vmdk"]], "storage": NotRequired[str], "target-digest": NotRequired[str], "target-disk": NotRequired[Literal["ide0", "ide1", "ide2", "ide3", "scsi0", "scsi1", "scsi2", "scsi3", "scsi4", "scsi5", "scsi6", "scsi7", "scsi8", "scsi9", "scsi10", "scsi11", "scsi12", "scsi13", "scsi14", "scsi15", "scsi16", "scsi17", "scsi18", "scsi19", "scsi20", "scsi21", "scsi22", "scsi23", "scsi24", "scsi25", "scsi26", "scsi27", "scsi28", "scsi29", "scsi30", "virtio0", "virtio1", "virtio2", "virtio3", "virtio4", "virtio5", "virtio6", "virtio7", "virtio8", "virtio9", "virtio10", "virtio11", "virtio12", "virtio13", "virtio14", "virtio15", "sata0", "sata1", "sata2", "sata3", "sata4", "sata5", "efidisk0", "tpmstate0", "unused0", "unused1", "unused2", "unused3", "unused4", "unused5", "unused6", "unused7", "unused8", "unused9", "unused10", "unused11", "unused12", "unused13", "unused14", "unused15", "unused16", "unused17", "unused18", "unused19", "unused20", "unused21", "unused22", "unused23", "unused24", "unused25", "unused26", "unused27", "unused28", "unused29", "unused30", "unused31", "unused32", "unused33", "unused34", "unused35", "unused36", "unused37", "unused38", "unused39", "unused40", "unused41", "unused42", "unused43", "unused44", "unused45", "unused46", "unused47", "unused48", "unused49", "unused50", "unused51", "unused52", "unused53", "unused54", "unused55", "unused56", "unused57", "unused58", "unused59", "unused60", "unused61", "unused62", "unused63", "unused64", "unused65", "unused66", "unused67", "unused68", "unused69", "unused70", "unused71", "unused72", "unused73", "unused74", "unused75", "unused76", "unused77", "unused78", "unused79", "unused80", "unused81", "unused82", "unused83", "unused84", "unused85", "unused86", "unused87", "unused88", "unused89", "unused90", "unused91", "unused92", "unused93", "unused94", "unused95", "unused96", "unused97", "unused98", "unused99", "unused100", "unused101", "unused102", "unused103", "unused104", "unused105", "unused106", "unused107", "unused108", "unused109", "unused110", "unused111", "unused112", "unused113", "unused114", "unused115", "unused116", "unused117", "unused118", "unused119", "unused120", "unused121", "unused122", "unused123", "unused124", "unused125", "unused126", "unused127", "unused128", "unused129", "unused130", "unused131", "unused132", "unused133", "unused134", "unused135", "unused136", "unused137", "unused138", "unused139", "unused140", "unused141", "unused142", "unused143", "unused144", "unused145", "unused146", "unused147", "unused148", "unused149", "unused150", "unused151", "unused152", "unused153", "unused154", "unused155", "unused156", "unused157", "unused158", "unused159", "unused160", "unused161", "unused162", "unused163", "unused164", "unused165", "unused166", "unused167", "unused168", "unused169", "unused170", "unused171", "unused172", "unused173", "unused174", "unused175", "unused176", "unused177", "unused178", "unused179", "unused180", "unused181", "unused182", "unused183", "unused184", "unused185", "unused186", "unused187", "unused188", "unused189", "unused190", "unused191", "unused192", "unused193", "unused194", "unused195", "unused196", "unused197", "unused198", "unused199", "unused200", "unused201", "unused202", "unused203", "unused204", "unused205", "unused206", "unused207", "unused208", "unused209", "unused210", "unused211", "unused212", "unused213", "unused214", "unused215", "unused216", "unused217", "unused218", "unused219", "unused220", "unused221", "unused222", "unused223", "unused224", "unused225", "unused226", "unused227", "unused228", "unused229", "unused230", "unused231", "unused232", "unused233", "unused234", "unused235", "unused236", "unused237", "unused238", "unused239", "unused240", "unused241", "unused242", "unused243", "unused244", "unused245", "unused246", "unused247", "unused248", "unused249", "unused250", "unused251", "unused252", "unused253", "unused254", "unused255"]], "target-vmid": NotRequired[int]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def move_disk(self) -> MoveDisk: ...
+
+                    @dataclass
+                    class Migrate:
+                        @dataclass
+                        class _Get:
+                            @dataclass
+                            class _LocalDisks:
+                                class TypedDict(_Shape_35a0b7250f26.TypedDict):
+                                    pass
+
+                                class Model(_Shape_35a0b7250f26.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Migrate._Get._LocalDisks"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+
+                            @dataclass
+                            class _NotAllowedNodes:
+                                class TypedDict(_Shape_86de687815b6.TypedDict):
+                                    pass
+
+                                class Model(_Shape_86de687815b6.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Migrate._Get._NotAllowedNodes"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                            TypedDict = typing.TypedDict("TypedDict", {"allowed_nodes": NotRequired[list[str]], "local_disks": list["ProxmoxAPI.Nodes.Node.Qemu.Vmid.Migrate._Get._LocalDisks.TypedDict"], "local_resources": list[str], "mapped-resource-info": dict[str, Any], "mapped-resources": list[str], "not_allowed_nodes": NotRequired["ProxmoxAPI.Nodes.Node.Qemu.Vmid.Migrate._Get._NotAllowedNodes.TypedDict"], "running": bool})
+
+                            class Model(BaseModel):
+                                allowed_nodes: Optional[list[str]] = None
+                                local_disks: list["ProxmoxAPI.Nodes.Node.Qemu.Vmid.Migrate._Get._LocalDisks.Model"]
+                                local_resources: list[str]
+                                mapped_resource_info: dict[str, Any] = pydantic.Field(alias="mapped-resource-info")
+                                mapped_resources: list[str] = pydantic.Field(alias="mapped-resources")
+                                not_allowed_nodes: Optional["ProxmoxAPI.Nodes.Node.Qemu.Vmid.Migrate._Get._NotAllowedNodes.Model"] = None
+                                running: bool
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Migrate._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"target": NotRequired[str]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Migrate._Get.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Migrate._Get.Model": ...
+
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"bwlimit": NotRequired[int], "force": NotRequired[bool], "migration_network": NotRequired[str], "migration_type": NotRequired[Literal["secure", "insecure"]], "online": NotRequired[bool], "target": str, "targetstorage": NotRequired[str], "with-local-disks": NotRequired[bool]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def migrate(self) -> Migrate: ...
+
+                    @dataclass
+                    class RemoteMigrate:
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"bwlimit": NotRequired[int], "delete": NotRequired[bool], "online": NotRequired[bool], "target-bridge": str, "target-endpoint": str, "target-storage": str, "target-vmid": NotRequired[int]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def remote_migrate(self) -> RemoteMigrate: ...
+
+                    @dataclass
+                    class Monitor:
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"command": str})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def monitor(self) -> Monitor: ...
+
+                    @dataclass
+                    class Resize:
+                        @dataclass
+                        class _Put:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"digest": NotRequired[str], "disk": Literal["ide0", "ide1", "ide2", "ide3", "scsi0", "scsi1", "scsi2", "scsi3", "scsi4", "scsi5", "scsi6", "scsi7", "scsi8", "scsi9", "scsi10", "scsi11", "scsi12", "scsi13", "scsi14", "scsi15", "scsi16", "scsi17", "scsi18", "scsi19", "scsi20", "scsi21", "scsi22", "scsi23", "scsi24", "scsi25", "scsi26", "scsi27", "scsi28", "scsi29", "scsi30", "virtio0", "virtio1", "virtio2", "virtio3", "virtio4", "virtio5", "virtio6", "virtio7", "virtio8", "virtio9", "virtio10", "virtio11", "virtio12", "virtio13", "virtio14", "virtio15", "sata0", "sata1", "sata2", "sata3", "sata4", "sata5", "efidisk0", "tpmstate0"], "size": str, "skiplock": NotRequired[bool]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def put(self) -> _Put: ...
+
+                        @property
+                        def set(self) -> _Put: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def resize(self) -> Resize: ...
+
+                    @dataclass
+                    class Snapshot:
+                        @dataclass
+                        class Snapname:
+                            @dataclass
+                            class Config:
+                                @dataclass
+                                class _Get:
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    node: str
+                                    vmid: int
+                                    snapname: str
+                                    Params = typing.TypedDict("Params", {})
+
+                                    def __call__(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> dict[str, Any]: ...
+
+                                    def model(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> dict[str, Any]: ...
+
+                                @dataclass
+                                class _Put:
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    node: str
+                                    vmid: int
+                                    snapname: str
+                                    Params = typing.TypedDict("Params", {"description": NotRequired[str]})
+
+                                    def __call__(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                    def model(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                @cached_property
+                                def get(self) -> _Get: ...
+
+                                @cached_property
+                                def put(self) -> _Put: ...
+
+                                @property
+                                def set(self) -> _Put: ...
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                snapname: str
+
+                            @cached_property
+                            def config(self) -> Config: ...
+
+                            @dataclass
+                            class Rollback:
+                                @dataclass
+                                class _Post:
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    node: str
+                                    vmid: int
+                                    snapname: str
+                                    Params = typing.TypedDict("Params", {"start": NotRequired[bool]})
+
+                                    def __call__(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> str: ...
+
+                                    def model(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> str: ...
+
+                                @cached_property
+                                def post(self) -> _Post: ...
+
+                                @property
+                                def create(self) -> _Post: ...
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                snapname: str
+
+                            @cached_property
+                            def rollback(self) -> Rollback: ...
+
+                            @dataclass
+                            class _Delete:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                snapname: str
+                                Params = typing.TypedDict("Params", {"force": NotRequired[bool]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                            @dataclass
+                            class _Get:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                snapname: str
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list[dict[str, Any]]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list[dict[str, Any]]: ...
+
+                            @cached_property
+                            def delete(self) -> _Delete: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            snapname: str
+
+                        def __call__(self, snapname: str) -> Snapname: ...
+
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_0fbc3a242dc5.TypedDict):
+                                pass
+
+                            class Model(_Shape_0fbc3a242dc5.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Snapshot._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Qemu.Vmid.Snapshot._Get.TypedDict"]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Qemu.Vmid.Snapshot._Get.Model"]: ...
+
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"description": NotRequired[str], "snapname": str, "vmstate": NotRequired[bool]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def snapshot(self) -> Snapshot: ...
+
+                    @dataclass
+                    class Template:
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"disk": NotRequired[Literal["ide0", "ide1", "ide2", "ide3", "scsi0", "scsi1", "scsi2", "scsi3", "scsi4", "scsi5", "scsi6", "scsi7", "scsi8", "scsi9", "scsi10", "scsi11", "scsi12", "scsi13", "scsi14", "scsi15", "scsi16", "scsi17", "scsi18", "scsi19", "scsi20", "scsi21", "scsi22", "scsi23", "scsi24", "scsi25", "scsi26", "scsi27", "scsi28", "scsi29", "scsi30", "virtio0", "virtio1", "virtio2", "virtio3", "virtio4", "virtio5", "virtio6", "virtio7", "virtio8", "virtio9", "virtio10", "virtio11", "virtio12", "virtio13", "virtio14", "virtio15", "sata0", "sata1", "sata2", "sata3", "sata4", "sata5", "efidisk0", "tpmstate0"]]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def template(self) -> Template: ...
+
+                    @dataclass
+                    class Mtunnel:
+                        @dataclass
+                        class _Post:
+                            class TypedDict(_Shape_4cc707acfd15.TypedDict):
+                                pass
+
+                            class Model(_Shape_4cc707acfd15.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Mtunnel._Post"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"bridges": NotRequired[str], "storages": NotRequired[str]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Mtunnel._Post.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Mtunnel._Post.Model": ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def mtunnel(self) -> Mtunnel: ...
+
+                    @dataclass
+                    class Mtunnelwebsocket:
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_c2b2dde606ed.TypedDict):
+                                pass
+
+                            class Model(_Shape_c2b2dde606ed.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Mtunnelwebsocket._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"socket": str, "ticket": str})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Mtunnelwebsocket._Get.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Qemu.Vmid.Mtunnelwebsocket._Get.Model": ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def mtunnelwebsocket(self) -> Mtunnelwebsocket: ...
+
+                    @dataclass
+                    class _Delete:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+                        Params = typing.TypedDict("Params", {"destroy-unreferenced-disks": NotRequired[bool], "purge": NotRequired[bool], "skiplock": NotRequired[bool]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_21168c7817dc.TypedDict):
+                            pass
+
+                        class Model(_Shape_21168c7817dc.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Qemu.Vmid._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Qemu.Vmid._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Qemu.Vmid._Get.Model"]: ...
+
+                    @cached_property
+                    def delete(self) -> _Delete: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    vmid: int
+
+                def __call__(self, vmid: int) -> Vmid: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_80eb5f2591b3.TypedDict):
+                        pass
+
+                    class Model(_Shape_80eb5f2591b3.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Nodes.Node.Qemu._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"full": NotRequired[bool]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Nodes.Node.Qemu._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Nodes.Node.Qemu._Get.Model"]: ...
+
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"acpi": NotRequired[bool], "affinity": NotRequired[str], "agent": NotRequired[str], "amd-sev": NotRequired[str], "arch": NotRequired[Literal["x86_64", "aarch64"]], "archive": NotRequired[str], "args": NotRequired[str], "audio0": NotRequired[str], "autostart": NotRequired[bool], "balloon": NotRequired[int], "bios": NotRequired[Literal["seabios", "ovmf"]], "boot": NotRequired[str], "bootdisk": NotRequired[str], "bwlimit": NotRequired[int], "cdrom": NotRequired[str], "cicustom": NotRequired[str], "cipassword": NotRequired[str], "citype": NotRequired[Literal["configdrive2", "nocloud", "opennebula"]], "ciupgrade": NotRequired[bool], "ciuser": NotRequired[str], "cores": NotRequired[int], "cpu": NotRequired[str], "cpulimit": NotRequired[float], "cpuunits": NotRequired[int], "description": NotRequired[str], "efidisk0": NotRequired[str], "force": NotRequired[bool], "freeze": NotRequired[bool], "hookscript": NotRequired[str], "hotplug": NotRequired[str], "hugepages": NotRequired[Literal["any", "2", "1024"]], "import-working-storage": NotRequired[str], "ivshmem": NotRequired[str], "keephugepages": NotRequired[bool], "keyboard": NotRequired[Literal["de", "de-ch", "da", "en-gb", "en-us", "es", "fi", "fr", "fr-be", "fr-ca", "fr-ch", "hu", "is", "it", "ja", "lt", "mk", "nl", "no", "pl", "pt", "pt-br", "sv", "sl", "tr"]], "kvm": NotRequired[bool], "live-restore": NotRequired[bool], "localtime": NotRequired[bool], "lock": NotRequired[Literal["backup", "clone", "create", "migrate", "rollback", "snapshot", "snapshot-delete", "suspending", "suspended"]], "machine": NotRequired[str], "memory": NotRequired[str], "migrate_downtime": NotRequired[float], "migrate_speed": NotRequired[int], "name": NotRequired[str], "nameserver": NotRequired[str], "numa": NotRequired[bool], "onboot": NotRequired[bool], "ostype": NotRequired[Literal["other", "wxp", "w2k", "w2k3", "w2k8", "wvista", "win7", "win8", "win10", "win11", "l24", "l26", "solaris"]], "pool": NotRequired[str], "protection": NotRequired[bool], "reboot": NotRequired[bool], "rng0": NotRequired[str], "scsihw": NotRequired[Literal["lsi", "lsi53c810", "virtio-scsi-pci", "virtio-scsi-single", "megasas", "pvscsi"]], "searchdomain": NotRequired[str], "shares": NotRequired[int], "smbios1": NotRequired[str], "smp": NotRequired[int], "sockets": NotRequired[int], "spice_enhancements": NotRequired[str], "sshkeys": NotRequired[str], "start": NotRequired[bool], "startdate": NotRequired[str], "startup": NotRequired[str], "storage": NotRequired[str], "tablet": NotRequired[bool], "tags": NotRequired[str], "tdf": NotRequired[bool], "template": NotRequired[bool], "tpmstate0": NotRequired[str], "unique": NotRequired[bool], "vcpus": NotRequired[int], "vga": NotRequired[str], "vmgenid": NotRequired[str], "vmid": int, "vmstatestorage": NotRequired[str], "watchdog": NotRequired[str]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Any
+                    ) -> str: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Any
+                    ) -> str: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def qemu(self) -> Qemu: ...
+
+            @dataclass
+            class Lxc:
+                @dataclass
+                class Vmid:
+                    @dataclass
+                    class Config:
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_d71defb238ab.TypedDict):
+                                pass
+
+                            class Model(_Shape_d71defb238ab.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Config._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"current": NotRequired[bool], "snapshot": NotRequired[str]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Config._Get.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Config._Get.Model": ...
+
+                        @dataclass
+                        class _Put:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"arch": NotRequired[Literal["amd64", "i386", "arm64", "armhf", "riscv32", "riscv64"]], "cmode": NotRequired[Literal["shell", "console", "tty"]], "console": NotRequired[bool], "cores": NotRequired[int], "cpulimit": NotRequired[float], "cpuunits": NotRequired[int], "debug": NotRequired[bool], "delete": NotRequired[str], "description": NotRequired[str], "digest": NotRequired[str], "features": NotRequired[str], "hookscript": NotRequired[str], "hostname": NotRequired[str], "lock": NotRequired[Literal["backup", "create", "destroyed", "disk", "fstrim", "migrate", "mounted", "rollback", "snapshot", "snapshot-delete"]], "memory": NotRequired[int], "nameserver": NotRequired[str], "onboot": NotRequired[bool], "ostype": NotRequired[Literal["debian", "devuan", "ubuntu", "centos", "fedora", "opensuse", "archlinux", "alpine", "gentoo", "nixos", "unmanaged"]], "protection": NotRequired[bool], "revert": NotRequired[str], "rootfs": NotRequired[str], "searchdomain": NotRequired[str], "startup": NotRequired[str], "swap": NotRequired[int], "tags": NotRequired[str], "template": NotRequired[bool], "timezone": NotRequired[str], "tty": NotRequired[int], "unprivileged": NotRequired[bool]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Any
+                            ) -> None: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Any
+                            ) -> None: ...
+
+                            def update(
+                                self, *, current: Optional[typing.Mapping[str, Any]] = None, check: bool = True, **kwargs: Any
+                            ) -> None: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+
+                        @cached_property
+                        def put(self) -> _Put: ...
+
+                        @property
+                        def set(self) -> _Put: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def config(self) -> Config: ...
+
+                    @dataclass
+                    class Status:
+                        @dataclass
+                        class Current:
+                            @dataclass
+                            class _Get:
+                                class TypedDict(_Shape_810be4c1e563.TypedDict):
+                                    pass
+
+                                class Model(_Shape_810be4c1e563.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Status.Current._Get"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Status.Current._Get.TypedDict": ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Status.Current._Get.Model": ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def current(self) -> Current: ...
+
+                        @dataclass
+                        class Start:
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {"debug": NotRequired[bool], "skiplock": NotRequired[bool]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def start(self) -> Start: ...
+
+                        @dataclass
+                        class Stop:
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {"overrule-shutdown": NotRequired[bool], "skiplock": NotRequired[bool]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def stop(self) -> Stop: ...
+
+                        @dataclass
+                        class Shutdown:
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {"forceStop": NotRequired[bool], "timeout": NotRequired[int]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def shutdown(self) -> Shutdown: ...
+
+                        @dataclass
+                        class Suspend:
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def suspend(self) -> Suspend: ...
+
+                        @dataclass
+                        class Resume:
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def resume(self) -> Resume: ...
+
+                        @dataclass
+                        class Reboot:
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {"timeout": NotRequired[int]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def reboot(self) -> Reboot: ...
+
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_21168c7817dc.TypedDict):
+                                pass
+
+                            class Model(_Shape_21168c7817dc.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Status._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Lxc.Vmid.Status._Get.TypedDict"]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Lxc.Vmid.Status._Get.Model"]: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def status(self) -> Status: ...
+
+                    @dataclass
+                    class Snapshot:
+                        @dataclass
+                        class Snapname:
+                            @dataclass
+                            class Rollback:
+                                @dataclass
+                                class _Post:
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    node: str
+                                    vmid: int
+                                    snapname: str
+                                    Params = typing.TypedDict("Params", {"start": NotRequired[bool]})
+
+                                    def __call__(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> str: ...
+
+                                    def model(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> str: ...
+
+                                @cached_property
+                                def post(self) -> _Post: ...
+
+                                @property
+                                def create(self) -> _Post: ...
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                snapname: str
+
+                            @cached_property
+                            def rollback(self) -> Rollback: ...
+
+                            @dataclass
+                            class Config:
+                                @dataclass
+                                class _Get:
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    node: str
+                                    vmid: int
+                                    snapname: str
+                                    Params = typing.TypedDict("Params", {})
+
+                                    def __call__(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> dict[str, Any]: ...
+
+                                    def model(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> dict[str, Any]: ...
+
+                                @dataclass
+                                class _Put:
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    node: str
+                                    vmid: int
+                                    snapname: str
+                                    Params = typing.TypedDict("Params", {"description": NotRequired[str]})
+
+                                    def __call__(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                    def model(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                @cached_property
+                                def get(self) -> _Get: ...
+
+                                @cached_property
+                                def put(self) -> _Put: ...
+
+                                @property
+                                def set(self) -> _Put: ...
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                snapname: str
+
+                            @cached_property
+                            def config(self) -> Config: ...
+
+                            @dataclass
+                            class _Delete:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                snapname: str
+                                Params = typing.TypedDict("Params", {"force": NotRequired[bool]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                            @dataclass
+                            class _Get:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                snapname: str
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list[dict[str, Any]]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list[dict[str, Any]]: ...
+
+                            @cached_property
+                            def delete(self) -> _Delete: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            snapname: str
+
+                        def __call__(self, snapname: str) -> Snapname: ...
+
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_920bdb96bf0e.TypedDict):
+                                pass
+
+                            class Model(_Shape_920bdb96bf0e.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Snapshot._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Lxc.Vmid.Snapshot._Get.TypedDict"]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Lxc.Vmid.Snapshot._Get.Model"]: ...
+
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"description": NotRequired[str], "snapname": str})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def snapshot(self) -> Snapshot: ...
+
+                    @dataclass
+                    class Firewall:
+                        @dataclass
+                        class Rules:
+                            @dataclass
+                            class Pos:
+                                @dataclass
+                                class _Delete:
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    node: str
+                                    vmid: int
+                                    pos: int
+                                    Params = typing.TypedDict("Params", {"digest": NotRequired[str]})
+
+                                    def __call__(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                    def model(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                @dataclass
+                                class _Get:
+                                    class TypedDict(_Shape_7e5fdbf08cb2.TypedDict):
+                                        pass
+
+                                    class Model(_Shape_7e5fdbf08cb2.Model):
+                                        pass
+                                    Model.__name__ = "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Firewall.Rules.Pos._Get"
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    node: str
+                                    vmid: int
+                                    pos: int
+                                    Params = typing.TypedDict("Params", {})
+
+                                    def __call__(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Firewall.Rules.Pos._Get.TypedDict": ...
+
+                                    def model(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Firewall.Rules.Pos._Get.Model": ...
+
+                                @dataclass
+                                class _Put:
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    node: str
+                                    vmid: int
+                                    pos: int
+                                    Params = typing.TypedDict("Params", {"action": NotRequired[str], "comment": NotRequired[str], "delete": NotRequired[str], "dest": NotRequired[str], "digest": NotRequired[str], "dport": NotRequired[str], "enable": NotRequired[int], "icmp-type": NotRequired[str], "iface": NotRequired[str], "log": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]], "macro": NotRequired[str], "moveto": NotRequired[int], "proto": NotRequired[str], "source": NotRequired[str], "sport": NotRequired[str], "type": NotRequired[Literal["in", "out", "forward", "group"]]})
+
+                                    def __call__(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                    def model(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                @cached_property
+                                def delete(self) -> _Delete: ...
+
+                                @cached_property
+                                def get(self) -> _Get: ...
+
+                                @cached_property
+                                def put(self) -> _Put: ...
+
+                                @property
+                                def set(self) -> _Put: ...
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                pos: int
+
+                            def __call__(self, pos: int) -> Pos: ...
+
+                            @dataclass
+                            class _Get:
+                                class TypedDict(_Shape_5877922db5f2.TypedDict):
+                                    pass
+
+                                class Model(_Shape_5877922db5f2.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Firewall.Rules._Get"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list["ProxmoxAPI.Nodes.Node.Lxc.Vmid.Firewall.Rules._Get.TypedDict"]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list["ProxmoxAPI.Nodes.Node.Lxc.Vmid.Firewall.Rules._Get.Model"]: ...
+
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {"action": str, "comment": NotRequired[str], "dest": NotRequired[str], "digest": NotRequired[str], "dport": NotRequired[str], "enable": NotRequired[int], "icmp-type": NotRequired[str], "iface": NotRequired[str], "log": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]], "macro": NotRequired[str], "pos": NotRequired[int], "proto": NotRequired[str], "source": NotRequired[str], "sport": NotRequired[str], "type": Literal["in", "out", "forward", "group"]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def rules(self) -> Rules: ...
+
+                        @dataclass
+                        class Aliases:
+                            @dataclass
+                            class Name:
+                                @dataclass
+                                class _Delete:
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    node: str
+                                    vmid: int
+                                    name: str
+                                    Params = typing.TypedDict("Params", {"digest": NotRequired[str]})
+
+                                    def __call__(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                    def model(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                @dataclass
+                                class _Get:
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    node: str
+                                    vmid: int
+                                    name: str
+                                    Params = typing.TypedDict("Params", {})
+
+                                    def __call__(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> dict[str, Any]: ...
+
+                                    def model(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> dict[str, Any]: ...
+
+                                @dataclass
+                                class _Put:
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    node: str
+                                    vmid: int
+                                    name: str
+                                    Params = typing.TypedDict("Params", {"cidr": str, "comment": NotRequired[str], "digest": NotRequired[str], "rename": NotRequired[str]})
+
+                                    def __call__(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                    def model(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                @cached_property
+                                def delete(self) -> _Delete: ...
+
+                                @cached_property
+                                def get(self) -> _Get: ...
+
+                                @cached_property
+                                def put(self) -> _Put: ...
+
+                                @property
+                                def set(self) -> _Put: ...
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                name: str
+
+                            def __call__(self, name: str) -> Name: ...
+
+                            @dataclass
+                            class _Get:
+                                class TypedDict(_Shape_af6cfdcc96b3.TypedDict):
+                                    pass
+
+                                class Model(_Shape_af6cfdcc96b3.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Firewall.Aliases._Get"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list["ProxmoxAPI.Nodes.Node.Lxc.Vmid.Firewall.Aliases._Get.TypedDict"]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list["ProxmoxAPI.Nodes.Node.Lxc.Vmid.Firewall.Aliases._Get.Model"]: ...
+
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {"cidr": str, "comment": NotRequired[str], "name": str})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def aliases(self) -> Aliases: ...
+
+                        @dataclass
+                        class Ipset:
+                            @dataclass
+                            class Name:
+                                @dataclass
+                                class Cidr:
+                                    @dataclass
+                                    class _Delete:
+                                        proxmox_api: ProxmoxerProxmoxAPI
+                                        node: str
+                                        vmid: int
+                                        name: str
+                                        cidr: str
+                                        Params = typing.TypedDict("Params", {"digest": NotRequired[str]})
+
+                                        def __call__(
+                                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                        ) -> None: ...
+
+                                        def model(
+                                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                        ) -> None: ...
+
+                                    @dataclass
+                                    class _Get:
+                                        proxmox_api: ProxmoxerProxmoxAPI
+                                        node: str
+                                        vmid: int
+                                        name: str
+                                        cidr: str
+                                        Params = typing.TypedDict("Params", {})
+
+                                        def __call__(
+                                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                        ) -> dict[str, Any]: ...
+
+                                        def model(
+                                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                        ) -> dict[str, Any]: ...
+
+                                    @dataclass
+                                    class _Put:
+                                        proxmox_api: ProxmoxerProxmoxAPI
+                                        node: str
+                                        vmid: int
+                                        name: str
+                                        cidr: str
+                                        Params = typing.TypedDict("Params", {"comment": NotRequired[str], "digest": NotRequired[str], "nomatch": NotRequired[bool]})
+
+                                        def __call__(
+                                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                        ) -> None: ...
+
+                                        def model(
+                                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                        ) -> None: ...
+
+                                    @cached_property
+                                    def delete(self) -> _Delete: ...
+
+                                    @cached_property
+                                    def get(self) -> _Get: ...
+
+                                    @cached_property
+                                    def put(self) -> _Put: ...
+
+                                    @property
+                                    def set(self) -> _Put: ...
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    node: str
+                                    vmid: int
+                                    name: str
+                                    cidr: str
+
+                                def __call__(self, cidr: str) -> Cidr: ...
+
+                                @dataclass
+                                class _Delete:
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    node: str
+                                    vmid: int
+                                    name: str
+                                    Params = typing.TypedDict("Params", {"force": NotRequired[bool]})
+
+                                    def __call__(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                    def model(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                @dataclass
+                                class _Get:
+                                    class TypedDict(_Shape_f6b6fb110821.TypedDict):
+                                        pass
+
+                                    class Model(_Shape_f6b6fb110821.Model):
+                                        pass
+                                    Model.__name__ = "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Firewall.Ipset.Name._Get"
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    node: str
+                                    vmid: int
+                                    name: str
+                                    Params = typing.TypedDict("Params", {})
+
+                                    def __call__(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> list["ProxmoxAPI.Nodes.Node.Lxc.Vmid.Firewall.Ipset.Name._Get.TypedDict"]: ...
+
+                                    def model(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> list["ProxmoxAPI.Nodes.Node.Lxc.Vmid.Firewall.Ipset.Name._Get.Model"]: ...
+
+                                @dataclass
+                                class _Post:
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    node: str
+                                    vmid: int
+                                    name: str
+                                    Params = typing.TypedDict("Params", {"cidr": str, "comment": NotRequired[str], "nomatch": NotRequired[bool]})
+
+                                    def __call__(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                    def model(
+                                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                    ) -> None: ...
+
+                                @cached_property
+                                def delete(self) -> _Delete: ...
+
+                                @cached_property
+                                def get(self) -> _Get: ...
+
+                                @cached_property
+                                def post(self) -> _Post: ...
+
+                                @property
+                                def create(self) -> _Post: ...
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                name: str
+
+                            def __call__(self, name: str) -> Name: ...
+
+                            @dataclass
+                            class _Get:
+                                class TypedDict(_Shape_709bdb2a6f84.TypedDict):
+                                    pass
+
+                                class Model(_Shape_709bdb2a6f84.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Firewall.Ipset._Get"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list["ProxmoxAPI.Nodes.Node.Lxc.Vmid.Firewall.Ipset._Get.TypedDict"]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list["ProxmoxAPI.Nodes.Node.Lxc.Vmid.Firewall.Ipset._Get.Model"]: ...
+
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {"comment": NotRequired[str], "digest": NotRequired[str], "name": str, "rename": NotRequired[str]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def ipset(self) -> Ipset: ...
+
+                        @dataclass
+                        class Options:
+                            @dataclass
+                            class _Get:
+                                class TypedDict(_Shape_26fca3d62f57.TypedDict):
+                                    pass
+
+                                class Model(_Shape_26fca3d62f57.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Firewall.Options._Get"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Firewall.Options._Get.TypedDict": ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Firewall.Options._Get.Model": ...
+
+                            @dataclass
+                            class _Put:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {"delete": NotRequired[str], "dhcp": NotRequired[bool], "digest": NotRequired[str], "enable": NotRequired[bool], "ipfilter": NotRequired[bool], "log_level_in": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]], "log_level_out": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]], "macfilter": NotRequired[bool], "ndp": NotRequired[bool], "policy_in": NotRequired[Literal["ACCEPT", "REJECT", "DROP"]], "policy_out": NotRequired[Literal["ACCEPT", "REJECT", "DROP"]], "radv": NotRequired[bool]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+
+                            @cached_property
+                            def put(self) -> _Put: ...
+
+                            @property
+                            def set(self) -> _Put: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def options(self) -> Options: ...
+
+                        @dataclass
+                        class Log:
+                            @dataclass
+                            class _Get:
+                                class TypedDict(_Shape_b560f719f833.TypedDict):
+                                    pass
+
+                                class Model(_Shape_b560f719f833.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Firewall.Log._Get"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {"limit": NotRequired[int], "since": NotRequired[int], "start": NotRequired[int], "until": NotRequired[int]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list["ProxmoxAPI.Nodes.Node.Lxc.Vmid.Firewall.Log._Get.TypedDict"]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list["ProxmoxAPI.Nodes.Node.Lxc.Vmid.Firewall.Log._Get.Model"]: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def log(self) -> Log: ...
+
+                        @dataclass
+                        class Refs:
+                            @dataclass
+                            class _Get:
+                                class TypedDict(_Shape_3ff2000df841.TypedDict):
+                                    pass
+
+                                class Model(_Shape_3ff2000df841.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Firewall.Refs._Get"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                                Params = typing.TypedDict("Params", {"type": NotRequired[Literal["alias", "ipset"]]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list["ProxmoxAPI.Nodes.Node.Lxc.Vmid.Firewall.Refs._Get.TypedDict"]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list["ProxmoxAPI.Nodes.Node.Lxc.Vmid.Firewall.Refs._Get.Model"]: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+
+                        @cached_property
+                        def refs(self) -> Refs: ...
+
+                        @dataclass
+                        class _Get:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list[dict[str, Any]]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list[dict[str, Any]]: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def firewall(self) -> Firewall: ...
+
+                    @dataclass
+                    class Rrd:
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_195e3c884669.TypedDict):
+                                pass
+
+                            class Model(_Shape_195e3c884669.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Rrd._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"cf": NotRequired[Literal["AVERAGE", "MAX"]], "ds": str, "timeframe": Literal["hour", "day", "week", "month", "year"]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Rrd._Get.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Rrd._Get.Model": ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def rrd(self) -> Rrd: ...
+
+                    @dataclass
+                    class Rrddata:
+                        @dataclass
+                        class _Get:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"cf": NotRequired[Literal["AVERAGE", "MAX"]], "timeframe": Literal["hour", "day", "week", "month", "year"]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list[dict[str, Any]]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list[dict[str, Any]]: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def rrddata(self) -> Rrddata: ...
+
+                    @dataclass
+                    class Vncproxy:
+                        @dataclass
+                        class _Post:
+                            class TypedDict(_Shape_4e7fdf7cf155.TypedDict):
+                                pass
+
+                            class Model(_Shape_4e7fdf7cf155.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Vncproxy._Post"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"height": NotRequired[int], "websocket": NotRequired[bool], "width": NotRequired[int]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Vncproxy._Post.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Vncproxy._Post.Model": ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def vncproxy(self) -> Vncproxy: ...
+
+                    @dataclass
+                    class Termproxy:
+                        @dataclass
+                        class _Post:
+                            class TypedDict(_Shape_c3611ee60687.TypedDict):
+                                pass
+
+                            class Model(_Shape_c3611ee60687.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Termproxy._Post"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Termproxy._Post.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Termproxy._Post.Model": ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def termproxy(self) -> Termproxy: ...
+
+                    @dataclass
+                    class Vncwebsocket:
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_12b5d7d6b00b.TypedDict):
+                                pass
+
+                            class Model(_Shape_12b5d7d6b00b.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Vncwebsocket._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"port": int, "vncticket": str})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Vncwebsocket._Get.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Vncwebsocket._Get.Model": ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def vncwebsocket(self) -> Vncwebsocket: ...
+
+                    @dataclass
+                    class Spiceproxy:
+                        @dataclass
+                        class _Post:
+                            class TypedDict(_Shape_dc8364425177.TypedDict):
+                                pass
+
+                            class Model(_Shape_dc8364425177.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Spiceproxy._Post"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"proxy": NotRequired[str]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Spiceproxy._Post.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Spiceproxy._Post.Model": ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def spiceproxy(self) -> Spiceproxy: ...
+
+                    @dataclass
+                    class RemoteMigrate:
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"bwlimit": NotRequired[float], "delete": NotRequired[bool], "online": NotRequired[bool], "restart": NotRequired[bool], "target-bridge": str, "target-endpoint": str, "target-storage": str, "target-vmid": NotRequired[int], "timeout": NotRequired[int]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def remote_migrate(self) -> RemoteMigrate: ...
+
+                    @dataclass
+                    class Migrate:
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"bwlimit": NotRequired[float], "online": NotRequired[bool], "restart": NotRequired[bool], "target": str, "target-storage": NotRequired[str], "timeout": NotRequired[int]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def migrate(self) -> Migrate: ...
+
+                    @dataclass
+                    class Feature:
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_05b47b521e27.TypedDict):
+                                pass
+
+                            class Model(_Shape_05b47b521e27.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Feature._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"feature": Literal["snapshot", "clone", "copy"], "snapname": NotRequired[str]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Feature._Get.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Feature._Get.Model": ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def feature(self) -> Feature: ...
+
+                    @dataclass
+                    class Template:
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def template(self) -> Template: ...
+
+                    @dataclass
+                    class Clone:
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"bwlimit": NotRequired[float], "description": NotRequired[str], "full": NotRequired[bool], "hostname": NotRequired[str], "newid": int, "pool": NotRequired[str], "snapname": NotRequired[str], "storage": NotRequired[str], "target": NotRequired[str]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def clone(self) -> Clone: ...
+
+                    @dataclass
+                    class Resize:
+                        @dataclass
+                        class _Put:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"digest": NotRequired[str], "disk": Literal["rootfs", "mp0", "mp1", "mp2", "mp3", "mp4", "mp5", "mp6", "mp7", "mp8", "mp9", "mp10", "mp11", "mp12", "mp13", "mp14", "mp15", "mp16", "mp17", "mp18", "mp19", "mp20", "mp21", "mp22", "mp23", "mp24", "mp25", "mp26", "mp27", "mp28", "mp29", "mp30", "mp31", "mp32", "mp33", "mp34", "mp35", "mp36", "mp37", "mp38", "mp39", "mp40", "mp41", "mp42", "mp43", "mp44", "mp45", "mp46", "mp47", "mp48", "mp49", "mp50", "mp51", "mp52", "mp53", "mp54", "mp55", "mp56", "mp57", "mp58", "mp59", "mp60", "mp61", "mp62", "mp63", "mp64", "mp65", "mp66", "mp67", "mp68", "mp69", "mp70", "mp71", "mp72", "mp73", "mp74", "mp75", "mp76", "mp77", "mp78", "mp79", "mp80", "mp81", "mp82", "mp83", "mp84", "mp85", "mp86", "mp87", "mp88", "mp89", "mp90", "mp91", "mp92", "mp93", "mp94", "mp95", "mp96", "mp97", "mp98", "mp99", "mp100", "mp101", "mp102", "mp103", "mp104", "mp105", "mp106", "mp107", "mp108", "mp109", "mp110", "mp111", "mp112", "mp113", "mp114", "mp115", "mp116", "mp117", "mp118", "mp119", "mp120", "mp121", "mp122", "mp123", "mp124", "mp125", "mp126", "mp127", "mp128", "mp129", "mp130", "mp131", "mp132", "mp133", "mp134", "mp135", "mp136", "mp137", "mp138", "mp139", "mp140", "mp141", "mp142", "mp143", "mp144", "mp145", "mp146", "mp147", "mp148", "mp149", "mp150", "mp151", "mp152", "mp153", "mp154", "mp155", "mp156", "mp157", "mp158", "mp159", "mp160", "mp161", "mp162", "mp163", "mp164", "mp165", "mp166", "mp167", "mp168", "mp169", "mp170", "mp171", "mp172", "mp173", "mp174", "mp175", "mp176", "mp177", "mp178", "mp179", "mp180", "mp181", "mp182", "mp183", "mp184", "mp185", "mp186", "mp187", "mp188", "mp189", "mp190", "mp191", "mp192", "mp193", "mp194", "mp195", "mp196", "mp197", "mp198", "mp199", "mp200", "mp201", "mp202", "mp203", "mp204", "mp205", "mp206", "mp207", "mp208", "mp209", "mp210", "mp211", "mp212", "mp213", "mp214", "mp215", "mp216", "mp217", "mp218", "mp219", "mp220", "mp221", "mp222", "mp223", "mp224", "mp225", "mp226", "mp227", "mp228", "mp229", "mp230", "mp231", "mp232", "mp233", "mp234", "mp235", "mp236", "mp237", "mp238", "mp239", "mp240", "mp241", "mp242", "mp243", "mp244", "mp245", "mp246", "mp247", "mp248", "mp249", "mp250", "mp251", "mp252", "mp253", "mp254", "mp255"], "size": str})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def put(self) -> _Put: ...
+
+                        @property
+                        def set(self) -> _Put: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def resize(self) -> Resize: ...
+
+                    @dataclass
+                    class MoveVolume:
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"bwlimit": NotRequired[float], "delete": NotRequired[bool], "digest": NotRequired[str], "storage": NotRequired[str], "target-digest": NotRequired[str], "target-vmid": NotRequired[int], "target-volume": NotRequired[Literal["rootfs", "mp0", "mp1", "mp2", "mp3", "mp4", "mp5", "mp6", "mp7", "mp8", "mp9", "mp10", "mp11", "mp12", "mp13", "mp14", "mp15", "mp16", "mp17", "mp18", "mp19", "mp20", "mp21", "mp22", "mp23", "mp24", "mp25", "mp26", "mp27", "mp28", "mp29", "mp30", "mp31", "mp32", "mp33", "mp34", "mp35", "mp36", "mp37", "mp38", "mp39", "mp40", "mp41", "mp42", "mp43", "mp44", "mp45", "mp46", "mp47", "mp48", "mp49", "mp50", "mp51", "mp52", "mp53", "mp54", "mp55", "mp56", "mp57", "mp58", "mp59", "mp60", "mp61", "mp62", "mp63", "mp64", "mp65", "mp66", "mp67", "mp68", "mp69", "mp70", "mp71", "mp72", "mp73", "mp74", "mp75", "mp76", "mp77", "mp78", "mp79", "mp80", "mp81", "mp82", "mp83", "mp84", "mp85", "mp86", "mp87", "mp88", "mp89", "mp90", "mp91", "mp92", "mp93", "mp94", "mp95", "mp96", "mp97", "mp98", "mp99", "mp100", "mp101", "mp102", "mp103", "mp104", "mp105", "mp106", "mp107", "mp108", "mp109", "mp110", "mp111", "mp112", "mp113", "mp114", "mp115", "mp116", "mp117", "mp118", "mp119", "mp120", "mp121", "mp122", "mp123", "mp124", "mp125", "mp126", "mp127", "mp128", "mp129", "mp130", "mp131", "mp132", "mp133", "mp134", "mp135", "mp136", "mp137", "mp138", "mp139", "mp140", "mp141", "mp142", "mp143", "mp144", "mp145", "mp146", "mp147", "mp148", "mp149", "mp150", "mp151", "mp152", "mp153", "mp154", "mp155", "mp156", "mp157", "mp158", "mp159", "mp160", "mp161", "mp162", "mp163", "mp164", "mp165", "mp166", "mp167", "mp168", "mp169", "mp170", "mp171", "mp172", "mp173", "mp174", "mp175", "mp176", "mp177", "mp178", "mp179", "mp180", "mp181", "mp182", "mp183", "mp184", "mp185", "mp186", "mp187", "mp188", "mp189", "mp190", "mp191", "mp192", "mp193", "mp194", "mp195", "mp196", "mp197", "mp198", "mp199", "mp200", "mp201", "mp202", "mp203", "mp204", "mp205", "mp206", "mp207", "mp208", "mp209", "mp210", "mp211", "mp212", "mp213", "mp214", "mp215", "mp216", "mp217", "mp218", "mp219", "mp220", "mp221", "mp222", "mp223", "mp224", "mp225", "mp226", "mp227", "mp228", "mp229", "mp230", "mp231", "mp232", "mp233", "mp234", "mp235", "mp236", "mp237", "mp238", "mp239", "mp240", "mp241", "mp242", "mp243", "mp244", "mp245", "mp246", "mp247", "mp248", "mp249", "mp250", "mp251", "mp252", "mp253", "mp254", "mp255", "unused0", "unused1", "unused2", "unused3", "unused4", "unused5", "unused6", "unused7", "unused8", "unused9", "unused10", "unused11", "unused12", "unused13", "unused14", "unused15", "unused16", "unused17", "unused18", "unused19", "unused20", "unused21", "unused22", "unused23", "unused24", "unused25", "unused26", "unused27", "unused28", "unused29", "unused30", "unused31", "unused32", "unused33", "unused34", "unused35", "unused36", "unused37", "unused38", "unused39", "unused40", "unused41", "unused42", "unused43", "unused44", "unused45", "unused46", "unused47", "unused48", "unused49", "unused50", "unused51", "unused52", "unused53", "unused54", "unused55", "unused56", "unused57", "unused58", "unused59", "unused60", "unused61", "unused62", "unused63", "unused64", "unused65", "unused66", "unused67", "unused68", "unused69", "unused70", "unused71", "unused72", "unused73", "unused74", "unused75", "unused76", "unused77", "unused78", "unused79", "unused80", "unused81", "unused82", "unused83", "unused84", "unused85", "unused86", "unused87", "unused88", "unused89", "unused90", "unused91", "unused92", "unused93", "unused94", "unused95", "unused96", "unused97", "unused98", "unused99", "unused100", "unused101", "unused102", "unused103", "unused104", "unused105", "unused106", "unused107", "unused108", "unused109", "unused110", "unused111", "unused112", "unused113", "unused114", "unused115", "unused116", "unused117", "unused118", "unused119", "unused120", "unused121", "unused122", "unused123", "unused124", "unused125", "unused126", "unused127", "unused128", "unused129", "unused130", "unused131", "unused132", "unused133", "unused134", "unused135", "unused136", "unused137", "unused138", "unused139", "unused140", "unused141", "unused142", "unused143", "unused144", "unused145", "unused146", "unused147", "unused148", "unused149", "unused150", "unused151", "unused152", "unused153", "unused154", "unused155", "unused156", "unused157", "unused158", "unused159", "unused160", "unused161", "unused162", "unused163", "unused164", "unused165", "unused166", "unused167", "unused168", "unused169", "unused170", "unused171", "unused172", "unused173", "unused174", "unused175", "unused176", "unused177", "unused178", "unused179", "unused180", "unused181", "unused182", "unused183", "unused184", "unused185", "unused186", "unused187", "unused188", "unused189", "unused190", "unused191", "unused192", "unused193", "unused194", "unused195", "unused196", "unused197", "unused198", "unused199", "unused200", "unused201", "unused202", "unused203", "unused204", "unused205", "unused206", "unused207", "unused208", "unused209", "unused210", "unused211", "unused212", "unused213", "unused214", "unused215", "unused216", "unused217", "unused218", "unused219", "unused220", "unused221", "unused222", "unused223", "unused224", "unused225", "unused226", "unused227", "unused228", "unused229", "unused230", "unused231", "unused232", "unused233", "unused234", "unused235", "unused236", "unused237", "unused238", "unused239", "unused240", "unused241", "unused242", "unused243", "unused244", "unused245", "unused246", "unused247", "unused248", "unused249", "unused250", "unused251", "unused252", "unused253", "unused254", "unused255"]], "volume": Literal["rootfs", "mp0", "mp1", "mp2", "mp3", "mp4", "mp5", "mp6", "mp7", "mp8", "mp9", "mp10", "mp11", "mp12", "mp13", "mp14", "mp15", "mp16", "mp17", "mp18", "mp19", "mp20", "mp21", "mp22", "mp23", "mp24", "mp25", "mp26", "mp27", "mp28", "mp29", "mp30", "mp31", "mp32", "mp33", "mp34", "mp35", "mp36", "mp37", "mp38", "mp39", "mp40", "mp41", "mp42", "mp43", "mp44", "mp45", "mp46", "mp47", "mp48", "mp49", "mp50", "mp51", "mp52", "mp53", "mp54", "mp55", "mp56", "mp57", "mp58", "mp59", "mp60", "mp61", "mp62", "mp63", "mp64", "mp65", "mp66", "mp67", "mp68", "mp69", "mp70", "mp71", "mp72", "mp73", "mp74", "mp75", "mp76", "mp77", "mp78", "mp79", "mp80", "mp81", "mp82", "mp83", "mp84", "mp85", "mp86", "mp87", "mp88", "mp89", "mp90", "mp91", "mp92", "mp93", "mp94", "mp95", "mp96", "mp97", "mp98", "mp99", "mp100", "mp101", "mp102", "mp103", "mp104", "mp105", "mp106", "mp107", "mp108", "mp109", "mp110", "mp111", "mp112", "mp113", "mp114", "mp115", "mp116", "mp117", "mp118", "mp119", "mp120", "mp121", "mp122", "mp123", "mp124", "mp125", "mp126", "mp127", "mp128", "mp129", "mp130", "mp131", "mp132", "mp133", "mp134", "mp135", "mp136", "mp137", "mp138", "mp139", "mp140", "mp141", "mp142", "mp143", "mp144", "mp145", "mp146", "mp147", "mp148", "mp149", "mp150", "mp151", "mp152", "mp153", "mp154", "mp155", "mp156", "mp157", "mp158", "mp159", "mp160", "mp161", "mp162", "mp163", "mp164", "mp165", "mp166", "mp167", "mp168", "mp169", "mp170", "mp171", "mp172", "mp173", "mp174", "mp175", "mp176", "mp177", "mp178", "mp179", "mp180", "mp181", "mp182", "mp183", "mp184", "mp185", "mp186", "mp187", "mp188", "mp189", "mp190", "mp191", "mp192", "mp193", "mp194", "mp195", "mp196", "mp197", "mp198", "mp199", "mp200", "mp201", "mp202", "mp203", "mp204", "mp205", "mp206", "mp207", "mp208", "mp209", "mp210", "mp211", "mp212", "mp213", "mp214", "mp215", "mp216", "mp217", "mp218", "mp219", "mp220", "mp221", "mp222", "mp223", "mp224", "mp225", "mp226", "mp227", "mp228", "mp229", "mp230", "mp231", "mp232", "mp233", "mp234", "mp235", "mp236", "mp237", "mp238", "mp239", "mp240", "mp241", "mp242", "mp243", "mp244", "mp245", "mp246", "mp247", "mp248", "mp249", "mp250", "mp251", "mp252", "mp253", "mp254", "mp255", "unused0", "unused1", "unused2", "unused3", "unused4", "unused5", "unused6", "unused7", "unused8", "unused9", "unused10", "unused11", "unused12", "unused13", "unused14", "unused15", "unused16", "unused17", "unused18", "unused19", "unused20", "unused21", "unused22", "unused23", "unused24", "unused25", "unused26", "unused27", "unused28", "unused29", "unused30", "unused31", "unused32", "unused33", "unused34", "unused35", "unused36", "unused37", "unused38", "unused39", "unused40", "unused41", "unused42", "unused43", "unused44", "unused45", "unused46", "unused47", "unused48", "unused49", "unused50", "unused51", "unused52", "unused53", "unused54", "unused55", "unused56", "unused57", "unused58", "unused59", "unused60", "unused61", "unused62", "unused63", "unused64", "unused65", "unused66", "unused67", "unused68", "unused69", "unused70", "unused71", "unused72", "unused73", "unused74", "unused75", "unused76", "unused77", "unused78", "unused79", "unused80", "unused81", "unused82", "unused83", "unused84", "unused85", "unused86", "unused87", "unused88", "unused89", "unused90", "unused91", "unused92", "unused93", "unused94", "unused95", "unused96", "unused97", "unused98", "unused99", "unused100", "unused101", "unused102", "unused103", "unused104", "unused105", "unused106", "unused107", "unused108", "unused109", "unused110", "unused111", "unused112", "unused113", "unused114", "unused115", "unused116", "unused117", "unused118", "unused119", "unused120", "unused121", "unused122", "unused123", "unused124", "unused125", "unused126", "unused127", "unused128", "unused129", "unused130", "unused131", "unused132", "unused133", "unused134", "unused135", "unused136", "unused137", "unused138", "unused139", "unused140", "unused141", "unused142", "unused143", "unused144", "unused145", "unused146", "unused147", "unused148", "unused149", "unused150", "unused151", "unused152", "unused153", "unused154", "unused155", "unused156", "unused157", "unused158", "unused159", "unused160", "unused161", "unused162", "unused163", "unused164", "unused165", "unused166", "unused167", "unused168", "unused169", "unused170", "unused171", "unused172", "unused173", "unused174", "unused175", "unused176", "unused177", "unused178", "unused179", "unused180", "unused181", "unused182", "unused183", "unused184", "unused185", "unused186", "unused187", "unused188", "unused189", "unused190", "unused191", "unused192", "unused193", "unused194", "unused195", "unused196", "unused197", "unused198", "unused199", "unused200", "unused201", "unused202", "unused203", "unused204", "unused205", "unused206", "unused207", "unused208", "unused209", "unused210", "unused211", "unused212", "unused213", "unused214", "unused215", "unused216", "unused217", "unused218", "unused219", "unused220", "unused221", "unused222", "unused223", "unused224", "unused225", "unused226", "unused227", "unused228", "unused229", "unused230", "unused231", "unused232", "unused233", "unused234", "unused235", "unused236", "unused237", "unused238", "unused239", "unused240", "unused241", "unused242", "unused243", "unused244", "unused245", "unused246", "unused247", "unused248", "unused249", "unused250", "unused251", "unused252", "unused253", "unused254", "unused255"]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def move_volume(self) -> MoveVolume: ...
+
+                    @dataclass
+                    class Pending:
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_bacc4da88340.TypedDict):
+                                pass
+
+                            class Model(_Shape_bacc4da88340.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Pending._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Lxc.Vmid.Pending._Get.TypedDict"]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Lxc.Vmid.Pending._Get.Model"]: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def pending(self) -> Pending: ...
+
+                    @dataclass
+                    class Interfaces:
+                        @dataclass
+                        class _Get:
+                            @dataclass
+                            class _IpAddresses:
+                                class TypedDict(_Shape_69dcd3c4fa4b.TypedDict):
+                                    pass
+
+                                class Model(_Shape_69dcd3c4fa4b.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Interfaces._Get._IpAddresses"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                vmid: int
+                            TypedDict = typing.TypedDict("TypedDict", {"hardware-address": str, "hwaddr": str, "inet": NotRequired[str], "inet6": NotRequired[str], "ip-addresses": list["ProxmoxAPI.Nodes.Node.Lxc.Vmid.Interfaces._Get._IpAddresses.TypedDict"], "name": str})
+
+                            class Model(BaseModel):
+                                hardware_address: str = pydantic.Field(alias="hardware-address")
+                                hwaddr: str
+                                inet: Optional[str] = None
+                                inet6: Optional[str] = None
+                                ip_addresses: list["ProxmoxAPI.Nodes.Node.Lxc.Vmid.Interfaces._Get._IpAddresses.Model"] = pydantic.Field(alias="ip-addresses")
+                                name: str
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Interfaces._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Lxc.Vmid.Interfaces._Get.TypedDict"]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Lxc.Vmid.Interfaces._Get.Model"]: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def interfaces(self) -> Interfaces: ...
+
+                    @dataclass
+                    class Mtunnel:
+                        @dataclass
+                        class _Post:
+                            class TypedDict(_Shape_4cc707acfd15.TypedDict):
+                                pass
+
+                            class Model(_Shape_4cc707acfd15.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Mtunnel._Post"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"bridges": NotRequired[str], "storages": NotRequired[str]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Mtunnel._Post.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Mtunnel._Post.Model": ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def mtunnel(self) -> Mtunnel: ...
+
+                    @dataclass
+                    class Mtunnelwebsocket:
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_c2b2dde606ed.TypedDict):
+                                pass
+
+                            class Model(_Shape_c2b2dde606ed.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Mtunnelwebsocket._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            vmid: int
+                            Params = typing.TypedDict("Params", {"socket": str, "ticket": str})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Mtunnelwebsocket._Get.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Lxc.Vmid.Mtunnelwebsocket._Get.Model": ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+
+                    @cached_property
+                    def mtunnelwebsocket(self) -> Mtunnelwebsocket: ...
+
+                    @dataclass
+                    class _Delete:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+                        Params = typing.TypedDict("Params", {"destroy-unreferenced-disks": NotRequired[bool], "force": NotRequired[bool], "purge": NotRequired[bool]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_21168c7817dc.TypedDict):
+                            pass
+
+                        class Model(_Shape_21168c7817dc.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Lxc.Vmid._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        vmid: int
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Lxc.Vmid._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Lxc.Vmid._Get.Model"]: ...
+
+                    @cached_property
+                    def delete(self) -> _Delete: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    vmid: int
+
+                def __call__(self, vmid: int) -> Vmid: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_04f5bfc18ba2.TypedDict):
+                        pass
+
+                    class Model(_Shape_04f5bfc18ba2.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Nodes.Node.Lxc._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Nodes.Node.Lxc._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Nodes.Node.Lxc._Get.Model"]: ...
+
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"arch": NotRequired[Literal["amd64", "i386", "arm64", "armhf", "riscv32", "riscv64"]], "bwlimit": NotRequired[float], "cmode": NotRequired[Literal["shell", "console", "tty"]], "console": NotRequired[bool], "cores": NotRequired[int], "cpulimit": NotRequired[float], "cpuunits": NotRequired[int], "debug": NotRequired[bool], "description": NotRequired[str], "features": NotRequired[str], "force": NotRequired[bool], "hookscript": NotRequired[str], "hostname": NotRequired[str], "ignore-unpack-errors": NotRequired[bool], "lock": NotRequired[Literal["backup", "create", "destroyed", "disk", "fstrim", "migrate", "mounted", "rollback", "snapshot", "snapshot-delete"]], "memory": NotRequired[int], "nameserver": NotRequired[str], "onboot": NotRequired[bool], "ostemplate": str, "ostype": NotRequired[Literal["debian", "devuan", "ubuntu", "centos", "fedora", "opensuse", "archlinux", "alpine", "gentoo", "nixos", "unmanaged"]], "password": NotRequired[str], "pool": NotRequired[str], "protection": NotRequired[bool], "restore": NotRequired[bool], "rootfs": NotRequired[str], "searchdomain": NotRequired[str], "ssh-public-keys": NotRequired[str], "start": NotRequired[bool], "startup": NotRequired[str], "storage": NotRequired[str], "swap": NotRequired[int], "tags": NotRequired[str], "template": NotRequired[bool], "timezone": NotRequired[str], "tty": NotRequired[int], "unique": NotRequired[bool], "unprivileged": NotRequired[bool], "vmid": int})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Any
+                    ) -> str: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Any
+                    ) -> str: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def lxc(self) -> Lxc: ...
+
+            @dataclass
+            class Ceph:
+                @dataclass
+                class Cfg:
+                    @dataclass
+                    class Raw:
+                        @dataclass
+                        class _Get:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+
+                    @cached_property
+                    def raw(self) -> Raw: ...
+
+                    @dataclass
+                    class Db:
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_b45bfead8f69.TypedDict):
+                                pass
+
+                            class Model(_Shape_b45bfead8f69.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Ceph.Cfg.Db._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Ceph.Cfg.Db._Get.TypedDict"]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Ceph.Cfg.Db._Get.Model"]: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+
+                    @cached_property
+                    def db(self) -> Db: ...
+
+                    @dataclass
+                    class Value:
+                        @dataclass
+                        class _Get:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            Params = typing.TypedDict("Params", {"config-keys": str})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> dict[str, Any]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> dict[str, Any]: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+
+                    @cached_property
+                    def value(self) -> Value: ...
+
+                    @dataclass
+                    class _Get:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list[dict[str, Any]]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list[dict[str, Any]]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def cfg(self) -> Cfg: ...
+
+                @dataclass
+                class Osd:
+                    @dataclass
+                    class Osdid:
+                        @dataclass
+                        class Metadata:
+                            @dataclass
+                            class _Get:
+                                @dataclass
+                                class _Devices:
+                                    class TypedDict(_Shape_c878c26ec1c0.TypedDict):
+                                        pass
+
+                                    class Model(_Shape_c878c26ec1c0.Model):
+                                        pass
+                                    Model.__name__ = "ProxmoxAPI.Nodes.Node.Ceph.Osd.Osdid.Metadata._Get._Devices"
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    node: str
+                                    osdid: int
+
+                                @dataclass
+                                class _Osd:
+                                    class TypedDict(_Shape_e5ada466df01.TypedDict):
+                                        pass
+
+                                    class Model(_Shape_e5ada466df01.Model):
+                                        pass
+                                    Model.__name__ = "ProxmoxAPI.Nodes.Node.Ceph.Osd.Osdid.Metadata._Get._Osd"
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    node: str
+                                    osdid: int
+                                TypedDict = typing.TypedDict("TypedDict", {"devices": list["ProxmoxAPI.Nodes.Node.Ceph.Osd.Osdid.Metadata._Get._Devices.TypedDict"], "osd": "ProxmoxAPI.Nodes.Node.Ceph.Osd.Osdid.Metadata._Get._Osd.TypedDict"})
+
+                                class Model(BaseModel):
+                                    devices: list["ProxmoxAPI.Nodes.Node.Ceph.Osd.Osdid.Metadata._Get._Devices.Model"]
+                                    osd: "ProxmoxAPI.Nodes.Node.Ceph.Osd.Osdid.Metadata._Get._Osd.Model"
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Ceph.Osd.Osdid.Metadata._Get"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                osdid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> "ProxmoxAPI.Nodes.Node.Ceph.Osd.Osdid.Metadata._Get.TypedDict": ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> "ProxmoxAPI.Nodes.Node.Ceph.Osd.Osdid.Metadata._Get.Model": ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            osdid: int
+
+                        @cached_property
+                        def metadata(self) -> Metadata: ...
+
+                        @dataclass
+                        class LvInfo:
+                            @dataclass
+                            class _Get:
+                                class TypedDict(_Shape_2af89e151d82.TypedDict):
+                                    pass
+
+                                class Model(_Shape_2af89e151d82.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Ceph.Osd.Osdid.LvInfo._Get"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                osdid: int
+                                Params = typing.TypedDict("Params", {"type": NotRequired[Literal["block", "db", "wal"]]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> "ProxmoxAPI.Nodes.Node.Ceph.Osd.Osdid.LvInfo._Get.TypedDict": ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> "ProxmoxAPI.Nodes.Node.Ceph.Osd.Osdid.LvInfo._Get.Model": ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            osdid: int
+
+                        @cached_property
+                        def lv_info(self) -> LvInfo: ...
+
+                        @dataclass
+                        class In:
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                osdid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            osdid: int
+
+                        @cached_property
+                        def in_(self) -> In: ...
+
+                        @dataclass
+                        class Out:
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                osdid: int
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            osdid: int
+
+                        @cached_property
+                        def out(self) -> Out: ...
+
+                        @dataclass
+                        class Scrub:
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                osdid: int
+                                Params = typing.TypedDict("Params", {"deep": NotRequired[bool]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            osdid: int
+
+                        @cached_property
+                        def scrub(self) -> Scrub: ...
+
+                        @dataclass
+                        class _Delete:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            osdid: int
+                            Params = typing.TypedDict("Params", {"cleanup": NotRequired[bool]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @dataclass
+                        class _Get:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            osdid: int
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list[dict[str, Any]]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list[dict[str, Any]]: ...
+
+                        @cached_property
+                        def delete(self) -> _Delete: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        osdid: int
+
+                    def __call__(self, osdid: int) -> Osdid: ...
+
+                    @dataclass
+                    class _Get:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                    @dataclass
+                    class _Post:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"crush-device-class": NotRequired[str], "db_dev": NotRequired[str], "db_dev_size": NotRequired[float], "dev": str, "encrypted": NotRequired[bool], "osds-per-device": NotRequired[int], "wal_dev": NotRequired[str], "wal_dev_size": NotRequired[float]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def post(self) -> _Post: ...
+
+                    @property
+                    def create(self) -> _Post: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def osd(self) -> Osd: ...
+
+                @dataclass
+                class Mds:
+                    @dataclass
+                    class Name:
+                        @dataclass
+                        class _Delete:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            name: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            name: str
+                            Params = typing.TypedDict("Params", {"hotstandby": NotRequired[bool]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def delete(self) -> _Delete: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        name: str
+
+                    def __call__(self, name: str) -> Name: ...
+
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_1e2723a34102.TypedDict):
+                            pass
+
+                        class Model(_Shape_1e2723a34102.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Ceph.Mds._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Ceph.Mds._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Ceph.Mds._Get.Model"]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def mds(self) -> Mds: ...
+
+                @dataclass
+                class Mgr:
+                    @dataclass
+                    class Id:
+                        @dataclass
+                        class _Delete:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            id: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            id: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def delete(self) -> _Delete: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        id: str
+
+                    def __call__(self, id: str) -> Id: ...
+
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_ad6c326538dd.TypedDict):
+                            pass
+
+                        class Model(_Shape_ad6c326538dd.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Ceph.Mgr._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Ceph.Mgr._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Ceph.Mgr._Get.Model"]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def mgr(self) -> Mgr: ...
+
+                @dataclass
+                class Mon:
+                    @dataclass
+                    class Monid:
+                        @dataclass
+                        class _Delete:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            monid: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            monid: str
+                            Params = typing.TypedDict("Params", {"mon-address": NotRequired[str]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def delete(self) -> _Delete: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        monid: str
+
+                    def __call__(self, monid: str) -> Monid: ...
+
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_0aa8c9ab0cf3.TypedDict):
+                            pass
+
+                        class Model(_Shape_0aa8c9ab0cf3.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Ceph.Mon._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Ceph.Mon._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Ceph.Mon._Get.Model"]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def mon(self) -> Mon: ...
+
+                @dataclass
+                class Fs:
+                    @dataclass
+                    class Name:
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            name: str
+                            Params = typing.TypedDict("Params", {"add-storage": NotRequired[bool], "pg_num": NotRequired[int]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        name: str
+
+                    def __call__(self, name: str) -> Name: ...
+
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_dfc500b7464e.TypedDict):
+                            pass
+
+                        class Model(_Shape_dfc500b7464e.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Ceph.Fs._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Ceph.Fs._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Ceph.Fs._Get.Model"]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def fs(self) -> Fs: ...
+
+                @dataclass
+                class Pool:
+                    @dataclass
+                    class Name:
+                        @dataclass
+                        class Status:
+                            @dataclass
+                            class _Get:
+                                class TypedDict(_Shape_7835b5fa0cd8.TypedDict):
+                                    pass
+
+                                class Model(_Shape_7835b5fa0cd8.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Ceph.Pool.Name.Status._Get"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                name: str
+                                Params = typing.TypedDict("Params", {"verbose": NotRequired[bool]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> "ProxmoxAPI.Nodes.Node.Ceph.Pool.Name.Status._Get.TypedDict": ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> "ProxmoxAPI.Nodes.Node.Ceph.Pool.Name.Status._Get.Model": ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            name: str
+
+                        @cached_property
+                        def status(self) -> Status: ...
+
+                        @dataclass
+                        class _Delete:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            name: str
+                            Params = typing.TypedDict("Params", {"force": NotRequired[bool], "remove_ecprofile": NotRequired[bool], "remove_storages": NotRequired[bool]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @dataclass
+                        class _Get:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            name: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list[dict[str, Any]]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list[dict[str, Any]]: ...
+
+                        @dataclass
+                        class _Put:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            name: str
+                            Params = typing.TypedDict("Params", {"application": NotRequired[Literal["rbd", "cephfs", "rgw"]], "crush_rule": NotRequired[str], "min_size": NotRequired[int], "pg_autoscale_mode": NotRequired[Literal["on", "off", "warn"]], "pg_num": NotRequired[int], "pg_num_min": NotRequired[int], "size": NotRequired[int], "target_size": NotRequired[str], "target_size_ratio": NotRequired[float]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def delete(self) -> _Delete: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+
+                        @cached_property
+                        def put(self) -> _Put: ...
+
+                        @property
+                        def set(self) -> _Put: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        name: str
+
+                    def __call__(self, name: str) -> Name: ...
+
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_c5362201c150.TypedDict):
+                            pass
+
+                        class Model(_Shape_c5362201c150.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Ceph.Pool._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Ceph.Pool._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Ceph.Pool._Get.Model"]: ...
+
+                    @dataclass
+                    class _Post:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"add_storages": NotRequired[bool], "application": NotRequired[Literal["rbd", "cephfs", "rgw"]], "crush_rule": NotRequired[str], "erasure-coding": NotRequired[str], "min_size": NotRequired[int], "name": str, "pg_autoscale_mode": NotRequired[Literal["on", "off", "warn"]], "pg_num": NotRequired[int], "pg_num_min": NotRequired[int], "size": NotRequired[int], "target_size": NotRequired[str], "target_size_ratio": NotRequired[float]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def post(self) -> _Post: ...
+
+                    @property
+                    def create(self) -> _Post: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def pool(self) -> Pool: ...
+
+                @dataclass
+                class Init:
+                    @dataclass
+                    class _Post:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"cluster-network": NotRequired[str], "disable_cephx": NotRequired[bool], "min_size": NotRequired[int], "network": NotRequired[str], "pg_bits": NotRequired[int], "size": NotRequired[int]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @cached_property
+                    def post(self) -> _Post: ...
+
+                    @property
+                    def create(self) -> _Post: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def init(self) -> Init: ...
+
+                @dataclass
+                class Stop:
+                    @dataclass
+                    class _Post:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"service": NotRequired[str]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                    @cached_property
+                    def post(self) -> _Post: ...
+
+                    @property
+                    def create(self) -> _Post: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def stop(self) -> Stop: ...
+
+                @dataclass
+                class Start:
+                    @dataclass
+                    class _Post:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"service": NotRequired[str]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                    @cached_property
+                    def post(self) -> _Post: ...
+
+                    @property
+                    def create(self) -> _Post: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def start(self) -> Start: ...
+
+                @dataclass
+                class Restart:
+                    @dataclass
+                    class _Post:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"service": NotRequired[str]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                    @cached_property
+                    def post(self) -> _Post: ...
+
+                    @property
+                    def create(self) -> _Post: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def restart(self) -> Restart: ...
+
+                @dataclass
+                class Status:
+                    @dataclass
+                    class _Get:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> dict[str, Any]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def status(self) -> Status: ...
+
+                @dataclass
+                class Crush:
+                    @dataclass
+                    class _Get:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def crush(self) -> Crush: ...
+
+                @dataclass
+                class Log:
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_b560f719f833.TypedDict):
+                            pass
+
+                        class Model(_Shape_b560f719f833.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Ceph.Log._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"limit": NotRequired[int], "start": NotRequired[int]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Ceph.Log._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Ceph.Log._Get.Model"]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def log(self) -> Log: ...
+
+                @dataclass
+                class Rules:
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_7e076d4d2657.TypedDict):
+                            pass
+
+                        class Model(_Shape_7e076d4d2657.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Ceph.Rules._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Ceph.Rules._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Ceph.Rules._Get.Model"]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def rules(self) -> Rules: ...
+
+                @dataclass
+                class CmdSafety:
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_26bae438332d.TypedDict):
+                            pass
+
+                        class Model(_Shape_26bae438332d.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Ceph.CmdSafety._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"action": Literal["stop", "destroy"], "id": str, "service": Literal["osd", "mon", "mds"]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> "ProxmoxAPI.Nodes.Node.Ceph.CmdSafety._Get.TypedDict": ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> "ProxmoxAPI.Nodes.Node.Ceph.CmdSafety._Get.Model": ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def cmd_safety(self) -> CmdSafety: ...
+
+                @dataclass
+                class _Get:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[dict[str, Any]]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[dict[str, Any]]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def ceph(self) -> Ceph: ...
+
+            @dataclass
+            class Vzdump:
+                @dataclass
+                class Defaults:
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_ccc760b74e6d.TypedDict):
+                            pass
+
+                        class Model(_Shape_ccc760b74e6d.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Vzdump.Defaults._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"storage": NotRequired[str]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> "ProxmoxAPI.Nodes.Node.Vzdump.Defaults._Get.TypedDict": ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> "ProxmoxAPI.Nodes.Node.Vzdump.Defaults._Get.Model": ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def defaults(self) -> Defaults: ...
+
+                @dataclass
+                class Extractconfig:
+                    @dataclass
+                    class _Get:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"volume": str})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def extractconfig(self) -> Extractconfig: ...
+
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"all": NotRequired[bool], "bwlimit": NotRequired[int], "compress": NotRequired[Literal["0", "1", "gzip", "lzo", "zstd"]], "dumpdir": NotRequired[str], "exclude": NotRequired[str], "exclude-path": NotRequired[list[Any]], "fleecing": NotRequired[str], "ionice": NotRequired[int], "job-id": NotRequired[str], "lockwait": NotRequired[int], "mailnotification": NotRequired[Literal["always", "failure"]], "mailto": NotRequired[str], "maxfiles": NotRequired[int], "mode": NotRequired[Literal["snapshot", "suspend", "stop"]], "notes-template": NotRequired[str], "notification-mode": NotRequired[Literal["auto", "legacy-sendmail", "notification-system"]], "notification-policy": NotRequired[Literal["always", "failure", "never"]], "notification-target": NotRequired[str], "pbs-change-detection-mode": NotRequired[Literal["legacy", "data", "metadata"]], "performance": NotRequired[str], "pigz": NotRequired[int], "pool": NotRequired[str], "protected": NotRequired[bool], "prune-backups": NotRequired[str], "quiet": NotRequired[bool], "remove": NotRequired[bool], "script": NotRequired[str], "stdexcludes": NotRequired[bool], "stdout": NotRequired[bool], "stop": NotRequired[bool], "stopwait": NotRequired[int], "storage": NotRequired[str], "tmpdir": NotRequired[str], "vmid": NotRequired[str], "zstd": NotRequired[int]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> str: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> str: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def vzdump(self) -> Vzdump: ...
+
+            @dataclass
+            class Services:
+                @dataclass
+                class Service:
+                    @dataclass
+                    class State:
+                        @dataclass
+                        class _Get:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            service: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> dict[str, Any]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> dict[str, Any]: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        service: str
+
+                    @cached_property
+                    def state(self) -> State: ...
+
+                    @dataclass
+                    class Start:
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            service: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        service: str
+
+                    @cached_property
+                    def start(self) -> Start: ...
+
+                    @dataclass
+                    class Stop:
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            service: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        service: str
+
+                    @cached_property
+                    def stop(self) -> Stop: ...
+
+                    @dataclass
+                    class Restart:
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            service: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        service: str
+
+                    @cached_property
+                    def restart(self) -> Restart: ...
+
+                    @dataclass
+                    class Reload:
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            service: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        service: str
+
+                    @cached_property
+                    def reload(self) -> Reload: ...
+
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_21168c7817dc.TypedDict):
+                            pass
+
+                        class Model(_Shape_21168c7817dc.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Services.Service._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        service: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Services.Service._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Services.Service._Get.Model"]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    service: str
+
+                def __call__(self, service: str) -> Service: ...
+
+                @dataclass
+                class _Get:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[dict[str, Any]]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[dict[str, Any]]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def services(self) -> Services: ...
+
+            @dataclass
+            class Subscription:
+                @dataclass
+                class _Delete:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_63204c9b844c.TypedDict):
+                        pass
+
+                    class Model(_Shape_63204c9b844c.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Nodes.Node.Subscription._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Nodes.Node.Subscription._Get.TypedDict": ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Nodes.Node.Subscription._Get.Model": ...
+
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"force": NotRequired[bool]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @dataclass
+                class _Put:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"key": str})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @cached_property
+                def delete(self) -> _Delete: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+
+                @cached_property
+                def put(self) -> _Put: ...
+
+                @property
+                def set(self) -> _Put: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def subscription(self) -> Subscription: ...
+
+            @dataclass
+            class Network:
+                @dataclass
+                class Iface:
+                    @dataclass
+                    class _Delete:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        iface: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_f597eedfb756.TypedDict):
+                            pass
+
+                        class Model(_Shape_f597eedfb756.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Network.Iface._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        iface: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> "ProxmoxAPI.Nodes.Node.Network.Iface._Get.TypedDict": ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> "ProxmoxAPI.Nodes.Node.Network.Iface._Get.Model": ...
+
+                    @dataclass
+                    class _Put:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        iface: str
+                        Params = typing.TypedDict("Params", {"address": NotRequired[str], "address6": NotRequired[str], "autostart": NotRequired[bool], "bond-primary": NotRequired[str], "bond_mode": NotRequired[Literal["balance-rr", "active-backup", "balance-xor", "broadcast", "802.3ad", "balance-tlb", "balance-alb", "balance-slb", "lacp-balance-slb", "lacp-balance-tcp"]], "bond_xmit_hash_policy": NotRequired[Literal["layer2", "layer2+3", "layer3+4"]], "bridge_ports": NotRequired[str], "bridge_vids": NotRequired[str], "bridge_vlan_aware": NotRequired[bool], "cidr": NotRequired[str], "cidr6": NotRequired[str], "comments": NotRequired[str], "comments6": NotRequired[str], "delete": NotRequired[str], "gateway": NotRequired[str], "gateway6": NotRequired[str], "mtu": NotRequired[int], "netmask": NotRequired[str], "netmask6": NotRequired[int], "ovs_bonds": NotRequired[str], "ovs_bridge": NotRequired[str], "ovs_options": NotRequired[str], "ovs_ports": NotRequired[str], "ovs_tag": NotRequired[int], "slaves": NotRequired[str], "type": Literal["bridge", "bond", "eth", "alias", "vlan", "OVSBridge", "OVSBond", "OVSPort", "OVSIntPort", "vnet", "unknown"], "vlan-id": NotRequired[int], "vlan-raw-device": NotRequired[str]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @cached_property
+                    def delete(self) -> _Delete: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def put(self) -> _Put: ...
+
+                    @property
+                    def set(self) -> _Put: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    iface: str
+
+                def __call__(self, iface: str) -> Iface: ...
+
+                @dataclass
+                class _Delete:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_8aea3955945c.TypedDict):
+                        pass
+
+                    class Model(_Shape_8aea3955945c.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Nodes.Node.Network._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"type": NotRequired[Literal["bridge", "bond", "eth", "alias", "vlan", "OVSBridge", "OVSBond", "OVSPort", "OVSIntPort", "vnet", "any_bridge", "any_local_bridge"]]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Nodes.Node.Network._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Nodes.Node.Network._Get.Model"]: ...
+
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"address": NotRequired[str], "address6": NotRequired[str], "autostart": NotRequired[bool], "bond-primary": NotRequired[str], "bond_mode": NotRequired[Literal["balance-rr", "active-backup", "balance-xor", "broadcast", "802.3ad", "balance-tlb", "balance-alb", "balance-slb", "lacp-balance-slb", "lacp-balance-tcp"]], "bond_xmit_hash_policy": NotRequired[Literal["layer2", "layer2+3", "layer3+4"]], "bridge_ports": NotRequired[str], "bridge_vids": NotRequired[str], "bridge_vlan_aware": NotRequired[bool], "cidr": NotRequired[str], "cidr6": NotRequired[str], "comments": NotRequired[str], "comments6": NotRequired[str], "gateway": NotRequired[str], "gateway6": NotRequired[str], "iface": str, "mtu": NotRequired[int], "netmask": NotRequired[str], "netmask6": NotRequired[int], "ovs_bonds": NotRequired[str], "ovs_bridge": NotRequired[str], "ovs_options": NotRequired[str], "ovs_ports": NotRequired[str], "ovs_tag": NotRequired[int], "slaves": NotRequired[str], "type": Literal["bridge", "bond", "eth", "alias", "vlan", "OVSBridge", "OVSBond", "OVSPort", "OVSIntPort", "vnet", "unknown"], "vlan-id": NotRequired[int], "vlan-raw-device": NotRequired[str]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @dataclass
+                class _Put:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> str: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> str: ...
+
+                @cached_property
+                def delete(self) -> _Delete: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+
+                @cached_property
+                def put(self) -> _Put: ...
+
+                @property
+                def set(self) -> _Put: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def network(self) -> Network: ...
+
+            @dataclass
+            class Tasks:
+                @dataclass
+                class Upid:
+                    @dataclass
+                    class Log:
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_b560f719f833.TypedDict):
+                                pass
+
+                            class Model(_Shape_b560f719f833.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Tasks.Upid.Log._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            upid: str
+                            Params = typing.TypedDict("Params", {"download": NotRequired[bool], "limit": NotRequired[int], "start": NotRequired[int]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Tasks.Upid.Log._Get.TypedDict"]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Tasks.Upid.Log._Get.Model"]: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        upid: str
+
+                    @cached_property
+                    def log(self) -> Log: ...
+
+                    @dataclass
+                    class Status:
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_3c7a0d330e61.TypedDict):
+                                pass
+
+                            class Model(_Shape_3c7a0d330e61.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Tasks.Upid.Status._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            upid: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Tasks.Upid.Status._Get.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Tasks.Upid.Status._Get.Model": ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        upid: str
+
+                    @cached_property
+                    def status(self) -> Status: ...
+
+                    @dataclass
+                    class _Delete:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        upid: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @dataclass
+                    class _Get:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        upid: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list[dict[str, Any]]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list[dict[str, Any]]: ...
+
+                    @cached_property
+                    def delete(self) -> _Delete: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    upid: str
+
+                def __call__(self, upid: str) -> Upid: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_d1c6fdcbf70a.TypedDict):
+                        pass
+
+                    class Model(_Shape_d1c6fdcbf70a.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Nodes.Node.Tasks._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"errors": NotRequired[bool], "limit": NotRequired[int], "since": NotRequired[int], "source": NotRequired[Literal["archive", "active", "all"]], "start": NotRequired[int], "statusfilter": NotRequired[str], "typefilter": NotRequired[str], "until": NotRequired[int], "userfilter": NotRequired[str], "vmid": NotRequired[int]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Nodes.Node.Tasks._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Nodes.Node.Tasks._Get.Model"]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def tasks(self) -> Tasks: ...
+
+            @dataclass
+            class Scan:
+                @dataclass
+                class Nfs:
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_951dee2df0f3.TypedDict):
+                            pass
+
+                        class Model(_Shape_951dee2df0f3.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Scan.Nfs._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"server": str})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Scan.Nfs._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Scan.Nfs._Get.Model"]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def nfs(self) -> Nfs: ...
+
+                @dataclass
+                class Cifs:
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_22a5085494a7.TypedDict):
+                            pass
+
+                        class Model(_Shape_22a5085494a7.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Scan.Cifs._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"domain": NotRequired[str], "password": NotRequired[str], "server": str, "username": NotRequired[str]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Scan.Cifs._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Scan.Cifs._Get.Model"]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def cifs(self) -> Cifs: ...
+
+                @dataclass
+                class Pbs:
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_efbe411c27ec.TypedDict):
+                            pass
+
+                        class Model(_Shape_efbe411c27ec.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Scan.Pbs._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"fingerprint": NotRequired[str], "password": str, "port": NotRequired[int], "server": str, "username": str})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Scan.Pbs._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Scan.Pbs._Get.Model"]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def pbs(self) -> Pbs: ...
+
+                @dataclass
+                class Glusterfs:
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_6468d58335f5.TypedDict):
+                            pass
+
+                        class Model(_Shape_6468d58335f5.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Scan.Glusterfs._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"server": str})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Scan.Glusterfs._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Scan.Glusterfs._Get.Model"]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def glusterfs(self) -> Glusterfs: ...
+
+                @dataclass
+                class Iscsi:
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_ecfc80a86311.TypedDict):
+                            pass
+
+                        class Model(_Shape_ecfc80a86311.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Scan.Iscsi._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"portal": str})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Scan.Iscsi._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Scan.Iscsi._Get.Model"]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def iscsi(self) -> Iscsi: ...
+
+                @dataclass
+                class Lvm:
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_87fefc2fe99d.TypedDict):
+                            pass
+
+                        class Model(_Shape_87fefc2fe99d.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Scan.Lvm._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Scan.Lvm._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Scan.Lvm._Get.Model"]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def lvm(self) -> Lvm: ...
+
+                @dataclass
+                class Lvmthin:
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_af650ad299f1.TypedDict):
+                            pass
+
+                        class Model(_Shape_af650ad299f1.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Scan.Lvmthin._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"vg": str})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Scan.Lvmthin._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Scan.Lvmthin._Get.Model"]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def lvmthin(self) -> Lvmthin: ...
+
+                @dataclass
+                class Zfs:
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_63523fe267a3.TypedDict):
+                            pass
+
+                        class Model(_Shape_63523fe267a3.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Scan.Zfs._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Scan.Zfs._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Scan.Zfs._Get.Model"]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def zfs(self) -> Zfs: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_a03b820fd42d.TypedDict):
+                        pass
+
+                    class Model(_Shape_a03b820fd42d.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Nodes.Node.Scan._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Nodes.Node.Scan._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Nodes.Node.Scan._Get.Model"]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def scan(self) -> Scan: ...
+
+            @dataclass
+            class Hardware:
+                @dataclass
+                class Pci:
+                    @dataclass
+                    class PciIdOrMapping:
+                        @dataclass
+                        class Mdev:
+                            @dataclass
+                            class _Get:
+                                class TypedDict(_Shape_4d905ab9c16d.TypedDict):
+                                    pass
+
+                                class Model(_Shape_4d905ab9c16d.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Hardware.Pci.PciIdOrMapping.Mdev._Get"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                pci_id_or_mapping: str
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list["ProxmoxAPI.Nodes.Node.Hardware.Pci.PciIdOrMapping.Mdev._Get.TypedDict"]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list["ProxmoxAPI.Nodes.Node.Hardware.Pci.PciIdOrMapping.Mdev._Get.Model"]: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            pci_id_or_mapping: str
+
+                        @cached_property
+                        def mdev(self) -> Mdev: ...
+
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_a03b820fd42d.TypedDict):
+                                pass
+
+                            class Model(_Shape_a03b820fd42d.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Hardware.Pci.PciIdOrMapping._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            pci_id_or_mapping: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Hardware.Pci.PciIdOrMapping._Get.TypedDict"]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Hardware.Pci.PciIdOrMapping._Get.Model"]: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        pci_id_or_mapping: str
+
+                    def __call__(self, pci_id_or_mapping: str) -> PciIdOrMapping: ...
+
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_419343aad6c2.TypedDict):
+                            pass
+
+                        class Model(_Shape_419343aad6c2.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Hardware.Pci._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"pci-class-blacklist": NotRequired[str], "verbose": NotRequired[bool]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Hardware.Pci._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Hardware.Pci._Get.Model"]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def pci(self) -> Pci: ...
+
+                @dataclass
+                class Usb:
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_18883e24957c.TypedDict):
+                            pass
+
+                        class Model(_Shape_18883e24957c.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Hardware.Usb._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Hardware.Usb._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Hardware.Usb._Get.Model"]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def usb(self) -> Usb: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_0eaf87bf66e4.TypedDict):
+                        pass
+
+                    class Model(_Shape_0eaf87bf66e4.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Nodes.Node.Hardware._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Nodes.Node.Hardware._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Nodes.Node.Hardware._Get.Model"]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def hardware(self) -> Hardware: ...
+
+            @dataclass
+            class Capabilities:
+                @dataclass
+                class Qemu:
+                    @dataclass
+                    class Cpu:
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_d0fc20c5567f.TypedDict):
+                                pass
+
+                            class Model(_Shape_d0fc20c5567f.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Capabilities.Qemu.Cpu._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Capabilities.Qemu.Cpu._Get.TypedDict"]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Capabilities.Qemu.Cpu._Get.Model"]: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+
+                    @cached_property
+                    def cpu(self) -> Cpu: ...
+
+                    @dataclass
+                    class Machines:
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_d03b35974d06.TypedDict):
+                                pass
+
+                            class Model(_Shape_d03b35974d06.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Capabilities.Qemu.Machines._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Capabilities.Qemu.Machines._Get.TypedDict"]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Capabilities.Qemu.Machines._Get.Model"]: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+
+                    @cached_property
+                    def machines(self) -> Machines: ...
+
+                    @dataclass
+                    class _Get:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list[dict[str, Any]]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list[dict[str, Any]]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def qemu(self) -> Qemu: ...
+
+                @dataclass
+                class _Get:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[dict[str, Any]]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[dict[str, Any]]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def capabilities(self) -> Capabilities: ...
+
+            @dataclass
+            class Storage:
+                @dataclass
+                class Storage:
+                    @dataclass
+                    class Prunebackups:
+                        @dataclass
+                        class _Delete:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            storage: str
+                            Params = typing.TypedDict("Params", {"prune-backups": NotRequired[str], "type": NotRequired[Literal["qemu", "lxc"]], "vmid": NotRequired[int]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_2c35ca4d4ce2.TypedDict):
+                                pass
+
+                            class Model(_Shape_2c35ca4d4ce2.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Storage.Storage.Prunebackups._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            storage: str
+                            Params = typing.TypedDict("Params", {"prune-backups": NotRequired[str], "type": NotRequired[Literal["qemu", "lxc"]], "vmid": NotRequired[int]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Storage.Storage.Prunebackups._Get.TypedDict"]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Storage.Storage.Prunebackups._Get.Model"]: ...
+
+                        @cached_property
+                        def delete(self) -> _Delete: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        storage: str
+
+                    @cached_property
+                    def prunebackups(self) -> Prunebackups: ...
+
+                    @dataclass
+                    class Content:
+                        @dataclass
+                        class Volume:
+                            @dataclass
+                            class _Delete:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                storage: str
+                                volume: str
+                                Params = typing.TypedDict("Params", {"delay": NotRequired[int]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                            @dataclass
+                            class _Get:
+                                class TypedDict(_Shape_b9422774550e.TypedDict):
+                                    pass
+
+                                class Model(_Shape_b9422774550e.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Storage.Storage.Content.Volume._Get"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                storage: str
+                                volume: str
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> "ProxmoxAPI.Nodes.Node.Storage.Storage.Content.Volume._Get.TypedDict": ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> "ProxmoxAPI.Nodes.Node.Storage.Storage.Content.Volume._Get.Model": ...
+
+                            @dataclass
+                            class _Post:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                storage: str
+                                volume: str
+                                Params = typing.TypedDict("Params", {"target": str, "target_node": NotRequired[str]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> str: ...
+
+                            @dataclass
+                            class _Put:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                storage: str
+                                volume: str
+                                Params = typing.TypedDict("Params", {"notes": NotRequired[str], "protected": NotRequired[bool]})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> None: ...
+
+                            @cached_property
+                            def delete(self) -> _Delete: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+
+                            @cached_property
+                            def post(self) -> _Post: ...
+
+                            @property
+                            def create(self) -> _Post: ...
+
+                            @cached_property
+                            def put(self) -> _Put: ...
+
+                            @property
+                            def set(self) -> _Put: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            storage: str
+                            volume: str
+
+                        def __call__(self, volume: str) -> Volume: ...
+
+                        @dataclass
+                        class _Get:
+                            @dataclass
+                            class _Verification:
+                                class TypedDict(_Shape_8127656f62a8.TypedDict):
+                                    pass
+
+                                class Model(_Shape_8127656f62a8.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Storage.Storage.Content._Get._Verification"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                storage: str
+                            TypedDict = typing.TypedDict("TypedDict", {"ctime": NotRequired[int], "encrypted": NotRequired[str], "format": str, "notes": NotRequired[str], "parent": NotRequired[str], "protected": NotRequired[bool], "size": int, "used": NotRequired[int], "verification": NotRequired["ProxmoxAPI.Nodes.Node.Storage.Storage.Content._Get._Verification.TypedDict"], "vmid": NotRequired[int], "volid": str})
+
+                            class Model(BaseModel):
+                                ctime: Optional[int] = None
+                                encrypted: Optional[str] = None
+                                format: str
+                                notes: Optional[str] = None
+                                parent: Optional[str] = None
+                                protected: Optional[bool] = None
+                                size: int
+                                used: Optional[int] = None
+                                verification: Optional["ProxmoxAPI.Nodes.Node.Storage.Storage.Content._Get._Verification.Model"] = None
+                                vmid: Optional[int] = None
+                                volid: str
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Storage.Storage.Content._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            storage: str
+                            Params = typing.TypedDict("Params", {"content": NotRequired[str], "vmid": NotRequired[int]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Storage.Storage.Content._Get.TypedDict"]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Storage.Storage.Content._Get.Model"]: ...
+
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            storage: str
+                            Params = typing.TypedDict("Params", {"filename": str, "format": NotRequired[Literal["raw", "qcow2", "subvol", "vmdk"]], "size": str, "vmid": int})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        storage: str
+
+                    @cached_property
+                    def content(self) -> Content: ...
+
+                    @dataclass
+                    class FileRestore:
+                        @dataclass
+                        class List:
+                            @dataclass
+                            class _Get:
+                                class TypedDict(_Shape_20568a4b38fb.TypedDict):
+                                    pass
+
+                                class Model(_Shape_20568a4b38fb.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Storage.Storage.FileRestore.List._Get"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                storage: str
+                                Params = typing.TypedDict("Params", {"filepath": str, "volume": str})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list["ProxmoxAPI.Nodes.Node.Storage.Storage.FileRestore.List._Get.TypedDict"]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list["ProxmoxAPI.Nodes.Node.Storage.Storage.FileRestore.List._Get.Model"]: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            storage: str
+
+                        @cached_property
+                        def list(self) -> List: ...
+
+                        @dataclass
+                        class Download:
+                            @dataclass
+                            class _Get:
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                storage: str
+                                Params = typing.TypedDict("Params", {"filepath": str, "tar": NotRequired[bool], "volume": str})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> Any: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> Any: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            storage: str
+
+                        @cached_property
+                        def download(self) -> Download: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        storage: str
+
+                    @cached_property
+                    def file_restore(self) -> FileRestore: ...
+
+                    @dataclass
+                    class Status:
+                        @dataclass
+                        class _Get:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            storage: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> dict[str, Any]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> dict[str, Any]: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        storage: str
+
+                    @cached_property
+                    def status(self) -> Status: ...
+
+                    @dataclass
+                    class Rrd:
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_195e3c884669.TypedDict):
+                                pass
+
+                            class Model(_Shape_195e3c884669.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Storage.Storage.Rrd._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            storage: str
+                            Params = typing.TypedDict("Params", {"cf": NotRequired[Literal["AVERAGE", "MAX"]], "ds": str, "timeframe": Literal["hour", "day", "week", "month", "year"]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Storage.Storage.Rrd._Get.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Storage.Storage.Rrd._Get.Model": ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        storage: str
+
+                    @cached_property
+                    def rrd(self) -> Rrd: ...
+
+                    @dataclass
+                    class Rrddata:
+                        @dataclass
+                        class _Get:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            storage: str
+                            Params = typing.TypedDict("Params", {"cf": NotRequired[Literal["AVERAGE", "MAX"]], "timeframe": Literal["hour", "day", "week", "month", "year"]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list[dict[str, Any]]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list[dict[str, Any]]: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        storage: str
+
+                    @cached_property
+                    def rrddata(self) -> Rrddata: ...
+
+                    @dataclass
+                    class Upload:
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            storage: str
+                            Params = typing.TypedDict("Params", {"checksum": NotRequired[str], "checksum-algorithm": NotRequired[Literal["md5", "sha1", "sha224", "sha256", "sha384", "sha512"]], "content": Literal["iso", "vztmpl", "import"], "filename": str, "tmpfilename": NotRequired[str]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        storage: str
+
+                    @cached_property
+                    def upload(self) -> Upload: ...
+
+                    @dataclass
+                    class DownloadUrl:
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            storage: str
+                            Params = typing.TypedDict("Params", {"checksum": NotRequired[str], "checksum-algorithm": NotRequired[Literal["md5", "sha1", "sha224", "sha256", "sha384", "sha512"]], "compression": NotRequired[str], "content": Literal["iso", "vztmpl", "import"], "filename": str, "url": str, "verify-certificates": NotRequired[bool]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        storage: str
+
+                    @cached_property
+                    def download_url(self) -> DownloadUrl: ...
+
+                    @dataclass
+                    class ImportMetadata:
+                        @dataclass
+                        class _Get:
+                            @dataclass
+                            class _Warnings:
+                                class TypedDict(_Shape_25f687097d19.TypedDict):
+                                    pass
+
+                                class Model(_Shape_25f687097d19.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Storage.Storage.ImportMetadata._Get._Warnings"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                storage: str
+                            TypedDict = typing.TypedDict("TypedDict", {"create-args": dict[str, Any], "disks": NotRequired[dict[str, Any]], "net": NotRequired[dict[str, Any]], "source": Literal["esxi"], "type": Literal["vm"], "warnings": NotRequired[list["ProxmoxAPI.Nodes.Node.Storage.Storage.ImportMetadata._Get._Warnings.TypedDict"]]})
+
+                            class Model(BaseModel):
+                                create_args: dict[str, Any] = pydantic.Field(alias="create-args")
+                                disks: Optional[dict[str, Any]] = None
+                                net: Optional[dict[str, Any]] = None
+                                source: Literal["esxi"]
+                                type: Literal["vm"]
+                                warnings: Optional[list["ProxmoxAPI.Nodes.Node.Storage.Storage.ImportMetadata._Get._Warnings.Model"]] = None
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Storage.Storage.ImportMetadata._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            storage: str
+                            Params = typing.TypedDict("Params", {"volume": str})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Storage.Storage.ImportMetadata._Get.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Storage.Storage.ImportMetadata._Get.Model": ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        storage: str
+
+                    @cached_property
+                    def import_metadata(self) -> ImportMetadata: ...
+
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_21168c7817dc.TypedDict):
+                            pass
+
+                        class Model(_Shape_21168c7817dc.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Storage.Storage._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        storage: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Storage.Storage._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Storage.Storage._Get.Model"]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    storage: str
+
+                def __call__(self, storage: str) -> Storage: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_6ecd47a77999.TypedDict):
+                        pass
+
+                    class Model(_Shape_6ecd47a77999.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Nodes.Node.Storage._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"content": NotRequired[str], "enabled": NotRequired[bool], "format": NotRequired[bool], "storage": NotRequired[str], "target": NotRequired[str]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Nodes.Node.Storage._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Nodes.Node.Storage._Get.Model"]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def storage(self) -> Storage: ...
+
+            @dataclass
+            class Disks:
+                @dataclass
+                class Lvm:
+                    @dataclass
+                    class Name:
+                        @dataclass
+                        class _Delete:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            name: str
+                            Params = typing.TypedDict("Params", {"cleanup-config": NotRequired[bool], "cleanup-disks": NotRequired[bool]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def delete(self) -> _Delete: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        name: str
+
+                    def __call__(self, name: str) -> Name: ...
+
+                    @dataclass
+                    class _Get:
+                        @dataclass
+                        class _Children:
+                            @dataclass
+                            class _Children:
+                                class TypedDict(_Shape_21db667278d3.TypedDict):
+                                    pass
+
+                                class Model(_Shape_21db667278d3.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Disks.Lvm._Get._Children._Children"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                            TypedDict = typing.TypedDict("TypedDict", {"children": NotRequired[list["ProxmoxAPI.Nodes.Node.Disks.Lvm._Get._Children._Children.TypedDict"]], "free": int, "leaf": bool, "name": str, "size": int})
+
+                            class Model(BaseModel):
+                                children: Optional[list["ProxmoxAPI.Nodes.Node.Disks.Lvm._Get._Children._Children.Model"]] = None
+                                free: int
+                                leaf: bool
+                                name: str
+                                size: int
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Disks.Lvm._Get._Children"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                        TypedDict = typing.TypedDict("TypedDict", {"children": list["ProxmoxAPI.Nodes.Node.Disks.Lvm._Get._Children.TypedDict"], "leaf": bool})
+
+                        class Model(BaseModel):
+                            children: list["ProxmoxAPI.Nodes.Node.Disks.Lvm._Get._Children.Model"]
+                            leaf: bool
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Disks.Lvm._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> "ProxmoxAPI.Nodes.Node.Disks.Lvm._Get.TypedDict": ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> "ProxmoxAPI.Nodes.Node.Disks.Lvm._Get.Model": ...
+
+                    @dataclass
+                    class _Post:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"add_storage": NotRequired[bool], "device": str, "name": str})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def post(self) -> _Post: ...
+
+                    @property
+                    def create(self) -> _Post: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def lvm(self) -> Lvm: ...
+
+                @dataclass
+                class Lvmthin:
+                    @dataclass
+                    class Name:
+                        @dataclass
+                        class _Delete:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            name: str
+                            Params = typing.TypedDict("Params", {"cleanup-config": NotRequired[bool], "cleanup-disks": NotRequired[bool], "volume-group": str})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def delete(self) -> _Delete: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        name: str
+
+                    def __call__(self, name: str) -> Name: ...
+
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_5e9d3b631702.TypedDict):
+                            pass
+
+                        class Model(_Shape_5e9d3b631702.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Disks.Lvmthin._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Disks.Lvmthin._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Disks.Lvmthin._Get.Model"]: ...
+
+                    @dataclass
+                    class _Post:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"add_storage": NotRequired[bool], "device": str, "name": str})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def post(self) -> _Post: ...
+
+                    @property
+                    def create(self) -> _Post: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def lvmthin(self) -> Lvmthin: ...
+
+                @dataclass
+                class Directory:
+                    @dataclass
+                    class Name:
+                        @dataclass
+                        class _Delete:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            name: str
+                            Params = typing.TypedDict("Params", {"cleanup-config": NotRequired[bool], "cleanup-disks": NotRequired[bool]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def delete(self) -> _Delete: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        name: str
+
+                    def __call__(self, name: str) -> Name: ...
+
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_b2ed40ab5d55.TypedDict):
+                            pass
+
+                        class Model(_Shape_b2ed40ab5d55.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Disks.Directory._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Disks.Directory._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Disks.Directory._Get.Model"]: ...
+
+                    @dataclass
+                    class _Post:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"add_storage": NotRequired[bool], "device": str, "filesystem": NotRequired[Literal["ext4", "xfs"]], "name": str})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def post(self) -> _Post: ...
+
+                    @property
+                    def create(self) -> _Post: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def directory(self) -> Directory: ...
+
+                @dataclass
+                class Zfs:
+                    @dataclass
+                    class Name:
+                        @dataclass
+                        class _Delete:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            name: str
+                            Params = typing.TypedDict("Params", {"cleanup-config": NotRequired[bool], "cleanup-disks": NotRequired[bool]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @dataclass
+                        class _Get:
+                            @dataclass
+                            class _Children:
+                                class TypedDict(_Shape_41cc8b5da1b3.TypedDict):
+                                    pass
+
+                                class Model(_Shape_41cc8b5da1b3.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Disks.Zfs.Name._Get._Children"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                name: str
+                            TypedDict = typing.TypedDict("TypedDict", {"action": NotRequired[str], "children": list["ProxmoxAPI.Nodes.Node.Disks.Zfs.Name._Get._Children.TypedDict"], "errors": str, "name": str, "scan": NotRequired[str], "state": str, "status": NotRequired[str]})
+
+                            class Model(BaseModel):
+                                action: Optional[str] = None
+                                children: list["ProxmoxAPI.Nodes.Node.Disks.Zfs.Name._Get._Children.Model"]
+                                errors: str
+                                name: str
+                                scan: Optional[str] = None
+                                state: str
+                                status: Optional[str] = None
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Disks.Zfs.Name._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            name: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Disks.Zfs.Name._Get.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Disks.Zfs.Name._Get.Model": ...
+
+                        @cached_property
+                        def delete(self) -> _Delete: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        name: str
+
+                    def __call__(self, name: str) -> Name: ...
+
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_c314c8f1fa2e.TypedDict):
+                            pass
+
+                        class Model(_Shape_c314c8f1fa2e.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Disks.Zfs._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Disks.Zfs._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Disks.Zfs._Get.Model"]: ...
+
+                    @dataclass
+                    class _Post:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"add_storage": NotRequired[bool], "ashift": NotRequired[int], "compression": NotRequired[Literal["on", "off", "gzip", "lz4", "lzjb", "zle", "zstd"]], "devices": str, "draid-config": NotRequired[str], "name": str, "raidlevel": Literal["single", "mirror", "raid10", "raidz", "raidz2", "raidz3", "draid", "draid2", "draid3"]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def post(self) -> _Post: ...
+
+                    @property
+                    def create(self) -> _Post: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def zfs(self) -> Zfs: ...
+
+                @dataclass
+                class List:
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_a55192fb2e36.TypedDict):
+                            pass
+
+                        class Model(_Shape_a55192fb2e36.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Disks.List._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"include-partitions": NotRequired[bool], "skipsmart": NotRequired[bool], "type": NotRequired[Literal["unused", "journal_disks"]]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Disks.List._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Disks.List._Get.Model"]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def list(self) -> List: ...
+
+                @dataclass
+                class Smart:
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_ea3b1d934b75.TypedDict):
+                            pass
+
+                        class Model(_Shape_ea3b1d934b75.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Disks.Smart._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"disk": str, "healthonly": NotRequired[bool]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> "ProxmoxAPI.Nodes.Node.Disks.Smart._Get.TypedDict": ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> "ProxmoxAPI.Nodes.Node.Disks.Smart._Get.Model": ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def smart(self) -> Smart: ...
+
+                @dataclass
+                class Initgpt:
+                    @dataclass
+                    class _Post:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"disk": str, "uuid": NotRequired[str]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                    @cached_property
+                    def post(self) -> _Post: ...
+
+                    @property
+                    def create(self) -> _Post: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def initgpt(self) -> Initgpt: ...
+
+                @dataclass
+                class Wipedisk:
+                    @dataclass
+                    class _Put:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"disk": str})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                    @cached_property
+                    def put(self) -> _Put: ...
+
+                    @property
+                    def set(self) -> _Put: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def wipedisk(self) -> Wipedisk: ...
+
+                @dataclass
+                class _Get:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[dict[str, Any]]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[dict[str, Any]]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def disks(self) -> Disks: ...
+
+            @dataclass
+            class Apt:
+                @dataclass
+                class Update:
+                    @dataclass
+                    class _Get:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list[dict[str, Any]]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list[dict[str, Any]]: ...
+
+                    @dataclass
+                    class _Post:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"notify": NotRequired[bool], "quiet": NotRequired[bool]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def post(self) -> _Post: ...
+
+                    @property
+                    def create(self) -> _Post: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def update(self) -> Update: ...
+
+                @dataclass
+                class Changelog:
+                    @dataclass
+                    class _Get:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"name": str, "version": NotRequired[str]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> str: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def changelog(self) -> Changelog: ...
+
+                @dataclass
+                class Repositories:
+                    @dataclass
+                    class _Get:
+                        @dataclass
+                        class _Errors:
+                            class TypedDict(_Shape_3ce1a87b05d2.TypedDict):
+                                pass
+
+                            class Model(_Shape_3ce1a87b05d2.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Apt.Repositories._Get._Errors"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+
+                        @dataclass
+                        class _Files:
+                            @dataclass
+                            class _Repositories:
+                                @dataclass
+                                class _Options:
+                                    class TypedDict(_Shape_1c53eea58c6c.TypedDict):
+                                        pass
+
+                                    class Model(_Shape_1c53eea58c6c.Model):
+                                        pass
+                                    Model.__name__ = "ProxmoxAPI.Nodes.Node.Apt.Repositories._Get._Files._Repositories._Options"
+                                    proxmox_api: ProxmoxerProxmoxAPI
+                                    node: str
+                                TypedDict = typing.TypedDict("TypedDict", {"Comment": NotRequired[str], "Components": NotRequired[list[str]], "Enabled": bool, "FileType": Literal["list", "sources"], "Options": NotRequired[list["ProxmoxAPI.Nodes.Node.Apt.Repositories._Get._Files._Repositories._Options.TypedDict"]], "Suites": list[str], "Types": list[Literal["deb", "deb-src"]], "URIs": list[str]})
+
+                                class Model(BaseModel):
+                                    comment: Optional[str] = pydantic.Field(alias="Comment", default=None)
+                                    components: Optional[list[str]] = pydantic.Field(alias="Components", default=None)
+                                    enabled: bool = pydantic.Field(alias="Enabled")
+                                    file_type: Literal["list", "sources"] = pydantic.Field(alias="FileType")
+                                    options: Optional[list["ProxmoxAPI.Nodes.Node.Apt.Repositories._Get._Files._Repositories._Options.Model"]] = pydantic.Field(alias="Options", default=None)
+                                    suites: list[str] = pydantic.Field(alias="Suites")
+                                    types: list[Literal["deb", "deb-src"]] = pydantic.Field(alias="Types")
+                                    uris: list[str] = pydantic.Field(alias="URIs")
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Apt.Repositories._Get._Files._Repositories"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                            TypedDict = typing.TypedDict("TypedDict", {"digest": list[int], "file-type": Literal["list", "sources"], "path": str, "repositories": list["ProxmoxAPI.Nodes.Node.Apt.Repositories._Get._Files._Repositories.TypedDict"]})
+
+                            class Model(BaseModel):
+                                digest: list[int]
+                                file_type: Literal["list", "sources"] = pydantic.Field(alias="file-type")
+                                path: str
+                                repositories: list["ProxmoxAPI.Nodes.Node.Apt.Repositories._Get._Files._Repositories.Model"]
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Apt.Repositories._Get._Files"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+
+                        @dataclass
+                        class _Infos:
+                            class TypedDict(_Shape_7e5a751f69a7.TypedDict):
+                                pass
+
+                            class Model(_Shape_7e5a751f69a7.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Apt.Repositories._Get._Infos"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+
+                        @dataclass
+                        class _StandardRepos:
+                            class TypedDict(_Shape_4f4c2003f26f.TypedDict):
+                                pass
+
+                            class Model(_Shape_4f4c2003f26f.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Apt.Repositories._Get._StandardRepos"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                        TypedDict = typing.TypedDict("TypedDict", {"digest": str, "errors": list["ProxmoxAPI.Nodes.Node.Apt.Repositories._Get._Errors.TypedDict"], "files": list["ProxmoxAPI.Nodes.Node.Apt.Repositories._Get._Files.TypedDict"], "infos": list["ProxmoxAPI.Nodes.Node.Apt.Repositories._Get._Infos.TypedDict"], "standard-repos": list["ProxmoxAPI.Nodes.Node.Apt.Repositories._Get._StandardRepos.TypedDict"]})
+
+                        class Model(BaseModel):
+                            digest: str
+                            errors: list["ProxmoxAPI.Nodes.Node.Apt.Repositories._Get._Errors.Model"]
+                            files: list["ProxmoxAPI.Nodes.Node.Apt.Repositories._Get._Files.Model"]
+                            infos: list["ProxmoxAPI.Nodes.Node.Apt.Repositories._Get._Infos.Model"]
+                            standard_repos: list["ProxmoxAPI.Nodes.Node.Apt.Repositories._Get._StandardRepos.Model"] = pydantic.Field(alias="standard-repos")
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Apt.Repositories._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> "ProxmoxAPI.Nodes.Node.Apt.Repositories._Get.TypedDict": ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> "ProxmoxAPI.Nodes.Node.Apt.Repositories._Get.Model": ...
+
+                    @dataclass
+                    class _Post:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"digest": NotRequired[str], "enabled": NotRequired[bool], "index": int, "path": str})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @dataclass
+                    class _Put:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"digest": NotRequired[str], "handle": str})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def post(self) -> _Post: ...
+
+                    @property
+                    def create(self) -> _Post: ...
+
+                    @cached_property
+                    def put(self) -> _Put: ...
+
+                    @property
+                    def set(self) -> _Put: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def repositories(self) -> Repositories: ...
+
+                @dataclass
+                class Versions:
+                    @dataclass
+                    class _Get:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list[dict[str, Any]]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list[dict[str, Any]]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def versions(self) -> Versions: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_702e4ae1eff6.TypedDict):
+                        pass
+
+                    class Model(_Shape_702e4ae1eff6.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Nodes.Node.Apt._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Nodes.Node.Apt._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Nodes.Node.Apt._Get.Model"]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def apt(self) -> Apt: ...
+
+            @dataclass
+            class Firewall:
+                @dataclass
+                class Rules:
+                    @dataclass
+                    class Pos:
+                        @dataclass
+                        class _Delete:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            pos: int
+                            Params = typing.TypedDict("Params", {"digest": NotRequired[str]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_7e5fdbf08cb2.TypedDict):
+                                pass
+
+                            class Model(_Shape_7e5fdbf08cb2.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Firewall.Rules.Pos._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            pos: int
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Firewall.Rules.Pos._Get.TypedDict": ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> "ProxmoxAPI.Nodes.Node.Firewall.Rules.Pos._Get.Model": ...
+
+                        @dataclass
+                        class _Put:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            pos: int
+                            Params = typing.TypedDict("Params", {"action": NotRequired[str], "comment": NotRequired[str], "delete": NotRequired[str], "dest": NotRequired[str], "digest": NotRequired[str], "dport": NotRequired[str], "enable": NotRequired[int], "icmp-type": NotRequired[str], "iface": NotRequired[str], "log": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]], "macro": NotRequired[str], "moveto": NotRequired[int], "proto": NotRequired[str], "source": NotRequired[str], "sport": NotRequired[str], "type": NotRequired[Literal["in", "out", "forward", "group"]]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> None: ...
+
+                        @cached_property
+                        def delete(self) -> _Delete: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+
+                        @cached_property
+                        def put(self) -> _Put: ...
+
+                        @property
+                        def set(self) -> _Put: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        pos: int
+
+                    def __call__(self, pos: int) -> Pos: ...
+
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_5877922db5f2.TypedDict):
+                            pass
+
+                        class Model(_Shape_5877922db5f2.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Firewall.Rules._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Firewall.Rules._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Firewall.Rules._Get.Model"]: ...
+
+                    @dataclass
+                    class _Post:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"action": str, "comment": NotRequired[str], "dest": NotRequired[str], "digest": NotRequired[str], "dport": NotRequired[str], "enable": NotRequired[int], "icmp-type": NotRequired[str], "iface": NotRequired[str], "log": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]], "macro": NotRequired[str], "pos": NotRequired[int], "proto": NotRequired[str], "source": NotRequired[str], "sport": NotRequired[str], "type": Literal["in", "out", "forward", "group"]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def post(self) -> _Post: ...
+
+                    @property
+                    def create(self) -> _Post: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def rules(self) -> Rules: ...
+
+                @dataclass
+                class Options:
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_46f44f5be7cc.TypedDict):
+                            pass
+
+                        class Model(_Shape_46f44f5be7cc.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Firewall.Options._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> "ProxmoxAPI.Nodes.Node.Firewall.Options._Get.TypedDict": ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> "ProxmoxAPI.Nodes.Node.Firewall.Options._Get.Model": ...
+
+                    @dataclass
+                    class _Put:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"delete": NotRequired[str], "digest": NotRequired[str], "enable": NotRequired[bool], "log_level_forward": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]], "log_level_in": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]], "log_level_out": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]], "log_nf_conntrack": NotRequired[bool], "ndp": NotRequired[bool], "nf_conntrack_allow_invalid": NotRequired[bool], "nf_conntrack_helpers": NotRequired[str], "nf_conntrack_max": NotRequired[int], "nf_conntrack_tcp_timeout_established": NotRequired[int], "nf_conntrack_tcp_timeout_syn_recv": NotRequired[int], "nftables": NotRequired[bool], "nosmurfs": NotRequired[bool], "protection_synflood": NotRequired[bool], "protection_synflood_burst": NotRequired[int], "protection_synflood_rate": NotRequired[int], "smurf_log_level": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]], "tcp_flags_log_level": NotRequired[Literal["emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"]], "tcpflags": NotRequired[bool]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+
+                    @cached_property
+                    def put(self) -> _Put: ...
+
+                    @property
+                    def set(self) -> _Put: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def options(self) -> Options: ...
+
+                @dataclass
+                class Log:
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_b560f719f833.TypedDict):
+                            pass
+
+                        class Model(_Shape_b560f719f833.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Firewall.Log._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"limit": NotRequired[int], "since": NotRequired[int], "start": NotRequired[int], "until": NotRequired[int]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Firewall.Log._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Firewall.Log._Get.Model"]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def log(self) -> Log: ...
+
+                @dataclass
+                class _Get:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[dict[str, Any]]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[dict[str, Any]]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def firewall(self) -> Firewall: ...
+
+            @dataclass
+            class Replication:
+                @dataclass
+                class Id:
+                    @dataclass
+                    class Status:
+                        @dataclass
+                        class _Get:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            id: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> dict[str, Any]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> dict[str, Any]: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        id: str
+
+                    @cached_property
+                    def status(self) -> Status: ...
+
+                    @dataclass
+                    class Log:
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_b560f719f833.TypedDict):
+                                pass
+
+                            class Model(_Shape_b560f719f833.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Replication.Id.Log._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            id: str
+                            Params = typing.TypedDict("Params", {"limit": NotRequired[int], "start": NotRequired[int]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Replication.Id.Log._Get.TypedDict"]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Replication.Id.Log._Get.Model"]: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        id: str
+
+                    @cached_property
+                    def log(self) -> Log: ...
+
+                    @dataclass
+                    class ScheduleNow:
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            id: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        id: str
+
+                    @cached_property
+                    def schedule_now(self) -> ScheduleNow: ...
+
+                    @dataclass
+                    class _Get:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        id: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list[dict[str, Any]]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list[dict[str, Any]]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    id: str
+
+                def __call__(self, id: str) -> Id: ...
+
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_702e4ae1eff6.TypedDict):
+                        pass
+
+                    class Model(_Shape_702e4ae1eff6.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Nodes.Node.Replication._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"guest": NotRequired[int]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Nodes.Node.Replication._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Nodes.Node.Replication._Get.Model"]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def replication(self) -> Replication: ...
+
+            @dataclass
+            class Certificates:
+                @dataclass
+                class Acme:
+                    @dataclass
+                    class Certificate:
+                        @dataclass
+                        class _Delete:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @dataclass
+                        class _Post:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            Params = typing.TypedDict("Params", {"force": NotRequired[bool]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @dataclass
+                        class _Put:
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            Params = typing.TypedDict("Params", {"force": NotRequired[bool]})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> str: ...
+
+                        @cached_property
+                        def delete(self) -> _Delete: ...
+
+                        @cached_property
+                        def post(self) -> _Post: ...
+
+                        @property
+                        def create(self) -> _Post: ...
+
+                        @cached_property
+                        def put(self) -> _Put: ...
+
+                        @property
+                        def set(self) -> _Put: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+
+                    @cached_property
+                    def certificate(self) -> Certificate: ...
+
+                    @dataclass
+                    class _Get:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list[dict[str, Any]]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list[dict[str, Any]]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def acme(self) -> Acme: ...
+
+                @dataclass
+                class Info:
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_58ab2e2fa2d1.TypedDict):
+                            pass
+
+                        class Model(_Shape_58ab2e2fa2d1.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Certificates.Info._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Certificates.Info._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Certificates.Info._Get.Model"]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def info(self) -> Info: ...
+
+                @dataclass
+                class Custom:
+                    @dataclass
+                    class _Delete:
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"restart": NotRequired[bool]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> None: ...
+
+                    @dataclass
+                    class _Post:
+                        class TypedDict(_Shape_58ab2e2fa2d1.TypedDict):
+                            pass
+
+                        class Model(_Shape_58ab2e2fa2d1.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Certificates.Custom._Post"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {"certificates": str, "force": NotRequired[bool], "key": NotRequired[str], "restart": NotRequired[bool]})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> "ProxmoxAPI.Nodes.Node.Certificates.Custom._Post.TypedDict": ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> "ProxmoxAPI.Nodes.Node.Certificates.Custom._Post.Model": ...
+
+                    @cached_property
+                    def delete(self) -> _Delete: ...
+
+                    @cached_property
+                    def post(self) -> _Post: ...
+
+                    @property
+                    def create(self) -> _Post: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def custom(self) -> Custom: ...
+
+                @dataclass
+                class _Get:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[dict[str, Any]]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[dict[str, Any]]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def certificates(self) -> Certificates: ...
+
+            @dataclass
+            class Config:
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_953e1743ce1d.TypedDict):
+                        pass
+
+                    class Model(_Shape_953e1743ce1d.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Nodes.Node.Config._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"property": NotRequired[Literal["acme", "acmedomain0", "acmedomain1", "acmedomain2", "acmedomain3", "acmedomain4", "acmedomain5", "ballooning-target", "description", "startall-onboot-delay", "wakeonlan"]]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Nodes.Node.Config._Get.TypedDict": ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Nodes.Node.Config._Get.Model": ...
+
+                @dataclass
+                class _Put:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"acme": NotRequired[str], "ballooning-target": NotRequired[int], "delete": NotRequired[str], "description": NotRequired[str], "digest": NotRequired[str], "startall-onboot-delay": NotRequired[int], "wakeonlan": NotRequired[str]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Any
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Any
+                    ) -> None: ...
+
+                    def update(
+                        self, *, current: Optional[typing.Mapping[str, Any]] = None, check: bool = True, **kwargs: Any
+                    ) -> None: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def put(self) -> _Put: ...
+
+                @property
+                def set(self) -> _Put: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def config(self) -> Config: ...
+
+            @dataclass
+            class Sdn:
+                @dataclass
+                class Zones:
+                    @dataclass
+                    class Zone:
+                        @dataclass
+                        class Content:
+                            @dataclass
+                            class _Get:
+                                class TypedDict(_Shape_8995825a45a7.TypedDict):
+                                    pass
+
+                                class Model(_Shape_8995825a45a7.Model):
+                                    pass
+                                Model.__name__ = "ProxmoxAPI.Nodes.Node.Sdn.Zones.Zone.Content._Get"
+                                proxmox_api: ProxmoxerProxmoxAPI
+                                node: str
+                                zone: str
+                                Params = typing.TypedDict("Params", {})
+
+                                def __call__(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list["ProxmoxAPI.Nodes.Node.Sdn.Zones.Zone.Content._Get.TypedDict"]: ...
+
+                                def model(
+                                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                                ) -> list["ProxmoxAPI.Nodes.Node.Sdn.Zones.Zone.Content._Get.Model"]: ...
+
+                            @cached_property
+                            def get(self) -> _Get: ...
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            zone: str
+
+                        @cached_property
+                        def content(self) -> Content: ...
+
+                        @dataclass
+                        class _Get:
+                            class TypedDict(_Shape_21168c7817dc.TypedDict):
+                                pass
+
+                            class Model(_Shape_21168c7817dc.Model):
+                                pass
+                            Model.__name__ = "ProxmoxAPI.Nodes.Node.Sdn.Zones.Zone._Get"
+                            proxmox_api: ProxmoxerProxmoxAPI
+                            node: str
+                            zone: str
+                            Params = typing.TypedDict("Params", {})
+
+                            def __call__(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Sdn.Zones.Zone._Get.TypedDict"]: ...
+
+                            def model(
+                                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                            ) -> list["ProxmoxAPI.Nodes.Node.Sdn.Zones.Zone._Get.Model"]: ...
+
+                        @cached_property
+                        def get(self) -> _Get: ...
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        zone: str
+
+                    def __call__(self, zone: str) -> Zone: ...
+
+                    @dataclass
+                    class _Get:
+                        class TypedDict(_Shape_d504837c3718.TypedDict):
+                            pass
+
+                        class Model(_Shape_d504837c3718.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Sdn.Zones._Get"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                        Params = typing.TypedDict("Params", {})
+
+                        def __call__(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Sdn.Zones._Get.TypedDict"]: ...
+
+                        def model(
+                            self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                        ) -> list["ProxmoxAPI.Nodes.Node.Sdn.Zones._Get.Model"]: ...
+
+                    @cached_property
+                    def get(self) -> _Get: ...
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+
+                @cached_property
+                def zones(self) -> Zones: ...
+
+                @dataclass
+                class _Get:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[dict[str, Any]]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[dict[str, Any]]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def sdn(self) -> Sdn: ...
+
+            @dataclass
+            class Version:
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_baee350ed80d.TypedDict):
+                        pass
+
+                    class Model(_Shape_baee350ed80d.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Nodes.Node.Version._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Nodes.Node.Version._Get.TypedDict": ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Nodes.Node.Version._Get.Model": ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def version(self) -> Version: ...
+
+            @dataclass
+            class Status:
+                @dataclass
+                class _Get:
+                    @dataclass
+                    class _BootInfo:
+                        class TypedDict(_Shape_b9b46f83b7ec.TypedDict):
+                            pass
+
+                        class Model(_Shape_b9b46f83b7ec.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Status._Get._BootInfo"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+
+                    @dataclass
+                    class _Cpuinfo:
+                        class TypedDict(_Shape_896adc7701b3.TypedDict):
+                            pass
+
+                        class Model(_Shape_896adc7701b3.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Status._Get._Cpuinfo"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+
+                    @dataclass
+                    class _CurrentKernel:
+                        class TypedDict(_Shape_d67ac64c1a1c.TypedDict):
+                            pass
+
+                        class Model(_Shape_d67ac64c1a1c.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Status._Get._CurrentKernel"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+
+                    @dataclass
+                    class _Memory:
+                        class TypedDict(_Shape_02ab1788fc9c.TypedDict):
+                            pass
+
+                        class Model(_Shape_02ab1788fc9c.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Status._Get._Memory"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+
+                    @dataclass
+                    class _Rootfs:
+                        class TypedDict(_Shape_4cce9616f8de.TypedDict):
+                            pass
+
+                        class Model(_Shape_4cce9616f8de.Model):
+                            pass
+                        Model.__name__ = "ProxmoxAPI.Nodes.Node.Status._Get._Rootfs"
+                        proxmox_api: ProxmoxerProxmoxAPI
+                        node: str
+                    TypedDict = typing.TypedDict("TypedDict", {"boot-info": "ProxmoxAPI.Nodes.Node.Status._Get._BootInfo.TypedDict", "cpu": float, "cpuinfo": "ProxmoxAPI.Nodes.Node.Status._Get._Cpuinfo.TypedDict", "current-kernel": "ProxmoxAPI.Nodes.Node.Status._Get._CurrentKernel.TypedDict", "loadavg": list[str], "memory": "ProxmoxAPI.Nodes.Node.Status._Get._Memory.TypedDict", "pveversion": str, "rootfs": "ProxmoxAPI.Nodes.Node.Status._Get._Rootfs.TypedDict"})
+
+                    class Model(BaseModel):
+                        boot_info: "ProxmoxAPI.Nodes.Node.Status._Get._BootInfo.Model" = pydantic.Field(alias="boot-info")
+                        cpu: float
+                        cpuinfo: "ProxmoxAPI.Nodes.Node.Status._Get._Cpuinfo.Model"
+                        current_kernel: "ProxmoxAPI.Nodes.Node.Status._Get._CurrentKernel.Model" = pydantic.Field(alias="current-kernel")
+                        loadavg: list[str]
+                        memory: "ProxmoxAPI.Nodes.Node.Status._Get._Memory.Model"
+                        pveversion: str
+                        rootfs: "ProxmoxAPI.Nodes.Node.Status._Get._Rootfs.Model"
+                    Model.__name__ = "ProxmoxAPI.Nodes.Node.Status._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Nodes.Node.Status._Get.TypedDict": ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Nodes.Node.Status._Get.Model": ...
+
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"command": Literal["reboot", "shutdown"]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def status(self) -> Status: ...
+
+            @dataclass
+            class Netstat:
+                @dataclass
+                class _Get:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[dict[str, Any]]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[dict[str, Any]]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def netstat(self) -> Netstat: ...
+
+            @dataclass
+            class Execute:
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"commands": str})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[dict[str, Any]]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[dict[str, Any]]: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def execute(self) -> Execute: ...
+
+            @dataclass
+            class Wakeonlan:
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> str: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> str: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def wakeonlan(self) -> Wakeonlan: ...
+
+            @dataclass
+            class Rrd:
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_195e3c884669.TypedDict):
+                        pass
+
+                    class Model(_Shape_195e3c884669.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Nodes.Node.Rrd._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"cf": NotRequired[Literal["AVERAGE", "MAX"]], "ds": str, "timeframe": Literal["hour", "day", "week", "month", "year"]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Nodes.Node.Rrd._Get.TypedDict": ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Nodes.Node.Rrd._Get.Model": ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def rrd(self) -> Rrd: ...
+
+            @dataclass
+            class Rrddata:
+                @dataclass
+                class _Get:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"cf": NotRequired[Literal["AVERAGE", "MAX"]], "timeframe": Literal["hour", "day", "week", "month", "year"]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[dict[str, Any]]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[dict[str, Any]]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def rrddata(self) -> Rrddata: ...
+
+            @dataclass
+            class Syslog:
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_b560f719f833.TypedDict):
+                        pass
+
+                    class Model(_Shape_b560f719f833.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Nodes.Node.Syslog._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"limit": NotRequired[int], "service": NotRequired[str], "since": NotRequired[str], "start": NotRequired[int], "until": NotRequired[str]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Nodes.Node.Syslog._Get.TypedDict"]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list["ProxmoxAPI.Nodes.Node.Syslog._Get.Model"]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def syslog(self) -> Syslog: ...
+
+            @dataclass
+            class Journal:
+                @dataclass
+                class _Get:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"endcursor": NotRequired[str], "lastentries": NotRequired[int], "since": NotRequired[int], "startcursor": NotRequired[str], "until": NotRequired[int]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[str]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[str]: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def journal(self) -> Journal: ...
+
+            @dataclass
+            class Vncshell:
+                @dataclass
+                class _Post:
+                    class TypedDict(_Shape_4e7fdf7cf155.TypedDict):
+                        pass
+
+                    class Model(_Shape_4e7fdf7cf155.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Nodes.Node.Vncshell._Post"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"cmd": NotRequired[Literal["ceph_install", "upgrade", "login"]], "cmd-opts": NotRequired[str], "height": NotRequired[int], "websocket": NotRequired[bool], "width": NotRequired[int]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Nodes.Node.Vncshell._Post.TypedDict": ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Nodes.Node.Vncshell._Post.Model": ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def vncshell(self) -> Vncshell: ...
+
+            @dataclass
+            class Termproxy:
+                @dataclass
+                class _Post:
+                    class TypedDict(_Shape_c3611ee60687.TypedDict):
+                        pass
+
+                    class Model(_Shape_c3611ee60687.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Nodes.Node.Termproxy._Post"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"cmd": NotRequired[Literal["ceph_install", "upgrade", "login"]], "cmd-opts": NotRequired[str]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Nodes.Node.Termproxy._Post.TypedDict": ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Nodes.Node.Termproxy._Post.Model": ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def termproxy(self) -> Termproxy: ...
+
+            @dataclass
+            class Vncwebsocket:
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_12b5d7d6b00b.TypedDict):
+                        pass
+
+                    class Model(_Shape_12b5d7d6b00b.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Nodes.Node.Vncwebsocket._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"port": int, "vncticket": str})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Nodes.Node.Vncwebsocket._Get.TypedDict": ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Nodes.Node.Vncwebsocket._Get.Model": ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def vncwebsocket(self) -> Vncwebsocket: ...
+
+            @dataclass
+            class Spiceshell:
+                @dataclass
+                class _Post:
+                    class TypedDict(_Shape_dc8364425177.TypedDict):
+                        pass
+
+                    class Model(_Shape_dc8364425177.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Nodes.Node.Spiceshell._Post"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"cmd": NotRequired[Literal["ceph_install", "upgrade", "login"]], "cmd-opts": NotRequired[str], "proxy": NotRequired[str]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Nodes.Node.Spiceshell._Post.TypedDict": ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Nodes.Node.Spiceshell._Post.Model": ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def spiceshell(self) -> Spiceshell: ...
+
+            @dataclass
+            class Dns:
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_e0e1c8b9f8bf.TypedDict):
+                        pass
+
+                    class Model(_Shape_e0e1c8b9f8bf.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Nodes.Node.Dns._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Nodes.Node.Dns._Get.TypedDict": ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Nodes.Node.Dns._Get.Model": ...
+
+                @dataclass
+                class _Put:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"dns1": NotRequired[str], "dns2": NotRequired[str], "dns3": NotRequired[str], "search": str})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def put(self) -> _Put: ...
+
+                @property
+                def set(self) -> _Put: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def dns(self) -> Dns: ...
+
+            @dataclass
+            class Time:
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_186ba101f850.TypedDict):
+                        pass
+
+                    class Model(_Shape_186ba101f850.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Nodes.Node.Time._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Nodes.Node.Time._Get.TypedDict": ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Nodes.Node.Time._Get.Model": ...
+
+                @dataclass
+                class _Put:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"timezone": str})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def put(self) -> _Put: ...
+
+                @property
+                def set(self) -> _Put: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def time(self) -> Time: ...
+
+            @dataclass
+            class Aplinfo:
+                @dataclass
+                class _Get:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[dict[str, Any]]: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> list[dict[str, Any]]: ...
+
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"storage": str, "template": str})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> str: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> str: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def aplinfo(self) -> Aplinfo: ...
+
+            @dataclass
+            class QueryUrlMetadata:
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_93b6fbad9fd6.TypedDict):
+                        pass
+
+                    class Model(_Shape_93b6fbad9fd6.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Nodes.Node.QueryUrlMetadata._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"url": str, "verify-certificates": NotRequired[bool]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Nodes.Node.QueryUrlMetadata._Get.TypedDict": ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Nodes.Node.QueryUrlMetadata._Get.Model": ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def query_url_metadata(self) -> QueryUrlMetadata: ...
+
+            @dataclass
+            class Report:
+                @dataclass
+                class _Get:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> str: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> str: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def report(self) -> Report: ...
+
+            @dataclass
+            class Startall:
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"force": NotRequired[bool], "vms": NotRequired[str]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> str: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> str: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def startall(self) -> Startall: ...
+
+            @dataclass
+            class Stopall:
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"force-stop": NotRequired[bool], "timeout": NotRequired[int], "vms": NotRequired[str]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> str: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> str: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def stopall(self) -> Stopall: ...
+
+            @dataclass
+            class Suspendall:
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"vms": NotRequired[str]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> str: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> str: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def suspendall(self) -> Suspendall: ...
+
+            @dataclass
+            class Migrateall:
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"maxworkers": NotRequired[int], "target": str, "vms": NotRequired[str], "with-local-disks": NotRequired[bool]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> str: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> str: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def migrateall(self) -> Migrateall: ...
+
+            @dataclass
+            class Hosts:
+                @dataclass
+                class _Get:
+                    class TypedDict(_Shape_56515a7944bc.TypedDict):
+                        pass
+
+                    class Model(_Shape_56515a7944bc.Model):
+                        pass
+                    Model.__name__ = "ProxmoxAPI.Nodes.Node.Hosts._Get"
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Nodes.Node.Hosts._Get.TypedDict": ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> "ProxmoxAPI.Nodes.Node.Hosts._Get.Model": ...
+
+                @dataclass
+                class _Post:
+                    proxmox_api: ProxmoxerProxmoxAPI
+                    node: str
+                    Params = typing.TypedDict("Params", {"data": str, "digest": NotRequired[str]})
+
+                    def __call__(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                    def model(
+                        self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                    ) -> None: ...
+
+                @cached_property
+                def get(self) -> _Get: ...
+
+                @cached_property
+                def post(self) -> _Post: ...
+
+                @property
+                def create(self) -> _Post: ...
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+
+            @cached_property
+            def hosts(self) -> Hosts: ...
+
+            @dataclass
+            class _Get:
+                proxmox_api: ProxmoxerProxmoxAPI
+                node: str
+                Params = typing.TypedDict("Params", {})
+
+                def __call__(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list[dict[str, Any]]: ...
+
+                def model(
+                    self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+                ) -> list[dict[str, Any]]: ...
+
+            @cached_property
+            def get(self) -> _Get: ...
+            proxmox_api: ProxmoxerProxmoxAPI
+            node: str
+
+        def __call__(self, node: str) -> Node: ...
+
+        @dataclass
+        class _Get:
+            class TypedDict(_Shape_867ed03f1f46.TypedDict):
+                pass
+
+            class Model(_Shape_867ed03f1f46.Model):
+                pass
+            Model.__name__ = "ProxmoxAPI.Nodes._Get"
+            proxmox_api: ProxmoxerProxmoxAPI
+            Params = typing.TypedDict("Params", {})
+
+            def __call__(
+                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+            ) -> list["ProxmoxAPI.Nodes._Get.TypedDict"]: ...
+
+            def model(
+                self, *args: Any, check: bool = True, **kwargs: Unpack[Params]
+            ) -> list["ProxmoxAPI.Nodes._Get.Model"]: ...
+
+        @cached_property
+        def get(self) -> _Get: ...
+        proxmox_api: ProxmoxerProxmoxAPI
\ No newline at end of file
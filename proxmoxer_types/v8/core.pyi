@@ -0,0 +1,44 @@
+# This file is autogenerated from apidata/apidata-v8.json
+
+import builtins
+import proxmoxer
+import pydantic
+import typing
+from functools import cached_property
+from typing import Any, TYPE_CHECKING
+if TYPE_CHECKING:
+    from ..v8 import ProxmoxAPI as ProxmoxerProxmoxAPI
+else:
+    from proxmoxer import ProxmoxAPI as ProxmoxerProxmoxAPI
+from ..shapes import BaseModel as BaseModel
+from typing import TypeAlias
+from . import _cluster, _nodes, _storage, _access, _pools, _version
+
+class ProxmoxAPI:
+    proxmox_api: ProxmoxerProxmoxAPI
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None: ...
+    Cluster: TypeAlias = _cluster.ProxmoxAPI.Cluster
+
+    @cached_property
+    def cluster(self) -> Cluster: ...
+    Nodes: TypeAlias = _nodes.ProxmoxAPI.Nodes
+
+    @cached_property
+    def nodes(self) -> Nodes: ...
+    Storage: TypeAlias = _storage.ProxmoxAPI.Storage
+
+    @cached_property
+    def storage(self) -> Storage: ...
+    Access: TypeAlias = _access.ProxmoxAPI.Access
+
+    @cached_property
+    def access(self) -> Access: ...
+    Pools: TypeAlias = _pools.ProxmoxAPI.Pools
+
+    @cached_property
+    def pools(self) -> Pools: ...
+    Version: TypeAlias = _version.ProxmoxAPI.Version
+
+    @cached_property
+    def version(self) -> Version: ...
\ No newline at end of file
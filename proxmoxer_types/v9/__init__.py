@@ -1 +1,17 @@
-from .core import *
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# See lite, the mypy plugin reads the manifest instead of core
+PROXMOXER_PLUGIN = False
+
+# What `from .core import *` exported, star imports do not ask __getattr__
+__all__ = ["ProxmoxAPI"]
+
+if TYPE_CHECKING and not PROXMOXER_PLUGIN:
+    from .core import *
+else:
+
+    def __getattr__(name: str) -> Any:
+        # core is big, the table, endpoints and lite modules get by without it
+        core = importlib.import_module(f"{__name__}.core")
+        return core if name == "core" else getattr(core, name)
@@ -0,0 +1,9 @@
+from typing import TYPE_CHECKING
+
+from .. import runtime
+
+
+class ProxmoxAPI(runtime.ProxmoxAPI):
+    if not TYPE_CHECKING:
+        # proxmoxer_types.mypy_plugin reads the manifest itself, mypy need not analyze it
+        from .endpoints import ENDPOINTS as _endpoints
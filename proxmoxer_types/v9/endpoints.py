@@ -0,0 +1,438 @@
+# This file is autogenerated from apidata/apidata-v9.json
+
+# Path, attribute of its last segment or "" for a parameter and the returned
+# type of each method, read by proxmoxer_types.runtime
+ENDPOINTS = (
+    ("/cluster", "cluster", (("get", ("array", ("object",))),)),
+    ("/cluster/replication", "replication", (("get", ("array", ("object", (("comment", True, ("string",)), ("disable", True, ("boolean",)), ("guest", False, ("integer",)), ("id", False, ("string",)), ("jobnum", False, ("integer",)), ("rate", True, ("number",)), ("remove_job", True, ("string", ("local", "full"))), ("schedule", True, ("string",)), ("source", True, ("string",)), ("target", False, ("string",)), ("type", False, ("string", ("local",))))))), ("post", ("null",)))),
+    ("/cluster/replication/{id}", "", (("delete", ("null",)), ("get", ("object", (("comment", True, ("string",)), ("digest", True, ("string",)), ("disable", True, ("boolean",)), ("guest", False, ("integer",)), ("id", False, ("string",)), ("jobnum", False, ("integer",)), ("rate", True, ("number",)), ("remove_job", True, ("string", ("local", "full"))), ("schedule", True, ("string",)), ("source", True, ("string",)), ("target", False, ("string",)), ("type", False, ("string", ("local",)))))), ("put", ("null",)))),
+    ("/cluster/metrics", "metrics", (("get", ("array", ("object",))),)),
+    ("/cluster/metrics/server", "server", (("get", ("array", ("object", (("disable", False, ("boolean",)), ("id", False, ("string",)), ("port", False, ("integer",)), ("server", False, ("string",)), ("type", False, ("string",)))))),)),
+    ("/cluster/metrics/server/{id}", "", (("delete", ("null",)), ("get", ("object",)), ("post", ("null",)), ("put", ("null",)))),
+    ("/cluster/metrics/export", "export", (("get", ("object", (("data", False, ("array", ("object", (("id", False, ("string",)), ("metric", False, ("string",)), ("timestamp", False, ("integer",)), ("type", False, ("string", ("gauge", "counter", "derive"))), ("value", False, ("number",)))))),))),)),
+    ("/cluster/notifications", "notifications", (("get", ("array", ("object",))),)),
+    ("/cluster/notifications/matcher-fields", "matcher_fields", (("get", ("array", ("object", (("name", False, ("string",)),)))),)),
+    ("/cluster/notifications/matcher-field-values", "matcher_field_values", (("get", ("array", ("object", (("comment", True, ("string",)), ("field", False, ("string",)), ("value", False, ("string",)))))),)),
+    ("/cluster/notifications/endpoints", "endpoints", (("get", ("array", ("object",))),)),
+    ("/cluster/notifications/endpoints/sendmail", "sendmail", (("get", ("array", ("object", (("author", True, ("string",)), ("comment", True, ("string",)), ("disable", True, ("boolean",)), ("from-address", True, ("string",), "from_address"), ("mailto", True, ("array", ("string",))), ("mailto-user", True, ("array", ("string",)), "mailto_user"), ("name", False, ("string",)), ("origin", False, ("string", ("user-created", "builtin", "modified-builtin"))))))), ("post", ("null",)))),
+    ("/cluster/notifications/endpoints/sendmail/{name}", "", (("delete", ("null",)), ("get", ("object", (("author", True, ("string",)), ("comment", True, ("string",)), ("digest", True, ("string",)), ("disable", True, ("boolean",)), ("from-address", True, ("string",), "from_address"), ("mailto", True, ("array", ("string",))), ("mailto-user", True, ("array", ("string",)), "mailto_user"), ("name", False, ("string",))))), ("put", ("null",)))),
+    ("/cluster/notifications/endpoints/gotify", "gotify", (("get", ("array", ("object", (("comment", True, ("string",)), ("disable", True, ("boolean",)), ("name", False, ("string",)), ("origin", False, ("string", ("user-created", "builtin", "modified-builtin"))), ("server", False, ("string",)))))), ("post", ("null",)))),
+    ("/cluster/notifications/endpoints/gotify/{name}", "", (("delete", ("null",)), ("get", ("object", (("comment", True, ("string",)), ("digest", True, ("string",)), ("disable", True, ("boolean",)), ("name", False, ("string",)), ("server", False, ("string",))))), ("put", ("null",)))),
+    ("/cluster/notifications/endpoints/smtp", "smtp", (("get", ("array", ("object", (("author", True, ("string",)), ("comment", True, ("string",)), ("disable", True, ("boolean",)), ("from-address", False, ("string",), "from_address"), ("mailto", True, ("array", ("string",))), ("mailto-user", True, ("array", ("string",)), "mailto_user"), ("mode", True, ("string", ("insecure", "starttls", "tls"))), ("name", False, ("string",)), ("origin", False, ("string", ("user-created", "builtin", "modified-builtin"))), ("port", True, ("integer",)), ("server", False, ("string",)), ("username", True, ("string",)))))), ("post", ("null",)))),
+    ("/cluster/notifications/endpoints/smtp/{name}", "", (("delete", ("null",)), ("get", ("object", (("author", True, ("string",)), ("comment", True, ("string",)), ("digest", True, ("string",)), ("disable", True, ("boolean",)), ("from-address", False, ("string",), "from_address"), ("mailto", True, ("array", ("string",))), ("mailto-user", True, ("array", ("string",)), "mailto_user"), ("mode", True, ("string", ("insecure", "starttls", "tls"))), ("name", False, ("string",)), ("port", True, ("integer",)), ("server", False, ("string",)), ("username", True, ("string",))))), ("put", ("null",)))),
+    ("/cluster/notifications/endpoints/webhook", "webhook", (("get", ("array", ("object", (("body", True, ("string",)), ("comment", True, ("string",)), ("disable", True, ("boolean",)), ("header", True, ("array", ("string",))), ("method", False, ("string", ("post", "put", "get"))), ("name", False, ("string",)), ("origin", False, ("string", ("user-created", "builtin", "modified-builtin"))), ("secret", True, ("array", ("string",))), ("url", False, ("string",)))))), ("post", ("null",)))),
+    ("/cluster/notifications/endpoints/webhook/{name}", "", (("delete", ("null",)), ("get", ("object", (("body", True, ("string",)), ("comment", True, ("string",)), ("digest", True, ("string",)), ("disable", True, ("boolean",)), ("header", True, ("array", ("string",))), ("method", False, ("string", ("post", "put", "get"))), ("name", False, ("string",)), ("secret", True, ("array", ("string",))), ("url", False, ("string",))))), ("put", ("null",)))),
+    ("/cluster/notifications/targets", "targets", (("get", ("array", ("object", (("comment", True, ("string",)), ("disable", True, ("boolean",)), ("name", False, ("string",)), ("origin", False, ("string", ("user-created", "builtin", "modified-builtin"))), ("type", False, ("string", ("sendmail", "gotify", "smtp", "webhook"))))))),)),
+    ("/cluster/notifications/targets/{name}", "", ()),
+    ("/cluster/notifications/targets/{name}/test", "test", (("post", ("null",)),)),
+    ("/cluster/notifications/matchers", "matchers", (("get", ("array", ("object", (("comment", True, ("string",)), ("disable", True, ("boolean",)), ("invert-match", True, ("boolean",), "invert_match"), ("match-calendar", True, ("array", ("string",)), "match_calendar"), ("match-field", True, ("array", ("string",)), "match_field"), ("match-severity", True, ("array", ("string",)), "match_severity"), ("mode", True, ("string", ("all", "any"))), ("name", False, ("string",)), ("origin", False, ("string", ("user-created", "builtin", "modified-builtin"))), ("target", True, ("array", ("string",))))))), ("post", ("null",)))),
+    ("/cluster/notifications/matchers/{name}", "", (("delete", ("null",)), ("get", ("object", (("comment", True, ("string",)), ("digest", True, ("string",)), ("disable", True, ("boolean",)), ("invert-match", True, ("boolean",), "invert_match"), ("match-calendar", True, ("array", ("string",)), "match_calendar"), ("match-field", True, ("array", ("string",)), "match_field"), ("match-severity", True, ("array", ("string",)), "match_severity"), ("mode", True, ("string", ("all", "any"))), ("name", False, ("string",)), ("target", True, ("array", ("string",)))))), ("put", ("null",)))),
+    ("/cluster/config", "config", (("get", ("array", ("object",))), ("post", ("string",)))),
+    ("/cluster/config/apiversion", "apiversion", (("get", ("integer",)),)),
+    ("/cluster/config/nodes", "nodes", (("get", ("array", ("object", (("node", False, ("string",)),)))),)),
+    ("/cluster/config/nodes/{node}", "", (("delete", ("null",)), ("post", ("object", (("corosync_authkey", False, ("string",)), ("corosync_conf", False, ("string",)), ("warnings", False, ("array", ("string",)))))))),
+    ("/cluster/config/join", "join", (("get", ("object", (("config_digest", False, ("string",)), ("nodelist", False, ("array", ("object", (("name", False, ("string",)), ("nodeid", True, ("integer",)), ("pve_addr", False, ("string",)), ("pve_fp", False, ("string",)), ("quorum_votes", False, ("integer",)), ("ring0_addr", True, ("string",)))))), ("preferred_node", False, ("string",)), ("totem", False, ("object",))))), ("post", ("string",)))),
+    ("/cluster/config/totem", "totem", (("get", ("object",)),)),
+    ("/cluster/config/qdevice", "qdevice", (("get", ("object",)),)),
+    ("/cluster/firewall", "firewall", (("get", ("array", ("object",))),)),
+    ("/cluster/firewall/groups", "groups", (("get", ("array", ("object", (("comment", True, ("string",)), ("digest", False, ("string",)), ("group", False, ("string",)))))), ("post", ("null",)))),
+    ("/cluster/firewall/groups/{group}", "", (("delete", ("null",)), ("get", ("array", ("object", (("action", False, ("string",)), ("comment", True, ("string",)), ("dest", True, ("string",)), ("dport", True, ("string",)), ("enable", True, ("integer",)), ("icmp-type", True, ("string",), "icmp_type"), ("iface", True, ("string",)), ("ipversion", True, ("integer",)), ("log", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("macro", True, ("string",)), ("pos", False, ("integer",)), ("proto", True, ("string",)), ("source", True, ("string",)), ("sport", True, ("string",)), ("type", False, ("string",)))))), ("post", ("null",)))),
+    ("/cluster/firewall/groups/{group}/{pos}", "", (("delete", ("null",)), ("get", ("object", (("action", False, ("string",)), ("comment", True, ("string",)), ("dest", True, ("string",)), ("dport", True, ("string",)), ("enable", True, ("integer",)), ("icmp-type", True, ("string",), "icmp_type"), ("iface", True, ("string",)), ("ipversion", True, ("integer",)), ("log", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("macro", True, ("string",)), ("pos", False, ("integer",)), ("proto", True, ("string",)), ("source", True, ("string",)), ("sport", True, ("string",)), ("type", False, ("string",))))), ("put", ("null",)))),
+    ("/cluster/firewall/rules", "rules", (("get", ("array", ("object", (("action", False, ("string",)), ("comment", True, ("string",)), ("dest", True, ("string",)), ("dport", True, ("string",)), ("enable", True, ("integer",)), ("icmp-type", True, ("string",), "icmp_type"), ("iface", True, ("string",)), ("ipversion", True, ("integer",)), ("log", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("macro", True, ("string",)), ("pos", False, ("integer",)), ("proto", True, ("string",)), ("source", True, ("string",)), ("sport", True, ("string",)), ("type", False, ("string",)))))), ("post", ("null",)))),
+    ("/cluster/firewall/rules/{pos}", "", (("delete", ("null",)), ("get", ("object", (("action", False, ("string",)), ("comment", True, ("string",)), ("dest", True, ("string",)), ("dport", True, ("string",)), ("enable", True, ("integer",)), ("icmp-type", True, ("string",), "icmp_type"), ("iface", True, ("string",)), ("ipversion", True, ("integer",)), ("log", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("macro", True, ("string",)), ("pos", False, ("integer",)), ("proto", True, ("string",)), ("source", True, ("string",)), ("sport", True, ("string",)), ("type", False, ("string",))))), ("put", ("null",)))),
+    ("/cluster/firewall/ipset", "ipset", (("get", ("array", ("object", (("comment", True, ("string",)), ("digest", False, ("string",)), ("name", False, ("string",)))))), ("post", ("null",)))),
+    ("/cluster/firewall/ipset/{name}", "", (("delete", ("null",)), ("get", ("array", ("object", (("cidr", False, ("string",)), ("comment", True, ("string",)), ("digest", False, ("string",)), ("nomatch", True, ("boolean",)))))), ("post", ("null",)))),
+    ("/cluster/firewall/ipset/{name}/{cidr}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/cluster/firewall/aliases", "aliases", (("get", ("array", ("object", (("cidr", False, ("string",)), ("comment", True, ("string",)), ("digest", False, ("string",)), ("name", False, ("string",)))))), ("post", ("null",)))),
+    ("/cluster/firewall/aliases/{name}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/cluster/firewall/options", "options", (("get", ("object", (("ebtables", True, ("boolean",)), ("enable", True, ("integer",)), ("log_ratelimit", True, ("string",)), ("policy_forward", True, ("string", ("ACCEPT", "DROP"))), ("policy_in", True, ("string", ("ACCEPT", "REJECT", "DROP"))), ("policy_out", True, ("string", ("ACCEPT", "REJECT", "DROP")))))), ("put", ("null",)))),
+    ("/cluster/firewall/macros", "macros", (("get", ("array", ("object", (("descr", False, ("string",)), ("macro", False, ("string",)))))),)),
+    ("/cluster/firewall/refs", "refs", (("get", ("array", ("object", (("comment", True, ("string",)), ("name", False, ("string",)), ("ref", False, ("string",)), ("scope", False, ("string",)), ("type", False, ("string", ("alias", "ipset"))))))),)),
+    ("/cluster/backup", "backup", (("get", ("array", ("object", (("id", False, ("string",)),)))), ("post", ("null",)))),
+    ("/cluster/backup/{id}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/cluster/backup/{id}/included_volumes", "included_volumes", (("get", ("object", (("children", False, ("array", ("object", (("children", True, ("array", ("object", (("id", False, ("string",)), ("included", False, ("boolean",)), ("name", False, ("string",)), ("reason", False, ("string",)))))), ("id", False, ("integer",)), ("name", True, ("string",)), ("type", False, ("string", ("qemu", "lxc", "unknown"))))))),))),)),
+    ("/cluster/backup-info", "backup_info", (("get", ("array", ("object", (("subdir", False, ("string",)),)))),)),
+    ("/cluster/backup-info/not-backed-up", "not_backed_up", (("get", ("array", ("object", (("name", True, ("string",)), ("type", False, ("string", ("qemu", "lxc"))), ("vmid", False, ("integer",)))))),)),
+    ("/cluster/ha", "ha", (("get", ("array", ("object", (("id", False, ("string",)),)))),)),
+    ("/cluster/ha/resources", "resources", (("get", ("array", ("object", (("sid", False, ("string",)),)))), ("post", ("null",)))),
+    ("/cluster/ha/resources/{sid}", "", (("delete", ("null",)), ("get", ("object", (("comment", True, ("string",)), ("digest", False, ("string",)), ("failback", True, ("boolean",)), ("group", True, ("string",)), ("max_relocate", True, ("integer",)), ("max_restart", True, ("integer",)), ("sid", False, ("string",)), ("state", True, ("string", ("started", "stopped", "enabled", "disabled", "ignored"))), ("type", False, ("string",))))), ("put", ("null",)))),
+    ("/cluster/ha/resources/{sid}/migrate", "migrate", (("post", ("object", (("blocking-resources", True, ("array", ("object", (("cause", False, ("string", ("resource-affinity",))), ("sid", False, ("string",))))), "blocking_resources"), ("comigrated-resources", True, ("array",), "comigrated_resources"), ("requested-node", False, ("string",), "requested_node"), ("sid", False, ("string",))))),)),
+    ("/cluster/ha/resources/{sid}/relocate", "relocate", (("post", ("object", (("blocking-resources", True, ("array", ("object", (("cause", False, ("string", ("resource-affinity",))), ("sid", False, ("string",))))), "blocking_resources"), ("comigrated-resources", True, ("array", ("string",)), "comigrated_resources"), ("requested-node", False, ("string",), "requested_node"), ("sid", False, ("string",))))),)),
+    ("/cluster/ha/groups", "groups", (("get", ("array", ("object", (("group", False, ("string",)),)))), ("post", ("null",)))),
+    ("/cluster/ha/groups/{group}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/cluster/ha/rules", "rules", (("get", ("array", ("object", (("rule", False, ("string",)), ("affinity", True, ("string",)), ("disable", True, ("boolean",)), ("strict", True, ("boolean",)), ("nodes", True, ("string",)), ("resources", True, ("string",)), ("type", False, ("string",)))))), ("post", ("null",)))),
+    ("/cluster/ha/rules/{rule}", "", (("delete", ("null",)), ("get", ("object", (("rule", False, ("string",)), ("type", False, ("string", ("node-affinity", "resource-affinity")))))), ("put", ("null",)))),
+    ("/cluster/ha/status", "status", (("get", ("array", ("object",))),)),
+    ("/cluster/ha/status/current", "current", (("get", ("array", ("object", (("crm_state", True, ("string",)), ("failback", True, ("boolean",)), ("id", False, ("string",)), ("max_relocate", True, ("integer",)), ("max_restart", True, ("integer",)), ("node", False, ("string",)), ("quorate", True, ("boolean",)), ("request_state", True, ("string",)), ("sid", True, ("string",)), ("state", True, ("string",)), ("status", False, ("string",)), ("timestamp", True, ("integer",)), ("type", False, ("string", ("quorum", "master", "lrm", "service"))))))),)),
+    ("/cluster/ha/status/manager_status", "manager_status", (("get", ("object",)),)),
+    ("/cluster/acme", "acme", (("get", ("array", ("object",))),)),
+    ("/cluster/acme/plugins", "plugins", (("get", ("array", ("object", (("api", True, ("string", ("1984hosting", "acmedns", "acmeproxy", "active24", "ad", "ali", "alviy", "anx", "artfiles", "arvan", "aurora", "autodns", "aws", "azion", "azure", "beget", "bookmyname", "bunny", "cf", "clouddns", "cloudns", "cn", "conoha", "constellix", "cpanel", "curanet", "cyon", "da", "ddnss", "desec", "df", "dgon", "dnsexit", "dnshome", "dnsimple", "dnsservices", "doapi", "domeneshop", "dp", "dpi", "dreamhost", "duckdns", "durabledns", "dyn", "dynu", "dynv6", "easydns", "edgecenter", "edgedns", "euserv", "exoscale", "fornex", "freedns", "freemyip", "gandi_livedns", "gcloud", "gcore", "gd", "geoscaling", "googledomains", "he", "he_ddns", "hetzner", "hexonet", "hostingde", "huaweicloud", "infoblox", "infomaniak", "internetbs", "inwx", "ionos", "ionos_cloud", "ipv64", "ispconfig", "jd", "joker", "kappernet", "kas", "kinghost", "knot", "la", "leaseweb", "lexicon", "limacity", "linode", "linode_v4", "loopia", "lua", "maradns", "me", "miab", "mijnhost", "misaka", "myapi", "mydevil", "mydnsjp", "mythic_beasts", "namecheap", "namecom", "namesilo", "nanelo", "nederhost", "neodigit", "netcup", "netlify", "nic", "njalla", "nm", "nsd", "nsone", "nsupdate", "nw", "oci", "omglol", "one", "online", "openprovider", "openstack", "opnsense", "ovh", "pdns", "pleskxml", "pointhq", "porkbun", "rackcorp", "rackspace", "rage4", "rcode0", "regru", "scaleway", "schlundtech", "selectel", "selfhost", "servercow", "simply", "technitium", "tele3", "tencent", "timeweb", "transip", "udr", "ultra", "unoeuro", "variomedia", "veesp", "vercel", "vscale", "vultr", "websupport", "west_cn", "world4you", "yandex360", "yc", "zilore", "zone", "zoneedit", "zonomi"))), ("data", True, ("string",)), ("digest", True, ("string",)), ("disable", True, ("boolean",)), ("nodes", True, ("string",)), ("plugin", False, ("string",)), ("type", False, ("string", ("dns", "standalone"))), ("validation-delay", True, ("integer",), "validation_delay"))))), ("post", ("null",)))),
+    ("/cluster/acme/plugins/{id}", "", (("delete", ("null",)), ("get", ("object", (("api", True, ("string", ("1984hosting", "acmedns", "acmeproxy", "active24", "ad", "ali", "alviy", "anx", "artfiles", "arvan", "aurora", "autodns", "aws", "azion", "azure", "beget", "bookmyname", "bunny", "cf", "clouddns", "cloudns", "cn", "conoha", "constellix", "cpanel", "curanet", "cyon", "da", "ddnss", "desec", "df", "dgon", "dnsexit", "dnshome", "dnsimple", "dnsservices", "doapi", "domeneshop", "dp", "dpi", "dreamhost", "duckdns", "durabledns", "dyn", "dynu", "dynv6", "easydns", "edgecenter", "edgedns", "euserv", "exoscale", "fornex", "freedns", "freemyip", "gandi_livedns", "gcloud", "gcore", "gd", "geoscaling", "googledomains", "he", "he_ddns", "hetzner", "hexonet", "hostingde", "huaweicloud", "infoblox", "infomaniak", "internetbs", "inwx", "ionos", "ionos_cloud", "ipv64", "ispconfig", "jd", "joker", "kappernet", "kas", "kinghost", "knot", "la", "leaseweb", "lexicon", "limacity", "linode", "linode_v4", "loopia", "lua", "maradns", "me", "miab", "mijnhost", "misaka", "myapi", "mydevil", "mydnsjp", "mythic_beasts", "namecheap", "namecom", "namesilo", "nanelo", "nederhost", "neodigit", "netcup", "netlify", "nic", "njalla", "nm", "nsd", "nsone", "nsupdate", "nw", "oci", "omglol", "one", "online", "openprovider", "openstack", "opnsense", "ovh", "pdns", "pleskxml", "pointhq", "porkbun", "rackcorp", "rackspace", "rage4", "rcode0", "regru", "scaleway", "schlundtech", "selectel", "selfhost", "servercow", "simply", "technitium", "tele3", "tencent", "timeweb", "transip", "udr", "ultra", "unoeuro", "variomedia", "veesp", "vercel", "vscale", "vultr", "websupport", "west_cn", "world4you", "yandex360", "yc", "zilore", "zone", "zoneedit", "zonomi"))), ("data", True, ("string",)), ("digest", True, ("string",)), ("disable", True, ("boolean",)), ("nodes", True, ("string",)), ("plugin", False, ("string",)), ("type", False, ("string", ("dns", "standalone"))), ("validation-delay", True, ("integer",), "validation_delay")))), ("put", ("null",)))),
+    ("/cluster/acme/account", "account", (("get", ("array", ("object",))), ("post", ("string",)))),
+    ("/cluster/acme/account/{name}", "", (("delete", ("string",)), ("get", ("object", (("account", True, ("object",)), ("directory", True, ("string",)), ("location", True, ("string",)), ("tos", True, ("string",))))), ("put", ("string",)))),
+    ("/cluster/acme/tos", "tos", (("get", ("string",)),)),
+    ("/cluster/acme/meta", "meta", (("get", ("object", (("caaIdentities", True, ("array", ("string",)), "caa_identities"), ("externalAccountRequired", True, ("boolean",), "external_account_required"), ("termsOfService", True, ("string",), "terms_of_service"), ("website", True, ("string",))))),)),
+    ("/cluster/acme/directories", "directories", (("get", ("array", ("object", (("name", False, ("string",)), ("url", False, ("string",)))))),)),
+    ("/cluster/acme/challenge-schema", "challenge_schema", (("get", ("array", ("object", (("id", False, ("string",)), ("name", False, ("string",)), ("schema", False, ("object",), "schema_"), ("type", False, ("string",)))))),)),
+    ("/cluster/ceph", "ceph", (("get", ("array", ("object",))),)),
+    ("/cluster/ceph/metadata", "metadata", (("get", ("object", (("mds", False, ("object", (("{id}", False, ("object", (("addr", False, ("string",)), ("ceph_release", False, ("string",)), ("ceph_version", False, ("string",)), ("ceph_version_short", False, ("string",)), ("hostname", False, ("string",)), ("mem_swap_kb", False, ("integer",)), ("mem_total_kb", False, ("integer",)), ("name", False, ("string",)))), "id"),))), ("mgr", False, ("object", (("{id}", False, ("object", (("addr", False, ("string",)), ("ceph_release", False, ("string",)), ("ceph_version", False, ("string",)), ("ceph_version_short", False, ("string",)), ("hostname", False, ("string",)), ("mem_swap_kb", False, ("integer",)), ("mem_total_kb", False, ("integer",)), ("name", False, ("string",)))), "id"),))), ("mon", False, ("object", (("{id}", False, ("object", (("addrs", False, ("string",)), ("ceph_release", False, ("string",)), ("ceph_version", False, ("string",)), ("ceph_version_short", False, ("string",)), ("hostname", False, ("string",)), ("mem_swap_kb", False, ("integer",)), ("mem_total_kb", False, ("integer",)), ("name", False, ("string",)))), "id"),))), ("node", False, ("object", (("{node}", False, ("object", (("buildcommit", False, ("string",)), ("version", False, ("object", (("parts", False, ("array",)), ("str", False, ("string",))))))), "node"),))), ("osd", False, ("array",))))),)),
+    ("/cluster/ceph/status", "status", (("get", ("object",)),)),
+    ("/cluster/ceph/flags", "flags", (("get", ("array", ("object", (("description", False, ("string",)), ("name", False, ("string", ("nobackfill", "nodeep-scrub", "nodown", "noin", "noout", "norebalance", "norecover", "noscrub", "notieragent", "noup", "pause"))), ("value", False, ("boolean",)))))), ("put", ("string",)))),
+    ("/cluster/ceph/flags/{flag}", "", (("get", ("boolean",)), ("put", ("null",)))),
+    ("/cluster/jobs", "jobs", (("get", ("array", ("object", (("subdir", False, ("string",)),)))),)),
+    ("/cluster/jobs/realm-sync", "realm_sync", (("get", ("array", ("object", (("comment", True, ("string",)), ("enabled", False, ("boolean",)), ("id", False, ("string",)), ("last-run", True, ("integer",), "last_run"), ("next-run", True, ("integer",), "next_run"), ("realm", False, ("string",)), ("remove-vanished", True, ("string",), "remove_vanished"), ("schedule", False, ("string",)), ("scope", True, ("string", ("users", "groups", "both"))))))),)),
+    ("/cluster/jobs/realm-sync/{id}", "", (("delete", ("null",)), ("get", ("object",)), ("post", ("null",)), ("put", ("null",)))),
+    ("/cluster/jobs/schedule-analyze", "schedule_analyze", (("get", ("array", ("object", (("timestamp", False, ("integer",)), ("utc", False, ("string",)))))),)),
+    ("/cluster/mapping", "mapping", (("get", ("array", ("object",))),)),
+    ("/cluster/mapping/dir", "dir", (("get", ("array", ("object", (("checks", True, ("array", ("object", (("message", False, ("string",)), ("severity", False, ("string", ("warning", "error"))))))), ("description", False, ("string",)), ("id", False, ("string",)), ("map", False, ("array", ("string",))))))), ("post", ("null",)))),
+    ("/cluster/mapping/dir/{id}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/cluster/mapping/pci", "pci", (("get", ("array", ("object", (("checks", True, ("array", ("object", (("message", False, ("string",)), ("severity", False, ("string", ("warning", "error"))))))), ("description", False, ("string",)), ("id", False, ("string",)), ("map", False, ("array", ("string",))))))), ("post", ("null",)))),
+    ("/cluster/mapping/pci/{id}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/cluster/mapping/usb", "usb", (("get", ("array", ("object", (("description", False, ("string",)), ("error", False, ("object",)), ("id", False, ("string",)), ("map", False, ("array", ("string",))))))), ("post", ("null",)))),
+    ("/cluster/mapping/usb/{id}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/cluster/bulk-action", "bulk_action", (("get", ("array", ("object",))),)),
+    ("/cluster/bulk-action/guest", "guest", (("get", ("array", ("object",))),)),
+    ("/cluster/bulk-action/guest/start", "start", (("post", ("string",)),)),
+    ("/cluster/bulk-action/guest/shutdown", "shutdown", (("post", ("string",)),)),
+    ("/cluster/bulk-action/guest/suspend", "suspend", (("post", ("string",)),)),
+    ("/cluster/bulk-action/guest/migrate", "migrate", (("post", ("string",)),)),
+    ("/cluster/sdn", "sdn", (("get", ("array", ("object", (("id", False, ("string",)),)))), ("put", ("string",)))),
+    ("/cluster/sdn/vnets", "vnets", (("get", ("array", ("object", (("alias", True, ("string",)), ("digest", True, ("string",)), ("isolate-ports", True, ("boolean",), "isolate_ports"), ("pending", True, ("object", (("alias", True, ("string",)), ("isolate-ports", True, ("boolean",), "isolate_ports"), ("tag", True, ("integer",)), ("vlanaware", True, ("boolean",)), ("zone", True, ("string",))))), ("state", True, ("string", ("new", "changed", "deleted"))), ("tag", True, ("integer",)), ("type", False, ("string", ("vnet",))), ("vlanaware", True, ("boolean",)), ("vnet", False, ("string",)), ("zone", True, ("string",)))))), ("post", ("null",)))),
+    ("/cluster/sdn/vnets/{vnet}", "", (("delete", ("null",)), ("get", ("object", (("alias", True, ("string",)), ("digest", True, ("string",)), ("isolate-ports", True, ("boolean",), "isolate_ports"), ("pending", True, ("object", (("alias", True, ("string",)), ("isolate-ports", True, ("boolean",), "isolate_ports"), ("tag", True, ("integer",)), ("vlanaware", True, ("boolean",)), ("zone", True, ("string",))))), ("state", True, ("string", ("new", "changed", "deleted"))), ("tag", True, ("integer",)), ("type", False, ("string", ("vnet",))), ("vlanaware", True, ("boolean",)), ("vnet", False, ("string",)), ("zone", True, ("string",))))), ("put", ("null",)))),
+    ("/cluster/sdn/vnets/{vnet}/firewall", "firewall", (("get", ("array", ("object",))),)),
+    ("/cluster/sdn/vnets/{vnet}/firewall/rules", "rules", (("get", ("array", ("object", (("action", False, ("string",)), ("comment", True, ("string",)), ("dest", True, ("string",)), ("dport", True, ("string",)), ("enable", True, ("integer",)), ("icmp-type", True, ("string",), "icmp_type"), ("iface", True, ("string",)), ("ipversion", True, ("integer",)), ("log", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("macro", True, ("string",)), ("pos", False, ("integer",)), ("proto", True, ("string",)), ("source", True, ("string",)), ("sport", True, ("string",)), ("type", False, ("string",)))))), ("post", ("null",)))),
+    ("/cluster/sdn/vnets/{vnet}/firewall/rules/{pos}", "", (("delete", ("null",)), ("get", ("object", (("action", False, ("string",)), ("comment", True, ("string",)), ("dest", True, ("string",)), ("dport", True, ("string",)), ("enable", True, ("integer",)), ("icmp-type", True, ("string",), "icmp_type"), ("iface", True, ("string",)), ("ipversion", True, ("integer",)), ("log", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("macro", True, ("string",)), ("pos", False, ("integer",)), ("proto", True, ("string",)), ("source", True, ("string",)), ("sport", True, ("string",)), ("type", False, ("string",))))), ("put", ("null",)))),
+    ("/cluster/sdn/vnets/{vnet}/firewall/options", "options", (("get", ("object", (("enable", True, ("boolean",)), ("log_level_forward", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("policy_forward", True, ("string", ("ACCEPT", "DROP")))))), ("put", ("null",)))),
+    ("/cluster/sdn/vnets/{vnet}/subnets", "subnets", (("get", ("array", ("object",))), ("post", ("null",)))),
+    ("/cluster/sdn/vnets/{vnet}/subnets/{subnet}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/cluster/sdn/vnets/{vnet}/ips", "ips", (("delete", ("null",)), ("post", ("null",)), ("put", ("null",)))),
+    ("/cluster/sdn/zones", "zones", (("get", ("array", ("object", (("advertise-subnets", True, ("boolean",), "advertise_subnets"), ("bridge", True, ("string",)), ("bridge-disable-mac-learning", True, ("boolean",), "bridge_disable_mac_learning"), ("controller", True, ("string",)), ("dhcp", True, ("string", ("dnsmasq",))), ("digest", True, ("string",)), ("disable-arp-nd-suppression", True, ("boolean",), "disable_arp_nd_suppression"), ("dns", True, ("string",)), ("dnszone", True, ("string",)), ("exitnodes", True, ("string",)), ("exitnodes-local-routing", True, ("boolean",), "exitnodes_local_routing"), ("exitnodes-primary", True, ("string",), "exitnodes_primary"), ("ipam", True, ("string",)), ("mac", True, ("string",)), ("mtu", True, ("integer",)), ("nodes", True, ("string",)), ("peers", True, ("string",)), ("pending", True, ("object", (("advertise-subnets", True, ("boolean",), "advertise_subnets"), ("bridge", True, ("string",)), ("bridge-disable-mac-learning", True, ("boolean",), "bridge_disable_mac_learning"), ("controller", True, ("string",)), ("dhcp", True, ("string", ("dnsmasq",))), ("disable-arp-nd-suppression", True, ("boolean",), "disable_arp_nd_suppression"), ("dns", True, ("string",)), ("dnszone", True, ("string",)), ("exitnodes", True, ("string",)), ("exitnodes-local-routing", True, ("boolean",), "exitnodes_local_routing"), ("exitnodes-primary", True, ("string",), "exitnodes_primary"), ("ipam", True, ("string",)), ("mac", True, ("string",)), ("mtu", True, ("integer",)), ("nodes", True, ("string",)), ("peers", True, ("string",)), ("reversedns", True, ("string",)), ("rt-import", True, ("string",), "rt_import"), ("tag", True, ("integer",)), ("vlan-protocol", True, ("string", ("802.1q", "802.1ad")), "vlan_protocol"), ("vrf-vxlan", True, ("integer",), "vrf_vxlan"), ("vxlan-port", True, ("integer",), "vxlan_port")))), ("reversedns", True, ("string",)), ("rt-import", True, ("string",), "rt_import"), ("state", True, ("string", ("new", "changed", "deleted"))), ("tag", True, ("integer",)), ("type", False, ("string", ("evpn", "faucet", "qinq", "simple", "vlan", "vxlan"))), ("vlan-protocol", True, ("string", ("802.1q", "802.1ad")), "vlan_protocol"), ("vrf-vxlan", True, ("integer",), "vrf_vxlan"), ("vxlan-port", True, ("integer",), "vxlan_port"), ("zone", False, ("string",)))))), ("post", ("null",)))),
+    ("/cluster/sdn/zones/{zone}", "", (("delete", ("null",)), ("get", ("object", (("advertise-subnets", True, ("boolean",), "advertise_subnets"), ("bridge", True, ("string",)), ("bridge-disable-mac-learning", True, ("boolean",), "bridge_disable_mac_learning"), ("controller", True, ("string",)), ("dhcp", True, ("string", ("dnsmasq",))), ("digest", True, ("string",)), ("disable-arp-nd-suppression", True, ("boolean",), "disable_arp_nd_suppression"), ("dns", True, ("string",)), ("dnszone", True, ("string",)), ("exitnodes", True, ("string",)), ("exitnodes-local-routing", True, ("boolean",), "exitnodes_local_routing"), ("exitnodes-primary", True, ("string",), "exitnodes_primary"), ("ipam", True, ("string",)), ("mac", True, ("string",)), ("mtu", True, ("integer",)), ("nodes", True, ("string",)), ("peers", True, ("string",)), ("pending", True, ("object", (("advertise-subnets", True, ("boolean",), "advertise_subnets"), ("bridge", True, ("string",)), ("bridge-disable-mac-learning", True, ("boolean",), "bridge_disable_mac_learning"), ("controller", True, ("string",)), ("dhcp", True, ("string", ("dnsmasq",))), ("disable-arp-nd-suppression", True, ("boolean",), "disable_arp_nd_suppression"), ("dns", True, ("string",)), ("dnszone", True, ("string",)), ("exitnodes", True, ("string",)), ("exitnodes-local-routing", True, ("boolean",), "exitnodes_local_routing"), ("exitnodes-primary", True, ("string",), "exitnodes_primary"), ("ipam", True, ("string",)), ("mac", True, ("string",)), ("mtu", True, ("integer",)), ("nodes", True, ("string",)), ("peers", True, ("string",)), ("reversedns", True, ("string",)), ("rt-import", True, ("string",), "rt_import"), ("tag", True, ("integer",)), ("vlan-protocol", True, ("string", ("802.1q", "802.1ad")), "vlan_protocol"), ("vrf-vxlan", True, ("integer",), "vrf_vxlan"), ("vxlan-port", True, ("integer",), "vxlan_port")))), ("reversedns", True, ("string",)), ("rt-import", True, ("string",), "rt_import"), ("state", True, ("string", ("new", "changed", "deleted"))), ("tag", True, ("integer",)), ("type", False, ("string", ("evpn", "faucet", "qinq", "simple", "vlan", "vxlan"))), ("vlan-protocol", True, ("string", ("802.1q", "802.1ad")), "vlan_protocol"), ("vrf-vxlan", True, ("integer",), "vrf_vxlan"), ("vxlan-port", True, ("integer",), "vxlan_port"), ("zone", False, ("string",))))), ("put", ("null",)))),
+    ("/cluster/sdn/controllers", "controllers", (("get", ("array", ("object", (("asn", True, ("integer",)), ("bgp-multipath-as-relax", True, ("boolean",), "bgp_multipath_as_relax"), ("controller", False, ("string",)), ("digest", True, ("string",)), ("ebgp", True, ("boolean",)), ("ebgp-multihop", True, ("integer",), "ebgp_multihop"), ("isis-domain", True, ("string",), "isis_domain"), ("isis-ifaces", True, ("string",), "isis_ifaces"), ("isis-net", True, ("string",), "isis_net"), ("loopback", True, ("string",)), ("node", True, ("string",)), ("peers", True, ("string",)), ("pending", True, ("object", (("asn", True, ("integer",)), ("bgp-multipath-as-relax", True, ("boolean",), "bgp_multipath_as_relax"), ("ebgp", True, ("boolean",)), ("ebgp-multihop", True, ("integer",), "ebgp_multihop"), ("isis-domain", True, ("string",), "isis_domain"), ("isis-ifaces", True, ("string",), "isis_ifaces"), ("isis-net", True, ("string",), "isis_net"), ("loopback", True, ("string",)), ("node", True, ("string",)), ("peers", True, ("string",))))), ("state", True, ("string", ("new", "changed", "deleted"))), ("type", False, ("string", ("bgp", "evpn", "faucet", "isis"))))))), ("post", ("null",)))),
+    ("/cluster/sdn/controllers/{controller}", "", (("delete", ("null",)), ("get", ("object", (("asn", True, ("integer",)), ("bgp-multipath-as-relax", True, ("boolean",), "bgp_multipath_as_relax"), ("controller", False, ("string",)), ("digest", True, ("string",)), ("ebgp", True, ("boolean",)), ("ebgp-multihop", True, ("integer",), "ebgp_multihop"), ("isis-domain", True, ("string",), "isis_domain"), ("isis-ifaces", True, ("string",), "isis_ifaces"), ("isis-net", True, ("string",), "isis_net"), ("loopback", True, ("string",)), ("node", True, ("string",)), ("peers", True, ("string",)), ("pending", True, ("object", (("asn", True, ("integer",)), ("bgp-multipath-as-relax", True, ("boolean",), "bgp_multipath_as_relax"), ("ebgp", True, ("boolean",)), ("ebgp-multihop", True, ("integer",), "ebgp_multihop"), ("isis-domain", True, ("string",), "isis_domain"), ("isis-ifaces", True, ("string",), "isis_ifaces"), ("isis-net", True, ("string",), "isis_net"), ("loopback", True, ("string",)), ("node", True, ("string",)), ("peers", True, ("string",))))), ("state", True, ("string", ("new", "changed", "deleted"))), ("type", False, ("string", ("bgp", "evpn", "faucet", "isis")))))), ("put", ("null",)))),
+    ("/cluster/sdn/ipams", "ipams", (("get", ("array", ("object", (("ipam", False, ("string",)), ("type", False, ("string",)))))), ("post", ("null",)))),
+    ("/cluster/sdn/ipams/{ipam}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/cluster/sdn/ipams/{ipam}/status", "status", (("get", ("array",)),)),
+    ("/cluster/sdn/dns", "dns", (("get", ("array", ("object", (("dns", False, ("string",)), ("type", False, ("string",)))))), ("post", ("null",)))),
+    ("/cluster/sdn/dns/{dns}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/cluster/sdn/fabrics", "fabrics", (("get", ("array", ("object", (("subdir", False, ("string",)),)))),)),
+    ("/cluster/sdn/fabrics/fabric", "fabric", (("get", ("array", ("object", (("area", True, ("string",)), ("csnp_interval", True, ("number",)), ("digest", True, ("string",)), ("hello_interval", True, ("number",)), ("id", False, ("string",)), ("ip6_prefix", True, ("string",)), ("ip_prefix", True, ("string",)), ("lock-token", True, ("string",), "lock_token"), ("protocol", False, ("string", ("openfabric", "ospf"))))))), ("post", ("null",)))),
+    ("/cluster/sdn/fabrics/fabric/{id}", "", (("delete", ("null",)), ("get", ("object", (("area", True, ("string",)), ("csnp_interval", True, ("number",)), ("digest", True, ("string",)), ("hello_interval", True, ("number",)), ("id", False, ("string",)), ("ip6_prefix", True, ("string",)), ("ip_prefix", True, ("string",)), ("lock-token", True, ("string",), "lock_token"), ("protocol", False, ("string", ("openfabric", "ospf")))))), ("put", ("null",)))),
+    ("/cluster/sdn/fabrics/node", "node", (("get", ("array", ("object", (("digest", True, ("string",)), ("fabric_id", False, ("string",)), ("interfaces", False, ("array",)), ("ip", True, ("string",)), ("ip6", True, ("string",)), ("lock-token", True, ("string",), "lock_token"), ("node_id", False, ("string",)), ("protocol", False, ("string", ("openfabric", "ospf"))))))),)),
+    ("/cluster/sdn/fabrics/node/{fabric_id}", "", (("get", ("array", ("object", (("digest", True, ("string",)), ("fabric_id", False, ("string",)), ("interfaces", False, ("array",)), ("ip", True, ("string",)), ("ip6", True, ("string",)), ("lock-token", True, ("string",), "lock_token"), ("node_id", False, ("string",)), ("protocol", False, ("string", ("openfabric", "ospf"))))))), ("post", ("null",)))),
+    ("/cluster/sdn/fabrics/node/{fabric_id}/{node_id}", "", (("delete", ("null",)), ("get", ("object", (("digest", True, ("string",)), ("fabric_id", False, ("string",)), ("interfaces", False, ("array",)), ("ip", True, ("string",)), ("ip6", True, ("string",)), ("lock-token", True, ("string",), "lock_token"), ("node_id", False, ("string",)), ("protocol", False, ("string", ("openfabric", "ospf")))))), ("put", ("null",)))),
+    ("/cluster/sdn/fabrics/all", "all", (("get", ("object", (("fabrics", False, ("array", ("object", (("area", True, ("string",)), ("csnp_interval", True, ("number",)), ("digest", True, ("string",)), ("hello_interval", True, ("number",)), ("id", False, ("string",)), ("ip6_prefix", True, ("string",)), ("ip_prefix", True, ("string",)), ("lock-token", True, ("string",), "lock_token"), ("protocol", False, ("string", ("openfabric", "ospf"))))))), ("nodes", False, ("array", ("object", (("digest", True, ("string",)), ("fabric_id", False, ("string",)), ("interfaces", False, ("array",)), ("ip", True, ("string",)), ("ip6", True, ("string",)), ("lock-token", True, ("string",), "lock_token"), ("node_id", False, ("string",)), ("protocol", False, ("string", ("openfabric", "ospf")))))))))),)),
+    ("/cluster/sdn/lock", "lock", (("delete", ("null",)), ("post", ("string",)))),
+    ("/cluster/sdn/rollback", "rollback", (("post", ("null",)),)),
+    ("/cluster/log", "log", (("get", ("array", ("object",))),)),
+    ("/cluster/resources", "resources", (("get", ("array", ("object", (("cgroup-mode", True, ("integer",), "cgroup_mode"), ("content", True, ("string",)), ("cpu", True, ("number",)), ("disk", True, ("integer",)), ("diskread", True, ("integer",)), ("diskwrite", True, ("integer",)), ("hastate", True, ("string",)), ("id", False, ("string",)), ("level", True, ("string",)), ("lock", True, ("string",)), ("maxcpu", True, ("number",)), ("maxdisk", True, ("integer",)), ("maxmem", True, ("integer",)), ("mem", True, ("integer",)), ("memhost", True, ("integer",)), ("name", True, ("string",)), ("netin", True, ("integer",)), ("netout", True, ("integer",)), ("network", True, ("string",)), ("network-type", True, ("string", ("fabric", "zone")), "network_type"), ("node", True, ("string",)), ("plugintype", True, ("string",)), ("pool", True, ("string",)), ("protocol", True, ("string",)), ("sdn", True, ("string",)), ("status", True, ("string",)), ("storage", True, ("string",)), ("tags", True, ("string",)), ("template", True, ("boolean",)), ("type", False, ("string", ("node", "storage", "pool", "qemu", "lxc", "openvz", "sdn", "network"))), ("uptime", True, ("integer",)), ("vmid", True, ("integer",)), ("zone-type", True, ("string",), "zone_type"))))),)),
+    ("/cluster/tasks", "tasks", (("get", ("array", ("object", (("upid", False, ("string",)),)))),)),
+    ("/cluster/options", "options", (("get", ("object",)), ("put", ("null",)))),
+    ("/cluster/status", "status", (("get", ("array", ("object", (("id", False, ("string",)), ("ip", True, ("string",)), ("level", True, ("string",)), ("local", True, ("boolean",)), ("name", False, ("string",)), ("nodeid", True, ("integer",)), ("nodes", True, ("integer",)), ("online", True, ("boolean",)), ("quorate", True, ("boolean",)), ("type", False, ("string", ("cluster", "node"))), ("version", True, ("integer",)))))),)),
+    ("/cluster/nextid", "nextid", (("get", ("integer",)),)),
+    ("/nodes", "nodes", (("get", ("array", ("object", (("cpu", True, ("number",)), ("level", True, ("string",)), ("maxcpu", True, ("integer",)), ("maxmem", True, ("integer",)), ("mem", True, ("integer",)), ("node", False, ("string",)), ("ssl_fingerprint", True, ("string",)), ("status", False, ("string", ("unknown", "online", "offline"))), ("uptime", True, ("integer",)), ("disk", True, ("integer",)), ("maxdisk", True, ("integer",)))))),)),
+    ("/nodes/{node}", "", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/qemu", "qemu", (("get", ("array", ("object", (("cpu", True, ("number",)), ("cpus", True, ("number",)), ("diskread", True, ("integer",)), ("diskwrite", True, ("integer",)), ("lock", True, ("string",)), ("maxdisk", True, ("integer",)), ("maxmem", True, ("integer",)), ("mem", True, ("integer",)), ("memhost", True, ("integer",)), ("name", True, ("string",)), ("netin", True, ("integer",)), ("netout", True, ("integer",)), ("pid", True, ("integer",)), ("pressurecpufull", True, ("number",)), ("pressurecpusome", True, ("number",)), ("pressureiofull", True, ("number",)), ("pressureiosome", True, ("number",)), ("pressurememoryfull", True, ("number",)), ("pressurememorysome", True, ("number",)), ("qmpstatus", True, ("string",)), ("running-machine", True, ("string",), "running_machine"), ("running-qemu", True, ("string",), "running_qemu"), ("serial", True, ("boolean",)), ("status", False, ("string", ("stopped", "running"))), ("tags", True, ("string",)), ("template", True, ("boolean",)), ("uptime", True, ("integer",)), ("vmid", False, ("integer",)), ("disk", True, ("integer",)))))), ("post", ("string",)))),
+    ("/nodes/{node}/qemu/{vmid}", "", (("delete", ("string",)), ("get", ("array", ("object", (("subdir", False, ("string",)),)))))),
+    ("/nodes/{node}/qemu/{vmid}/firewall", "firewall", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/qemu/{vmid}/firewall/rules", "rules", (("get", ("array", ("object", (("action", False, ("string",)), ("comment", True, ("string",)), ("dest", True, ("string",)), ("dport", True, ("string",)), ("enable", True, ("integer",)), ("icmp-type", True, ("string",), "icmp_type"), ("iface", True, ("string",)), ("ipversion", True, ("integer",)), ("log", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("macro", True, ("string",)), ("pos", False, ("integer",)), ("proto", True, ("string",)), ("source", True, ("string",)), ("sport", True, ("string",)), ("type", False, ("string",)))))), ("post", ("null",)))),
+    ("/nodes/{node}/qemu/{vmid}/firewall/rules/{pos}", "", (("delete", ("null",)), ("get", ("object", (("action", False, ("string",)), ("comment", True, ("string",)), ("dest", True, ("string",)), ("dport", True, ("string",)), ("enable", True, ("integer",)), ("icmp-type", True, ("string",), "icmp_type"), ("iface", True, ("string",)), ("ipversion", True, ("integer",)), ("log", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("macro", True, ("string",)), ("pos", False, ("integer",)), ("proto", True, ("string",)), ("source", True, ("string",)), ("sport", True, ("string",)), ("type", False, ("string",))))), ("put", ("null",)))),
+    ("/nodes/{node}/qemu/{vmid}/firewall/aliases", "aliases", (("get", ("array", ("object", (("cidr", False, ("string",)), ("comment", True, ("string",)), ("digest", False, ("string",)), ("name", False, ("string",)))))), ("post", ("null",)))),
+    ("/nodes/{node}/qemu/{vmid}/firewall/aliases/{name}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/nodes/{node}/qemu/{vmid}/firewall/ipset", "ipset", (("get", ("array", ("object", (("comment", True, ("string",)), ("digest", False, ("string",)), ("name", False, ("string",)))))), ("post", ("null",)))),
+    ("/nodes/{node}/qemu/{vmid}/firewall/ipset/{name}", "", (("delete", ("null",)), ("get", ("array", ("object", (("cidr", False, ("string",)), ("comment", True, ("string",)), ("digest", False, ("string",)), ("nomatch", True, ("boolean",)))))), ("post", ("null",)))),
+    ("/nodes/{node}/qemu/{vmid}/firewall/ipset/{name}/{cidr}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/nodes/{node}/qemu/{vmid}/firewall/options", "options", (("get", ("object", (("dhcp", True, ("boolean",)), ("enable", True, ("boolean",)), ("ipfilter", True, ("boolean",)), ("log_level_in", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("log_level_out", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("macfilter", True, ("boolean",)), ("ndp", True, ("boolean",)), ("policy_in", True, ("string", ("ACCEPT", "REJECT", "DROP"))), ("policy_out", True, ("string", ("ACCEPT", "REJECT", "DROP"))), ("radv", True, ("boolean",))))), ("put", ("null",)))),
+    ("/nodes/{node}/qemu/{vmid}/firewall/log", "log", (("get", ("array", ("object", (("n", False, ("integer",)), ("t", False, ("string",)))))),)),
+    ("/nodes/{node}/qemu/{vmid}/firewall/refs", "refs", (("get", ("array", ("object", (("comment", True, ("string",)), ("name", False, ("string",)), ("ref", False, ("string",)), ("scope", False, ("string",)), ("type", False, ("string", ("alias", "ipset"))))))),)),
+    ("/nodes/{node}/qemu/{vmid}/agent", "agent", (("get", ("array", ("object",))), ("post", ("object",)))),
+    ("/nodes/{node}/qemu/{vmid}/agent/fsfreeze-freeze", "fsfreeze_freeze", (("post", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/fsfreeze-status", "fsfreeze_status", (("post", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/fsfreeze-thaw", "fsfreeze_thaw", (("post", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/fstrim", "fstrim", (("post", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/get-fsinfo", "get_fsinfo", (("get", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/get-host-name", "get_host_name", (("get", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/get-memory-block-info", "get_memory_block_info", (("get", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/get-memory-blocks", "get_memory_blocks", (("get", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/get-osinfo", "get_osinfo", (("get", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/get-time", "get_time", (("get", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/get-timezone", "get_timezone", (("get", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/get-users", "get_users", (("get", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/get-vcpus", "get_vcpus", (("get", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/info", "info", (("get", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/network-get-interfaces", "network_get_interfaces", (("get", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/ping", "ping", (("post", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/shutdown", "shutdown", (("post", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/suspend-disk", "suspend_disk", (("post", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/suspend-hybrid", "suspend_hybrid", (("post", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/suspend-ram", "suspend_ram", (("post", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/set-user-password", "set_user_password", (("post", ("object",)),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/exec", "exec", (("post", ("object", (("pid", False, ("integer",)),))),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/exec-status", "exec_status", (("get", ("object", (("err-data", True, ("string",), "err_data"), ("err-truncated", True, ("boolean",), "err_truncated"), ("exitcode", True, ("integer",)), ("exited", False, ("boolean",)), ("out-data", True, ("string",), "out_data"), ("out-truncated", True, ("boolean",), "out_truncated"), ("signal", True, ("integer",))))),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/file-read", "file_read", (("get", ("object", (("content", False, ("string",)), ("truncated", True, ("boolean",))))),)),
+    ("/nodes/{node}/qemu/{vmid}/agent/file-write", "file_write", (("post", ("null",)),)),
+    ("/nodes/{node}/qemu/{vmid}/rrd", "rrd", (("get", ("object", (("filename", False, ("string",)),))),)),
+    ("/nodes/{node}/qemu/{vmid}/rrddata", "rrddata", (("get", ("array", ("dict", ("number",)))),)),
+    ("/nodes/{node}/qemu/{vmid}/config", "config", (("get", ("object", (("acpi", True, ("boolean",)), ("affinity", True, ("string",)), ("agent", True, ("string",)), ("allow-ksm", True, ("boolean",), "allow_ksm"), ("amd-sev", True, ("string",), "amd_sev"), ("arch", True, ("string", ("x86_64", "aarch64"))), ("args", True, ("string",)), ("audio0", True, ("string",)), ("autostart", True, ("boolean",)), ("balloon", True, ("integer",)), ("bios", True, ("string", ("seabios", "ovmf"))), ("boot", True, ("string",)), ("bootdisk", True, ("string",)), ("cdrom", True, ("string",)), ("cicustom", True, ("string",)), ("cipassword", True, ("string",)), ("citype", True, ("string", ("configdrive2", "nocloud", "opennebula"))), ("ciupgrade", True, ("boolean",)), ("ciuser", True, ("string",)), ("cores", True, ("integer",)), ("cpu", True, ("string",)), ("cpulimit", True, ("number",)), ("cpuunits", True, ("integer",)), ("description", True, ("string",)), ("digest", False, ("string",)), ("efidisk0", True, ("string",)), ("freeze", True, ("boolean",)), ("hookscript", True, ("string",)), ("hostpci[n]", True, ("string",), "hostpcin"), ("hotplug", True, ("string",)), ("hugepages", True, ("string", ("any", "2", "1024"))), ("ide[n]", True, ("string",), "iden"), ("intel-tdx", True, ("string",), "intel_tdx"), ("ipconfig[n]", True, ("string",), "ipconfign"), ("ivshmem", True, ("string",)), ("keephugepages", True, ("boolean",)), ("keyboard", True, ("string", ("de", "de-ch", "da", "en-gb", "en-us", "es", "fi", "fr", "fr-be", "fr-ca", "fr-ch", "hu", "is", "it", "ja", "lt", "mk", "nl", "no", "pl", "pt", "pt-br", "sv", "sl", "tr"))), ("kvm", True, ("boolean",)), ("localtime", True, ("boolean",)), ("lock", True, ("string", ("backup", "clone", "create", "migrate", "rollback", "snapshot", "snapshot-delete", "suspending", "suspended"))), ("machine", True, ("string",)), ("memory", True, ("string",)), ("meta", True, ("string",)), ("migrate_downtime", True, ("number",)), ("migrate_speed", True, ("integer",)), ("name", True, ("string",)), ("nameserver", True, ("string",)), ("net[n]", True, ("string",), "netn"), ("numa", True, ("boolean",)), ("numa[n]", True, ("string",), "numan"), ("onboot", True, ("boolean",)), ("ostype", True, ("string", ("other", "wxp", "w2k", "w2k3", "w2k8", "wvista", "win7", "win8", "win10", "win11", "l24", "l26", "solaris"))), ("parallel[n]", True, ("string",), "paralleln"), ("parent", True, ("string",)), ("protection", True, ("boolean",)), ("reboot", True, ("boolean",)), ("rng0", True, ("string",)), ("running-nets-host-mtu", True, ("string",), "running_nets_host_mtu"), ("runningcpu", True, ("string",)), ("runningmachine", True, ("string",)), ("sata[n]", True, ("string",), "satan"), ("scsi[n]", True, ("string",), "scsin"), ("scsihw", True, ("string", ("lsi", "lsi53c810", "virtio-scsi-pci", "virtio-scsi-single", "megasas", "pvscsi"))), ("searchdomain", True, ("string",)), ("serial[n]", True, ("string",), "serialn"), ("shares", True, ("integer",)), ("smbios1", True, ("string",)), ("smp", True, ("integer",)), ("snaptime", True, ("integer",)), ("sockets", True, ("integer",)), ("spice_enhancements", True, ("string",)), ("sshkeys", True, ("string",)), ("startdate", True, ("string",)), ("startup", True, ("string",)), ("tablet", True, ("boolean",)), ("tags", True, ("string",)), ("tdf", True, ("boolean",)), ("template", True, ("boolean",)), ("tpmstate0", True, ("string",)), ("unused[n]", True, ("string",), "unusedn"), ("usb[n]", True, ("string",), "usbn"), ("vcpus", True, ("integer",)), ("vga", True, ("string",)), ("virtio[n]", True, ("string",), "virtion"), ("virtiofs[n]", True, ("string",), "virtiofsn"), ("vmgenid", True, ("string",)), ("vmstate", True, ("string",)), ("vmstatestorage", True, ("string",)), ("watchdog", True, ("string",))))), ("post", ("string",)), ("put", ("null",)))),
+    ("/nodes/{node}/qemu/{vmid}/pending", "pending", (("get", ("array", ("object", (("delete", True, ("integer",)), ("key", False, ("string",)), ("pending", True, ("string",)), ("value", True, ("string",)))))),)),
+    ("/nodes/{node}/qemu/{vmid}/cloudinit", "cloudinit", (("get", ("array", ("object", (("delete", True, ("integer",)), ("key", False, ("string",)), ("pending", True, ("string",)), ("value", True, ("string",)))))), ("put", ("null",)))),
+    ("/nodes/{node}/qemu/{vmid}/cloudinit/dump", "dump", (("get", ("string",)),)),
+    ("/nodes/{node}/qemu/{vmid}/unlink", "unlink", (("put", ("null",)),)),
+    ("/nodes/{node}/qemu/{vmid}/vncproxy", "vncproxy", (("post", ("object", (("cert", False, ("string",)), ("password", True, ("string",)), ("port", False, ("integer",)), ("ticket", False, ("string",)), ("upid", False, ("string",)), ("user", False, ("string",))))),)),
+    ("/nodes/{node}/qemu/{vmid}/termproxy", "termproxy", (("post", ("object", (("port", False, ("integer",)), ("ticket", False, ("string",)), ("upid", False, ("string",)), ("user", False, ("string",))))),)),
+    ("/nodes/{node}/qemu/{vmid}/vncwebsocket", "vncwebsocket", (("get", ("object", (("port", False, ("string",)),))),)),
+    ("/nodes/{node}/qemu/{vmid}/spiceproxy", "spiceproxy", (("post", ("object", (("host", False, ("string",)), ("password", False, ("string",)), ("proxy", False, ("string",)), ("tls-port", False, ("integer",), "tls_port"), ("type", False, ("string",))))),)),
+    ("/nodes/{node}/qemu/{vmid}/status", "status", (("get", ("array", ("object", (("subdir", False, ("string",)),)))),)),
+    ("/nodes/{node}/qemu/{vmid}/status/current", "current", (("get", ("object", (("agent", True, ("boolean",)), ("clipboard", True, ("string", ("vnc",))), ("cpu", True, ("number",)), ("cpus", True, ("number",)), ("diskread", True, ("integer",)), ("diskwrite", True, ("integer",)), ("ha", False, ("object",)), ("lock", True, ("string",)), ("maxdisk", True, ("integer",)), ("maxmem", True, ("integer",)), ("mem", True, ("integer",)), ("memhost", True, ("integer",)), ("name", True, ("string",)), ("netin", True, ("integer",)), ("netout", True, ("integer",)), ("pid", True, ("integer",)), ("pressurecpufull", True, ("number",)), ("pressurecpusome", True, ("number",)), ("pressureiofull", True, ("number",)), ("pressureiosome", True, ("number",)), ("pressurememoryfull", True, ("number",)), ("pressurememorysome", True, ("number",)), ("qmpstatus", True, ("string",)), ("running-machine", True, ("string",), "running_machine"), ("running-qemu", True, ("string",), "running_qemu"), ("serial", True, ("boolean",)), ("spice", True, ("boolean",)), ("status", False, ("string", ("stopped", "running"))), ("tags", True, ("string",)), ("template", True, ("boolean",)), ("uptime", True, ("integer",)), ("vmid", False, ("integer",))))),)),
+    ("/nodes/{node}/qemu/{vmid}/status/start", "start", (("post", ("string",)),)),
+    ("/nodes/{node}/qemu/{vmid}/status/stop", "stop", (("post", ("string",)),)),
+    ("/nodes/{node}/qemu/{vmid}/status/reset", "reset", (("post", ("string",)),)),
+    ("/nodes/{node}/qemu/{vmid}/status/shutdown", "shutdown", (("post", ("string",)),)),
+    ("/nodes/{node}/qemu/{vmid}/status/reboot", "reboot", (("post", ("string",)),)),
+    ("/nodes/{node}/qemu/{vmid}/status/suspend", "suspend", (("post", ("string",)),)),
+    ("/nodes/{node}/qemu/{vmid}/status/resume", "resume", (("post", ("string",)),)),
+    ("/nodes/{node}/qemu/{vmid}/sendkey", "sendkey", (("put", ("null",)),)),
+    ("/nodes/{node}/qemu/{vmid}/feature", "feature", (("get", ("object", (("hasFeature", False, ("boolean",), "has_feature"), ("nodes", False, ("array", ("string",)))))),)),
+    ("/nodes/{node}/qemu/{vmid}/clone", "clone", (("post", ("string",)),)),
+    ("/nodes/{node}/qemu/{vmid}/move_disk", "move_disk", (("post", ("string",)),)),
+    ("/nodes/{node}/qemu/{vmid}/migrate", "migrate", (("get", ("object", (("allowed_nodes", True, ("array", ("string",))), ("dependent-ha-resources", True, ("array", ("string",)), "dependent_ha_resources"), ("has-dbus-vmstate", False, ("boolean",), "has_dbus_vmstate"), ("local_disks", False, ("array", ("object", (("cdrom", False, ("boolean",)), ("is_unused", False, ("boolean",)), ("size", False, ("integer",)), ("volid", False, ("string",)))))), ("local_resources", False, ("array", ("string",))), ("mapped-resource-info", False, ("object",), "mapped_resource_info"), ("mapped-resources", False, ("array", ("string",)), "mapped_resources"), ("not_allowed_nodes", True, ("dict", ("object", (("blocking-ha-resources", True, ("array", ("object", (("cause", False, ("string", ("resource-affinity",))), ("sid", False, ("string",))))), "blocking_ha_resources"), ("unavailable_storages", True, ("array", ("string",))))))), ("running", False, ("boolean",))))), ("post", ("string",)))),
+    ("/nodes/{node}/qemu/{vmid}/remote_migrate", "remote_migrate", (("post", ("string",)),)),
+    ("/nodes/{node}/qemu/{vmid}/monitor", "monitor", (("post", ("string",)),)),
+    ("/nodes/{node}/qemu/{vmid}/resize", "resize", (("put", ("string",)),)),
+    ("/nodes/{node}/qemu/{vmid}/snapshot", "snapshot", (("get", ("array", ("object", (("description", False, ("string",)), ("name", False, ("string",)), ("parent", True, ("string",)), ("snaptime", True, ("integer",)), ("vmstate", True, ("boolean",)))))), ("post", ("string",)))),
+    ("/nodes/{node}/qemu/{vmid}/snapshot/{snapname}", "", (("delete", ("string",)), ("get", ("array", ("object",))))),
+    ("/nodes/{node}/qemu/{vmid}/snapshot/{snapname}/config", "config", (("get", ("object",)), ("put", ("null",)))),
+    ("/nodes/{node}/qemu/{vmid}/snapshot/{snapname}/rollback", "rollback", (("post", ("string",)),)),
+    ("/nodes/{node}/qemu/{vmid}/template", "template", (("post", ("string",)),)),
+    ("/nodes/{node}/qemu/{vmid}/mtunnel", "mtunnel", (("post", ("object", (("socket", False, ("string",)), ("ticket", False, ("string",)), ("upid", False, ("string",))))),)),
+    ("/nodes/{node}/qemu/{vmid}/mtunnelwebsocket", "mtunnelwebsocket", (("get", ("object", (("port", True, ("string",)), ("socket", True, ("string",))))),)),
+    ("/nodes/{node}/qemu/{vmid}/dbus-vmstate", "dbus_vmstate", (("post", ("null",)),)),
+    ("/nodes/{node}/lxc", "lxc", (("get", ("array", ("object", (("cpu", True, ("number",)), ("cpus", True, ("number",)), ("disk", True, ("integer",)), ("diskread", True, ("integer",)), ("diskwrite", True, ("integer",)), ("lock", True, ("string",)), ("maxdisk", True, ("integer",)), ("maxmem", True, ("integer",)), ("maxswap", True, ("integer",)), ("mem", True, ("integer",)), ("name", True, ("string",)), ("netin", True, ("integer",)), ("netout", True, ("integer",)), ("pressurecpusome", True, ("number",)), ("pressureiofull", True, ("number",)), ("pressureiosome", True, ("number",)), ("pressurememoryfull", True, ("number",)), ("pressurememorysome", True, ("number",)), ("status", False, ("string", ("stopped", "running"))), ("tags", True, ("string",)), ("template", True, ("boolean",)), ("uptime", True, ("integer",)), ("vmid", False, ("integer",)))))), ("post", ("string",)))),
+    ("/nodes/{node}/lxc/{vmid}", "", (("delete", ("string",)), ("get", ("array", ("object", (("subdir", False, ("string",)),)))))),
+    ("/nodes/{node}/lxc/{vmid}/config", "config", (("get", ("object", (("arch", True, ("string", ("amd64", "i386", "arm64", "armhf", "riscv32", "riscv64"))), ("cmode", True, ("string", ("shell", "console", "tty"))), ("console", True, ("boolean",)), ("cores", True, ("integer",)), ("cpulimit", True, ("number",)), ("cpuunits", True, ("integer",)), ("debug", True, ("boolean",)), ("description", True, ("string",)), ("dev[n]", True, ("string",), "devn"), ("digest", False, ("string",)), ("entrypoint", True, ("string",)), ("env", True, ("string",)), ("features", True, ("string",)), ("hookscript", True, ("string",)), ("hostname", True, ("string",)), ("lock", True, ("string", ("backup", "create", "destroyed", "disk", "fstrim", "migrate", "mounted", "rollback", "snapshot", "snapshot-delete"))), ("lxc", True, ("array", ("array", ("string",)))), ("memory", True, ("integer",)), ("mp[n]", True, ("string",), "mpn"), ("nameserver", True, ("string",)), ("net[n]", True, ("string",), "netn"), ("onboot", True, ("boolean",)), ("ostype", True, ("string", ("debian", "devuan", "ubuntu", "centos", "fedora", "opensuse", "archlinux", "alpine", "gentoo", "nixos", "unmanaged"))), ("protection", True, ("boolean",)), ("rootfs", True, ("string",)), ("searchdomain", True, ("string",)), ("startup", True, ("string",)), ("swap", True, ("integer",)), ("tags", True, ("string",)), ("template", True, ("boolean",)), ("timezone", True, ("string",)), ("tty", True, ("integer",)), ("unprivileged", True, ("boolean",)), ("unused[n]", True, ("string",), "unusedn")))), ("put", ("null",)))),
+    ("/nodes/{node}/lxc/{vmid}/status", "status", (("get", ("array", ("object", (("subdir", False, ("string",)),)))),)),
+    ("/nodes/{node}/lxc/{vmid}/status/current", "current", (("get", ("object", (("cpu", True, ("number",)), ("cpus", True, ("number",)), ("disk", True, ("integer",)), ("diskread", True, ("integer",)), ("diskwrite", True, ("integer",)), ("ha", False, ("object",)), ("lock", True, ("string",)), ("maxdisk", True, ("integer",)), ("maxmem", True, ("integer",)), ("maxswap", True, ("integer",)), ("mem", True, ("integer",)), ("name", True, ("string",)), ("netin", True, ("integer",)), ("netout", True, ("integer",)), ("pressurecpusome", True, ("number",)), ("pressureiofull", True, ("number",)), ("pressureiosome", True, ("number",)), ("pressurememoryfull", True, ("number",)), ("pressurememorysome", True, ("number",)), ("status", False, ("string", ("stopped", "running"))), ("tags", True, ("string",)), ("template", True, ("boolean",)), ("uptime", True, ("integer",)), ("vmid", False, ("integer",))))),)),
+    ("/nodes/{node}/lxc/{vmid}/status/start", "start", (("post", ("string",)),)),
+    ("/nodes/{node}/lxc/{vmid}/status/stop", "stop", (("post", ("string",)),)),
+    ("/nodes/{node}/lxc/{vmid}/status/shutdown", "shutdown", (("post", ("string",)),)),
+    ("/nodes/{node}/lxc/{vmid}/status/suspend", "suspend", (("post", ("string",)),)),
+    ("/nodes/{node}/lxc/{vmid}/status/resume", "resume", (("post", ("string",)),)),
+    ("/nodes/{node}/lxc/{vmid}/status/reboot", "reboot", (("post", ("string",)),)),
+    ("/nodes/{node}/lxc/{vmid}/snapshot", "snapshot", (("get", ("array", ("object", (("description", False, ("string",)), ("name", False, ("string",)), ("parent", True, ("string",)), ("snaptime", True, ("integer",)))))), ("post", ("string",)))),
+    ("/nodes/{node}/lxc/{vmid}/snapshot/{snapname}", "", (("delete", ("string",)), ("get", ("array", ("object",))))),
+    ("/nodes/{node}/lxc/{vmid}/snapshot/{snapname}/rollback", "rollback", (("post", ("string",)),)),
+    ("/nodes/{node}/lxc/{vmid}/snapshot/{snapname}/config", "config", (("get", ("object",)), ("put", ("null",)))),
+    ("/nodes/{node}/lxc/{vmid}/firewall", "firewall", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/lxc/{vmid}/firewall/rules", "rules", (("get", ("array", ("object", (("action", False, ("string",)), ("comment", True, ("string",)), ("dest", True, ("string",)), ("dport", True, ("string",)), ("enable", True, ("integer",)), ("icmp-type", True, ("string",), "icmp_type"), ("iface", True, ("string",)), ("ipversion", True, ("integer",)), ("log", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("macro", True, ("string",)), ("pos", False, ("integer",)), ("proto", True, ("string",)), ("source", True, ("string",)), ("sport", True, ("string",)), ("type", False, ("string",)))))), ("post", ("null",)))),
+    ("/nodes/{node}/lxc/{vmid}/firewall/rules/{pos}", "", (("delete", ("null",)), ("get", ("object", (("action", False, ("string",)), ("comment", True, ("string",)), ("dest", True, ("string",)), ("dport", True, ("string",)), ("enable", True, ("integer",)), ("icmp-type", True, ("string",), "icmp_type"), ("iface", True, ("string",)), ("ipversion", True, ("integer",)), ("log", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("macro", True, ("string",)), ("pos", False, ("integer",)), ("proto", True, ("string",)), ("source", True, ("string",)), ("sport", True, ("string",)), ("type", False, ("string",))))), ("put", ("null",)))),
+    ("/nodes/{node}/lxc/{vmid}/firewall/aliases", "aliases", (("get", ("array", ("object", (("cidr", False, ("string",)), ("comment", True, ("string",)), ("digest", False, ("string",)), ("name", False, ("string",)))))), ("post", ("null",)))),
+    ("/nodes/{node}/lxc/{vmid}/firewall/aliases/{name}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/nodes/{node}/lxc/{vmid}/firewall/ipset", "ipset", (("get", ("array", ("object", (("comment", True, ("string",)), ("digest", False, ("string",)), ("name", False, ("string",)))))), ("post", ("null",)))),
+    ("/nodes/{node}/lxc/{vmid}/firewall/ipset/{name}", "", (("delete", ("null",)), ("get", ("array", ("object", (("cidr", False, ("string",)), ("comment", True, ("string",)), ("digest", False, ("string",)), ("nomatch", True, ("boolean",)))))), ("post", ("null",)))),
+    ("/nodes/{node}/lxc/{vmid}/firewall/ipset/{name}/{cidr}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/nodes/{node}/lxc/{vmid}/firewall/options", "options", (("get", ("object", (("dhcp", True, ("boolean",)), ("enable", True, ("boolean",)), ("ipfilter", True, ("boolean",)), ("log_level_in", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("log_level_out", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("macfilter", True, ("boolean",)), ("ndp", True, ("boolean",)), ("policy_in", True, ("string", ("ACCEPT", "REJECT", "DROP"))), ("policy_out", True, ("string", ("ACCEPT", "REJECT", "DROP"))), ("radv", True, ("boolean",))))), ("put", ("null",)))),
+    ("/nodes/{node}/lxc/{vmid}/firewall/log", "log", (("get", ("array", ("object", (("n", False, ("integer",)), ("t", False, ("string",)))))),)),
+    ("/nodes/{node}/lxc/{vmid}/firewall/refs", "refs", (("get", ("array", ("object", (("comment", True, ("string",)), ("name", False, ("string",)), ("ref", False, ("string",)), ("scope", False, ("string",)), ("type", False, ("string", ("alias", "ipset"))))))),)),
+    ("/nodes/{node}/lxc/{vmid}/rrd", "rrd", (("get", ("object", (("filename", False, ("string",)),))),)),
+    ("/nodes/{node}/lxc/{vmid}/rrddata", "rrddata", (("get", ("array", ("dict", ("number",)))),)),
+    ("/nodes/{node}/lxc/{vmid}/vncproxy", "vncproxy", (("post", ("object", (("cert", False, ("string",)), ("port", False, ("integer",)), ("ticket", False, ("string",)), ("upid", False, ("string",)), ("user", False, ("string",))))),)),
+    ("/nodes/{node}/lxc/{vmid}/termproxy", "termproxy", (("post", ("object", (("port", False, ("integer",)), ("ticket", False, ("string",)), ("upid", False, ("string",)), ("user", False, ("string",))))),)),
+    ("/nodes/{node}/lxc/{vmid}/vncwebsocket", "vncwebsocket", (("get", ("object", (("port", False, ("string",)),))),)),
+    ("/nodes/{node}/lxc/{vmid}/spiceproxy", "spiceproxy", (("post", ("object", (("host", False, ("string",)), ("password", False, ("string",)), ("proxy", False, ("string",)), ("tls-port", False, ("integer",), "tls_port"), ("type", False, ("string",))))),)),
+    ("/nodes/{node}/lxc/{vmid}/remote_migrate", "remote_migrate", (("post", ("string",)),)),
+    ("/nodes/{node}/lxc/{vmid}/migrate", "migrate", (("get", ("object", (("allowed-nodes", True, ("array", ("string",)), "allowed_nodes"), ("dependent-ha-resources", True, ("array", ("string",)), "dependent_ha_resources"), ("not-allowed-nodes", True, ("object", (("blocking-ha-resources", True, ("array", ("object", (("cause", False, ("string", ("resource-affinity",))), ("sid", False, ("string",))))), "blocking_ha_resources"),)), "not_allowed_nodes"), ("running", False, ("boolean",))))), ("post", ("string",)))),
+    ("/nodes/{node}/lxc/{vmid}/feature", "feature", (("get", ("object", (("hasFeature", False, ("boolean",), "has_feature"),))),)),
+    ("/nodes/{node}/lxc/{vmid}/template", "template", (("post", ("null",)),)),
+    ("/nodes/{node}/lxc/{vmid}/clone", "clone", (("post", ("string",)),)),
+    ("/nodes/{node}/lxc/{vmid}/resize", "resize", (("put", ("string",)),)),
+    ("/nodes/{node}/lxc/{vmid}/move_volume", "move_volume", (("post", ("string",)),)),
+    ("/nodes/{node}/lxc/{vmid}/pending", "pending", (("get", ("array", ("object", (("delete", True, ("integer",)), ("key", False, ("string",)), ("pending", True, ("string",)), ("value", True, ("string",)))))),)),
+    ("/nodes/{node}/lxc/{vmid}/interfaces", "interfaces", (("get", ("array", ("object", (("hardware-address", False, ("string",), "hardware_address"), ("hwaddr", False, ("string",)), ("inet", True, ("string",)), ("inet6", True, ("string",)), ("ip-addresses", False, ("array", ("object", (("ip-address", True, ("string",), "ip_address"), ("ip-address-type", True, ("string",), "ip_address_type"), ("prefix", True, ("integer",))))), "ip_addresses"), ("name", False, ("string",)))))),)),
+    ("/nodes/{node}/lxc/{vmid}/mtunnel", "mtunnel", (("post", ("object", (("socket", False, ("string",)), ("ticket", False, ("string",)), ("upid", False, ("string",))))),)),
+    ("/nodes/{node}/lxc/{vmid}/mtunnelwebsocket", "mtunnelwebsocket", (("get", ("object", (("port", True, ("string",)), ("socket", True, ("string",))))),)),
+    ("/nodes/{node}/ceph", "ceph", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/ceph/cfg", "cfg", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/ceph/cfg/raw", "raw", (("get", ("string",)),)),
+    ("/nodes/{node}/ceph/cfg/db", "db", (("get", ("array", ("object", (("can_update_at_runtime", False, ("boolean",)), ("level", False, ("string",)), ("mask", False, ("string",)), ("name", False, ("string",)), ("section", False, ("string",)), ("value", False, ("string",)))))),)),
+    ("/nodes/{node}/ceph/cfg/value", "value", (("get", ("object",)),)),
+    ("/nodes/{node}/ceph/osd", "osd", (("get", ("object",)), ("post", ("string",)))),
+    ("/nodes/{node}/ceph/osd/{osdid}", "", (("delete", ("string",)), ("get", ("array", ("object",))))),
+    ("/nodes/{node}/ceph/osd/{osdid}/metadata", "metadata", (("get", ("object", (("devices", False, ("array", ("object", (("dev_node", False, ("string",)), ("device", False, ("string", ("block", "db", "wal"))), ("devices", False, ("string",)), ("size", False, ("integer",)), ("support_discard", False, ("boolean",)), ("type", False, ("string",)))))), ("osd", False, ("object", (("back_addr", False, ("string",)), ("front_addr", False, ("string",)), ("hb_back_addr", False, ("string",)), ("hb_front_addr", False, ("string",)), ("hostname", False, ("string",)), ("id", False, ("integer",)), ("mem_usage", False, ("integer",)), ("osd_data", False, ("string",)), ("osd_objectstore", False, ("string",)), ("pid", False, ("integer",)), ("version", False, ("string",)))))))),)),
+    ("/nodes/{node}/ceph/osd/{osdid}/lv-info", "lv_info", (("get", ("object", (("creation_time", False, ("string",)), ("lv_name", False, ("string",)), ("lv_path", False, ("string",)), ("lv_size", False, ("integer",)), ("lv_uuid", False, ("string",)), ("vg_name", False, ("string",))))),)),
+    ("/nodes/{node}/ceph/osd/{osdid}/in", "in_", (("post", ("null",)),)),
+    ("/nodes/{node}/ceph/osd/{osdid}/out", "out", (("post", ("null",)),)),
+    ("/nodes/{node}/ceph/osd/{osdid}/scrub", "scrub", (("post", ("null",)),)),
+    ("/nodes/{node}/ceph/mds", "mds", (("get", ("array", ("object", (("addr", True, ("string",)), ("host", True, ("string",)), ("name", False, ("string",)), ("rank", True, ("integer",)), ("standby_replay", True, ("boolean",)), ("state", False, ("string",)))))),)),
+    ("/nodes/{node}/ceph/mds/{name}", "", (("delete", ("string",)), ("post", ("string",)))),
+    ("/nodes/{node}/ceph/mgr", "mgr", (("get", ("array", ("object", (("addr", True, ("string",)), ("host", True, ("string",)), ("name", False, ("string",)), ("state", False, ("string",)))))),)),
+    ("/nodes/{node}/ceph/mgr/{id}", "", (("delete", ("string",)), ("post", ("string",)))),
+    ("/nodes/{node}/ceph/mon", "mon", (("get", ("array", ("object", (("addr", True, ("string",)), ("ceph_version", True, ("string",)), ("ceph_version_short", True, ("string",)), ("direxists", True, ("string",)), ("host", True, ("boolean",)), ("name", False, ("string",)), ("quorum", True, ("boolean",)), ("rank", True, ("integer",)), ("service", True, ("integer",)), ("state", True, ("string",)))))),)),
+    ("/nodes/{node}/ceph/mon/{monid}", "", (("delete", ("string",)), ("post", ("string",)))),
+    ("/nodes/{node}/ceph/fs", "fs", (("get", ("array", ("object", (("data_pool", False, ("string",)), ("metadata_pool", False, ("string",)), ("name", False, ("string",)))))),)),
+    ("/nodes/{node}/ceph/fs/{name}", "", (("post", ("string",)),)),
+    ("/nodes/{node}/ceph/pool", "pool", (("get", ("array", ("object", (("application_metadata", True, ("object",)), ("autoscale_status", True, ("object",)), ("bytes_used", False, ("integer",)), ("crush_rule", False, ("integer",)), ("crush_rule_name", False, ("string",)), ("min_size", False, ("integer",)), ("percent_used", False, ("number",)), ("pg_autoscale_mode", True, ("string",)), ("pg_num", False, ("integer",)), ("pg_num_final", True, ("integer",)), ("pg_num_min", True, ("integer",)), ("pool", False, ("integer",)), ("pool_name", False, ("string",)), ("size", False, ("integer",)), ("target_size", True, ("integer",)), ("target_size_ratio", True, ("number",)), ("type", False, ("string", ("replicated", "erasure", "unknown"))))))), ("post", ("string",)))),
+    ("/nodes/{node}/ceph/pool/{name}", "", (("delete", ("string",)), ("get", ("array", ("object",))), ("put", ("string",)))),
+    ("/nodes/{node}/ceph/pool/{name}/status", "status", (("get", ("object", (("application", True, ("string", ("rbd", "cephfs", "rgw"))), ("application_list", True, ("array",)), ("autoscale_status", True, ("object",)), ("crush_rule", True, ("string",)), ("fast_read", False, ("boolean",)), ("hashpspool", False, ("boolean",)), ("id", False, ("integer",)), ("min_size", True, ("integer",)), ("name", False, ("string",)), ("nodeep-scrub", False, ("boolean",), "nodeep_scrub"), ("nodelete", False, ("boolean",)), ("nopgchange", False, ("boolean",)), ("noscrub", False, ("boolean",)), ("nosizechange", False, ("boolean",)), ("pg_autoscale_mode", True, ("string", ("on", "off", "warn"))), ("pg_num", True, ("integer",)), ("pg_num_min", True, ("integer",)), ("pgp_num", False, ("integer",)), ("size", True, ("integer",)), ("statistics", True, ("object",)), ("target_size", True, ("string",)), ("target_size_ratio", True, ("number",)), ("use_gmt_hitset", False, ("boolean",)), ("write_fadvise_dontneed", False, ("boolean",))))),)),
+    ("/nodes/{node}/ceph/init", "init", (("post", ("null",)),)),
+    ("/nodes/{node}/ceph/stop", "stop", (("post", ("string",)),)),
+    ("/nodes/{node}/ceph/start", "start", (("post", ("string",)),)),
+    ("/nodes/{node}/ceph/restart", "restart", (("post", ("string",)),)),
+    ("/nodes/{node}/ceph/status", "status", (("get", ("object",)),)),
+    ("/nodes/{node}/ceph/crush", "crush", (("get", ("string",)),)),
+    ("/nodes/{node}/ceph/log", "log", (("get", ("array", ("object", (("n", False, ("integer",)), ("t", False, ("string",)))))),)),
+    ("/nodes/{node}/ceph/rules", "rules", (("get", ("array", ("object", (("name", False, ("string",)),)))),)),
+    ("/nodes/{node}/ceph/cmd-safety", "cmd_safety", (("get", ("object", (("safe", False, ("boolean",)), ("status", True, ("string",))))),)),
+    ("/nodes/{node}/vzdump", "vzdump", (("post", ("string",)),)),
+    ("/nodes/{node}/vzdump/defaults", "defaults", (("get", ("object", (("all", True, ("boolean",)), ("bwlimit", True, ("integer",)), ("compress", True, ("string", ("0", "1", "gzip", "lzo", "zstd"))), ("dumpdir", True, ("string",)), ("exclude", True, ("string",)), ("exclude-path", True, ("array", ("string",)), "exclude_path"), ("fleecing", True, ("string",)), ("ionice", True, ("integer",)), ("lockwait", True, ("integer",)), ("mailnotification", True, ("string", ("always", "failure"))), ("mailto", True, ("string",)), ("maxfiles", True, ("integer",)), ("mode", True, ("string", ("snapshot", "suspend", "stop"))), ("node", True, ("string",)), ("notes-template", True, ("string",), "notes_template"), ("notification-mode", True, ("string", ("auto", "legacy-sendmail", "notification-system")), "notification_mode"), ("pbs-change-detection-mode", True, ("string", ("legacy", "data", "metadata")), "pbs_change_detection_mode"), ("performance", True, ("string",)), ("pigz", True, ("integer",)), ("pool", True, ("string",)), ("protected", True, ("boolean",)), ("prune-backups", True, ("string",), "prune_backups"), ("quiet", True, ("boolean",)), ("remove", True, ("boolean",)), ("script", True, ("string",)), ("stdexcludes", True, ("boolean",)), ("stop", True, ("boolean",)), ("stopwait", True, ("integer",)), ("storage", True, ("string",)), ("tmpdir", True, ("string",)), ("vmid", True, ("string",)), ("zstd", True, ("integer",))))),)),
+    ("/nodes/{node}/vzdump/extractconfig", "extractconfig", (("get", ("string",)),)),
+    ("/nodes/{node}/services", "services", (("get", ("array", ("object", (("active-state", False, ("string", ("active", "inactive", "failed", "activating", "deactivating", "maintenance", "reloading", "refreshing", "unknown")), "active_state"), ("desc", False, ("string",)), ("name", False, ("string",)), ("service", False, ("string",)), ("state", False, ("string", ("dead", "condition", "start-pre", "start", "start-post", "running", "exited", "reload", "reload-signal", "reload-notify", "mounting", "stop", "stop-watchdog", "stop-sigterm", "stop-sigkill", "stop-post", "final-watchdog", "final-sigterm", "final-sigkill", "failed", "dead-before-auto-restart", "failed-before-auto-restart", "dead-resources-pinned", "auto-restart", "auto-restart-queued", "cleaning", "unknown"))), ("unit-state", False, ("string", ("enabled", "enabled-runtime", "linked", "linked-runtime", "alias", "masked", "masked-runtime", "static", "disabled", "indirect", "generated", "transient", "bad", "not-found", "unknown")), "unit_state"))))),)),
+    ("/nodes/{node}/services/{service}", "", (("get", ("array", ("object", (("subdir", False, ("string",)),)))),)),
+    ("/nodes/{node}/services/{service}/state", "state", (("get", ("object", (("active-state", False, ("string", ("active", "inactive", "failed", "activating", "deactivating", "maintenance", "reloading", "refreshing", "unknown")), "active_state"), ("desc", False, ("string",)), ("name", False, ("string",)), ("service", False, ("string",)), ("state", False, ("string", ("dead", "condition", "start-pre", "start", "start-post", "running", "exited", "reload", "reload-signal", "reload-notify", "mounting", "stop", "stop-watchdog", "stop-sigterm", "stop-sigkill", "stop-post", "final-watchdog", "final-sigterm", "final-sigkill", "failed", "dead-before-auto-restart", "failed-before-auto-restart", "dead-resources-pinned", "auto-restart", "auto-restart-queued", "cleaning", "unknown"))), ("unit-state", False, ("string", ("enabled", "enabled-runtime", "linked", "linked-runtime", "alias", "masked", "masked-runtime", "static", "disabled", "indirect", "generated", "transient", "bad", "not-found", "unknown")), "unit_state")))),)),
+    ("/nodes/{node}/services/{service}/start", "start", (("post", ("string",)),)),
+    ("/nodes/{node}/services/{service}/stop", "stop", (("post", ("string",)),)),
+    ("/nodes/{node}/services/{service}/restart", "restart", (("post", ("string",)),)),
+    ("/nodes/{node}/services/{service}/reload", "reload", (("post", ("string",)),)),
+    ("/nodes/{node}/subscription", "subscription", (("delete", ("null",)), ("get", ("object", (("checktime", True, ("integer",)), ("key", True, ("string",)), ("level", True, ("string",)), ("message", True, ("string",)), ("nextduedate", True, ("string",)), ("productname", True, ("string",)), ("regdate", True, ("string",)), ("serverid", True, ("string",)), ("signature", True, ("string",)), ("sockets", True, ("integer",)), ("status", False, ("string", ("new", "notfound", "active", "invalid", "expired", "suspended"))), ("url", True, ("string",))))), ("post", ("null",)), ("put", ("null",)))),
+    ("/nodes/{node}/network", "network", (("delete", ("null",)), ("get", ("array", ("object", (("active", True, ("boolean",)), ("address", True, ("string",)), ("address6", True, ("string",)), ("autostart", True, ("boolean",)), ("bond-primary", True, ("string",), "bond_primary"), ("bond_mode", True, ("string", ("balance-rr", "active-backup", "balance-xor", "broadcast", "802.3ad", "balance-tlb", "balance-alb", "balance-slb", "lacp-balance-slb", "lacp-balance-tcp"))), ("bond_xmit_hash_policy", True, ("string", ("layer2", "layer2+3", "layer3+4"))), ("bridge-access", True, ("integer",), "bridge_access"), ("bridge-arp-nd-suppress", True, ("boolean",), "bridge_arp_nd_suppress"), ("bridge-learning", True, ("boolean",), "bridge_learning"), ("bridge-multicast-flood", True, ("boolean",), "bridge_multicast_flood"), ("bridge-unicast-flood", True, ("boolean",), "bridge_unicast_flood"), ("bridge_ports", True, ("string",)), ("bridge_vids", True, ("string",)), ("bridge_vlan_aware", True, ("boolean",)), ("cidr", True, ("string",)), ("cidr6", True, ("string",)), ("comments", True, ("string",)), ("comments6", True, ("string",)), ("exists", True, ("boolean",)), ("families", True, ("array", ("string", ("inet", "inet6")))), ("gateway", True, ("string",)), ("gateway6", True, ("string",)), ("iface", False, ("string",)), ("link-type", True, ("string",), "link_type"), ("method", True, ("string", ("loopback", "dhcp", "manual", "static", "auto"))), ("method6", True, ("string", ("loopback", "dhcp", "manual", "static", "auto"))), ("mtu", True, ("integer",)), ("netmask", True, ("string",)), ("netmask6", True, ("integer",)), ("options", True, ("array", ("string",))), ("options6", True, ("array", ("string",))), ("ovs_bonds", True, ("string",)), ("ovs_bridge", True, ("string",)), ("ovs_options", True, ("string",)), ("ovs_ports", True, ("string",)), ("ovs_tag", True, ("integer",)), ("priority", True, ("integer",)), ("slaves", True, ("string",)), ("type", False, ("string", ("bridge", "bond", "eth", "alias", "vlan", "fabric", "OVSBridge", "OVSBond", "OVSPort", "OVSIntPort", "vnet", "unknown"))), ("uplink-id", True, ("string",), "uplink_id"), ("vlan-id", True, ("integer",), "vlan_id"), ("vlan-protocol", True, ("string", ("802.1ad", "802.1q")), "vlan_protocol"), ("vlan-raw-device", True, ("string",), "vlan_raw_device"), ("vxlan-id", True, ("integer",), "vxlan_id"), ("vxlan-local-tunnelip", True, ("string",), "vxlan_local_tunnelip"), ("vxlan-physdev", True, ("string",), "vxlan_physdev"), ("vxlan-svcnodeip", True, ("string",), "vxlan_svcnodeip"))))), ("post", ("null",)), ("put", ("string",)))),
+    ("/nodes/{node}/network/{iface}", "", (("delete", ("null",)), ("get", ("object", (("method", False, ("string",)), ("type", False, ("string",))))), ("put", ("null",)))),
+    ("/nodes/{node}/tasks", "tasks", (("get", ("array", ("object", (("endtime", True, ("integer",)), ("id", False, ("string",)), ("node", False, ("string",)), ("pid", False, ("integer",)), ("pstart", False, ("integer",)), ("starttime", False, ("integer",)), ("status", True, ("string",)), ("type", False, ("string",)), ("upid", False, ("string",)), ("user", False, ("string",)))))),)),
+    ("/nodes/{node}/tasks/{upid}", "", (("delete", ("null",)), ("get", ("array", ("object",))))),
+    ("/nodes/{node}/tasks/{upid}/log", "log", (("get", ("array", ("object", (("n", False, ("integer",)), ("t", False, ("string",)))))),)),
+    ("/nodes/{node}/tasks/{upid}/status", "status", (("get", ("object", (("exitstatus", True, ("string",)), ("id", False, ("string",)), ("node", False, ("string",)), ("pid", False, ("integer",)), ("pstart", False, ("integer",)), ("starttime", False, ("integer",)), ("status", False, ("string", ("running", "stopped"))), ("type", False, ("string",)), ("upid", False, ("string",)), ("user", False, ("string",))))),)),
+    ("/nodes/{node}/scan", "scan", (("get", ("array", ("object", (("method", False, ("string",)),)))),)),
+    ("/nodes/{node}/scan/nfs", "nfs", (("get", ("array", ("object", (("options", False, ("string",)), ("path", False, ("string",)))))),)),
+    ("/nodes/{node}/scan/cifs", "cifs", (("get", ("array", ("object", (("description", False, ("string",)), ("share", False, ("string",)))))),)),
+    ("/nodes/{node}/scan/pbs", "pbs", (("get", ("array", ("object", (("comment", True, ("string",)), ("store", False, ("string",)))))),)),
+    ("/nodes/{node}/scan/iscsi", "iscsi", (("get", ("array", ("object", (("portal", False, ("string",)), ("target", False, ("string",)))))),)),
+    ("/nodes/{node}/scan/lvm", "lvm", (("get", ("array", ("object", (("vg", False, ("string",)),)))),)),
+    ("/nodes/{node}/scan/lvmthin", "lvmthin", (("get", ("array", ("object", (("lv", False, ("string",)),)))),)),
+    ("/nodes/{node}/scan/zfs", "zfs", (("get", ("array", ("object", (("pool", False, ("string",)),)))),)),
+    ("/nodes/{node}/hardware", "hardware", (("get", ("array", ("object", (("type", False, ("string",)),)))),)),
+    ("/nodes/{node}/hardware/pci", "pci", (("get", ("array", ("object", (("class", False, ("string",), "class_"), ("device", False, ("string",)), ("device_name", True, ("string",)), ("id", False, ("string",)), ("iommugroup", False, ("integer",)), ("mdev", True, ("boolean",)), ("subsystem_device", True, ("string",)), ("subsystem_device_name", True, ("string",)), ("subsystem_vendor", True, ("string",)), ("subsystem_vendor_name", True, ("string",)), ("vendor", False, ("string",)), ("vendor_name", True, ("string",)))))),)),
+    ("/nodes/{node}/hardware/pci/{pci-id-or-mapping}", "", (("get", ("array", ("object", (("method", False, ("string",)),)))),)),
+    ("/nodes/{node}/hardware/pci/{pci-id-or-mapping}/mdev", "mdev", (("get", ("array", ("object", (("available", False, ("integer",)), ("description", False, ("string",)), ("name", True, ("string",)), ("type", False, ("string",)))))),)),
+    ("/nodes/{node}/hardware/usb", "usb", (("get", ("array", ("object", (("busnum", False, ("integer",)), ("class", False, ("integer",), "class_"), ("devnum", False, ("integer",)), ("level", False, ("integer",)), ("manufacturer", True, ("string",)), ("port", False, ("integer",)), ("prodid", False, ("string",)), ("product", True, ("string",)), ("serial", True, ("string",)), ("speed", False, ("string",)), ("usbpath", True, ("string",)), ("vendid", False, ("string",)))))),)),
+    ("/nodes/{node}/capabilities", "capabilities", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/capabilities/qemu", "qemu", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/capabilities/qemu/cpu", "cpu", (("get", ("array", ("object", (("custom", False, ("boolean",)), ("name", False, ("string",)), ("vendor", False, ("string",)))))),)),
+    ("/nodes/{node}/capabilities/qemu/cpu-flags", "cpu_flags", (("get", ("array", ("object", (("description", False, ("string",)), ("name", False, ("string",)))))),)),
+    ("/nodes/{node}/capabilities/qemu/machines", "machines", (("get", ("array", ("object", (("changes", True, ("string",)), ("id", False, ("string",)), ("type", False, ("string", ("q35", "i440fx"))), ("version", False, ("string",)))))),)),
+    ("/nodes/{node}/capabilities/qemu/migration", "migration", (("get", ("object", (("has-dbus-vmstate", False, ("boolean",), "has_dbus_vmstate"),))),)),
+    ("/nodes/{node}/storage", "storage", (("get", ("array", ("object", (("active", True, ("boolean",)), ("avail", True, ("integer",)), ("content", False, ("string",)), ("enabled", True, ("boolean",)), ("formats", True, ("object", (("default", False, ("string", ("qcow2", "raw", "subvol", "vmdk"))), ("supported", False, ("array", ("string", ("qcow2", "raw", "subvol", "vmdk"))))))), ("select_existing", True, ("boolean",)), ("shared", True, ("boolean",)), ("storage", False, ("string",)), ("total", True, ("integer",)), ("type", False, ("string",)), ("used", True, ("integer",)), ("used_fraction", True, ("number",)))))),)),
+    ("/nodes/{node}/storage/{storage}", "", (("get", ("array", ("object", (("subdir", False, ("string",)),)))),)),
+    ("/nodes/{node}/storage/{storage}/prunebackups", "prunebackups", (("delete", ("string",)), ("get", ("array", ("object", (("ctime", False, ("integer",)), ("mark", False, ("string", ("keep", "remove", "protected", "renamed"))), ("type", False, ("string",)), ("vmid", True, ("integer",)), ("volid", False, ("string",)))))))),
+    ("/nodes/{node}/storage/{storage}/content", "content", (("get", ("array", ("object", (("ctime", True, ("integer",)), ("encrypted", True, ("string",)), ("format", False, ("string",)), ("notes", True, ("string",)), ("parent", True, ("string",)), ("protected", True, ("boolean",)), ("size", False, ("integer",)), ("used", True, ("integer",)), ("verification", True, ("object", (("state", False, ("string",)), ("upid", False, ("string",))))), ("vmid", True, ("integer",)), ("volid", False, ("string",)))))), ("post", ("string",)))),
+    ("/nodes/{node}/storage/{storage}/content/{volume}", "", (("delete", ("string",)), ("get", ("object", (("format", False, ("string",)), ("notes", True, ("string",)), ("path", False, ("string",)), ("protected", True, ("boolean",)), ("size", False, ("integer",)), ("used", False, ("integer",))))), ("post", ("string",)), ("put", ("null",)))),
+    ("/nodes/{node}/storage/{storage}/file-restore", "file_restore", ()),
+    ("/nodes/{node}/storage/{storage}/file-restore/list", "list", (("get", ("array", ("object", (("filepath", False, ("string",)), ("leaf", False, ("boolean",)), ("mtime", True, ("integer",)), ("size", True, ("integer",)), ("text", False, ("string",)), ("type", False, ("string",)))))),)),
+    ("/nodes/{node}/storage/{storage}/file-restore/download", "download", (("get", ("any",)),)),
+    ("/nodes/{node}/storage/{storage}/status", "status", (("get", ("object", (("active", True, ("boolean",)), ("avail", True, ("integer",)), ("content", False, ("string",)), ("enabled", True, ("boolean",)), ("shared", True, ("boolean",)), ("total", True, ("integer",)), ("type", False, ("string",)), ("used", True, ("integer",))))),)),
+    ("/nodes/{node}/storage/{storage}/rrd", "rrd", (("get", ("object", (("filename", False, ("string",)),))),)),
+    ("/nodes/{node}/storage/{storage}/rrddata", "rrddata", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/storage/{storage}/upload", "upload", (("post", ("string",)),)),
+    ("/nodes/{node}/storage/{storage}/download-url", "download_url", (("post", ("string",)),)),
+    ("/nodes/{node}/storage/{storage}/oci-registry-pull", "oci_registry_pull", (("post", ("string",)),)),
+    ("/nodes/{node}/storage/{storage}/import-metadata", "import_metadata", (("get", ("object", (("create-args", False, ("object",), "create_args"), ("disks", True, ("object",)), ("net", True, ("object",)), ("source", False, ("string", ("esxi",))), ("type", False, ("string", ("vm",))), ("warnings", True, ("array", ("object", (("key", True, ("string",)), ("type", False, ("string", ("cdrom-image-ignored", "efi-state-lost", "guest-is-running", "nvme-unsupported", "ova-needs-extracting", "ovmf-with-lsi-unsupported", "serial-port-socket-only"))), ("value", True, ("string",))))))))),)),
+    ("/nodes/{node}/disks", "disks", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/disks/lvm", "lvm", (("get", ("object", (("children", False, ("array", ("object", (("children", True, ("array", ("object", (("free", False, ("integer",)), ("leaf", False, ("boolean",)), ("name", False, ("string",)), ("size", False, ("integer",)))))), ("free", False, ("integer",)), ("leaf", False, ("boolean",)), ("name", False, ("string",)), ("size", False, ("integer",)))))), ("leaf", False, ("boolean",))))), ("post", ("string",)))),
+    ("/nodes/{node}/disks/lvm/{name}", "", (("delete", ("string",)),)),
+    ("/nodes/{node}/disks/lvmthin", "lvmthin", (("get", ("array", ("object", (("lv", False, ("string",)), ("lv_size", False, ("integer",)), ("metadata_size", False, ("integer",)), ("metadata_used", False, ("integer",)), ("used", False, ("integer",)), ("vg", False, ("string",)))))), ("post", ("string",)))),
+    ("/nodes/{node}/disks/lvmthin/{name}", "", (("delete", ("string",)),)),
+    ("/nodes/{node}/disks/directory", "directory", (("get", ("array", ("object", (("device", False, ("string",)), ("options", False, ("string",)), ("path", False, ("string",)), ("type", False, ("string",)), ("unitfile", False, ("string",)))))), ("post", ("string",)))),
+    ("/nodes/{node}/disks/directory/{name}", "", (("delete", ("string",)),)),
+    ("/nodes/{node}/disks/zfs", "zfs", (("get", ("array", ("object", (("alloc", False, ("integer",)), ("dedup", False, ("number",)), ("frag", False, ("integer",)), ("free", False, ("integer",)), ("health", False, ("string",)), ("name", False, ("string",)), ("size", False, ("integer",)))))), ("post", ("string",)))),
+    ("/nodes/{node}/disks/zfs/{name}", "", (("delete", ("string",)), ("get", ("object", (("action", True, ("string",)), ("children", False, ("array", ("object", (("cksum", True, ("number",)), ("msg", False, ("string",)), ("name", False, ("string",)), ("read", True, ("number",)), ("state", True, ("string",)), ("write", True, ("number",)))))), ("errors", False, ("string",)), ("name", False, ("string",)), ("scan", True, ("string",)), ("state", False, ("string",)), ("status", True, ("string",))))))),
+    ("/nodes/{node}/disks/list", "list", (("get", ("array", ("object", (("devpath", False, ("string",)), ("gpt", False, ("boolean",)), ("health", True, ("string",)), ("model", True, ("string",)), ("mounted", False, ("boolean",)), ("osdid", False, ("integer",)), ("osdid-list", False, ("array", ("integer",)), "osdid_list"), ("parent", True, ("string",)), ("serial", True, ("string",)), ("size", False, ("integer",)), ("used", True, ("string",)), ("vendor", True, ("string",)), ("wwn", True, ("string",)))))),)),
+    ("/nodes/{node}/disks/smart", "smart", (("get", ("object", (("attributes", True, ("array",)), ("health", False, ("string",)), ("text", True, ("string",)), ("type", True, ("string",))))),)),
+    ("/nodes/{node}/disks/initgpt", "initgpt", (("post", ("string",)),)),
+    ("/nodes/{node}/disks/wipedisk", "wipedisk", (("put", ("string",)),)),
+    ("/nodes/{node}/apt", "apt", (("get", ("array", ("object", (("id", False, ("string",)),)))),)),
+    ("/nodes/{node}/apt/update", "update", (("get", ("array", ("object", (("Arch", False, ("string", ("armhf", "arm64", "amd64", "ppc64el", "risc64", "s390x", "all")), "arch"), ("Description", False, ("string",), "description"), ("NotifyStatus", True, ("string",), "notify_status"), ("OldVersion", True, ("string",), "old_version"), ("Origin", False, ("string",), "origin"), ("Package", False, ("string",), "package"), ("Priority", False, ("string",), "priority"), ("Section", False, ("string",), "section"), ("Title", False, ("string",), "title"), ("Version", False, ("string",), "version"))))), ("post", ("string",)))),
+    ("/nodes/{node}/apt/changelog", "changelog", (("get", ("string",)),)),
+    ("/nodes/{node}/apt/repositories", "repositories", (("get", ("object", (("digest", False, ("string",)), ("errors", False, ("array", ("object", (("error", False, ("string",)), ("path", False, ("string",)))))), ("files", False, ("array", ("object", (("digest", False, ("array", ("integer",))), ("file-type", False, ("string", ("list", "sources")), "file_type"), ("path", False, ("string",)), ("repositories", False, ("array", ("object", (("Comment", True, ("string",), "comment"), ("Components", True, ("array", ("string",)), "components"), ("Enabled", False, ("boolean",), "enabled"), ("FileType", False, ("string", ("list", "sources")), "file_type"), ("Options", True, ("array", ("object", (("Key", False, ("string",), "key"), ("Values", False, ("array", ("string",)), "values")))), "options"), ("Suites", False, ("array", ("string",)), "suites"), ("Types", False, ("array", ("string", ("deb", "deb-src"))), "types"), ("URIs", False, ("array", ("string",)), "uris"))))))))), ("infos", False, ("array", ("object", (("index", False, ("integer",)), ("kind", False, ("string",)), ("message", False, ("string",)), ("path", False, ("string",)), ("property", True, ("string",)))))), ("standard-repos", False, ("array", ("object", (("handle", False, ("string",)), ("name", False, ("string",)), ("status", True, ("boolean",))))), "standard_repos")))), ("post", ("null",)), ("put", ("null",)))),
+    ("/nodes/{node}/apt/versions", "versions", (("get", ("array", ("object", (("Arch", False, ("string", ("armhf", "arm64", "amd64", "ppc64el", "risc64", "s390x", "all")), "arch"), ("CurrentState", False, ("string", ("Installed", "NotInstalled", "UnPacked", "HalfConfigured", "HalfInstalled", "ConfigFiles")), "current_state"), ("Description", False, ("string",), "description"), ("ManagerVersion", True, ("string",), "manager_version"), ("NotifyStatus", True, ("string",), "notify_status"), ("OldVersion", True, ("string",), "old_version"), ("Origin", False, ("string",), "origin"), ("Package", False, ("string",), "package"), ("Priority", False, ("string",), "priority"), ("RunningKernel", True, ("string",), "running_kernel"), ("Section", False, ("string",), "section"), ("Title", False, ("string",), "title"), ("Version", False, ("string",), "version"))))),)),
+    ("/nodes/{node}/firewall", "firewall", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/firewall/rules", "rules", (("get", ("array", ("object", (("action", False, ("string",)), ("comment", True, ("string",)), ("dest", True, ("string",)), ("dport", True, ("string",)), ("enable", True, ("integer",)), ("icmp-type", True, ("string",), "icmp_type"), ("iface", True, ("string",)), ("ipversion", True, ("integer",)), ("log", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("macro", True, ("string",)), ("pos", False, ("integer",)), ("proto", True, ("string",)), ("source", True, ("string",)), ("sport", True, ("string",)), ("type", False, ("string",)))))), ("post", ("null",)))),
+    ("/nodes/{node}/firewall/rules/{pos}", "", (("delete", ("null",)), ("get", ("object", (("action", False, ("string",)), ("comment", True, ("string",)), ("dest", True, ("string",)), ("dport", True, ("string",)), ("enable", True, ("integer",)), ("icmp-type", True, ("string",), "icmp_type"), ("iface", True, ("string",)), ("ipversion", True, ("integer",)), ("log", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("macro", True, ("string",)), ("pos", False, ("integer",)), ("proto", True, ("string",)), ("source", True, ("string",)), ("sport", True, ("string",)), ("type", False, ("string",))))), ("put", ("null",)))),
+    ("/nodes/{node}/firewall/options", "options", (("get", ("object", (("enable", True, ("boolean",)), ("log_level_forward", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("log_level_in", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("log_level_out", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("log_nf_conntrack", True, ("boolean",)), ("ndp", True, ("boolean",)), ("nf_conntrack_allow_invalid", True, ("boolean",)), ("nf_conntrack_helpers", True, ("string",)), ("nf_conntrack_max", True, ("integer",)), ("nf_conntrack_tcp_timeout_established", True, ("integer",)), ("nf_conntrack_tcp_timeout_syn_recv", True, ("integer",)), ("nftables", True, ("boolean",)), ("nosmurfs", True, ("boolean",)), ("protection_synflood", True, ("boolean",)), ("protection_synflood_burst", True, ("integer",)), ("protection_synflood_rate", True, ("integer",)), ("smurf_log_level", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("tcp_flags_log_level", True, ("string", ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog"))), ("tcpflags", True, ("boolean",))))), ("put", ("null",)))),
+    ("/nodes/{node}/firewall/log", "log", (("get", ("array", ("object", (("n", False, ("integer",)), ("t", False, ("string",)))))),)),
+    ("/nodes/{node}/replication", "replication", (("get", ("array", ("object", (("id", False, ("string",)),)))),)),
+    ("/nodes/{node}/replication/{id}", "", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/replication/{id}/status", "status", (("get", ("object",)),)),
+    ("/nodes/{node}/replication/{id}/log", "log", (("get", ("array", ("object", (("n", False, ("integer",)), ("t", False, ("string",)))))),)),
+    ("/nodes/{node}/replication/{id}/schedule_now", "schedule_now", (("post", ("string",)),)),
+    ("/nodes/{node}/certificates", "certificates", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/certificates/acme", "acme", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/certificates/acme/certificate", "certificate", (("delete", ("string",)), ("post", ("string",)), ("put", ("string",)))),
+    ("/nodes/{node}/certificates/info", "info", (("get", ("array", ("object", (("filename", True, ("string",)), ("fingerprint", True, ("string",)), ("issuer", True, ("string",)), ("notafter", True, ("integer",)), ("notbefore", True, ("integer",)), ("pem", True, ("string",)), ("public-key-bits", True, ("integer",), "public_key_bits"), ("public-key-type", True, ("string",), "public_key_type"), ("san", True, ("array", ("string",))), ("subject", True, ("string",)))))),)),
+    ("/nodes/{node}/certificates/custom", "custom", (("delete", ("null",)), ("post", ("object", (("filename", True, ("string",)), ("fingerprint", True, ("string",)), ("issuer", True, ("string",)), ("notafter", True, ("integer",)), ("notbefore", True, ("integer",)), ("pem", True, ("string",)), ("public-key-bits", True, ("integer",), "public_key_bits"), ("public-key-type", True, ("string",), "public_key_type"), ("san", True, ("array", ("string",))), ("subject", True, ("string",))))))),
+    ("/nodes/{node}/config", "config", (("get", ("object", (("acme", True, ("string",)), ("acmedomain[n]", True, ("string",), "acmedomainn"), ("ballooning-target", True, ("integer",), "ballooning_target"), ("description", True, ("string",)), ("digest", True, ("string",)), ("startall-onboot-delay", True, ("integer",), "startall_onboot_delay"), ("wakeonlan", True, ("string",))))), ("put", ("null",)))),
+    ("/nodes/{node}/sdn", "sdn", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/sdn/fabrics", "fabrics", ()),
+    ("/nodes/{node}/sdn/fabrics/{fabric}", "", (("get", ("array", ("object", (("subdir", False, ("string",)),)))),)),
+    ("/nodes/{node}/sdn/fabrics/{fabric}/routes", "routes", (("get", ("array", ("object", (("route", False, ("string",)), ("via", False, ("array", ("string",))))))),)),
+    ("/nodes/{node}/sdn/fabrics/{fabric}/neighbors", "neighbors", (("get", ("array", ("object", (("neighbor", False, ("string",)), ("status", False, ("string",)), ("uptime", False, ("string",)))))),)),
+    ("/nodes/{node}/sdn/fabrics/{fabric}/interfaces", "interfaces", (("get", ("array", ("object", (("name", False, ("string",)), ("state", False, ("string",)), ("type", False, ("string",)))))),)),
+    ("/nodes/{node}/sdn/zones", "zones", (("get", ("array", ("object", (("status", False, ("string", ("available", "pending", "error"))), ("zone", False, ("string",)))))),)),
+    ("/nodes/{node}/sdn/zones/{zone}", "", (("get", ("array", ("object", (("subdir", False, ("string",)),)))),)),
+    ("/nodes/{node}/sdn/zones/{zone}/content", "content", (("get", ("array", ("object", (("status", True, ("string",)), ("statusmsg", True, ("string",)), ("vnet", False, ("string",)))))),)),
+    ("/nodes/{node}/sdn/zones/{zone}/bridges", "bridges", (("get", ("array", ("object", (("name", False, ("string",)), ("ports", False, ("array", ("object", (("index", True, ("string",)), ("name", False, ("string",)), ("primary_vlan", True, ("number",)), ("vlans", True, ("array", ("string",))), ("vmid", True, ("number",)))))), ("vlan_filtering", False, ("string",)))))),)),
+    ("/nodes/{node}/sdn/zones/{zone}/ip-vrf", "ip_vrf", (("get", ("array", ("object", (("ip", False, ("string",)), ("metric", False, ("integer",)), ("nexthops", False, ("array", ("string",))), ("protocol", False, ("string",)))))),)),
+    ("/nodes/{node}/sdn/vnets", "vnets", ()),
+    ("/nodes/{node}/sdn/vnets/{vnet}", "", (("get", ("array", ("object", (("subdir", False, ("string",)),)))),)),
+    ("/nodes/{node}/sdn/vnets/{vnet}/mac-vrf", "mac_vrf", (("get", ("array", ("object", (("ip", False, ("string",)), ("mac", False, ("string",)), ("nexthop", False, ("string",)))))),)),
+    ("/nodes/{node}/version", "version", (("get", ("object", (("release", False, ("string",)), ("repoid", False, ("string",)), ("version", False, ("string",))))),)),
+    ("/nodes/{node}/status", "status", (("get", ("object", (("boot-info", False, ("object", (("mode", False, ("string", ("efi", "legacy-bios"))), ("secureboot", True, ("boolean",)))), "boot_info"), ("cpu", False, ("number",)), ("cpuinfo", False, ("object", (("cores", False, ("integer",)), ("cpus", False, ("integer",)), ("model", False, ("string",)), ("sockets", False, ("integer",))))), ("current-kernel", False, ("object", (("machine", False, ("string",)), ("release", False, ("string",)), ("sysname", False, ("string",)), ("version", False, ("string",)))), "current_kernel"), ("loadavg", False, ("array", ("string",))), ("memory", False, ("object", (("available", False, ("integer",)), ("free", False, ("integer",)), ("total", False, ("integer",)), ("used", False, ("integer",))))), ("pveversion", False, ("string",)), ("rootfs", False, ("object", (("avail", False, ("integer",)), ("free", False, ("integer",)), ("total", False, ("integer",)), ("used", False, ("integer",)))))))), ("post", ("null",)))),
+    ("/nodes/{node}/netstat", "netstat", (("get", ("array", ("object",))),)),
+    ("/nodes/{node}/execute", "execute", (("post", ("array", ("object",))),)),
+    ("/nodes/{node}/wakeonlan", "wakeonlan", (("post", ("string",)),)),
+    ("/nodes/{node}/rrd", "rrd", (("get", ("object", (("filename", False, ("string",)),))),)),
+    ("/nodes/{node}/rrddata", "rrddata", (("get", ("array", ("dict", ("number",)))),)),
+    ("/nodes/{node}/syslog", "syslog", (("get", ("array", ("object", (("n", False, ("integer",)), ("t", False, ("string",)))))),)),
+    ("/nodes/{node}/journal", "journal", (("get", ("array", ("string",))),)),
+    ("/nodes/{node}/vncshell", "vncshell", (("post", ("object", (("cert", False, ("string",)), ("port", False, ("integer",)), ("ticket", False, ("string",)), ("upid", False, ("string",)), ("user", False, ("string",))))),)),
+    ("/nodes/{node}/termproxy", "termproxy", (("post", ("object", (("port", False, ("integer",)), ("ticket", False, ("string",)), ("upid", False, ("string",)), ("user", False, ("string",))))),)),
+    ("/nodes/{node}/vncwebsocket", "vncwebsocket", (("get", ("object", (("port", False, ("string",)),))),)),
+    ("/nodes/{node}/spiceshell", "spiceshell", (("post", ("object", (("host", False, ("string",)), ("password", False, ("string",)), ("proxy", False, ("string",)), ("tls-port", False, ("integer",), "tls_port"), ("type", False, ("string",))))),)),
+    ("/nodes/{node}/dns", "dns", (("get", ("object", (("dns1", True, ("string",)), ("dns2", True, ("string",)), ("dns3", True, ("string",)), ("search", True, ("string",))))), ("put", ("null",)))),
+    ("/nodes/{node}/time", "time", (("get", ("object", (("localtime", False, ("integer",)), ("time", False, ("integer",)), ("timezone", False, ("string",))))), ("put", ("null",)))),
+    ("/nodes/{node}/aplinfo", "aplinfo", (("get", ("array", ("object",))), ("post", ("string",)))),
+    ("/nodes/{node}/query-oci-repo-tags", "query_oci_repo_tags", (("get", ("array", ("string",))),)),
+    ("/nodes/{node}/query-url-metadata", "query_url_metadata", (("get", ("object", (("filename", True, ("string",)), ("mimetype", True, ("string",)), ("size", True, ("integer",))))),)),
+    ("/nodes/{node}/report", "report", (("get", ("string",)),)),
+    ("/nodes/{node}/startall", "startall", (("post", ("string",)),)),
+    ("/nodes/{node}/stopall", "stopall", (("post", ("string",)),)),
+    ("/nodes/{node}/suspendall", "suspendall", (("post", ("string",)),)),
+    ("/nodes/{node}/migrateall", "migrateall", (("post", ("string",)),)),
+    ("/nodes/{node}/hosts", "hosts", (("get", ("object", (("data", False, ("string",)), ("digest", True, ("string",))))), ("post", ("null",)))),
+    ("/storage", "storage", (("get", ("array", ("object", (("storage", False, ("string",)),)))), ("post", ("object", (("config", True, ("object", (("encryption-key", True, ("string",), "encryption_key"),))), ("storage", False, ("string",)), ("type", False, ("string", ("btrfs", "cephfs", "cifs", "dir", "esxi", "iscsi", "iscsidirect", "lvm", "lvmthin", "nfs", "pbs", "rbd", "zfs", "zfspool")))))))),
+    ("/storage/{storage}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("object", (("config", True, ("object", (("encryption-key", True, ("string",), "encryption_key"),))), ("storage", False, ("string",)), ("type", False, ("string", ("btrfs", "cephfs", "cifs", "dir", "esxi", "iscsi", "iscsidirect", "lvm", "lvmthin", "nfs", "pbs", "rbd", "zfs", "zfspool")))))))),
+    ("/access", "access", (("get", ("array", ("object", (("subdir", False, ("string",)),)))),)),
+    ("/access/users", "users", (("get", ("array", ("object", (("comment", True, ("string",)), ("email", True, ("string",)), ("enable", True, ("boolean",)), ("expire", True, ("integer",)), ("firstname", True, ("string",)), ("groups", True, ("string",)), ("keys", True, ("string",)), ("lastname", True, ("string",)), ("realm-type", True, ("string",), "realm_type"), ("tfa-locked-until", True, ("integer",), "tfa_locked_until"), ("tokens", True, ("array", ("object", (("comment", True, ("string",)), ("expire", True, ("integer",)), ("privsep", True, ("boolean",)), ("tokenid", False, ("string",)))))), ("totp-locked", True, ("boolean",), "totp_locked"), ("userid", False, ("string",)))))), ("post", ("null",)))),
+    ("/access/users/{userid}", "", (("delete", ("null",)), ("get", ("object", (("comment", True, ("string",)), ("email", True, ("string",)), ("enable", True, ("boolean",)), ("expire", True, ("integer",)), ("firstname", True, ("string",)), ("groups", True, ("array", ("string",))), ("keys", True, ("string",)), ("lastname", True, ("string",)), ("tokens", True, ("object",))))), ("put", ("null",)))),
+    ("/access/users/{userid}/tfa", "tfa", (("get", ("object", (("realm", True, ("string", ("oath", "yubico"))), ("types", True, ("array", ("string", ("totp", "u2f", "yubico", "webauthn", "recovedry")))), ("user", True, ("string", ("oath", "u2f")))))),)),
+    ("/access/users/{userid}/unlock-tfa", "unlock_tfa", (("put", ("boolean",)),)),
+    ("/access/users/{userid}/token", "token", (("get", ("array", ("object", (("comment", True, ("string",)), ("expire", True, ("integer",)), ("privsep", True, ("boolean",)), ("tokenid", False, ("string",)))))),)),
+    ("/access/users/{userid}/token/{tokenid}", "", (("delete", ("null",)), ("get", ("object", (("comment", True, ("string",)), ("expire", True, ("integer",)), ("privsep", True, ("boolean",))))), ("post", ("object", (("full-tokenid", False, ("string",), "full_tokenid"), ("info", False, ("object", (("comment", True, ("string",)), ("expire", True, ("integer",)), ("privsep", True, ("boolean",))))), ("value", False, ("string",))))), ("put", ("object", (("comment", True, ("string",)), ("expire", True, ("integer",)), ("privsep", True, ("boolean",))))))),
+    ("/access/groups", "groups", (("get", ("array", ("object", (("comment", True, ("string",)), ("groupid", False, ("string",)), ("users", True, ("string",)))))), ("post", ("null",)))),
+    ("/access/groups/{groupid}", "", (("delete", ("null",)), ("get", ("object", (("comment", True, ("string",)), ("members", False, ("array", ("string",)))))), ("put", ("null",)))),
+    ("/access/roles", "roles", (("get", ("array", ("object", (("privs", True, ("string",)), ("roleid", False, ("string",)), ("special", True, ("boolean",)))))), ("post", ("null",)))),
+    ("/access/roles/{roleid}", "", (("delete", ("null",)), ("get", ("object", (("Datastore.Allocate", True, ("boolean",), "datastore_allocate"), ("Datastore.AllocateSpace", True, ("boolean",), "datastore_allocate_space"), ("Datastore.AllocateTemplate", True, ("boolean",), "datastore_allocate_template"), ("Datastore.Audit", True, ("boolean",), "datastore_audit"), ("Group.Allocate", True, ("boolean",), "group_allocate"), ("Mapping.Audit", True, ("boolean",), "mapping_audit"), ("Mapping.Modify", True, ("boolean",), "mapping_modify"), ("Mapping.Use", True, ("boolean",), "mapping_use"), ("Permissions.Modify", True, ("boolean",), "permissions_modify"), ("Pool.Allocate", True, ("boolean",), "pool_allocate"), ("Pool.Audit", True, ("boolean",), "pool_audit"), ("Realm.Allocate", True, ("boolean",), "realm_allocate"), ("Realm.AllocateUser", True, ("boolean",), "realm_allocate_user"), ("SDN.Allocate", True, ("boolean",), "sdnallocate"), ("SDN.Audit", True, ("boolean",), "sdnaudit"), ("SDN.Use", True, ("boolean",), "sdnuse"), ("Sys.AccessNetwork", True, ("boolean",), "sys_access_network"), ("Sys.Audit", True, ("boolean",), "sys_audit"), ("Sys.Console", True, ("boolean",), "sys_console"), ("Sys.Incoming", True, ("boolean",), "sys_incoming"), ("Sys.Modify", True, ("boolean",), "sys_modify"), ("Sys.PowerMgmt", True, ("boolean",), "sys_power_mgmt"), ("Sys.Syslog", True, ("boolean",), "sys_syslog"), ("User.Modify", True, ("boolean",), "user_modify"), ("VM.Allocate", True, ("boolean",), "vmallocate"), ("VM.Audit", True, ("boolean",), "vmaudit"), ("VM.Backup", True, ("boolean",), "vmbackup"), ("VM.Clone", True, ("boolean",), "vmclone"), ("VM.Config.CDROM", True, ("boolean",), "vmconfig_cdrom"), ("VM.Config.CPU", True, ("boolean",), "vmconfig_cpu"), ("VM.Config.Cloudinit", True, ("boolean",), "vmconfig_cloudinit"), ("VM.Config.Disk", True, ("boolean",), "vmconfig_disk"), ("VM.Config.HWType", True, ("boolean",), "vmconfig_hwtype"), ("VM.Config.Memory", True, ("boolean",), "vmconfig_memory"), ("VM.Config.Network", True, ("boolean",), "vmconfig_network"), ("VM.Config.Options", True, ("boolean",), "vmconfig_options"), ("VM.Console", True, ("boolean",), "vmconsole"), ("VM.GuestAgent.Audit", True, ("boolean",), "vmguest_agent_audit"), ("VM.GuestAgent.FileRead", True, ("boolean",), "vmguest_agent_file_read"), ("VM.GuestAgent.FileSystemMgmt", True, ("boolean",), "vmguest_agent_file_system_mgmt"), ("VM.GuestAgent.FileWrite", True, ("boolean",), "vmguest_agent_file_write"), ("VM.GuestAgent.Unrestricted", True, ("boolean",), "vmguest_agent_unrestricted"), ("VM.Migrate", True, ("boolean",), "vmmigrate"), ("VM.PowerMgmt", True, ("boolean",), "vmpower_mgmt"), ("VM.Replicate", True, ("boolean",), "vmreplicate"), ("VM.Snapshot", True, ("boolean",), "vmsnapshot"), ("VM.Snapshot.Rollback", True, ("boolean",), "vmsnapshot_rollback")))), ("put", ("null",)))),
+    ("/access/acl", "acl", (("get", ("array", ("object", (("path", False, ("string",)), ("propagate", True, ("boolean",)), ("roleid", False, ("string",)), ("type", False, ("string", ("user", "group", "token"))), ("ugid", False, ("string",)))))), ("put", ("null",)))),
+    ("/access/domains", "domains", (("get", ("array", ("object", (("comment", True, ("string",)), ("realm", False, ("string",)), ("tfa", True, ("string", ("yubico", "oath"))), ("type", False, ("string",)))))), ("post", ("null",)))),
+    ("/access/domains/{realm}", "", (("delete", ("null",)), ("get", ("object",)), ("put", ("null",)))),
+    ("/access/domains/{realm}/sync", "sync", (("post", ("string",)),)),
+    ("/access/openid", "openid", (("get", ("array", ("object", (("subdir", False, ("string",)),)))),)),
+    ("/access/openid/auth-url", "auth_url", (("post", ("string",)),)),
+    ("/access/openid/login", "login", (("post", ("object", (("CSRFPreventionToken", False, ("string",), "csrfprevention_token"), ("cap", False, ("object",)), ("clustername", True, ("string",)), ("ticket", False, ("string",)), ("username", False, ("string",))))),)),
+    ("/access/tfa", "tfa", (("get", ("array", ("object", (("entries", False, ("array", ("object", (("created", False, ("integer",)), ("description", False, ("string",)), ("enable", True, ("boolean",)), ("id", False, ("string",)), ("type", False, ("string", ("totp", "u2f", "webauthn", "recovery", "yubico"))))))), ("tfa-locked-until", True, ("integer",), "tfa_locked_until"), ("totp-locked", True, ("boolean",), "totp_locked"), ("userid", False, ("string",)))))),)),
+    ("/access/tfa/{userid}", "", (("get", ("array", ("object", (("created", False, ("integer",)), ("description", False, ("string",)), ("enable", True, ("boolean",)), ("id", False, ("string",)), ("type", False, ("string", ("totp", "u2f", "webauthn", "recovery", "yubico"))))))), ("post", ("object", (("challenge", True, ("string",)), ("id", False, ("string",)), ("recovery", True, ("array", ("string",)))))))),
+    ("/access/tfa/{userid}/{id}", "", (("delete", ("null",)), ("get", ("object", (("created", False, ("integer",)), ("description", False, ("string",)), ("enable", True, ("boolean",)), ("id", False, ("string",)), ("type", False, ("string", ("totp", "u2f", "webauthn", "recovery", "yubico")))))), ("put", ("null",)))),
+    ("/access/ticket", "ticket", (("get", ("null",)), ("post", ("object", (("CSRFPreventionToken", True, ("string",), "csrfprevention_token"), ("clustername", True, ("string",)), ("ticket", True, ("string",)), ("username", False, ("string",))))))),
+    ("/access/vncticket", "vncticket", (("post", ("null",)),)),
+    ("/access/password", "password", (("put", ("null",)),)),
+    ("/access/permissions", "permissions", (("get", ("object",)),)),
+    ("/pools", "pools", (("delete", ("null",)), ("get", ("array", ("object", (("comment", True, ("string",)), ("members", True, ("array", ("object", (("id", False, ("string",)), ("node", False, ("string",)), ("storage", True, ("string",)), ("type", False, ("string", ("qemu", "lxc", "openvz", "storage"))), ("vmid", True, ("integer",)))))), ("poolid", False, ("string",)))))), ("post", ("null",)), ("put", ("null",)))),
+    ("/pools/{poolid}", "", (("delete", ("null",)), ("get", ("object", (("comment", True, ("string",)), ("members", False, ("array", ("object", (("id", False, ("string",)), ("node", False, ("string",)), ("storage", True, ("string",)), ("type", False, ("string", ("qemu", "lxc", "openvz", "storage"))), ("vmid", True, ("integer",)), ("name", False, ("string",))))))))), ("put", ("null",)))),
+    ("/version", "version", (("get", ("object", (("console", True, ("string", ("applet", "vv", "html5", "xtermjs"))), ("release", False, ("string",)), ("repoid", False, ("string",)), ("version", False, ("string",))))),)),
+)
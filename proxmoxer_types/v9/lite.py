@@ -0,0 +1,15 @@
+from typing import TYPE_CHECKING
+
+# mypy takes MYPY as true, and PROXMOXER_PLUGIN with `always_true = PROXMOXER_PLUGIN`,
+# which proxmoxer_types.mypy_plugin requires.
+# Without the plugin mypy reads both branches below and keeps the first ProxmoxAPI,
+# pyright keeps the last one.
+MYPY = PROXMOXER_PLUGIN = False
+
+if TYPE_CHECKING and not PROXMOXER_PLUGIN:
+    from .core import ProxmoxAPI as ProxmoxAPI
+else:
+    from ._lite import ProxmoxAPI as ProxmoxAPI  # type: ignore[assignment]
+
+if TYPE_CHECKING and not MYPY:
+    from .core import ProxmoxAPI as ProxmoxAPI
@@ -0,0 +1,1550 @@
+# This file is autogenerated from apidata/apidata-v9.json
+
+from ..schema import Format, Method, Param
+
+_Format_0b3dddebc23a = Format({"address": Param("string", False, format="address"), "priority": Param("integer", True, minimum=0, maximum=255)}, default_key="address")
+_Format_21abd2afdb75 = Format({"burst": Param("integer", True, minimum=0), "enable": Param("boolean", False), "rate": Param("string", True)}, default_key="enable")
+_Format_8bb3bf1ec711 = Format({"clone": Param("number", True, minimum=0), "default": Param("number", True, minimum=0), "migration": Param("number", True, minimum=0), "move": Param("number", True, minimum=0), "restore": Param("number", True, minimum=0)})
+_Format_37dc218f6366 = Format({"ha": Param("string", True, ("basic", "static")), "ha-rebalance-on-start": Param("boolean", True)})
+_Format_edd725523689 = Format({"shutdown_policy": Param("string", False, ("freeze", "failover", "conditional", "migrate"))})
+_Format_f347c5a21bc8 = Format({"network": Param("string", True, format="CIDR"), "type": Param("string", False, ("secure", "insecure"))}, default_key="type")
+_Format_36baeb21d9ac = Format({"lower": Param("integer", True), "upper": Param("integer", True)})
+_Format_65f9376990eb = Format({"fencing": Param("string", True, ("always", "never")), "package-updates": Param("string", True, ("auto", "always", "never")), "replication": Param("string", True, ("always", "never")), "target-fencing": Param("string", True), "target-package-updates": Param("string", True), "target-replication": Param("string", True)})
+_Format_a60dd3fdeb12 = Format({"case-sensitive": Param("boolean", True), "color-map": Param("string", True), "ordering": Param("string", True, ("config", "alphabetical")), "shape": Param("string", True, ("full", "circle", "dense", "none"))})
+_Format_6aae01081571 = Format({"appid": Param("string", True), "origin": Param("string", True)})
+_Format_376db2d24d5f = Format({"user-allow": Param("string", True, ("none", "list", "existing", "free")), "user-allow-list": Param("string", True)})
+_Format_b9da8916ff52 = Format({"allow-subdomains": Param("boolean", True), "id": Param("string", True), "origin": Param("string", True), "rp": Param("string", True)})
+_Format_23a5bda48b65 = Format({"enabled": Param("boolean", False), "freeze-fs-on-backup": Param("boolean", True), "fstrim_cloned_disks": Param("boolean", True), "type": Param("string", True, ("virtio", "isa"))}, default_key="enabled")
+_Format_c5b977836777 = Format({"device": Param("string", False, ("ich9-intel-hda", "intel-hda", "AC97")), "driver": Param("string", True, ("spice", "none"))})
+_Format_ab8a16165183 = Format({"efitype": Param("string", True, ("2m", "4m")), "file": Param("string", False, format="pve-volume-id-or-qm-path"), "format": Param("string", True, ("raw", "qcow", "qed", "qcow2", "vmdk", "cloop")), "import-from": Param("string", True, format="pve-volume-id-or-absolute-path"), "ms-cert": Param("string", True, ("2011", "2023")), "pre-enrolled-keys": Param("boolean", True), "size": Param("string", True, format="disk-size")}, default_key="file", aliases={"volume": "file"})
+_Format_373461a1aea1 = Format({"aio": Param("string", True, ("native", "threads", "io_uring")), "backup": Param("boolean", True), "bps": Param("integer", True), "bps_max_length": Param("integer", True, minimum=1), "bps_rd": Param("integer", True), "bps_rd_max_length": Param("integer", True, minimum=1), "bps_wr": Param("integer", True), "bps_wr_max_length": Param("integer", True, minimum=1), "cache": Param("string", True, ("none", "writethrough", "writeback", "unsafe", "directsync")), "detect_zeroes": Param("boolean", True), "discard": Param("string", True, ("ignore", "on")), "file": Param("string", False, format="pve-volume-id-or-qm-path"), "format": Param("string", True, ("raw", "qcow", "qed", "qcow2", "vmdk", "cloop")), "import-from": Param("string", True, format="pve-volume-id-or-absolute-path"), "iops": Param("integer", True), "iops_max": Param("integer", True), "iops_max_length": Param("integer", True, minimum=1), "iops_rd": Param("integer", True), "iops_rd_max": Param("integer", True), "iops_rd_max_length": Param("integer", True, minimum=1), "iops_wr": Param("integer", True), "iops_wr_max": Param("integer", True), "iops_wr_max_length": Param("integer", True, minimum=1), "mbps": Param("number", True), "mbps_max": Param("number", True), "mbps_rd": Param("number", True), "mbps_rd_max": Param("number", True), "mbps_wr": Param("number", True), "mbps_wr_max": Param("number", True), "media": Param("string", True, ("cdrom", "disk")), "model": Param("string", True, format="urlencoded"), "replicate": Param("boolean", True), "rerror": Param("string", True, ("ignore", "report", "stop")), "serial": Param("string", True, format="urlencoded"), "shared": Param("boolean", True), "size": Param("string", True, format="disk-size"), "snapshot": Param("boolean", True), "ssd": Param("boolean", True), "werror": Param("string", True, ("enospc", "ignore", "report", "stop")), "wwn": Param("string", True)}, default_key="file", aliases={"bps_rd_length": "bps_rd_max_length", "bps_wr_length": "bps_wr_max_length", "iops_rd_length": "iops_rd_max_length", "iops_wr_length": "iops_wr_max_length", "volume": "file"})
+_Format_f128b0c0ae29 = Format({"name": Param("string", True), "size": Param("integer", False, minimum=1)})
+_Format_05997f1cf757 = Format({"aw-bits": Param("number", True, minimum=32, maximum=64), "enable-s3": Param("boolean", True), "enable-s4": Param("boolean", True), "type": Param("string", True), "viommu": Param("string", True, ("intel", "virtio"))}, default_key="type")
+_Format_eb5881d59e6c = Format({"current": Param("integer", False, minimum=16)}, default_key="current")
+_Format_45e0564941fb = Format({"bridge": Param("string", True, format="pve-bridge-id"), "firewall": Param("boolean", True), "link_down": Param("boolean", True), "macaddr": Param("string", True, format="mac-addr"), "model": Param("string", False, ("e1000", "e1000-82540em", "e1000-82544gc", "e1000-82545em", "e1000e", "i82551", "i82557b", "i82559er", "ne2k_isa", "ne2k_pci", "pcnet", "rtl8139", "virtio", "vmxnet3")), "mtu": Param("integer", True, minimum=1, maximum=65520), "queues": Param("integer", True, minimum=0, maximum=64), "rate": Param("number", True, minimum=0), "tag": Param("integer", True, minimum=1, maximum=4094), "trunks": Param("string", True)}, default_key="model", aliases={"e1000": "macaddr", "e1000-82540em": "macaddr", "e1000-82544gc": "macaddr", "e1000-82545em": "macaddr", "e1000e": "macaddr", "i82551": "macaddr", "i82557b": "macaddr", "i82559er": "macaddr", "ne2k_isa": "macaddr", "ne2k_pci": "macaddr", "pcnet": "macaddr", "rtl8139": "macaddr", "virtio": "macaddr", "vmxnet3": "macaddr"}, key_aliases={"e1000": "model", "e1000-82540em": "model", "e1000-82544gc": "model", "e1000-82545em": "model", "e1000e": "model", "i82551": "model", "i82557b": "model", "i82559er": "model", "ne2k_isa": "model", "ne2k_pci": "model", "pcnet": "model", "rtl8139": "model", "virtio": "model", "vmxnet3": "model"})
+_Format_70e536457672 = Format({"cpus": Param("string", False), "hostnodes": Param("string", True), "memory": Param("number", True), "policy": Param("string", True, ("preferred", "bind", "interleave"))})
+_Format_5ea14c1db33a = Format({"aio": Param("string", True, ("native", "threads", "io_uring")), "backup": Param("boolean", True), "bps": Param("integer", True), "bps_max_length": Param("integer", True, minimum=1), "bps_rd": Param("integer", True), "bps_rd_max_length": Param("integer", True, minimum=1), "bps_wr": Param("integer", True), "bps_wr_max_length": Param("integer", True, minimum=1), "cache": Param("string", True, ("none", "writethrough", "writeback", "unsafe", "directsync")), "detect_zeroes": Param("boolean", True), "discard": Param("string", True, ("ignore", "on")), "file": Param("string", False, format="pve-volume-id-or-qm-path"), "format": Param("string", True, ("raw", "qcow", "qed", "qcow2", "vmdk", "cloop")), "import-from": Param("string", True, format="pve-volume-id-or-absolute-path"), "iops": Param("integer", True), "iops_max": Param("integer", True), "iops_max_length": Param("integer", True, minimum=1), "iops_rd": Param("integer", True), "iops_rd_max": Param("integer", True), "iops_rd_max_length": Param("integer", True, minimum=1), "iops_wr": Param("integer", True), "iops_wr_max": Param("integer", True), "iops_wr_max_length": Param("integer", True, minimum=1), "mbps": Param("number", True), "mbps_max": Param("number", True), "mbps_rd": Param("number", True), "mbps_rd_max": Param("number", True), "mbps_wr": Param("number", True), "mbps_wr_max": Param("number", True), "media": Param("string", True, ("cdrom", "disk")), "replicate": Param("boolean", True), "rerror": Param("string", True, ("ignore", "report", "stop")), "serial": Param("string", True, format="urlencoded"), "shared": Param("boolean", True), "size": Param("string", True, format="disk-size"), "snapshot": Param("boolean", True), "ssd": Param("boolean", True), "werror": Param("string", True, ("enospc", "ignore", "report", "stop")), "wwn": Param("string", True)}, default_key="file", aliases={"bps_rd_length": "bps_rd_max_length", "bps_wr_length": "bps_wr_max_length", "iops_rd_length": "iops_rd_max_length", "iops_wr_length": "iops_wr_max_length", "volume": "file"})
+_Format_f1d16f8e5e26 = Format({"aio": Param("string", True, ("native", "threads", "io_uring")), "backup": Param("boolean", True), "bps": Param("integer", True), "bps_max_length": Param("integer", True, minimum=1), "bps_rd": Param("integer", True), "bps_rd_max_length": Param("integer", True, minimum=1), "bps_wr": Param("integer", True), "bps_wr_max_length": Param("integer", True, minimum=1), "cache": Param("string", True, ("none", "writethrough", "writeback", "unsafe", "directsync")), "detect_zeroes": Param("boolean", True), "discard": Param("string", True, ("ignore", "on")), "file": Param("string", False, format="pve-volume-id-or-qm-path"), "format": Param("string", True, ("raw", "qcow", "qed", "qcow2", "vmdk", "cloop")), "import-from": Param("string", True, format="pve-volume-id-or-absolute-path"), "iops": Param("integer", True), "iops_max": Param("integer", True), "iops_max_length": Param("integer", True, minimum=1), "iops_rd": Param("integer", True), "iops_rd_max": Param("integer", True), "iops_rd_max_length": Param("integer", True, minimum=1), "iops_wr": Param("integer", True), "iops_wr_max": Param("integer", True), "iops_wr_max_length": Param("integer", True, minimum=1), "iothread": Param("boolean", True), "mbps": Param("number", True), "mbps_max": Param("number", True), "mbps_rd": Param("number", True), "mbps_rd_max": Param("number", True), "mbps_wr": Param("number", True), "mbps_wr_max": Param("number", True), "media": Param("string", True, ("cdrom", "disk")), "product": Param("string", True), "queues": Param("integer", True, minimum=2), "replicate": Param("boolean", True), "rerror": Param("string", True, ("ignore", "report", "stop")), "ro": Param("boolean", True), "scsiblock": Param("boolean", True), "serial": Param("string", True, format="urlencoded"), "shared": Param("boolean", True), "size": Param("string", True, format="disk-size"), "snapshot": Param("boolean", True), "ssd": Param("boolean", True), "vendor": Param("string", True), "werror": Param("string", True, ("enospc", "ignore", "report", "stop")), "wwn": Param("string", True)}, default_key="file", aliases={"bps_rd_length": "bps_rd_max_length", "bps_wr_length": "bps_wr_max_length", "iops_rd_length": "iops_rd_max_length", "iops_wr_length": "iops_wr_max_length", "volume": "file"})
+_Format_48429e484440 = Format({"foldersharing": Param("boolean", True), "videostreaming": Param("string", True, ("off", "all", "filter"))})
+_Format_f07abab5c0f3 = Format({"file": Param("string", False, format="pve-volume-id-or-qm-path"), "format": Param("string", True, ("raw", "qcow2", "vmdk")), "import-from": Param("string", True, format="pve-volume-id-or-absolute-path"), "size": Param("string", True, format="disk-size"), "version": Param("string", True, ("v1.2", "v2.0"))}, default_key="file", aliases={"volume": "file"})
+_Format_b246298cf105 = Format({"file": Param("string", False, format="pve-volume-id")}, default_key="file", aliases={"volume": "file"})
+_Format_9579881278db = Format({"host": Param("string", True), "mapping": Param("string", True, format="pve-configid"), "usb3": Param("boolean", True)}, default_key="host")
+_Format_dfe079e3b54a = Format({"clipboard": Param("string", True, ("vnc",)), "memory": Param("integer", True, minimum=4, maximum=512), "type": Param("string", True, ("cirrus", "qxl", "qxl2", "qxl3", "qxl4", "none", "serial0", "serial1", "serial2", "serial3", "std", "virtio", "virtio-gl", "vmware"))}, default_key="type")
+_Format_99392d93cef5 = Format({"aio": Param("string", True, ("native", "threads", "io_uring")), "backup": Param("boolean", True), "bps": Param("integer", True), "bps_max_length": Param("integer", True, minimum=1), "bps_rd": Param("integer", True), "bps_rd_max_length": Param("integer", True, minimum=1), "bps_wr": Param("integer", True), "bps_wr_max_length": Param("integer", True, minimum=1), "cache": Param("string", True, ("none", "writethrough", "writeback", "unsafe", "directsync")), "detect_zeroes": Param("boolean", True), "discard": Param("string", True, ("ignore", "on")), "file": Param("string", False, format="pve-volume-id-or-qm-path"), "format": Param("string", True, ("raw", "qcow", "qed", "qcow2", "vmdk", "cloop")), "import-from": Param("string", True, format="pve-volume-id-or-absolute-path"), "iops": Param("integer", True), "iops_max": Param("integer", True), "iops_max_length": Param("integer", True, minimum=1), "iops_rd": Param("integer", True), "iops_rd_max": Param("integer", True), "iops_rd_max_length": Param("integer", True, minimum=1), "iops_wr": Param("integer", True), "iops_wr_max": Param("integer", True), "iops_wr_max_length": Param("integer", True, minimum=1), "iothread": Param("boolean", True), "mbps": Param("number", True), "mbps_max": Param("number", True), "mbps_rd": Param("number", True), "mbps_rd_max": Param("number", True), "mbps_wr": Param("number", True), "mbps_wr_max": Param("number", True), "media": Param("string", True, ("cdrom", "disk")), "replicate": Param("boolean", True), "rerror": Param("string", True, ("ignore", "report", "stop")), "ro": Param("boolean", True), "serial": Param("string", True, format="urlencoded"), "shared": Param("boolean", True), "size": Param("string", True, format="disk-size"), "snapshot": Param("boolean", True), "werror": Param("string", True, ("enospc", "ignore", "report", "stop"))}, default_key="file", aliases={"bps_rd_length": "bps_rd_max_length", "bps_wr_length": "bps_wr_max_length", "iops_rd_length": "iops_rd_max_length", "iops_wr_length": "iops_wr_max_length", "volume": "file"})
+_Format_f35c24beeb6a = Format({"cache": Param("string", True, ("auto", "always", "metadata", "never")), "direct-io": Param("boolean", True), "dirid": Param("string", False, format="pve-configid"), "expose-acl": Param("boolean", True), "expose-xattr": Param("boolean", True)}, default_key="dirid")
+_Format_ada839e6a62b = Format({"deny-write": Param("boolean", True), "gid": Param("integer", True, minimum=0), "mode": Param("string", True), "path": Param("string", True, format="pve-lxc-dev-string"), "uid": Param("integer", True, minimum=0)}, default_key="path")
+_Format_07e30db5d3cc = Format({"force_rw_sys": Param("boolean", True), "fuse": Param("boolean", True), "keyctl": Param("boolean", True), "mknod": Param("boolean", True), "mount": Param("string", True), "nesting": Param("boolean", True)})
+_Format_75f1cf30d947 = Format({"acl": Param("boolean", True), "backup": Param("boolean", True), "mountoptions": Param("string", True), "mp": Param("string", False, format="pve-lxc-mp-string"), "quota": Param("boolean", True), "replicate": Param("boolean", True), "ro": Param("boolean", True), "shared": Param("boolean", True), "size": Param("string", True, format="disk-size"), "volume": Param("string", False, format="pve-lxc-mp-string")}, default_key="volume")
+_Format_67f20a71850e = Format({"bridge": Param("string", True), "firewall": Param("boolean", True), "gw": Param("string", True, format="ipv4"), "gw6": Param("string", True, format="ipv6"), "host-managed": Param("boolean", True), "hwaddr": Param("string", True, format="mac-addr"), "ip": Param("string", True, format="pve-ipv4-config"), "ip6": Param("string", True, format="pve-ipv6-config"), "link_down": Param("boolean", True), "mtu": Param("integer", True, minimum=64, maximum=65535), "name": Param("string", False), "rate": Param("number", True), "tag": Param("integer", True, minimum=1, maximum=4094), "trunks": Param("string", True), "type": Param("string", True, ("veth",))})
+_Format_c789790bf4ce = Format({"acl": Param("boolean", True), "mountoptions": Param("string", True), "quota": Param("boolean", True), "replicate": Param("boolean", True), "ro": Param("boolean", True), "shared": Param("boolean", True), "size": Param("string", True, format="disk-size"), "volume": Param("string", False, format="pve-lxc-mp-string")}, default_key="volume")
+_Format_1783c7d3cd22 = Format({"volume": Param("string", False, format="pve-volume-id")}, default_key="volume")
+_Format_200eee0df6dd = Format({"device-class": Param("string", True), "failure-domain": Param("string", True), "k": Param("integer", False, minimum=2), "m": Param("integer", False, minimum=1), "profile": Param("string", True)})
+_Format_a3e76e8265f8 = Format({"data": Param("integer", False, minimum=1), "spares": Param("integer", False, minimum=0)})
+_Format_207345cbb644 = Format({"account": Param("string", True, format="pve-configid"), "domains": Param("string", True, format="pve-acme-domain-list")})
+_Format_6045c7b332f5 = Format({"alias": Param("string", True, format="pve-acme-alias"), "domain": Param("string", False, format="pve-acme-domain"), "plugin": Param("string", True, format="pve-configid")}, default_key="domain")
+_Format_c0a3b57f98cb = Format({"bind-interface": Param("string", True, format="pve-iface"), "broadcast-address": Param("string", True, format="ipv4"), "mac": Param("string", False, format="mac-addr")}, default_key="mac")
+
+ENDPOINTS: dict[str, dict[str, Method]] = {
+    "/cluster": {
+        "GET": Method({}, "array", ()),
+    },
+    "/cluster/replication": {
+        "GET": Method({}, "array", ("comment", "disable", "guest", "id", "jobnum", "rate", "remove_job", "schedule", "source", "target", "type")),
+        "POST": Method({"comment": Param("string", True), "disable": Param("boolean", True), "id": Param("string", False, format="pve-replication-job-id"), "rate": Param("number", True, minimum=1), "remove_job": Param("string", True, ("local", "full")), "schedule": Param("string", True, format="pve-calendar-event", default="*/15"), "source": Param("string", True, format="pve-node"), "target": Param("string", False, format="pve-node"), "type": Param("string", False, ("local",))}, "null", ()),
+    },
+    "/cluster/replication/{id}": {
+        "DELETE": Method({"force": Param("boolean", True, default=0), "id": Param("string", False, format="pve-replication-job-id"), "keep": Param("boolean", True, default=0)}, "null", ()),
+        "GET": Method({"id": Param("string", False, format="pve-replication-job-id")}, "object", ("comment", "digest", "disable", "guest", "id", "jobnum", "rate", "remove_job", "schedule", "source", "target", "type")),
+        "PUT": Method({"comment": Param("string", True), "delete": Param("string", True, format="pve-configid-list"), "digest": Param("string", True), "disable": Param("boolean", True), "id": Param("string", False, format="pve-replication-job-id"), "rate": Param("number", True, minimum=1), "remove_job": Param("string", True, ("local", "full")), "schedule": Param("string", True, format="pve-calendar-event", default="*/15"), "source": Param("string", True, format="pve-node")}, "null", ()),
+    },
+    "/cluster/metrics": {
+        "GET": Method({}, "array", ()),
+    },
+    "/cluster/metrics/server": {
+        "GET": Method({}, "array", ("disable", "id", "port", "server", "type")),
+    },
+    "/cluster/metrics/server/{id}": {
+        "DELETE": Method({"id": Param("string", False, format="pve-configid")}, "null", ()),
+        "GET": Method({"id": Param("string", False, format="pve-configid")}, "object", ()),
+        "POST": Method({"api-path-prefix": Param("string", True), "bucket": Param("string", True), "disable": Param("boolean", True), "id": Param("string", False, format="pve-configid"), "influxdbproto": Param("string", True, ("udp", "http", "https"), default="udp"), "max-body-size": Param("integer", True, minimum=1, default=25000000), "mtu": Param("integer", True, minimum=512, maximum=65536, default=1500), "organization": Param("string", True), "otel-compression": Param("string", True, ("none", "gzip"), default="gzip"), "otel-headers": Param("string", True), "otel-max-body-size": Param("integer", True, minimum=1024, default=10000000), "otel-path": Param("string", True, default="/v1/metrics"), "otel-protocol": Param("string", True, ("http", "https"), default="https"), "otel-resource-attributes": Param("string", True), "otel-timeout": Param("integer", True, minimum=1, maximum=10, default=5), "otel-verify-ssl": Param("boolean", True, default=1), "path": Param("string", True, format="graphite-path"), "port": Param("integer", False, minimum=1, maximum=65536), "proto": Param("string", True, ("udp", "tcp")), "server": Param("string", False, format="address"), "timeout": Param("integer", True, minimum=0, default=1), "token": Param("string", True), "type": Param("string", False, ("graphite", "influxdb", "opentelemetry"), format="pve-configid"), "verify-certificate": Param("boolean", True, default=1)}, "null", ()),
+        "PUT": Method({"api-path-prefix": Param("string", True), "bucket": Param("string", True), "delete": Param("string", True, format="pve-configid-list"), "digest": Param("string", True), "disable": Param("boolean", True), "id": Param("string", False, format="pve-configid"), "influxdbproto": Param("string", True, ("udp", "http", "https"), default="udp"), "max-body-size": Param("integer", True, minimum=1, default=25000000), "mtu": Param("integer", True, minimum=512, maximum=65536, default=1500), "organization": Param("string", True), "otel-compression": Param("string", True, ("none", "gzip"), default="gzip"), "otel-headers": Param("string", True), "otel-max-body-size": Param("integer", True, minimum=1024, default=10000000), "otel-path": Param("string", True, default="/v1/metrics"), "otel-protocol": Param("string", True, ("http", "https"), default="https"), "otel-resource-attributes": Param("string", True), "otel-timeout": Param("integer", True, minimum=1, maximum=10, default=5), "otel-verify-ssl": Param("boolean", True, default=1), "path": Param("string", True, format="graphite-path"), "port": Param("integer", False, minimum=1, maximum=65536), "proto": Param("string", True, ("udp", "tcp")), "server": Param("string", False, format="address"), "timeout": Param("integer", True, minimum=0, default=1), "token": Param("string", True), "verify-certificate": Param("boolean", True, default=1)}, "null", ()),
+    },
+    "/cluster/metrics/export": {
+        "GET": Method({"history": Param("boolean", True, default=0), "local-only": Param("boolean", True, default=0), "node-list": Param("string", True), "start-time": Param("integer", True, default=0)}, "object", ("data",)),
+    },
+    "/cluster/notifications": {
+        "GET": Method({}, "array", ()),
+    },
+    "/cluster/notifications/matcher-fields": {
+        "GET": Method({}, "array", ("name",)),
+    },
+    "/cluster/notifications/matcher-field-values": {
+        "GET": Method({}, "array", ("comment", "field", "value")),
+    },
+    "/cluster/notifications/endpoints": {
+        "GET": Method({}, "array", ()),
+    },
+    "/cluster/notifications/endpoints/sendmail": {
+        "GET": Method({}, "array", ("author", "comment", "disable", "from-address", "mailto", "mailto-user", "name", "origin")),
+        "POST": Method({"author": Param("string", True), "comment": Param("string", True), "disable": Param("boolean", True, default=0), "from-address": Param("string", True), "mailto": Param("array", True), "mailto-user": Param("array", True), "name": Param("string", False, format="pve-configid")}, "null", ()),
+    },
+    "/cluster/notifications/endpoints/sendmail/{name}": {
+        "DELETE": Method({"name": Param("string", False, format="pve-configid")}, "null", ()),
+        "GET": Method({"name": Param("string", False, format="pve-configid")}, "object", ("author", "comment", "digest", "disable", "from-address", "mailto", "mailto-user", "name")),
+        "PUT": Method({"author": Param("string", True), "comment": Param("string", True), "delete": Param("array", True), "digest": Param("string", True), "disable": Param("boolean", True, default=0), "from-address": Param("string", True), "mailto": Param("array", True), "mailto-user": Param("array", True), "name": Param("string", False, format="pve-configid")}, "null", ()),
+    },
+    "/cluster/notifications/endpoints/gotify": {
+        "GET": Method({}, "array", ("comment", "disable", "name", "origin", "server")),
+        "POST": Method({"comment": Param("string", True), "disable": Param("boolean", True, default=0), "name": Param("string", False, format="pve-configid"), "server": Param("string", False), "token": Param("string", False)}, "null", ()),
+    },
+    "/cluster/notifications/endpoints/gotify/{name}": {
+        "DELETE": Method({"name": Param("string", False, format="pve-configid")}, "null", ()),
+        "GET": Method({"name": Param("string", False, format="pve-configid")}, "object", ("comment", "digest", "disable", "name", "server")),
+        "PUT": Method({"comment": Param("string", True), "delete": Param("array", True), "digest": Param("string", True), "disable": Param("boolean", True, default=0), "name": Param("string", False, format="pve-configid"), "server": Param("string", True), "token": Param("string", True)}, "null", ()),
+    },
+    "/cluster/notifications/endpoints/smtp": {
+        "GET": Method({}, "array", ("author", "comment", "disable", "from-address", "mailto", "mailto-user", "mode", "name", "origin", "port", "server", "username")),
+        "POST": Method({"author": Param("string", True), "comment": Param("string", True), "disable": Param("boolean", True, default=0), "from-address": Param("string", False), "mailto": Param("array", True), "mailto-user": Param("array", True), "mode": Param("string", True, ("insecure", "starttls", "tls"), default="tls"), "name": Param("string", False, format="pve-configid"), "password": Param("string", True), "port": Param("integer", True), "server": Param("string", False), "username": Param("string", True)}, "null", ()),
+    },
+    "/cluster/notifications/endpoints/smtp/{name}": {
+        "DELETE": Method({"name": Param("string", False, format="pve-configid")}, "null", ()),
+        "GET": Method({"name": Param("string", False, format="pve-configid")}, "object", ("author", "comment", "digest", "disable", "from-address", "mailto", "mailto-user", "mode", "name", "port", "server", "username")),
+        "PUT": Method({"author": Param("string", True), "comment": Param("string", True), "delete": Param("array", True), "digest": Param("string", True), "disable": Param("boolean", True, default=0), "from-address": Param("string", True), "mailto": Param("array", True), "mailto-user": Param("array", True), "mode": Param("string", True, ("insecure", "starttls", "tls"), default="tls"), "name": Param("string", False, format="pve-configid"), "password": Param("string", True), "port": Param("integer", True), "server": Param("string", True), "username": Param("string", True)}, "null", ()),
+    },
+    "/cluster/notifications/endpoints/webhook": {
+        "GET": Method({}, "array", ("body", "comment", "disable", "header", "method", "name", "origin", "secret", "url")),
+        "POST": Method({"body": Param("string", True), "comment": Param("string", True), "disable": Param("boolean", True, default=0), "header": Param("array", True), "method": Param("string", False, ("post", "put", "get")), "name": Param("string", False, format="pve-configid"), "secret": Param("array", True), "url": Param("string", False)}, "null", ()),
+    },
+    "/cluster/notifications/endpoints/webhook/{name}": {
+        "DELETE": Method({"name": Param("string", False, format="pve-configid")}, "null", ()),
+        "GET": Method({"name": Param("string", False, format="pve-configid")}, "object", ("body", "comment", "digest", "disable", "header", "method", "name", "secret", "url")),
+        "PUT": Method({"body": Param("string", True), "comment": Param("string", True), "delete": Param("array", True), "digest": Param("string", True), "disable": Param("boolean", True, default=0), "header": Param("array", True), "method": Param("string", True, ("post", "put", "get")), "name": Param("string", False, format="pve-configid"), "secret": Param("array", True), "url": Param("string", True)}, "null", ()),
+    },
+    "/cluster/notifications/targets": {
+        "GET": Method({}, "array", ("comment", "disable", "name", "origin", "type")),
+    },
+    "/cluster/notifications/targets/{name}/test": {
+        "POST": Method({"name": Param("string", False, format="pve-configid")}, "null", ()),
+    },
+    "/cluster/notifications/matchers": {
+        "GET": Method({}, "array", ("comment", "disable", "invert-match", "match-calendar", "match-field", "match-severity", "mode", "name", "origin", "target")),
+        "POST": Method({"comment": Param("string", True), "disable": Param("boolean", True, default=0), "invert-match": Param("boolean", True), "match-calendar": Param("array", True), "match-field": Param("array", True), "match-severity": Param("array", True), "mode": Param("string", True, ("all", "any"), default="all"), "name": Param("string", False, format="pve-configid"), "target": Param("array", True)}, "null", ()),
+    },
+    "/cluster/notifications/matchers/{name}": {
+        "DELETE": Method({"name": Param("string", False, format="pve-configid")}, "null", ()),
+        "GET": Method({"name": Param("string", False, format="pve-configid")}, "object", ("comment", "digest", "disable", "invert-match", "match-calendar", "match-field", "match-severity", "mode", "name", "target")),
+        "PUT": Method({"comment": Param("string", True), "delete": Param("array", True), "digest": Param("string", True), "disable": Param("boolean", True, default=0), "invert-match": Param("boolean", True), "match-calendar": Param("array", True), "match-field": Param("array", True), "match-severity": Param("array", True), "mode": Param("string", True, ("all", "any"), default="all"), "name": Param("string", False, format="pve-configid"), "target": Param("array", True)}, "null", ()),
+    },
+    "/cluster/config": {
+        "GET": Method({}, "array", ()),
+        "POST": Method({"clustername": Param("string", False, format="pve-node"), "link[n]": Param("string", True, format=_Format_0b3dddebc23a), "nodeid": Param("integer", True, minimum=1), "votes": Param("integer", True, minimum=1)}, "string", ()),
+    },
+    "/cluster/config/apiversion": {
+        "GET": Method({}, "integer", ()),
+    },
+    "/cluster/config/nodes": {
+        "GET": Method({}, "array", ("node",)),
+    },
+    "/cluster/config/nodes/{node}": {
+        "DELETE": Method({"node": Param("string", False, format="pve-node")}, "null", ()),
+        "POST": Method({"apiversion": Param("integer", True), "force": Param("boolean", True), "link[n]": Param("string", True, format=_Format_0b3dddebc23a), "new_node_ip": Param("string", True, format="ip"), "node": Param("string", False, format="pve-node"), "nodeid": Param("integer", True, minimum=1), "votes": Param("integer", True, minimum=0)}, "object", ("corosync_authkey", "corosync_conf", "warnings")),
+    },
+    "/cluster/config/join": {
+        "GET": Method({"node": Param("string", True, format="pve-node", default="current connected node")}, "object", ("config_digest", "nodelist", "preferred_node", "totem")),
+        "POST": Method({"fingerprint": Param("string", False), "force": Param("boolean", True), "hostname": Param("string", False), "link[n]": Param("string", True, format=_Format_0b3dddebc23a), "nodeid": Param("integer", True, minimum=1), "password": Param("string", False), "votes": Param("integer", True, minimum=0)}, "string", ()),
+    },
+    "/cluster/config/totem": {
+        "GET": Method({}, "object", ()),
+    },
+    "/cluster/config/qdevice": {
+        "GET": Method({}, "object", ()),
+    },
+    "/cluster/firewall": {
+        "GET": Method({}, "array", ()),
+    },
+    "/cluster/firewall/groups": {
+        "GET": Method({}, "array", ("comment", "digest", "group")),
+        "POST": Method({"comment": Param("string", True), "digest": Param("string", True), "group": Param("string", False), "rename": Param("string", True)}, "null", ()),
+    },
+    "/cluster/firewall/groups/{group}": {
+        "DELETE": Method({"group": Param("string", False)}, "null", ()),
+        "GET": Method({"group": Param("string", False)}, "array", ("action", "comment", "dest", "dport", "enable", "icmp-type", "iface", "ipversion", "log", "macro", "pos", "proto", "source", "sport", "type")),
+        "POST": Method({"action": Param("string", False), "comment": Param("string", True), "dest": Param("string", True, format="pve-fw-addr-spec"), "digest": Param("string", True), "dport": Param("string", True, format="pve-fw-dport-spec"), "enable": Param("integer", True, minimum=0), "group": Param("string", False), "icmp-type": Param("string", True, format="pve-fw-icmp-type-spec"), "iface": Param("string", True, format="pve-iface"), "log": Param("string", True, ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog")), "macro": Param("string", True), "pos": Param("integer", True, minimum=0), "proto": Param("string", True, format="pve-fw-protocol-spec"), "source": Param("string", True, format="pve-fw-addr-spec"), "sport": Param("string", True, format="pve-fw-sport-spec"), "type": Param("string", False, ("in", "out", "forward", "group"))}, "null", ()),
+    },
+    "/cluster/firewall/groups/{group}/{pos}": {
+        "DELETE": Method({"digest": Param("string", True), "group": Param("string", False), "pos": Param("integer", True, minimum=0)}, "null", ()),
+        "GET": Method({"group": Param("string", False), "pos": Param("integer", True, minimum=0)}, "object", ("action", "comment", "dest", "dport", "enable", "icmp-type", "iface", "ipversion", "log", "macro", "pos", "proto", "source", "sport", "type")),
+        "PUT": Method({"action": Param("string", True), "comment": Param("string", True), "delete": Param("string", True, format="pve-configid-list"), "dest": Param("string", True, format="pve-fw-addr-spec"), "digest": Param("string", True), "dport": Param("string", True, format="pve-fw-dport-spec"), "enable": Param("integer", True, minimum=0), "group": Param("string", False), "icmp-type": Param("string", True, format="pve-fw-icmp-type-spec"), "iface": Param("string", True, format="pve-iface"), "log": Param("string", True, ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog")), "macro": Param("string", True), "moveto": Param("integer", True, minimum=0), "pos": Param("integer", True, minimum=0), "proto": Param("string", True, format="pve-fw-protocol-spec"), "source": Param("string", True, format="pve-fw-addr-spec"), "sport": Param("string", True, format="pve-fw-sport-spec"), "type": Param("string", True, ("in", "out", "forward", "group"))}, "null", ()),
+    },
+    "/cluster/firewall/rules": {
+        "GET": Method({}, "array", ("action", "comment", "dest", "dport", "enable", "icmp-type", "iface", "ipversion", "log", "macro", "pos", "proto", "source", "sport", "type")),
+        "POST": Method({"action": Param("string", False), "comment": Param("string", True), "dest": Param("string", True, format="pve-fw-addr-spec"), "digest": Param("string", True), "dport": Param("string", True, format="pve-fw-dport-spec"), "enable": Param("integer", True, minimum=0), "icmp-type": Param("string", True, format="pve-fw-icmp-type-spec"), "iface": Param("string", True, format="pve-iface"), "log": Param("string", True, ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog")), "macro": Param("string", True), "pos": Param("integer", True, minimum=0), "proto": Param("string", True, format="pve-fw-protocol-spec"), "source": Param("string", True, format="pve-fw-addr-spec"), "sport": Param("string", True, format="pve-fw-sport-spec"), "type": Param("string", False, ("in", "out", "forward", "group"))}, "null", ()),
+    },
+    "/cluster/firewall/rules/{pos}": {
+        "DELETE": Method({"digest": Param("string", True), "pos": Param("integer", True, minimum=0)}, "null", ()),
+        "GET": Method({"pos": Param("integer", True, minimum=0)}, "object", ("action", "comment", "dest", "dport", "enable", "icmp-type", "iface", "ipversion", "log", "macro", "pos", "proto", "source", "sport", "type")),
+        "PUT": Method({"action": Param("string", True), "comment": Param("string", True), "delete": Param("string", True, format="pve-configid-list"), "dest": Param("string", True, format="pve-fw-addr-spec"), "digest": Param("string", True), "dport": Param("string", True, format="pve-fw-dport-spec"), "enable": Param("integer", True, minimum=0), "icmp-type": Param("string", True, format="pve-fw-icmp-type-spec"), "iface": Param("string", True, format="pve-iface"), "log": Param("string", True, ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog")), "macro": Param("string", True), "moveto": Param("integer", True, minimum=0), "pos": Param("integer", True, minimum=0), "proto": Param("string", True, format="pve-fw-protocol-spec"), "source": Param("string", True, format="pve-fw-addr-spec"), "sport": Param("string", True, format="pve-fw-sport-spec"), "type": Param("string", True, ("in", "out", "forward", "group"))}, "null", ()),
+    },
+    "/cluster/firewall/ipset": {
+        "GET": Method({}, "array", ("comment", "digest", "name")),
+        "POST": Method({"comment": Param("string", True), "digest": Param("string", True), "name": Param("string", False), "rename": Param("string", True)}, "null", ()),
+    },
+    "/cluster/firewall/ipset/{name}": {
+        "DELETE": Method({"force": Param("boolean", True), "name": Param("string", False)}, "null", ()),
+        "GET": Method({"name": Param("string", False)}, "array", ("cidr", "comment", "digest", "nomatch")),
+        "POST": Method({"cidr": Param("string", False, format="IPorCIDRorAlias"), "comment": Param("string", True), "name": Param("string", False), "nomatch": Param("boolean", True)}, "null", ()),
+    },
+    "/cluster/firewall/ipset/{name}/{cidr}": {
+        "DELETE": Method({"cidr": Param("string", False, format="IPorCIDRorAlias"), "digest": Param("string", True), "name": Param("string", False)}, "null", ()),
+        "GET": Method({"cidr": Param("string", False, format="IPorCIDRorAlias"), "name": Param("string", False)}, "object", ()),
+        "PUT": Method({"cidr": Param("string", False, format="IPorCIDRorAlias"), "comment": Param("string", True), "digest": Param("string", True), "name": Param("string", False), "nomatch": Param("boolean", True)}, "null", ()),
+    },
+    "/cluster/firewall/aliases": {
+        "GET": Method({}, "array", ("cidr", "comment", "digest", "name")),
+        "POST": Method({"cidr": Param("string", False, format="IPorCIDR"), "comment": Param("string", True), "name": Param("string", False)}, "null", ()),
+    },
+    "/cluster/firewall/aliases/{name}": {
+        "DELETE": Method({"digest": Param("string", True), "name": Param("string", False)}, "null", ()),
+        "GET": Method({"name": Param("string", False)}, "object", ()),
+        "PUT": Method({"cidr": Param("string", False, format="IPorCIDR"), "comment": Param("string", True), "digest": Param("string", True), "name": Param("string", False), "rename": Param("string", True)}, "null", ()),
+    },
+    "/cluster/firewall/options": {
+        "GET": Method({}, "object", ("ebtables", "enable", "log_ratelimit", "policy_forward", "policy_in", "policy_out")),
+        "PUT": Method({"delete": Param("string", True, format="pve-configid-list"), "digest": Param("string", True), "ebtables": Param("boolean", True, default=1), "enable": Param("integer", True, minimum=0, default=0), "log_ratelimit": Param("string", True, format=_Format_21abd2afdb75), "policy_forward": Param("string", True, ("ACCEPT", "DROP")), "policy_in": Param("string", True, ("ACCEPT", "REJECT", "DROP")), "policy_out": Param("string", True, ("ACCEPT", "REJECT", "DROP"))}, "null", ()),
+    },
+    "/cluster/firewall/macros": {
+        "GET": Method({}, "array", ("descr", "macro")),
+    },
+    "/cluster/firewall/refs": {
+        "GET": Method({"type": Param("string", True, ("alias", "ipset"))}, "array", ("comment", "name", "ref", "scope", "type")),
+    },
+    "/cluster/backup": {
+        "GET": Method({}, "array", ("id",)),
+        "POST": Method({"all": Param("boolean", True, default=0), "bwlimit": Param("integer", True, minimum=0, default=0), "comment": Param("string", True), "compress": Param("string", True, ("0", "1", "gzip", "lzo", "zstd"), default="0"), "dow": Param("string", True, format="pve-day-of-week-list", default="mon,tue,wed,thu,fri,sat,sun"), "dumpdir": Param("string", True), "enabled": Param("boolean", True, default="1"), "exclude": Param("string", True, format="pve-vmid-list"), "exclude-path": Param("array", True), "fleecing": Param("string", True, format="backup-fleecing"), "id": Param("string", True, format="pve-configid"), "ionice": Param("integer", True, minimum=0, maximum=8, default=7), "lockwait": Param("integer", True, minimum=0, default=180), "mailnotification": Param("string", True, ("always", "failure"), default="always"), "mailto": Param("string", True, format="email-or-username-list"), "maxfiles": Param("integer", True, minimum=1), "mode": Param("string", True, ("snapshot", "suspend", "stop"), default="snapshot"), "node": Param("string", True, format="pve-node"), "notes-template": Param("string", True), "notification-mode": Param("string", True, ("auto", "legacy-sendmail", "notification-system"), default="auto"), "pbs-change-detection-mode": Param("string", True, ("legacy", "data", "metadata")), "performance": Param("string", True, format="backup-performance"), "pigz": Param("integer", True, default=0), "pool": Param("string", True), "protected": Param("boolean", True), "prune-backups": Param("string", True, format="prune-backups", default="keep-all=1"), "quiet": Param("boolean", True, default=0), "remove": Param("boolean", True, default=1), "repeat-missed": Param("boolean", True, default=0), "schedule": Param("string", True, format="pve-calendar-event"), "script": Param("string", True), "starttime": Param("string", True), "stdexcludes": Param("boolean", True, default=1), "stop": Param("boolean", True, default=0), "stopwait": Param("integer", True, minimum=0, default=10), "storage": Param("string", True, format="pve-storage-id"), "tmpdir": Param("string", True), "vmid": Param("string", True, format="pve-vmid-list"), "zstd": Param("integer", True, default=1)}, "null", ()),
+    },
+    "/cluster/backup/{id}": {
+        "DELETE": Method({"id": Param("string", False)}, "null", ()),
+        "GET": Method({"id": Param("string", False)}, "object", ()),
+        "PUT": Method({"all": Param("boolean", True, default=0), "bwlimit": Param("integer", True, minimum=0, default=0), "comment": Param("string", True), "compress": Param("string", True, ("0", "1", "gzip", "lzo", "zstd"), default="0"), "delete": Param("string", True, format="pve-configid-list"), "dow": Param("string", True, format="pve-day-of-week-list"), "dumpdir": Param("string", True), "enabled": Param("boolean", True, default="1"), "exclude": Param("string", True, format="pve-vmid-list"), "exclude-path": Param("array", True), "fleecing": Param("string", True, format="backup-fleecing"), "id": Param("string", False), "ionice": Param("integer", True, minimum=0, maximum=8, default=7), "lockwait": Param("integer", True, minimum=0, default=180), "mailnotification": Param("string", True, ("always", "failure"), default="always"), "mailto": Param("string", True, format="email-or-username-list"), "maxfiles": Param("integer", True, minimum=1), "mode": Param("string", True, ("snapshot", "suspend", "stop"), default="snapshot"), "node": Param("string", True, format="pve-node"), "notes-template": Param("string", True), "notification-mode": Param("string", True, ("auto", "legacy-sendmail", "notification-system"), default="auto"), "pbs-change-detection-mode": Param("string", True, ("legacy", "data", "metadata")), "performance": Param("string", True, format="backup-performance"), "pigz": Param("integer", True, default=0), "pool": Param("string", True), "protected": Param("boolean", True), "prune-backups": Param("string", True, format="prune-backups", default="keep-all=1"), "quiet": Param("boolean", True, default=0), "remove": Param("boolean", True, default=1), "repeat-missed": Param("boolean", True, default=0), "schedule": Param("string", True, format="pve-calendar-event"), "script": Param("string", True), "starttime": Param("string", True), "stdexcludes": Param("boolean", True, default=1), "stop": Param("boolean", True, default=0), "stopwait": Param("integer", True, minimum=0, default=10), "storage": Param("string", True, format="pve-storage-id"), "tmpdir": Param("string", True), "vmid": Param("string", True, format="pve-vmid-list"), "zstd": Param("integer", True, default=1)}, "null", ()),
+    },
+    "/cluster/backup/{id}/included_volumes": {
+        "GET": Method({"id": Param("string", False)}, "object", ("children",)),
+    },
+    "/cluster/backup-info": {
+        "GET": Method({}, "array", ("subdir",)),
+    },
+    "/cluster/backup-info/not-backed-up": {
+        "GET": Method({}, "array", ("name", "type", "vmid")),
+    },
+    "/cluster/ha": {
+        "GET": Method({}, "array", ("id",)),
+    },
+    "/cluster/ha/resources": {
+        "GET": Method({"type": Param("string", True, ("ct", "vm"))}, "array", ("sid",)),
+        "POST": Method({"comment": Param("string", True), "failback": Param("boolean", True, default=1), "group": Param("string", True, format="pve-configid"), "max_relocate": Param("integer", True, minimum=0, default=1), "max_restart": Param("integer", True, minimum=0, default=1), "sid": Param("string", False, format="pve-ha-resource-or-vm-id"), "state": Param("string", True, ("started", "stopped", "enabled", "disabled", "ignored"), default="started"), "type": Param("string", True, ("ct", "vm"))}, "null", ()),
+    },
+    "/cluster/ha/resources/{sid}": {
+        "DELETE": Method({"purge": Param("boolean", True, default=1), "sid": Param("string", False, format="pve-ha-resource-or-vm-id")}, "null", ()),
+        "GET": Method({"sid": Param("string", False, format="pve-ha-resource-or-vm-id")}, "object", ("comment", "digest", "failback", "group", "max_relocate", "max_restart", "sid", "state", "type")),
+        "PUT": Method({"comment": Param("string", True), "delete": Param("string", True, format="pve-configid-list"), "digest": Param("string", True), "failback": Param("boolean", True, default=1), "group": Param("string", True, format="pve-configid"), "max_relocate": Param("integer", True, minimum=0, default=1), "max_restart": Param("integer", True, minimum=0, default=1), "sid": Param("string", False, format="pve-ha-resource-or-vm-id"), "state": Param("string", True, ("started", "stopped", "enabled", "disabled", "ignored"), default="started")}, "null", ()),
+    },
+    "/cluster/ha/resources/{sid}/migrate": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "sid": Param("string", False, format="pve-ha-resource-or-vm-id")}, "object", ("blocking-resources", "comigrated-resources", "requested-node", "sid")),
+    },
+    "/cluster/ha/resources/{sid}/relocate": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "sid": Param("string", False, format="pve-ha-resource-or-vm-id")}, "object", ("blocking-resources", "comigrated-resources", "requested-node", "sid")),
+    },
+    "/cluster/ha/groups": {
+        "GET": Method({}, "array", ("group",)),
+        "POST": Method({"comment": Param("string", True), "group": Param("string", False, format="pve-configid"), "nodes": Param("string", False, format="pve-ha-node-list"), "nofailback": Param("boolean", True, default=0), "restricted": Param("boolean", True, default=0), "type": Param("string", True, ("group",))}, "null", ()),
+    },
+    "/cluster/ha/groups/{group}": {
+        "DELETE": Method({"group": Param("string", False, format="pve-configid")}, "null", ()),
+        "GET": Method({"group": Param("string", False, format="pve-configid")}, "object", ()),
+        "PUT": Method({"comment": Param("string", True), "delete": Param("string", True, format="pve-configid-list"), "digest": Param("string", True), "group": Param("string", False, format="pve-configid"), "nodes": Param("string", True, format="pve-ha-node-list"), "nofailback": Param("boolean", True, default=0), "restricted": Param("boolean", True, default=0)}, "null", ()),
+    },
+    "/cluster/ha/rules": {
+        "GET": Method({"resource": Param("string", True), "type": Param("string", True, ("node-affinity", "resource-affinity"))}, "array", ("rule", "affinity", "disable", "strict", "nodes", "resources", "type")),
+        "POST": Method({"affinity": Param("string", True, ("positive", "negative")), "comment": Param("string", True), "disable": Param("boolean", True), "nodes": Param("string", True, format="pve-ha-node-list"), "resources": Param("string", False, format="pve-ha-resource-id-list"), "rule": Param("string", False, format="pve-configid"), "strict": Param("boolean", True, default=0), "type": Param("string", False, ("node-affinity", "resource-affinity"))}, "null", ()),
+    },
+    "/cluster/ha/rules/{rule}": {
+        "DELETE": Method({"rule": Param("string", False, format="pve-configid")}, "null", ()),
+        "GET": Method({"rule": Param("string", False, format="pve-configid")}, "object", ("rule", "type")),
+        "PUT": Method({"affinity": Param("string", True, ("positive", "negative")), "comment": Param("string", True), "delete": Param("string", True, format="pve-configid-list"), "digest": Param("string", True), "disable": Param("boolean", True), "nodes": Param("string", True, format="pve-ha-node-list"), "resources": Param("string", True, format="pve-ha-resource-id-list"), "rule": Param("string", False, format="pve-configid"), "strict": Param("boolean", True, default=0), "type": Param("string", False, ("node-affinity", "resource-affinity"))}, "null", ()),
+    },
+    "/cluster/ha/status": {
+        "GET": Method({}, "array", ()),
+    },
+    "/cluster/ha/status/current": {
+        "GET": Method({}, "array", ("crm_state", "failback", "id", "max_relocate", "max_restart", "node", "quorate", "request_state", "sid", "state", "status", "timestamp", "type")),
+    },
+    "/cluster/ha/status/manager_status": {
+        "GET": Method({}, "object", ()),
+    },
+    "/cluster/acme": {
+        "GET": Method({}, "array", ()),
+    },
+    "/cluster/acme/plugins": {
+        "GET": Method({"type": Param("string", True, ("dns", "standalone"))}, "array", ("api", "data", "digest", "disable", "nodes", "plugin", "type", "validation-delay")),
+        "POST": Method({"api": Param("string", True, ("1984hosting", "acmedns", "acmeproxy", "active24", "ad", "ali", "alviy", "anx", "artfiles", "arvan", "aurora", "autodns", "aws", "azion", "azure", "beget", "bookmyname", "bunny", "cf", "clouddns", "cloudns", "cn", "conoha", "constellix", "cpanel", "curanet", "cyon", "da", "ddnss", "desec", "df", "dgon", "dnsexit", "dnshome", "dnsimple", "dnsservices", "doapi", "domeneshop", "dp", "dpi", "dreamhost", "duckdns", "durabledns", "dyn", "dynu", "dynv6", "easydns", "edgecenter", "edgedns", "euserv", "exoscale", "fornex", "freedns", "freemyip", "gandi_livedns", "gcloud", "gcore", "gd", "geoscaling", "googledomains", "he", "he_ddns", "hetzner", "hexonet", "hostingde", "huaweicloud", "infoblox", "infomaniak", "internetbs", "inwx", "ionos", "ionos_cloud", "ipv64", "ispconfig", "jd", "joker", "kappernet", "kas", "kinghost", "knot", "la", "leaseweb", "lexicon", "limacity", "linode", "linode_v4", "loopia", "lua", "maradns", "me", "miab", "mijnhost", "misaka", "myapi", "mydevil", "mydnsjp", "mythic_beasts", "namecheap", "namecom", "namesilo", "nanelo", "nederhost", "neodigit", "netcup", "netlify", "nic", "njalla", "nm", "nsd", "nsone", "nsupdate", "nw", "oci", "omglol", "one", "online", "openprovider", "openstack", "opnsense", "ovh", "pdns", "pleskxml", "pointhq", "porkbun", "rackcorp", "rackspace", "rage4", "rcode0", "regru", "scaleway", "schlundtech", "selectel", "selfhost", "servercow", "simply", "technitium", "tele3", "tencent", "timeweb", "transip", "udr", "ultra", "unoeuro", "variomedia", "veesp", "vercel", "vscale", "vultr", "websupport", "west_cn", "world4you", "yandex360", "yc", "zilore", "zone", "zoneedit", "zonomi")), "data": Param("string", True), "disable": Param("boolean", True), "id": Param("string", False, format="pve-configid"), "nodes": Param("string", True, format="pve-node-list"), "type": Param("string", False, ("dns", "standalone")), "validation-delay": Param("integer", True, minimum=0, maximum=172800, default=30)}, "null", ()),
+    },
+    "/cluster/acme/plugins/{id}": {
+        "DELETE": Method({"id": Param("string", False, format="pve-configid")}, "null", ()),
+        "GET": Method({"id": Param("string", False, format="pve-configid")}, "object", ("api", "data", "digest", "disable", "nodes", "plugin", "type", "validation-delay")),
+        "PUT": Method({"api": Param("string", True, ("1984hosting", "acmedns", "acmeproxy", "active24", "ad", "ali", "alviy", "anx", "artfiles", "arvan", "aurora", "autodns", "aws", "azion", "azure", "beget", "bookmyname", "bunny", "cf", "clouddns", "cloudns", "cn", "conoha", "constellix", "cpanel", "curanet", "cyon", "da", "ddnss", "desec", "df", "dgon", "dnsexit", "dnshome", "dnsimple", "dnsservices", "doapi", "domeneshop", "dp", "dpi", "dreamhost", "duckdns", "durabledns", "dyn", "dynu", "dynv6", "easydns", "edgecenter", "edgedns", "euserv", "exoscale", "fornex", "freedns", "freemyip", "gandi_livedns", "gcloud", "gcore", "gd", "geoscaling", "googledomains", "he", "he_ddns", "hetzner", "hexonet", "hostingde", "huaweicloud", "infoblox", "infomaniak", "internetbs", "inwx", "ionos", "ionos_cloud", "ipv64", "ispconfig", "jd", "joker", "kappernet", "kas", "kinghost", "knot", "la", "leaseweb", "lexicon", "limacity", "linode", "linode_v4", "loopia", "lua", "maradns", "me", "miab", "mijnhost", "misaka", "myapi", "mydevil", "mydnsjp", "mythic_beasts", "namecheap", "namecom", "namesilo", "nanelo", "nederhost", "neodigit", "netcup", "netlify", "nic", "njalla", "nm", "nsd", "nsone", "nsupdate", "nw", "oci", "omglol", "one", "online", "openprovider", "openstack", "opnsense", "ovh", "pdns", "pleskxml", "pointhq", "porkbun", "rackcorp", "rackspace", "rage4", "rcode0", "regru", "scaleway", "schlundtech", "selectel", "selfhost", "servercow", "simply", "technitium", "tele3", "tencent", "timeweb", "transip", "udr", "ultra", "unoeuro", "variomedia", "veesp", "vercel", "vscale", "vultr", "websupport", "west_cn", "world4you", "yandex360", "yc", "zilore", "zone", "zoneedit", "zonomi")), "data": Param("string", True), "delete": Param("string", True, format="pve-configid-list"), "digest": Param("string", True), "disable": Param("boolean", True), "id": Param("string", False, format="pve-configid"), "nodes": Param("string", True, format="pve-node-list"), "validation-delay": Param("integer", True, minimum=0, maximum=172800, default=30)}, "null", ()),
+    },
+    "/cluster/acme/account": {
+        "GET": Method({}, "array", ()),
+        "POST": Method({"contact": Param("string", False, format="email-list"), "directory": Param("string", True, default="https://acme-v02.api.letsencrypt.org/directory"), "eab-hmac-key": Param("string", True), "eab-kid": Param("string", True), "name": Param("string", True, format="pve-configid", default="default"), "tos_url": Param("string", True)}, "string", ()),
+    },
+    "/cluster/acme/account/{name}": {
+        "DELETE": Method({"name": Param("string", True, format="pve-configid", default="default")}, "string", ()),
+        "GET": Method({"name": Param("string", True, format="pve-configid", default="default")}, "object", ("account", "directory", "location", "tos")),
+        "PUT": Method({"contact": Param("string", True, format="email-list"), "name": Param("string", True, format="pve-configid", default="default")}, "string", ()),
+    },
+    "/cluster/acme/tos": {
+        "GET": Method({"directory": Param("string", True, default="https://acme-v02.api.letsencrypt.org/directory")}, "string", ()),
+    },
+    "/cluster/acme/meta": {
+        "GET": Method({"directory": Param("string", True, default="https://acme-v02.api.letsencrypt.org/directory")}, "object", ("caaIdentities", "externalAccountRequired", "termsOfService", "website")),
+    },
+    "/cluster/acme/directories": {
+        "GET": Method({}, "array", ("name", "url")),
+    },
+    "/cluster/acme/challenge-schema": {
+        "GET": Method({}, "array", ("id", "name", "schema", "type")),
+    },
+    "/cluster/ceph": {
+        "GET": Method({}, "array", ()),
+    },
+    "/cluster/ceph/metadata": {
+        "GET": Method({"scope": Param("string", True, ("all", "versions"), default="all")}, "object", ("mds", "mgr", "mon", "node", "osd")),
+    },
+    "/cluster/ceph/status": {
+        "GET": Method({}, "object", ()),
+    },
+    "/cluster/ceph/flags": {
+        "GET": Method({}, "array", ("description", "name", "value")),
+        "PUT": Method({"nobackfill": Param("boolean", True), "nodeep-scrub": Param("boolean", True), "nodown": Param("boolean", True), "noin": Param("boolean", True), "noout": Param("boolean", True), "norebalance": Param("boolean", True), "norecover": Param("boolean", True), "noscrub": Param("boolean", True), "notieragent": Param("boolean", True), "noup": Param("boolean", True), "pause": Param("boolean", True)}, "string", ()),
+    },
+    "/cluster/ceph/flags/{flag}": {
+        "GET": Method({"flag": Param("string", False, ("nobackfill", "nodeep-scrub", "nodown", "noin", "noout", "norebalance", "norecover", "noscrub", "notieragent", "noup", "pause"))}, "boolean", ()),
+        "PUT": Method({"flag": Param("string", False, ("nobackfill", "nodeep-scrub", "nodown", "noin", "noout", "norebalance", "norecover", "noscrub", "notieragent", "noup", "pause")), "value": Param("boolean", False)}, "null", ()),
+    },
+    "/cluster/jobs": {
+        "GET": Method({}, "array", ("subdir",)),
+    },
+    "/cluster/jobs/realm-sync": {
+        "GET": Method({}, "array", ("comment", "enabled", "id", "last-run", "next-run", "realm", "remove-vanished", "schedule", "scope")),
+    },
+    "/cluster/jobs/realm-sync/{id}": {
+        "DELETE": Method({"id": Param("string", False, format="pve-configid")}, "null", ()),
+        "GET": Method({"id": Param("string", False, format="pve-configid")}, "object", ()),
+        "POST": Method({"comment": Param("string", True), "enable-new": Param("boolean", True, default="1"), "enabled": Param("boolean", True, default=1), "id": Param("string", False, format="pve-configid"), "realm": Param("string", True, format="pve-realm"), "remove-vanished": Param("string", True, default="none"), "schedule": Param("string", False, format="pve-calendar-event"), "scope": Param("string", True, ("users", "groups", "both"))}, "null", ()),
+        "PUT": Method({"comment": Param("string", True), "delete": Param("string", True, format="pve-configid-list"), "enable-new": Param("boolean", True, default="1"), "enabled": Param("boolean", True, default=1), "id": Param("string", False, format="pve-configid"), "remove-vanished": Param("string", True, default="none"), "schedule": Param("string", False, format="pve-calendar-event"), "scope": Param("string", True, ("users", "groups", "both"))}, "null", ()),
+    },
+    "/cluster/jobs/schedule-analyze": {
+        "GET": Method({"iterations": Param("integer", True, minimum=1, maximum=100, default=10), "schedule": Param("string", False, format="pve-calendar-event"), "starttime": Param("integer", True)}, "array", ("timestamp", "utc")),
+    },
+    "/cluster/mapping": {
+        "GET": Method({}, "array", ()),
+    },
+    "/cluster/mapping/dir": {
+        "GET": Method({"check-node": Param("string", True, format="pve-node")}, "array", ("checks", "description", "id", "map")),
+        "POST": Method({"description": Param("string", True), "id": Param("string", False, format="pve-configid"), "map": Param("array", False)}, "null", ()),
+    },
+    "/cluster/mapping/dir/{id}": {
+        "DELETE": Method({"id": Param("string", False, format="pve-configid")}, "null", ()),
+        "GET": Method({"id": Param("string", False, format="pve-configid")}, "object", ()),
+        "PUT": Method({"delete": Param("string", True, format="pve-configid-list"), "description": Param("string", True), "digest": Param("string", True), "id": Param("string", False, format="pve-configid"), "map": Param("array", True)}, "null", ()),
+    },
+    "/cluster/mapping/pci": {
+        "GET": Method({"check-node": Param("string", True, format="pve-node")}, "array", ("checks", "description", "id", "map")),
+        "POST": Method({"description": Param("string", True), "id": Param("string", False, format="pve-configid"), "live-migration-capable": Param("boolean", True, default=0), "map": Param("array", False), "mdev": Param("boolean", True, default=0)}, "null", ()),
+    },
+    "/cluster/mapping/pci/{id}": {
+        "DELETE": Method({"id": Param("string", False, format="pve-configid")}, "null", ()),
+        "GET": Method({"id": Param("string", False, format="pve-configid")}, "object", ()),
+        "PUT": Method({"delete": Param("string", True, format="pve-configid-list"), "description": Param("string", True), "digest": Param("string", True), "id": Param("string", False, format="pve-configid"), "live-migration-capable": Param("boolean", True, default=0), "map": Param("array", True), "mdev": Param("boolean", True, default=0)}, "null", ()),
+    },
+    "/cluster/mapping/usb": {
+        "GET": Method({"check-node": Param("string", True, format="pve-node")}, "array", ("description", "error", "id", "map")),
+        "POST": Method({"description": Param("string", True), "id": Param("string", False, format="pve-configid"), "map": Param("array", False)}, "null", ()),
+    },
+    "/cluster/mapping/usb/{id}": {
+        "DELETE": Method({"id": Param("string", False, format="pve-configid")}, "null", ()),
+        "GET": Method({"id": Param("string", False, format="pve-configid")}, "object", ()),
+        "PUT": Method({"delete": Param("string", True, format="pve-configid-list"), "description": Param("string", True), "digest": Param("string", True), "id": Param("string", False, format="pve-configid"), "map": Param("array", False)}, "null", ()),
+    },
+    "/cluster/bulk-action": {
+        "GET": Method({}, "array", ()),
+    },
+    "/cluster/bulk-action/guest": {
+        "GET": Method({}, "array", ()),
+    },
+    "/cluster/bulk-action/guest/start": {
+        "POST": Method({"maxworkers": Param("integer", True, default=1), "timeout": Param("integer", True), "vms": Param("array", True)}, "string", ()),
+    },
+    "/cluster/bulk-action/guest/shutdown": {
+        "POST": Method({"force-stop": Param("boolean", True, default=1), "maxworkers": Param("integer", True, default=1), "timeout": Param("integer", True, default=180), "vms": Param("array", True)}, "string", ()),
+    },
+    "/cluster/bulk-action/guest/suspend": {
+        "POST": Method({"maxworkers": Param("integer", True, default=1), "statestorage": Param("string", True, format="pve-storage-id"), "to-disk": Param("boolean", True, default=0), "vms": Param("array", True)}, "string", ()),
+    },
+    "/cluster/bulk-action/guest/migrate": {
+        "POST": Method({"maxworkers": Param("integer", True, default=1), "online": Param("boolean", True), "target": Param("string", False, format="pve-node"), "vms": Param("array", True), "with-local-disks": Param("boolean", True)}, "string", ()),
+    },
+    "/cluster/sdn": {
+        "GET": Method({}, "array", ("id",)),
+        "PUT": Method({"lock-token": Param("string", True), "release-lock": Param("boolean", True, default=1)}, "string", ()),
+    },
+    "/cluster/sdn/vnets": {
+        "GET": Method({"pending": Param("boolean", True), "running": Param("boolean", True)}, "array", ("alias", "digest", "isolate-ports", "pending", "state", "tag", "type", "vlanaware", "vnet", "zone")),
+        "POST": Method({"alias": Param("string", True), "isolate-ports": Param("boolean", True), "lock-token": Param("string", True), "tag": Param("integer", True, minimum=1, maximum=16777215), "type": Param("string", True, ("vnet",)), "vlanaware": Param("boolean", True), "vnet": Param("string", False, format="pve-sdn-vnet-id"), "zone": Param("string", False)}, "null", ()),
+    },
+    "/cluster/sdn/vnets/{vnet}": {
+        "DELETE": Method({"lock-token": Param("string", True), "vnet": Param("string", False, format="pve-sdn-vnet-id")}, "null", ()),
+        "GET": Method({"pending": Param("boolean", True), "running": Param("boolean", True), "vnet": Param("string", False, format="pve-sdn-vnet-id")}, "object", ("alias", "digest", "isolate-ports", "pending", "state", "tag", "type", "vlanaware", "vnet", "zone")),
+        "PUT": Method({"alias": Param("string", True), "delete": Param("string", True, format="pve-configid-list"), "digest": Param("string", True), "isolate-ports": Param("boolean", True), "lock-token": Param("string", True), "tag": Param("integer", True, minimum=1, maximum=16777215), "vlanaware": Param("boolean", True), "vnet": Param("string", False, format="pve-sdn-vnet-id"), "zone": Param("string", True)}, "null", ()),
+    },
+    "/cluster/sdn/vnets/{vnet}/firewall": {
+        "GET": Method({"vnet": Param("string", False, format="pve-sdn-vnet-id")}, "array", ()),
+    },
+    "/cluster/sdn/vnets/{vnet}/firewall/rules": {
+        "GET": Method({"vnet": Param("string", False, format="pve-sdn-vnet-id")}, "array", ("action", "comment", "dest", "dport", "enable", "icmp-type", "iface", "ipversion", "log", "macro", "pos", "proto", "source", "sport", "type")),
+        "POST": Method({"action": Param("string", False), "comment": Param("string", True), "dest": Param("string", True, format="pve-fw-addr-spec"), "digest": Param("string", True), "dport": Param("string", True, format="pve-fw-dport-spec"), "enable": Param("integer", True, minimum=0), "icmp-type": Param("string", True, format="pve-fw-icmp-type-spec"), "iface": Param("string", True, format="pve-iface"), "log": Param("string", True, ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog")), "macro": Param("string", True), "pos": Param("integer", True, minimum=0), "proto": Param("string", True, format="pve-fw-protocol-spec"), "source": Param("string", True, format="pve-fw-addr-spec"), "sport": Param("string", True, format="pve-fw-sport-spec"), "type": Param("string", False, ("in", "out", "forward", "group")), "vnet": Param("string", False, format="pve-sdn-vnet-id")}, "null", ()),
+    },
+    "/cluster/sdn/vnets/{vnet}/firewall/rules/{pos}": {
+        "DELETE": Method({"digest": Param("string", True), "pos": Param("integer", True, minimum=0), "vnet": Param("string", False, format="pve-sdn-vnet-id")}, "null", ()),
+        "GET": Method({"pos": Param("integer", True, minimum=0), "vnet": Param("string", False, format="pve-sdn-vnet-id")}, "object", ("action", "comment", "dest", "dport", "enable", "icmp-type", "iface", "ipversion", "log", "macro", "pos", "proto", "source", "sport", "type")),
+        "PUT": Method({"action": Param("string", True), "comment": Param("string", True), "delete": Param("string", True, format="pve-configid-list"), "dest": Param("string", True, format="pve-fw-addr-spec"), "digest": Param("string", True), "dport": Param("string", True, format="pve-fw-dport-spec"), "enable": Param("integer", True, minimum=0), "icmp-type": Param("string", True, format="pve-fw-icmp-type-spec"), "iface": Param("string", True, format="pve-iface"), "log": Param("string", True, ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog")), "macro": Param("string", True), "moveto": Param("integer", True, minimum=0), "pos": Param("integer", True, minimum=0), "proto": Param("string", True, format="pve-fw-protocol-spec"), "source": Param("string", True, format="pve-fw-addr-spec"), "sport": Param("string", True, format="pve-fw-sport-spec"), "type": Param("string", True, ("in", "out", "forward", "group")), "vnet": Param("string", False, format="pve-sdn-vnet-id")}, "null", ()),
+    },
+    "/cluster/sdn/vnets/{vnet}/firewall/options": {
+        "GET": Method({"vnet": Param("string", False, format="pve-sdn-vnet-id")}, "object", ("enable", "log_level_forward", "policy_forward")),
+        "PUT": Method({"delete": Param("string", True, format="pve-configid-list"), "digest": Param("string", True), "enable": Param("boolean", True, default=0), "log_level_forward": Param("string", True, ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog")), "policy_forward": Param("string", True, ("ACCEPT", "DROP")), "vnet": Param("string", False, format="pve-sdn-vnet-id")}, "null", ()),
+    },
+    "/cluster/sdn/vnets/{vnet}/subnets": {
+        "GET": Method({"pending": Param("boolean", True), "running": Param("boolean", True), "vnet": Param("string", False, format="pve-sdn-vnet-id")}, "array", ()),
+        "POST": Method({"dhcp-dns-server": Param("string", True, format="ip"), "dhcp-range": Param("array", True), "dnszoneprefix": Param("string", True, format="dns-name"), "gateway": Param("string", True, format="ip"), "lock-token": Param("string", True), "snat": Param("boolean", True), "subnet": Param("string", False, format="pve-sdn-subnet-id"), "type": Param("string", False, ("subnet",)), "vnet": Param("string", False)}, "null", ()),
+    },
+    "/cluster/sdn/vnets/{vnet}/subnets/{subnet}": {
+        "DELETE": Method({"lock-token": Param("string", True), "subnet": Param("string", False, format="pve-sdn-subnet-id"), "vnet": Param("string", False, format="pve-sdn-vnet-id")}, "null", ()),
+        "GET": Method({"pending": Param("boolean", True), "running": Param("boolean", True), "subnet": Param("string", False, format="pve-sdn-subnet-id"), "vnet": Param("string", False, format="pve-sdn-vnet-id")}, "object", ()),
+        "PUT": Method({"delete": Param("string", True, format="pve-configid-list"), "dhcp-dns-server": Param("string", True, format="ip"), "dhcp-range": Param("array", True), "digest": Param("string", True), "dnszoneprefix": Param("string", True, format="dns-name"), "gateway": Param("string", True, format="ip"), "lock-token": Param("string", True), "snat": Param("boolean", True), "subnet": Param("string", False, format="pve-sdn-subnet-id"), "vnet": Param("string", True)}, "null", ()),
+    },
+    "/cluster/sdn/vnets/{vnet}/ips": {
+        "DELETE": Method({"ip": Param("string", False, format="ip"), "mac": Param("string", True, format="mac-addr"), "vnet": Param("string", False, format="pve-sdn-vnet-id"), "zone": Param("string", False, format="pve-sdn-zone-id")}, "null", ()),
+        "POST": Method({"ip": Param("string", False, format="ip"), "mac": Param("string", True, format="mac-addr"), "vnet": Param("string", False, format="pve-sdn-vnet-id"), "zone": Param("string", False, format="pve-sdn-zone-id")}, "null", ()),
+        "PUT": Method({"ip": Param("string", False, format="ip"), "mac": Param("string", True, format="mac-addr"), "vmid": Param("integer", True, minimum=100, maximum=999999999, format="pve-vmid"), "vnet": Param("string", False, format="pve-sdn-vnet-id"), "zone": Param("string", False, format="pve-sdn-zone-id")}, "null", ()),
+    },
+    "/cluster/sdn/zones": {
+        "GET": Method({"pending": Param("boolean", True), "running": Param("boolean", True), "type": Param("string", True, ("evpn", "faucet", "qinq", "simple", "vlan", "vxlan"))}, "array", ("advertise-subnets", "bridge", "bridge-disable-mac-learning", "controller", "dhcp", "digest", "disable-arp-nd-suppression", "dns", "dnszone", "exitnodes", "exitnodes-local-routing", "exitnodes-primary", "ipam", "mac", "mtu", "nodes", "peers", "pending", "reversedns", "rt-import", "state", "tag", "type", "vlan-protocol", "vrf-vxlan", "vxlan-port", "zone")),
+        "POST": Method({"advertise-subnets": Param("boolean", True), "bridge": Param("string", True), "bridge-disable-mac-learning": Param("boolean", True), "controller": Param("string", True), "dhcp": Param("string", True, ("dnsmasq",)), "disable-arp-nd-suppression": Param("boolean", True), "dns": Param("string", True), "dnszone": Param("string", True, format="dns-name"), "dp-id": Param("integer", True), "exitnodes": Param("string", True, format="pve-node-list"), "exitnodes-local-routing": Param("boolean", True), "exitnodes-primary": Param("string", True, format="pve-node"), "fabric": Param("string", True, format="pve-sdn-fabric-id"), "ipam": Param("string", True), "lock-token": Param("string", True), "mac": Param("string", True, format="mac-addr"), "mtu": Param("integer", True), "nodes": Param("string", True, format="pve-node-list"), "peers": Param("string", True, format="ip-list"), "reversedns": Param("string", True), "rt-import": Param("string", True, format="pve-sdn-bgp-rt-list"), "tag": Param("integer", True, minimum=0), "type": Param("string", False, ("evpn", "faucet", "qinq", "simple", "vlan", "vxlan"), format="pve-configid"), "vlan-protocol": Param("string", True, ("802.1q", "802.1ad"), default="802.1q"), "vrf-vxlan": Param("integer", True, minimum=1, maximum=16777215), "vxlan-port": Param("integer", True, minimum=1, maximum=65536, default=4789), "zone": Param("string", False, format="pve-sdn-zone-id")}, "null", ()),
+    },
+    "/cluster/sdn/zones/{zone}": {
+        "DELETE": Method({"lock-token": Param("string", True), "zone": Param("string", False, format="pve-sdn-zone-id")}, "null", ()),
+        "GET": Method({"pending": Param("boolean", True), "running": Param("boolean", True), "zone": Param("string", False, format="pve-sdn-zone-id")}, "object", ("advertise-subnets", "bridge", "bridge-disable-mac-learning", "controller", "dhcp", "digest", "disable-arp-nd-suppression", "dns", "dnszone", "exitnodes", "exitnodes-local-routing", "exitnodes-primary", "ipam", "mac", "mtu", "nodes", "peers", "pending", "reversedns", "rt-import", "state", "tag", "type", "vlan-protocol", "vrf-vxlan", "vxlan-port", "zone")),
+        "PUT": Method({"advertise-subnets": Param("boolean", True), "bridge": Param("string", True), "bridge-disable-mac-learning": Param("boolean", True), "controller": Param("string", True), "delete": Param("string", True, format="pve-configid-list"), "dhcp": Param("string", True, ("dnsmasq",)), "digest": Param("string", True), "disable-arp-nd-suppression": Param("boolean", True), "dns": Param("string", True), "dnszone": Param("string", True, format="dns-name"), "dp-id": Param("integer", True), "exitnodes": Param("string", True, format="pve-node-list"), "exitnodes-local-routing": Param("boolean", True), "exitnodes-primary": Param("string", True, format="pve-node"), "fabric": Param("string", True, format="pve-sdn-fabric-id"), "ipam": Param("string", True), "lock-token": Param("string", True), "mac": Param("string", True, format="mac-addr"), "mtu": Param("integer", True), "nodes": Param("string", True, format="pve-node-list"), "peers": Param("string", True, format="ip-list"), "reversedns": Param("string", True), "rt-import": Param("string", True, format="pve-sdn-bgp-rt-list"), "tag": Param("integer", True, minimum=0), "vlan-protocol": Param("string", True, ("802.1q", "802.1ad"), default="802.1q"), "vrf-vxlan": Param("integer", True, minimum=1, maximum=16777215), "vxlan-port": Param("integer", True, minimum=1, maximum=65536, default=4789), "zone": Param("string", False, format="pve-sdn-zone-id")}, "null", ()),
+    },
+    "/cluster/sdn/controllers": {
+        "GET": Method({"pending": Param("boolean", True), "running": Param("boolean", True), "type": Param("string", True, ("bgp", "evpn", "faucet", "isis"))}, "array", ("asn", "bgp-multipath-as-relax", "controller", "digest", "ebgp", "ebgp-multihop", "isis-domain", "isis-ifaces", "isis-net", "loopback", "node", "peers", "pending", "state", "type")),
+        "POST": Method({"asn": Param("integer", True, minimum=0, maximum=4294967295), "bgp-multipath-as-path-relax": Param("boolean", True), "controller": Param("string", False, format="pve-sdn-controller-id"), "ebgp": Param("boolean", True), "ebgp-multihop": Param("integer", True), "fabric": Param("string", True, format="pve-sdn-fabric-id"), "isis-domain": Param("string", True), "isis-ifaces": Param("string", True, format="pve-iface-list"), "isis-net": Param("string", True, format="pve-sdn-isis-net"), "lock-token": Param("string", True), "loopback": Param("string", True), "node": Param("string", True, format="pve-node"), "peers": Param("string", True, format="ip-list"), "type": Param("string", False, ("bgp", "evpn", "faucet", "isis"), format="pve-configid")}, "null", ()),
+    },
+    "/cluster/sdn/controllers/{controller}": {
+        "DELETE": Method({"controller": Param("string", False, format="pve-sdn-controller-id"), "lock-token": Param("string", True)}, "null", ()),
+        "GET": Method({"controller": Param("string", False, format="pve-sdn-controller-id"), "pending": Param("boolean", True), "running": Param("boolean", True)}, "object", ("asn", "bgp-multipath-as-relax", "controller", "digest", "ebgp", "ebgp-multihop", "isis-domain", "isis-ifaces", "isis-net", "loopback", "node", "peers", "pending", "state", "type")),
+        "PUT": Method({"asn": Param("integer", True, minimum=0, maximum=4294967295), "bgp-multipath-as-path-relax": Param("boolean", True), "controller": Param("string", False, format="pve-sdn-controller-id"), "delete": Param("string", True, format="pve-configid-list"), "digest": Param("string", True), "ebgp": Param("boolean", True), "ebgp-multihop": Param("integer", True), "fabric": Param("string", True, format="pve-sdn-fabric-id"), "isis-domain": Param("string", True), "isis-ifaces": Param("string", True, format="pve-iface-list"), "isis-net": Param("string", True, format="pve-sdn-isis-net"), "lock-token": Param("string", True), "loopback": Param("string", True), "node": Param("string", True, format="pve-node"), "peers": Param("string", True, format="ip-list")}, "null", ()),
+    },
+    "/cluster/sdn/ipams": {
+        "GET": Method({"type": Param("string", True, ("netbox", "phpipam", "pve"))}, "array", ("ipam", "type")),
+        "POST": Method({"fingerprint": Param("string", True), "ipam": Param("string", False, format="pve-sdn-ipam-id"), "lock-token": Param("string", True), "section": Param("integer", True), "token": Param("string", True), "type": Param("string", False, ("netbox", "phpipam", "pve"), format="pve-configid"), "url": Param("string", True)}, "null", ()),
+    },
+    "/cluster/sdn/ipams/{ipam}": {
+        "DELETE": Method({"ipam": Param("string", False, format="pve-sdn-ipam-id"), "lock-token": Param("string", True)}, "null", ()),
+        "GET": Method({"ipam": Param("string", False, format="pve-sdn-ipam-id")}, "object", ()),
+        "PUT": Method({"delete": Param("string", True, format="pve-configid-list"), "digest": Param("string", True), "fingerprint": Param("string", True), "ipam": Param("string", False, format="pve-sdn-ipam-id"), "lock-token": Param("string", True), "section": Param("integer", True), "token": Param("string", True), "url": Param("string", True)}, "null", ()),
+    },
+    "/cluster/sdn/ipams/{ipam}/status": {
+        "GET": Method({"ipam": Param("string", False, format="pve-sdn-ipam-id")}, "array", ()),
+    },
+    "/cluster/sdn/dns": {
+        "GET": Method({"type": Param("string", True, ("powerdns",))}, "array", ("dns", "type")),
+        "POST": Method({"dns": Param("string", False, format="pve-sdn-dns-id"), "fingerprint": Param("string", True), "key": Param("string", False), "lock-token": Param("string", True), "reversemaskv6": Param("integer", True), "reversev6mask": Param("integer", True), "ttl": Param("integer", True), "type": Param("string", False, ("powerdns",), format="pve-configid"), "url": Param("string", False)}, "null", ()),
+    },
+    "/cluster/sdn/dns/{dns}": {
+        "DELETE": Method({"dns": Param("string", False, format="pve-sdn-dns-id"), "lock-token": Param("string", True)}, "null", ()),
+        "GET": Method({"dns": Param("string", False, format="pve-sdn-dns-id")}, "object", ()),
+        "PUT": Method({"delete": Param("string", True, format="pve-configid-list"), "digest": Param("string", True), "dns": Param("string", False, format="pve-sdn-dns-id"), "fingerprint": Param("string", True), "key": Param("string", True), "lock-token": Param("string", True), "reversemaskv6": Param("integer", True), "ttl": Param("integer", True), "url": Param("string", True)}, "null", ()),
+    },
+    "/cluster/sdn/fabrics": {
+        "GET": Method({}, "array", ("subdir",)),
+    },
+    "/cluster/sdn/fabrics/fabric": {
+        "GET": Method({"pending": Param("boolean", True), "running": Param("boolean", True)}, "array", ("area", "csnp_interval", "digest", "hello_interval", "id", "ip6_prefix", "ip_prefix", "lock-token", "protocol")),
+        "POST": Method({"area": Param("string", True), "csnp_interval": Param("number", True, minimum=1, maximum=600), "digest": Param("string", True), "hello_interval": Param("number", True, minimum=1, maximum=600), "id": Param("string", False, format="pve-sdn-fabric-id"), "ip6_prefix": Param("string", True, format="CIDR"), "ip_prefix": Param("string", True, format="CIDR"), "lock-token": Param("string", True), "protocol": Param("string", False, ("openfabric", "ospf"))}, "null", ()),
+    },
+    "/cluster/sdn/fabrics/fabric/{id}": {
+        "DELETE": Method({"id": Param("string", False, format="pve-sdn-fabric-id")}, "null", ()),
+        "GET": Method({"id": Param("string", False, format="pve-sdn-fabric-id")}, "object", ("area", "csnp_interval", "digest", "hello_interval", "id", "ip6_prefix", "ip_prefix", "lock-token", "protocol")),
+        "PUT": Method({"area": Param("string", True), "csnp_interval": Param("number", True, minimum=1, maximum=600), "delete": Param("array", False), "digest": Param("string", True), "hello_interval": Param("number", True, minimum=1, maximum=600), "id": Param("string", False, format="pve-sdn-fabric-id"), "ip6_prefix": Param("string", True, format="CIDR"), "ip_prefix": Param("string", True, format="CIDR"), "lock-token": Param("string", True), "protocol": Param("string", False, ("openfabric", "ospf"))}, "null", ()),
+    },
+    "/cluster/sdn/fabrics/node": {
+        "GET": Method({"pending": Param("boolean", True), "running": Param("boolean", True)}, "array", ("digest", "fabric_id", "interfaces", "ip", "ip6", "lock-token", "node_id", "protocol")),
+    },
+    "/cluster/sdn/fabrics/node/{fabric_id}": {
+        "GET": Method({"fabric_id": Param("string", False, format="pve-sdn-fabric-id"), "pending": Param("boolean", True), "running": Param("boolean", True)}, "array", ("digest", "fabric_id", "interfaces", "ip", "ip6", "lock-token", "node_id", "protocol")),
+        "POST": Method({"digest": Param("string", True), "fabric_id": Param("string", False, format="pve-sdn-fabric-id"), "interfaces": Param("array", False), "ip": Param("string", True, format="ipv4"), "ip6": Param("string", True, format="ipv6"), "lock-token": Param("string", True), "node_id": Param("string", False, format="pve-node"), "protocol": Param("string", False, ("openfabric", "ospf"))}, "null", ()),
+    },
+    "/cluster/sdn/fabrics/node/{fabric_id}/{node_id}": {
+        "DELETE": Method({"fabric_id": Param("string", False, format="pve-sdn-fabric-id"), "node_id": Param("string", False, format="pve-node")}, "null", ()),
+        "GET": Method({"fabric_id": Param("string", False, format="pve-sdn-fabric-id"), "node_id": Param("string", False, format="pve-node")}, "object", ("digest", "fabric_id", "interfaces", "ip", "ip6", "lock-token", "node_id", "protocol")),
+        "PUT": Method({"delete": Param("array", True), "digest": Param("string", True), "fabric_id": Param("string", False, format="pve-sdn-fabric-id"), "interfaces": Param("array", False), "ip": Param("string", True, format="ipv4"), "ip6": Param("string", True, format="ipv6"), "lock-token": Param("string", True), "node_id": Param("string", False, format="pve-node"), "protocol": Param("string", False, ("openfabric", "ospf"))}, "null", ()),
+    },
+    "/cluster/sdn/fabrics/all": {
+        "GET": Method({"pending": Param("boolean", True), "running": Param("boolean", True)}, "object", ("fabrics", "nodes")),
+    },
+    "/cluster/sdn/lock": {
+        "DELETE": Method({"force": Param("boolean", True, default=0), "lock-token": Param("string", True)}, "null", ()),
+        "POST": Method({"allow-pending": Param("boolean", True, default=0)}, "string", ()),
+    },
+    "/cluster/sdn/rollback": {
+        "POST": Method({"lock-token": Param("string", True), "release-lock": Param("boolean", True, default=1)}, "null", ()),
+    },
+    "/cluster/log": {
+        "GET": Method({"max": Param("integer", True, minimum=1)}, "array", ()),
+    },
+    "/cluster/resources": {
+        "GET": Method({"type": Param("string", True, ("vm", "storage", "node", "sdn"))}, "array", ("cgroup-mode", "content", "cpu", "disk", "diskread", "diskwrite", "hastate", "id", "level", "lock", "maxcpu", "maxdisk", "maxmem", "mem", "memhost", "name", "netin", "netout", "network", "network-type", "node", "plugintype", "pool", "protocol", "sdn", "status", "storage", "tags", "template", "type", "uptime", "vmid", "zone-type")),
+    },
+    "/cluster/tasks": {
+        "GET": Method({}, "array", ("upid",)),
+    },
+    "/cluster/options": {
+        "GET": Method({}, "object", ()),
+        "PUT": Method({"bwlimit": Param("string", True, format=_Format_8bb3bf1ec711), "consent-text": Param("string", True), "console": Param("string", True, ("applet", "vv", "html5", "xtermjs")), "crs": Param("string", True, format=_Format_37dc218f6366), "delete": Param("string", True, format="pve-configid-list"), "description": Param("string", True), "email_from": Param("string", True, format="email-opt"), "fencing": Param("string", True, ("watchdog", "hardware", "both"), default="watchdog"), "ha": Param("string", True, format=_Format_edd725523689), "http_proxy": Param("string", True), "keyboard": Param("string", True, ("de", "de-ch", "da", "en-gb", "en-us", "es", "fi", "fr", "fr-be", "fr-ca", "fr-ch", "hu", "is", "it", "ja", "lt", "mk", "nl", "no", "pl", "pt", "pt-br", "sv", "sl", "tr")), "language": Param("string", True, ("ar", "ca", "da", "de", "en", "es", "eu", "fa", "fr", "hr", "he", "it", "ja", "ka", "kr", "nb", "nl", "nn", "pl", "pt_BR", "ru", "sl", "sv", "tr", "ukr", "zh_CN", "zh_TW")), "mac_prefix": Param("string", True, format="mac-prefix", default="BC:24:11"), "max_workers": Param("integer", True, minimum=1), "migration": Param("string", True, format=_Format_f347c5a21bc8), "migration_unsecure": Param("boolean", True), "next-id": Param("string", True, format=_Format_36baeb21d9ac), "notify": Param("string", True, format=_Format_65f9376990eb), "registered-tags": Param("string", True), "replication": Param("string", True, format=_Format_f347c5a21bc8), "tag-style": Param("string", True, format=_Format_a60dd3fdeb12), "u2f": Param("string", True, format=_Format_6aae01081571), "user-tag-access": Param("string", True, format=_Format_376db2d24d5f), "webauthn": Param("string", True, format=_Format_b9da8916ff52)}, "null", ()),
+    },
+    "/cluster/status": {
+        "GET": Method({}, "array", ("id", "ip", "level", "local", "name", "nodeid", "nodes", "online", "quorate", "type", "version")),
+    },
+    "/cluster/nextid": {
+        "GET": Method({"vmid": Param("integer", True, minimum=100, maximum=999999999, format="pve-vmid")}, "integer", ()),
+    },
+    "/nodes": {
+        "GET": Method({}, "array", ("cpu", "level", "maxcpu", "maxmem", "mem", "node", "ssl_fingerprint", "status", "uptime", "disk", "maxdisk")),
+    },
+    "/nodes/{node}": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ()),
+    },
+    "/nodes/{node}/qemu": {
+        "GET": Method({"full": Param("boolean", True), "node": Param("string", False, format="pve-node")}, "array", ("cpu", "cpus", "diskread", "diskwrite", "lock", "maxdisk", "maxmem", "mem", "memhost", "name", "netin", "netout", "pid", "pressurecpufull", "pressurecpusome", "pressureiofull", "pressureiosome", "pressurememoryfull", "pressurememorysome", "qmpstatus", "running-machine", "running-qemu", "serial", "status", "tags", "template", "uptime", "vmid", "disk")),
+        "POST": Method({"acpi": Param("boolean", True, default=1), "affinity": Param("string", True, format="pve-cpuset"), "agent": Param("string", True, format=_Format_23a5bda48b65), "allow-ksm": Param("boolean", True, default=1), "amd-sev": Param("string", True, format="pve-qemu-sev-fmt"), "arch": Param("string", True, ("x86_64", "aarch64")), "archive": Param("string", True), "args": Param("string", True), "audio0": Param("string", True, format=_Format_c5b977836777), "autostart": Param("boolean", True, default=0), "balloon": Param("integer", True, minimum=0), "bios": Param("string", True, ("seabios", "ovmf"), default="seabios"), "boot": Param("string", True, format="pve-qm-boot"), "bootdisk": Param("string", True, format="pve-qm-bootdisk"), "bwlimit": Param("integer", True, minimum=0, default="restore limit from datacenter or storage config"), "cdrom": Param("string", True, format="pve-qm-ide"), "cicustom": Param("string", True, format="pve-qm-cicustom"), "cipassword": Param("string", True), "citype": Param("string", True, ("configdrive2", "nocloud", "opennebula")), "ciupgrade": Param("boolean", True, default=1), "ciuser": Param("string", True), "cores": Param("integer", True, minimum=1, default=1), "cpu": Param("string", True, format="pve-vm-cpu-conf"), "cpulimit": Param("number", True, minimum=0, maximum=128, default=0), "cpuunits": Param("integer", True, minimum=1, maximum=262144, default="cgroup v1: 1024, cgroup v2: 100"), "description": Param("string", True), "efidisk0": Param("string", True, format=_Format_ab8a16165183), "force": Param("boolean", True), "freeze": Param("boolean", True), "ha-managed": Param("boolean", True, default=0), "hookscript": Param("string", True, format="pve-volume-id"), "hostpci[n]": Param("string", True, format="pve-qm-hostpci"), "hotplug": Param("string", True, format="pve-hotplug-features", default="network,disk,usb"), "hugepages": Param("string", True, ("any", "2", "1024")), "ide[n]": Param("string", True, format=_Format_373461a1aea1), "import-working-storage": Param("string", True, format="pve-storage-id"), "intel-tdx": Param("string", True, format="pve-qemu-tdx-fmt"), "ipconfig[n]": Param("string", True, format="pve-qm-ipconfig"), "ivshmem": Param("string", True, format=_Format_f128b0c0ae29), "keephugepages": Param("boolean", True, default=0), "keyboard": Param("string", True, ("de", "de-ch", "da", "en-gb", "en-us", "es", "fi", "fr", "fr-be", "fr-ca", "fr-ch", "hu", "is", "it", "ja", "lt", "mk", "nl", "no", "pl", "pt", "pt-br", "sv", "sl", "tr")), "kvm": Param("boolean", True, default=1), "live-restore": Param("boolean", True), "localtime": Param("boolean", True), "lock": Param("string", True, ("backup", "clone", "create", "migrate", "rollback", "snapshot", "snapshot-delete", "suspending", "suspended")), "machine": Param("string", True, format=_Format_05997f1cf757), "memory": Param("string", True, format=_Format_eb5881d59e6c), "migrate_downtime": Param("number", True, minimum=0, default=0.1), "migrate_speed": Param("integer", True, minimum=0, default=0), "name": Param("string", True, format="dns-name"), "nameserver": Param("string", True, format="address-list"), "net[n]": Param("string", True, format=_Format_45e0564941fb), "node": Param("string", False, format="pve-node"), "numa": Param("boolean", True, default=0), "numa[n]": Param("string", True, format=_Format_70e536457672), "onboot": Param("boolean", True, default=0), "ostype": Param("string", True, ("other", "wxp", "w2k", "w2k3", "w2k8", "wvista", "win7", "win8", "win10", "win11", "l24", "l26", "solaris"), default="other"), "parallel[n]": Param("string", True), "pool": Param("string", True, format="pve-poolid"), "protection": Param("boolean", True, default=0), "reboot": Param("boolean", True, default=1), "rng0": Param("string", True, format="pve-qm-rng"), "sata[n]": Param("string", True, format=_Format_5ea14c1db33a), "scsi[n]": Param("string", True, format=_Format_f1d16f8e5e26), "scsihw": Param("string", True, ("lsi", "lsi53c810", "virtio-scsi-pci", "virtio-scsi-single", "megasas", "pvscsi"), default="lsi"), "searchdomain": Param("string", True), "serial[n]": Param("string", True), "shares": Param("integer", True, minimum=0, maximum=50000, default=1000), "smbios1": Param("string", True, format="pve-qm-smbios1"), "smp": Param("integer", True, minimum=1, default=1), "sockets": Param("integer", True, minimum=1, default=1), "spice_enhancements": Param("string", True, format=_Format_48429e484440), "sshkeys": Param("string", True, format="urlencoded"), "start": Param("boolean", True, default=0), "startdate": Param("string", True, default="now"), "startup": Param("string", True, format="pve-startup-order"), "storage": Param("string", True, format="pve-storage-id"), "tablet": Param("boolean", True, default=1), "tags": Param("string", True, format="pve-tag-list"), "tdf": Param("boolean", True, default=0), "template": Param("boolean", True, default=0), "tpmstate0": Param("string", True, format=_Format_f07abab5c0f3), "unique": Param("boolean", True), "unused[n]": Param("string", True, format=_Format_b246298cf105), "usb[n]": Param("string", True, format=_Format_9579881278db), "vcpus": Param("integer", True, minimum=1, default=0), "vga": Param("string", True, format=_Format_dfe079e3b54a), "virtio[n]": Param("string", True, format=_Format_99392d93cef5), "virtiofs[n]": Param("string", True, format=_Format_f35c24beeb6a), "vmgenid": Param("string", True, default="1 (autogenerated)"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid"), "vmstatestorage": Param("string", True, format="pve-storage-id"), "watchdog": Param("string", True, format="pve-qm-watchdog")}, "string", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}": {
+        "DELETE": Method({"destroy-unreferenced-disks": Param("boolean", True, default=0), "node": Param("string", False, format="pve-node"), "purge": Param("boolean", True), "skiplock": Param("boolean", True), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ("subdir",)),
+    },
+    "/nodes/{node}/qemu/{vmid}/firewall": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/firewall/rules": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ("action", "comment", "dest", "dport", "enable", "icmp-type", "iface", "ipversion", "log", "macro", "pos", "proto", "source", "sport", "type")),
+        "POST": Method({"action": Param("string", False), "comment": Param("string", True), "dest": Param("string", True, format="pve-fw-addr-spec"), "digest": Param("string", True), "dport": Param("string", True, format="pve-fw-dport-spec"), "enable": Param("integer", True, minimum=0), "icmp-type": Param("string", True, format="pve-fw-icmp-type-spec"), "iface": Param("string", True, format="pve-iface"), "log": Param("string", True, ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog")), "macro": Param("string", True), "node": Param("string", False, format="pve-node"), "pos": Param("integer", True, minimum=0), "proto": Param("string", True, format="pve-fw-protocol-spec"), "source": Param("string", True, format="pve-fw-addr-spec"), "sport": Param("string", True, format="pve-fw-sport-spec"), "type": Param("string", False, ("in", "out", "forward", "group")), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/firewall/rules/{pos}": {
+        "DELETE": Method({"digest": Param("string", True), "node": Param("string", False, format="pve-node"), "pos": Param("integer", True, minimum=0), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+        "GET": Method({"node": Param("string", False, format="pve-node"), "pos": Param("integer", True, minimum=0), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ("action", "comment", "dest", "dport", "enable", "icmp-type", "iface", "ipversion", "log", "macro", "pos", "proto", "source", "sport", "type")),
+        "PUT": Method({"action": Param("string", True), "comment": Param("string", True), "delete": Param("string", True, format="pve-configid-list"), "dest": Param("string", True, format="pve-fw-addr-spec"), "digest": Param("string", True), "dport": Param("string", True, format="pve-fw-dport-spec"), "enable": Param("integer", True, minimum=0), "icmp-type": Param("string", True, format="pve-fw-icmp-type-spec"), "iface": Param("string", True, format="pve-iface"), "log": Param("string", True, ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog")), "macro": Param("string", True), "moveto": Param("integer", True, minimum=0), "node": Param("string", False, format="pve-node"), "pos": Param("integer", True, minimum=0), "proto": Param("string", True, format="pve-fw-protocol-spec"), "source": Param("string", True, format="pve-fw-addr-spec"), "sport": Param("string", True, format="pve-fw-sport-spec"), "type": Param("string", True, ("in", "out", "forward", "group")), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/firewall/aliases": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ("cidr", "comment", "digest", "name")),
+        "POST": Method({"cidr": Param("string", False, format="IPorCIDR"), "comment": Param("string", True), "name": Param("string", False), "node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/firewall/aliases/{name}": {
+        "DELETE": Method({"digest": Param("string", True), "name": Param("string", False), "node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+        "GET": Method({"name": Param("string", False), "node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ()),
+        "PUT": Method({"cidr": Param("string", False, format="IPorCIDR"), "comment": Param("string", True), "digest": Param("string", True), "name": Param("string", False), "node": Param("string", False, format="pve-node"), "rename": Param("string", True), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/firewall/ipset": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ("comment", "digest", "name")),
+        "POST": Method({"comment": Param("string", True), "digest": Param("string", True), "name": Param("string", False), "node": Param("string", False, format="pve-node"), "rename": Param("string", True), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/firewall/ipset/{name}": {
+        "DELETE": Method({"force": Param("boolean", True), "name": Param("string", False), "node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+        "GET": Method({"name": Param("string", False), "node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ("cidr", "comment", "digest", "nomatch")),
+        "POST": Method({"cidr": Param("string", False, format="IPorCIDRorAlias"), "comment": Param("string", True), "name": Param("string", False), "node": Param("string", False, format="pve-node"), "nomatch": Param("boolean", True), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/firewall/ipset/{name}/{cidr}": {
+        "DELETE": Method({"cidr": Param("string", False, format="IPorCIDRorAlias"), "digest": Param("string", True), "name": Param("string", False), "node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+        "GET": Method({"cidr": Param("string", False, format="IPorCIDRorAlias"), "name": Param("string", False), "node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ()),
+        "PUT": Method({"cidr": Param("string", False, format="IPorCIDRorAlias"), "comment": Param("string", True), "digest": Param("string", True), "name": Param("string", False), "node": Param("string", False, format="pve-node"), "nomatch": Param("boolean", True), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/firewall/options": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ("dhcp", "enable", "ipfilter", "log_level_in", "log_level_out", "macfilter", "ndp", "policy_in", "policy_out", "radv")),
+        "PUT": Method({"delete": Param("string", True, format="pve-configid-list"), "dhcp": Param("boolean", True, default=0), "digest": Param("string", True), "enable": Param("boolean", True, default=0), "ipfilter": Param("boolean", True), "log_level_in": Param("string", True, ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog")), "log_level_out": Param("string", True, ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog")), "macfilter": Param("boolean", True, default=1), "ndp": Param("boolean", True, default=1), "node": Param("string", False, format="pve-node"), "policy_in": Param("string", True, ("ACCEPT", "REJECT", "DROP")), "policy_out": Param("string", True, ("ACCEPT", "REJECT", "DROP")), "radv": Param("boolean", True), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/firewall/log": {
+        "GET": Method({"limit": Param("integer", True, minimum=0), "node": Param("string", False, format="pve-node"), "since": Param("integer", True, minimum=0), "start": Param("integer", True, minimum=0), "until": Param("integer", True, minimum=0), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ("n", "t")),
+    },
+    "/nodes/{node}/qemu/{vmid}/firewall/refs": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "type": Param("string", True, ("alias", "ipset")), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ("comment", "name", "ref", "scope", "type")),
+    },
+    "/nodes/{node}/qemu/{vmid}/agent": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "array", (), additional=True),
+        "POST": Method({"command": Param("string", False, ("fsfreeze-freeze", "fsfreeze-status", "fsfreeze-thaw", "fstrim", "get-fsinfo", "get-host-name", "get-memory-block-info", "get-memory-blocks", "get-osinfo", "get-time", "get-timezone", "get-users", "get-vcpus", "info", "network-get-interfaces", "ping", "shutdown", "suspend-disk", "suspend-hybrid", "suspend-ram")), "node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/agent/fsfreeze-freeze": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/agent/fsfreeze-status": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/agent/fsfreeze-thaw": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/agent/fstrim": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/agent/get-fsinfo": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/agent/get-host-name": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/agent/get-memory-block-info": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/agent/get-memory-blocks": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/agent/get-osinfo": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/agent/get-time": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/agent/get-timezone": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/agent/get-users": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/agent/get-vcpus": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/agent/info": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/agent/network-get-interfaces": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/agent/ping": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/agent/shutdown": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/agent/suspend-disk": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/agent/suspend-hybrid": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/agent/suspend-ram": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/agent/set-user-password": {
+        "POST": Method({"crypted": Param("boolean", True, default=0), "node": Param("string", False, format="pve-node"), "password": Param("string", False), "username": Param("string", False), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/agent/exec": {
+        "POST": Method({"command": Param("array", False), "input-data": Param("string", True), "node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ("pid",)),
+    },
+    "/nodes/{node}/qemu/{vmid}/agent/exec-status": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "pid": Param("integer", False), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ("err-data", "err-truncated", "exitcode", "exited", "out-data", "out-truncated", "signal")),
+    },
+    "/nodes/{node}/qemu/{vmid}/agent/file-read": {
+        "GET": Method({"file": Param("string", False), "node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ("content", "truncated")),
+    },
+    "/nodes/{node}/qemu/{vmid}/agent/file-write": {
+        "POST": Method({"content": Param("string", False), "encode": Param("boolean", True, default=1), "file": Param("string", False), "node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/rrd": {
+        "GET": Method({"cf": Param("string", True, ("AVERAGE", "MAX")), "ds": Param("string", False, format="pve-configid-list"), "node": Param("string", False, format="pve-node"), "timeframe": Param("string", False, ("hour", "day", "week", "month", "year")), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ("filename",)),
+    },
+    "/nodes/{node}/qemu/{vmid}/rrddata": {
+        "GET": Method({"cf": Param("string", True, ("AVERAGE", "MAX")), "node": Param("string", False, format="pve-node"), "timeframe": Param("string", False, ("hour", "day", "week", "month", "year")), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/config": {
+        "GET": Method({"current": Param("boolean", True, default=0), "node": Param("string", False, format="pve-node"), "snapshot": Param("string", True, format="pve-configid"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ("acpi", "affinity", "agent", "allow-ksm", "amd-sev", "arch", "args", "audio0", "autostart", "balloon", "bios", "boot", "bootdisk", "cdrom", "cicustom", "cipassword", "citype", "ciupgrade", "ciuser", "cores", "cpu", "cpulimit", "cpuunits", "description", "digest", "efidisk0", "freeze", "hookscript", "hostpci[n]", "hotplug", "hugepages", "ide[n]", "intel-tdx", "ipconfig[n]", "ivshmem", "keephugepages", "keyboard", "kvm", "localtime", "lock", "machine", "memory", "meta", "migrate_downtime", "migrate_speed", "name", "nameserver", "net[n]", "numa", "numa[n]", "onboot", "ostype", "parallel[n]", "parent", "protection", "reboot", "rng0", "running-nets-host-mtu", "runningcpu", "runningmachine", "sata[n]", "scsi[n]", "scsihw", "searchdomain", "serial[n]", "shares", "smbios1", "smp", "snaptime", "sockets", "spice_enhancements", "sshkeys", "startdate", "startup", "tablet", "tags", "tdf", "template", "tpmstate0", "unused[n]", "usb[n]", "vcpus", "vga", "virtio[n]", "virtiofs[n]", "vmgenid", "vmstate", "vmstatestorage", "watchdog")),
+        "POST": Method({"acpi": Param("boolean", True, default=1), "affinity": Param("string", True, format="pve-cpuset"), "agent": Param("string", True, format=_Format_23a5bda48b65), "allow-ksm": Param("boolean", True, default=1), "amd-sev": Param("string", True, format="pve-qemu-sev-fmt"), "arch": Param("string", True, ("x86_64", "aarch64")), "args": Param("string", True), "audio0": Param("string", True, format=_Format_c5b977836777), "autostart": Param("boolean", True, default=0), "background_delay": Param("integer", True, minimum=1, maximum=30), "balloon": Param("integer", True, minimum=0), "bios": Param("string", True, ("seabios", "ovmf"), default="seabios"), "boot": Param("string", True, format="pve-qm-boot"), "bootdisk": Param("string", True, format="pve-qm-bootdisk"), "cdrom": Param("string", True, format="pve-qm-ide"), "cicustom": Param("string", True, format="pve-qm-cicustom"), "cipassword": Param("string", True), "citype": Param("string", True, ("configdrive2", "nocloud", "opennebula")), "ciupgrade": Param("boolean", True, default=1), "ciuser": Param("string", True), "cores": Param("integer", True, minimum=1, default=1), "cpu": Param("string", True, format="pve-vm-cpu-conf"), "cpulimit": Param("number", True, minimum=0, maximum=128, default=0), "cpuunits": Param("integer", True, minimum=1, maximum=262144, default="cgroup v1: 1024, cgroup v2: 100"), "delete": Param("string", True, format="pve-configid-list"), "description": Param("string", True), "digest": Param("string", True), "efidisk0": Param("string", True, format=_Format_ab8a16165183), "force": Param("boolean", True), "freeze": Param("boolean", True), "hookscript": Param("string", True, format="pve-volume-id"), "hostpci[n]": Param("string", True, format="pve-qm-hostpci"), "hotplug": Param("string", True, format="pve-hotplug-features", default="network,disk,usb"), "hugepages": Param("string", True, ("any", "2", "1024")), "ide[n]": Param("string", True, format=_Format_373461a1aea1), "import-working-storage": Param("string", True, format="pve-storage-id"), "intel-tdx": Param("string", True, format="pve-qemu-tdx-fmt"), "ipconfig[n]": Param("string", True, format="pve-qm-ipconfig"), "ivshmem": Param("string", True, format=_Format_f128b0c0ae29), "keephugepages": Param("boolean", True, default=0), "keyboard": Param("string", True, ("de", "de-ch", "da", "en-gb", "en-us", "es", "fi", "fr", "fr-be", "fr-ca", "fr-ch", "hu", "is", "it", "ja", "lt", "mk", "nl", "no", "pl", "pt", "pt-br", "sv", "sl", "tr")), "kvm": Param("boolean", True, default=1), "localtime": Param("boolean", True), "lock": Param("string", True, ("backup", "clone", "create", "migrate", "rollback", "snapshot", "snapshot-delete", "suspending", "suspended")), "machine": Param("string", True, format=_Format_05997f1cf757), "memory": Param("string", True, format=_Format_eb5881d59e6c), "migrate_downtime": Param("number", True, minimum=0, default=0.1), "migrate_speed": Param("integer", True, minimum=0, default=0), "name": Param("string", True, format="dns-name"), "nameserver": Param("string", True, format="address-list"), "net[n]": Param("string", True, format=_Format_45e0564941fb), "node": Param("string", False, format="pve-node"), "numa": Param("boolean", True, default=0), "numa[n]": Param("string", True, format=_Format_70e536457672), "onboot": Param("boolean", True, default=0), "ostype": Param("string", True, ("other", "wxp", "w2k", "w2k3", "w2k8", "wvista", "win7", "win8", "win10", "win11", "l24", "l26", "solaris"), default="other"), "parallel[n]": Param("string", True), "protection": Param("boolean", True, default=0), "reboot": Param("boolean", True, default=1), "revert": Param("string", True, format="pve-configid-list"), "rng0": Param("string", True, format="pve-qm-rng"), "sata[n]": Param("string", True, format=_Format_5ea14c1db33a), "scsi[n]": Param("string", True, format=_Format_f1d16f8e5e26), "scsihw": Param("string", True, ("lsi", "lsi53c810", "virtio-scsi-pci", "virtio-scsi-single", "megasas", "pvscsi"), default="lsi"), "searchdomain": Param("string", True), "serial[n]": Param("string", True), "shares": Param("integer", True, minimum=0, maximum=50000, default=1000), "skiplock": Param("boolean", True), "smbios1": Param("string", True, format="pve-qm-smbios1"), "smp": Param("integer", True, minimum=1, default=1), "sockets": Param("integer", True, minimum=1, default=1), "spice_enhancements": Param("string", True, format=_Format_48429e484440), "sshkeys": Param("string", True, format="urlencoded"), "startdate": Param("string", True, default="now"), "startup": Param("string", True, format="pve-startup-order"), "tablet": Param("boolean", True, default=1), "tags": Param("string", True, format="pve-tag-list"), "tdf": Param("boolean", True, default=0), "template": Param("boolean", True, default=0), "tpmstate0": Param("string", True, format=_Format_f07abab5c0f3), "unused[n]": Param("string", True, format=_Format_b246298cf105), "usb[n]": Param("string", True, format=_Format_9579881278db), "vcpus": Param("integer", True, minimum=1, default=0), "vga": Param("string", True, format=_Format_dfe079e3b54a), "virtio[n]": Param("string", True, format=_Format_99392d93cef5), "virtiofs[n]": Param("string", True, format=_Format_f35c24beeb6a), "vmgenid": Param("string", True, default="1 (autogenerated)"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid"), "vmstatestorage": Param("string", True, format="pve-storage-id"), "watchdog": Param("string", True, format="pve-qm-watchdog")}, "string", ()),
+        "PUT": Method({"acpi": Param("boolean", True, default=1), "affinity": Param("string", True, format="pve-cpuset"), "agent": Param("string", True, format=_Format_23a5bda48b65), "allow-ksm": Param("boolean", True, default=1), "amd-sev": Param("string", True, format="pve-qemu-sev-fmt"), "arch": Param("string", True, ("x86_64", "aarch64")), "args": Param("string", True), "audio0": Param("string", True, format=_Format_c5b977836777), "autostart": Param("boolean", True, default=0), "balloon": Param("integer", True, minimum=0), "bios": Param("string", True, ("seabios", "ovmf"), default="seabios"), "boot": Param("string", True, format="pve-qm-boot"), "bootdisk": Param("string", True, format="pve-qm-bootdisk"), "cdrom": Param("string", True, format="pve-qm-ide"), "cicustom": Param("string", True, format="pve-qm-cicustom"), "cipassword": Param("string", True), "citype": Param("string", True, ("configdrive2", "nocloud", "opennebula")), "ciupgrade": Param("boolean", True, default=1), "ciuser": Param("string", True), "cores": Param("integer", True, minimum=1, default=1), "cpu": Param("string", True, format="pve-vm-cpu-conf"), "cpulimit": Param("number", True, minimum=0, maximum=128, default=0), "cpuunits": Param("integer", True, minimum=1, maximum=262144, default="cgroup v1: 1024, cgroup v2: 100"), "delete": Param("string", True, format="pve-configid-list"), "description": Param("string", True), "digest": Param("string", True), "efidisk0": Param("string", True, format=_Format_ab8a16165183), "force": Param("boolean", True), "freeze": Param("boolean", True), "hookscript": Param("string", True, format="pve-volume-id"), "hostpci[n]": Param("string", True, format="pve-qm-hostpci"), "hotplug": Param("string", True, format="pve-hotplug-features", default="network,disk,usb"), "hugepages": Param("string", True, ("any", "2", "1024")), "ide[n]": Param("string", True, format=_Format_373461a1aea1), "intel-tdx": Param("string", True, format="pve-qemu-tdx-fmt"), "ipconfig[n]": Param("string", True, format="pve-qm-ipconfig"), "ivshmem": Param("string", True, format=_Format_f128b0c0ae29), "keephugepages": Param("boolean", True, default=0), "keyboard": Param("string", True, ("de", "de-ch", "da", "en-gb", "en-us", "es", "fi", "fr", "fr-be", "fr-ca", "fr-ch", "hu", "is", "it", "ja", "lt", "mk", "nl", "no", "pl", "pt", "pt-br", "sv", "sl", "tr")), "kvm": Param("boolean", True, default=1), "localtime": Param("boolean", True), "lock": Param("string", True, ("backup", "clone", "create", "migrate", "rollback", "snapshot", "snapshot-delete", "suspending", "suspended")), "machine": Param("string", True, format=_Format_05997f1cf757), "memory": Param("string", True, format=_Format_eb5881d59e6c), "migrate_downtime": Param("number", True, minimum=0, default=0.1), "migrate_speed": Param("integer", True, minimum=0, default=0), "name": Param("string", True, format="dns-name"), "nameserver": Param("string", True, format="address-list"), "net[n]": Param("string", True, format=_Format_45e0564941fb), "node": Param("string", False, format="pve-node"), "numa": Param("boolean", True, default=0), "numa[n]": Param("string", True, format=_Format_70e536457672), "onboot": Param("boolean", True, default=0), "ostype": Param("string", True, ("other", "wxp", "w2k", "w2k3", "w2k8", "wvista", "win7", "win8", "win10", "win11", "l24", "l26", "solaris"), default="other"), "parallel[n]": Param("string", True), "protection": Param("boolean", True, default=0), "reboot": Param("boolean", True, default=1), "revert": Param("string", True, format="pve-configid-list"), "rng0": Param("string", True, format="pve-qm-rng"), "sata[n]": Param("string", True, format=_Format_5ea14c1db33a), "scsi[n]": Param("string", True, format=_Format_f1d16f8e5e26), "scsihw": Param("string", True, ("lsi", "lsi53c810", "virtio-scsi-pci", "virtio-scsi-single", "megasas", "pvscsi"), default="lsi"), "searchdomain": Param("string", True), "serial[n]": Param("string", True), "shares": Param("integer", True, minimum=0, maximum=50000, default=1000), "skiplock": Param("boolean", True), "smbios1": Param("string", True, format="pve-qm-smbios1"), "smp": Param("integer", True, minimum=1, default=1), "sockets": Param("integer", True, minimum=1, default=1), "spice_enhancements": Param("string", True, format=_Format_48429e484440), "sshkeys": Param("string", True, format="urlencoded"), "startdate": Param("string", True, default="now"), "startup": Param("string", True, format="pve-startup-order"), "tablet": Param("boolean", True, default=1), "tags": Param("string", True, format="pve-tag-list"), "tdf": Param("boolean", True, default=0), "template": Param("boolean", True, default=0), "tpmstate0": Param("string", True, format=_Format_f07abab5c0f3), "unused[n]": Param("string", True, format=_Format_b246298cf105), "usb[n]": Param("string", True, format=_Format_9579881278db), "vcpus": Param("integer", True, minimum=1, default=0), "vga": Param("string", True, format=_Format_dfe079e3b54a), "virtio[n]": Param("string", True, format=_Format_99392d93cef5), "virtiofs[n]": Param("string", True, format=_Format_f35c24beeb6a), "vmgenid": Param("string", True, default="1 (autogenerated)"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid"), "vmstatestorage": Param("string", True, format="pve-storage-id"), "watchdog": Param("string", True, format="pve-qm-watchdog")}, "null", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/pending": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ("delete", "key", "pending", "value")),
+    },
+    "/nodes/{node}/qemu/{vmid}/cloudinit": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ("delete", "key", "pending", "value")),
+        "PUT": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/cloudinit/dump": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "type": Param("string", False, ("user", "network", "meta")), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/unlink": {
+        "PUT": Method({"force": Param("boolean", True), "idlist": Param("string", False, format="pve-configid-list"), "node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/vncproxy": {
+        "POST": Method({"generate-password": Param("boolean", True, default=0), "node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid"), "websocket": Param("boolean", True)}, "object", ("cert", "password", "port", "ticket", "upid", "user")),
+    },
+    "/nodes/{node}/qemu/{vmid}/termproxy": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "serial": Param("string", True, ("serial0", "serial1", "serial2", "serial3")), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ("port", "ticket", "upid", "user")),
+    },
+    "/nodes/{node}/qemu/{vmid}/vncwebsocket": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "port": Param("integer", False, minimum=5900, maximum=5999), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid"), "vncticket": Param("string", False)}, "object", ("port",)),
+    },
+    "/nodes/{node}/qemu/{vmid}/spiceproxy": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "proxy": Param("string", True, format="address"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ("host", "password", "proxy", "tls-port", "type")),
+    },
+    "/nodes/{node}/qemu/{vmid}/status": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ("subdir",)),
+    },
+    "/nodes/{node}/qemu/{vmid}/status/current": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ("agent", "clipboard", "cpu", "cpus", "diskread", "diskwrite", "ha", "lock", "maxdisk", "maxmem", "mem", "memhost", "name", "netin", "netout", "pid", "pressurecpufull", "pressurecpusome", "pressureiofull", "pressureiosome", "pressurememoryfull", "pressurememorysome", "qmpstatus", "running-machine", "running-qemu", "serial", "spice", "status", "tags", "template", "uptime", "vmid")),
+    },
+    "/nodes/{node}/qemu/{vmid}/status/start": {
+        "POST": Method({"force-cpu": Param("string", True), "machine": Param("string", True, format=_Format_05997f1cf757), "migratedfrom": Param("string", True, format="pve-node"), "migration_network": Param("string", True, format="CIDR"), "migration_type": Param("string", True, ("secure", "insecure")), "nets-host-mtu": Param("string", True), "node": Param("string", False, format="pve-node"), "skiplock": Param("boolean", True), "stateuri": Param("string", True), "targetstorage": Param("string", True, format="storage-pair-list"), "timeout": Param("integer", True, minimum=0, default="max(30, vm memory in GiB)"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid"), "with-conntrack-state": Param("boolean", True, default=0)}, "string", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/status/stop": {
+        "POST": Method({"keepActive": Param("boolean", True, default=0), "migratedfrom": Param("string", True, format="pve-node"), "node": Param("string", False, format="pve-node"), "overrule-shutdown": Param("boolean", True, default=0), "skiplock": Param("boolean", True), "timeout": Param("integer", True, minimum=0), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/status/reset": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "skiplock": Param("boolean", True), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/status/shutdown": {
+        "POST": Method({"forceStop": Param("boolean", True, default=0), "keepActive": Param("boolean", True, default=0), "node": Param("string", False, format="pve-node"), "skiplock": Param("boolean", True), "timeout": Param("integer", True, minimum=0), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/status/reboot": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "timeout": Param("integer", True, minimum=0), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/status/suspend": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "skiplock": Param("boolean", True), "statestorage": Param("string", True, format="pve-storage-id"), "todisk": Param("boolean", True, default=0), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/status/resume": {
+        "POST": Method({"nocheck": Param("boolean", True), "node": Param("string", False, format="pve-node"), "skiplock": Param("boolean", True), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/sendkey": {
+        "PUT": Method({"key": Param("string", False), "node": Param("string", False, format="pve-node"), "skiplock": Param("boolean", True), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/feature": {
+        "GET": Method({"feature": Param("string", False, ("snapshot", "clone", "copy")), "node": Param("string", False, format="pve-node"), "snapname": Param("string", True, format="pve-configid"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ("hasFeature", "nodes")),
+    },
+    "/nodes/{node}/qemu/{vmid}/clone": {
+        "POST": Method({"bwlimit": Param("integer", True, minimum=0, default="clone limit from datacenter or storage config"), "description": Param("string", True), "format": Param("string", True, ("raw", "qcow2", "vmdk")), "full": Param("boolean", True), "name": Param("string", True, format="dns-name"), "newid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid"), "node": Param("string", False, format="pve-node"), "pool": Param("string", True, format="pve-poolid"), "snapname": Param("string", True, format="pve-configid"), "storage": Param("string", True, format="pve-storage-id"), "target": Param("string", True, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/move_disk": {
+        "POST": Method({"bwlimit": Param("integer", True, minimum=0, default="move limit from datacenter or storage config"), "delete": Param("boolean", True, default=0), "digest": Param("string", True), "disk": Param("string", False, ("ide0", "ide1", "ide2", "ide3", "scsi0", "scsi1", "scsi2", "scsi3", "scsi4", "scsi5", "scsi6", "scsi7", "scsi8", "scsi9", "scsi10", "scsi11", "scsi12", "scsi13", "scsi14", "scsi15", "scsi16", "scsi17", "scsi18", "scsi19", "scsi20", "scsi21", "scsi22", "scsi23", "scsi24", "scsi25", "scsi26", "scsi27", "scsi28", "scsi29", "scsi30", "virtio0", "virtio1", "virtio2", "virtio3", "virtio4", "virtio5", "virtio6", "virtio7", "virtio8", "virtio9", "virtio10", "virtio11", "virtio12", "virtio13", "virtio14", "virtio15", "sata0", "sata1", "sata2", "sata3", "sata4", "sata5", "efidisk0", "tpmstate0", "unused0", "unused1", "unused2", "unused3", "unused4", "unused5", "unused6", "unused7", "unused8", "unused9", "unused10", "unused11", "unused12", "unused13", "unused14", "unused15", "unused16", "unused17", "unused18", "unused19", "unused20", "unused21", "unused22", "unused23", "unused24", "unused25", "unused26", "unused27", "unused28", "unused29", "unused30", "unused31", "unused32", "unused33", "unused34", "unused35", "unused36", "unused37", "unused38", "unused39", "unused40", "unused41", "unused42", "unused43", "unused44", "unused45", "unused46", "unused47", "unused48", "unused49", "unused50", "unused51", "unused52", "unused53", "unused54", "unused55", "unused56", "unused57", "unused58", "unused59", "unused60", "unused61", "unused62", "unused63", "unused64", "unused65", "unused66", "unused67", "unused68", "unused69", "unused70", "unused71", "unused72", "unused73", "unused74", "unused75", "unused76", "unused77", "unused78", "unused79", "unused80", "unused81", "unused82", "unused83", "unused84", "unused85", "unused86", "unused87", "unused88", "unused89", "unused90", "unused91", "unused92", "unused93", "unused94", "unused95", "unused96", "unused97", "unused98", "unused99", "unused100", "unused101", "unused102", "unused103", "unused104", "unused105", "unused106", "unused107", "unused108", "unused109", "unused110", "unused111", "unused112", "unused113", "unused114", "unused115", "unused116", "unused117", "unused118", "unused119", "unused120", "unused121", "unused122", "unused123", "unused124", "unused125", "unused126", "unused127", "unused128", "unused129", "unused130", "unused131", "unused132", "unused133", "unused134", "unused135", "unused136", "unused137", "unused138", "unused139", "unused140", "unused141", "unused142", "unused143", "unused144", "unused145", "unused146", "unused147", "unused148", "unused149", "unused150", "unused151", "unused152", "unused153", "unused154", "unused155", "unused156", "unused157", "unused158", "unused159", "unused160", "unused161", "unused162", "unused163", "unused164", "unused165", "unused166", "unused167", "unused168", "unused169", "unused170", "unused171", "unused172", "unused173", "unused174", "unused175", "unused176", "unused177", "unused178", "unused179", "unused180", "unused181", "unused182", "unused183", "unused184", "unused185", "unused186", "unused187", "unused188", "unused189", "unused190", "unused191", "unused192", "unused193", "unused194", "unused195", "unused196", "unused197", "unused198", "unused199", "unused200", "unused201", "unused202", "unused203", "unused204", "unused205", "unused206", "unused207", "unused208", "unused209", "unused210", "unused211", "unused212", "unused213", "unused214", "unused215", "unused216", "unused217", "unused218", "unused219", "unused220", "unused221", "unused222", "unused223", "unused224", "unused225", "unused226", "unused227", "unused228", "unused229", "unused230", "unused231", "unused232", "unused233", "unused234", "unused235", "unused236", "unused237", "unused238", "unused239", "unused240", "unused241", "unused242", "unused243", "unused244", "unused245", "unused246", "unused247", "unused248", "unused249", "unused250", "unused251", "unused252", "unused253", "unused254", "unused255")), "format": Param("string", True, ("raw", "qcow2", "vmdk")), "node": Param("string", False, format="pve-node"), "storage": Param("string", True, format="pve-storage-id"), "target-digest": Param("string", True), "target-disk": Param("string", True, ("ide0", "ide1", "ide2", "ide3", "scsi0", "scsi1", "scsi2", "scsi3", "scsi4", "scsi5", "scsi6", "scsi7", "scsi8", "scsi9", "scsi10", "scsi11", "scsi12", "scsi13", "scsi14", "scsi15", "scsi16", "scsi17", "scsi18", "scsi19", "scsi20", "scsi21", "scsi22", "scsi23", "scsi24", "scsi25", "scsi26", "scsi27", "scsi28", "scsi29", "scsi30", "virtio0", "virtio1", "virtio2", "virtio3", "virtio4", "virtio5", "virtio6", "virtio7", "virtio8", "virtio9", "virtio10", "virtio11", "virtio12", "virtio13", "virtio14", "virtio15", "sata0", "sata1", "sata2", "sata3", "sata4", "sata5", "efidisk0", "tpmstate0", "unused0", "unused1", "unused2", "unused3", "unused4", "unused5", "unused6", "unused7", "unused8", "unused9", "unused10", "unused11", "unused12", "unused13", "unused14", "unused15", "unused16", "unused17", "unused18", "unused19", "unused20", "unused21", "unused22", "unused23", "unused24", "unused25", "unused26", "unused27", "unused28", "unused29", "unused30", "unused31", "unused32", "unused33", "unused34", "unused35", "unused36", "unused37", "unused38", "unused39", "unused40", "unused41", "unused42", "unused43", "unused44", "unused45", "unused46", "unused47", "unused48", "unused49", "unused50", "unused51", "unused52", "unused53", "unused54", "unused55", "unused56", "unused57", "unused58", "unused59", "unused60", "unused61", "unused62", "unused63", "unused64", "unused65", "unused66", "unused67", "unused68", "unused69", "unused70", "unused71", "unused72", "unused73", "unused74", "unused75", "unused76", "unused77", "unused78", "unused79", "unused80", "unused81", "unused82", "unused83", "unused84", "unused85", "unused86", "unused87", "unused88", "unused89", "unused90", "unused91", "unused92", "unused93", "unused94", "unused95", "unused96", "unused97", "unused98", "unused99", "unused100", "unused101", "unused102", "unused103", "unused104", "unused105", "unused106", "unused107", "unused108", "unused109", "unused110", "unused111", "unused112", "unused113", "unused114", "unused115", "unused116", "unused117", "unused118", "unused119", "unused120", "unused121", "unused122", "unused123", "unused124", "unused125", "unused126", "unused127", "unused128", "unused129", "unused130", "unused131", "unused132", "unused133", "unused134", "unused135", "unused136", "unused137", "unused138", "unused139", "unused140", "unused141", "unused142", "unused143", "unused144", "unused145", "unused146", "unused147", "unused148", "unused149", "unused150", "unused151", "unused152", "unused153", "unused154", "unused155", "unused156", "unused157", "unused158", "unused159", "unused160", "unused161", "unused162", "unused163", "unused164", "unused165", "unused166", "unused167", "unused168", "unused169", "unused170", "unused171", "unused172", "unused173", "unused174", "unused175", "unused176", "unused177", "unused178", "unused179", "unused180", "unused181", "unused182", "unused183", "unused184", "unused185", "unused186", "unused187", "unused188", "unused189", "unused190", "unused191", "unused192", "unused193", "unused194", "unused195", "unused196", "unused197", "unused198", "unused199", "unused200", "unused201", "unused202", "unused203", "unused204", "unused205", "unused206", "unused207", "unused208", "unused209", "unused210", "unused211", "unused212", "unused213", "unused214", "unused215", "unused216", "unused217", "unused218", "unused219", "unused220", "unused221", "unused222", "unused223", "unused224", "unused225", "unused226", "unused227", "unused228", "unused229", "unused230", "unused231", "unused232", "unused233", "unused234", "unused235", "unused236", "unused237", "unused238", "unused239", "unused240", "unused241", "unused242", "unused243", "unused244", "unused245", "unused246", "unused247", "unused248", "unused249", "unused250", "unused251", "unused252", "unused253", "unused254", "unused255")), "target-vmid": Param("integer", True, minimum=100, maximum=999999999, format="pve-vmid"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/migrate": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "target": Param("string", True, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ("allowed_nodes", "dependent-ha-resources", "has-dbus-vmstate", "local_disks", "local_resources", "mapped-resource-info", "mapped-resources", "not_allowed_nodes", "running")),
+        "POST": Method({"bwlimit": Param("integer", True, minimum=0, default="migrate limit from datacenter or storage config"), "force": Param("boolean", True), "migration_network": Param("string", True, format="CIDR"), "migration_type": Param("string", True, ("secure", "insecure")), "node": Param("string", False, format="pve-node"), "online": Param("boolean", True), "target": Param("string", False, format="pve-node"), "targetstorage": Param("string", True, format="storage-pair-list"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid"), "with-conntrack-state": Param("boolean", True, default=0), "with-local-disks": Param("boolean", True)}, "string", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/remote_migrate": {
+        "POST": Method({"bwlimit": Param("integer", True, minimum=0, default="migrate limit from datacenter or storage config"), "delete": Param("boolean", True, default=0), "node": Param("string", False, format="pve-node"), "online": Param("boolean", True), "target-bridge": Param("string", False, format="bridge-pair-list"), "target-endpoint": Param("string", False, format="proxmox-remote"), "target-storage": Param("string", False, format="storage-pair-list"), "target-vmid": Param("integer", True, minimum=100, maximum=999999999, format="pve-vmid"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/monitor": {
+        "POST": Method({"command": Param("string", False), "node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/resize": {
+        "PUT": Method({"digest": Param("string", True), "disk": Param("string", False, ("ide0", "ide1", "ide2", "ide3", "scsi0", "scsi1", "scsi2", "scsi3", "scsi4", "scsi5", "scsi6", "scsi7", "scsi8", "scsi9", "scsi10", "scsi11", "scsi12", "scsi13", "scsi14", "scsi15", "scsi16", "scsi17", "scsi18", "scsi19", "scsi20", "scsi21", "scsi22", "scsi23", "scsi24", "scsi25", "scsi26", "scsi27", "scsi28", "scsi29", "scsi30", "virtio0", "virtio1", "virtio2", "virtio3", "virtio4", "virtio5", "virtio6", "virtio7", "virtio8", "virtio9", "virtio10", "virtio11", "virtio12", "virtio13", "virtio14", "virtio15", "sata0", "sata1", "sata2", "sata3", "sata4", "sata5", "efidisk0", "tpmstate0")), "node": Param("string", False, format="pve-node"), "size": Param("string", False), "skiplock": Param("boolean", True), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/snapshot": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ("description", "name", "parent", "snaptime", "vmstate")),
+        "POST": Method({"description": Param("string", True), "node": Param("string", False, format="pve-node"), "snapname": Param("string", False, format="pve-configid"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid"), "vmstate": Param("boolean", True)}, "string", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/snapshot/{snapname}": {
+        "DELETE": Method({"force": Param("boolean", True), "node": Param("string", False, format="pve-node"), "snapname": Param("string", False, format="pve-configid"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+        "GET": Method({"node": Param("string", False, format="pve-node"), "snapname": Param("string", False, format="pve-configid"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/snapshot/{snapname}/config": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "snapname": Param("string", False, format="pve-configid"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ()),
+        "PUT": Method({"description": Param("string", True), "node": Param("string", False, format="pve-node"), "snapname": Param("string", False, format="pve-configid"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/snapshot/{snapname}/rollback": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "snapname": Param("string", False, format="pve-configid"), "start": Param("boolean", True, default=0), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/template": {
+        "POST": Method({"disk": Param("string", True, ("ide0", "ide1", "ide2", "ide3", "scsi0", "scsi1", "scsi2", "scsi3", "scsi4", "scsi5", "scsi6", "scsi7", "scsi8", "scsi9", "scsi10", "scsi11", "scsi12", "scsi13", "scsi14", "scsi15", "scsi16", "scsi17", "scsi18", "scsi19", "scsi20", "scsi21", "scsi22", "scsi23", "scsi24", "scsi25", "scsi26", "scsi27", "scsi28", "scsi29", "scsi30", "virtio0", "virtio1", "virtio2", "virtio3", "virtio4", "virtio5", "virtio6", "virtio7", "virtio8", "virtio9", "virtio10", "virtio11", "virtio12", "virtio13", "virtio14", "virtio15", "sata0", "sata1", "sata2", "sata3", "sata4", "sata5", "efidisk0", "tpmstate0")), "node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+    },
+    "/nodes/{node}/qemu/{vmid}/mtunnel": {
+        "POST": Method({"bridges": Param("string", True, format="pve-bridge-id-list"), "node": Param("string", False, format="pve-node"), "storages": Param("string", True, format="pve-storage-id-list"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ("socket", "ticket", "upid")),
+    },
+    "/nodes/{node}/qemu/{vmid}/mtunnelwebsocket": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "socket": Param("string", False), "ticket": Param("string", False), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ("port", "socket")),
+    },
+    "/nodes/{node}/qemu/{vmid}/dbus-vmstate": {
+        "POST": Method({"action": Param("string", False, ("start", "stop")), "node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+    },
+    "/nodes/{node}/lxc": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ("cpu", "cpus", "disk", "diskread", "diskwrite", "lock", "maxdisk", "maxmem", "maxswap", "mem", "name", "netin", "netout", "pressurecpusome", "pressureiofull", "pressureiosome", "pressurememoryfull", "pressurememorysome", "status", "tags", "template", "uptime", "vmid")),
+        "POST": Method({"arch": Param("string", True, ("amd64", "i386", "arm64", "armhf", "riscv32", "riscv64"), default="amd64"), "bwlimit": Param("number", True, minimum=0, default="restore limit from datacenter or storage config"), "cmode": Param("string", True, ("shell", "console", "tty"), default="tty"), "console": Param("boolean", True, default=1), "cores": Param("integer", True, minimum=1, maximum=8192), "cpulimit": Param("number", True, minimum=0, maximum=8192, default=0), "cpuunits": Param("integer", True, minimum=0, maximum=500000, default="cgroup v1: 1024, cgroup v2: 100"), "debug": Param("boolean", True, default=0), "description": Param("string", True), "dev[n]": Param("string", True, format=_Format_ada839e6a62b), "entrypoint": Param("string", True, default="/sbin/init"), "env": Param("string", True), "features": Param("string", True, format=_Format_07e30db5d3cc), "force": Param("boolean", True), "ha-managed": Param("boolean", True, default=0), "hookscript": Param("string", True, format="pve-volume-id"), "hostname": Param("string", True, format="dns-name"), "ignore-unpack-errors": Param("boolean", True), "lock": Param("string", True, ("backup", "create", "destroyed", "disk", "fstrim", "migrate", "mounted", "rollback", "snapshot", "snapshot-delete")), "memory": Param("integer", True, minimum=16, default=512), "mp[n]": Param("string", True, format=_Format_75f1cf30d947), "nameserver": Param("string", True, format="lxc-ip-with-ll-iface-list"), "net[n]": Param("string", True, format=_Format_67f20a71850e), "node": Param("string", False, format="pve-node"), "onboot": Param("boolean", True, default=0), "ostemplate": Param("string", False), "ostype": Param("string", True, ("debian", "devuan", "ubuntu", "centos", "fedora", "opensuse", "archlinux", "alpine", "gentoo", "nixos", "unmanaged")), "password": Param("string", True), "pool": Param("string", True, format="pve-poolid"), "protection": Param("boolean", True, default=0), "restore": Param("boolean", True), "rootfs": Param("string", True, format=_Format_c789790bf4ce), "searchdomain": Param("string", True, format="dns-name-list"), "ssh-public-keys": Param("string", True), "start": Param("boolean", True, default=0), "startup": Param("string", True, format="pve-startup-order"), "storage": Param("string", True, format="pve-storage-id", default="local"), "swap": Param("integer", True, minimum=0, default=512), "tags": Param("string", True, format="pve-tag-list"), "template": Param("boolean", True, default=0), "timezone": Param("string", True, format="pve-ct-timezone"), "tty": Param("integer", True, minimum=0, maximum=6, default=2), "unique": Param("boolean", True), "unprivileged": Param("boolean", True, default=0), "unused[n]": Param("string", True, format=_Format_1783c7d3cd22), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+    },
+    "/nodes/{node}/lxc/{vmid}": {
+        "DELETE": Method({"destroy-unreferenced-disks": Param("boolean", True), "force": Param("boolean", True, default=0), "node": Param("string", False, format="pve-node"), "purge": Param("boolean", True, default=0), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ("subdir",)),
+    },
+    "/nodes/{node}/lxc/{vmid}/config": {
+        "GET": Method({"current": Param("boolean", True, default=0), "node": Param("string", False, format="pve-node"), "snapshot": Param("string", True, format="pve-configid"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ("arch", "cmode", "console", "cores", "cpulimit", "cpuunits", "debug", "description", "dev[n]", "digest", "entrypoint", "env", "features", "hookscript", "hostname", "lock", "lxc", "memory", "mp[n]", "nameserver", "net[n]", "onboot", "ostype", "protection", "rootfs", "searchdomain", "startup", "swap", "tags", "template", "timezone", "tty", "unprivileged", "unused[n]")),
+        "PUT": Method({"arch": Param("string", True, ("amd64", "i386", "arm64", "armhf", "riscv32", "riscv64"), default="amd64"), "cmode": Param("string", True, ("shell", "console", "tty"), default="tty"), "console": Param("boolean", True, default=1), "cores": Param("integer", True, minimum=1, maximum=8192), "cpulimit": Param("number", True, minimum=0, maximum=8192, default=0), "cpuunits": Param("integer", True, minimum=0, maximum=500000, default="cgroup v1: 1024, cgroup v2: 100"), "debug": Param("boolean", True, default=0), "delete": Param("string", True, format="pve-configid-list"), "description": Param("string", True), "dev[n]": Param("string", True, format=_Format_ada839e6a62b), "digest": Param("string", True), "entrypoint": Param("string", True, default="/sbin/init"), "env": Param("string", True), "features": Param("string", True, format=_Format_07e30db5d3cc), "hookscript": Param("string", True, format="pve-volume-id"), "hostname": Param("string", True, format="dns-name"), "lock": Param("string", True, ("backup", "create", "destroyed", "disk", "fstrim", "migrate", "mounted", "rollback", "snapshot", "snapshot-delete")), "memory": Param("integer", True, minimum=16, default=512), "mp[n]": Param("string", True, format=_Format_75f1cf30d947), "nameserver": Param("string", True, format="lxc-ip-with-ll-iface-list"), "net[n]": Param("string", True, format=_Format_67f20a71850e), "node": Param("string", False, format="pve-node"), "onboot": Param("boolean", True, default=0), "ostype": Param("string", True, ("debian", "devuan", "ubuntu", "centos", "fedora", "opensuse", "archlinux", "alpine", "gentoo", "nixos", "unmanaged")), "protection": Param("boolean", True, default=0), "revert": Param("string", True, format="pve-configid-list"), "rootfs": Param("string", True, format=_Format_c789790bf4ce), "searchdomain": Param("string", True, format="dns-name-list"), "startup": Param("string", True, format="pve-startup-order"), "swap": Param("integer", True, minimum=0, default=512), "tags": Param("string", True, format="pve-tag-list"), "template": Param("boolean", True, default=0), "timezone": Param("string", True, format="pve-ct-timezone"), "tty": Param("integer", True, minimum=0, maximum=6, default=2), "unprivileged": Param("boolean", True, default=0), "unused[n]": Param("string", True, format=_Format_1783c7d3cd22), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+    },
+    "/nodes/{node}/lxc/{vmid}/status": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ("subdir",)),
+    },
+    "/nodes/{node}/lxc/{vmid}/status/current": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ("cpu", "cpus", "disk", "diskread", "diskwrite", "ha", "lock", "maxdisk", "maxmem", "maxswap", "mem", "name", "netin", "netout", "pressurecpusome", "pressureiofull", "pressureiosome", "pressurememoryfull", "pressurememorysome", "status", "tags", "template", "uptime", "vmid")),
+    },
+    "/nodes/{node}/lxc/{vmid}/status/start": {
+        "POST": Method({"debug": Param("boolean", True, default=0), "node": Param("string", False, format="pve-node"), "skiplock": Param("boolean", True), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+    },
+    "/nodes/{node}/lxc/{vmid}/status/stop": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "overrule-shutdown": Param("boolean", True, default=0), "skiplock": Param("boolean", True), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+    },
+    "/nodes/{node}/lxc/{vmid}/status/shutdown": {
+        "POST": Method({"forceStop": Param("boolean", True, default=0), "node": Param("string", False, format="pve-node"), "timeout": Param("integer", True, minimum=0, default=60), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+    },
+    "/nodes/{node}/lxc/{vmid}/status/suspend": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+    },
+    "/nodes/{node}/lxc/{vmid}/status/resume": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+    },
+    "/nodes/{node}/lxc/{vmid}/status/reboot": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "timeout": Param("integer", True, minimum=0), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+    },
+    "/nodes/{node}/lxc/{vmid}/snapshot": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ("description", "name", "parent", "snaptime")),
+        "POST": Method({"description": Param("string", True), "node": Param("string", False, format="pve-node"), "snapname": Param("string", False, format="pve-configid"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+    },
+    "/nodes/{node}/lxc/{vmid}/snapshot/{snapname}": {
+        "DELETE": Method({"force": Param("boolean", True), "node": Param("string", False, format="pve-node"), "snapname": Param("string", False, format="pve-configid"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+        "GET": Method({"node": Param("string", False, format="pve-node"), "snapname": Param("string", False, format="pve-configid"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ()),
+    },
+    "/nodes/{node}/lxc/{vmid}/snapshot/{snapname}/rollback": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "snapname": Param("string", False, format="pve-configid"), "start": Param("boolean", True, default=0), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+    },
+    "/nodes/{node}/lxc/{vmid}/snapshot/{snapname}/config": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "snapname": Param("string", False, format="pve-configid"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ()),
+        "PUT": Method({"description": Param("string", True), "node": Param("string", False, format="pve-node"), "snapname": Param("string", False, format="pve-configid"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+    },
+    "/nodes/{node}/lxc/{vmid}/firewall": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ()),
+    },
+    "/nodes/{node}/lxc/{vmid}/firewall/rules": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ("action", "comment", "dest", "dport", "enable", "icmp-type", "iface", "ipversion", "log", "macro", "pos", "proto", "source", "sport", "type")),
+        "POST": Method({"action": Param("string", False), "comment": Param("string", True), "dest": Param("string", True, format="pve-fw-addr-spec"), "digest": Param("string", True), "dport": Param("string", True, format="pve-fw-dport-spec"), "enable": Param("integer", True, minimum=0), "icmp-type": Param("string", True, format="pve-fw-icmp-type-spec"), "iface": Param("string", True, format="pve-iface"), "log": Param("string", True, ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog")), "macro": Param("string", True), "node": Param("string", False, format="pve-node"), "pos": Param("integer", True, minimum=0), "proto": Param("string", True, format="pve-fw-protocol-spec"), "source": Param("string", True, format="pve-fw-addr-spec"), "sport": Param("string", True, format="pve-fw-sport-spec"), "type": Param("string", False, ("in", "out", "forward", "group")), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+    },
+    "/nodes/{node}/lxc/{vmid}/firewall/rules/{pos}": {
+        "DELETE": Method({"digest": Param("string", True), "node": Param("string", False, format="pve-node"), "pos": Param("integer", True, minimum=0), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+        "GET": Method({"node": Param("string", False, format="pve-node"), "pos": Param("integer", True, minimum=0), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ("action", "comment", "dest", "dport", "enable", "icmp-type", "iface", "ipversion", "log", "macro", "pos", "proto", "source", "sport", "type")),
+        "PUT": Method({"action": Param("string", True), "comment": Param("string", True), "delete": Param("string", True, format="pve-configid-list"), "dest": Param("string", True, format="pve-fw-addr-spec"), "digest": Param("string", True), "dport": Param("string", True, format="pve-fw-dport-spec"), "enable": Param("integer", True, minimum=0), "icmp-type": Param("string", True, format="pve-fw-icmp-type-spec"), "iface": Param("string", True, format="pve-iface"), "log": Param("string", True, ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog")), "macro": Param("string", True), "moveto": Param("integer", True, minimum=0), "node": Param("string", False, format="pve-node"), "pos": Param("integer", True, minimum=0), "proto": Param("string", True, format="pve-fw-protocol-spec"), "source": Param("string", True, format="pve-fw-addr-spec"), "sport": Param("string", True, format="pve-fw-sport-spec"), "type": Param("string", True, ("in", "out", "forward", "group")), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+    },
+    "/nodes/{node}/lxc/{vmid}/firewall/aliases": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ("cidr", "comment", "digest", "name")),
+        "POST": Method({"cidr": Param("string", False, format="IPorCIDR"), "comment": Param("string", True), "name": Param("string", False), "node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+    },
+    "/nodes/{node}/lxc/{vmid}/firewall/aliases/{name}": {
+        "DELETE": Method({"digest": Param("string", True), "name": Param("string", False), "node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+        "GET": Method({"name": Param("string", False), "node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ()),
+        "PUT": Method({"cidr": Param("string", False, format="IPorCIDR"), "comment": Param("string", True), "digest": Param("string", True), "name": Param("string", False), "node": Param("string", False, format="pve-node"), "rename": Param("string", True), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+    },
+    "/nodes/{node}/lxc/{vmid}/firewall/ipset": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ("comment", "digest", "name")),
+        "POST": Method({"comment": Param("string", True), "digest": Param("string", True), "name": Param("string", False), "node": Param("string", False, format="pve-node"), "rename": Param("string", True), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+    },
+    "/nodes/{node}/lxc/{vmid}/firewall/ipset/{name}": {
+        "DELETE": Method({"force": Param("boolean", True), "name": Param("string", False), "node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+        "GET": Method({"name": Param("string", False), "node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ("cidr", "comment", "digest", "nomatch")),
+        "POST": Method({"cidr": Param("string", False, format="IPorCIDRorAlias"), "comment": Param("string", True), "name": Param("string", False), "node": Param("string", False, format="pve-node"), "nomatch": Param("boolean", True), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+    },
+    "/nodes/{node}/lxc/{vmid}/firewall/ipset/{name}/{cidr}": {
+        "DELETE": Method({"cidr": Param("string", False, format="IPorCIDRorAlias"), "digest": Param("string", True), "name": Param("string", False), "node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+        "GET": Method({"cidr": Param("string", False, format="IPorCIDRorAlias"), "name": Param("string", False), "node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ()),
+        "PUT": Method({"cidr": Param("string", False, format="IPorCIDRorAlias"), "comment": Param("string", True), "digest": Param("string", True), "name": Param("string", False), "node": Param("string", False, format="pve-node"), "nomatch": Param("boolean", True), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+    },
+    "/nodes/{node}/lxc/{vmid}/firewall/options": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ("dhcp", "enable", "ipfilter", "log_level_in", "log_level_out", "macfilter", "ndp", "policy_in", "policy_out", "radv")),
+        "PUT": Method({"delete": Param("string", True, format="pve-configid-list"), "dhcp": Param("boolean", True, default=0), "digest": Param("string", True), "enable": Param("boolean", True, default=0), "ipfilter": Param("boolean", True), "log_level_in": Param("string", True, ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog")), "log_level_out": Param("string", True, ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog")), "macfilter": Param("boolean", True, default=1), "ndp": Param("boolean", True, default=1), "node": Param("string", False, format="pve-node"), "policy_in": Param("string", True, ("ACCEPT", "REJECT", "DROP")), "policy_out": Param("string", True, ("ACCEPT", "REJECT", "DROP")), "radv": Param("boolean", True), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+    },
+    "/nodes/{node}/lxc/{vmid}/firewall/log": {
+        "GET": Method({"limit": Param("integer", True, minimum=0), "node": Param("string", False, format="pve-node"), "since": Param("integer", True, minimum=0), "start": Param("integer", True, minimum=0), "until": Param("integer", True, minimum=0), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ("n", "t")),
+    },
+    "/nodes/{node}/lxc/{vmid}/firewall/refs": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "type": Param("string", True, ("alias", "ipset")), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ("comment", "name", "ref", "scope", "type")),
+    },
+    "/nodes/{node}/lxc/{vmid}/rrd": {
+        "GET": Method({"cf": Param("string", True, ("AVERAGE", "MAX")), "ds": Param("string", False, format="pve-configid-list"), "node": Param("string", False, format="pve-node"), "timeframe": Param("string", False, ("hour", "day", "week", "month", "year")), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ("filename",)),
+    },
+    "/nodes/{node}/lxc/{vmid}/rrddata": {
+        "GET": Method({"cf": Param("string", True, ("AVERAGE", "MAX")), "node": Param("string", False, format="pve-node"), "timeframe": Param("string", False, ("hour", "day", "week", "month", "year")), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ()),
+    },
+    "/nodes/{node}/lxc/{vmid}/vncproxy": {
+        "POST": Method({"height": Param("integer", True, minimum=16, maximum=2160), "node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid"), "websocket": Param("boolean", True), "width": Param("integer", True, minimum=16, maximum=4096)}, "object", ("cert", "port", "ticket", "upid", "user")),
+    },
+    "/nodes/{node}/lxc/{vmid}/termproxy": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ("port", "ticket", "upid", "user")),
+    },
+    "/nodes/{node}/lxc/{vmid}/vncwebsocket": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "port": Param("integer", False, minimum=5900, maximum=5999), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid"), "vncticket": Param("string", False)}, "object", ("port",)),
+    },
+    "/nodes/{node}/lxc/{vmid}/spiceproxy": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "proxy": Param("string", True, format="address"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ("host", "password", "proxy", "tls-port", "type")),
+    },
+    "/nodes/{node}/lxc/{vmid}/remote_migrate": {
+        "POST": Method({"bwlimit": Param("number", True, minimum=0, default="migrate limit from datacenter or storage config"), "delete": Param("boolean", True, default=0), "node": Param("string", False, format="pve-node"), "online": Param("boolean", True), "restart": Param("boolean", True), "target-bridge": Param("string", False, format="bridge-pair-list"), "target-endpoint": Param("string", False, format="proxmox-remote"), "target-storage": Param("string", False, format="storage-pair-list"), "target-vmid": Param("integer", True, minimum=100, maximum=999999999, format="pve-vmid"), "timeout": Param("integer", True, default=180), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+    },
+    "/nodes/{node}/lxc/{vmid}/migrate": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "target": Param("string", True, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ("allowed-nodes", "dependent-ha-resources", "not-allowed-nodes", "running")),
+        "POST": Method({"bwlimit": Param("number", True, minimum=0, default="migrate limit from datacenter or storage config"), "node": Param("string", False, format="pve-node"), "online": Param("boolean", True), "restart": Param("boolean", True), "target": Param("string", False, format="pve-node"), "target-storage": Param("string", True, format="storage-pair-list"), "timeout": Param("integer", True, default=180), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+    },
+    "/nodes/{node}/lxc/{vmid}/feature": {
+        "GET": Method({"feature": Param("string", False, ("snapshot", "clone", "copy")), "node": Param("string", False, format="pve-node"), "snapname": Param("string", True, format="pve-configid"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ("hasFeature",)),
+    },
+    "/nodes/{node}/lxc/{vmid}/template": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "null", ()),
+    },
+    "/nodes/{node}/lxc/{vmid}/clone": {
+        "POST": Method({"bwlimit": Param("number", True, minimum=0, default="clone limit from datacenter or storage config"), "description": Param("string", True), "full": Param("boolean", True), "hostname": Param("string", True, format="dns-name"), "newid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid"), "node": Param("string", False, format="pve-node"), "pool": Param("string", True, format="pve-poolid"), "snapname": Param("string", True, format="pve-configid"), "storage": Param("string", True, format="pve-storage-id"), "target": Param("string", True, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+    },
+    "/nodes/{node}/lxc/{vmid}/resize": {
+        "PUT": Method({"digest": Param("string", True), "disk": Param("string", False, ("rootfs", "mp0", "mp1", "mp2", "mp3", "mp4", "mp5", "mp6", "mp7", "mp8", "mp9", "mp10", "mp11", "mp12", "mp13", "mp14", "mp15", "mp16", "mp17", "mp18", "mp19", "mp20", "mp21", "mp22", "mp23", "mp24", "mp25", "mp26", "mp27", "mp28", "mp29", "mp30", "mp31", "mp32", "mp33", "mp34", "mp35", "mp36", "mp37", "mp38", "mp39", "mp40", "mp41", "mp42", "mp43", "mp44", "mp45", "mp46", "mp47", "mp48", "mp49", "mp50", "mp51", "mp52", "mp53", "mp54", "mp55", "mp56", "mp57", "mp58", "mp59", "mp60", "mp61", "mp62", "mp63", "mp64", "mp65", "mp66", "mp67", "mp68", "mp69", "mp70", "mp71", "mp72", "mp73", "mp74", "mp75", "mp76", "mp77", "mp78", "mp79", "mp80", "mp81", "mp82", "mp83", "mp84", "mp85", "mp86", "mp87", "mp88", "mp89", "mp90", "mp91", "mp92", "mp93", "mp94", "mp95", "mp96", "mp97", "mp98", "mp99", "mp100", "mp101", "mp102", "mp103", "mp104", "mp105", "mp106", "mp107", "mp108", "mp109", "mp110", "mp111", "mp112", "mp113", "mp114", "mp115", "mp116", "mp117", "mp118", "mp119", "mp120", "mp121", "mp122", "mp123", "mp124", "mp125", "mp126", "mp127", "mp128", "mp129", "mp130", "mp131", "mp132", "mp133", "mp134", "mp135", "mp136", "mp137", "mp138", "mp139", "mp140", "mp141", "mp142", "mp143", "mp144", "mp145", "mp146", "mp147", "mp148", "mp149", "mp150", "mp151", "mp152", "mp153", "mp154", "mp155", "mp156", "mp157", "mp158", "mp159", "mp160", "mp161", "mp162", "mp163", "mp164", "mp165", "mp166", "mp167", "mp168", "mp169", "mp170", "mp171", "mp172", "mp173", "mp174", "mp175", "mp176", "mp177", "mp178", "mp179", "mp180", "mp181", "mp182", "mp183", "mp184", "mp185", "mp186", "mp187", "mp188", "mp189", "mp190", "mp191", "mp192", "mp193", "mp194", "mp195", "mp196", "mp197", "mp198", "mp199", "mp200", "mp201", "mp202", "mp203", "mp204", "mp205", "mp206", "mp207", "mp208", "mp209", "mp210", "mp211", "mp212", "mp213", "mp214", "mp215", "mp216", "mp217", "mp218", "mp219", "mp220", "mp221", "mp222", "mp223", "mp224", "mp225", "mp226", "mp227", "mp228", "mp229", "mp230", "mp231", "mp232", "mp233", "mp234", "mp235", "mp236", "mp237", "mp238", "mp239", "mp240", "mp241", "mp242", "mp243", "mp244", "mp245", "mp246", "mp247", "mp248", "mp249", "mp250", "mp251", "mp252", "mp253", "mp254", "mp255")), "node": Param("string", False, format="pve-node"), "size": Param("string", False), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+    },
+    "/nodes/{node}/lxc/{vmid}/move_volume": {
+        "POST": Method({"bwlimit": Param("number", True, minimum=0, default="clone limit from datacenter or storage config"), "delete": Param("boolean", True, default=0), "digest": Param("string", True), "node": Param("string", False, format="pve-node"), "storage": Param("string", True, format="pve-storage-id"), "target-digest": Param("string", True), "target-vmid": Param("integer", True, minimum=100, maximum=999999999, format="pve-vmid"), "target-volume": Param("string", True, ("rootfs", "mp0", "mp1", "mp2", "mp3", "mp4", "mp5", "mp6", "mp7", "mp8", "mp9", "mp10", "mp11", "mp12", "mp13", "mp14", "mp15", "mp16", "mp17", "mp18", "mp19", "mp20", "mp21", "mp22", "mp23", "mp24", "mp25", "mp26", "mp27", "mp28", "mp29", "mp30", "mp31", "mp32", "mp33", "mp34", "mp35", "mp36", "mp37", "mp38", "mp39", "mp40", "mp41", "mp42", "mp43", "mp44", "mp45", "mp46", "mp47", "mp48", "mp49", "mp50", "mp51", "mp52", "mp53", "mp54", "mp55", "mp56", "mp57", "mp58", "mp59", "mp60", "mp61", "mp62", "mp63", "mp64", "mp65", "mp66", "mp67", "mp68", "mp69", "mp70", "mp71", "mp72", "mp73", "mp74", "mp75", "mp76", "mp77", "mp78", "mp79", "mp80", "mp81", "mp82", "mp83", "mp84", "mp85", "mp86", "mp87", "mp88", "mp89", "mp90", "mp91", "mp92", "mp93", "mp94", "mp95", "mp96", "mp97", "mp98", "mp99", "mp100", "mp101", "mp102", "mp103", "mp104", "mp105", "mp106", "mp107", "mp108", "mp109", "mp110", "mp111", "mp112", "mp113", "mp114", "mp115", "mp116", "mp117", "mp118", "mp119", "mp120", "mp121", "mp122", "mp123", "mp124", "mp125", "mp126", "mp127", "mp128", "mp129", "mp130", "mp131", "mp132", "mp133", "mp134", "mp135", "mp136", "mp137", "mp138", "mp139", "mp140", "mp141", "mp142", "mp143", "mp144", "mp145", "mp146", "mp147", "mp148", "mp149", "mp150", "mp151", "mp152", "mp153", "mp154", "mp155", "mp156", "mp157", "mp158", "mp159", "mp160", "mp161", "mp162", "mp163", "mp164", "mp165", "mp166", "mp167", "mp168", "mp169", "mp170", "mp171", "mp172", "mp173", "mp174", "mp175", "mp176", "mp177", "mp178", "mp179", "mp180", "mp181", "mp182", "mp183", "mp184", "mp185", "mp186", "mp187", "mp188", "mp189", "mp190", "mp191", "mp192", "mp193", "mp194", "mp195", "mp196", "mp197", "mp198", "mp199", "mp200", "mp201", "mp202", "mp203", "mp204", "mp205", "mp206", "mp207", "mp208", "mp209", "mp210", "mp211", "mp212", "mp213", "mp214", "mp215", "mp216", "mp217", "mp218", "mp219", "mp220", "mp221", "mp222", "mp223", "mp224", "mp225", "mp226", "mp227", "mp228", "mp229", "mp230", "mp231", "mp232", "mp233", "mp234", "mp235", "mp236", "mp237", "mp238", "mp239", "mp240", "mp241", "mp242", "mp243", "mp244", "mp245", "mp246", "mp247", "mp248", "mp249", "mp250", "mp251", "mp252", "mp253", "mp254", "mp255", "unused0", "unused1", "unused2", "unused3", "unused4", "unused5", "unused6", "unused7", "unused8", "unused9", "unused10", "unused11", "unused12", "unused13", "unused14", "unused15", "unused16", "unused17", "unused18", "unused19", "unused20", "unused21", "unused22", "unused23", "unused24", "unused25", "unused26", "unused27", "unused28", "unused29", "unused30", "unused31", "unused32", "unused33", "unused34", "unused35", "unused36", "unused37", "unused38", "unused39", "unused40", "unused41", "unused42", "unused43", "unused44", "unused45", "unused46", "unused47", "unused48", "unused49", "unused50", "unused51", "unused52", "unused53", "unused54", "unused55", "unused56", "unused57", "unused58", "unused59", "unused60", "unused61", "unused62", "unused63", "unused64", "unused65", "unused66", "unused67", "unused68", "unused69", "unused70", "unused71", "unused72", "unused73", "unused74", "unused75", "unused76", "unused77", "unused78", "unused79", "unused80", "unused81", "unused82", "unused83", "unused84", "unused85", "unused86", "unused87", "unused88", "unused89", "unused90", "unused91", "unused92", "unused93", "unused94", "unused95", "unused96", "unused97", "unused98", "unused99", "unused100", "unused101", "unused102", "unused103", "unused104", "unused105", "unused106", "unused107", "unused108", "unused109", "unused110", "unused111", "unused112", "unused113", "unused114", "unused115", "unused116", "unused117", "unused118", "unused119", "unused120", "unused121", "unused122", "unused123", "unused124", "unused125", "unused126", "unused127", "unused128", "unused129", "unused130", "unused131", "unused132", "unused133", "unused134", "unused135", "unused136", "unused137", "unused138", "unused139", "unused140", "unused141", "unused142", "unused143", "unused144", "unused145", "unused146", "unused147", "unused148", "unused149", "unused150", "unused151", "unused152", "unused153", "unused154", "unused155", "unused156", "unused157", "unused158", "unused159", "unused160", "unused161", "unused162", "unused163", "unused164", "unused165", "unused166", "unused167", "unused168", "unused169", "unused170", "unused171", "unused172", "unused173", "unused174", "unused175", "unused176", "unused177", "unused178", "unused179", "unused180", "unused181", "unused182", "unused183", "unused184", "unused185", "unused186", "unused187", "unused188", "unused189", "unused190", "unused191", "unused192", "unused193", "unused194", "unused195", "unused196", "unused197", "unused198", "unused199", "unused200", "unused201", "unused202", "unused203", "unused204", "unused205", "unused206", "unused207", "unused208", "unused209", "unused210", "unused211", "unused212", "unused213", "unused214", "unused215", "unused216", "unused217", "unused218", "unused219", "unused220", "unused221", "unused222", "unused223", "unused224", "unused225", "unused226", "unused227", "unused228", "unused229", "unused230", "unused231", "unused232", "unused233", "unused234", "unused235", "unused236", "unused237", "unused238", "unused239", "unused240", "unused241", "unused242", "unused243", "unused244", "unused245", "unused246", "unused247", "unused248", "unused249", "unused250", "unused251", "unused252", "unused253", "unused254", "unused255")), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid"), "volume": Param("string", False, ("rootfs", "mp0", "mp1", "mp2", "mp3", "mp4", "mp5", "mp6", "mp7", "mp8", "mp9", "mp10", "mp11", "mp12", "mp13", "mp14", "mp15", "mp16", "mp17", "mp18", "mp19", "mp20", "mp21", "mp22", "mp23", "mp24", "mp25", "mp26", "mp27", "mp28", "mp29", "mp30", "mp31", "mp32", "mp33", "mp34", "mp35", "mp36", "mp37", "mp38", "mp39", "mp40", "mp41", "mp42", "mp43", "mp44", "mp45", "mp46", "mp47", "mp48", "mp49", "mp50", "mp51", "mp52", "mp53", "mp54", "mp55", "mp56", "mp57", "mp58", "mp59", "mp60", "mp61", "mp62", "mp63", "mp64", "mp65", "mp66", "mp67", "mp68", "mp69", "mp70", "mp71", "mp72", "mp73", "mp74", "mp75", "mp76", "mp77", "mp78", "mp79", "mp80", "mp81", "mp82", "mp83", "mp84", "mp85", "mp86", "mp87", "mp88", "mp89", "mp90", "mp91", "mp92", "mp93", "mp94", "mp95", "mp96", "mp97", "mp98", "mp99", "mp100", "mp101", "mp102", "mp103", "mp104", "mp105", "mp106", "mp107", "mp108", "mp109", "mp110", "mp111", "mp112", "mp113", "mp114", "mp115", "mp116", "mp117", "mp118", "mp119", "mp120", "mp121", "mp122", "mp123", "mp124", "mp125", "mp126", "mp127", "mp128", "mp129", "mp130", "mp131", "mp132", "mp133", "mp134", "mp135", "mp136", "mp137", "mp138", "mp139", "mp140", "mp141", "mp142", "mp143", "mp144", "mp145", "mp146", "mp147", "mp148", "mp149", "mp150", "mp151", "mp152", "mp153", "mp154", "mp155", "mp156", "mp157", "mp158", "mp159", "mp160", "mp161", "mp162", "mp163", "mp164", "mp165", "mp166", "mp167", "mp168", "mp169", "mp170", "mp171", "mp172", "mp173", "mp174", "mp175", "mp176", "mp177", "mp178", "mp179", "mp180", "mp181", "mp182", "mp183", "mp184", "mp185", "mp186", "mp187", "mp188", "mp189", "mp190", "mp191", "mp192", "mp193", "mp194", "mp195", "mp196", "mp197", "mp198", "mp199", "mp200", "mp201", "mp202", "mp203", "mp204", "mp205", "mp206", "mp207", "mp208", "mp209", "mp210", "mp211", "mp212", "mp213", "mp214", "mp215", "mp216", "mp217", "mp218", "mp219", "mp220", "mp221", "mp222", "mp223", "mp224", "mp225", "mp226", "mp227", "mp228", "mp229", "mp230", "mp231", "mp232", "mp233", "mp234", "mp235", "mp236", "mp237", "mp238", "mp239", "mp240", "mp241", "mp242", "mp243", "mp244", "mp245", "mp246", "mp247", "mp248", "mp249", "mp250", "mp251", "mp252", "mp253", "mp254", "mp255", "unused0", "unused1", "unused2", "unused3", "unused4", "unused5", "unused6", "unused7", "unused8", "unused9", "unused10", "unused11", "unused12", "unused13", "unused14", "unused15", "unused16", "unused17", "unused18", "unused19", "unused20", "unused21", "unused22", "unused23", "unused24", "unused25", "unused26", "unused27", "unused28", "unused29", "unused30", "unused31", "unused32", "unused33", "unused34", "unused35", "unused36", "unused37", "unused38", "unused39", "unused40", "unused41", "unused42", "unused43", "unused44", "unused45", "unused46", "unused47", "unused48", "unused49", "unused50", "unused51", "unused52", "unused53", "unused54", "unused55", "unused56", "unused57", "unused58", "unused59", "unused60", "unused61", "unused62", "unused63", "unused64", "unused65", "unused66", "unused67", "unused68", "unused69", "unused70", "unused71", "unused72", "unused73", "unused74", "unused75", "unused76", "unused77", "unused78", "unused79", "unused80", "unused81", "unused82", "unused83", "unused84", "unused85", "unused86", "unused87", "unused88", "unused89", "unused90", "unused91", "unused92", "unused93", "unused94", "unused95", "unused96", "unused97", "unused98", "unused99", "unused100", "unused101", "unused102", "unused103", "unused104", "unused105", "unused106", "unused107", "unused108", "unused109", "unused110", "unused111", "unused112", "unused113", "unused114", "unused115", "unused116", "unused117", "unused118", "unused119", "unused120", "unused121", "unused122", "unused123", "unused124", "unused125", "unused126", "unused127", "unused128", "unused129", "unused130", "unused131", "unused132", "unused133", "unused134", "unused135", "unused136", "unused137", "unused138", "unused139", "unused140", "unused141", "unused142", "unused143", "unused144", "unused145", "unused146", "unused147", "unused148", "unused149", "unused150", "unused151", "unused152", "unused153", "unused154", "unused155", "unused156", "unused157", "unused158", "unused159", "unused160", "unused161", "unused162", "unused163", "unused164", "unused165", "unused166", "unused167", "unused168", "unused169", "unused170", "unused171", "unused172", "unused173", "unused174", "unused175", "unused176", "unused177", "unused178", "unused179", "unused180", "unused181", "unused182", "unused183", "unused184", "unused185", "unused186", "unused187", "unused188", "unused189", "unused190", "unused191", "unused192", "unused193", "unused194", "unused195", "unused196", "unused197", "unused198", "unused199", "unused200", "unused201", "unused202", "unused203", "unused204", "unused205", "unused206", "unused207", "unused208", "unused209", "unused210", "unused211", "unused212", "unused213", "unused214", "unused215", "unused216", "unused217", "unused218", "unused219", "unused220", "unused221", "unused222", "unused223", "unused224", "unused225", "unused226", "unused227", "unused228", "unused229", "unused230", "unused231", "unused232", "unused233", "unused234", "unused235", "unused236", "unused237", "unused238", "unused239", "unused240", "unused241", "unused242", "unused243", "unused244", "unused245", "unused246", "unused247", "unused248", "unused249", "unused250", "unused251", "unused252", "unused253", "unused254", "unused255"))}, "string", ()),
+    },
+    "/nodes/{node}/lxc/{vmid}/pending": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ("delete", "key", "pending", "value")),
+    },
+    "/nodes/{node}/lxc/{vmid}/interfaces": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ("hardware-address", "hwaddr", "inet", "inet6", "ip-addresses", "name")),
+    },
+    "/nodes/{node}/lxc/{vmid}/mtunnel": {
+        "POST": Method({"bridges": Param("string", True, format="pve-bridge-id-list"), "node": Param("string", False, format="pve-node"), "storages": Param("string", True, format="pve-storage-id-list"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ("socket", "ticket", "upid")),
+    },
+    "/nodes/{node}/lxc/{vmid}/mtunnelwebsocket": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "socket": Param("string", False), "ticket": Param("string", False), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "object", ("port", "socket")),
+    },
+    "/nodes/{node}/ceph": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ()),
+    },
+    "/nodes/{node}/ceph/cfg": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ()),
+    },
+    "/nodes/{node}/ceph/cfg/raw": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "string", ()),
+    },
+    "/nodes/{node}/ceph/cfg/db": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ("can_update_at_runtime", "level", "mask", "name", "section", "value")),
+    },
+    "/nodes/{node}/ceph/cfg/value": {
+        "GET": Method({"config-keys": Param("string", False), "node": Param("string", False, format="pve-node")}, "object", ()),
+    },
+    "/nodes/{node}/ceph/osd": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "object", ()),
+        "POST": Method({"crush-device-class": Param("string", True), "db_dev": Param("string", True), "db_dev_size": Param("number", True, minimum=1, default="bluestore_block_db_size or 10% of OSD size"), "dev": Param("string", False), "encrypted": Param("boolean", True, default=0), "node": Param("string", False, format="pve-node"), "osds-per-device": Param("integer", True, minimum=1), "wal_dev": Param("string", True), "wal_dev_size": Param("number", True, minimum=0.5, default="bluestore_block_wal_size or 1% of OSD size")}, "string", ()),
+    },
+    "/nodes/{node}/ceph/osd/{osdid}": {
+        "DELETE": Method({"cleanup": Param("boolean", True, default=0), "node": Param("string", False, format="pve-node"), "osdid": Param("integer", False)}, "string", ()),
+        "GET": Method({"node": Param("string", False, format="pve-node"), "osdid": Param("integer", False)}, "array", ()),
+    },
+    "/nodes/{node}/ceph/osd/{osdid}/metadata": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "osdid": Param("integer", False)}, "object", ("devices", "osd")),
+    },
+    "/nodes/{node}/ceph/osd/{osdid}/lv-info": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "osdid": Param("integer", False), "type": Param("string", True, ("block", "db", "wal"), default="block")}, "object", ("creation_time", "lv_name", "lv_path", "lv_size", "lv_uuid", "vg_name")),
+    },
+    "/nodes/{node}/ceph/osd/{osdid}/in": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "osdid": Param("integer", False)}, "null", ()),
+    },
+    "/nodes/{node}/ceph/osd/{osdid}/out": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "osdid": Param("integer", False)}, "null", ()),
+    },
+    "/nodes/{node}/ceph/osd/{osdid}/scrub": {
+        "POST": Method({"deep": Param("boolean", True, default=0), "node": Param("string", False, format="pve-node"), "osdid": Param("integer", False)}, "null", ()),
+    },
+    "/nodes/{node}/ceph/mds": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ("addr", "host", "name", "rank", "standby_replay", "state")),
+    },
+    "/nodes/{node}/ceph/mds/{name}": {
+        "DELETE": Method({"name": Param("string", False), "node": Param("string", False, format="pve-node")}, "string", ()),
+        "POST": Method({"hotstandby": Param("boolean", True, default="0"), "name": Param("string", True, default="nodename"), "node": Param("string", False, format="pve-node")}, "string", ()),
+    },
+    "/nodes/{node}/ceph/mgr": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ("addr", "host", "name", "state")),
+    },
+    "/nodes/{node}/ceph/mgr/{id}": {
+        "DELETE": Method({"id": Param("string", False), "node": Param("string", False, format="pve-node")}, "string", ()),
+        "POST": Method({"id": Param("string", True), "node": Param("string", False, format="pve-node")}, "string", ()),
+    },
+    "/nodes/{node}/ceph/mon": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ("addr", "ceph_version", "ceph_version_short", "direxists", "host", "name", "quorum", "rank", "service", "state")),
+    },
+    "/nodes/{node}/ceph/mon/{monid}": {
+        "DELETE": Method({"monid": Param("string", False), "node": Param("string", False, format="pve-node")}, "string", ()),
+        "POST": Method({"mon-address": Param("string", True, format="ip-list"), "monid": Param("string", True), "node": Param("string", False, format="pve-node")}, "string", ()),
+    },
+    "/nodes/{node}/ceph/fs": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ("data_pool", "metadata_pool", "name")),
+    },
+    "/nodes/{node}/ceph/fs/{name}": {
+        "POST": Method({"add-storage": Param("boolean", True, default=0), "name": Param("string", True, default="cephfs"), "node": Param("string", False, format="pve-node"), "pg_num": Param("integer", True, minimum=8, maximum=32768, default=128)}, "string", ()),
+    },
+    "/nodes/{node}/ceph/pool": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ("application_metadata", "autoscale_status", "bytes_used", "crush_rule", "crush_rule_name", "min_size", "percent_used", "pg_autoscale_mode", "pg_num", "pg_num_final", "pg_num_min", "pool", "pool_name", "size", "target_size", "target_size_ratio", "type")),
+        "POST": Method({"add_storages": Param("boolean", True, default="0; for erasure coded pools: 1"), "application": Param("string", True, ("rbd", "cephfs", "rgw"), default="rbd"), "crush_rule": Param("string", True), "erasure-coding": Param("string", True, format=_Format_200eee0df6dd), "min_size": Param("integer", True, minimum=1, maximum=7, default=2), "name": Param("string", False), "node": Param("string", False, format="pve-node"), "pg_autoscale_mode": Param("string", True, ("on", "off", "warn"), default="warn"), "pg_num": Param("integer", True, minimum=1, maximum=32768, default=128), "pg_num_min": Param("integer", True, maximum=32768), "size": Param("integer", True, minimum=1, maximum=7, default=3), "target_size": Param("string", True), "target_size_ratio": Param("number", True)}, "string", ()),
+    },
+    "/nodes/{node}/ceph/pool/{name}": {
+        "DELETE": Method({"force": Param("boolean", True, default=0), "name": Param("string", False), "node": Param("string", False, format="pve-node"), "remove_ecprofile": Param("boolean", True, default=1), "remove_storages": Param("boolean", True, default=0)}, "string", ()),
+        "GET": Method({"name": Param("string", False), "node": Param("string", False, format="pve-node")}, "array", ()),
+        "PUT": Method({"application": Param("string", True, ("rbd", "cephfs", "rgw")), "crush_rule": Param("string", True), "min_size": Param("integer", True, minimum=1, maximum=7), "name": Param("string", False), "node": Param("string", False, format="pve-node"), "pg_autoscale_mode": Param("string", True, ("on", "off", "warn")), "pg_num": Param("integer", True, minimum=1, maximum=32768), "pg_num_min": Param("integer", True, maximum=32768), "size": Param("integer", True, minimum=1, maximum=7), "target_size": Param("string", True), "target_size_ratio": Param("number", True)}, "string", ()),
+    },
+    "/nodes/{node}/ceph/pool/{name}/status": {
+        "GET": Method({"name": Param("string", False), "node": Param("string", False, format="pve-node"), "verbose": Param("boolean", True, default=0)}, "object", ("application", "application_list", "autoscale_status", "crush_rule", "fast_read", "hashpspool", "id", "min_size", "name", "nodeep-scrub", "nodelete", "nopgchange", "noscrub", "nosizechange", "pg_autoscale_mode", "pg_num", "pg_num_min", "pgp_num", "size", "statistics", "target_size", "target_size_ratio", "use_gmt_hitset", "write_fadvise_dontneed")),
+    },
+    "/nodes/{node}/ceph/init": {
+        "POST": Method({"cluster-network": Param("string", True, format="CIDR"), "disable_cephx": Param("boolean", True, default=0), "min_size": Param("integer", True, minimum=1, maximum=7, default=2), "network": Param("string", True, format="CIDR"), "node": Param("string", False, format="pve-node"), "pg_bits": Param("integer", True, minimum=6, maximum=14, default=6), "size": Param("integer", True, minimum=1, maximum=7, default=3)}, "null", ()),
+    },
+    "/nodes/{node}/ceph/stop": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "service": Param("string", True, default="ceph.target")}, "string", ()),
+    },
+    "/nodes/{node}/ceph/start": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "service": Param("string", True, default="ceph.target")}, "string", ()),
+    },
+    "/nodes/{node}/ceph/restart": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "service": Param("string", True, default="ceph.target")}, "string", ()),
+    },
+    "/nodes/{node}/ceph/status": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "object", ()),
+    },
+    "/nodes/{node}/ceph/crush": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "string", ()),
+    },
+    "/nodes/{node}/ceph/log": {
+        "GET": Method({"limit": Param("integer", True, minimum=0), "node": Param("string", False, format="pve-node"), "start": Param("integer", True, minimum=0)}, "array", ("n", "t")),
+    },
+    "/nodes/{node}/ceph/rules": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ("name",)),
+    },
+    "/nodes/{node}/ceph/cmd-safety": {
+        "GET": Method({"action": Param("string", False, ("stop", "destroy")), "id": Param("string", False), "node": Param("string", False, format="pve-node"), "service": Param("string", False, ("osd", "mon", "mds"))}, "object", ("safe", "status")),
+    },
+    "/nodes/{node}/vzdump": {
+        "POST": Method({"all": Param("boolean", True, default=0), "bwlimit": Param("integer", True, minimum=0, default=0), "compress": Param("string", True, ("0", "1", "gzip", "lzo", "zstd"), default="0"), "dumpdir": Param("string", True), "exclude": Param("string", True, format="pve-vmid-list"), "exclude-path": Param("array", True), "fleecing": Param("string", True, format="backup-fleecing"), "ionice": Param("integer", True, minimum=0, maximum=8, default=7), "job-id": Param("string", True), "lockwait": Param("integer", True, minimum=0, default=180), "mailnotification": Param("string", True, ("always", "failure"), default="always"), "mailto": Param("string", True, format="email-or-username-list"), "maxfiles": Param("integer", True, minimum=1), "mode": Param("string", True, ("snapshot", "suspend", "stop"), default="snapshot"), "node": Param("string", True, format="pve-node"), "notes-template": Param("string", True), "notification-mode": Param("string", True, ("auto", "legacy-sendmail", "notification-system"), default="auto"), "pbs-change-detection-mode": Param("string", True, ("legacy", "data", "metadata")), "performance": Param("string", True, format="backup-performance"), "pigz": Param("integer", True, default=0), "pool": Param("string", True), "protected": Param("boolean", True), "prune-backups": Param("string", True, format="prune-backups", default="keep-all=1"), "quiet": Param("boolean", True, default=0), "remove": Param("boolean", True, default=1), "script": Param("string", True), "stdexcludes": Param("boolean", True, default=1), "stdout": Param("boolean", True), "stop": Param("boolean", True, default=0), "stopwait": Param("integer", True, minimum=0, default=10), "storage": Param("string", True, format="pve-storage-id"), "tmpdir": Param("string", True), "vmid": Param("string", True, format="pve-vmid-list"), "zstd": Param("integer", True, default=1)}, "string", ()),
+    },
+    "/nodes/{node}/vzdump/defaults": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "storage": Param("string", True, format="pve-storage-id")}, "object", ("all", "bwlimit", "compress", "dumpdir", "exclude", "exclude-path", "fleecing", "ionice", "lockwait", "mailnotification", "mailto", "maxfiles", "mode", "node", "notes-template", "notification-mode", "pbs-change-detection-mode", "performance", "pigz", "pool", "protected", "prune-backups", "quiet", "remove", "script", "stdexcludes", "stop", "stopwait", "storage", "tmpdir", "vmid", "zstd")),
+    },
+    "/nodes/{node}/vzdump/extractconfig": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "volume": Param("string", False)}, "string", ()),
+    },
+    "/nodes/{node}/services": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ("active-state", "desc", "name", "service", "state", "unit-state")),
+    },
+    "/nodes/{node}/services/{service}": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "service": Param("string", False, ("chrony", "corosync", "cron", "ksmtuned", "lxcfs", "postfix", "proxmox-firewall", "pve-cluster", "pve-firewall", "pve-ha-crm", "pve-ha-lrm", "pve-lxc-syscalld", "pvedaemon", "pvefw-logger", "pveproxy", "pvescheduler", "pvestatd", "qmeventd", "spiceproxy", "sshd", "syslog", "systemd-journald", "systemd-timesyncd"))}, "array", ("subdir",)),
+    },
+    "/nodes/{node}/services/{service}/state": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "service": Param("string", False, ("chrony", "corosync", "cron", "ksmtuned", "lxcfs", "postfix", "proxmox-firewall", "pve-cluster", "pve-firewall", "pve-ha-crm", "pve-ha-lrm", "pve-lxc-syscalld", "pvedaemon", "pvefw-logger", "pveproxy", "pvescheduler", "pvestatd", "qmeventd", "spiceproxy", "sshd", "syslog", "systemd-journald", "systemd-timesyncd"))}, "object", ("active-state", "desc", "name", "service", "state", "unit-state")),
+    },
+    "/nodes/{node}/services/{service}/start": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "service": Param("string", False, ("chrony", "corosync", "cron", "ksmtuned", "lxcfs", "postfix", "proxmox-firewall", "pve-cluster", "pve-firewall", "pve-ha-crm", "pve-ha-lrm", "pve-lxc-syscalld", "pvedaemon", "pvefw-logger", "pveproxy", "pvescheduler", "pvestatd", "qmeventd", "spiceproxy", "sshd", "syslog", "systemd-journald", "systemd-timesyncd"))}, "string", ()),
+    },
+    "/nodes/{node}/services/{service}/stop": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "service": Param("string", False, ("chrony", "corosync", "cron", "ksmtuned", "lxcfs", "postfix", "proxmox-firewall", "pve-cluster", "pve-firewall", "pve-ha-crm", "pve-ha-lrm", "pve-lxc-syscalld", "pvedaemon", "pvefw-logger", "pveproxy", "pvescheduler", "pvestatd", "qmeventd", "spiceproxy", "sshd", "syslog", "systemd-journald", "systemd-timesyncd"))}, "string", ()),
+    },
+    "/nodes/{node}/services/{service}/restart": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "service": Param("string", False, ("chrony", "corosync", "cron", "ksmtuned", "lxcfs", "postfix", "proxmox-firewall", "pve-cluster", "pve-firewall", "pve-ha-crm", "pve-ha-lrm", "pve-lxc-syscalld", "pvedaemon", "pvefw-logger", "pveproxy", "pvescheduler", "pvestatd", "qmeventd", "spiceproxy", "sshd", "syslog", "systemd-journald", "systemd-timesyncd"))}, "string", ()),
+    },
+    "/nodes/{node}/services/{service}/reload": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "service": Param("string", False, ("chrony", "corosync", "cron", "ksmtuned", "lxcfs", "postfix", "proxmox-firewall", "pve-cluster", "pve-firewall", "pve-ha-crm", "pve-ha-lrm", "pve-lxc-syscalld", "pvedaemon", "pvefw-logger", "pveproxy", "pvescheduler", "pvestatd", "qmeventd", "spiceproxy", "sshd", "syslog", "systemd-journald", "systemd-timesyncd"))}, "string", ()),
+    },
+    "/nodes/{node}/subscription": {
+        "DELETE": Method({"node": Param("string", False, format="pve-node")}, "null", ()),
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "object", ("checktime", "key", "level", "message", "nextduedate", "productname", "regdate", "serverid", "signature", "sockets", "status", "url")),
+        "POST": Method({"force": Param("boolean", True, default=0), "node": Param("string", False, format="pve-node")}, "null", ()),
+        "PUT": Method({"key": Param("string", False), "node": Param("string", False, format="pve-node")}, "null", ()),
+    },
+    "/nodes/{node}/network": {
+        "DELETE": Method({"node": Param("string", False, format="pve-node")}, "null", ()),
+        "GET": Method({"node": Param("string", False, format="pve-node"), "type": Param("string", True, ("bridge", "bond", "eth", "alias", "vlan", "fabric", "OVSBridge", "OVSBond", "OVSPort", "OVSIntPort", "vnet", "any_bridge", "any_local_bridge", "include_sdn"))}, "array", ("active", "address", "address6", "autostart", "bond-primary", "bond_mode", "bond_xmit_hash_policy", "bridge-access", "bridge-arp-nd-suppress", "bridge-learning", "bridge-multicast-flood", "bridge-unicast-flood", "bridge_ports", "bridge_vids", "bridge_vlan_aware", "cidr", "cidr6", "comments", "comments6", "exists", "families", "gateway", "gateway6", "iface", "link-type", "method", "method6", "mtu", "netmask", "netmask6", "options", "options6", "ovs_bonds", "ovs_bridge", "ovs_options", "ovs_ports", "ovs_tag", "priority", "slaves", "type", "uplink-id", "vlan-id", "vlan-protocol", "vlan-raw-device", "vxlan-id", "vxlan-local-tunnelip", "vxlan-physdev", "vxlan-svcnodeip")),
+        "POST": Method({"address": Param("string", True, format="ipv4"), "address6": Param("string", True, format="ipv6"), "autostart": Param("boolean", True), "bond-primary": Param("string", True, format="pve-iface"), "bond_mode": Param("string", True, ("balance-rr", "active-backup", "balance-xor", "broadcast", "802.3ad", "balance-tlb", "balance-alb", "balance-slb", "lacp-balance-slb", "lacp-balance-tcp")), "bond_xmit_hash_policy": Param("string", True, ("layer2", "layer2+3", "layer3+4")), "bridge_ports": Param("string", True, format="pve-iface-list"), "bridge_vids": Param("string", True, format="pve-vlan-id-or-range-list"), "bridge_vlan_aware": Param("boolean", True), "cidr": Param("string", True, format="CIDRv4"), "cidr6": Param("string", True, format="CIDRv6"), "comments": Param("string", True), "comments6": Param("string", True), "gateway": Param("string", True, format="ipv4"), "gateway6": Param("string", True, format="ipv6"), "iface": Param("string", False, format="pve-iface"), "mtu": Param("integer", True, minimum=1280, maximum=65520), "netmask": Param("string", True, format="ipv4mask"), "netmask6": Param("integer", True, minimum=0, maximum=128), "node": Param("string", False, format="pve-node"), "ovs_bonds": Param("string", True, format="pve-iface-list"), "ovs_bridge": Param("string", True, format="pve-iface"), "ovs_options": Param("string", True), "ovs_ports": Param("string", True, format="pve-iface-list"), "ovs_tag": Param("integer", True, minimum=1, maximum=4094), "slaves": Param("string", True, format="pve-iface-list"), "type": Param("string", False, ("bridge", "bond", "eth", "alias", "vlan", "fabric", "OVSBridge", "OVSBond", "OVSPort", "OVSIntPort", "vnet", "unknown")), "vlan-id": Param("integer", True, minimum=1, maximum=4094), "vlan-raw-device": Param("string", True, format="pve-iface")}, "null", ()),
+        "PUT": Method({"node": Param("string", False, format="pve-node"), "regenerate-frr": Param("boolean", True, default=0)}, "string", ()),
+    },
+    "/nodes/{node}/network/{iface}": {
+        "DELETE": Method({"iface": Param("string", False, format="pve-iface"), "node": Param("string", False, format="pve-node")}, "null", ()),
+        "GET": Method({"iface": Param("string", False, format="pve-iface"), "node": Param("string", False, format="pve-node")}, "object", ("method", "type")),
+        "PUT": Method({"address": Param("string", True, format="ipv4"), "address6": Param("string", True, format="ipv6"), "autostart": Param("boolean", True), "bond-primary": Param("string", True, format="pve-iface"), "bond_mode": Param("string", True, ("balance-rr", "active-backup", "balance-xor", "broadcast", "802.3ad", "balance-tlb", "balance-alb", "balance-slb", "lacp-balance-slb", "lacp-balance-tcp")), "bond_xmit_hash_policy": Param("string", True, ("layer2", "layer2+3", "layer3+4")), "bridge_ports": Param("string", True, format="pve-iface-list"), "bridge_vids": Param("string", True, format="pve-vlan-id-or-range-list"), "bridge_vlan_aware": Param("boolean", True), "cidr": Param("string", True, format="CIDRv4"), "cidr6": Param("string", True, format="CIDRv6"), "comments": Param("string", True), "comments6": Param("string", True), "delete": Param("string", True, format="pve-configid-list"), "gateway": Param("string", True, format="ipv4"), "gateway6": Param("string", True, format="ipv6"), "iface": Param("string", False, format="pve-iface"), "mtu": Param("integer", True, minimum=1280, maximum=65520), "netmask": Param("string", True, format="ipv4mask"), "netmask6": Param("integer", True, minimum=0, maximum=128), "node": Param("string", False, format="pve-node"), "ovs_bonds": Param("string", True, format="pve-iface-list"), "ovs_bridge": Param("string", True, format="pve-iface"), "ovs_options": Param("string", True), "ovs_ports": Param("string", True, format="pve-iface-list"), "ovs_tag": Param("integer", True, minimum=1, maximum=4094), "slaves": Param("string", True, format="pve-iface-list"), "type": Param("string", False, ("bridge", "bond", "eth", "alias", "vlan", "fabric", "OVSBridge", "OVSBond", "OVSPort", "OVSIntPort", "vnet", "unknown")), "vlan-id": Param("integer", True, minimum=1, maximum=4094), "vlan-raw-device": Param("string", True, format="pve-iface")}, "null", ()),
+    },
+    "/nodes/{node}/tasks": {
+        "GET": Method({"errors": Param("boolean", True, default=0), "limit": Param("integer", True, minimum=0, default=50), "node": Param("string", False, format="pve-node"), "since": Param("integer", True), "source": Param("string", True, ("archive", "active", "all"), default="archive"), "start": Param("integer", True, minimum=0, default=0), "statusfilter": Param("string", True, format="pve-task-status-type-list"), "typefilter": Param("string", True), "until": Param("integer", True), "userfilter": Param("string", True), "vmid": Param("integer", True, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ("endtime", "id", "node", "pid", "pstart", "starttime", "status", "type", "upid", "user")),
+    },
+    "/nodes/{node}/tasks/{upid}": {
+        "DELETE": Method({"node": Param("string", False, format="pve-node"), "upid": Param("string", False)}, "null", ()),
+        "GET": Method({"node": Param("string", False, format="pve-node"), "upid": Param("string", False)}, "array", ()),
+    },
+    "/nodes/{node}/tasks/{upid}/log": {
+        "GET": Method({"download": Param("boolean", True), "limit": Param("integer", True, minimum=0, default=50), "node": Param("string", False, format="pve-node"), "start": Param("integer", True, minimum=0, default=0), "upid": Param("string", False)}, "array", ("n", "t")),
+    },
+    "/nodes/{node}/tasks/{upid}/status": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "upid": Param("string", False)}, "object", ("exitstatus", "id", "node", "pid", "pstart", "starttime", "status", "type", "upid", "user")),
+    },
+    "/nodes/{node}/scan": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ("method",)),
+    },
+    "/nodes/{node}/scan/nfs": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "server": Param("string", False, format="pve-storage-server")}, "array", ("options", "path")),
+    },
+    "/nodes/{node}/scan/cifs": {
+        "GET": Method({"domain": Param("string", True), "node": Param("string", False, format="pve-node"), "password": Param("string", True), "server": Param("string", False, format="pve-storage-server"), "username": Param("string", True)}, "array", ("description", "share")),
+    },
+    "/nodes/{node}/scan/pbs": {
+        "GET": Method({"fingerprint": Param("string", True), "node": Param("string", False, format="pve-node"), "password": Param("string", False), "port": Param("integer", True, minimum=1, maximum=65535, default=8007), "server": Param("string", False, format="pve-storage-server"), "username": Param("string", False)}, "array", ("comment", "store")),
+    },
+    "/nodes/{node}/scan/iscsi": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "portal": Param("string", False, format="pve-storage-portal-dns")}, "array", ("portal", "target")),
+    },
+    "/nodes/{node}/scan/lvm": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ("vg",)),
+    },
+    "/nodes/{node}/scan/lvmthin": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vg": Param("string", False)}, "array", ("lv",)),
+    },
+    "/nodes/{node}/scan/zfs": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ("pool",)),
+    },
+    "/nodes/{node}/hardware": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ("type",)),
+    },
+    "/nodes/{node}/hardware/pci": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "pci-class-blacklist": Param("string", True, format="string-list", default="05;06;0b"), "verbose": Param("boolean", True, default=1)}, "array", ("class", "device", "device_name", "id", "iommugroup", "mdev", "subsystem_device", "subsystem_device_name", "subsystem_vendor", "subsystem_vendor_name", "vendor", "vendor_name")),
+    },
+    "/nodes/{node}/hardware/pci/{pci-id-or-mapping}": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "pci-id-or-mapping": Param("string", False)}, "array", ("method",)),
+    },
+    "/nodes/{node}/hardware/pci/{pci-id-or-mapping}/mdev": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "pci-id-or-mapping": Param("string", False)}, "array", ("available", "description", "name", "type")),
+    },
+    "/nodes/{node}/hardware/usb": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ("busnum", "class", "devnum", "level", "manufacturer", "port", "prodid", "product", "serial", "speed", "usbpath", "vendid")),
+    },
+    "/nodes/{node}/capabilities": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ()),
+    },
+    "/nodes/{node}/capabilities/qemu": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ()),
+    },
+    "/nodes/{node}/capabilities/qemu/cpu": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ("custom", "name", "vendor")),
+    },
+    "/nodes/{node}/capabilities/qemu/cpu-flags": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ("description", "name")),
+    },
+    "/nodes/{node}/capabilities/qemu/machines": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ("changes", "id", "type", "version")),
+    },
+    "/nodes/{node}/capabilities/qemu/migration": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "object", ("has-dbus-vmstate",)),
+    },
+    "/nodes/{node}/storage": {
+        "GET": Method({"content": Param("string", True, format="pve-storage-content-list"), "enabled": Param("boolean", True, default=0), "format": Param("boolean", True, default=0), "node": Param("string", False, format="pve-node"), "storage": Param("string", True, format="pve-storage-id"), "target": Param("string", True, format="pve-node")}, "array", ("active", "avail", "content", "enabled", "formats", "select_existing", "shared", "storage", "total", "type", "used", "used_fraction")),
+    },
+    "/nodes/{node}/storage/{storage}": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "storage": Param("string", False, format="pve-storage-id")}, "array", ("subdir",)),
+    },
+    "/nodes/{node}/storage/{storage}/prunebackups": {
+        "DELETE": Method({"node": Param("string", False, format="pve-node"), "prune-backups": Param("string", True, format="prune-backups"), "storage": Param("string", False, format="pve-storage-id"), "type": Param("string", True, ("qemu", "lxc")), "vmid": Param("integer", True, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+        "GET": Method({"node": Param("string", False, format="pve-node"), "prune-backups": Param("string", True, format="prune-backups"), "storage": Param("string", False, format="pve-storage-id"), "type": Param("string", True, ("qemu", "lxc")), "vmid": Param("integer", True, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ("ctime", "mark", "type", "vmid", "volid")),
+    },
+    "/nodes/{node}/storage/{storage}/content": {
+        "GET": Method({"content": Param("string", True, format="pve-storage-content"), "node": Param("string", False, format="pve-node"), "storage": Param("string", False, format="pve-storage-id"), "vmid": Param("integer", True, minimum=100, maximum=999999999, format="pve-vmid")}, "array", ("ctime", "encrypted", "format", "notes", "parent", "protected", "size", "used", "verification", "vmid", "volid")),
+        "POST": Method({"filename": Param("string", False), "format": Param("string", True, ("raw", "qcow2", "subvol", "vmdk")), "node": Param("string", False, format="pve-node"), "size": Param("string", False), "storage": Param("string", False, format="pve-storage-id"), "vmid": Param("integer", False, minimum=100, maximum=999999999, format="pve-vmid")}, "string", ()),
+    },
+    "/nodes/{node}/storage/{storage}/content/{volume}": {
+        "DELETE": Method({"delay": Param("integer", True, minimum=1, maximum=30), "node": Param("string", False, format="pve-node"), "storage": Param("string", True, format="pve-storage-id"), "volume": Param("string", False)}, "string", ()),
+        "GET": Method({"node": Param("string", False, format="pve-node"), "storage": Param("string", True, format="pve-storage-id"), "volume": Param("string", False)}, "object", ("format", "notes", "path", "protected", "size", "used")),
+        "POST": Method({"node": Param("string", False, format="pve-node"), "storage": Param("string", True, format="pve-storage-id"), "target": Param("string", False), "target_node": Param("string", True, format="pve-node"), "volume": Param("string", False)}, "string", ()),
+        "PUT": Method({"node": Param("string", False, format="pve-node"), "notes": Param("string", True), "protected": Param("boolean", True), "storage": Param("string", True, format="pve-storage-id"), "volume": Param("string", False)}, "null", ()),
+    },
+    "/nodes/{node}/storage/{storage}/file-restore/list": {
+        "GET": Method({"filepath": Param("string", False), "node": Param("string", False, format="pve-node"), "storage": Param("string", False, format="pve-storage-id"), "volume": Param("string", False)}, "array", ("filepath", "leaf", "mtime", "size", "text", "type")),
+    },
+    "/nodes/{node}/storage/{storage}/file-restore/download": {
+        "GET": Method({"filepath": Param("string", False), "node": Param("string", False, format="pve-node"), "storage": Param("string", False, format="pve-storage-id"), "tar": Param("boolean", True, default=0), "volume": Param("string", False)}, "any", ()),
+    },
+    "/nodes/{node}/storage/{storage}/status": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "storage": Param("string", False, format="pve-storage-id")}, "object", ("active", "avail", "content", "enabled", "shared", "total", "type", "used")),
+    },
+    "/nodes/{node}/storage/{storage}/rrd": {
+        "GET": Method({"cf": Param("string", True, ("AVERAGE", "MAX")), "ds": Param("string", False, format="pve-configid-list"), "node": Param("string", False, format="pve-node"), "storage": Param("string", False, format="pve-storage-id"), "timeframe": Param("string", False, ("hour", "day", "week", "month", "year"))}, "object", ("filename",)),
+    },
+    "/nodes/{node}/storage/{storage}/rrddata": {
+        "GET": Method({"cf": Param("string", True, ("AVERAGE", "MAX")), "node": Param("string", False, format="pve-node"), "storage": Param("string", False, format="pve-storage-id"), "timeframe": Param("string", False, ("hour", "day", "week", "month", "year"))}, "array", ()),
+    },
+    "/nodes/{node}/storage/{storage}/upload": {
+        "POST": Method({"checksum": Param("string", True), "checksum-algorithm": Param("string", True, ("md5", "sha1", "sha224", "sha256", "sha384", "sha512")), "content": Param("string", False, ("iso", "vztmpl", "import"), format="pve-storage-content"), "filename": Param("string", False), "node": Param("string", False, format="pve-node"), "storage": Param("string", False, format="pve-storage-id"), "tmpfilename": Param("string", True)}, "string", ()),
+    },
+    "/nodes/{node}/storage/{storage}/download-url": {
+        "POST": Method({"checksum": Param("string", True), "checksum-algorithm": Param("string", True, ("md5", "sha1", "sha224", "sha256", "sha384", "sha512")), "compression": Param("string", True), "content": Param("string", False, ("iso", "vztmpl", "import"), format="pve-storage-content"), "filename": Param("string", False), "node": Param("string", False, format="pve-node"), "storage": Param("string", False, format="pve-storage-id"), "url": Param("string", False), "verify-certificates": Param("boolean", True, default=1)}, "string", ()),
+    },
+    "/nodes/{node}/storage/{storage}/oci-registry-pull": {
+        "POST": Method({"filename": Param("string", True), "node": Param("string", False, format="pve-node"), "reference": Param("string", False), "storage": Param("string", False, format="pve-storage-id")}, "string", ()),
+    },
+    "/nodes/{node}/storage/{storage}/import-metadata": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "storage": Param("string", False, format="pve-storage-id"), "volume": Param("string", False)}, "object", ("create-args", "disks", "net", "source", "type", "warnings")),
+    },
+    "/nodes/{node}/disks": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ()),
+    },
+    "/nodes/{node}/disks/lvm": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "object", ("children", "leaf")),
+        "POST": Method({"add_storage": Param("boolean", True, default=0), "device": Param("string", False), "name": Param("string", False, format="pve-storage-id"), "node": Param("string", False, format="pve-node")}, "string", ()),
+    },
+    "/nodes/{node}/disks/lvm/{name}": {
+        "DELETE": Method({"cleanup-config": Param("boolean", True, default=0), "cleanup-disks": Param("boolean", True, default=0), "name": Param("string", False, format="pve-storage-id"), "node": Param("string", False, format="pve-node")}, "string", ()),
+    },
+    "/nodes/{node}/disks/lvmthin": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ("lv", "lv_size", "metadata_size", "metadata_used", "used", "vg")),
+        "POST": Method({"add_storage": Param("boolean", True, default=0), "device": Param("string", False), "name": Param("string", False, format="pve-storage-id"), "node": Param("string", False, format="pve-node")}, "string", ()),
+    },
+    "/nodes/{node}/disks/lvmthin/{name}": {
+        "DELETE": Method({"cleanup-config": Param("boolean", True, default=0), "cleanup-disks": Param("boolean", True, default=0), "name": Param("string", False, format="pve-storage-id"), "node": Param("string", False, format="pve-node"), "volume-group": Param("string", False, format="pve-storage-id")}, "string", ()),
+    },
+    "/nodes/{node}/disks/directory": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ("device", "options", "path", "type", "unitfile")),
+        "POST": Method({"add_storage": Param("boolean", True, default=0), "device": Param("string", False), "filesystem": Param("string", True, ("ext4", "xfs"), default="ext4"), "name": Param("string", False, format="pve-storage-id"), "node": Param("string", False, format="pve-node")}, "string", ()),
+    },
+    "/nodes/{node}/disks/directory/{name}": {
+        "DELETE": Method({"cleanup-config": Param("boolean", True, default=0), "cleanup-disks": Param("boolean", True, default=0), "name": Param("string", False, format="pve-storage-id"), "node": Param("string", False, format="pve-node")}, "string", ()),
+    },
+    "/nodes/{node}/disks/zfs": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ("alloc", "dedup", "frag", "free", "health", "name", "size")),
+        "POST": Method({"add_storage": Param("boolean", True, default=0), "ashift": Param("integer", True, minimum=9, maximum=16, default=12), "compression": Param("string", True, ("on", "off", "gzip", "lz4", "lzjb", "zle", "zstd"), default="on"), "devices": Param("string", False, format="string-list"), "draid-config": Param("string", True, format=_Format_a3e76e8265f8), "name": Param("string", False, format="pve-storage-id"), "node": Param("string", False, format="pve-node"), "raidlevel": Param("string", False, ("single", "mirror", "raid10", "raidz", "raidz2", "raidz3", "draid", "draid2", "draid3"))}, "string", ()),
+    },
+    "/nodes/{node}/disks/zfs/{name}": {
+        "DELETE": Method({"cleanup-config": Param("boolean", True, default=0), "cleanup-disks": Param("boolean", True, default=0), "name": Param("string", False, format="pve-storage-id"), "node": Param("string", False, format="pve-node")}, "string", ()),
+        "GET": Method({"name": Param("string", False, format="pve-storage-id"), "node": Param("string", False, format="pve-node")}, "object", ("action", "children", "errors", "name", "scan", "state", "status")),
+    },
+    "/nodes/{node}/disks/list": {
+        "GET": Method({"include-partitions": Param("boolean", True, default=0), "node": Param("string", False, format="pve-node"), "skipsmart": Param("boolean", True, default=0), "type": Param("string", True, ("unused", "journal_disks"))}, "array", ("devpath", "gpt", "health", "model", "mounted", "osdid", "osdid-list", "parent", "serial", "size", "used", "vendor", "wwn")),
+    },
+    "/nodes/{node}/disks/smart": {
+        "GET": Method({"disk": Param("string", False), "healthonly": Param("boolean", True), "node": Param("string", False, format="pve-node")}, "object", ("attributes", "health", "text", "type")),
+    },
+    "/nodes/{node}/disks/initgpt": {
+        "POST": Method({"disk": Param("string", False), "node": Param("string", False, format="pve-node"), "uuid": Param("string", True)}, "string", ()),
+    },
+    "/nodes/{node}/disks/wipedisk": {
+        "PUT": Method({"disk": Param("string", False), "node": Param("string", False, format="pve-node")}, "string", ()),
+    },
+    "/nodes/{node}/apt": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ("id",)),
+    },
+    "/nodes/{node}/apt/update": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ("Arch", "Description", "NotifyStatus", "OldVersion", "Origin", "Package", "Priority", "Section", "Title", "Version")),
+        "POST": Method({"node": Param("string", False, format="pve-node"), "notify": Param("boolean", True, default=0), "quiet": Param("boolean", True, default=0)}, "string", ()),
+    },
+    "/nodes/{node}/apt/changelog": {
+        "GET": Method({"name": Param("string", False), "node": Param("string", False, format="pve-node"), "version": Param("string", True)}, "string", ()),
+    },
+    "/nodes/{node}/apt/repositories": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "object", ("digest", "errors", "files", "infos", "standard-repos")),
+        "POST": Method({"digest": Param("string", True), "enabled": Param("boolean", True), "index": Param("integer", False), "node": Param("string", False, format="pve-node"), "path": Param("string", False)}, "null", ()),
+        "PUT": Method({"digest": Param("string", True), "handle": Param("string", False), "node": Param("string", False, format="pve-node")}, "null", ()),
+    },
+    "/nodes/{node}/apt/versions": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ("Arch", "CurrentState", "Description", "ManagerVersion", "NotifyStatus", "OldVersion", "Origin", "Package", "Priority", "RunningKernel", "Section", "Title", "Version")),
+    },
+    "/nodes/{node}/firewall": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ()),
+    },
+    "/nodes/{node}/firewall/rules": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ("action", "comment", "dest", "dport", "enable", "icmp-type", "iface", "ipversion", "log", "macro", "pos", "proto", "source", "sport", "type")),
+        "POST": Method({"action": Param("string", False), "comment": Param("string", True), "dest": Param("string", True, format="pve-fw-addr-spec"), "digest": Param("string", True), "dport": Param("string", True, format="pve-fw-dport-spec"), "enable": Param("integer", True, minimum=0), "icmp-type": Param("string", True, format="pve-fw-icmp-type-spec"), "iface": Param("string", True, format="pve-iface"), "log": Param("string", True, ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog")), "macro": Param("string", True), "node": Param("string", False, format="pve-node"), "pos": Param("integer", True, minimum=0), "proto": Param("string", True, format="pve-fw-protocol-spec"), "source": Param("string", True, format="pve-fw-addr-spec"), "sport": Param("string", True, format="pve-fw-sport-spec"), "type": Param("string", False, ("in", "out", "forward", "group"))}, "null", ()),
+    },
+    "/nodes/{node}/firewall/rules/{pos}": {
+        "DELETE": Method({"digest": Param("string", True), "node": Param("string", False, format="pve-node"), "pos": Param("integer", True, minimum=0)}, "null", ()),
+        "GET": Method({"node": Param("string", False, format="pve-node"), "pos": Param("integer", True, minimum=0)}, "object", ("action", "comment", "dest", "dport", "enable", "icmp-type", "iface", "ipversion", "log", "macro", "pos", "proto", "source", "sport", "type")),
+        "PUT": Method({"action": Param("string", True), "comment": Param("string", True), "delete": Param("string", True, format="pve-configid-list"), "dest": Param("string", True, format="pve-fw-addr-spec"), "digest": Param("string", True), "dport": Param("string", True, format="pve-fw-dport-spec"), "enable": Param("integer", True, minimum=0), "icmp-type": Param("string", True, format="pve-fw-icmp-type-spec"), "iface": Param("string", True, format="pve-iface"), "log": Param("string", True, ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog")), "macro": Param("string", True), "moveto": Param("integer", True, minimum=0), "node": Param("string", False, format="pve-node"), "pos": Param("integer", True, minimum=0), "proto": Param("string", True, format="pve-fw-protocol-spec"), "source": Param("string", True, format="pve-fw-addr-spec"), "sport": Param("string", True, format="pve-fw-sport-spec"), "type": Param("string", True, ("in", "out", "forward", "group"))}, "null", ()),
+    },
+    "/nodes/{node}/firewall/options": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "object", ("enable", "log_level_forward", "log_level_in", "log_level_out", "log_nf_conntrack", "ndp", "nf_conntrack_allow_invalid", "nf_conntrack_helpers", "nf_conntrack_max", "nf_conntrack_tcp_timeout_established", "nf_conntrack_tcp_timeout_syn_recv", "nftables", "nosmurfs", "protection_synflood", "protection_synflood_burst", "protection_synflood_rate", "smurf_log_level", "tcp_flags_log_level", "tcpflags")),
+        "PUT": Method({"delete": Param("string", True, format="pve-configid-list"), "digest": Param("string", True), "enable": Param("boolean", True, default=1), "log_level_forward": Param("string", True, ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog")), "log_level_in": Param("string", True, ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog")), "log_level_out": Param("string", True, ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog")), "log_nf_conntrack": Param("boolean", True, default=0), "ndp": Param("boolean", True, default=1), "nf_conntrack_allow_invalid": Param("boolean", True, default=0), "nf_conntrack_helpers": Param("string", True, format="pve-fw-conntrack-helper", default=""), "nf_conntrack_max": Param("integer", True, minimum=32768, default=262144), "nf_conntrack_tcp_timeout_established": Param("integer", True, minimum=7875, default=432000), "nf_conntrack_tcp_timeout_syn_recv": Param("integer", True, minimum=30, maximum=60, default=60), "nftables": Param("boolean", True, default=0), "node": Param("string", False, format="pve-node"), "nosmurfs": Param("boolean", True), "protection_synflood": Param("boolean", True, default=0), "protection_synflood_burst": Param("integer", True, default=1000), "protection_synflood_rate": Param("integer", True, default=200), "smurf_log_level": Param("string", True, ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog")), "tcp_flags_log_level": Param("string", True, ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug", "nolog")), "tcpflags": Param("boolean", True, default=0)}, "null", ()),
+    },
+    "/nodes/{node}/firewall/log": {
+        "GET": Method({"limit": Param("integer", True, minimum=0), "node": Param("string", False, format="pve-node"), "since": Param("integer", True, minimum=0), "start": Param("integer", True, minimum=0), "until": Param("integer", True, minimum=0)}, "array", ("n", "t")),
+    },
+    "/nodes/{node}/replication": {
+        "GET": Method({"guest": Param("integer", True, minimum=100, maximum=999999999, format="pve-vmid"), "node": Param("string", False, format="pve-node")}, "array", ("id",)),
+    },
+    "/nodes/{node}/replication/{id}": {
+        "GET": Method({"id": Param("string", False, format="pve-replication-job-id"), "node": Param("string", False, format="pve-node")}, "array", ()),
+    },
+    "/nodes/{node}/replication/{id}/status": {
+        "GET": Method({"id": Param("string", False, format="pve-replication-job-id"), "node": Param("string", False, format="pve-node")}, "object", ()),
+    },
+    "/nodes/{node}/replication/{id}/log": {
+        "GET": Method({"id": Param("string", False, format="pve-replication-job-id"), "limit": Param("integer", True, minimum=0), "node": Param("string", False, format="pve-node"), "start": Param("integer", True, minimum=0)}, "array", ("n", "t")),
+    },
+    "/nodes/{node}/replication/{id}/schedule_now": {
+        "POST": Method({"id": Param("string", False, format="pve-replication-job-id"), "node": Param("string", False, format="pve-node")}, "string", ()),
+    },
+    "/nodes/{node}/certificates": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ()),
+    },
+    "/nodes/{node}/certificates/acme": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ()),
+    },
+    "/nodes/{node}/certificates/acme/certificate": {
+        "DELETE": Method({"node": Param("string", False, format="pve-node")}, "string", ()),
+        "POST": Method({"force": Param("boolean", True, default=0), "node": Param("string", False, format="pve-node")}, "string", ()),
+        "PUT": Method({"force": Param("boolean", True, default=0), "node": Param("string", False, format="pve-node")}, "string", ()),
+    },
+    "/nodes/{node}/certificates/info": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ("filename", "fingerprint", "issuer", "notafter", "notbefore", "pem", "public-key-bits", "public-key-type", "san", "subject")),
+    },
+    "/nodes/{node}/certificates/custom": {
+        "DELETE": Method({"node": Param("string", False, format="pve-node"), "restart": Param("boolean", True, default=0)}, "null", ()),
+        "POST": Method({"certificates": Param("string", False, format="pem-certificate-chain"), "force": Param("boolean", True, default=0), "key": Param("string", True, format="pem-string"), "node": Param("string", False, format="pve-node"), "restart": Param("boolean", True, default=0)}, "object", ("filename", "fingerprint", "issuer", "notafter", "notbefore", "pem", "public-key-bits", "public-key-type", "san", "subject")),
+    },
+    "/nodes/{node}/config": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "property": Param("string", True, ("acme", "acmedomain0", "acmedomain1", "acmedomain2", "acmedomain3", "acmedomain4", "acmedomain5", "ballooning-target", "description", "startall-onboot-delay", "wakeonlan"), default="all")}, "object", ("acme", "acmedomain[n]", "ballooning-target", "description", "digest", "startall-onboot-delay", "wakeonlan")),
+        "PUT": Method({"acme": Param("string", True, format=_Format_207345cbb644), "acmedomain[n]": Param("string", True, format=_Format_6045c7b332f5), "ballooning-target": Param("integer", True, minimum=0, maximum=100, default=80), "delete": Param("string", True, format="pve-configid-list"), "description": Param("string", True), "digest": Param("string", True), "node": Param("string", False, format="pve-node"), "startall-onboot-delay": Param("integer", True, minimum=0, maximum=300, default=0), "wakeonlan": Param("string", True, format=_Format_c0a3b57f98cb)}, "null", ()),
+    },
+    "/nodes/{node}/sdn": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ()),
+    },
+    "/nodes/{node}/sdn/fabrics/{fabric}": {
+        "GET": Method({"fabric": Param("string", False, format="pve-sdn-fabric-id"), "node": Param("string", False, format="pve-node")}, "array", ("subdir",)),
+    },
+    "/nodes/{node}/sdn/fabrics/{fabric}/routes": {
+        "GET": Method({"fabric": Param("string", False, format="pve-sdn-fabric-id"), "node": Param("string", False, format="pve-node")}, "array", ("route", "via")),
+    },
+    "/nodes/{node}/sdn/fabrics/{fabric}/neighbors": {
+        "GET": Method({"fabric": Param("string", False, format="pve-sdn-fabric-id"), "node": Param("string", False, format="pve-node")}, "array", ("neighbor", "status", "uptime")),
+    },
+    "/nodes/{node}/sdn/fabrics/{fabric}/interfaces": {
+        "GET": Method({"fabric": Param("string", False, format="pve-sdn-fabric-id"), "node": Param("string", False, format="pve-node")}, "array", ("name", "state", "type")),
+    },
+    "/nodes/{node}/sdn/zones": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ("status", "zone")),
+    },
+    "/nodes/{node}/sdn/zones/{zone}": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "zone": Param("string", False, format="pve-sdn-zone-id")}, "array", ("subdir",)),
+    },
+    "/nodes/{node}/sdn/zones/{zone}/content": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "zone": Param("string", False, format="pve-sdn-zone-id")}, "array", ("status", "statusmsg", "vnet")),
+    },
+    "/nodes/{node}/sdn/zones/{zone}/bridges": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "zone": Param("string", False)}, "array", ("name", "ports", "vlan_filtering")),
+    },
+    "/nodes/{node}/sdn/zones/{zone}/ip-vrf": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "zone": Param("string", False)}, "array", ("ip", "metric", "nexthops", "protocol")),
+    },
+    "/nodes/{node}/sdn/vnets/{vnet}": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vnet": Param("string", False, format="pve-sdn-vnet-id")}, "array", ("subdir",)),
+    },
+    "/nodes/{node}/sdn/vnets/{vnet}/mac-vrf": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "vnet": Param("string", False, format="pve-sdn-vnet-id")}, "array", ("ip", "mac", "nexthop")),
+    },
+    "/nodes/{node}/version": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "object", ("release", "repoid", "version")),
+    },
+    "/nodes/{node}/status": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "object", ("boot-info", "cpu", "cpuinfo", "current-kernel", "loadavg", "memory", "pveversion", "rootfs")),
+        "POST": Method({"command": Param("string", False, ("reboot", "shutdown")), "node": Param("string", False, format="pve-node")}, "null", ()),
+    },
+    "/nodes/{node}/netstat": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ()),
+    },
+    "/nodes/{node}/execute": {
+        "POST": Method({"commands": Param("string", False, format="pve-command-batch"), "node": Param("string", False, format="pve-node")}, "array", ()),
+    },
+    "/nodes/{node}/wakeonlan": {
+        "POST": Method({"node": Param("string", False, format="pve-node")}, "string", ()),
+    },
+    "/nodes/{node}/rrd": {
+        "GET": Method({"cf": Param("string", True, ("AVERAGE", "MAX")), "ds": Param("string", False, format="pve-configid-list"), "node": Param("string", False, format="pve-node"), "timeframe": Param("string", False, ("hour", "day", "week", "month", "year", "decade"))}, "object", ("filename",)),
+    },
+    "/nodes/{node}/rrddata": {
+        "GET": Method({"cf": Param("string", True, ("AVERAGE", "MAX")), "node": Param("string", False, format="pve-node"), "timeframe": Param("string", False, ("hour", "day", "week", "month", "year", "decade"))}, "array", ()),
+    },
+    "/nodes/{node}/syslog": {
+        "GET": Method({"limit": Param("integer", True, minimum=0), "node": Param("string", False, format="pve-node"), "service": Param("string", True), "since": Param("string", True), "start": Param("integer", True, minimum=0), "until": Param("string", True)}, "array", ("n", "t")),
+    },
+    "/nodes/{node}/journal": {
+        "GET": Method({"endcursor": Param("string", True), "lastentries": Param("integer", True, minimum=0), "node": Param("string", False, format="pve-node"), "since": Param("integer", True, minimum=0), "startcursor": Param("string", True), "until": Param("integer", True, minimum=0)}, "array", ()),
+    },
+    "/nodes/{node}/vncshell": {
+        "POST": Method({"cmd": Param("string", True, ("ceph_install", "login", "upgrade"), default="login"), "cmd-opts": Param("string", True, default=""), "height": Param("integer", True, minimum=16, maximum=2160), "node": Param("string", False, format="pve-node"), "websocket": Param("boolean", True), "width": Param("integer", True, minimum=16, maximum=4096)}, "object", ("cert", "port", "ticket", "upid", "user")),
+    },
+    "/nodes/{node}/termproxy": {
+        "POST": Method({"cmd": Param("string", True, ("ceph_install", "login", "upgrade"), default="login"), "cmd-opts": Param("string", True, default=""), "node": Param("string", False, format="pve-node")}, "object", ("port", "ticket", "upid", "user")),
+    },
+    "/nodes/{node}/vncwebsocket": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "port": Param("integer", False, minimum=5900, maximum=5999), "vncticket": Param("string", False)}, "object", ("port",)),
+    },
+    "/nodes/{node}/spiceshell": {
+        "POST": Method({"cmd": Param("string", True, ("ceph_install", "login", "upgrade"), default="login"), "cmd-opts": Param("string", True, default=""), "node": Param("string", False, format="pve-node"), "proxy": Param("string", True, format="address")}, "object", ("host", "password", "proxy", "tls-port", "type")),
+    },
+    "/nodes/{node}/dns": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "object", ("dns1", "dns2", "dns3", "search")),
+        "PUT": Method({"dns1": Param("string", True, format="ip"), "dns2": Param("string", True, format="ip"), "dns3": Param("string", True, format="ip"), "node": Param("string", False, format="pve-node"), "search": Param("string", False)}, "null", ()),
+    },
+    "/nodes/{node}/time": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "object", ("localtime", "time", "timezone")),
+        "PUT": Method({"node": Param("string", False, format="pve-node"), "timezone": Param("string", False)}, "null", ()),
+    },
+    "/nodes/{node}/aplinfo": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "array", ()),
+        "POST": Method({"node": Param("string", False, format="pve-node"), "storage": Param("string", False, format="pve-storage-id"), "template": Param("string", False)}, "string", ()),
+    },
+    "/nodes/{node}/query-oci-repo-tags": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "reference": Param("string", False)}, "array", ()),
+    },
+    "/nodes/{node}/query-url-metadata": {
+        "GET": Method({"node": Param("string", False, format="pve-node"), "url": Param("string", False), "verify-certificates": Param("boolean", True, default=1)}, "object", ("filename", "mimetype", "size")),
+    },
+    "/nodes/{node}/report": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "string", ()),
+    },
+    "/nodes/{node}/startall": {
+        "POST": Method({"force": Param("boolean", True, default="off"), "node": Param("string", False, format="pve-node"), "vms": Param("string", True, format="pve-vmid-list")}, "string", ()),
+    },
+    "/nodes/{node}/stopall": {
+        "POST": Method({"force-stop": Param("boolean", True, default=1), "node": Param("string", False, format="pve-node"), "timeout": Param("integer", True, minimum=0, maximum=7200, default=180), "vms": Param("string", True, format="pve-vmid-list")}, "string", ()),
+    },
+    "/nodes/{node}/suspendall": {
+        "POST": Method({"node": Param("string", False, format="pve-node"), "vms": Param("string", True, format="pve-vmid-list")}, "string", ()),
+    },
+    "/nodes/{node}/migrateall": {
+        "POST": Method({"maxworkers": Param("integer", True, minimum=1), "node": Param("string", False, format="pve-node"), "target": Param("string", False, format="pve-node"), "vms": Param("string", True, format="pve-vmid-list"), "with-local-disks": Param("boolean", True)}, "string", ()),
+    },
+    "/nodes/{node}/hosts": {
+        "GET": Method({"node": Param("string", False, format="pve-node")}, "object", ("data", "digest")),
+        "POST": Method({"data": Param("string", False), "digest": Param("string", True), "node": Param("string", False, format="pve-node")}, "null", ()),
+    },
+    "/storage": {
+        "GET": Method({"type": Param("string", True, ("btrfs", "cephfs", "cifs", "dir", "esxi", "iscsi", "iscsidirect", "lvm", "lvmthin", "nfs", "pbs", "rbd", "zfs", "zfspool"))}, "array", ("storage",)),
+        "POST": Method({"authsupported": Param("string", True), "base": Param("string", True, format="pve-volume-id"), "blocksize": Param("string", True), "bwlimit": Param("string", True, format=_Format_8bb3bf1ec711), "comstar_hg": Param("string", True), "comstar_tg": Param("string", True), "content": Param("string", True, format="pve-storage-content-list"), "content-dirs": Param("string", True, format="pve-dir-override-list"), "create-base-path": Param("boolean", True, default="yes"), "create-subdirs": Param("boolean", True, default="yes"), "data-pool": Param("string", True), "datastore": Param("string", True), "disable": Param("boolean", True), "domain": Param("string", True), "encryption-key": Param("string", True), "export": Param("string", True, format="pve-storage-path"), "fingerprint": Param("string", True), "format": Param("string", True, ("raw", "qcow2", "subvol", "vmdk")), "fs-name": Param("string", True, format="pve-configid"), "fuse": Param("boolean", True), "is_mountpoint": Param("string", True, default="no"), "iscsiprovider": Param("string", True), "keyring": Param("string", True), "krbd": Param("boolean", True, default=0), "lio_tpg": Param("string", True), "master-pubkey": Param("string", True), "max-protected-backups": Param("integer", True, minimum=-1, default="Unlimited for users with Datastore.Allocate privilege, 5 for other users"), "mkdir": Param("boolean", True, default="yes"), "monhost": Param("string", True, format="pve-storage-portal-dns-list"), "mountpoint": Param("string", True, format="pve-storage-path"), "namespace": Param("string", True), "nocow": Param("boolean", True, default=0), "nodes": Param("string", True, format="pve-node-list"), "nowritecache": Param("boolean", True), "options": Param("string", True, format="pve-storage-options"), "password": Param("string", True), "path": Param("string", True, format="pve-storage-path"), "pool": Param("string", True), "port": Param("integer", True, minimum=1, maximum=65535), "portal": Param("string", True, format="pve-storage-portal-dns"), "preallocation": Param("string", True, ("off", "metadata", "falloc", "full"), default="metadata"), "prune-backups": Param("string", True, format="prune-backups"), "saferemove": Param("boolean", True), "saferemove-stepsize": Param("integer", True, ("1", "2", "4", "8", "16", "32"), default=32), "saferemove_throughput": Param("string", True), "server": Param("string", True, format="pve-storage-server"), "share": Param("string", True), "shared": Param("boolean", True), "skip-cert-verification": Param("boolean", True, default="false"), "smbversion": Param("string", True, ("default", "2.0", "2.1", "3", "3.0", "3.11"), default="default"), "snapshot-as-volume-chain": Param("boolean", True, default=0), "sparse": Param("boolean", True), "storage": Param("string", False, format="pve-storage-id"), "subdir": Param("string", True, format="pve-storage-path"), "tagged_only": Param("boolean", True), "target": Param("string", True), "thinpool": Param("string", True, format="pve-storage-vgname"), "type": Param("string", False, ("btrfs", "cephfs", "cifs", "dir", "esxi", "iscsi", "iscsidirect", "lvm", "lvmthin", "nfs", "pbs", "rbd", "zfs", "zfspool")), "username": Param("string", True), "vgname": Param("string", True, format="pve-storage-vgname"), "zfs-base-path": Param("string", True, format="pve-storage-path")}, "object", ("config", "storage", "type")),
+    },
+    "/storage/{storage}": {
+        "DELETE": Method({"storage": Param("string", False, format="pve-storage-id")}, "null", ()),
+        "GET": Method({"storage": Param("string", False, format="pve-storage-id")}, "object", ()),
+        "PUT": Method({"blocksize": Param("string", True), "bwlimit": Param("string", True, format=_Format_8bb3bf1ec711), "comstar_hg": Param("string", True), "comstar_tg": Param("string", True), "content": Param("string", True, format="pve-storage-content-list"), "content-dirs": Param("string", True, format="pve-dir-override-list"), "create-base-path": Param("boolean", True, default="yes"), "create-subdirs": Param("boolean", True, default="yes"), "data-pool": Param("string", True), "delete": Param("string", True, format="pve-configid-list"), "digest": Param("string", True), "disable": Param("boolean", True), "domain": Param("string", True), "encryption-key": Param("string", True), "fingerprint": Param("string", True), "format": Param("string", True, ("raw", "qcow2", "subvol", "vmdk")), "fs-name": Param("string", True, format="pve-configid"), "fuse": Param("boolean", True), "is_mountpoint": Param("string", True, default="no"), "keyring": Param("string", True), "krbd": Param("boolean", True, default=0), "lio_tpg": Param("string", True), "master-pubkey": Param("string", True), "max-protected-backups": Param("integer", True, minimum=-1, default="Unlimited for users with Datastore.Allocate privilege, 5 for other users"), "mkdir": Param("boolean", True, default="yes"), "monhost": Param("string", True, format="pve-storage-portal-dns-list"), "mountpoint": Param("string", True, format="pve-storage-path"), "namespace": Param("string", True), "nocow": Param("boolean", True, default=0), "nodes": Param("string", True, format="pve-node-list"), "nowritecache": Param("boolean", True), "options": Param("string", True, format="pve-storage-options"), "password": Param("string", True), "pool": Param("string", True), "port": Param("integer", True, minimum=1, maximum=65535), "preallocation": Param("string", True, ("off", "metadata", "falloc", "full"), default="metadata"), "prune-backups": Param("string", True, format="prune-backups"), "saferemove": Param("boolean", True), "saferemove-stepsize": Param("integer", True, ("1", "2", "4", "8", "16", "32"), default=32), "saferemove_throughput": Param("string", True), "server": Param("string", True, format="pve-storage-server"), "shared": Param("boolean", True), "skip-cert-verification": Param("boolean", True, default="false"), "smbversion": Param("string", True, ("default", "2.0", "2.1", "3", "3.0", "3.11"), default="default"), "snapshot-as-volume-chain": Param("boolean", True, default=0), "sparse": Param("boolean", True), "storage": Param("string", False, format="pve-storage-id"), "subdir": Param("string", True, format="pve-storage-path"), "tagged_only": Param("boolean", True), "username": Param("string", True), "zfs-base-path": Param("string", True, format="pve-storage-path")}, "object", ("config", "storage", "type")),
+    },
+    "/access": {
+        "GET": Method({}, "array", ("subdir",)),
+    },
+    "/access/users": {
+        "GET": Method({"enabled": Param("boolean", True), "full": Param("boolean", True, default=0)}, "array", ("comment", "email", "enable", "expire", "firstname", "groups", "keys", "lastname", "realm-type", "tfa-locked-until", "tokens", "totp-locked", "userid")),
+        "POST": Method({"comment": Param("string", True), "email": Param("string", True, format="email-opt"), "enable": Param("boolean", True, default=1), "expire": Param("integer", True, minimum=0), "firstname": Param("string", True), "groups": Param("string", True, format="pve-groupid-list"), "keys": Param("string", True), "lastname": Param("string", True), "password": Param("string", True), "userid": Param("string", False, format="pve-userid")}, "null", ()),
+    },
+    "/access/users/{userid}": {
+        "DELETE": Method({"userid": Param("string", False, format="pve-userid")}, "null", ()),
+        "GET": Method({"userid": Param("string", False, format="pve-userid")}, "object", ("comment", "email", "enable", "expire", "firstname", "groups", "keys", "lastname", "tokens")),
+        "PUT": Method({"append": Param("boolean", True), "comment": Param("string", True), "email": Param("string", True, format="email-opt"), "enable": Param("boolean", True, default=1), "expire": Param("integer", True, minimum=0), "firstname": Param("string", True), "groups": Param("string", True, format="pve-groupid-list"), "keys": Param("string", True), "lastname": Param("string", True), "userid": Param("string", False, format="pve-userid")}, "null", ()),
+    },
+    "/access/users/{userid}/tfa": {
+        "GET": Method({"multiple": Param("boolean", True, default=0), "userid": Param("string", False, format="pve-userid")}, "object", ("realm", "types", "user")),
+    },
+    "/access/users/{userid}/unlock-tfa": {
+        "PUT": Method({"userid": Param("string", False, format="pve-userid")}, "boolean", ()),
+    },
+    "/access/users/{userid}/token": {
+        "GET": Method({"userid": Param("string", False, format="pve-userid")}, "array", ("comment", "expire", "privsep", "tokenid")),
+    },
+    "/access/users/{userid}/token/{tokenid}": {
+        "DELETE": Method({"tokenid": Param("string", False), "userid": Param("string", False, format="pve-userid")}, "null", ()),
+        "GET": Method({"tokenid": Param("string", False), "userid": Param("string", False, format="pve-userid")}, "object", ("comment", "expire", "privsep")),
+        "POST": Method({"comment": Param("string", True), "expire": Param("integer", True, minimum=0, default="same as user"), "privsep": Param("boolean", True, default=1), "tokenid": Param("string", False), "userid": Param("string", False, format="pve-userid")}, "object", ("full-tokenid", "info", "value")),
+        "PUT": Method({"comment": Param("string", True), "delete": Param("string", True, format="pve-configid-list"), "expire": Param("integer", True, minimum=0, default="same as user"), "privsep": Param("boolean", True, default=1), "tokenid": Param("string", False), "userid": Param("string", False, format="pve-userid")}, "object", ("comment", "expire", "privsep")),
+    },
+    "/access/groups": {
+        "GET": Method({}, "array", ("comment", "groupid", "users")),
+        "POST": Method({"comment": Param("string", True), "groupid": Param("string", False, format="pve-groupid")}, "null", ()),
+    },
+    "/access/groups/{groupid}": {
+        "DELETE": Method({"groupid": Param("string", False, format="pve-groupid")}, "null", ()),
+        "GET": Method({"groupid": Param("string", False, format="pve-groupid")}, "object", ("comment", "members")),
+        "PUT": Method({"comment": Param("string", True), "groupid": Param("string", False, format="pve-groupid")}, "null", ()),
+    },
+    "/access/roles": {
+        "GET": Method({}, "array", ("privs", "roleid", "special")),
+        "POST": Method({"privs": Param("string", True, format="pve-priv-list"), "roleid": Param("string", False, format="pve-roleid")}, "null", ()),
+    },
+    "/access/roles/{roleid}": {
+        "DELETE": Method({"roleid": Param("string", False, format="pve-roleid")}, "null", ()),
+        "GET": Method({"roleid": Param("string", False, format="pve-roleid")}, "object", ("Datastore.Allocate", "Datastore.AllocateSpace", "Datastore.AllocateTemplate", "Datastore.Audit", "Group.Allocate", "Mapping.Audit", "Mapping.Modify", "Mapping.Use", "Permissions.Modify", "Pool.Allocate", "Pool.Audit", "Realm.Allocate", "Realm.AllocateUser", "SDN.Allocate", "SDN.Audit", "SDN.Use", "Sys.AccessNetwork", "Sys.Audit", "Sys.Console", "Sys.Incoming", "Sys.Modify", "Sys.PowerMgmt", "Sys.Syslog", "User.Modify", "VM.Allocate", "VM.Audit", "VM.Backup", "VM.Clone", "VM.Config.CDROM", "VM.Config.CPU", "VM.Config.Cloudinit", "VM.Config.Disk", "VM.Config.HWType", "VM.Config.Memory", "VM.Config.Network", "VM.Config.Options", "VM.Console", "VM.GuestAgent.Audit", "VM.GuestAgent.FileRead", "VM.GuestAgent.FileSystemMgmt", "VM.GuestAgent.FileWrite", "VM.GuestAgent.Unrestricted", "VM.Migrate", "VM.PowerMgmt", "VM.Replicate", "VM.Snapshot", "VM.Snapshot.Rollback")),
+        "PUT": Method({"append": Param("boolean", True), "privs": Param("string", True, format="pve-priv-list"), "roleid": Param("string", False, format="pve-roleid")}, "null", ()),
+    },
+    "/access/acl": {
+        "GET": Method({}, "array", ("path", "propagate", "roleid", "type", "ugid")),
+        "PUT": Method({"delete": Param("boolean", True), "groups": Param("string", True, format="pve-groupid-list"), "path": Param("string", False), "propagate": Param("boolean", True, default=1), "roles": Param("string", False, format="pve-roleid-list"), "tokens": Param("string", True, format="pve-tokenid-list"), "users": Param("string", True, format="pve-userid-list")}, "null", ()),
+    },
+    "/access/domains": {
+        "GET": Method({}, "array", ("comment", "realm", "tfa", "type")),
+        "POST": Method({"acr-values": Param("string", True), "autocreate": Param("boolean", True, default=0), "base_dn": Param("string", True), "bind_dn": Param("string", True), "capath": Param("string", True, default="/etc/ssl/certs"), "case-sensitive": Param("boolean", True, default=1), "cert": Param("string", True), "certkey": Param("string", True), "check-connection": Param("boolean", True, default=0), "client-id": Param("string", True), "client-key": Param("string", True), "comment": Param("string", True), "default": Param("boolean", True), "domain": Param("string", True), "filter": Param("string", True), "group_classes": Param("string", True, format="ldap-simple-attr-list", default="groupOfNames, group, univentionGroup, ipausergroup"), "group_dn": Param("string", True), "group_filter": Param("string", True), "group_name_attr": Param("string", True, format="ldap-simple-attr"), "groups-autocreate": Param("boolean", True, default=0), "groups-claim": Param("string", True), "groups-overwrite": Param("boolean", True, default=0), "issuer-url": Param("string", True), "mode": Param("string", True, ("ldap", "ldaps", "ldap+starttls"), default="ldap"), "password": Param("string", True), "port": Param("integer", True, minimum=1, maximum=65535), "prompt": Param("string", True), "query-userinfo": Param("boolean", True, default=1), "realm": Param("string", False, format="pve-realm"), "scopes": Param("string", True, default="email profile"), "secure": Param("boolean", True), "server1": Param("string", True, format="address"), "server2": Param("string", True, format="address"), "sslversion": Param("string", True, ("tlsv1", "tlsv1_1", "tlsv1_2", "tlsv1_3")), "sync-defaults-options": Param("string", True, format="realm-sync-options"), "sync_attributes": Param("string", True), "tfa": Param("string", True, format="pve-tfa-config"), "type": Param("string", False, ("ad", "ldap", "openid", "pam", "pve")), "user_attr": Param("string", True), "user_classes": Param("string", True, format="ldap-simple-attr-list", default="inetorgperson, posixaccount, person, user"), "username-claim": Param("string", True), "verify": Param("boolean", True, default=0)}, "null", ()),
+    },
+    "/access/domains/{realm}": {
+        "DELETE": Method({"realm": Param("string", False, format="pve-realm")}, "null", ()),
+        "GET": Method({"realm": Param("string", False, format="pve-realm")}, "object", ()),
+        "PUT": Method({"acr-values": Param("string", True), "autocreate": Param("boolean", True, default=0), "base_dn": Param("string", True), "bind_dn": Param("string", True), "capath": Param("string", True, default="/etc/ssl/certs"), "case-sensitive": Param("boolean", True, default=1), "cert": Param("string", True), "certkey": Param("string", True), "check-connection": Param("boolean", True, default=0), "client-id": Param("string", True), "client-key": Param("string", True), "comment": Param("string", True), "default": Param("boolean", True), "delete": Param("string", True, format="pve-configid-list"), "digest": Param("string", True), "domain": Param("string", True), "filter": Param("string", True), "group_classes": Param("string", True, format="ldap-simple-attr-list", default="groupOfNames, group, univentionGroup, ipausergroup"), "group_dn": Param("string", True), "group_filter": Param("string", True), "group_name_attr": Param("string", True, format="ldap-simple-attr"), "groups-autocreate": Param("boolean", True, default=0), "groups-claim": Param("string", True), "groups-overwrite": Param("boolean", True, default=0), "issuer-url": Param("string", True), "mode": Param("string", True, ("ldap", "ldaps", "ldap+starttls"), default="ldap"), "password": Param("string", True), "port": Param("integer", True, minimum=1, maximum=65535), "prompt": Param("string", True), "query-userinfo": Param("boolean", True, default=1), "realm": Param("string", False, format="pve-realm"), "scopes": Param("string", True, default="email profile"), "secure": Param("boolean", True), "server1": Param("string", True, format="address"), "server2": Param("string", True, format="address"), "sslversion": Param("string", True, ("tlsv1", "tlsv1_1", "tlsv1_2", "tlsv1_3")), "sync-defaults-options": Param("string", True, format="realm-sync-options"), "sync_attributes": Param("string", True), "tfa": Param("string", True, format="pve-tfa-config"), "user_attr": Param("string", True), "user_classes": Param("string", True, format="ldap-simple-attr-list", default="inetorgperson, posixaccount, person, user"), "verify": Param("boolean", True, default=0)}, "null", ()),
+    },
+    "/access/domains/{realm}/sync": {
+        "POST": Method({"dry-run": Param("boolean", True, default=0), "enable-new": Param("boolean", True, default="1"), "full": Param("boolean", True), "purge": Param("boolean", True), "realm": Param("string", False, format="pve-realm"), "remove-vanished": Param("string", True, default="none"), "scope": Param("string", True, ("users", "groups", "both"))}, "string", ()),
+    },
+    "/access/openid": {
+        "GET": Method({}, "array", ("subdir",)),
+    },
+    "/access/openid/auth-url": {
+        "POST": Method({"realm": Param("string", False, format="pve-realm"), "redirect-url": Param("string", False)}, "string", ()),
+    },
+    "/access/openid/login": {
+        "POST": Method({"code": Param("string", False), "redirect-url": Param("string", False), "state": Param("string", False)}, "object", ("CSRFPreventionToken", "cap", "clustername", "ticket", "username")),
+    },
+    "/access/tfa": {
+        "GET": Method({}, "array", ("entries", "tfa-locked-until", "totp-locked", "userid")),
+    },
+    "/access/tfa/{userid}": {
+        "GET": Method({"userid": Param("string", False, format="pve-userid")}, "array", ("created", "description", "enable", "id", "type")),
+        "POST": Method({"challenge": Param("string", True), "description": Param("string", True), "password": Param("string", True), "totp": Param("string", True), "type": Param("string", False, ("totp", "u2f", "webauthn", "recovery", "yubico")), "userid": Param("string", False, format="pve-userid"), "value": Param("string", True)}, "object", ("challenge", "id", "recovery")),
+    },
+    "/access/tfa/{userid}/{id}": {
+        "DELETE": Method({"id": Param("string", False), "password": Param("string", True), "userid": Param("string", False, format="pve-userid")}, "null", ()),
+        "GET": Method({"id": Param("string", False), "userid": Param("string", False, format="pve-userid")}, "object", ("created", "description", "enable", "id", "type")),
+        "PUT": Method({"description": Param("string", True), "enable": Param("boolean", True), "id": Param("string", False), "password": Param("string", True), "userid": Param("string", False, format="pve-userid")}, "null", ()),
+    },
+    "/access/ticket": {
+        "GET": Method({}, "null", ()),
+        "POST": Method({"new-format": Param("boolean", True, default=1), "otp": Param("string", True), "password": Param("string", False), "path": Param("string", True), "privs": Param("string", True, format="pve-priv-list"), "realm": Param("string", True, format="pve-realm"), "tfa-challenge": Param("string", True), "username": Param("string", False)}, "object", ("CSRFPreventionToken", "clustername", "ticket", "username")),
+    },
+    "/access/vncticket": {
+        "POST": Method({"authid": Param("string", False), "path": Param("string", False), "privs": Param("string", False, format="pve-priv-list"), "vncticket": Param("string", False)}, "null", ()),
+    },
+    "/access/password": {
+        "PUT": Method({"confirmation-password": Param("string", True), "password": Param("string", False), "userid": Param("string", False, format="pve-userid")}, "null", ()),
+    },
+    "/access/permissions": {
+        "GET": Method({"path": Param("string", True), "userid": Param("string", True)}, "object", ()),
+    },
+    "/pools": {
+        "DELETE": Method({"poolid": Param("string", False, format="pve-poolid")}, "null", ()),
+        "GET": Method({"poolid": Param("string", True, format="pve-poolid"), "type": Param("string", True, ("qemu", "lxc", "storage"))}, "array", ("comment", "members", "poolid")),
+        "POST": Method({"comment": Param("string", True), "poolid": Param("string", False, format="pve-poolid")}, "null", ()),
+        "PUT": Method({"allow-move": Param("boolean", True, default=0), "comment": Param("string", True), "delete": Param("boolean", True, default=0), "poolid": Param("string", False, format="pve-poolid"), "storage": Param("string", True, format="pve-storage-id-list"), "vms": Param("string", True, format="pve-vmid-list")}, "null", ()),
+    },
+    "/pools/{poolid}": {
+        "DELETE": Method({"poolid": Param("string", False, format="pve-poolid")}, "null", ()),
+        "GET": Method({"poolid": Param("string", False, format="pve-poolid"), "type": Param("string", True, ("qemu", "lxc", "storage"))}, "object", ("comment", "members")),
+        "PUT": Method({"allow-move": Param("boolean", True, default=0), "comment": Param("string", True), "delete": Param("boolean", True, default=0), "poolid": Param("string", False, format="pve-poolid"), "storage": Param("string", True, format="pve-storage-id-list"), "vms": Param("string", True, format="pve-vmid-list")}, "null", ()),
+    },
+    "/version": {
+        "GET": Method({}, "object", ("console", "release", "repoid", "version")),
+    },
+}
@@ -0,0 +1,251 @@
+"""Checks of the parameters of a request against the schema, before it is sent.
+
+The generated classes and the lite runtime pass the keyword arguments of a call
+to the validator of its method, compiled once from the version's table: missing
+parameters, types, enums, bounds and the common named formats are caught without
+a round trip. `check=False` skips it for one call. Property strings are parsed and
+their keys checked the same way. What passes here can still be rejected by the
+server, which knows the formats not listed in FORMATS.
+
+Parameters the schema does not list are sent with an UnknownParameterWarning
+rather than rejected, the schema of a version can lag behind its servers.
+"""
+
+import importlib
+import re
+import warnings
+from functools import lru_cache
+from typing import Any, Callable, Mapping, Optional
+
+from . import properties
+from .schema import Format, Method, Param
+
+__all__ = ["UnknownParameterWarning", "Validator", "validator"]
+
+# What is wrong with a value, None if nothing is
+Check = Callable[[Any], Optional[str]]
+
+# The server takes form values, "1" is as good an integer as 1
+INTEGER = re.compile(r"[+-]?\d+")
+BOOLEANS = frozenset(("0", "1", "true", "false", "yes", "no", "on", "off"))
+# Lists like pve-configid-list are split on these
+SEPARATORS = re.compile(r"[;,\0\s]+")
+FORMATS: dict[str, re.Pattern[str]] = {
+    "pve-configid": re.compile(r"[a-z][a-z0-9_-]*", re.IGNORECASE),
+    "pve-node": re.compile(r"[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?"),
+    "pve-storage-id": re.compile(r"[a-z]([a-z0-9_.-]*[a-z0-9])?", re.IGNORECASE),
+    "pve-vmid": re.compile(r"[1-9][0-9]{2,8}"),
+}
+
+
+def integer(value: Any) -> Optional[str]:
+    if isinstance(value, bool) or not (
+        isinstance(value, int) or isinstance(value, str) and INTEGER.fullmatch(value)
+    ):
+        return f"{value!r} is not an integer"
+    return None
+
+
+def number(value: Any) -> Optional[str]:
+    if isinstance(value, bool):
+        return f"{value!r} is not a number"
+    try:
+        float(value)
+    except (TypeError, ValueError):
+        return f"{value!r} is not a number"
+    return None
+
+
+def boolean(value: Any) -> Optional[str]:
+    if isinstance(value, (bool, int)) and value in (0, 1):
+        return None
+    if isinstance(value, str) and value.lower() in BOOLEANS:
+        return None
+    return f"{value!r} is not a boolean"
+
+
+def string(value: Any) -> Optional[str]:
+    if isinstance(value, (str, int, float)):
+        return None
+    return f"{value!r} is not a string"
+
+
+def array(value: Any) -> Optional[str]:
+    if isinstance(value, (list, tuple, str)):
+        return None
+    return f"{value!r} is not a list"
+
+
+TYPES: dict[str, Check] = {
+    "integer": integer,
+    "number": number,
+    "boolean": boolean,
+    "string": string,
+    "array": array,
+}
+
+
+def formatted(name: str) -> Optional[Check]:
+    """Check of a named format, None if it is not one checked here."""
+    base, _, suffix = name.rpartition("-")
+    if suffix == "list" and base in FORMATS:
+        pattern = FORMATS[base]
+        return lambda value: next(
+            (
+                f"{item!r} in {value!r} is not a valid {base}"
+                for item in SEPARATORS.split(str(value))
+                if item and not pattern.fullmatch(item)
+            ),
+            None,
+        )
+    if name in FORMATS:
+        pattern = FORMATS[name]
+        return lambda value: (
+            None
+            if pattern.fullmatch(str(value))
+            else f"{value!r} is not a valid {name}"
+        )
+    return None
+
+
+def property_string(format: Format) -> Check:
+    """Check of a property string, its keys are checked like parameters."""
+    parser = properties.compiled(format)
+    keys = {name: compiled(param) for name, param in format.keys.items()}
+    required = [name for name, param in format.keys.items() if not param.optional]
+
+    def ret(value: Any) -> Optional[str]:
+        try:
+            values = parser.values(str(value))
+        except ValueError as invalid:
+            return str(invalid)
+        for name in required:
+            if name not in values:
+                return f"{name} is missing in {value!r}"
+        for key, each in values.items():
+            check = keys.get(key)
+            if check is None:
+                return f"{key} in {value!r} is not a key"
+            if (error := check(each)) is not None:
+                return f"{key} in {value!r}: {error}"
+        return None
+
+    return ret
+
+
+def compiled(param: Param) -> Check:
+    """Check of a parameter, its type first and then the rest."""
+    checks: list[Check] = []
+    if param.enum:
+        allowed = frozenset(map(str, param.enum))
+        checks.append(
+            lambda value: (
+                None
+                if str(value) in allowed
+                else f"{value!r} is not one of {sorted(allowed)}"
+            )
+        )
+    if param.minimum is not None:
+        minimum = param.minimum
+        checks.append(
+            lambda value: (
+                None if float(value) >= minimum else f"{value!r} is below {minimum}"
+            )
+        )
+    if param.maximum is not None:
+        maximum = param.maximum
+        checks.append(
+            lambda value: (
+                None if float(value) <= maximum else f"{value!r} is above {maximum}"
+            )
+        )
+    if isinstance(param.format, str) and (check := formatted(param.format)):
+        checks.append(check)
+    elif isinstance(param.format, Format):
+        checks.append(property_string(param.format))
+    kind = TYPES.get(param.type, string)
+
+    def ret(value: Any) -> Optional[str]:
+        error = kind(value)
+        for check in checks:
+            if error is not None:
+                break
+            error = check(value)
+        return error
+
+    return ret
+
+
+class UnknownParameterWarning(UserWarning):
+    """Parameters of a call the schema does not list, which are sent anyway."""
+
+
+class Validator:
+    """Checks the parameters of one method of an endpoint."""
+
+    def __init__(self, path: str, method: str, spec: Method) -> None:
+        self.name = f"{method} {path}"
+        self.additional = spec.additional
+        self.checks: dict[str, Check] = {}
+        # Parameters like net[n] for net0, net1, ...
+        self.indexed: list[tuple[re.Pattern[str], Check]] = []
+        in_path = set(re.findall(r"{([^}]+)}", path))
+        self.required = frozenset(
+            name
+            for name, param in spec.params.items()
+            if not param.optional and name not in in_path
+        )
+        for name, param in spec.params.items():
+            if name.endswith("[n]"):
+                pattern = re.compile(re.escape(name[: -len("[n]")]) + r"\d+")
+                self.indexed.append((pattern, compiled(param)))
+            else:
+                self.checks[name] = compiled(param)
+
+    def find(self, name: str) -> Optional[Check]:
+        check = self.checks.get(name)
+        if check is None:
+            check = next(
+                (check for pattern, check in self.indexed if pattern.fullmatch(name)),
+                None,
+            )
+        return check
+
+    def __call__(self, params: Mapping[str, Any]) -> None:
+        """Raise ValueError listing what is wrong with `params`, the keyword arguments of a call.
+
+        Parameters the schema does not list only warn, see UnknownParameterWarning.
+        """
+        errors = [
+            f"{name}: missing"
+            for name in sorted(self.required)
+            if params.get(name) is None
+        ]
+        unknown: list[str] = []
+        for name, value in params.items():
+            # Like requests, None leaves the parameter out
+            if value is None:
+                continue
+            check = self.find(name)
+            if check is None:
+                if not self.additional:
+                    unknown.append(name)
+            elif (error := check(value)) is not None:
+                errors.append(f"{name}: {error}")
+        if errors:
+            raise ValueError(f"Invalid parameters for {self.name}: {'; '.join(errors)}")
+        if unknown:
+            # Past the generated method, at its caller
+            warnings.warn(
+                f"Not parameters of {self.name} in the schema, sent anyway: {', '.join(unknown)}",
+                UnknownParameterWarning,
+                stacklevel=3,
+            )
+
+
+@lru_cache(maxsize=None)
+def validator(module: str, path: str, method: str) -> Validator:
+    """The validator of a method, from the table of the API version of `module`, e.g. its core."""
+    package = module.rpartition(".")[0]
+    table = importlib.import_module(package + ".table").ENDPOINTS
+    return Validator(path, method, table[path][method])
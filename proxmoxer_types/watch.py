@@ -0,0 +1,189 @@
+import threading
+from collections.abc import Callable, Collection, Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal, Optional
+
+if TYPE_CHECKING:
+    from .v9 import ProxmoxAPI
+
+    Resource = ProxmoxAPI.Cluster.Resources._Get.TypedDict
+
+__all__ = ["Event", "Subscription", "Watcher"]
+
+# Server side `type` filter of /cluster/resources
+ResourceClass = Literal["vm", "storage", "node", "sdn"]
+
+CLASSES: dict[ResourceClass, frozenset[str]] = {
+    "vm": frozenset(("qemu", "lxc", "openvz")),
+    "storage": frozenset(("storage",)),
+    "node": frozenset(("node",)),
+    "sdn": frozenset(("sdn",)),
+}
+
+
+@dataclass(frozen=True)
+class Event:
+    kind: Literal["added", "removed", "changed"]
+    id: str
+    resource: "Resource"
+    changes: dict[str, tuple[Any, Any]] = field(default_factory=dict)
+
+
+@dataclass(eq=False)
+class Subscription:
+    callback: Callable[[Event], None]
+    type: Optional[ResourceClass] = None
+    # Only deliver `changed` events touching one of these fields
+    fields: Optional[Collection[str]] = None
+
+    def wants(self, event: Event) -> bool:
+        if self.type is not None and event.resource["type"] not in CLASSES[self.type]:
+            return False
+        if event.kind == "changed" and self.fields is not None:
+            return not event.changes.keys().isdisjoint(self.fields)
+        return True
+
+
+@dataclass
+class Watcher:
+    api: "ProxmoxAPI"
+    min_interval: float = 2.0
+    max_interval: float = 60.0
+    backoff: float = 1.5
+    subscriptions: list[Subscription] = field(default_factory=list)
+    # Last snapshot per server side filter, keyed by resource id
+    index: dict[Optional[ResourceClass], dict[str, "Resource"]] = field(
+        default_factory=dict
+    )
+    # Called after every poll with its events, e.g. to refresh what /cluster/resources does not list
+    hooks: list[Callable[[list[Event]], None]] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self.interval = self.min_interval
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.thread: threading.Thread | None = None
+        # Subscriptions that got their initial snapshot
+        self.seeded: set[Subscription] = set()
+
+    def subscribe(
+        self,
+        callback: Callable[[Event], None],
+        type: Optional[ResourceClass] = None,
+        fields: Optional[Collection[str]] = None,
+    ) -> Subscription:
+        subscription = Subscription(callback=callback, type=type, fields=fields)
+        with self.lock:
+            self.subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self.lock:
+            self.subscriptions.remove(subscription)
+            self.seeded.discard(subscription)
+
+    def filters(self) -> set[Optional[ResourceClass]]:
+        types: set[Optional[ResourceClass]] = {
+            subscription.type for subscription in self.subscriptions
+        }
+        # One unfiltered fetch serves every subscriber once anybody needs all classes
+        return {None} if None in types or not types else types
+
+    def poll(self) -> list[Event]:
+        with self.lock:
+            subscriptions = list(self.subscriptions)
+            filters = self.filters()
+        # A new filter starts from what the others already saw, its first fetch only reports changes
+        for type in filters - self.index.keys():
+            seed = self.seed(type)
+            if seed is not None:
+                self.index[type] = seed
+        for stale in self.index.keys() - filters:
+            del self.index[stale]
+        events: list[Event] = []
+        for type in filters:
+            if type is None:
+                rows = self.api.cluster.resources.get()
+            else:
+                rows = self.api.cluster.resources.get(type=type)
+            events.extend(self.diff(type, rows))
+        for event in events:
+            for subscription in subscriptions:
+                if subscription in self.seeded and subscription.wants(event):
+                    subscription.callback(event)
+        # New subscriptions get everything they want as added, once
+        for subscription in subscriptions:
+            if subscription not in self.seeded:
+                index = self.index.get(None if None in filters else subscription.type)
+                for id, row in (index or {}).items():
+                    event = Event(kind="added", id=id, resource=row)
+                    if subscription.wants(event):
+                        subscription.callback(event)
+                self.seeded.add(subscription)
+        for hook in list(self.hooks):
+            hook(events)
+        if events:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * self.backoff, self.max_interval)
+        return events
+
+    def seed(self, type: Optional[ResourceClass]) -> Optional[dict[str, "Resource"]]:
+        """The snapshot of a filter taken from those of the others, None without any."""
+        if type is None:
+            if not self.index:
+                return None
+            # Classes nobody watched so far are reported as added
+            return {id: row for rows in self.index.values() for id, row in rows.items()}
+        if None not in self.index:
+            return None
+        return {
+            id: row
+            for id, row in self.index[None].items()
+            if row["type"] in CLASSES[type]
+        }
+
+    def diff(
+        self, type: Optional[ResourceClass], rows: list["Resource"]
+    ) -> list[Event]:
+        old = self.index.get(type, {})
+        new = {row["id"]: row for row in rows}
+        self.index[type] = new
+        events: list[Event] = []
+        for id, row in new.items():
+            before = old.get(id)
+            if before is None:
+                events.append(Event(kind="added", id=id, resource=row))
+            elif before != row:
+                events.append(
+                    Event(
+                        kind="changed", id=id, resource=row, changes=delta(before, row)
+                    )
+                )
+        for id in old.keys() - new.keys():
+            events.append(Event(kind="removed", id=id, resource=old[id]))
+        return events
+
+    def run(self) -> None:
+        while not self.stopped.is_set():
+            self.poll()
+            self.stopped.wait(self.interval)
+
+    def start(self) -> None:
+        if self.thread is None or not self.thread.is_alive():
+            self.stopped.clear()
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+
+    def stop(self) -> None:
+        self.stopped.set()
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join()
+
+
+def delta(old: Mapping[str, Any], new: Mapping[str, Any]) -> dict[str, tuple[Any, Any]]:
+    return {
+        key: (old.get(key), new.get(key))
+        for key in old.keys() | new.keys()
+        if old.get(key) != new.get(key)
+    }
@@ -0,0 +1,177 @@
+"""Parsed configs of guests and nodes, reused while their digest is unchanged.
+
+Endpoints like /nodes/{node}/qemu/{vmid}/config return the `digest` of the
+config. ConfigCache keeps the validated model and the parsed property strings
+of every config it fetched by path and digest: fetching a config that did not
+change reuses both without validating or parsing it again. With a Watcher it
+only fetches the configs of guests whose row in /cluster/resources changed in
+one of FIELDS, and the others once they are older than `max_age`.
+"""
+
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any, Optional
+
+from . import properties, runtime
+from .router import router
+from .watch import Event, Watcher
+
+if TYPE_CHECKING:
+    from .v9 import ProxmoxAPI
+
+__all__ = ["Config", "ConfigCache"]
+
+GUESTS = {
+    "qemu": "/nodes/{node}/qemu/{vmid}/config",
+    "lxc": "/nodes/{node}/lxc/{vmid}/config",
+}
+# Fields of /cluster/resources changing with the config, or when pending changes are applied
+FIELDS = (
+    "name",
+    "node",
+    "status",
+    "template",
+    "lock",
+    "tags",
+    "maxcpu",
+    "maxmem",
+    "maxdisk",
+    "hastate",
+)
+
+
+@dataclass(frozen=True)
+class Config:
+    path: str
+    digest: Optional[str]
+    # The model of the returned config, validated once per digest
+    model: Any
+    # The returned config with its property strings parsed, see proxmoxer_types.properties
+    values: dict[str, Any]
+    # time.monotonic() of the last fetch
+    fetched: float
+
+
+def validate(method: Any, data: Any) -> Any:
+    if isinstance(method, runtime.Method):
+        return runtime.validator(method.spec).validate_python(data)
+    return type(method).Model.model_validate(data)
+
+
+@dataclass
+class ConfigCache:
+    api: "ProxmoxAPI"
+    # Seconds after which a config is fetched again even without a change signal
+    max_age: float = 300.0
+    watcher: Optional[Watcher] = None
+    workers: int = 8
+    # Latest config by path, reused while the server returns the same digest
+    configs: dict[str, Config] = field(default_factory=dict)
+    # Paths to fetch again on their next lookup
+    stale: set[str] = field(default_factory=set)
+    # Fetches answered from the cache and fetches that were parsed
+    hits: int = 0
+    misses: int = 0
+
+    def __post_init__(self) -> None:
+        self.lock = threading.Lock()
+        self.module = type(self.api).__module__
+        self.package = self.module.rpartition(".")[0]
+        if self.watcher is not None:
+            self.watcher.subscribe(self.apply, type="vm", fields=FIELDS)
+
+    def fetch(self, path: str) -> Config:
+        """Fetch the config at `path`, parsing it only if its digest changed."""
+        route = router(self.package).match(path)
+        method = route.handle(self.api).get
+        data = method()
+        digest = data.get("digest")
+        now = time.monotonic()
+        with self.lock:
+            cached = self.configs.get(path)
+        hit = cached is not None and digest is not None and cached.digest == digest
+        if cached is not None and hit:
+            ret = replace(cached, fetched=now)
+        else:
+            values = properties.config(self.module, route.path)(data)
+            ret = Config(path, digest, validate(method, data), values, now)
+        with self.lock:
+            self.configs[path] = ret
+            self.stale.discard(path)
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return ret
+
+    def fresh(self, path: str) -> Optional[Config]:
+        """The cached config at `path` unless it is stale or expired."""
+        with self.lock:
+            config = self.configs.get(path)
+            if config is None or path in self.stale:
+                return None
+        return config if time.monotonic() - config.fetched < self.max_age else None
+
+    def get(self, path: str) -> Config:
+        """The config at `path`, only fetched if it is unknown, stale or expired."""
+        return self.fresh(path) or self.fetch(path)
+
+    def invalidate(self, path: str) -> None:
+        """Fetch the config at `path` again on its next lookup, e.g. after writing it."""
+        with self.lock:
+            self.stale.add(path)
+
+    def guest(self, node: str, vmid: int, type: str = "qemu") -> Config:
+        return self.get(GUESTS[type].format(node=node, vmid=vmid))
+
+    def refresh(self, paths: Iterable[str]) -> dict[str, Config]:
+        """The configs at `paths`, fetching those that are unknown, stale or expired in parallel."""
+        ret = {path: self.fresh(path) for path in paths}
+        missing = [path for path, config in ret.items() if config is None]
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            ret.update(zip(missing, pool.map(self.fetch, missing)))
+        return {path: config for path, config in ret.items() if config is not None}
+
+    def guests(self, poll: bool = True) -> dict[str, Config]:
+        """The configs of every guest in /cluster/resources, polling the watcher for changes first.
+
+        Pass `poll=False` while the watcher polls in its own thread.
+        """
+        if self.watcher is None:
+            raise ValueError("guests() needs a watcher")
+        if poll:
+            self.watcher.poll()
+        rows = [
+            row
+            for snapshot in list(self.watcher.index.values())
+            for row in snapshot.values()
+        ]
+        return self.refresh(
+            GUESTS[row["type"]].format(node=row["node"], vmid=row["vmid"])
+            for row in rows
+            if row["type"] in GUESTS and "node" in row and "vmid" in row
+        )
+
+    def apply(self, event: Event) -> None:
+        """Mark the config of a guest whose row in /cluster/resources changed as stale."""
+        resource = event.resource
+        template = GUESTS.get(resource["type"])
+        if template is None or "vmid" not in resource or "node" not in resource:
+            return
+        path = template.format(node=resource["node"], vmid=resource["vmid"])
+        with self.lock:
+            if event.kind == "removed":
+                self.configs.pop(path, None)
+                self.stale.discard(path)
+                return
+            self.stale.add(path)
+            # A migrated guest is gone from its previous node
+            if "node" in event.changes:
+                moved = template.format(
+                    node=event.changes["node"][0], vmid=resource["vmid"]
+                )
+                self.configs.pop(moved, None)
+                self.stale.discard(moved)
@@ -0,0 +1,251 @@
+"""mypy plugin typing the handles of the `lite` modules from the endpoint manifest.
+
+Enable it with `plugins = proxmoxer_types.mypy_plugin` and
+`always_true = PROXMOXER_PLUGIN` in the mypy configuration, the latter makes the
+lite modules declare their ProxmoxAPI without core. mypy then no longer analyzes the classes of `core`: `api.nodes("pve1").qemu`,
+`api("nodes/pve1/qemu")` and `resolve(api, "nodes/pve1/qemu")` are typed as
+`Resource[Literal["v9"], Literal["/nodes/{node}/qemu"]]`, and calling one of its
+methods returns the type the manifest lists for it, e.g. a TypedDict with the
+properties of an object. Only the paths a project uses are ever looked up.
+"""
+
+import importlib
+import re
+from functools import lru_cache
+from typing import Callable, Iterable, Optional, Sequence
+
+from mypy.checker import TypeChecker
+from mypy.nodes import Expression, TypeInfo
+from mypy.options import Options
+from mypy.plugin import (
+    AttributeContext,
+    CheckerPluginInterface,
+    FunctionContext,
+    MethodContext,
+    Plugin,
+)
+from mypy.typeops import try_getting_str_literals
+from mypy.types import (
+    AnyType,
+    Instance,
+    LiteralType,
+    NoneType,
+    ProperType,
+    Type,
+    TypedDictType,
+    TypeOfAny,
+    UnionType,
+    get_proper_type,
+)
+
+from .runtime import ALIASES, Node, Spec, root
+
+RESOURCE = "proxmoxer_types.runtime.Resource"
+METHOD = "proxmoxer_types.runtime.Method"
+RESOLVE = "proxmoxer_types.router.resolve"
+LITE = re.compile(r"proxmoxer_types\.(v\d+)\._lite\.ProxmoxAPI")
+PRIMITIVES = {
+    "string": "builtins.str",
+    "integer": "builtins.int",
+    "number": "builtins.float",
+    "boolean": "builtins.bool",
+}
+
+
+@lru_cache(maxsize=None)
+def node(version: str, path: str) -> Node:
+    """The node of the manifest of `version` for a path with its parameters, e.g. /nodes/{node}."""
+    if not path:
+        endpoints = importlib.import_module(f"proxmoxer_types.{version}.endpoints")
+        return root(endpoints.ENDPOINTS)
+    parent, _, segment = path.rpartition("/")
+    ret = node(version, parent)
+    if segment.startswith("{"):
+        assert ret.param is not None
+        return ret.param
+    return ret.children[ret.literals[segment]]
+
+
+def literal(api: CheckerPluginInterface, value: str) -> LiteralType:
+    return LiteralType(value, api.named_generic_type("builtins.str", []))
+
+
+def instance(api: CheckerPluginInterface, fullname: str, args: list[Type]) -> Instance:
+    # Looked up in the module itself, proxmoxer_types only lists the submodules imported by name
+    assert isinstance(api, TypeChecker)
+    module, _, name = fullname.rpartition(".")
+    info = api.modules[module].names[name].node
+    assert isinstance(info, TypeInfo)
+    return Instance(info, args)
+
+
+def resource(api: CheckerPluginInterface, version: str, path: str) -> Instance:
+    return instance(api, RESOURCE, [literal(api, version), literal(api, path)])
+
+
+def locate(type: Type) -> Optional[tuple[str, str]]:
+    """Version and path of a handle, None if it is not one the plugin typed."""
+    proper = get_proper_type(type)
+    if not isinstance(proper, Instance):
+        return None
+    for base in proper.type.mro:
+        if match := LITE.fullmatch(base.fullname):
+            return match.group(1), ""
+    if proper.type.fullname not in (RESOURCE, METHOD):
+        return None
+    args = [get_proper_type(arg) for arg in proper.args[:2]]
+    if not all(
+        isinstance(arg, LiteralType) and isinstance(arg.value, str) for arg in args
+    ):
+        return None
+    return tuple(str(arg.value) for arg in args if isinstance(arg, LiteralType))  # type: ignore[return-value]
+
+
+def walk(
+    api: CheckerPluginInterface,
+    version: str,
+    path: str,
+    args: Iterable[tuple[Expression, Type]],
+    context: Expression,
+) -> Type:
+    """The resource below `path` for the arguments of a call, like Resource.__call__ resolves it."""
+    current = node(version, path)
+    for expr, type in args:
+        strings = try_getting_str_literals(expr, type)
+        # Only literal strings can select fixed segments or span several
+        segments: Sequence[Optional[str]] = (
+            strings[0].strip("/").split("/")
+            if strings and len(strings) == 1
+            else [None]
+        )
+        for segment in segments:
+            if segment in current.literals:
+                child = current.children[current.literals[segment]]
+            elif current.param is not None:
+                child = current.param
+            else:
+                api.fail(
+                    f'"{current.path or "ProxmoxAPI"}" has no path below it', context
+                )
+                return AnyType(TypeOfAny.from_error)
+            current = child
+    return resource(api, version, current.path)
+
+
+def returned(api: CheckerPluginInterface, spec: Spec) -> ProperType:
+    """The type of the data of a spec, objects with properties become TypedDicts."""
+    kind, *rest = spec
+    if kind == "string" and rest:
+        return UnionType.make_union([literal(api, value) for value in rest[0]])
+    if kind in PRIMITIVES:
+        return api.named_generic_type(PRIMITIVES[kind], [])
+    if kind == "null":
+        return NoneType()
+    if kind == "array":
+        items = returned(api, rest[0]) if rest else AnyType(TypeOfAny.explicit)
+        return api.named_generic_type("builtins.list", [items])
+    if kind == "dict" or (kind == "object" and not rest):
+        values = returned(api, rest[0]) if rest else AnyType(TypeOfAny.explicit)
+        return api.named_generic_type(
+            "builtins.dict", [api.named_generic_type("builtins.str", []), values]
+        )
+    if kind == "object":
+        return TypedDictType(
+            {name: returned(api, prop) for name, _, prop, *_ in rest[0]},
+            {name for name, optional, *_ in rest[0] if not optional},
+            set(),
+            api.named_generic_type("typing._TypedDict", []),
+        )
+    return AnyType(TypeOfAny.explicit)
+
+
+def attribute(ctx: AttributeContext, name: str) -> Type:
+    located = locate(ctx.type)
+    if located is None:
+        return ctx.default_attr_type
+    version, path = located
+    current = node(version, path)
+    if name in current.children:
+        return resource(ctx.api, version, current.children[name].path)
+    method = name if name in current.methods else ALIASES.get(name)
+    if method in current.methods:
+        args: list[Type] = [
+            literal(ctx.api, version),
+            literal(ctx.api, path),
+            literal(ctx.api, method),
+        ]
+        return instance(ctx.api, METHOD, args)
+    ctx.api.fail(f'"{path or "ProxmoxAPI"}" has no attribute "{name}"', ctx.context)
+    return AnyType(TypeOfAny.from_error)
+
+
+def call(ctx: MethodContext) -> Type:
+    located = locate(ctx.type)
+    if located is None:
+        return ctx.default_return_type
+    version, path = located
+    args = zip(sum(ctx.args, []), sum(ctx.arg_types, []))
+    assert isinstance(ctx.context, Expression)
+    return walk(ctx.api, version, path, args, ctx.context)
+
+
+def method(ctx: MethodContext) -> Type:
+    located = locate(ctx.type)
+    proper = get_proper_type(ctx.type)
+    if located is None or not isinstance(proper, Instance):
+        return ctx.default_return_type
+    version, path = located
+    name = get_proper_type(proper.args[2])
+    assert isinstance(name, LiteralType)
+    return returned(ctx.api, node(version, path).methods[str(name.value)])
+
+
+def resolve(ctx: FunctionContext) -> Type:
+    if not ctx.arg_types[0]:
+        return ctx.default_return_type
+    located = locate(ctx.arg_types[0][0])
+    if located is None:
+        return ctx.default_return_type
+    version, path = located
+    args = zip(ctx.args[1], ctx.arg_types[1])
+    assert isinstance(ctx.context, Expression)
+    return walk(ctx.api, version, path, args, ctx.context)
+
+
+class ProxmoxerPlugin(Plugin):
+    def __init__(self, options: Options) -> None:
+        super().__init__(options)
+        # Left to the configuration, it is read before plugins load and cached with it
+        if "PROXMOXER_PLUGIN" not in options.always_true:
+            raise ValueError(
+                "proxmoxer_types.mypy_plugin needs always_true = PROXMOXER_PLUGIN"
+                " in the mypy configuration"
+            )
+
+    def get_attribute_hook(
+        self, fullname: str
+    ) -> Optional[Callable[[AttributeContext], Type]]:
+        prefix, _, name = fullname.rpartition(".")
+        if prefix == RESOURCE and not name.startswith("_"):
+            return lambda ctx: attribute(ctx, name)
+        return None
+
+    def get_method_hook(
+        self, fullname: str
+    ) -> Optional[Callable[[MethodContext], Type]]:
+        if fullname == f"{METHOD}.__call__":
+            return method
+        if fullname == f"{RESOURCE}.__call__" or LITE.fullmatch(
+            fullname.removesuffix(".__call__")
+        ):
+            return call
+        return None
+
+    def get_function_hook(
+        self, fullname: str
+    ) -> Optional[Callable[[FunctionContext], Type]]:
+        return resolve if fullname == RESOLVE else None
+
+
+def plugin(version: str) -> type[Plugin]:
+    return ProxmoxerPlugin
@@ -0,0 +1,269 @@
+import importlib
+import re
+from collections.abc import Collection, Iterable, Mapping
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any, Literal, Optional
+
+from .schema import Method
+
+if TYPE_CHECKING:
+    from .v9 import ProxmoxAPI
+
+__all__ = ["Plan", "Query", "guests"]
+
+GUESTS = ("qemu", "lxc")
+
+CLUSTER = "/cluster/resources"
+NODES = "/nodes"
+NODE = "/nodes/{node}/%s"
+GUEST = "/nodes/{node}/%s/{vmid}/status/current"
+
+# Fields known from the request path of node and guest scoped endpoints
+PATHFIELDS = frozenset(("id", "node", "type", "vmid"))
+PREFILTERS = frozenset(("node", "type", "vmid", "pool"))
+
+Strategy = Literal["cluster", "node", "guest"]
+
+
+@dataclass(frozen=True)
+class Plan:
+    strategy: Strategy
+    calls: int
+    # Endpoint -> parameters pushed down to the server
+    requests: dict[str, dict[str, Any]]
+
+
+def endpoints(api: "ProxmoxAPI") -> dict[str, dict[str, Method]]:
+    package = type(api).__module__.rpartition(".")[0]
+    table: dict[str, dict[str, Method]] = importlib.import_module(
+        package + ".table"
+    ).ENDPOINTS
+    return table
+
+
+def matches(row: Mapping[str, Any], filters: Mapping[str, Any]) -> bool:
+    for key, wanted in filters.items():
+        if key == "tag":
+            tags = set(re.split("[;, ]+", row.get("tags") or ""))
+            if tags.isdisjoint(values(wanted)):
+                return False
+        elif row.get(key) not in values(wanted):
+            return False
+    return True
+
+
+def covers(methods: Mapping[str, Optional[Method]], needed: set[str]) -> bool:
+    if not all(methods.values()):
+        return False
+    fields: set[str] = set(PATHFIELDS)
+    for method in methods.values():
+        if method:
+            fields.update(method.fields)
+    return needed <= fields
+
+
+def values(wanted: Any) -> list[Any]:
+    if isinstance(wanted, Collection) and not isinstance(wanted, str):
+        return list(wanted)
+    return [wanted]
+
+
+def guest_types(wanted: Any) -> Any:
+    """The guest types of a `type` filter, `vm` means all of them like for /cluster/resources."""
+    ret: list[str] = []
+    for each in values(wanted):
+        if each not in (*GUESTS, "vm"):
+            raise ValueError(
+                f"{each!r} is not a guest type, expected one of {', '.join(GUESTS)} or vm"
+            )
+        ret.extend(GUESTS if each == "vm" else (each,))
+    ret = list(dict.fromkeys(ret))
+    return ret[0] if len(ret) == 1 else ret
+
+
+@dataclass(frozen=True)
+class Query:
+    api: "ProxmoxAPI"
+    filters: dict[str, Any] = field(default_factory=dict)
+    selected: tuple[str, ...] = ()
+    # Cluster size estimates for the cost model
+    nodes: int = 3
+    guests: int = 30
+
+    def where(self, **filters: Any) -> "Query":
+        if "type" in filters:
+            filters["type"] = guest_types(filters["type"])
+        return replace(self, filters={**self.filters, **filters})
+
+    def fields(self, *fields: str) -> "Query":
+        return replace(self, selected=(*self.selected, *fields))
+
+    def estimate(self, nodes: int, guests: int) -> "Query":
+        return replace(self, nodes=nodes, guests=guests)
+
+    @property
+    def types(self) -> list[str]:
+        wanted = values(guest_types(self.filters.get("type", GUESTS)))
+        return [type for type in GUESTS if type in wanted]
+
+    @property
+    def prefilters(self) -> dict[str, Any]:
+        # Filters applicable before fanning out to one call per guest
+        return {key: value for key, value in self.filters.items() if key in PREFILTERS}
+
+    @property
+    def needed(self) -> set[str]:
+        keys = {"tags" if key == "tag" else key for key in self.filters}
+        return keys | set(self.selected)
+
+    def pushdown(self, method: Method, params: dict[str, Any]) -> dict[str, Any]:
+        for key, wanted in self.filters.items():
+            param = method.params.get(key)
+            if param is None or not param.optional or len(values(wanted)) != 1:
+                continue
+            if param.enum is None or wanted in param.enum:
+                params.setdefault(key, wanted)
+        return params
+
+    def candidates(self, fanout: bool = True) -> list[Plan]:
+        table = endpoints(self.api)
+        needed = self.needed
+        plans: list[Plan] = []
+
+        cluster = table.get(CLUSTER, {}).get("GET")
+        if cluster and needed <= set(cluster.fields):
+            params: dict[str, Any] = {}
+            if "type" in cluster.params and "vm" in (cluster.params["type"].enum or ()):
+                params["type"] = "vm"
+            plans.append(Plan("cluster", 1, {CLUSTER: params}))
+
+        nodes = values(self.filters["node"]) if "node" in self.filters else None
+        nodelist = 0 if nodes else 1
+        count = len(nodes) if nodes else self.nodes
+        methods: dict[str, Optional[Method]]
+        methods = {
+            NODE % type: table.get(NODE % type, {}).get("GET") for type in self.types
+        }
+        if covers(methods, needed):
+            requests: dict[str, dict[str, Any]] = {NODES: {}} if nodelist else {}
+            for path, method in methods.items():
+                assert method
+                params = {"full": 1} if "full" in method.params else {}
+                requests[path] = self.pushdown(method, params)
+            plans.append(Plan("node", nodelist + count * len(methods), requests))
+
+        methods = {
+            GUEST % type: table.get(GUEST % type, {}).get("GET") for type in self.types
+        }
+        if fanout and covers(methods, needed):
+            requests = {path: {} for path in methods}
+            if (
+                nodes
+                and len(nodes) == 1
+                and "vmid" in self.filters
+                and "pool" not in self.filters
+                and len(self.types) == 1
+            ):
+                # The paths are fully known, nothing to enumerate
+                plans.append(
+                    Plan(
+                        "guest",
+                        len(values(self.filters["vmid"])),
+                        requests,
+                    )
+                )
+            else:
+                listing = replace(
+                    self, selected=("node", "type", "vmid"), filters=self.prefilters
+                )
+                listing_plan = min(
+                    listing.candidates(fanout=False), key=lambda plan: plan.calls
+                )
+                count = (
+                    len(values(self.filters["vmid"]))
+                    if "vmid" in self.filters
+                    else self.guests
+                )
+                plans.append(
+                    Plan(
+                        "guest",
+                        listing_plan.calls + count,
+                        {**listing_plan.requests, **requests},
+                    )
+                )
+        return plans
+
+    def plan(self) -> Plan:
+        plans = self.candidates()
+        if not plans:
+            raise ValueError(f"No endpoint provides all of {sorted(self.needed)}")
+        return min(plans, key=lambda plan: plan.calls)
+
+    def fetch(self, plan: Plan) -> Iterable[dict[str, Any]]:
+        if plan.strategy == "cluster":
+            for row in self.api.cluster.resources.get(**plan.requests[CLUSTER]):
+                if row["type"] in self.types:
+                    yield dict(row)
+        elif plan.strategy == "node":
+            if NODES in plan.requests:
+                nodes = [node["node"] for node in self.api.nodes.get()]
+            else:
+                nodes = values(self.filters["node"])
+            for node in nodes:
+                for type in self.types:
+                    params = plan.requests[NODE % type]
+                    if type == "qemu":
+                        rows: Iterable[Mapping[str, Any]] = self.api.nodes(
+                            node
+                        ).qemu.get(**params)
+                    else:
+                        rows = self.api.nodes(node).lxc.get(**params)
+                    for item in rows:
+                        yield {
+                            **item,
+                            "node": node,
+                            "type": type,
+                            "id": f"{type}/{item['vmid']}",
+                        }
+        else:
+            guests: Iterable[Mapping[str, Any]]
+            if CLUSTER in plan.requests or NODE % self.types[0] in plan.requests:
+                strategy: Strategy = "cluster" if CLUSTER in plan.requests else "node"
+                guests = self.fetch(replace(plan, strategy=strategy))
+            else:
+                guests = (
+                    {"node": node, "type": self.types[0], "vmid": vmid}
+                    for node in values(self.filters["node"])
+                    for vmid in values(self.filters["vmid"])
+                )
+            for guest in guests:
+                if not matches(guest, self.prefilters):
+                    continue
+                node, type, vmid = guest["node"], guest["type"], int(guest["vmid"])
+                status: Mapping[str, Any]
+                if type == "qemu":
+                    status = self.api.nodes(node).qemu(vmid).status.current.get()
+                else:
+                    status = self.api.nodes(node).lxc(vmid).status.current.get()
+                yield {
+                    **guest,
+                    **status,
+                    "node": node,
+                    "type": type,
+                    "id": f"{type}/{vmid}",
+                }
+
+    def all(self) -> list[dict[str, Any]]:
+        ret = []
+        for row in self.fetch(self.plan()):
+            if matches(row, self.filters):
+                ret.append(
+                    {key: row.get(key) for key in self.selected}
+                    if self.selected
+                    else row
+                )
+        return ret
+
+
+def guests(api: "ProxmoxAPI", *fields: str) -> Query:
+    return Query(api=api, selected=fields)
@@ -0,0 +1,258 @@
+import bisect
+import importlib
+import math
+import mmap
+import os
+import re
+from array import array
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from .v9 import ProxmoxAPI
+
+__all__ = ["TIMEFRAMES", "Series", "Store"]
+
+Timeframe = Literal["hour", "day", "week", "month", "year", "decade"]
+
+# Consolidation steps (seconds) of the RRAs behind each rrddata `timeframe`. PVE 9
+# also has `decade` for nodes, with the one week steps of `year`, which covers it.
+TIMEFRAMES: dict[Timeframe, int] = {
+    "hour": 60,
+    "day": 30 * 60,
+    "week": 3 * 60 * 60,
+    "month": 12 * 60 * 60,
+    "year": 7 * 24 * 60 * 60,
+}
+
+RAW = "raw"
+TIME = "time"
+TIMECODE: Literal["q"] = "q"
+VALUECODE: Literal["d"] = "d"
+
+
+@dataclass
+class _Column:
+    path: Path
+    typecode: Literal["q", "d"]
+    stat: tuple[int, int] | None = None
+    map: mmap.mmap | None = None
+
+    def view(self) -> "memoryview[Any]":
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return memoryview(array(self.typecode))
+        if (stat.st_ino, stat.st_size) != self.stat:
+            # Stale maps are not closed: views handed out earlier may still export them
+            self.stat = (stat.st_ino, stat.st_size)
+            self.map = None
+            if stat.st_size:
+                with self.path.open("rb") as src:
+                    self.map = mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.map is None:
+            return memoryview(array(self.typecode))
+        return memoryview(self.map).cast(self.typecode)
+
+
+@dataclass
+class Series:
+    path: Path
+    columns: dict[tuple[str, str], _Column] = field(default_factory=dict)
+
+    def _column(self, tier: str, metric: str) -> _Column:
+        key = (tier, metric)
+        if key not in self.columns:
+            self.columns[key] = _Column(
+                path=self.path
+                / tier
+                / (metric + (".i64" if metric == TIME else ".f64")),
+                typecode=TIMECODE if metric == TIME else VALUECODE,
+            )
+        return self.columns[key]
+
+    def metrics(self, tier: str = RAW) -> list[str]:
+        if not (self.path / tier).is_dir():
+            return []
+        return sorted(entry.stem for entry in (self.path / tier).glob("*.f64"))
+
+    def time(self, tier: str = RAW) -> "memoryview[Any]":
+        return self._column(tier, TIME).view()
+
+    def column(self, metric: str, tier: str = RAW) -> "memoryview[Any]":
+        return self._column(tier, metric).view()
+
+    def __len__(self) -> int:
+        return len(self.time())
+
+    def range(
+        self,
+        start: int | None = None,
+        end: int | None = None,
+        metrics: Iterable[str] | None = None,
+        tier: str = RAW,
+    ) -> "dict[str, memoryview[Any]]":
+        time = self.time(tier)
+        lo = 0 if start is None else bisect.bisect_left(time, start)
+        hi = len(time) if end is None else bisect.bisect_right(time, end)
+        ret = {TIME: time[lo:hi]}
+        for metric in self.metrics(tier) if metrics is None else metrics:
+            column = self.column(metric, tier)
+            ret[metric] = column[lo:hi] if len(column) else column
+        return ret
+
+    def numpy(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        numpy: Any = importlib.import_module("numpy")
+        return {
+            name: numpy.frombuffer(view, dtype=view.format)
+            for name, view in self.range(*args, **kwargs).items()
+        }
+
+    def _append(self, tier: str, rows: list[Mapping[str, Any]]) -> int:
+        time = self.time(tier)
+        last = time[-1] if len(time) else None
+        rows = sorted(
+            (
+                row
+                for row in rows
+                if row.get(TIME) is not None and (last is None or int(row[TIME]) > last)
+            ),
+            key=lambda row: int(row[TIME]),
+        )
+        if not rows:
+            return 0
+        count = len(time)
+        (self.path / tier).mkdir(parents=True, exist_ok=True)
+        metrics = set(self.metrics(tier))
+        metrics.update(
+            key
+            for row in rows
+            for key, value in row.items()
+            if key != TIME and _numeric(value)
+        )
+        for metric in sorted(metrics):
+            column = self._column(tier, metric)
+            with column.path.open("ab") as dst:
+                # Columns first seen now are back-filled so every file keeps the same row count
+                missing = count - dst.tell() // 8
+                if missing < 0:
+                    # Leftovers of an append interrupted before its timestamps were written
+                    dst.truncate(count * 8)
+                elif missing > 0:
+                    array(VALUECODE, [math.nan] * missing).tofile(dst)
+                array(VALUECODE, (_float(row.get(metric)) for row in rows)).tofile(dst)
+        with self._column(tier, TIME).path.open("ab") as dst:
+            array(TIMECODE, (int(row[TIME]) for row in rows)).tofile(dst)
+        return len(rows)
+
+    def append(self, rows: Iterable[Mapping[str, Any]]) -> int:
+        return self._append(RAW, list(rows))
+
+    def compact(self, keep: int | None = None) -> None:
+        time = self.time()
+        if not len(time):
+            return
+        metrics = self.metrics()
+        columns = {metric: self.column(metric) for metric in metrics}
+        for tier, step in TIMEFRAMES.items():
+            tiertime = self.time(tier)
+            first = (tiertime[-1] + step) if len(tiertime) else None
+            # Only completed buckets are consolidated, the current one is left for the next run
+            complete = time[-1] // step * step
+            lo = 0 if first is None else bisect.bisect_left(time, first)
+            buckets: dict[int, list[int]] = {}
+            for index in range(lo, len(time)):
+                bucket = time[index] // step * step
+                if bucket >= complete:
+                    break
+                buckets.setdefault(bucket, []).append(index)
+            self._append(
+                tier,
+                [
+                    {
+                        TIME: bucket,
+                        **{
+                            metric: _average(columns[metric], indexes)
+                            for metric in metrics
+                        },
+                    }
+                    for bucket, indexes in buckets.items()
+                ],
+            )
+        if keep is not None:
+            # Rows of buckets still to be consolidated by some tier are kept whatever their age
+            incomplete = min(time[-1] // step * step for step in TIMEFRAMES.values())
+            cut = bisect.bisect_left(time, min(time[-1] - keep, incomplete))
+            if cut:
+                self._truncate(RAW, cut)
+
+    def _truncate(self, tier: str, rows: int) -> None:
+        for metric in (TIME, *self.metrics(tier)):
+            column = self._column(tier, metric)
+            tmp = column.path.with_suffix(".tmp")
+            with column.path.open("rb") as src, tmp.open("wb") as dst:
+                src.seek(rows * 8)
+                while chunk := src.read(1 << 20):
+                    dst.write(chunk)
+            os.replace(tmp, column.path)
+
+
+@dataclass
+class Store:
+    root: Path
+    series: dict[tuple[str, str], Series] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self.root = Path(self.root)
+
+    def __call__(self, kind: str, id: str | int) -> Series:
+        key = (kind, str(id))
+        if key not in self.series:
+            for part in key:
+                if not re.fullmatch("[A-Za-z0-9_.-]+", part) or part in (".", ".."):
+                    raise ValueError(f"Invalid series {kind}/{id}")
+            self.series[key] = Series(path=self.root / kind / key[1])
+        return self.series[key]
+
+    def collect(
+        self,
+        api: "ProxmoxAPI",
+        node: str,
+        vmid: int | None = None,
+        kind: Literal["node", "qemu", "lxc"] = "qemu",
+        timeframe: Timeframe = "hour",
+        cf: Literal["AVERAGE", "MAX"] = "AVERAGE",
+    ) -> int:
+        if kind == "node":
+            rows = api.nodes(node).rrddata.get(timeframe=timeframe, cf=cf)
+            return self(kind, node).append(rows)
+        if timeframe == "decade":
+            raise ValueError(f"{kind} rrddata has no decade timeframe")
+        if vmid is None:
+            raise ValueError(f"{kind} rrddata needs a vmid")
+        if kind == "qemu":
+            rows = api.nodes(node).qemu(vmid).rrddata.get(timeframe=timeframe, cf=cf)
+        else:
+            rows = api.nodes(node).lxc(vmid).rrddata.get(timeframe=timeframe, cf=cf)
+        return self(kind, vmid).append(rows)
+
+
+def _numeric(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _float(value: Any) -> float:
+    return float(value) if _numeric(value) else math.nan
+
+
+def _average(column: "memoryview[Any]", indexes: list[int]) -> float:
+    if not len(column):
+        return math.nan
+    values = [
+        column[index]
+        for index in indexes
+        if index < len(column) and not math.isnan(column[index])
+    ]
+    return math.fsum(values) / len(values) if values else math.nan
@@ -0,0 +1,252 @@
+"""ProxmoxAPI built on demand from the endpoint manifest of an API version.
+
+The `core` module of a version spells every endpoint out as a class, which
+makes importing it slow and big. The classes here provide the same handles from
+the tuples of the version's `endpoints` module: a resource is created when it
+is first accessed and the validator of a returned type when it is first used.
+Type checkers see the classes of `core`, see the `lite` module of a version.
+With proxmoxer_types.mypy_plugin mypy sees these instead, the plugin fills in
+the version and path of a handle as its type arguments.
+"""
+
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from typing import Any, ClassVar, Generic, Literal, Optional, TypeAlias, TypeVar
+
+import proxmoxer
+import pydantic
+
+from . import validation
+
+# Returned type: ("string",), ("string", enum), ("integer",), ("number",), ("boolean",),
+# ("null",), ("any",), ("array",), ("array", items), ("dict", values), ("object",)
+# or ("object", properties) where a property is (name, optional, type[, attribute])
+Spec: TypeAlias = tuple[Any, ...]
+# (path, attribute of its last segment or "" for a parameter, ((method, returned type), ...))
+Endpoints: TypeAlias = tuple[tuple[str, str, tuple[tuple[str, Spec], ...]], ...]
+
+PRIMITIVES: dict[str, Any] = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "null": None,
+    "any": Any,
+}
+ALIASES = {"create": "post", "set": "put"}
+# How a segment of a path is passed to the proxmoxer resource
+Kind: TypeAlias = Literal["param", "attribute", "call"]
+
+# Version, path and method of a handle as literals, only filled in by the mypy plugin
+V = TypeVar("V")
+P = TypeVar("P")
+M = TypeVar("M")
+
+
+class BaseModel(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(extra="allow")
+
+
+@lru_cache(maxsize=None)
+def annotation(spec: Spec) -> Any:
+    """The type `core` annotates a value of this spec with, objects with properties become models."""
+    kind, *rest = spec
+    if kind == "string" and rest:
+        return Literal[rest[0]]
+    if kind in PRIMITIVES:
+        return PRIMITIVES[kind]
+    if kind == "array":
+        return list[annotation(rest[0]) if rest else Any]  # type: ignore[misc]
+    if kind == "dict":
+        return dict[str, annotation(rest[0])]  # type: ignore[misc]
+    if not rest:
+        return dict[str, Any]
+    fields: dict[str, Any] = {}
+    for name, optional, prop, *attribute in rest[0]:
+        type = annotation(prop)
+        alias = {"alias": name} if attribute else {}
+        if optional:
+            fields[attribute[0] if attribute else name] = (
+                Optional[type],
+                pydantic.Field(default=None, **alias),
+            )
+        else:
+            fields[attribute[0] if attribute else name] = (
+                type,
+                pydantic.Field(**alias),
+            )
+    return pydantic.create_model("Model", __base__=BaseModel, **fields)
+
+
+@lru_cache(maxsize=None)
+def validator(spec: Spec) -> "pydantic.TypeAdapter[Any]":
+    return pydantic.TypeAdapter(annotation(spec))
+
+
+Entry: TypeAlias = tuple[str, str, tuple[tuple[str, Spec], ...]]
+
+
+@lru_cache(maxsize=None)
+def index(endpoints: Endpoints) -> dict[str, list[Entry]]:
+    """Endpoints by the path of their parent."""
+    ret: dict[str, list[Entry]] = {}
+    for entry in endpoints:
+        ret.setdefault(entry[0].rpartition("/")[0], []).append(entry)
+    return ret
+
+
+@dataclass
+class Node:
+    """A path of the manifest, the nodes below it are only made when first looked up."""
+
+    endpoints: Endpoints
+    path: str
+    # Segments of the path, each a parameter, an attribute of the proxmoxer resource or called with it
+    segments: tuple[tuple[str, Kind], ...]
+    methods: dict[str, Spec]
+
+    @cached_property
+    def children(self) -> dict[str, "Node"]:
+        return {
+            attribute: self.child(entry)
+            for entry in index(self.endpoints).get(self.path, ())
+            if (attribute := entry[1])
+        }
+
+    @cached_property
+    def literals(self) -> dict[str, str]:
+        """Attributes of the children by the segment of their path."""
+        return {
+            child.path.rpartition("/")[2]: attribute
+            for attribute, child in self.children.items()
+        }
+
+    @cached_property
+    def param(self) -> Optional["Node"]:
+        return next(
+            (
+                self.child(entry)
+                for entry in index(self.endpoints).get(self.path, ())
+                if not entry[1]
+            ),
+            None,
+        )
+
+    def child(self, entry: Entry) -> "Node":
+        path, attribute, methods = entry
+        segment = path.rpartition("/")[2]
+        kind: Kind = (
+            "param"
+            if not attribute
+            else "attribute" if attribute == segment else "call"
+        )
+        step: tuple[str, Kind] = (segment, kind)
+        return Node(self.endpoints, path, self.segments + (step,), dict(methods))
+
+
+class Method(Generic[V, P, M]):
+    """Calls one method of an endpoint, `model` validates the returned data like the generated classes."""
+
+    def __init__(self, resource: "Resource[V, P]", method: str, spec: Spec) -> None:
+        self.resource = resource
+        self.method = method
+        self.spec = spec
+
+    def __call__(self, *args: Any, check: bool = True, **kwargs: Any) -> Any:
+        if check:
+            validation.validator(
+                type(self.resource._api).__module__,
+                self.resource._node.path,
+                self.method.upper(),
+            )(kwargs)
+        return getattr(self.resource._target(), self.method)(*args, **kwargs)
+
+    def model(self, *args: Any, check: bool = True, **kwargs: Any) -> Any:
+        return validator(self.spec).validate_python(self(*args, check=check, **kwargs))
+
+    def __repr__(self) -> str:
+        return f"<{self.method.upper()} {self.resource._node.path}>"
+
+
+class Resource(Generic[V, P]):
+    """A path of the API, its attributes are the paths below it and its methods."""
+
+    def __init__(self, api: "ProxmoxAPI", node: Node, params: tuple[Any, ...]) -> None:
+        # Underscores keep these apart from the attributes of the paths
+        self._api = api
+        self._node = node
+        self._params = params
+        self._calls: dict[Any, Resource[V, Any]] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        node: Optional[Node] = self.__dict__.get("_node")
+        if node is None:
+            raise AttributeError(name)
+        ret: Resource[V, Any] | Method[V, P, Any]
+        if name in node.children:
+            ret = Resource(self._api, node.children[name], self._params)
+        elif name in node.methods:
+            ret = Method(self, name, node.methods[name])
+        elif ALIASES.get(name) in node.methods:
+            ret = getattr(self, ALIASES[name])
+        else:
+            raise AttributeError(f"{node.path or 'ProxmoxAPI'} has no {name!r}")
+        # Later lookups find it without calling __getattr__, like the cached properties of core
+        self.__dict__[name] = ret
+        return ret
+
+    def __call__(self, *segments: Any) -> "Resource[V, Any]":
+        """The resource below this one, like proxmoxer's `api("nodes/pve1")` or `api.nodes("pve1")`."""
+        ret: Resource[V, Any] = self
+        for segment in segments:
+            parts = (
+                segment.strip("/").split("/") if isinstance(segment, str) else [segment]
+            )
+            for part in parts:
+                ret = ret._child(part)
+        return ret
+
+    def _child(self, segment: Any) -> "Resource[V, Any]":
+        # Fixed segments win over parameters, like on the server
+        if isinstance(segment, str) and segment in self._node.literals:
+            ret: Resource[V, Any] = getattr(self, self._node.literals[segment])
+            return ret
+        if self._node.param is None:
+            raise TypeError(f"{self._node.path or 'ProxmoxAPI'} has no {segment!r}")
+        if segment not in self._calls:
+            self._calls[segment] = Resource(
+                self._api, self._node.param, self._params + (segment,)
+            )
+        return self._calls[segment]
+
+    def _target(self) -> Any:
+        # Looked up on every call like the generated classes do
+        ret: Any = self._api.proxmox_api
+        params = iter(self._params)
+        for segment, kind in self._node.segments:
+            if kind == "param":
+                ret = ret(next(params))
+            elif kind == "attribute":
+                ret = getattr(ret, segment)
+            else:
+                ret = ret(segment)
+        return ret
+
+    def __repr__(self) -> str:
+        return f"<{self._node.path or 'ProxmoxAPI'} {self._params}>"
+
+
+@lru_cache(maxsize=None)
+def root(endpoints: Endpoints) -> Node:
+    return Node(endpoints, "", (), {})
+
+
+class ProxmoxAPI(Resource[Any, Literal[""]]):
+    """Root resource, a subclass per API version sets `_endpoints`."""
+
+    _endpoints: ClassVar[Endpoints] = ()
+    proxmox_api: proxmoxer.ProxmoxAPI
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.proxmox_api = proxmoxer.ProxmoxAPI(*args, **kwargs)
+        super().__init__(self, root(self._endpoints), ())
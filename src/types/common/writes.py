@@ -0,0 +1,219 @@
+"""Writes of configs that only send what changed.
+
+Every PUT of a config takes its lock and bumps its digest, even when it sets
+the values the config already has. `changes` compares the desired values with
+the current config, with the types and property strings of the version's table,
+and returns the parameters of a single write: the changed values, the keys to
+`delete`, and the `digest` of the config the comparison was made against, so
+the server rejects the write if the config changed since. It returns None if
+nothing changed. PVE leaves keys at their default out of a config, a missing
+key is compared with the `default` of the schema. The generated config methods taking a digest call it from
+`update()`, Batch merges the changes of many calls per config.
+"""
+
+import importlib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Mapping, Optional
+
+import pydantic
+
+from . import properties
+from .configs import ConfigCache
+from .router import router
+from .schema import Param
+
+if TYPE_CHECKING:
+    from .v9 import ProxmoxAPI
+
+__all__ = ["Batch", "BatchError", "Diff", "changes"]
+
+
+class Diff:
+    """Compares values with the config of one endpoint for one of its writing methods."""
+
+    def __init__(self, module: str, path: str, method: str) -> None:
+        table = importlib.import_module(module.rpartition(".")[0] + ".table").ENDPOINTS
+        self.params: dict[str, Param] = table[path][method].params
+        self.config = properties.config(module, path)
+
+    def param(self, key: str) -> Optional[Param]:
+        match = properties.INDEXED.fullmatch(key)
+        return self.params.get(key) or (
+            self.params.get(match.group(1) + "[n]") if match else None
+        )
+
+    def text(self, key: str, value: Any) -> Any:
+        """The value to send for `key`, models and mappings of property strings are dumped."""
+        string = self.config.lookup(key)
+        if string is not None and isinstance(value, (Mapping, pydantic.BaseModel)):
+            return string.dump(value)
+        return value
+
+    def canonical(self, key: str, value: Any) -> Any:
+        string = self.config.lookup(key)
+        param = self.param(key)
+        try:
+            if string is not None:
+                return string.values(self.text(key, value))
+            if param is not None and param.type == "boolean":
+                return properties.BOOLEANS.get(properties.text(value).lower(), value)
+            if param is not None and param.type == "integer":
+                return int(value)
+            if param is not None and param.type == "number":
+                return float(value)
+        except (TypeError, ValueError):
+            # Invalid values never match, the write reports them
+            return value
+        return properties.text(value)
+
+    def equal(self, key: str, old: Any, new: Any) -> bool:
+        return bool(self.canonical(key, old) == self.canonical(key, new))
+
+    def unchanged(self, current: Mapping[str, Any], key: str, value: Any) -> bool:
+        if key in current:
+            return self.equal(key, current[key], value)
+        # Configs leave out keys at their default
+        param = self.param(key)
+        if param is None or param.default is None:
+            return False
+        return self.equal(key, param.default, value)
+
+    def __call__(
+        self, current: Mapping[str, Any], desired: Mapping[str, Any]
+    ) -> Optional[dict[str, Any]]:
+        ret: dict[str, Any] = {}
+        delete = {
+            key
+            for key in str(desired.get("delete") or "").replace(";", ",").split(",")
+            if key in current
+        }
+        for key, value in desired.items():
+            if key in ("delete", "digest"):
+                continue
+            if value is None:
+                if key in current:
+                    delete.add(key)
+            elif not self.unchanged(current, key, value):
+                ret[key] = self.text(key, value)
+        if not ret and not delete:
+            return None
+        if delete:
+            ret["delete"] = ",".join(sorted(delete))
+        digest = desired.get("digest", current.get("digest"))
+        if digest is not None:
+            ret["digest"] = digest
+        return ret
+
+
+@lru_cache(maxsize=None)
+def diff(module: str, path: str, method: str) -> Diff:
+    return Diff(module, path, method)
+
+
+def changes(
+    module: str,
+    path: str,
+    method: str,
+    current: Mapping[str, Any],
+    desired: Mapping[str, Any],
+) -> Optional[dict[str, Any]]:
+    """Parameters writing `desired` over the config `current`, None if it already has them.
+
+    Keys set to None are deleted. Values of property strings may be models or
+    mappings and are compared by their keys, like numbers and booleans by value.
+    Keys missing from `current` have their default.
+    """
+    return diff(module, path, method)(current, desired)
+
+
+class BatchError(Exception):
+    """Writes of a flush that failed, the others were sent or skipped."""
+
+    def __init__(
+        self, errors: dict[str, BaseException], written: dict[str, dict[str, Any]]
+    ) -> None:
+        super().__init__(
+            "; ".join(
+                f"Writing {path} failed: {error}" for path, error in errors.items()
+            )
+        )
+        # Errors by path, and the parameters sent by path like flush() returns them
+        self.errors = errors
+        self.written = written
+
+
+@dataclass
+class Batch:
+    """Changes of many configs, merged into at most one write per config.
+
+    The current configs come from `cache`, a stale one makes the server reject
+    the write because of its digest and is fetched again on the next flush.
+    """
+
+    api: "ProxmoxAPI"
+    cache: Optional[ConfigCache] = None
+    # Method writing the configs, POST for the asynchronous /nodes/{node}/qemu/{vmid}/config
+    method: str = "PUT"
+    # Desired values by path, waiting for flush()
+    pending: dict[str, dict[str, Any]] = field(default_factory=dict)
+    # Writes sent and writes skipped because the config already matched
+    sent: int = 0
+    skipped: int = 0
+
+    def __post_init__(self) -> None:
+        self.lock = threading.Lock()
+        self.configs = self.cache or ConfigCache(self.api)
+        self.module = type(self.api).__module__
+
+    def set(self, path: str, **values: Any) -> None:
+        """Stage values for the config at `path`, later values of a key win."""
+        with self.lock:
+            # A new dict, a write in flight leaves these pending
+            self.pending[path] = {**self.pending.get(path, {}), **values}
+
+    def write(self, path: str, values: dict[str, Any]) -> Optional[dict[str, Any]]:
+        route = router(self.module.rpartition(".")[0]).match(path)
+        config = self.configs.get(path)
+        params = changes(self.module, route.path, self.method, config.values, values)
+        if params is not None:
+            try:
+                getattr(route.handle(self.api), self.method.lower())(**params)
+            finally:
+                # The digest changed, or the write was rejected because it had
+                self.configs.invalidate(path)
+        with self.lock:
+            if self.pending.get(path) is values:
+                del self.pending[path]
+            if params is None:
+                self.skipped += 1
+            else:
+                self.sent += 1
+        return params
+
+    def flush(self) -> dict[str, dict[str, Any]]:
+        """Write the pending changes in parallel, returns the parameters sent by path.
+
+        Every write runs, if any failed BatchError reports all of them once the
+        others are done. Configs whose write failed stay pending.
+        """
+        with self.lock:
+            pending = dict(self.pending)
+        with ThreadPoolExecutor(max_workers=self.configs.workers) as pool:
+            futures: dict[str, Future[Optional[dict[str, Any]]]] = {
+                path: pool.submit(self.write, path, values)
+                for path, values in pending.items()
+            }
+        ret: dict[str, dict[str, Any]] = {}
+        errors: dict[str, BaseException] = {}
+        for path, future in futures.items():
+            error = future.exception()
+            if error is not None:
+                errors[path] = error
+            elif (params := future.result()) is not None:
+                ret[path] = params
+        if errors:
+            raise BatchError(errors, ret)
+        return ret
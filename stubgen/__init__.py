@@ -1,13 +1,15 @@
+import hashlib
+import io
 import keyword
 import re
 import textwrap
 
-from dataclasses import dataclass
-from functools import cached_property
-from typing import Any, Callable, Literal, Optional, Self, TypeAlias, Union, assert_never
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Literal, Optional, Protocol, Self, TypeAlias, Union, assert_never, runtime_checkable
 
 import pydantic
-from jinja2 import Template
+from jinja2 import Environment, Template
 
 LATEST = 'v9'
 
@@ -22,26 +24,134 @@ ApiSchemaItemInfoMethodReturns: TypeAlias = Union[
     "ApiSchemaItemInfoMethodReturnsString",
 ]
 
+from .formatting import literal
 from .patches import Patch
 
-def render(template: str, *args: Any, **kwargs: Any) -> str:
-    return Template(textwrap.dedent(template)).render(
-        str=str, repr=repr, *args, **kwargs
-    )
+if TYPE_CHECKING:
+    from .fragments import Fragments
+
+# Templates are laid out like the code they render, lines holding only a block tag leave nothing behind
+ENVIRONMENT = Environment(trim_blocks=True, lstrip_blocks=True, keep_trailing_newline=True)
+ENVIRONMENT.globals.update(str=str, literal=literal)
+
+
+@lru_cache(maxsize=None)
+def template(source: str) -> Template:
+    return ENVIRONMENT.from_string(textwrap.dedent(source).removeprefix("\n"))
+
+
+class Sink(Protocol):
+    def write(self, text: str, /) -> int: ...
+
+
+@runtime_checkable
+class Recording(Protocol):
+    def define(self, name: str, text: str, /) -> None: ...
+
+
+class Emitter:
+    """Writes rendered code to `dst`, indenting nested code on the fly like `textwrap.indent`.
+
+    Templates lay out their code, including where blank lines go. Runs of blank lines
+    are written once the code after them is: none where a block opens, up to two
+    before top level code and one within a block.
+
+    Module level definitions the code depends on are collected in `definitions`,
+    the first definition of a name wins.
+    """
+
+    def __init__(self, dst: Sink, definitions: dict[str, str] | None = None) -> None:
+        self.dst = dst
+        self.definitions = {} if definitions is None else definitions
+        self.prefix = ""
+        # Leading whitespace of the current line, None once it has content
+        self.pending: str | None = ""
+        # Blank lines not written yet, whether the last line opened a block, which holds at the start
+        # of the output too, and the code of the current line so far
+        self.blank = 0
+        self.opened = True
+        self.last = ""
+
+    def define(self, name: str, text: str) -> None:
+        self.definitions.setdefault(name, text)
+        if isinstance(self.dst, Recording):
+            self.dst.define(name, text)
+
+    def separate(self, indent: str) -> None:
+        """Write the blank lines before code starting with `indent`."""
+        if self.blank and not self.opened:
+            self.dst.write("\n" * min(self.blank, 1 if indent else 2))
+        self.blank = 0
+
+    def write(self, text: str) -> None:
+        for line in text.splitlines(keepends=True):
+            if self.pending is not None:
+                if line.strip():
+                    self.separate(self.prefix + self.pending + line[: len(line) - len(line.lstrip())])
+                    self.dst.write(self.prefix + self.pending)
+                    self.pending = None
+                elif line.endswith("\n"):
+                    self.blank += 1
+                    self.pending = ""
+                    continue
+                else:
+                    self.pending += line
+                    continue
+            self.dst.write(line)
+            self.last = line.rstrip() or self.last
+            if line.endswith("\n"):
+                self.pending = ""
+                self.opened = self.last.endswith(":")
+                self.last = ""
+
+    def emit(self, writer: "Writer", indent: bool = False) -> str:
+        prefix = self.prefix
+        if indent:
+            self.prefix += "    "
+        try:
+            writer(self)
+        finally:
+            self.prefix = prefix
+        return ""
+
+    def stream(self, source: str, **kwargs: Any) -> None:
+        # Templates place nested code with {{ emit(...) }}, which writes it out in between the chunks
+        for chunk in template(source).generate(emit=self.emit, **kwargs):
+            self.write(chunk)
+
 
+Writer: TypeAlias = Callable[[Emitter], None]
 
-class Code(pydantic.BaseModel):
-    head: str = ""
-    tail: str = ""
 
-    def headcode(self, indent: bool = False) -> str:
-        return textwrap.indent(self.head, "    " if indent else "")
+def stream(source: str, **kwargs: Any) -> Writer:
+    return lambda out: out.stream(source, **kwargs)
 
-    def tailcode(self, indent: bool = False) -> str:
-        return textwrap.indent(self.tail, "    " if indent else "")
+
+def nothing(out: Emitter) -> None:
+    pass
+
+
+@dataclass
+class Code:
+    head: Writer = nothing
+    tail: Writer = nothing
+
+    def write(self, dst: Sink, definitions: dict[str, str] | None = None) -> None:
+        out = Emitter(dst, definitions)
+        self.head(out)
+        self.tail(out)
+
+    def render(self, definitions: dict[str, str] | None = None) -> str:
+        dst = io.StringIO()
+        self.write(dst, definitions)
+        return dst.getvalue()
 
     def __str__(self) -> str:
-        return self.head + self.tail
+        return self.render()
+
+
+def verbatim(text: str) -> Code:
+    return Code(head=lambda out: out.write(text))
 
 
 class Path(pydantic.BaseModel):
@@ -135,7 +245,7 @@ class Path(pydantic.BaseModel):
                 ret += "/{" + segment.as_property + "}"
             else:
                 ret += "/" + segment.orig
-        return repr(ret)
+        return literal(ret)
 
     @property
     def as_classpath(self) -> str:
@@ -158,7 +268,7 @@ class Path(pydantic.BaseModel):
                         render = segment.as_property
                 else:
                     if render:
-                        render += f"({repr(segment.orig)})"
+                        render += f"({literal(segment.orig)})"
                     else:
                         raise ValueError("BUG")
         return render
@@ -177,12 +287,86 @@ class Path(pydantic.BaseModel):
         )
 
 
-class Return(pydantic.BaseModel):
-    code: Code | None = None
+@dataclass
+class Shape:
+    """TypedDict and Model of an object without nested objects, emitted once per module.
+
+    Endpoints returning it declare a TypedDict and a Model of their own that only subclass
+    it, the types users see keep the name of their endpoint.
+    """
+
+    name: str
+    text: str
+
+    @classmethod
+    def new(cls, returns: dict[str, "Return"]) -> "Shape":
+        # The name hashes the names and types of the fields rather than the rendered text, layout changes keep it
+        key = repr([(retname, ret.optional, ret.dicttype, ret.modeltype) for retname, ret in returns.items()])
+        name = f"_Shape_{hashlib.sha256(key.encode()).hexdigest()[:12]}"
+        text = str(Code(head=stream(
+            """
+            class {{ name }}:
+                TypedDict = typing.TypedDict(
+                    "TypedDict",
+                    {
+            {% for retname, return in returns.items() %}
+                        {{ Field(name=retname, ret=return).for_typeddict() }},
+            {% endfor %}
+                    },
+                )
+
+                class Model(BaseModel):
+            {% for retname, return in returns.items() %}
+                    {{ Field(name=retname, ret=return).for_model() }}
+            {% endfor %}
+            """,
+            Field=Field,
+            name=name,
+            returns=returns,
+        )))
+        return cls(name=name, text=text)
+
+    def define(self, out: Emitter) -> None:
+        out.define(self.name, self.text)
+
+    def defining(self, writer: Writer) -> Writer:
+        def ret(out: Emitter) -> None:
+            self.define(out)
+            writer(out)
+        return ret
+
+    @staticmethod
+    def module(definitions: dict[str, str]) -> Code:
+        """Shapes of several API versions, imported by the types of each of them."""
+        return Code(
+            head=stream(
+                """
+                import pydantic
+                import typing
+                from typing import Any, Literal, Optional, NotRequired
+
+
+                class BaseModel(pydantic.BaseModel):
+                    model_config = pydantic.ConfigDict(extra="allow")
+                {% for text in shapes %}
+
+
+                {{ emit(verbatim(text).head) -}}
+                {% endfor %}
+                """,
+                shapes=definitions.values(),
+                verbatim=verbatim,
+            )
+        )
+
+
+@dataclass
+class Return:
     optional: bool
-    primitive: bool = True
     dicttype: str
     modeltype: str
+    code: Code | None = None
+    primitive: bool = True
 
 
 @dataclass
@@ -192,9 +376,9 @@ class Field:
 
     def for_typeddict(self) -> str:
         if self.ret.optional:
-            return f"{repr(self.name)}: NotRequired[{self.ret.dicttype}]"
+            return f"{literal(self.name)}: NotRequired[{self.ret.dicttype}]"
         else:
-            return f"{repr(self.name)}: {self.ret.dicttype}"
+            return f"{literal(self.name)}: {self.ret.dicttype}"
 
     def for_model(self) -> str:
         name_as_property = Path.Segment(orig=self.name).as_property
@@ -206,124 +390,300 @@ class Field:
                 return f"{self.name}: {self.ret.modeltype}"
         else:
             if self.ret.optional:
-                return f"{name_as_property}: Optional[{self.ret.modeltype}] = pydantic.Field(alias={repr(self.name)}, default=None)"
+                return f"{name_as_property}: Optional[{self.ret.modeltype}] = pydantic.Field(alias={literal(self.name)}, default=None)"
             else:
-                return f"{name_as_property}: {self.ret.modeltype} = pydantic.Field(alias={repr(self.name)})"
+                return f"{name_as_property}: {self.ret.modeltype} = pydantic.Field(alias={literal(self.name)})"
+
+
+def calls(
+    path: Path, dicttype: str, modeltype: str, params: Optional["ApiSchemaItemInfoMethodParameters"]
+) -> Writer:
+    """Parameters, `__call__` and `model` of the class of a method, the calls check the parameters before sending them.
+
+    The keyword arguments are typed with the parameters where those list all of them.
+
+    Methods writing a config with a digest also get `update`, see ..writes.
+    """
+    return stream(
+        """
+        {% if fields %}
+        Params = typing.TypedDict(
+            "Params",
+            {
+        {% for field in fields %}
+                {{ field }},
+        {% endfor %}
+            },
+        )
+        {% else %}
+        Params = typing.TypedDict("Params", {})
+        {% endif %}
+
+        def __call__(
+            self, *args: Any, check: bool = True, **kwargs: {{ kwargs }}
+        ) -> {{ dicttype }}:
+            if check:
+                validator(__name__, {{ literal(str(path)) }}, {{ literal(path[-1].orig.upper()) }})(kwargs)
+            data: Any = self.proxmox_api.{{ path.rendered_call }}.{{ path[-1] }}(*args, **kwargs)  # type: ignore[operator, unused-ignore]
+            return typing.cast(
+                {{ dicttype }}, data
+            )
+
+        def model(
+            self, *args: Any, check: bool = True, **kwargs: {{ kwargs }}
+        ) -> {{ modeltype }}:
+            class validate(pydantic.BaseModel):
+                data: {{ modeltype }}
+
+            data: Any = self(*args, check=check, **kwargs)
+            return validate(data=data).data
+        {% if updates %}
+
+        def update(
+            self,
+            *,
+            current: Optional[typing.Mapping[str, Any]] = None,
+            check: bool = True,
+            **kwargs: Any,
+        ) -> {{ dicttype if dicttype == "None" else "Optional[" + dicttype + "]" }}:
+            if current is None:
+                current = self.proxmox_api.{{ path.rendered_call }}.get()  # type: ignore[operator, unused-ignore]
+            params = changes(
+                __name__, {{ literal(str(path)) }}, {{ literal(path[-1].orig.upper()) }}, current, kwargs
+            )
+            if params is None:
+                return None
+            return self(check=check, **params)
+        {% endif %}
+        """,
+        path=path,
+        dicttype=dicttype,
+        modeltype=modeltype,
+        fields=params.typeddict(path) if params else [],
+        kwargs="Unpack[Params]" if params and params.closed(path) else "Any",
+        updates=updates(path, params),
+    )
+
+
+def updates(path: Path, params: Optional["ApiSchemaItemInfoMethodParameters"]) -> bool:
+    """Whether a method writes a config guarded by its digest, those get `update` sending only what changed."""
+    return (
+        path[-1].orig in ("put", "post")
+        and path[-2].orig == "config"
+        and params is not None
+        and "digest" in (params.properties or {})
+    )
+
 
+def method(
+    path: Path,
+    dicttype: str,
+    modeltype: str,
+    param_type: Callable[[str], str | None],
+    params: Optional["ApiSchemaItemInfoMethodParameters"],
+) -> Writer:
+    """Class of a method returning something other than an object with properties."""
+    return stream(
+        """
+        @dataclass
+        class {{ path[-1].as_class }}:
+            proxmox_api: ProxmoxerProxmoxAPI
+        {% for param in path.params %}
+            {{ param }}: {{ param_type(param.as_param) }}
+        {% endfor %}
+
+        {{ emit(calls(path, dicttype, modeltype, params), indent=True) -}}
+        """,
+        path=path,
+        dicttype=dicttype,
+        modeltype=modeltype,
+        param_type=param_type,
+        calls=calls,
+        params=params,
+    )
+
+
+def accessor(path: Path) -> Writer:
+    """Property returning the class of a method, post also gets `create` and put `set`."""
+    return stream(
+        """
+        @cached_property
+        def {{ path[-1] }}(self) -> {{ path[-1].as_class }}:
+            return self.{{ path[-1].as_class }}(
+                proxmox_api=self.proxmox_api,
+        {% for param in path.params %}
+                {{ param }}=self.{{ param }},
+        {% endfor %}
+            )
+        {% if path[-1] == "post" %}
 
-class BaseModel(pydantic.BaseModel):
+        @property
+        def create(self) -> {{ path[-1].as_class }}:
+            return self.{{ path[-1] }}
+        {% elif path[-1] == "put" %}
+
+        @property
+        def set(self) -> {{ path[-1].as_class }}:
+            return self.{{ path[-1] }}
+        {% endif %}
+        """,
+        path=path,
+    )
+
+
+def flag(value: Any) -> bool:
+    # The schema has 0, 1 and "1"
+    return str(value).lower() in ("1", "on", "t", "true", "y", "yes")
+
+
+def number(value: Any) -> int | float | None:
+    # The schema has numbers and numeric strings
+    if value is None:
+        return None
+    return int(value) if float(value).is_integer() else float(value)
+
+
+@dataclass(slots=True, kw_only=True)
+class BaseModel:
     optional: bool = False
 
-    def _dump(self, path: Path, optional: bool, type: str, param_type: Callable[[str], str | None]) -> Return:
+    def visit(self, patch: Patch) -> None:
+        pass
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        return ()
+
+    @property
+    def spec(self) -> tuple[Any, ...]:
+        # Returned type in the endpoint manifest, read by proxmoxer_types.runtime
+        return (getattr(self, "type"),)
+
+    def _dump(
+        self,
+        path: Path,
+        optional: bool,
+        type: str,
+        param_type: Callable[[str], str | None],
+        params: Optional["ApiSchemaItemInfoMethodParameters"] = None,
+    ) -> Return:
         code = Code(
-            head = render(
-                """
-                @dataclass
-                class {{ path[-1].as_class }}:
-                    proxmox_api: ProxmoxerProxmoxAPI
-                {% if path.params %}
-                {%   for param in path.params %}
-                    {{ param }}: {{ param_type(param.as_param) }}
-                {%   endfor %}
-                {% endif %}
-                    def __call__(self, *args: Any, **kwargs: Any) -> {{ dicttype }}:
-                        data: Any = self.proxmox_api.{{ path.rendered_call }}.{{ path[-1] }}(*args, **kwargs)  # type: ignore[operator, unused-ignore]
-                        return typing.cast({{ dicttype }}, data)
-
-                    def model(self, *args: Any, **kwargs: Any) -> {{ modeltype }}:
-                        class validate(pydantic.BaseModel):
-                            data: {{ modeltype }}
-                        data: Any = self.proxmox_api.{{ path.rendered_call }}.{{ path[-1] }}(*args, **kwargs)  # type: ignore[operator, unused-ignore]
-                        return validate(data=data).data
-                """,
-                path=path,
-                dicttype=type,
-                modeltype=type,
-                param_type=param_type,
-            ),
-            tail=render(
-                """
-                @cached_property
-                def {{ path[-1] }}(self) -> {{ path[-1].as_class }}:
-                    return self.{{ path[-1].as_class }}(
-                        proxmox_api=self.proxmox_api,
-                {%   if path.params %}
-                {%     for param in path.params %}
-                        {{ param }}=self.{{ param }},
-                {%-    endfor %}
-                {%-  endif %}
-                    )
-                {% if path[-1] == "post" -%}
-                @property
-                def create(self) -> {{ path[-1].as_class }}: return self.{{ path[-1] }}
-                {% elif path[-1] == "put" -%}
-                @property
-                def set(self) -> {{ path[-1].as_class }}: return self.{{ path[-1] }}
-                {% endif -%}
-                """,
-                path=path,
-                type=type,
-            )
+            head=method(path, type, type, param_type, params),
+            tail=accessor(path),
         )
         return Return(code=code, optional=optional, primitive=True, dicttype=type, modeltype=type)
 
 
+@dataclass(slots=True, kw_only=True)
 class ApiSchemaItemInfoMethodReturnsString(BaseModel):
     type: Literal["string"]
     enum: list[str] | None = None
 
+    @classmethod
+    def parse(cls, data: dict[str, Any]) -> Self:
+        enum = data.get("enum")
+        return cls(type="string", optional=flag(data.get("optional")), enum=None if enum is None else list(enum))
+
+    @property
+    def spec(self) -> tuple[Any, ...]:
+        return ("string", tuple(self.enum)) if self.enum else ("string",)
+
     def dump(self, path: Path, name: str, param_type: Callable[[str], str | None], **kwargs: Any) -> Return:
         path = path.copy_append(Path.CodeSegment(orig=name))
         if self.enum:
-            return self._dump(path=path, optional=self.optional, param_type=param_type, type=f"Literal{repr(self.enum)}")
+            return self._dump(path=path, optional=self.optional, param_type=param_type, type=f"Literal{literal(self.enum)}", params=kwargs.get("params"))
         else:
-            return self._dump(path=path, optional=self.optional, param_type=param_type, type="str")
+            return self._dump(path=path, optional=self.optional, param_type=param_type, type="str", params=kwargs.get("params"))
 
 
+@dataclass(slots=True, kw_only=True)
 class ApiSchemaItemInfoMethodReturnsInteger(BaseModel):
     type: Literal["integer"]
 
+    @classmethod
+    def parse(cls, data: dict[str, Any]) -> Self:
+        return cls(type="integer", optional=flag(data.get("optional")))
+
     def dump(self, path: Path, name: str, param_type: Callable[[str], str | None], **kwargs: Any) -> Return:
         path = path.copy_append(Path.CodeSegment(orig=name))
-        return self._dump(path=path, optional=self.optional, param_type=param_type, type="int")
+        return self._dump(path=path, optional=self.optional, param_type=param_type, type="int", params=kwargs.get("params"))
 
 
+@dataclass(slots=True, kw_only=True)
 class ApiSchemaItemInfoMethodReturnsNumber(BaseModel):
     type: Literal["number"]
 
+    @classmethod
+    def parse(cls, data: dict[str, Any]) -> Self:
+        return cls(type="number", optional=flag(data.get("optional")))
+
     def dump(self, path: Path, name: str, param_type: Callable[[str], str | None], **kwargs: Any) -> Return:
         path = path.copy_append(Path.CodeSegment(orig=name))
-        return self._dump(path=path, optional=self.optional, param_type=param_type, type="float")
+        return self._dump(path=path, optional=self.optional, param_type=param_type, type="float", params=kwargs.get("params"))
 
 
+@dataclass(slots=True, kw_only=True)
 class ApiSchemaItemInfoMethodReturnsBoolean(BaseModel):
     type: Literal["boolean"]
 
+    @classmethod
+    def parse(cls, data: dict[str, Any]) -> Self:
+        return cls(type="boolean", optional=flag(data.get("optional")))
+
     def dump(self, path: Path, name: str, param_type: Callable[[str], str | None], **kwargs: Any) -> Return:
         path = path.copy_append(Path.CodeSegment(orig=name))
-        return self._dump(path=path, optional=self.optional, param_type=param_type, type="bool")
+        return self._dump(path=path, optional=self.optional, param_type=param_type, type="bool", params=kwargs.get("params"))
 
 
+@dataclass(slots=True, kw_only=True)
 class ApiSchemaItemInfoMethodReturnsNull(BaseModel):
     type: Literal["null"]
 
+    @classmethod
+    def parse(cls, data: dict[str, Any]) -> Self:
+        return cls(type="null", optional=flag(data.get("optional")))
+
     def dump(self, path: Path, name: str, param_type: Callable[[str], str | None], **kwargs: Any) -> Return:
         path = path.copy_append(Path.CodeSegment(orig=name))
-        return self._dump(path=path, optional=self.optional, param_type=param_type, type="None")
+        return self._dump(path=path, optional=self.optional, param_type=param_type, type="None", params=kwargs.get("params"))
 
 
+@dataclass(slots=True, kw_only=True)
 class ApiSchemaItemInfoMethodReturnsAny(BaseModel):
     type: Literal["any"]
 
+    @classmethod
+    def parse(cls, data: dict[str, Any]) -> Self:
+        return cls(type="any", optional=flag(data.get("optional")))
+
     def dump(self, path: Path, name: str, param_type: Callable[[str], str | None], **kwargs: Any) -> Return:
         path = path.copy_append(Path.CodeSegment(orig=name))
-        return self._dump(path=path, optional=self.optional, param_type=param_type, type="Any")
+        return self._dump(path=path, optional=self.optional, param_type=param_type, type="Any", params=kwargs.get("params"))
 
 
+@dataclass(slots=True, kw_only=True)
 class ApiSchemaItemInfoMethodReturnsArray(BaseModel):
     type: Literal["array"]
     items: Optional[ApiSchemaItemInfoMethodReturns] = None
 
+    @classmethod
+    def parse(cls, data: dict[str, Any]) -> Self:
+        items = data.get("items")
+        return cls(type="array", optional=flag(data.get("optional")), items=None if items is None else returns(items))
+
+    def visit(self, patch: Patch) -> None:
+        patch(self).hook()
+        if self.items:
+            self.items.visit(patch(self))
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        return self.items.fields if self.items else ()
+
+    @property
+    def spec(self) -> tuple[Any, ...]:
+        return ("array", self.items.spec) if self.items else ("array",)
+
     def dump(
         self,
         path: Path,
@@ -332,63 +692,27 @@ class ApiSchemaItemInfoMethodReturnsArray(BaseModel):
         param_type: Callable[[str], str | None],
         call_type: Callable[[str], str] = lambda x:x,
         call: bool = False,
+        params: Optional["ApiSchemaItemInfoMethodParameters"] = None,
     ) -> Return:
         patch(self).hook()
         if self.items:
-            child = self.items.dump(path=path, name=name, patch=patch(self), param_type=param_type, call_type=lambda x: f"list[{x}]", call=call)
+            child = self.items.dump(
+                path=path, name=name, patch=patch(self), param_type=param_type, call_type=lambda x: f"list[{x}]", call=call, params=params,
+            )
             if child.primitive:
-                head = render(
-                    """
-                    @dataclass
-                    class {{ path[-1].as_class }}:
-                        proxmox_api: ProxmoxerProxmoxAPI
-                    {% if path.params %}
-                    {%   for param in path.params %}
-                        {{ param }}: {{ param_type(param.as_param) }}
-                    {%   endfor %}
-                    {% endif %}
-                        def __call__(self, *args: Any, **kwargs: Any) -> {{ dicttype }}:
-                            data: Any = self.proxmox_api.{{ path.rendered_call }}.{{ path[-1] }}(*args, **kwargs)  # type: ignore[operator, unused-ignore]
-                            return typing.cast({{ dicttype }}, data)
-
-                        def model(self, *args: Any, **kwargs: Any) -> {{ modeltype }}:
-                            class validate(pydantic.BaseModel):
-                                data: {{ modeltype }}
-                            data: Any = self.proxmox_api.{{ path.rendered_call }}.{{ path[-1] }}(*args, **kwargs)  # type: ignore[operator, unused-ignore]
-                            return validate(data=data).data
-                    """,
-                    path=path.copy_append(Path.CodeSegment(orig=name)),
-                    dicttype=call_type(f"list[{child.dicttype}]"),
-                    modeltype=call_type(f"list[{child.modeltype}]"),
-                    param_type=param_type,
+                head = method(
+                    path.copy_append(Path.CodeSegment(orig=name)),
+                    call_type(f"list[{child.dicttype}]"),
+                    call_type(f"list[{child.modeltype}]"),
+                    param_type,
+                    params,
                 )
             else:
                 assert child.code
                 head = child.code.head
             code = Code(
                 head=head,
-                tail=render(
-                    """
-                    @cached_property
-                    def {{ path[-1] }}(self) -> {{ path[-1].as_class }}:
-                        return self.{{ path[-1].as_class }}(
-                            proxmox_api=self.proxmox_api,
-                    {%   if path.params %}
-                    {%     for param in path.params %}
-                            {{ param }}=self.{{ param }},
-                    {%-    endfor %}
-                    {%-  endif %}
-                        )
-                    {% if path[-1] == "post" -%}
-                    @property
-                    def create(self) -> {{ path[-1].as_class }}: return self.{{ path[-1] }}
-                    {% elif path[-1] == "put" -%}
-                    @property
-                    def set(self) -> {{ path[-1].as_class }}: return self.{{ path[-1] }}
-                    {% endif -%}
-                    """,
-                    path=path.copy_append(Path.CodeSegment(orig=name)),
-                ),
+                tail=accessor(path.copy_append(Path.CodeSegment(orig=name))),
             )
             return Return(
                 code=code,
@@ -400,64 +724,56 @@ class ApiSchemaItemInfoMethodReturnsArray(BaseModel):
         else:
             path = path.copy_append(Path.CodeSegment(orig=name))
             code = Code(
-                head=render(
-                    """
-                    @dataclass
-                    class {{ path[-1].as_class }}:
-                        proxmox_api: ProxmoxerProxmoxAPI
-                    {% if path.params %}
-                    {%   for param in path.params %}
-                        {{ param }}: {{ param_type(param.as_param) }}
-                    {%   endfor %}
-                    {% endif %}
-                        def __call__(self, *args: Any, **kwargs: Any) -> {{ dicttype }}:
-                            data: Any = self.proxmox_api.{{ path.rendered_call }}.{{ path[-1] }}(*args, **kwargs)  # type: ignore[operator, unused-ignore]
-                            return typing.cast({{ dicttype }}, data)
-
-                        def model(self, *args: Any, **kwargs: Any) -> {{ modeltype }}:
-                            class validate(pydantic.BaseModel):
-                                data: {{ modeltype }}
-                            data: Any = self.proxmox_api.{{ path.rendered_call }}.{{ path[-1] }}(*args, **kwargs)  # type: ignore[operator, unused-ignore]
-                            return validate(data=data).data
-                    """,
-                    path=path,
-                    dicttype="list[Any]",
-                    modeltype="list[Any]",
-                    param_type=param_type,
-                ),
-                tail=render(
-                    """
-                    @cached_property
-                    def {{ path[-1] }}(self) -> {{ path[-1].as_class }}:
-                        return self.{{ path[-1].as_class }}(
-                            proxmox_api=self.proxmox_api,
-                    {%   if path.params %}
-                    {%     for param in path.params %}
-                            {{ param }}=self.{{ param }},
-                    {%-    endfor %}
-                    {%-  endif %}
-                        )
-                    {% if path[-1] == "post" -%}
-                    @property
-                    def create(self) -> {{ path[-1].as_class }}: return self.{{ path[-1] }}
-                    {% elif path[-1] == "put" -%}
-                    @property
-                    def set(self) -> {{ path[-1].as_class }}: return self.{{ path[-1] }}
-                    {% endif -%}
-                    """,
-                    path=path,
-                ),
+                head=method(path, "list[Any]", "list[Any]", param_type, params),
+                tail=accessor(path),
             )
             return Return(
                 code=code, optional=self.optional, primitive=True, dicttype="list[Any]", modeltype="list[Any]",
             )
 
 
+@dataclass(slots=True, kw_only=True)
 class ApiSchemaItemInfoMethodReturnsObject(BaseModel):
     type: Literal["object"] | None = None
     properties: dict[str, ApiSchemaItemInfoMethodReturns] | None = None
     values: ApiSchemaItemInfoMethodReturns | None = None
 
+    @classmethod
+    def parse(cls, data: dict[str, Any]) -> Self:
+        properties = data.get("properties")
+        values = data.get("values")
+        return cls(
+            type=data.get("type"),
+            optional=flag(data.get("optional")),
+            properties=None if properties is None else {key: returns(value) for key, value in properties.items()},
+            values=None if values is None else returns(values),
+        )
+
+    def visit(self, patch: Patch) -> None:
+        patch(self).hook()
+        if self.properties:
+            for key, prop in self.properties.items():
+                prop.visit(patch(self, name=key))
+        elif self.values:
+            self.values.visit(patch(self))
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        return tuple(self.properties) if self.properties else ()
+
+    @property
+    def spec(self) -> tuple[Any, ...]:
+        if self.properties:
+            properties: list[tuple[Any, ...]] = []
+            for key, prop in self.properties.items():
+                attribute = Path.Segment(orig=key).as_property
+                # The model attribute follows when it differs from the property name
+                properties.append((key, prop.optional, prop.spec) + (() if key == attribute else (attribute,)))
+            return ("object", tuple(properties))
+        if self.values:
+            return ("dict", self.values.spec)
+        return ("object",)
+
     def dump(
         self,
         path: Path,
@@ -466,6 +782,7 @@ class ApiSchemaItemInfoMethodReturnsObject(BaseModel):
         param_type: Callable[[str], str | None],
         call_type: Callable[[str], str] = lambda x:x,
         call: bool = False,
+        params: Optional["ApiSchemaItemInfoMethodParameters"] = None,
     ) -> Return:
         patch(self).hook()
         if self.properties:
@@ -473,82 +790,74 @@ class ApiSchemaItemInfoMethodReturnsObject(BaseModel):
             returns: dict[str, Return] = {
                 key: prop.dump(path=path, name=key, patch=patch(self, name=key), param_type=param_type) for key, prop in self.properties.items()
             }
-            code = Code(
-                head=render(
-                    """
-                    @dataclass
-                    class {{ path[-1].as_class }}:
-                    {%- for return in returns.values() %}{% if not return.primitive %}{{ return.code.headcode(indent=True) }}{% endif %}{% endfor %}
-                        TypedDict = typing.TypedDict('TypedDict', {
-                    {%-    for retname, return in returns.items() %}
+            # Objects without nested ones subclass their shape, the others are declared in place
+            shape = None if any(not ret.primitive for ret in returns.values()) else Shape.new(returns)
+            head = stream(
+                """
+                @dataclass
+                class {{ path[-1].as_class }}:
+                {% for return in returns.values() if not return.primitive %}
+
+                {{ emit(return.code.head, indent=True) -}}
+                {% endfor %}
+
+                {% if shape %}
+                    class TypedDict({{ shape.name }}.TypedDict):
+                        pass
+
+                    class Model({{ shape.name }}.Model):
+                        pass
+                {% else %}
+                    TypedDict = typing.TypedDict(
+                        "TypedDict",
+                        {
+                {% for retname, return in returns.items() %}
                             {{ Field(name=retname, ret=return).for_typeddict() }},
-                    {%-   endfor %}
-                        })
-                        class Model(BaseModel):
-                    {%-    for retname, return in returns.items() %}
-                            {{ Field(name=retname, ret=return).for_model() }}
-                    {%-   endfor %}
-                        Model.__name__ = {{ repr(path.as_classpath) }}
-
-                        proxmox_api: ProxmoxerProxmoxAPI
-                    {% if path.params %}
-                    {%   for param in path.params %}
-                        {{ param }}: {{ param_type(param.as_param) }}
-                    {%   endfor %}
-                    {% endif %}
-
-                    {%- if call %}
-                        def __call__(self, *args: Any, **kwargs: Any) -> {{ dicttype }}:
-                            data: Any = self.proxmox_api.{{ path.rendered_call }}.{{ path[-1] }}(*args, **kwargs)  # type: ignore[operator, unused-ignore]
-                            return typing.cast({{ dicttype }}, data)
-
-                        def model(self, *args: Any, **kwargs: Any) -> {{ modeltype }}:
-                            class validate(pydantic.BaseModel):
-                                data: {{ modeltype }}
-                            data: Any = self.proxmox_api.{{ path.rendered_call }}.{{ path[-1] }}(*args, **kwargs)  # type: ignore[operator, unused-ignore]
-                            return validate(data=data).data
-                    {%- endif %}
-                    """,
-                    Field=Field,
-                    path=path,
-                    returns=returns,
-                    call=call,
-                    dicttype=call_type(repr(f"{ path.as_classpath }.TypedDict")),
-                    modeltype=call_type(repr(f"{ path.as_classpath }.Model")),
-                    param_type=param_type,
-                ),
-                tail=render(
-                    """
-                    @cached_property
-                    def {{ path[-1] }}(self) -> {{ path[-1].as_class }}:
-                        return self.{{ path[-1].as_class }}(
-                            proxmox_api=self.proxmox_api,
-                    {%   if path.params %}
-                    {%     for param in path.params %}
-                            {{ param }}=self.{{ param }},
-                    {%-    endfor %}
-                    {%-  endif %}
-                        )
-                    {% if path[-1] == "post" -%}
-                    @property
-                    def create(self) -> {{ path[-1].as_class }}: return self.{{ path[-1] }}
-                    {% elif path[-1] == "put" -%}
-                    @property
-                    def set(self) -> {{ path[-1].as_class }}: return self.{{ path[-1] }}
-                    {% endif -%}
-                    """,
-                    path=path,
-                ),
+                {% endfor %}
+                        },
+                    )
+
+                    class Model(BaseModel):
+                {% for retname, return in returns.items() %}
+                        {{ Field(name=retname, ret=return).for_model() }}
+                {% endfor %}
+                {% endif %}
+
+                    Model.__name__ = {{ literal(path.as_classpath) }}
+
+                    proxmox_api: ProxmoxerProxmoxAPI
+                {% for param in path.params %}
+                    {{ param }}: {{ param_type(param.as_param) }}
+                {% endfor %}
+                {% if call %}
+
+                {{ emit(calls(path, dicttype, modeltype, params), indent=True) -}}
+                {% endif %}
+                """,
+                Field=Field,
+                path=path,
+                returns=returns,
+                shape=shape,
+                call=call,
+                dicttype=call_type(literal(f"{ path.as_classpath }.TypedDict")),
+                modeltype=call_type(literal(f"{ path.as_classpath }.Model")),
+                param_type=param_type,
+                calls=calls,
+                params=params,
+            )
+            code = Code(
+                head=head if shape is None else shape.defining(head),
+                tail=accessor(path),
             )
             return Return(
                 code=code,
                 optional=self.optional,
                 primitive=False,
-                dicttype=repr(f"{path.as_classpath}.TypedDict"),
-                modeltype=repr(f"{path.as_classpath}.Model"),
+                dicttype=literal(f"{path.as_classpath}.TypedDict"),
+                modeltype=literal(f"{path.as_classpath}.Model"),
             )
         elif self.values:
-            values = self.values.dump(path=path, name=name, patch=patch(self), param_type=param_type)
+            values = self.values.dump(path=path, name=name, patch=patch(self), param_type=param_type, params=params)
             return Return(
                 code=values.code,
                 dicttype=f"dict[str, { values.dicttype }]",
@@ -559,61 +868,76 @@ class ApiSchemaItemInfoMethodReturnsObject(BaseModel):
         else:
             path = path.copy_append(Path.CodeSegment(orig=name))
             code = Code(
-                head=render(
-                    """
-                    @dataclass
-                    class {{ path[-1].as_class }}:
-                        proxmox_api: ProxmoxerProxmoxAPI
-                    {% if path.params %}
-                    {%   for param in path.params %}
-                        {{ param }}: {{ param_type(param.as_param) }}
-                    {%   endfor %}
-                    {% endif %}
-                        def __call__(self, *args: Any, **kwargs: Any) -> {{ dicttype }}:
-                            data: Any = self.proxmox_api.{{ path.rendered_call }}.{{ path[-1] }}(*args, **kwargs)  # type: ignore[operator, unused-ignore]
-                            return typing.cast({{ dicttype }}, data)
-
-                        def model(self, *args: Any, **kwargs: Any) -> {{ modeltype }}:
-                            class validate(pydantic.BaseModel):
-                                data: {{ modeltype }}
-                            data: Any = self.proxmox_api.{{ path.rendered_call }}.{{ path[-1] }}(*args, **kwargs)  # type: ignore[operator, unused-ignore]
-                            return validate(data=data).data
-                    """,
-                    path=path,
-                    dicttype="dict[str, Any]",
-                    modeltype="dict[str, Any]",
-                    param_type=param_type,
-                ),
-                tail=render(
-                    """
-                    @cached_property
-                    def {{ path[-1] }}(self) -> {{ path[-1].as_class }}:
-                        return self.{{ path[-1].as_class }}(
-                            proxmox_api=self.proxmox_api,
-                    {%   if path.params %}
-                    {%     for param in path.params %}
-                            {{ param }}=self.{{ param }},
-                    {%-    endfor %}
-                    {%-  endif %}
-                        )
-                    {% if path[-1] == "post" -%}
-                    @property
-                    def create(self) -> {{ path[-1].as_class }}: return self.{{ path[-1] }}
-                    {% elif path[-1] == "put" -%}
-                    @property
-                    def set(self) -> {{ path[-1].as_class }}: return self.{{ path[-1] }}
-                    {% endif -%}
-                    """,
-                    path=path,
-                ),
+                head=method(path, "dict[str, Any]", "dict[str, Any]", param_type, params),
+                tail=accessor(path),
             )
             return Return(
                 code=code, optional=self.optional, primitive=True, dicttype="dict[str, Any]", modeltype="dict[str, Any]",
             )
 
 
+def returns(data: dict[str, Any]) -> ApiSchemaItemInfoMethodReturns:
+    ret: ApiSchemaItemInfoMethodReturns = RETURNS[data.get("type") or "object"].parse(data)
+    return ret
+
+
+RETURNS: dict[str, type[ApiSchemaItemInfoMethodReturns]] = {
+    "any": ApiSchemaItemInfoMethodReturnsAny,
+    "array": ApiSchemaItemInfoMethodReturnsArray,
+    "boolean": ApiSchemaItemInfoMethodReturnsBoolean,
+    "integer": ApiSchemaItemInfoMethodReturnsInteger,
+    "null": ApiSchemaItemInfoMethodReturnsNull,
+    "number": ApiSchemaItemInfoMethodReturnsNumber,
+    "object": ApiSchemaItemInfoMethodReturnsObject,
+    "string": ApiSchemaItemInfoMethodReturnsString,
+}
+
+
+@dataclass(slots=True, kw_only=True)
 class ApiSchemaItemInfoMethodProperty(BaseModel):
     type: Literal["array", "boolean", "integer", "number", "string"]
+    enum: list[str | int] | None = None
+    minimum: int | float | None = None
+    maximum: int | float | None = None
+    # Named formats only, property strings have a schema of their own
+    format: str | None = None
+    property_string: Optional["ApiSchemaItemInfoMethodPropertyString"] = None
+    default: str | int | float | None = None
+
+    @classmethod
+    def parse(cls, data: dict[str, Any]) -> Self:
+        enum = data.get("enum")
+        format = data.get("format")
+        return cls(
+            type=data["type"],
+            optional=flag(data.get("optional")),
+            enum=None if enum is None else list(enum),
+            minimum=number(data.get("minimum")),
+            maximum=number(data.get("maximum")),
+            format=format if isinstance(format, str) else None,
+            property_string=ApiSchemaItemInfoMethodPropertyString.parse(format) if isinstance(format, dict) else None,
+            default=data.get("default"),
+        )
+
+    @property
+    def annotation(self) -> str:
+        """Type of the parameter in a TypedDict of the parameters of a method."""
+        if self.type == "string" and self.enum:
+            return f"Literal{literal(self.enum)}"
+        return str(self)
+
+    def checks(self, formats: dict[str, str] | None = None) -> str:
+        """Arguments of the Param in the table besides its type and optional.
+
+        `formats` are the names of the Formats the table defines by their text, a property string refers to its own.
+        """
+        ret = f", {literal(tuple(self.enum))}" if self.enum else ""
+        for name in ("minimum", "maximum", "format", "default"):
+            if getattr(self, name) is not None:
+                ret += f", {name}={literal(getattr(self, name))}"
+        if self.property_string and formats is not None:
+            ret += f", format={formats[str(self.property_string)]}"
+        return ret
 
     def __str__(self) -> str:
         if self.type == "array":
@@ -629,36 +953,150 @@ class ApiSchemaItemInfoMethodProperty(BaseModel):
         else:
             assert_never(self.type)
 
+@dataclass(slots=True, kw_only=True)
+class ApiSchemaItemInfoMethodPropertyString(BaseModel):
+    """The keys of a property string, the `format` of a parameter like net[n]."""
+
+    keys: dict[str, ApiSchemaItemInfoMethodProperty]
+    default_key: str | None = None
+    aliases: dict[str, str] = field(default_factory=dict)
+    key_aliases: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def parse(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            keys={
+                name: ApiSchemaItemInfoMethodProperty.parse({"type": "string", **key})
+                for name, key in data.items()
+                if "alias" not in key
+            },
+            default_key=next((name for name, key in data.items() if flag(key.get("default_key"))), None),
+            aliases={name: key["alias"] for name, key in data.items() if "alias" in key},
+            key_aliases={name: key["keyAlias"] for name, key in data.items() if "keyAlias" in key},
+        )
+
+    @staticmethod
+    def name(text: str) -> str:
+        """Name of the Format the table defines once for every parameter of this property string."""
+        return f"_Format_{hashlib.sha256(text.encode()).hexdigest()[:12]}"
+
+    def __str__(self) -> str:
+        keys = ", ".join(
+            f"{literal(name)}: Param({literal(key.type)}, {literal(key.optional)}{key.checks()})"
+            for name, key in self.keys.items()
+        )
+        ret = f"Format({{{keys}}}"
+        if self.default_key:
+            ret += f", default_key={literal(self.default_key)}"
+        for name in ("aliases", "key_aliases"):
+            if getattr(self, name):
+                items = ", ".join(f"{literal(key)}: {literal(value)}" for key, value in getattr(self, name).items())
+                ret += f", {name}={{{items}}}"
+        return ret + ")"
+
+
+@dataclass(slots=True, kw_only=True)
 class ApiSchemaItemInfoMethodParameters(BaseModel):
     properties: dict[str, ApiSchemaItemInfoMethodProperty] | None = None
+    # Whether parameters besides the properties are accepted, the server rejects them by default
+    additional: bool = False
 
+    @classmethod
+    def parse(cls, data: dict[str, Any]) -> Self:
+        properties = data.get("properties")
+        return cls(
+            optional=flag(data.get("optional")),
+            properties=None if properties is None else {
+                key: ApiSchemaItemInfoMethodProperty.parse(value) for key, value in properties.items()
+            },
+            additional=flag(data.get("additionalProperties")),
+        )
 
+    def closed(self, path: Path) -> bool:
+        """Whether the TypedDict of the parameters lists every keyword argument of a call, see `typeddict`."""
+        names = set(self.properties or {}) - {param.as_param for param in path.params}
+        return not (
+            self.additional
+            or any(name.endswith("[n]") for name in names)
+            or names & {"self", "args", "check"}
+        )
+
+    def typeddict(self, path: Path) -> list[str]:
+        """Fields of the TypedDict of the parameters besides those of the path.
+
+        Indexed parameters like net[n] are left out, a TypedDict cannot spell net0, net1, ...
+        """
+        in_path = {param.as_param for param in path.params}
+        return [
+            Field(name=name, ret=Return(optional=prop.optional, dicttype=prop.annotation, modeltype="")).for_typeddict()
+            for name, prop in (self.properties or {}).items()
+            if name not in in_path and not name.endswith("[n]")
+        ]
+
+
+@dataclass(slots=True, kw_only=True)
 class ApiSchemaItemInfoMethod(BaseModel):
     method: str
     returns: ApiSchemaItemInfoMethodReturns
     parameters: ApiSchemaItemInfoMethodParameters
 
+    @classmethod
+    def parse(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            optional=flag(data.get("optional")),
+            method=data["method"],
+            returns=returns(data["returns"]),
+            parameters=ApiSchemaItemInfoMethodParameters.parse(data["parameters"]),
+        )
+
     def param_type(self, name: str) -> ApiSchemaItemInfoMethodProperty | None:
         return self.parameters.properties.get(name) if self.parameters.properties else None
 
+    def visit(self, patch: Patch) -> None:
+        self.returns.visit(patch(self))
+
     def dump(self, path: Path, method: str, patch: Patch) -> Code | None:
         def param_type(name: str) -> str | None:
             return str(self.param_type(name)) if self.param_type(name) else None
-        return self.returns.dump(path=path, name=method, patch=patch(self), param_type=param_type, call=True).code
+        return self.returns.dump(
+            path=path, name=method, patch=patch(self), param_type=param_type, call=True, params=self.parameters,
+        ).code
 
 
+@dataclass(slots=True, kw_only=True)
 class ApiSchemaItemInfo(BaseModel):
     DELETE: ApiSchemaItemInfoMethod | None = None
     GET: ApiSchemaItemInfoMethod | None = None
     POST: ApiSchemaItemInfoMethod | None = None
     PUT: ApiSchemaItemInfoMethod | None = None
 
+    @classmethod
+    def parse(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            optional=flag(data.get("optional")),
+            **{
+                name: None if data.get(name) is None else ApiSchemaItemInfoMethod.parse(data[name])
+                for name in ("DELETE", "GET", "POST", "PUT")
+            },
+        )
+
     def param_type(self, name: str) -> ApiSchemaItemInfoMethodProperty:
         for method in (self.DELETE, self.GET, self.POST, self.PUT):
             if method and (param_type := method.param_type(name)):
                 return param_type
         raise RuntimeError(f"Parameter {name} not found")
 
+    @property
+    def methods(self) -> dict[str, ApiSchemaItemInfoMethod]:
+        return {
+            name: method
+            for name, method in (("DELETE", self.DELETE), ("GET", self.GET), ("POST", self.POST), ("PUT", self.PUT))
+            if method
+        }
+
+    def visit(self, patch: Patch) -> None:
+        for method in self.methods.values():
+            method.visit(patch(self))
 
     def dump(self, path: Path, patch: Patch) -> Code:
         codelist: list[Code] = []
@@ -671,109 +1109,144 @@ class ApiSchemaItemInfo(BaseModel):
         if self.PUT and (code := self.PUT.dump(path=path, method="put", patch=patch(self))):
             codelist.append(code)
         return Code(
-            head=render(
+            head=stream(
                 """
-                {% for code in codelist -%}
-                {{   code.headcode(indent=False) }}
-                {% endfor -%}
-                {% for code in codelist -%}
-                {{   code.tailcode(indent=False) }}
-                {% endfor -%}
+                {% for code in codelist %}
+                {{ emit(code.head) }}
+                {% endfor %}
+                {% for code in codelist %}
+                {{ emit(code.tail) }}
+                {% endfor %}
                 """,
                 codelist=codelist,
             )
         )
 
 
+@dataclass(slots=True, kw_only=True)
 class ApiSchemaItem(BaseModel):
-    children: list["ApiSchemaItem"] | None = None
+    # Left out of repr(), which stands for the item's own content
+    children: list["ApiSchemaItem"] | None = field(default=None, repr=False)
     info: ApiSchemaItemInfo | None = None
     leaf: bool
     path: str
     text: str
 
+    @classmethod
+    def parse(cls, data: dict[str, Any]) -> Self:
+        children = data.get("children")
+        info = data.get("info")
+        return cls(
+            optional=flag(data.get("optional")),
+            children=None if children is None else [cls.parse(child) for child in children],
+            info=None if info is None else ApiSchemaItemInfo.parse(info),
+            leaf=flag(data["leaf"]),
+            path=data["path"],
+            text=data["text"],
+        )
+
+    def walk(self) -> Iterator["ApiSchemaItem"]:
+        yield self
+        for child in self.children or ():
+            yield from child.walk()
+
+    def visit(self, patch: Patch) -> None:
+        patch(self).hook()
+        if self.info:
+            self.info.visit(patch(self))
+
     def dump(
         self,
         type_check_only: bool,
         patch: Patch,
         recurse: bool,
         return_prefix: str = "",
+        fragments: Optional["Fragments"] = None,
     ) -> Code:
         patch(self).hook()
+        if fragments and (cached := fragments.cached(self)):
+            return cached
         path = Path.new(self.path)
-        return Code(
-            head=render(
+        code = Code(
+            head=stream(
                 """
-                {% if recurse -%}
+                {% if recurse %}
                 # {{ path }}
-                {%   if type_check_only %}@type_check_only{% else %}@dataclass{% endif %}
+                {% if type_check_only %}
+                @type_check_only
+                {% else %}
+                @dataclass
+                {% endif %}
                 class {{ path[-1].as_class }}:
-                {%   if childcodes -%}
-                {%     for code in childcodes -%}
-                {{       code.headcode(indent=True) }}
-                {%     endfor -%}
-                {%   endif %}
-                {%   if infodump -%}
-                {{     infodump.headcode(indent=True) }}
-                {%   endif %}
+                {% for code in childcodes or () %}
+                {{ emit(code.head, indent=True) }}
+                {% endfor %}
+                {% if infodump %}
+                {{ emit(infodump.head, indent=True) }}
+                {% endif %}
                     proxmox_api: ProxmoxerProxmoxAPI
-                {%   if path.params %}
-                {%     for param in path.params %}
-                    {{   param }}: {% if info %}{{ info.param_type(param.as_param) }}{% else %}str{% endif %}
-                {%-    endfor %}
-                {%   endif %}
+                {% for param in path.params %}
+                    {{ param }}: {{ param_type(param) }}
+                {% endfor %}
+
                 {% endif %}
-                {%- if path[-1].is_param %}
+                {% if path[-1].is_param %}
                 def __post_init__(self) -> None:
                     @lru_cache
-                    def cache({{ path[-1] }}: {% if info %}{{ info.param_type(path[-1].as_param) }}{% else %}str{% endif %}) -> {{ path.as_classpath }}:
+                    def cache(
+                        {{ path[-1] }}: {{ param_type(path[-1]) }}
+                    ) -> {{ path.as_classpath }}:
                         return self.{{ path[-1].as_class }}(
                             proxmox_api=self.proxmox_api,
                             {{ path[-1] }}={{ path[-1] }},
-                    {%   if path.params %}
-                    {%     for param in path.params[:-1] %}
+                {% for param in path.params[:-1] %}
                             {{ param }}=self.{{ param }},
-                    {%-    endfor %}
-                    {%-  endif %}
+                {% endfor %}
                         )
+
                     self.__cache = cache
-                def __call__(self, {{ path[-1] }}: {% if info %}{{ info.param_type(path[-1].as_param) }}{% else %}str{% endif %}) -> {{ path[-1].as_class }}:
+
+                def __call__(self, {{ path[-1] }}: {{ param_type(path[-1]) }}) -> {{ path[-1].as_class }}:
                     return self.__cache({{ path[-1] }})
-                {%- else %}
+                {% else %}
                 @cached_property
-                {%    if type_check_only -%}
+                {% if type_check_only %}
                 @type_check_only
-                def {{ path[-1] }}(self) -> {% if return_prefix %}{{ return_prefix }}{% endif %}{{ path[-1].as_class }}: ...
-                {%    else -%}
-                def {{ path[-1] }}(self) -> {% if return_prefix %}{{ return_prefix }}{% endif %}{{ path[-1].as_class }}:
+                def {{ path[-1] }}(self) -> {{ return_prefix }}{{ path[-1].as_class }}: ...
+                {% else %}
+                def {{ path[-1] }}(self) -> {{ return_prefix }}{{ path[-1].as_class }}:
                     return self.{{ path[-1].as_class }}(
                         proxmox_api=self.proxmox_api,
-                {%   if path.params %}
-                {%     for param in path.params %}
+                {% for param in path.params %}
                         {{ param }}=self.{{ param }},
-                {%-    endfor %}
-                {%-  endif %}
+                {% endfor %}
                     )
-                {%    endif -%}
-                {% endif -%}
+                {% endif %}
+                {% endif %}
                 """,
-                childcodes=(child.dump(type_check_only=type_check_only, recurse=True, patch=patch) for child in self.children) if self.children else None,
-                info=self.info,
+                childcodes=(child.dump(type_check_only=type_check_only, recurse=True, patch=patch, fragments=fragments) for child in self.children) if self.children else None,
                 infodump=self.info.dump(path=path, patch=patch(self)) if self.info else None,
+                param_type=lambda param: self.info.param_type(param.as_param) if self.info else "str",
                 path=path,
                 recurse=recurse,
                 type_check_only=type_check_only,
                 return_prefix=return_prefix,
             ),
         )
+        return fragments.record(self, code) if fragments else code
 
 
+@dataclass(slots=True, kw_only=True)
 class ApiSchema(BaseModel):
     children: list[ApiSchemaItem]
 
+    @classmethod
+    def parse(cls, data: list[dict[str, Any]]) -> Self:
+        return cls(children=[ApiSchemaItem.parse(child) for child in data])
+
     def stubs(self, patch: Patch, apiversion: str) -> Code:
         return Code(
-            head=render(
+            head=stream(
                 """
                 __license__ = "MIT"
 
@@ -790,14 +1263,21 @@ class ApiSchema(BaseModel):
                 SERVICES: Incomplete
 
                 def config_failure(message: Incomplete, *args: Incomplete) -> None: ...
-                
+
                 class ResourceException(Exception):
                     status_code: Incomplete
                     status_message: Incomplete
                     content: Incomplete
                     errors: Incomplete
-                    def __init__(self, status_code: Incomplete, status_message: Incomplete, content: Incomplete, errors: Incomplete | None = None) -> None: ...
-                
+
+                    def __init__(
+                        self,
+                        status_code: Incomplete,
+                        status_message: Incomplete,
+                        content: Incomplete,
+                        errors: Incomplete | None = None,
+                    ) -> None: ...
+
                 class AuthenticationError(Exception): ...
 
                 class ProxmoxResource:
@@ -813,12 +1293,17 @@ class ApiSchema(BaseModel):
                     def set(self, *args: Incomplete, **data: Incomplete) -> Incomplete: ...
 
                 class ProxmoxAPI:
-                    def __init__(self, host: Incomplete | None = None, backend: str = 'https', service: str = 'PVE', **kwargs: Incomplete) -> None: ...
+                    def __init__(
+                        self,
+                        host: Incomplete | None = None,
+                        backend: str = "https",
+                        service: str = "PVE",
+                        **kwargs: Incomplete,
+                    ) -> None: ...
                     def get_tokens(self) -> Incomplete: ...
-
-                {% for code in childcodes -%}
-                {{  code.headcode(indent=True) }}
-                {% endfor -%}
+                {% for code in childcodes %}
+                {{ emit(code.head, indent=True) -}}
+                {% endfor %}
                 """,
                 LATEST=LATEST,
                 childcodes=(
@@ -832,9 +1317,30 @@ class ApiSchema(BaseModel):
             )
         )
 
-    def types(self, patch: Patch, apiversion: str) -> Code:
+    def typecodes(self, patch: Patch, fragments: Optional["Fragments"] = None) -> Iterator[Code]:
+        for child in self.children:
+            yield child.dump(type_check_only=False, recurse=True, patch=patch, fragments=fragments)
+
+    def types(
+        self,
+        patch: Patch,
+        apiversion: str,
+        codes: Iterable[Code] | None = None,
+        definitions: dict[str, str] | None = None,
+        shared: bool = False,
+        checked: bool = False,
+    ) -> Code:
+        """Types of one API version, `shared` imports the shapes from ..shapes instead of defining them.
+
+        `checked` validates the parameters of a call with ..validation and compares the values of `update`
+        calls with ..writes, both read the table generated next to the types.
+        """
+        if codes is None:
+            # Paths define the shapes they return while being rendered, the shapes come first in the module
+            definitions = {}
+            codes = [verbatim(code.render(definitions)) for code in self.typecodes(patch)]
         return Code(
-            head=render(
+            head=stream(
                 """
                 import builtins
                 import proxmoxer
@@ -842,26 +1348,145 @@ class ApiSchema(BaseModel):
                 import typing
                 from dataclasses import dataclass
                 from functools import cached_property, lru_cache
-                from typing import Any, Literal, Optional, NotRequired, TYPE_CHECKING
+                from typing import Any, Literal, Optional, NotRequired, TYPE_CHECKING, Unpack
 
                 if TYPE_CHECKING:
                     from ..{{ apiversion }} import ProxmoxAPI as ProxmoxerProxmoxAPI
                 else:
                     from proxmoxer import ProxmoxAPI as ProxmoxerProxmoxAPI
+                {% if checked %}
+
+                from ..validation import validator
+                from ..writes import changes
+                {% endif %}
+                {% if shared %}
+
+                from ..shapes import (
+                    BaseModel,
+                {% for name in names %}
+                    {{ name }},
+                {% endfor %}
+                )
+                {% else %}
+
 
                 class BaseModel(pydantic.BaseModel):
                     model_config = pydantic.ConfigDict(extra="allow")
+                {% for text in shapes %}
+
+
+                {{ emit(verbatim(text).head) -}}
+                {% endfor %}
+                {% endif %}
+                {% if not checked %}
+
+
+                def validator(
+                    module: str, path: str, method: str
+                ) -> typing.Callable[[typing.Mapping[str, Any]], None]:
+                    # Without a table next to the types the server checks the parameters
+                    return lambda params: None
+
+
+                def changes(
+                    module: str,
+                    path: str,
+                    method: str,
+                    current: typing.Mapping[str, Any],
+                    desired: typing.Mapping[str, Any],
+                ) -> Optional[dict[str, Any]]:
+                    # Nor compares the desired values with the config, `update` writes all of them
+                    return dict(desired)
+                {% endif %}
+
 
                 class ProxmoxAPI:
                     proxmox_api: ProxmoxerProxmoxAPI
+
                     def __init__(self, *args: Any, **kwargs: Any) -> None:
                         self.proxmox_api = ProxmoxerProxmoxAPI(*args, **kwargs)
+                {% for code in childcodes %}
 
-                {% for code in childcodes -%}
-                {{  code.headcode(indent=True) }}
-                {% endfor -%}
+                {{ emit(code.head, indent=True) -}}
+                {% endfor %}
                 """,
                 apiversion=apiversion,
-                childcodes=(child.dump(type_check_only=False, recurse=True, patch=patch) for child in self.children),
+                childcodes=codes,
+                names=(definitions or {}).keys(),
+                shapes=(definitions or {}).values(),
+                shared=shared,
+                checked=checked,
+                verbatim=verbatim,
+            )
+        )
+
+    def table(self, patch: Patch, apiversion: str) -> Code:
+        items = [item for child in self.children for item in child.walk()]
+        for item in items:
+            item.visit(patch)
+        # Names of the property strings by their text, each defined once and shared by its parameters
+        formats: dict[str, str] = {}
+        for item in items:
+            for method in (item.info.methods.values() if item.info else ()):
+                for prop in (method.parameters.properties or {}).values():
+                    if prop.property_string:
+                        text = str(prop.property_string)
+                        formats.setdefault(text, prop.property_string.name(text))
+        return Code(
+            head=stream(
+                """
+                from ..schema import Format, Method, Param
+
+                {% for text, name in formats.items() %}
+                {{ name }} = {{ text }}
+                {% endfor %}
+
+                ENDPOINTS: dict[str, dict[str, Method]] = {
+                {% for item in items if item.info and item.info.methods %}
+                    {{ literal(item.path) }}: {
+                {% for name, method in item.info.methods.items() %}
+                        {{ literal(name) }}: Method({
+                {%- for param, prop in (method.parameters.properties or {}).items() -%}
+                {{ literal(param) }}: Param({{ literal(prop.type) }}, {{ literal(prop.optional) }}{{ prop.checks(formats) }}){% if not loop.last %}, {% endif %}
+                {%- endfor -%}
+                }, {{ literal(method.returns.type or "object") }}, {{ literal(method.returns.fields) }}{% if method.parameters.additional %}, additional=True{% endif %}),
+                {% endfor %}
+                    },
+                {% endfor %}
+                }
+                """,
+                items=items,
+                formats=formats,
+            )
+        )
+
+    def endpoints(self, patch: Patch, apiversion: str) -> Code:
+        items = [item for child in self.children for item in child.walk()]
+        for item in items:
+            item.visit(patch)
+
+        def attribute(path: str) -> str:
+            segment = Path.new(path)[-1]
+            return "" if segment.is_param else segment.as_property
+
+        def methods(item: ApiSchemaItem) -> tuple[tuple[str, tuple[Any, ...]], ...]:
+            if not item.info:
+                return ()
+            return tuple((name.lower(), method.returns.spec) for name, method in item.info.methods.items())
+
+        return Code(
+            head=stream(
+                """
+                # Path, attribute of its last segment or "" for a parameter and the returned
+                # type of each method, read by proxmoxer_types.runtime
+                ENDPOINTS = (
+                {% for item in items %}
+                    ({{ literal(item.path) }}, {{ literal(attribute(item.path)) }}, {{ literal(methods(item)) }}),
+                {% endfor %}
+                )
+                """,
+                items=items,
+                attribute=attribute,
+                methods=methods,
             )
         )
@@ -1,8 +1,9 @@
 import argparse
-import json
 from pathlib import Path
 from . import ApiSchema
-from .patches import Patch as BasePatch
+from .build import generate_all, load, patch, stitch, subtree, write, write_slim
+from .profiling import dump, profile, summary
+from .shaking import reachable, shake
 
 parser = argparse.ArgumentParser(
     formatter_class=argparse.ArgumentDefaultsHelpFormatter
@@ -20,44 +21,157 @@ parser.add_argument(
 )
 parser.add_argument(
     "--types",
-    type=Path,
+    type=str,
     help="type destination, e.g. proxmoxer_types/v*/core.py",
 )
+parser.add_argument(
+    "--table",
+    type=str,
+    help="endpoint table destination, e.g. proxmoxer_types/v*/table.py, --types then check the parameters of calls against it",
+)
+parser.add_argument(
+    "--endpoints",
+    type=str,
+    help="endpoint manifest destination, e.g. proxmoxer_types/v*/endpoints.py, "
+    "the tuples proxmoxer_types.runtime builds its handles from",
+)
+parser.add_argument(
+    "--slim",
+    action="store_true",
+    help="also write body-less .pyi stubs next to --types, split per top level path, "
+    "type checkers read them instead of the types",
+)
+parser.add_argument(
+    "--shapes",
+    type=Path,
+    help="destination of the return shapes shared by every version with --all, "
+    "e.g. proxmoxer_types/shapes.py, the types import them from there",
+)
 parser.add_argument(
     "--apiversion",
     type=str,
     choices=('v6', 'v7', 'v8', 'v9'),
     help="PVE major version of the JSON schema",
-    required=True,
+)
+parser.add_argument(
+    "--all",
+    action="store_true",
+    help="generate every apidata-v*.json in --apidata in parallel, "
+    "--types and --table contain {apiversion}, --stubs is generated from the latest version",
+)
+parser.add_argument(
+    "--apidata",
+    type=Path,
+    help="directory of apidata-v*.json files for --all",
+    default=Path("apidata"),
+)
+parser.add_argument(
+    "--jobs",
+    type=int,
+    help="worker processes for --all, defaults to the number of CPUs",
+)
+parser.add_argument(
+    "--cache",
+    type=Path,
+    help="directory of pruned schemas and rendered fragments, types are only regenerated for changed schema subtrees",
+)
+parser.add_argument(
+    "--explain",
+    action="store_true",
+    help="list the paths regenerated despite --cache and why",
+)
+parser.add_argument(
+    "--only",
+    action="append",
+    help="generate only the endpoints matching this fnmatch pattern, e.g. '/nodes/{node}/qemu*', "
+    "and their parents, can be repeated",
+)
+parser.add_argument(
+    "--scan",
+    type=Path,
+    action="append",
+    help="generate only the endpoints reached from the ProxmoxAPI attribute chains "
+    "and path strings in this Python file or directory, and their parents, can be repeated",
+)
+
+parser.add_argument(
+    "--profile",
+    type=Path,
+    help="instead of writing them, generate the types, stubs and table of --config "
+    "(of every apidata-v*.json in --apidata with --all) in memory and write the wall time, "
+    "allocations and peak memory of every phase and top level subtree to this JSON report",
 )
 
 args = parser.parse_args()
 
-Patch: type[BasePatch]
-
-if args.apiversion == "v6":
-    from .patches.v6 import Patch
-elif args.apiversion == "v7":
-    from .patches.v7 import Patch
-elif args.apiversion == "v8":
-    from .patches.v8 import Patch
-elif args.apiversion == "v9":
-    from .patches.v9 import Patch
-else:
-    raise RuntimeError(f"API-Version {args.apiversion} unsupported")
-
-with args.config.open() as src:
-    schema = ApiSchema(children=json.load(src))
-
-for todo in (
-    (args.stubs, schema.stubs),
-    (args.types, schema.types),
+if args.explain and not args.cache:
+    parser.error("--explain needs --cache")
+
+if (args.only or args.scan) and (args.all or args.profile):
+    parser.error("--only and --scan need a single --apiversion")
+
+if args.profile:
+    if args.all:
+        configs = {config.stem.removeprefix("apidata-"): config for config in sorted(args.apidata.glob("apidata-v*.json"))}
+    elif args.apiversion is None:
+        parser.error("--apiversion is required without --all")
+    else:
+        configs = {args.apiversion: args.config}
+    report = {apiversion: profile(config, apiversion, args.cache) for apiversion, config in configs.items()}
+    dump(report, args.profile)
+    print(summary(report))
+    parser.exit()
+
+if args.all:
+    for option in ("types", "table", "endpoints"):
+        if getattr(args, option) and "{apiversion}" not in getattr(args, option):
+            parser.error(f"--{option} needs an {{apiversion}} placeholder with --all")
+    generate_all(
+        args.apidata,
+        stubs=args.stubs,
+        types=args.types,
+        table=args.table,
+        workers=args.jobs,
+        cache=args.cache,
+        explain=args.explain,
+        shapes=args.shapes,
+        endpoints=args.endpoints,
+        slim=args.slim,
+    )
+    parser.exit()
+
+if args.shapes:
+    parser.error("--shapes needs --all")
+
+if args.apiversion is None:
+    parser.error("--apiversion is required without --all")
+
+if args.slim and not args.types:
+    parser.error("--slim needs --types")
+
+data = load(args.config, args.cache)
+if args.only or args.scan:
+    data = shake(data, reachable(data, args.only or (), args.scan or ()))
+
+for destination, generate in (
+    (args.stubs, ApiSchema.stubs),
+    (args.types, ApiSchema.types),
+    (args.table, ApiSchema.table),
+    (args.endpoints, ApiSchema.endpoints),
 ):
-    if todo[0]:
-        with todo[0].open("w") as dst:
-            print(
-                f"# This file is autogenerated from {args.config}",
-                file=dst,
-            )
-            print(file=dst)
-            print(todo[1](patch=Patch(), apiversion=args.apiversion), file=dst)
+    if not destination:
+        continue
+    if generate is ApiSchema.types and args.cache and not (args.only or args.scan):
+        parts = (
+            subtree(args.config, args.apiversion, index, args.cache, Path(destination))
+            for index in range(len(data))
+        )
+        code = stitch(args.apiversion, parts, args.explain, checked=bool(args.table))
+    elif generate is ApiSchema.types:
+        code = ApiSchema.parse(data).types(patch=patch(args.apiversion), apiversion=args.apiversion, checked=bool(args.table))
+    else:
+        # Patches modify the schema, every destination gets a pristine copy
+        code = generate(ApiSchema.parse(data), patch=patch(args.apiversion), apiversion=args.apiversion)
+    write(Path(destination), args.config, code)
+    if generate is ApiSchema.types and args.slim:
+        write_slim(Path(destination), args.config)
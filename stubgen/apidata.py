@@ -0,0 +1,85 @@
+import hashlib
+import json
+import marshal
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+# Part of the cache file name, bump whenever prune() keeps different fields
+FORMAT = 4
+
+METHODS = ("DELETE", "GET", "POST", "PUT")
+# Fields of a parameter the generated code uses
+PARAMETER = ("type", "optional", "enum", "minimum", "maximum", "format", "default")
+# Fields of a key of a property string, the format of a parameter like net[n]
+KEY = ("type", "optional", "enum", "minimum", "maximum", "format", "default_key", "alias", "keyAlias")
+
+
+def prune_returns(data: dict[str, Any]) -> dict[str, Any]:
+    ret: dict[str, Any] = {key: data[key] for key in ("type", "optional", "enum") if key in data}
+    for key in ("items", "values"):
+        if data.get(key) is not None:
+            ret[key] = prune_returns(data[key])
+    if data.get("properties") is not None:
+        ret["properties"] = {key: prune_returns(value) for key, value in data["properties"].items()}
+    return ret
+
+
+def prune_parameter(data: dict[str, Any]) -> dict[str, Any]:
+    ret = {key: data[key] for key in PARAMETER if key in data}
+    if isinstance(ret.get("format"), dict):
+        ret["format"] = {
+            name: {key: value[key] for key in KEY if key in value}
+            for name, value in ret["format"].items()
+        }
+    return ret
+
+
+def prune_method(data: dict[str, Any]) -> dict[str, Any]:
+    properties = data["parameters"].get("properties")
+    return {
+        "method": data["method"],
+        "returns": prune_returns(data["returns"]),
+        "parameters": {
+            "properties": None if properties is None else {
+                name: prune_parameter(prop) for name, prop in properties.items()
+            },
+            "additionalProperties": data["parameters"].get("additionalProperties"),
+        },
+    }
+
+
+def prune(data: dict[str, Any]) -> dict[str, Any]:
+    ret: dict[str, Any] = {key: data[key] for key in ("leaf", "path", "text")}
+    if data.get("info") is not None:
+        ret["info"] = {
+            name: prune_method(method)
+            for name, method in data["info"].items()
+            if name in METHODS and method is not None
+        }
+    if data.get("children") is not None:
+        ret["children"] = [prune(child) for child in data["children"]]
+    return ret
+
+
+def load(config: Path, cache: Optional[Path] = None) -> list[dict[str, Any]]:
+    raw = config.read_bytes()
+    if cache is None:
+        return [prune(item) for item in json.loads(raw)]
+    path = cache / "apidata" / f"{config.stem}-{FORMAT}-{hashlib.sha256(raw).hexdigest()[:16]}.marshal"
+    try:
+        with path.open("rb") as src:
+            data: list[dict[str, Any]] = marshal.load(src)
+        return data
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    data = [prune(item) for item in json.loads(raw)]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for stale in path.parent.glob(f"{config.stem}-*.marshal"):
+        stale.unlink(missing_ok=True)
+    # Workers of stubgen --all may race, only ever expose complete files
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with tmp.open("wb") as dst:
+        marshal.dump(data, dst)
+    tmp.replace(path)
+    return data
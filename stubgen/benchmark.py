@@ -0,0 +1,200 @@
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from functools import partial
+from pathlib import Path
+from typing import Callable, TypeVar
+
+from . import ApiSchema, apidata
+from .patches import Patch
+from .profiling import Report, dump, profile, regressions, summary
+
+parser = argparse.ArgumentParser(
+    formatter_class=argparse.ArgumentDefaultsHelpFormatter
+)
+parser.add_argument(
+    "--apidata",
+    type=Path,
+    help="directory of apidata-v*.json files",
+    default=Path("apidata"),
+)
+parser.add_argument(
+    "--repeat",
+    type=int,
+    help="report the fastest of this many runs",
+    default=3,
+)
+parser.add_argument(
+    "--baseline",
+    type=Path,
+    help="profile report of a previous run, fail if a phase or top level subtree got slower or uses more memory",
+    default=Path("benchmark.json"),
+)
+parser.add_argument(
+    "--tolerance",
+    type=float,
+    help="fraction above the baseline that still passes",
+    default=0.25,
+)
+parser.add_argument(
+    "--checkers",
+    type=Path,
+    help="instead of generating, time mypy and pyright on this file with the slim "
+    "stubs of proxmoxer_types and without, e.g. tests/test_cases.py",
+)
+parser.add_argument(
+    "--checkers-baseline",
+    type=Path,
+    help="seconds of a previous --checkers run, --save writes it",
+    default=Path("benchmark-checkers.json"),
+)
+parser.add_argument(
+    "--validation",
+    action="store_true",
+    help="instead of generating, time 10000 invalid calls of a generated validator of proxmoxer_types",
+)
+parser.add_argument(
+    "--save",
+    action="store_true",
+    help="write the profile report to --baseline instead of comparing with it",
+)
+
+T = TypeVar("T")
+
+
+def measure(repeat: int, setup: Callable[[], T], func: Callable[[T], object]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        arg = setup()
+        start = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def load(config: Path, cache: Path | None = None) -> ApiSchema:
+    return ApiSchema.parse(apidata.load(config, cache))
+
+
+def generate(schema: ApiSchema, apiversion: str, target: str) -> str:
+    patch: type[Patch] = importlib.import_module(f"stubgen.patches.{apiversion}").Patch
+    with contextlib.redirect_stdout(io.StringIO()):
+        return str(getattr(schema, target)(patch=patch(), apiversion=apiversion))
+
+
+def checkers(cases: Path, repeat: int) -> dict[str, dict[str, float]]:
+    """Seconds mypy and pyright take on `cases` in a copy of the packages, with the slim stubs and without."""
+    commands = {
+        # Without a cache, like a first run in CI
+        "mypy": [sys.executable, "-m", "mypy", "--cache-dir", os.devnull, "proxmoxer-stubs", cases.name],
+        "pyright": [sys.executable, "-m", "pyright", cases.name],
+    }
+    ret: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        for package in ("proxmoxer_types", "proxmoxer-stubs"):
+            shutil.copytree(package, root / package)
+        shutil.copy("pyproject.toml", root)
+        shutil.copy(cases, root)
+        for variant in ("slim", "full"):
+            if variant == "full":
+                for stub in root.glob("proxmoxer_types/v*/*.pyi"):
+                    stub.unlink()
+            ret[variant] = {
+                checker: round(measure(repeat, lambda: command, partial(subprocess.run, cwd=root, check=True, capture_output=True)), 2)
+                for checker, command in commands.items()
+            }
+    return ret
+
+
+def validation(repeat: int, calls: int = 10000) -> float:
+    """Seconds `calls` creations of a guest with too few cores take to fail locally."""
+    from proxmoxer_types.validation import validator
+
+    create = validator("proxmoxer_types.v9.core", "/nodes/{node}/qemu", "POST")
+
+    def run(calls: int) -> None:
+        for vmid in range(100, 100 + calls):
+            try:
+                create({"vmid": vmid, "cores": 0})
+            except ValueError:
+                continue
+            raise AssertionError("cores=0 passed the validator")
+
+    return measure(repeat, lambda: calls, run)
+
+
+def main() -> None:
+    args = parser.parse_args()
+    if args.validation:
+        print(f"{'validation':<10}{validation(args.repeat):>9.2f}s")
+        return
+    if args.checkers:
+        timings = checkers(args.checkers, args.repeat)
+        print(f"{'stubs':<10}" + "".join(f"{checker:>10}" for checker in timings["slim"]))
+        for variant, measured in timings.items():
+            print(f"{variant:<10}" + "".join(f"{second:>9.2f}s" for second in measured.values()))
+        if args.save:
+            with args.checkers_baseline.open("w") as dst:
+                json.dump(timings, dst, indent=2)
+                print(file=dst)
+        elif args.checkers_baseline.exists():
+            with args.checkers_baseline.open() as src:
+                previous = json.load(src)["slim"]
+            failed = [
+                f"{checker}: {previous[checker]} -> {second}"
+                for checker, second in timings["slim"].items()
+                if second > previous.get(checker, second) * (1 + args.tolerance)
+            ]
+            if failed:
+                parser.exit(1, "Regressions against {}:\n{}\n".format(args.checkers_baseline, "\n".join(failed)))
+        return
+    targets = ("types", "stubs", "table")
+    print(f"{'version':<10}{'load':>10}{'cached':>10}" + "".join(f"{target:>10}" for target in targets))
+    for config in sorted(args.apidata.glob("apidata-v*.json")):
+        apiversion = config.stem.removeprefix("apidata-")
+        data = apidata.load(config)
+        with tempfile.TemporaryDirectory() as cache:
+            load(config, Path(cache))
+            seconds = [
+                measure(args.repeat, lambda: config, load),
+                measure(args.repeat, lambda: config, lambda config: load(config, Path(cache))),
+            ]
+        seconds += [
+            measure(
+                args.repeat,
+                lambda: ApiSchema.parse(data),
+                partial(generate, apiversion=apiversion, target=target),
+            )
+            for target in targets
+        ]
+        print(f"{apiversion:<10}" + "".join(f"{second:>9.2f}s" for second in seconds))
+
+    report: Report = {}
+    for config in sorted(args.apidata.glob("apidata-v*.json")):
+        apiversion = config.stem.removeprefix("apidata-")
+        report[apiversion] = profile(config, apiversion)
+    print()
+    print(summary(report))
+    if args.save:
+        dump(report, args.baseline)
+        return
+    if not args.baseline.exists():
+        return
+    with args.baseline.open() as src:
+        baseline: Report = json.load(src)
+    failed = list(regressions(report, baseline, args.tolerance))
+    if failed:
+        parser.exit(1, "Regressions against {}:\n{}\n".format(args.baseline, "\n".join(failed)))
+
+
+if __name__ == "__main__":
+    main()
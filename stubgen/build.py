@@ -0,0 +1,163 @@
+import importlib
+import inspect
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, TypeAlias
+
+from . import LATEST, ApiSchema, ApiSchemaItem, Code, Shape, apidata, verbatim
+from .fragments import Fragments, digest
+from .patches import Patch
+from .slim import split
+
+# Rendered types of one top level path, the shapes it defines and the explanation of what was regenerated
+Fragment: TypeAlias = tuple[str, dict[str, str], list[str]]
+
+
+def patch(apiversion: str) -> Patch:
+    instance: Patch = importlib.import_module(f"{__package__}.patches.{apiversion}").Patch()
+    return instance
+
+
+@lru_cache(maxsize=None)
+def load(config: Path, cache: Optional[Path] = None) -> list[dict[str, Any]]:
+    return apidata.load(config, cache)
+
+
+def write(destination: Path, config: Path, code: Code) -> None:
+    with destination.open("w") as dst:
+        print(f"# This file is autogenerated from {config}", file=dst)
+        print(file=dst)
+        code.write(dst)
+
+
+def write_slim(destination: Path, config: Path) -> None:
+    """Body-less stubs of the types written to `destination`, next to them."""
+    for name, text in split(destination.read_text()).items():
+        stem = destination.stem if name == "core" else name
+        write(destination.with_name(f"{stem}.pyi"), config, verbatim(text))
+
+
+def render(config: Path, apiversion: str, target: str, cache: Optional[Path] = None) -> str:
+    # Patches modify the schema, every target gets a pristine copy
+    schema = ApiSchema.parse(load(config, cache))
+    return str(getattr(schema, target)(patch=patch(apiversion), apiversion=apiversion))
+
+
+def salt(apiversion: str) -> str:
+    modules = (".", ".fragments", ".patches", f".patches.{apiversion}")
+    return digest(*(inspect.getsource(importlib.import_module(module, __package__)) for module in modules))
+
+
+def manifest(cache: Path, destination: Path, path: str) -> Path:
+    return cache / destination.as_posix().strip("/").replace("/", "_") / (path.strip("/").replace("/", "_") + ".json")
+
+
+def subtree(
+    config: Path,
+    apiversion: str,
+    index: int,
+    cache: Optional[Path] = None,
+    destination: Optional[Path] = None,
+) -> Fragment:
+    item = ApiSchemaItem.parse(load(config, cache)[index])
+    schema = ApiSchema(children=[item])
+    definitions: dict[str, str] = {}
+    if cache is None or destination is None:
+        return "".join(code.render(definitions) for code in schema.typecodes(patch(apiversion))), definitions, []
+    # Patch up front, so that the subtree hashes cover what the patches change
+    hooks = patch(apiversion)
+    for each in item.walk():
+        each.visit(hooks)
+    fragments = Fragments.open(manifest(cache, destination, item.path), salt(apiversion))
+    fragments.index(item)
+    text = "".join(code.render(definitions) for code in schema.typecodes(Patch(), fragments))
+    fragments.save()
+    return text, definitions, [f"{destination}: {line}" for line in fragments.explanation]
+
+
+def result(future: "Future[str]") -> Code:
+    return verbatim(future.result())
+
+
+def stitch(
+    apiversion: str,
+    parts: Iterable[Fragment],
+    explain: bool = False,
+    shapes: Optional[dict[str, str]] = None,
+    checked: bool = False,
+) -> Code:
+    """Types of one version from its fragments, adding its shapes to `shapes` for a shared module if given."""
+    texts: list[str] = []
+    definitions: dict[str, str] = {}
+    for text, defined, explanation in parts:
+        if explain and explanation:
+            print(*explanation, sep="\n")
+        texts.append(text)
+        for name, definition in defined.items():
+            definitions.setdefault(name, definition)
+            if shapes is not None:
+                shapes.setdefault(name, definition)
+    return ApiSchema(children=[]).types(
+        patch=patch(apiversion),
+        apiversion=apiversion,
+        codes=map(verbatim, texts),
+        definitions=definitions,
+        shared=shapes is not None,
+        checked=checked,
+    )
+
+
+def generate_all(
+    directory: Path,
+    stubs: Optional[Path],
+    types: Optional[str],
+    table: Optional[str],
+    workers: Optional[int] = None,
+    cache: Optional[Path] = None,
+    explain: bool = False,
+    shapes: Optional[Path] = None,
+    endpoints: Optional[str] = None,
+    slim: bool = False,
+) -> None:
+    configs = {
+        config.stem.removeprefix("apidata-"): config
+        for config in sorted(directory.glob("apidata-v*.json"))
+    }
+    outputs: list[tuple[Path, Path, Callable[[], Code]]] = []
+    # Shapes of every version in version order, each defined once in the shared module
+    definitions: Optional[dict[str, str]] = None if shapes is None else {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for apiversion, config in configs.items():
+            if types:
+                # One job per top level path, stitched back together in schema order
+                count = len(load(config, cache))
+                destination = Path(types.format(apiversion=apiversion))
+                parts = [
+                    pool.submit(subtree, config, apiversion, index, cache, destination)
+                    for index in range(count)
+                ]
+                outputs.append((
+                    destination,
+                    config,
+                    partial(
+                        stitch, apiversion, (part.result() for part in parts), explain, definitions, checked=bool(table)
+                    ),
+                ))
+            for target, destination_template in (("table", table), ("endpoints", endpoints)):
+                if destination_template:
+                    future = pool.submit(render, config, apiversion, target, cache)
+                    outputs.append((Path(destination_template.format(apiversion=apiversion)), config, partial(result, future)))
+        if stubs:
+            future = pool.submit(render, configs[LATEST], LATEST, "stubs", cache)
+            outputs.append((stubs, configs[LATEST], partial(result, future)))
+        for destination, config, code in outputs:
+            write(destination, config, code())
+        if types and slim:
+            for job in [
+                pool.submit(write_slim, Path(types.format(apiversion=apiversion)), config)
+                for apiversion, config in configs.items()
+            ]:
+                job.result()
+    if shapes is not None and definitions is not None:
+        write(shapes, directory, Shape.module(definitions))
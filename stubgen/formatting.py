@@ -0,0 +1,31 @@
+"""Literals written the way black writes them, with double quotes where they need no more escapes."""
+
+import re
+
+STRINGS = re.compile(r'"(?:[^"\\\n]|\\.)*"|\'(?:[^\'\\\n]|\\.)*\'')
+
+
+def literal(value: object) -> str:
+    """Like repr, but with the quotes black prefers for strings."""
+    if isinstance(value, str):
+        return prefer_double_quotes(repr(value))
+    if isinstance(value, tuple):
+        items = ", ".join(literal(item) for item in value)
+        return f"({items},)" if len(value) == 1 else f"({items})"
+    if isinstance(value, list):
+        return "[" + ", ".join(literal(item) for item in value) + "]"
+    return repr(value)
+
+
+def prefer_double_quotes(text: str) -> str:
+    # black's normalize_string_quotes for a string literal without prefix
+    if text[0] != "'":
+        return text
+    body = text[1:-1]
+    unescaped = re.sub(r"([^\\]|^)\\((?:\\\\)*)'", r"\1\2'", body)
+    unescaped = re.sub(r"([^\\]|^)\\((?:\\\\)*)'", r"\1\2'", unescaped)
+    escaped = re.sub(r"([^\\]|^)((?:\\\\)*)\"", r'\1\2\\"', unescaped)
+    escaped = re.sub(r"([^\\]|^)((?:\\\\)*)\"", r'\1\2\\"', escaped)
+    if escaped.count('\\"') > body.count("\\'"):
+        return text
+    return f'"{escaped}"'
@@ -0,0 +1,182 @@
+import hashlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeAlias
+
+from . import ApiSchemaItem, Code, Emitter, Sink
+
+# Rendered text, a one element list holding the key of a nested item's fragment,
+# or a module level definition made in between
+Parts: TypeAlias = list[str | list[str] | dict[str, str]]
+
+
+class Recorder:
+    def __init__(self, target: Sink, parts: Parts) -> None:
+        self.target = target
+        self.parts = parts
+
+    def write(self, text: str) -> int:
+        self.parts.append(text)
+        return self.target.write(text)
+
+    def define(self, name: str, text: str) -> None:
+        self.parts.append({"name": name, "text": text})
+
+
+def coalesce(parts: Parts) -> Parts:
+    ret: Parts = []
+    text: list[str] = []
+    for part in parts:
+        if isinstance(part, str):
+            text.append(part)
+            continue
+        if text:
+            ret.append("".join(text))
+            text = []
+        ret.append(part)
+    if text:
+        ret.append("".join(text))
+    return ret
+
+
+def state(out: Emitter) -> dict[str, Any]:
+    # Where the emitter stands after a fragment, restored after replaying it
+    return {"pending": out.pending, "blank": out.blank, "opened": out.opened, "last": out.last}
+
+
+def restore(out: Emitter, fragment: dict[str, Any]) -> None:
+    out.pending, out.blank, out.opened, out.last = (fragment[name] for name in ("pending", "blank", "opened", "last"))
+
+
+def digest(*parts: str) -> str:
+    ret = hashlib.sha256()
+    for part in parts:
+        ret.update(part.encode())
+        ret.update(b"\0")
+    return ret.hexdigest()
+
+
+@dataclass
+class Fragments:
+    """Rendered code of one top level subtree, reused for items whose subtree hash is unchanged."""
+
+    manifest: Path
+    # Digest of the generator and patch sources, part of every key
+    salt: str
+    fragments: dict[str, dict[str, Any]] = field(default_factory=dict)
+    # Previous run: path -> (digest of the item without children, key)
+    paths: dict[str, tuple[str, str]] = field(default_factory=dict)
+    previous: str | None = None
+    root: str = ""
+    items: dict[str, ApiSchemaItem] = field(default_factory=dict)
+    keys: dict[int, str] = field(default_factory=dict)
+    owns: dict[str, str] = field(default_factory=dict)
+    used: dict[str, dict[str, Any]] = field(default_factory=dict)
+    explanation: list[str] = field(default_factory=list)
+
+    @classmethod
+    def open(cls, manifest: Path, salt: str) -> "Fragments":
+        ret = cls(manifest=manifest, salt=salt)
+        try:
+            with manifest.open() as src:
+                data = json.load(src)
+        except (OSError, ValueError):
+            return ret
+        ret.previous = data["salt"]
+        if ret.previous == salt:
+            ret.fragments = data["fragments"]
+        ret.paths = {path: (own, key) for path, (own, key) in data["paths"].items()}
+        return ret
+
+    def save(self) -> None:
+        for path in self.paths.keys() - self.owns.keys():
+            self.explanation.append(f"{path}: removed")
+        self.manifest.parent.mkdir(parents=True, exist_ok=True)
+        with self.manifest.open("w") as dst:
+            json.dump(
+                {
+                    "salt": self.salt,
+                    "paths": {
+                        path: (self.owns[path], self.keys[id(item)])
+                        for path, item in self.items.items()
+                    },
+                    "fragments": self.used,
+                },
+                dst,
+            )
+
+    def index(self, item: ApiSchemaItem) -> str:
+        # Merkle hash: an item's key changes with its own schema or any descendant's key
+        self.root = self.root or item.path
+        children = [self.index(child) for child in item.children or ()]
+        own = digest(repr(item))
+        key = digest(self.salt, own, *children)
+        self.keys[id(item)] = key
+        self.owns[item.path] = own
+        self.items[item.path] = item
+        return key
+
+    def reason(self, item: ApiSchemaItem) -> str:
+        if self.previous is None:
+            return "not cached"
+        if self.previous != self.salt:
+            return "generator or patches changed"
+        if item.path not in self.paths:
+            return "new"
+        if self.paths[item.path][0] != self.owns[item.path]:
+            return "schema changed"
+        return "descendant changed"
+
+    def cached(self, item: ApiSchemaItem) -> Code | None:
+        key = self.keys[id(item)]
+        if key not in self.fragments:
+            return None
+
+        def head(out: Emitter) -> None:
+            assert out.pending == ""
+            out.separate(out.prefix)
+            parent = out.dst
+            dst = parent.target if isinstance(parent, Recorder) else parent
+            self.replay(key, dst, out.definitions)
+            if isinstance(parent, Recorder):
+                parent.parts.append([key])
+            restore(out, self.fragments[key])
+
+        return Code(head=head)
+
+    def replay(self, key: str, dst: Sink, definitions: dict[str, str]) -> None:
+        fragment = self.used[key] = self.fragments[key]
+        for part in fragment["parts"]:
+            if isinstance(part, str):
+                dst.write(part)
+            elif isinstance(part, dict):
+                definitions.setdefault(part["name"], part["text"])
+            else:
+                self.replay(part[0], dst, definitions)
+
+    def record(self, item: ApiSchemaItem, code: Code) -> Code:
+        key = self.keys[id(item)]
+        reason = self.reason(item)
+        if item.path == self.root or reason not in ("not cached", "generator or patches changed"):
+            self.explanation.append(f"{item.path}: {reason}")
+
+        def head(out: Emitter) -> None:
+            if out.pending != "":
+                # Only fragments starting on a fresh line can be replayed anywhere
+                code.head(out)
+                return
+            # Blank lines before the fragment depend on what precedes it, they belong to the parent
+            out.separate(out.prefix)
+            parent = out.dst
+            parts: Parts = []
+            out.dst = Recorder(parent.target if isinstance(parent, Recorder) else parent, parts)
+            try:
+                code.head(out)
+            finally:
+                out.dst = parent
+            if isinstance(parent, Recorder):
+                parent.parts.append([key])
+            self.used[key] = {"parts": coalesce(parts), **state(out)}
+
+        return Code(head=head)
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Any, Optional, Union, Self, TypeAlias
+from typing import Callable, ClassVar, Optional, Union, Self, TypeAlias
 
 import stubgen
 
@@ -10,33 +10,93 @@ CallType: TypeAlias = Union[
     "stubgen.ApiSchemaItemInfoMethodReturns",
 ]
 
+Hook: TypeAlias = Callable[[CallType], None]
+
+
+@dataclass(frozen=True, slots=True)
+class Call:
+    call: CallType
+    name: Optional[str] = None
+    # Calls are shared by every patch below them, a callpath is the chain of parents
+    parent: Optional["Call"] = None
+
+    def __str__(self) -> str:
+        if isinstance(self.call, stubgen.ApiSchemaItem):
+            assert isinstance(self.call.path, str)
+            return self.call.path
+        elif isinstance(self.call, stubgen.ApiSchemaItemInfo):
+            return "info"
+        elif isinstance(self.call, stubgen.ApiSchemaItemInfoMethod):
+            assert isinstance(self.call.method, str)
+            return self.call.method
+        else:
+            type_: str = getattr(self.call, 'type') or ''
+            return f"{type_}[{self.name}]" if self.name else type_
+
+
 @dataclass
+class Node:
+    """Trie of registered callpaths, one level per callpath component."""
+
+    children: dict[str, "Node"] = field(default_factory=dict)
+    hooks: list[tuple[Hook, str]] = field(default_factory=list)
+
+
 class Patch:
-    @dataclass
-    class Call:
-        call: CallType
-        name: Optional[str] = None
-
-        def __str__(self) -> str:
-            if isinstance(self.call, stubgen.ApiSchemaItem):
-                assert isinstance(self.call.path, str)
-                return self.call.path
-            elif isinstance(self.call, stubgen.ApiSchemaItemInfo):
-                return "info"
-            elif isinstance(self.call, stubgen.ApiSchemaItemInfoMethod):
-                assert isinstance(self.call.method, str)
-                return self.call.method
-            else:
-                type_: str = getattr(self.call, 'type') or ''
-                return f"{type_}[{self.name}]" if self.name else type_
-
-    callpath: list[Call] = field(default_factory=list)
+    """Schema fixes of one API version, see Patch.register.
+
+    A patch follows the descent through the schema. Its node is None as soon
+    as no registered callpath starts with the current one, so unpatched
+    subtrees cost nothing beyond the descent itself.
+    """
+
+    registry: ClassVar[Node] = Node()
+
+    def __init_subclass__(cls) -> None:
+        super().__init_subclass__()
+        cls.registry = Node()
+
+    def __init__(self, call: Optional[Call] = None, node: Optional[Node] = None) -> None:
+        self.call = call
+        self.node = self.registry if call is None else node
+
+    @classmethod
+    def register(cls, *callpaths: str, reason: str) -> Callable[[Hook], Hook]:
+        """Run the decorated hook with the schema object at each of the callpaths.
+
+        A callpath is the repr of the patch at that object, e.g.
+        '/nodes/{node}/qemu.info.GET.array.object'.
+        """
+        def decorator(hook: Hook) -> Hook:
+            for callpath in callpaths:
+                node = cls.registry
+                for component in callpath.split("."):
+                    node = node.children.setdefault(component, Node())
+                node.hooks.append((hook, reason))
+            return hook
+        return decorator
+
+    @property
+    def callpath(self) -> list[Call]:
+        ret = []
+        call = self.call
+        while call is not None:
+            ret.append(call)
+            call = call.parent
+        return ret[::-1]
 
     def hook(self) -> None:
-        pass
+        if self.node is None or not self.node.hooks:
+            return
+        assert self.call is not None
+        for hook, reason in self.node.hooks:
+            print(f"{hook.__module__}: Patching {self}: {reason}")
+            hook(self.call.call)
 
     def __call__(self, head: CallType, name: Optional[str] = None) -> Self:
-        return type(self)(callpath=[*self.callpath, self.Call(call=head, name=name)])
+        call = Call(call=head, name=name, parent=self.call)
+        node = None if self.node is None else self.node.children.get(str(call))
+        return type(self)(call, node)
 
     def __repr__(self) -> str:
         return ".".join(str(call) for call in self.callpath)
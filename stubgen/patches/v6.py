@@ -1,5 +1,4 @@
-from typing import Any
-from . import Patch as BasePatch
+from . import CallType, Patch as BasePatch
 from .. import (
     Code,
     Path,
@@ -11,25 +10,24 @@ from .. import (
 __all__ = ["Patch"]
 
 class Patch(BasePatch):
-    def hook(self) -> None:
-        obj = self.callpath[-1].call
+    pass
 
-        # /nodes/...
+# /nodes/...
 
-        if self == "/nodes/{node}/qemu/{vmid}/cloudinit":
-            print(f"{__name__}: Patching {self}: transform vmid type from str to int")
-            assert isinstance(obj, ApiSchemaItem)
-            assert obj.info is None
+@Patch.register("/nodes/{node}/qemu/{vmid}/cloudinit", reason="transform vmid type from str to int")
+def qemu_cloudinit(obj: CallType) -> None:
+    assert isinstance(obj, ApiSchemaItem)
+    assert obj.info is None
 
-            class FakeInfo(ApiSchemaItemInfo):
-                def dump(self, path: Path, patch: BasePatch) -> Code:
-                    return Code()
+    class FakeInfo(ApiSchemaItemInfo):
+        def dump(self, path: Path, patch: BasePatch) -> Code:
+            return Code()
 
-                def param_type(self, name: str) -> ApiSchemaItemInfoMethodProperty:
-                    if name == "vmid":
-                        return ApiSchemaItemInfoMethodProperty(type="integer")
-                    elif name == "node":
-                        return ApiSchemaItemInfoMethodProperty(type="string")
-                    else:
-                        raise NotImplementedError(name)
-            obj.info = FakeInfo()
+        def param_type(self, name: str) -> ApiSchemaItemInfoMethodProperty:
+            if name == "vmid":
+                return ApiSchemaItemInfoMethodProperty(type="integer")
+            elif name == "node":
+                return ApiSchemaItemInfoMethodProperty(type="string")
+            else:
+                raise NotImplementedError(name)
+    obj.info = FakeInfo()
@@ -1,5 +1,4 @@
-from typing import Any
-from . import Patch as BasePatch
+from . import CallType, Patch as BasePatch
 from .. import (
     ApiSchemaItemInfoMethodReturns,
     ApiSchemaItemInfoMethodReturnsArray,
@@ -13,74 +12,80 @@ from .. import (
 __all__ = ["Patch"]
 
 class Patch(BasePatch):
-    def hook(self) -> None:
-        obj = self.callpath[-1].call
-
-        # /cluster/...
-
-        if self == '/cluster/ha/rules.info.GET.array.object':
-            print(f"{__name__}: Patching {self}: Add nodes, resources, type properties")
-            assert isinstance(obj, ApiSchemaItemInfoMethodReturnsObject)
-            assert isinstance(obj.properties, dict)
-            obj.properties["affinity"] = ApiSchemaItemInfoMethodReturnsString(optional=True, type="string")
-            obj.properties["disable"] = ApiSchemaItemInfoMethodReturnsBoolean(optional=True, type="boolean")
-            obj.properties["strict"] = ApiSchemaItemInfoMethodReturnsBoolean(optional=True, type="boolean")
-            obj.properties["nodes"] = ApiSchemaItemInfoMethodReturnsString(optional=True, type="string")
-            obj.properties["resources"] = ApiSchemaItemInfoMethodReturnsString(optional=True, type="string")
-            obj.properties["type"] = ApiSchemaItemInfoMethodReturnsString(optional=False, type="string")
-
-
-        if self == '/cluster/ha/status/current.info.GET.array.object':
-            print(f"{__name__}: Patching {self}: Specify type property as string")
-            assert isinstance(obj, ApiSchemaItemInfoMethodReturnsObject)
-            assert isinstance(obj.properties, dict)
-            obj.properties["type"] = ApiSchemaItemInfoMethodReturnsString(optional=False, type="string", enum=["quorum", "master", "lrm", "service"])
-
-        # /nodes/...
-
-        if self == '/nodes.info.GET.array.object':
-            print(f"{__name__}: Patching {self}: Add disk and maxdisk propertries")
-            assert isinstance(obj, ApiSchemaItemInfoMethodReturnsObject)
-            assert isinstance(obj.properties, dict)
-            obj.properties["disk"] = ApiSchemaItemInfoMethodReturnsInteger(optional=True, type="integer")
-            obj.properties["maxdisk"] = ApiSchemaItemInfoMethodReturnsInteger(optional=True, type="integer")
-
-        if self == "/pools/{poolid}.info.GET.object[members].array.object":
-            print(f"{__name__}: Patching {self}: Add name property")
-            assert isinstance(obj, ApiSchemaItemInfoMethodReturnsObject)
-            assert isinstance(obj.properties, dict)
-            obj.properties["name"] = ApiSchemaItemInfoMethodReturnsString(optional=False, type="string")
-
-        if self == "/nodes/{node}/qemu.info.GET.array.object":
-            print(f"{__name__}: Patching {self}: Add disk property")
-            assert isinstance(obj, ApiSchemaItemInfoMethodReturnsObject)
-            assert isinstance(obj.properties, dict)
-            obj.properties["disk"] = ApiSchemaItemInfoMethodReturnsInteger(optional=True, type="integer")
-
-        # Returned data is not a dict with fields as specified but a dict whose values are a dict as specified
-        if self == "/nodes/{node}/qemu/{vmid}/migrate.info.GET.object":
-            print(f"{__name__}: Patching {self}: Modify node_allowed_nodes property")
-            assert isinstance(obj, ApiSchemaItemInfoMethodReturnsObject)
-            assert isinstance(obj.properties, dict)
-            obj.properties["not_allowed_nodes"] = ApiSchemaItemInfoMethodReturnsObject(
-                optional=True,
-                type="object",
-                values=obj.properties["not_allowed_nodes"],
-            )
-
-        if self == '/nodes/{node}/apt/repositories.info.GET.object[infos].array.object':
-            print(f"{__name__}: Patching {self}: Fixing index property from string to integer")
-            assert isinstance(obj, ApiSchemaItemInfoMethodReturnsObject)
-            assert isinstance(obj.properties, dict)
-            obj.properties["index"] = ApiSchemaItemInfoMethodReturnsInteger(optional=False, type="integer")
-
-        if self in (
-            '/nodes/{node}/rrddata.info.GET.array',
-            '/nodes/{node}/qemu/{vmid}/rrddata.info.GET.array',
-            '/nodes/{node}/lxc/{vmid}/rrddata.info.GET.array',
-        ):
-            print(f"{__name__}: Patching {self}: Define rrddata")
-            assert isinstance(obj, ApiSchemaItemInfoMethodReturnsArray)
-            assert isinstance(obj.items, ApiSchemaItemInfoMethodReturnsObject)
-            obj.items.properties = None
-            obj.items.values = ApiSchemaItemInfoMethodReturnsNumber(optional=False, type="number")
+    pass
+
+# /cluster/...
+
+@Patch.register('/cluster/ha/rules.info.GET.array.object', reason="Add nodes, resources, type properties")
+def ha_rules(obj: CallType) -> None:
+    assert isinstance(obj, ApiSchemaItemInfoMethodReturnsObject)
+    assert isinstance(obj.properties, dict)
+    obj.properties["affinity"] = ApiSchemaItemInfoMethodReturnsString(optional=True, type="string")
+    obj.properties["disable"] = ApiSchemaItemInfoMethodReturnsBoolean(optional=True, type="boolean")
+    obj.properties["strict"] = ApiSchemaItemInfoMethodReturnsBoolean(optional=True, type="boolean")
+    obj.properties["nodes"] = ApiSchemaItemInfoMethodReturnsString(optional=True, type="string")
+    obj.properties["resources"] = ApiSchemaItemInfoMethodReturnsString(optional=True, type="string")
+    obj.properties["type"] = ApiSchemaItemInfoMethodReturnsString(optional=False, type="string")
+
+
+@Patch.register('/cluster/ha/status/current.info.GET.array.object', reason="Specify type property as string")
+def ha_status_current(obj: CallType) -> None:
+    assert isinstance(obj, ApiSchemaItemInfoMethodReturnsObject)
+    assert isinstance(obj.properties, dict)
+    obj.properties["type"] = ApiSchemaItemInfoMethodReturnsString(optional=False, type="string", enum=["quorum", "master", "lrm", "service"])
+
+
+# /nodes/...
+
+@Patch.register('/nodes.info.GET.array.object', reason="Add disk and maxdisk propertries")
+def nodes(obj: CallType) -> None:
+    assert isinstance(obj, ApiSchemaItemInfoMethodReturnsObject)
+    assert isinstance(obj.properties, dict)
+    obj.properties["disk"] = ApiSchemaItemInfoMethodReturnsInteger(optional=True, type="integer")
+    obj.properties["maxdisk"] = ApiSchemaItemInfoMethodReturnsInteger(optional=True, type="integer")
+
+
+@Patch.register("/pools/{poolid}.info.GET.object[members].array.object", reason="Add name property")
+def pools_poolid_members(obj: CallType) -> None:
+    assert isinstance(obj, ApiSchemaItemInfoMethodReturnsObject)
+    assert isinstance(obj.properties, dict)
+    obj.properties["name"] = ApiSchemaItemInfoMethodReturnsString(optional=False, type="string")
+
+
+@Patch.register("/nodes/{node}/qemu.info.GET.array.object", reason="Add disk property")
+def qemu(obj: CallType) -> None:
+    assert isinstance(obj, ApiSchemaItemInfoMethodReturnsObject)
+    assert isinstance(obj.properties, dict)
+    obj.properties["disk"] = ApiSchemaItemInfoMethodReturnsInteger(optional=True, type="integer")
+
+
+# Returned data is not a dict with fields as specified but a dict whose values are a dict as specified
+@Patch.register("/nodes/{node}/qemu/{vmid}/migrate.info.GET.object", reason="Modify node_allowed_nodes property")
+def qemu_migrate(obj: CallType) -> None:
+    assert isinstance(obj, ApiSchemaItemInfoMethodReturnsObject)
+    assert isinstance(obj.properties, dict)
+    obj.properties["not_allowed_nodes"] = ApiSchemaItemInfoMethodReturnsObject(
+        optional=True,
+        type="object",
+        values=obj.properties["not_allowed_nodes"],
+    )
+
+
+@Patch.register('/nodes/{node}/apt/repositories.info.GET.object[infos].array.object', reason="Fixing index property from string to integer")
+def apt_repositories_infos(obj: CallType) -> None:
+    assert isinstance(obj, ApiSchemaItemInfoMethodReturnsObject)
+    assert isinstance(obj.properties, dict)
+    obj.properties["index"] = ApiSchemaItemInfoMethodReturnsInteger(optional=False, type="integer")
+
+
+@Patch.register(
+    '/nodes/{node}/rrddata.info.GET.array',
+    '/nodes/{node}/qemu/{vmid}/rrddata.info.GET.array',
+    '/nodes/{node}/lxc/{vmid}/rrddata.info.GET.array',
+    reason="Define rrddata",
+)
+def rrddata(obj: CallType) -> None:
+    assert isinstance(obj, ApiSchemaItemInfoMethodReturnsArray)
+    assert isinstance(obj.items, ApiSchemaItemInfoMethodReturnsObject)
+    obj.items.properties = None
+    obj.items.values = ApiSchemaItemInfoMethodReturnsNumber(optional=False, type="number")
@@ -0,0 +1,142 @@
+"""Wall time, allocations and peak memory of the phases of generating an API version.
+
+Memory is traced with tracemalloc, which slows everything down: seconds are
+comparable between profiles, not with an untraced run. A measurement holds the
+bytes still allocated at the end of the phase and the most allocated at once
+during it, both relative to its start.
+"""
+
+import contextlib
+import io
+import json
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Optional, TypeAlias
+
+from . import ApiSchema, apidata
+from .build import Fragment, patch, stitch
+from .patches import Patch
+
+# Version -> {"phases": phase -> measurement, "subtrees": top level path -> phase -> measurement}
+Report: TypeAlias = dict[str, dict[str, dict[str, Any]]]
+
+TARGETS = ("types", "stubs", "table")
+METRICS = ("seconds", "allocated", "peak")
+
+
+@dataclass
+class Open:
+    start: float
+    memory: int
+    peak: int
+
+
+@dataclass
+class Profiler:
+    open: list[Open] = field(default_factory=list)
+
+    @contextlib.contextmanager
+    def measure(self, measurements: dict[str, Any], name: str) -> Iterator[None]:
+        self.fold()
+        memory = tracemalloc.get_traced_memory()[0]
+        phase = Open(time.perf_counter(), memory, memory)
+        self.open.append(phase)
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - phase.start
+            self.fold()
+            self.open.pop()
+            measurements[name] = {
+                "seconds": round(seconds, 4),
+                "allocated": tracemalloc.get_traced_memory()[0] - phase.memory,
+                "peak": phase.peak - phase.memory,
+            }
+
+    def fold(self) -> None:
+        # tracemalloc keeps a single peak, carry it into the open phases before resetting it
+        peak = tracemalloc.get_traced_memory()[1]
+        for phase in self.open:
+            phase.peak = max(phase.peak, peak)
+        tracemalloc.reset_peak()
+
+
+def profile(config: Path, apiversion: str, cache: Optional[Path] = None) -> dict[str, dict[str, Any]]:
+    """Generate the types, stubs and table of one version in memory, measuring each phase and top level subtree."""
+    phases: dict[str, Any] = {}
+    subtrees: dict[str, dict[str, Any]] = {}
+    profiler = Profiler()
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        with profiler.measure(phases, "total"), contextlib.redirect_stdout(io.StringIO()):
+            with profiler.measure(phases, "load"):
+                data = apidata.load(config, cache)
+            with profiler.measure(phases, "parse"):
+                schema = ApiSchema.parse(data)
+            # Patched up front like cached subtrees are, so that rendering can be told apart
+            hooks = patch(apiversion)
+            with profiler.measure(phases, "patch"):
+                for item in schema.children:
+                    with profiler.measure(subtrees.setdefault(item.path, {}), "patch"):
+                        for each in item.walk():
+                            each.visit(hooks)
+            texts: dict[str, str] = {}
+            with profiler.measure(phases, "render types"):
+                parts: list[Fragment] = []
+                for item in schema.children:
+                    definitions: dict[str, str] = {}
+                    with profiler.measure(subtrees[item.path], "render"):
+                        text = "".join(code.render(definitions) for code in ApiSchema(children=[item]).typecodes(Patch()))
+                    parts.append((text, definitions, []))
+                texts["types"] = str(stitch(apiversion, parts))
+            for target in TARGETS:
+                if target not in texts:
+                    # Patches modify the schema, every target gets a pristine copy
+                    pristine = ApiSchema.parse(data)
+                    with profiler.measure(phases, f"render {target}"):
+                        texts[target] = str(getattr(pristine, target)(patch=patch(apiversion), apiversion=apiversion))
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    return {"phases": phases, "subtrees": subtrees}
+
+
+def summary(report: Report) -> str:
+    """Phases of every version as a table of seconds and peak MiB."""
+    phases = list(next(iter(report.values()))["phases"]) if report else []
+    lines = [f"{'version':<10}" + "".join(f"{phase:>15}" for phase in phases)]
+    for apiversion, measurements in report.items():
+        lines.append(f"{apiversion:<10}" + "".join(f"{measurements['phases'][phase]['seconds']:>14.2f}s" for phase in phases))
+        lines.append(f"{'':<10}" + "".join(f"{measurements['phases'][phase]['peak'] / 2**20:>12.1f}MiB" for phase in phases))
+    return "\n".join(lines)
+
+
+def dump(report: Report, destination: Path) -> None:
+    with destination.open("w") as dst:
+        json.dump(report, dst, indent=2)
+        print(file=dst)
+
+
+def flatten(measurements: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    ret = dict(measurements["phases"])
+    for path, phases in measurements["subtrees"].items():
+        ret.update({f"{path} {phase}": measurement for phase, measurement in phases.items()})
+    return ret
+
+
+def regressions(report: Report, baseline: Report, tolerance: float) -> Iterator[str]:
+    """Measurements more than `tolerance` above the baseline, ignoring differences below the noise."""
+    noise = {"seconds": 0.05, "allocated": 2**20, "peak": 2**20}
+    for apiversion in sorted(report.keys() & baseline.keys()):
+        previous = flatten(baseline[apiversion])
+        for name, measurement in flatten(report[apiversion]).items():
+            if name not in previous:
+                continue
+            for metric in METRICS:
+                current, before = measurement[metric], previous[name][metric]
+                if current > before * (1 + tolerance) and current - before > noise[metric]:
+                    yield f"{apiversion} {name} {metric}: {before} -> {current}"
@@ -0,0 +1,122 @@
+"""Trim an API schema to the endpoints an application uses.
+
+Endpoints are kept when they match an --only pattern or are reached by a chain
+of attributes and calls in the scanned sources, e.g. `api.nodes(node).qemu.get()`
+keeps /nodes/{node}/qemu, or by a path string like "nodes/pve1/qemu". Their
+parents are kept too, the types generated from the trimmed schema then contain
+only their classes and the shapes they return.
+"""
+
+import ast
+import fnmatch
+from pathlib import Path as FilePath
+from typing import Any, Iterable, Iterator, Optional
+
+from . import Path
+
+# A chain of attributes and calls, None for a call
+Chain = tuple[Optional[str], ...]
+
+
+def chains(source: str) -> Iterator[Chain]:
+    """Outermost chains of attributes and calls of a module."""
+    inner: set[int] = set()
+    for node in ast.walk(ast.parse(source)):
+        if id(node) in inner or not isinstance(node, (ast.Attribute, ast.Call)):
+            continue
+        chain: list[Optional[str]] = []
+        expr: ast.expr = node
+        while isinstance(expr, (ast.Attribute, ast.Call)):
+            if isinstance(expr, ast.Attribute):
+                chain.append(expr.attr)
+                expr = expr.value
+            else:
+                chain.append(None)
+                expr = expr.func
+            inner.add(id(expr))
+        yield tuple(reversed(chain))
+
+
+def strings(source: str) -> Iterator[str]:
+    """String constants of a module that look like paths."""
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Constant) and isinstance(node.value, str) and "/" in node.value:
+            yield node.value
+
+
+def modules(sources: Iterable[FilePath]) -> Iterator[str]:
+    for source in sources:
+        for file in sorted(source.rglob("*.py")) if source.is_dir() else [source]:
+            yield file.read_text()
+
+
+class Tree:
+    """Paths below an endpoint by attribute and by segment."""
+
+    def __init__(self, path: str, children: list[dict[str, Any]]) -> None:
+        self.path = path
+        self.attributes: dict[str, Tree] = {}
+        self.segments: dict[str, Tree] = {}
+        self.param: Optional[Tree] = None
+        for item in children:
+            child = Tree(item["path"], item.get("children") or [])
+            segment = Path.Segment(orig=item["path"].rpartition("/")[2])
+            if segment.is_param:
+                self.param = child
+            else:
+                self.attributes[segment.as_property] = child
+                self.segments[segment.orig] = child
+
+    def chain(self, chain: Chain) -> Iterator[str]:
+        """Paths reached by the chain, from wherever in it an endpoint starts."""
+        for start in range(len(chain)):
+            node = self
+            for token in chain[start:]:
+                child = node.param if token is None else node.attributes.get(token)
+                if child is None:
+                    break
+                node = child
+                yield node.path
+
+    def string(self, path: str) -> Iterator[str]:
+        """Paths leading to a concrete path, fixed segments win over parameters."""
+        node = self
+        for segment in path.strip("/").split("/"):
+            child = node.segments.get(segment, node.param)
+            if child is None:
+                break
+            node = child
+            yield node.path
+
+
+def shake(data: list[dict[str, Any]], keep: set[str]) -> list[dict[str, Any]]:
+    """The items of `data` leading to a path in `keep`."""
+    ret = []
+    for item in data:
+        children = shake(item.get("children") or [], keep)
+        if children or item["path"] in keep:
+            ret.append({**item, "children": children} if "children" in item else item)
+    return ret
+
+
+def reachable(
+    data: list[dict[str, Any]],
+    only: Iterable[str] = (),
+    sources: Iterable[FilePath] = (),
+) -> set[str]:
+    """Paths matching the fnmatch patterns in `only` or reached from `sources`."""
+
+    def walk(items: list[dict[str, Any]]) -> Iterator[str]:
+        for item in items:
+            yield item["path"]
+            yield from walk(item.get("children") or [])
+
+    patterns = list(only)
+    ret = {path for path in walk(data) if any(fnmatch.fnmatchcase(path, pattern) for pattern in patterns)}
+    tree = Tree("", data)
+    for source in modules(sources):
+        for chain in chains(source):
+            ret.update(tree.chain(chain))
+        for string in strings(source):
+            ret.update(tree.string(string))
+    return ret
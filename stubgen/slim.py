@@ -0,0 +1,135 @@
+"""Body-less stubs of generated types, split per top level path.
+
+Type checkers prefer `core.pyi` over `core.py`. It declares ProxmoxAPI without
+method bodies and aliases each top level path to its class in a stub module of
+its own, e.g. `Cluster: TypeAlias = _cluster.ProxmoxAPI.Cluster`, so a checker
+that resolves lazily only analyzes the subtrees a project uses.
+"""
+
+import ast
+import re
+from typing import Iterable, Iterator
+
+from .formatting import STRINGS, prefer_double_quotes
+
+# Decorators without a bearing on the declared types
+RUNTIME = frozenset(("lru_cache",))
+# Names core re-exports besides ProxmoxAPI
+EXPORTED = frozenset(("BaseModel",))
+# Annotated defaults of a signature, which ast.unparse writes without spaces around the `=`
+DEFAULT = re.compile(r"(?<=\w: )((?:[^=(),\[\]]|\[[^=()]*\])+)=(?!=)")
+# Stub signatures longer than LINE_LENGTH are wrapped at their parentheses, like the generated ones
+SIGNATURE = re.compile(r"^( *)def (\w+)\((.*)\)( -> [^()]*: \.\.\.)$", re.MULTILINE)
+LINE_LENGTH = 88
+
+
+def unparse(nodes: list[ast.stmt]) -> str:
+    text = ast.unparse(ast.Module(nodes, []))
+    text = STRINGS.sub(lambda match: prefer_double_quotes(match.group()), text)
+    text = re.sub(r"^ *def .*$", lambda match: DEFAULT.sub(r"\1 = ", match.group()), text, flags=re.MULTILINE)
+    # Stub bodies on the line of their definition, like the generated stubs
+    text = re.sub(r":\n *\.\.\.$", ": ...", text, flags=re.MULTILINE)
+    return SIGNATURE.sub(wrap, text)
+
+
+def wrap(match: re.Match[str]) -> str:
+    if len(match.group()) <= LINE_LENGTH:
+        return match.group()
+    indent, name, params, returns = match.groups()
+    return f"{indent}def {name}(\n{indent}    {params}\n{indent}){returns}"
+
+
+def names(nodes: Iterable[ast.stmt]) -> set[str]:
+    ret: set[str] = set()
+    for node in nodes:
+        for each in ast.walk(node):
+            if isinstance(each, ast.Name):
+                ret.add(each.id)
+            elif isinstance(each, ast.Constant) and isinstance(each.value, str):
+                # Forward references
+                ret.add(each.value.partition(".")[0])
+    return ret
+
+
+def declarations(body: list[ast.stmt]) -> Iterator[ast.stmt]:
+    """Statements of a class body with the bodies of its methods replaced by `...`."""
+    for node in body:
+        if isinstance(node, ast.FunctionDef):
+            if node.name == "__post_init__":
+                continue
+            node.decorator_list = [
+                decorator
+                for decorator in node.decorator_list
+                if not (isinstance(decorator, ast.Name) and decorator.id in RUNTIME)
+            ]
+            node.body = [ast.Expr(ast.Constant(...))]
+            yield node
+        elif isinstance(node, ast.ClassDef):
+            node.body = list(declarations(node.body)) or [ast.Expr(ast.Constant(...))]
+            yield node
+        else:
+            yield node
+
+
+def imports(header: list[ast.stmt], used: set[str], exported: frozenset[str] = frozenset()) -> list[ast.stmt]:
+    """The statements of `header`, without the names imported from modules that are not used."""
+    ret: list[ast.stmt] = []
+    for node in header:
+        if isinstance(node, ast.ImportFrom):
+            aliases = [
+                ast.alias(alias.name, alias.name if alias.name in exported else alias.asname)
+                for alias in node.names
+                if (alias.asname or alias.name) in used
+            ]
+            if aliases:
+                ret.append(ast.ImportFrom(node.module, aliases, node.level))
+        else:
+            ret.append(node)
+    return ret
+
+
+def split(source: str) -> dict[str, str]:
+    """Stub modules by name of the source of generated types, `core` for the module itself."""
+    module = ast.parse(source)
+    api = next(node for node in module.body if isinstance(node, ast.ClassDef) and node.name == "ProxmoxAPI")
+    header = list(declarations([node for node in module.body if not isinstance(node, ast.ClassDef)]))
+    # Shapes defined in the module itself rather than imported from a shared module
+    shapes = list(declarations([node for node in module.body if isinstance(node, ast.ClassDef) and node is not api]))
+    defined = [node.name for node in shapes if isinstance(node, ast.ClassDef)]
+    # Names the header itself uses, e.g. in an `if TYPE_CHECKING:`
+    needed = names(node for node in header if not isinstance(node, (ast.Import, ast.ImportFrom)))
+
+    def stub(body: list[ast.stmt], exported: frozenset[str] = frozenset()) -> str:
+        used = needed | names(body) | exported
+        local = [ast.alias(name, name if name in exported else None) for name in defined if name in used]
+        head = imports(header, used, exported) + ([ast.ImportFrom("_shapes", local, 1)] if local else [])
+        return unparse(head + body)
+
+    ret: dict[str, str] = {}
+    if shapes:
+        ret["_shapes"] = unparse(imports(header, needed | names(shapes)) + shapes)
+    body: list[ast.stmt] = []
+    modules: list[str] = []
+    for node in declarations(api.body):
+        if not isinstance(node, ast.ClassDef):
+            body.append(node)
+            continue
+        name = "_" + node.name.lower()
+        # Within a ProxmoxAPI of its own, the references of the subtree resolve without core
+        wrapper = ast.parse("class ProxmoxAPI: ...").body[0]
+        assert isinstance(wrapper, ast.ClassDef)
+        wrapper.body = [node]
+        ret[name] = stub([wrapper])
+        alias = ast.Attribute(ast.Attribute(ast.Name(name), "ProxmoxAPI"), node.name)
+        body.append(ast.AnnAssign(ast.Name(node.name), ast.Name("TypeAlias"), alias, simple=1))
+        modules.append(name)
+    api.body = body
+    ret["core"] = stub(
+        [
+            ast.ImportFrom("typing", [ast.alias("TypeAlias")], 0),
+            ast.ImportFrom(None, [ast.alias(name) for name in modules], 1),
+            api,
+        ],
+        EXPORTED,
+    )
+    return ret
@@ -0,0 +1,68 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+import pytest
+
+import proxmoxer_types.v6
+from proxmoxer_types.v9 import ProxmoxAPI
+
+
+@dataclass
+class Backend:
+    routes: dict[tuple[str, str], Any] = field(default_factory=dict)
+    calls: list[tuple[str, str, dict[str, Any]]] = field(default_factory=list)
+
+    def __call__(self, method: str, path: str, params: dict[str, Any]) -> Any:
+        self.calls.append((method, path, params))
+        route = self.routes[(method, path)]
+        return route(params) if callable(route) else route
+
+
+class Resource:
+    def __init__(self, backend: Backend, path: str = "") -> None:
+        self._backend = backend
+        self._path = path
+
+    def __getattr__(self, name: str) -> "Resource":
+        return Resource(self._backend, f"{self._path}/{name}")
+
+    def __call__(self, *segments: Any) -> "Resource":
+        return Resource(self._backend, "/".join((self._path, *map(str, segments))))
+
+    def _request(self, method: str) -> Callable[..., Any]:
+        return lambda *args, **params: self._backend(method, self._path, params)
+
+    @property
+    def get(self) -> Callable[..., Any]:
+        return self._request("GET")
+
+    @property
+    def post(self) -> Callable[..., Any]:
+        return self._request("POST")
+
+    @property
+    def put(self) -> Callable[..., Any]:
+        return self._request("PUT")
+
+    @property
+    def delete(self) -> Callable[..., Any]:
+        return self._request("DELETE")
+
+
+@pytest.fixture
+def backend() -> Backend:
+    return Backend()
+
+
+@pytest.fixture
+def api(backend: Backend) -> ProxmoxAPI:
+    api = ProxmoxAPI(backend="local")
+    api.proxmox_api = Resource(backend)  # type: ignore[assignment]
+    return api
+
+
+@pytest.fixture
+def api6(backend: Backend) -> proxmoxer_types.v6.ProxmoxAPI:
+    api = proxmoxer_types.v6.ProxmoxAPI(backend="local")
+    api.proxmox_api = Resource(backend)  # type: ignore[assignment]
+    return api
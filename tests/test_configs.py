@@ -0,0 +1,59 @@
+from typing import Any
+
+from proxmoxer_types.configs import ConfigCache
+from proxmoxer_types.v9 import ProxmoxAPI
+from proxmoxer_types.watch import Watcher
+
+from conftest import Backend
+
+NET = "virtio=BC:24:11:2E:6A:10,bridge=vmbr0"
+
+
+def test_unchanged_digests_reuse_the_parsed_config(api: ProxmoxAPI, backend: Backend) -> None:
+    config: dict[str, Any] = {"digest": "a", "name": "db", "cores": 2, "net0": NET}
+    backend.routes[("GET", "/nodes/pve1/qemu/100/config")] = lambda params: dict(config)
+    cache = ConfigCache(api)
+
+    first = cache.fetch("/nodes/pve1/qemu/100/config")
+    assert first.model.name == "db" and first.values["net0"].bridge == "vmbr0"
+    again = cache.fetch("/nodes/pve1/qemu/100/config")
+    assert again.model is first.model and again.values is first.values
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    config.update(digest="b", cores=4)
+    changed = cache.fetch("/nodes/pve1/qemu/100/config")
+    assert changed.model.cores == 4 and changed.digest == "b"
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_only_changed_or_expired_configs_are_fetched(api: ProxmoxAPI, backend: Backend) -> None:
+    db = {"id": "qemu/100", "type": "qemu", "node": "pve1", "vmid": 100, "name": "db", "cpu": 0.1}
+    web = {"id": "lxc/101", "type": "lxc", "node": "pve1", "vmid": 101, "name": "web", "cpu": 0.2}
+    backend.routes[("GET", "/cluster/resources")] = lambda params: [dict(db), dict(web)]
+    backend.routes[("GET", "/nodes/pve1/qemu/100/config")] = {"digest": "a", "name": "db"}
+    backend.routes[("GET", "/nodes/pve1/lxc/101/config")] = {"digest": "b", "hostname": "web"}
+    backend.routes[("GET", "/nodes/pve2/qemu/100/config")] = {"digest": "a", "name": "db"}
+    cache = ConfigCache(api, watcher=Watcher(api))
+
+    def fetched() -> list[str]:
+        ret = [path for method, path, _ in backend.calls if path.endswith("/config")]
+        backend.calls.clear()
+        return ret
+
+    assert sorted(cache.guests()) == ["/nodes/pve1/lxc/101/config", "/nodes/pve1/qemu/100/config"]
+    assert sorted(fetched()) == ["/nodes/pve1/lxc/101/config", "/nodes/pve1/qemu/100/config"]
+
+    # Usage metrics do not touch the config
+    web["cpu"] = 0.9
+    cache.guests()
+    assert fetched() == []
+
+    db["node"] = "pve2"
+    assert sorted(cache.guests()) == ["/nodes/pve1/lxc/101/config", "/nodes/pve2/qemu/100/config"]
+    assert fetched() == ["/nodes/pve2/qemu/100/config"]
+    assert "/nodes/pve1/qemu/100/config" not in cache.configs
+
+    cache.max_age = 0
+    cache.guests()
+    assert len(fetched()) == 2
+    assert cache.hits == 2
@@ -0,0 +1,85 @@
+import threading
+
+from proxmoxer_types.inventory import Inventory
+from proxmoxer_types.v9 import ProxmoxAPI
+
+from conftest import Backend
+
+
+def test_lookups(api: ProxmoxAPI, backend: Backend) -> None:
+    db = {"id": "qemu/4711", "type": "qemu", "node": "pve1", "vmid": 4711, "pool": "prod", "tags": "db;web"}
+    web = {"id": "lxc/101", "type": "lxc", "node": "pve2", "vmid": 101, "tags": "web"}
+    storage = {"id": "storage/pve1/ceph", "type": "storage", "node": "pve1", "storage": "ceph", "status": "available"}
+    backend.routes[("GET", "/cluster/resources")] = [storage, db, web]
+    backend.routes[("GET", "/pools")] = [{"poolid": "prod"}]
+    backend.routes[("GET", "/pools/prod")] = {"members": [{"id": "qemu/4711", "node": "pve1", "type": "qemu"}, {"id": "storage/pve1/ceph", "node": "pve1", "type": "storage"}]}
+    backend.routes[("GET", "/nodes/pve1/storage/ceph/content")] = [{"volid": "ceph:vm-4711-disk-0", "vmid": 4711, "content": "images"}]
+
+    inventory = Inventory(api, storages=True)
+    inventory.refresh()
+
+    model = inventory.vmid(4711)
+    assert isinstance(model, ProxmoxAPI.Cluster.Resources._Get.Model)
+    assert model.node == "pve1"
+    assert [guest.id for guest in inventory.tag("web")] == ["lxc/101", "qemu/4711"]
+    assert [member.id for member in inventory.pool("prod")] == ["qemu/4711", "storage/pve1/ceph"]
+    assert [guest.id for guest in inventory.storage("ceph")] == ["qemu/4711"]
+    assert [guest.id for guest in inventory.guests()] == ["lxc/101", "qemu/4711"]
+
+    backend.routes[("GET", "/cluster/resources")] = [{**db, "node": "pve2"}, web, storage]
+    inventory.refresh(pools=False)
+    assert [guest.id for guest in inventory.node("pve2")] == ["lxc/101", "qemu/4711"]
+    assert inventory.node("pve1") == [inventory.resources["storage/pve1/ceph"]]
+    assert len([call for call in backend.calls if call[1].endswith("/content")]) == 1
+
+
+def test_storages_are_listed_again_when_their_content_can_change(api: ProxmoxAPI, backend: Backend) -> None:
+    storage = {"id": "storage/pve1/ceph", "type": "storage", "node": "pve1", "storage": "ceph", "status": "available", "disk": 1}
+    backend.routes[("GET", "/cluster/resources")] = [storage]
+    backend.routes[("GET", "/pools")] = []
+    backend.routes[("GET", "/nodes/pve1/storage/ceph/content")] = [{"volid": "ceph:vm-4711-disk-0", "vmid": 4711, "content": "images"}]
+    inventory = Inventory(api, storages=True)
+    inventory.refresh()
+
+    backend.routes[("GET", "/cluster/resources")] = [{**storage, "disk": 2}]
+    inventory.refresh(pools=False)
+    assert inventory.by_storage == {"ceph": {4711}}
+    backend.routes[("GET", "/cluster/resources")] = [{**storage, "disk": 2, "content": "images,rootdir"}]
+    inventory.refresh(pools=False)
+    assert len([call for call in backend.calls if call[1].endswith("/content")]) == 2
+
+
+def test_pools_follow_the_watcher(api: ProxmoxAPI, backend: Backend) -> None:
+    db = {"id": "qemu/4711", "type": "qemu", "node": "pve1", "vmid": 4711, "pool": "prod"}
+    storage = {"id": "storage/pve1/ceph", "type": "storage", "node": "pve1", "storage": "ceph", "status": "available"}
+    backend.routes[("GET", "/cluster/resources")] = [db, storage]
+    members = [{"id": "qemu/4711"}, {"id": "storage/pve1/ceph"}]
+    backend.routes[("GET", "/pools")] = lambda params: [{"poolid": "prod", "members": list(members)}]
+    inventory = Inventory(api, storages=True)
+
+    def content(params: dict[str, object]) -> list[dict[str, object]]:
+        # Another thread can take the lock while the storage is listed
+        locked: list[bool] = []
+
+        def take() -> None:
+            locked.append(inventory.lock.acquire(blocking=False))
+            if locked[-1]:
+                inventory.lock.release()
+
+        thread = threading.Thread(target=take)
+        thread.start()
+        thread.join()
+        assert locked == [True]
+        return []
+
+    backend.routes[("GET", "/nodes/pve1/storage/ceph/content")] = content
+    assert inventory.watcher is not None
+    inventory.watcher.poll()
+    assert [member.id for member in inventory.pool("prod")] == ["qemu/4711", "storage/pve1/ceph"]
+
+    # A guest leaving the pool triggers a listing on the watcher's next poll
+    del members[0]
+    backend.routes[("GET", "/cluster/resources")] = [{**db, "pool": None}, storage]
+    inventory.watcher.poll()
+    assert [member.id for member in inventory.pool("prod")] == ["storage/pve1/ceph"]
+    assert len([call for call in backend.calls if call[1] == "/pools"]) == 2
@@ -0,0 +1,62 @@
+import warnings
+from typing import Any
+
+import proxmoxer_types.v6
+import proxmoxer_types.v8
+from proxmoxer_types.metrics import Collector
+from proxmoxer_types.v9 import ProxmoxAPI
+
+from conftest import Backend, Resource
+
+
+def test_export(api: ProxmoxAPI, backend: Backend) -> None:
+    def export(params: dict[str, Any]) -> dict[str, Any]:
+        rows = [
+            {"id": "qemu/100", "metric": "cpu_current", "timestamp": t, "type": "gauge", "value": t / 10}
+            for t in (10, 20, 30)
+        ]
+        return {"data": [row for row in rows if row["timestamp"] > params.get("start-time", 0)]}
+
+    backend.routes[("GET", "/cluster/metrics/export")] = export
+    collector = Collector(api, partitions=[["pve1", "pve2"]])
+
+    metrics = collector.poll()
+    assert list(metrics["qemu/100"]["cpu_current"].timestamp) == [10, 20, 30]
+    assert list(metrics["qemu/100"]["cpu_current"].value) == [1.0, 2.0, 3.0]
+    assert backend.calls[-1][2] == {"node-list": "pve1,pve2", "history": 1}
+
+    assert collector.poll() == {}
+    assert backend.calls[-1][2]["start-time"] == 30
+
+
+def test_export_without_node_list(backend: Backend) -> None:
+    api8 = proxmoxer_types.v8.ProxmoxAPI(backend="local")
+    api8.proxmox_api = Resource(backend)  # type: ignore[assignment]
+    backend.routes[("GET", "/cluster/metrics/export")] = {"data": []}
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        Collector(api8, partitions=[["pve1"], ["pve2"]]).poll()  # type: ignore[arg-type]
+    assert backend.calls == [("GET", "/cluster/metrics/export", {"history": 1})]
+
+
+def test_export_start_is_the_newest_row(api: ProxmoxAPI, backend: Backend) -> None:
+    rows = [{"id": "node/pve1", "metric": "cpu_current", "timestamp": t, "type": "gauge", "value": 0.5} for t in (30, 10, 20)]
+    backend.routes[("GET", "/cluster/metrics/export")] = {"data": rows}
+    collector = Collector(api)
+    collector.poll()
+    collector.poll()
+    assert backend.calls[-1][2]["start-time"] == 30
+
+
+def test_rrddata_fallback(api6: proxmoxer_types.v6.ProxmoxAPI, backend: Backend) -> None:
+    backend.routes[("GET", "/cluster/resources")] = [
+        {"id": "qemu/100", "type": "qemu", "node": "pve1", "vmid": 100, "status": "running"},
+        {"id": "lxc/101", "type": "lxc", "node": "pve1", "vmid": 101, "status": "stopped"},
+    ]
+    backend.routes[("GET", "/nodes/pve1/qemu/100/rrddata")] = [{"time": 60, "cpu": 0.5}, {"time": 120, "cpu": 0.25}]
+    collector = Collector(api6)  # type: ignore[arg-type]
+
+    metrics = collector.poll()
+    assert list(metrics) == ["qemu/100"]
+    assert list(metrics["qemu/100"]["cpu"].value) == [0.5, 0.25]
+    assert collector.poll() == {}
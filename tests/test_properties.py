@@ -0,0 +1,73 @@
+import pytest
+
+from proxmoxer_types.properties import compiled, dump, parse, parse_all
+from proxmoxer_types.schema import Format, Param
+from proxmoxer_types.v9 import ProxmoxAPI
+from proxmoxer_types.validation import validator
+
+CONFIG = "/nodes/{node}/qemu/{vmid}/config"
+NET = "virtio=BC:24:11:2E:6A:10,bridge=vmbr0,firewall=1"
+
+
+def test_config_property_strings_become_models(api: ProxmoxAPI) -> None:
+    config = parse(
+        api,
+        CONFIG,
+        {
+            "net0": NET,
+            "scsi0": "local-lvm:vm-100-disk-0,iothread=1,size=32G",
+            "agent": "1",
+            "digest": "0123abcd",
+        },
+    )
+    assert (config["net0"].model, config["net0"].macaddr) == ("virtio", "BC:24:11:2E:6A:10")
+    assert config["net0"].firewall is True and config["net0"].tag is None
+    assert config["scsi0"].file == "local-lvm:vm-100-disk-0"
+    assert config["scsi0"].iothread is True
+    assert config["agent"].enabled is True
+    assert config["digest"] == "0123abcd"
+
+
+def test_models_are_dumped_back(api: ProxmoxAPI) -> None:
+    net = parse(api, CONFIG, {"net0": NET})["net0"]
+    assert dump(api, CONFIG, "net0", net) == NET
+    assert dump(api, CONFIG, "net1", {"model": "e1000", "bridge": "vmbr1", "link_down": False}) == "e1000,bridge=vmbr1,link_down=0"
+    assert dump(api, CONFIG, "agent", {"enabled": True, "fstrim_cloned_disks": True}) == "1,fstrim_cloned_disks=1"
+    with pytest.raises(ValueError, match="digest of /nodes/{node}/qemu/{vmid}/config is not a property string"):
+        dump(api, CONFIG, "digest", {})
+
+
+def test_aliases_and_quotes() -> None:
+    string = compiled(
+        Format(
+            {"file": Param("string"), "rate": Param("number", True), "model": Param("string"), "mac": Param("string", True)},
+            default_key="file",
+            aliases={"speed": "rate", "virtio": "mac"},
+            key_aliases={"virtio": "model"},
+        )
+    )
+    assert string.values('"a,b=c",speed=1.5') == {"file": "a,b=c", "rate": 1.5}
+    assert string.values("virtio=aa:bb") == {"model": "virtio", "mac": "aa:bb"}
+    assert string.dump({"file": "a,b=c", "rate": 2.0}) == '"a,b=c",rate=2'
+    assert string("x") is string("x")
+    with pytest.raises(ValueError, match="'rate' is given twice"):
+        string.values("x,rate=1,speed=2")
+    with pytest.raises(ValueError, match="rate='fast' in 'x,rate=fast' is not a number"):
+        string.values("x,rate=fast")
+
+
+def test_calls_check_property_strings() -> None:
+    config = validator("proxmoxer_types.v9.core", CONFIG, "PUT")
+    config({"net0": NET, "agent": "enabled=1,type=isa"})
+    with pytest.raises(ValueError, match="net0: firewal in 'virtio,firewal=1' is not a key"):
+        config({"net0": "virtio,firewal=1"})
+    with pytest.raises(ValueError, match="net0: model is missing in 'bridge=vmbr0'"):
+        config({"net0": "bridge=vmbr0"})
+    with pytest.raises(ValueError, match="agent: type in 'type=usb,1': 'usb' is not one of"):
+        config({"agent": "type=usb,1"})
+
+
+def test_parse_all_shares_equal_values(api: ProxmoxAPI) -> None:
+    configs = parse_all(api, CONFIG, [{"net0": NET, "vmgenid": str(vmid)} for vmid in range(100)])
+    assert len(configs) == 100
+    assert all(config["net0"] is configs[0]["net0"] for config in configs)
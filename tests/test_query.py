@@ -0,0 +1,44 @@
+import pytest
+
+from proxmoxer_types.query import guests
+from proxmoxer_types.v9 import ProxmoxAPI
+
+from conftest import Backend
+
+
+def test_plans(api: ProxmoxAPI) -> None:
+    plan = guests(api, "name", "mem").where(node="pve1", tag="db").plan()
+    assert (plan.strategy, plan.calls) == ("cluster", 1)
+    assert plan.requests == {"/cluster/resources": {"type": "vm"}}
+
+    plan = guests(api, "name", "pid").where(type="qemu").plan()
+    assert (plan.strategy, plan.calls) == ("node", 4)
+    assert plan.requests == {"/nodes": {}, "/nodes/{node}/qemu": {"full": 1}}
+
+    plan = guests(api, "ha").where(node="pve1", vmid=100, type="lxc").plan()
+    assert (plan.strategy, plan.calls) == ("guest", 1)
+
+    plan = guests(api, "ha").where(tag="db").estimate(nodes=2, guests=10).plan()
+    assert (plan.strategy, plan.calls) == ("guest", 11)
+
+
+def test_execution(api: ProxmoxAPI, backend: Backend) -> None:
+    backend.routes[("GET", "/cluster/resources")] = [
+        {"id": "qemu/100", "type": "qemu", "node": "pve1", "vmid": 100, "name": "db1", "status": "running", "tags": "db"},
+        {"id": "lxc/101", "type": "lxc", "node": "pve1", "vmid": 101, "name": "web1", "status": "running"},
+    ]
+    assert guests(api, "name").where(status="running", tag="db").all() == [{"name": "db1"}]
+
+    backend.routes[("GET", "/nodes/pve1/qemu/100/status/current")] = {"vmid": 100, "ha": {"managed": 0}, "status": "running"}
+    assert guests(api, "vmid", "ha").where(type="qemu").all() == [{"vmid": 100, "ha": {"managed": 0}}]
+
+
+def test_type_filters(api: ProxmoxAPI, backend: Backend) -> None:
+    backend.routes[("GET", "/cluster/resources")] = [
+        {"id": "qemu/100", "type": "qemu", "node": "pve1", "vmid": 100, "name": "db1"},
+        {"id": "lxc/101", "type": "lxc", "node": "pve1", "vmid": 101, "name": "web1"},
+    ]
+    assert guests(api, "name").where(type="vm").all() == [{"name": "db1"}, {"name": "web1"}]
+    for wanted in ("openvz", ["qemu", "vz"]):
+        with pytest.raises(ValueError, match="is not a guest type"):
+            guests(api, "name").where(type=wanted)
@@ -0,0 +1,36 @@
+import pytest
+
+from proxmoxer_types.router import Router, resolve
+from proxmoxer_types.v9 import ProxmoxAPI, endpoints, lite, table
+
+from conftest import Backend
+
+
+def test_string_paths_resolve_to_handles(api: ProxmoxAPI, backend: Backend) -> None:
+    handle = api.cluster.replication("some-id")
+    assert resolve(api, "cluster/replication/some-id") is handle
+    assert resolve(api, "/cluster/replication/some-id/") is handle
+    assert resolve(api, "cluster", "replication", "some-id") is handle
+    assert resolve(api, "cluster/backup-info/not-backed-up") is api.cluster.backup_info.not_backed_up
+    assert resolve(api, "nodes", "pve1", "qemu", 100) is api.nodes("pve1").qemu(100)
+    assert resolve(api, "") is api
+
+    backend.routes[("GET", "/cluster/backup-info/not-backed-up")] = [{"vmid": 100, "type": "qemu"}]
+    assert resolve(api, "cluster/backup-info/not-backed-up").get.model()[0].vmid == 100
+
+    lite_api = lite.ProxmoxAPI(backend="local")
+    assert resolve(lite_api, "nodes/pve1/qemu") is lite_api.nodes("pve1").qemu
+
+    with pytest.raises(ValueError):
+        resolve(api, "cluster/nothing")
+    with pytest.raises(ValueError):
+        resolve(api, "nodes/pve1/qemu/vm100")
+
+
+def test_routes_are_memoized() -> None:
+    routes = Router(endpoints.ENDPOINTS, table.ENDPOINTS)
+    route = routes.match("nodes/pve1/qemu/100/status/current")
+    assert route.path == "/nodes/{node}/qemu/{vmid}/status/current"
+    assert route.params == {"node": "pve1", "vmid": 100}
+    assert routes.match("nodes/pve1/qemu/100/status/current") is route
+    assert routes.match.cache_info().hits == 1
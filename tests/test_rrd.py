@@ -0,0 +1,45 @@
+import math
+from pathlib import Path
+
+from proxmoxer_types.rrd import TIMEFRAMES, Store
+
+
+def test_append_range(tmp_path: Path) -> None:
+    series = Store(tmp_path)("qemu", 100)
+    assert series.append([{"time": 120.0, "cpu": 0.5}, {"time": 60.0, "cpu": 0.25}]) == 2
+    assert series.append([{"time": 120.0, "cpu": 1.0}, {"time": 180.0, "mem": 42.0}]) == 1
+
+    assert series.metrics() == ["cpu", "mem"]
+    assert list(series.time()) == [60, 120, 180]
+    assert list(series.column("cpu")[:2]) == [0.25, 0.5]
+    assert math.isnan(series.column("cpu")[2])
+    assert math.isnan(series.column("mem")[0])
+
+    window = series.range(start=100, end=180, metrics=["cpu"])
+    assert list(window["time"]) == [120, 180]
+    assert window["cpu"][0] == 0.5
+
+
+def test_compact(tmp_path: Path) -> None:
+    series = Store(tmp_path)("node", "pve1")
+    step = TIMEFRAMES["day"]
+    series.append({"time": t, "cpu": float(t // step)} for t in range(0, 3 * step, 60))
+    series.compact(keep=step)
+
+    assert list(series.time("day")) == [0, step]
+    assert list(series.column("cpu", "day")) == [0.0, 1.0]
+    # The week, month and year buckets starting at 0 are not complete yet
+    assert series.time()[0] == 0
+
+
+def test_compact_keeps_incomplete_buckets(tmp_path: Path) -> None:
+    series = Store(tmp_path)("node", "pve1")
+    week = TIMEFRAMES["year"]
+    series.append({"time": t, "cpu": float(t // 3600)} for t in range(0, 2 * week + week // 2, 3600))
+    series.compact(keep=3600)
+    assert series.time()[0] == 2 * week
+    series.append({"time": t, "cpu": float(t // 3600)} for t in range(2 * week + week // 2, 3 * week + 3600, 3600))
+    series.compact(keep=3600)
+
+    assert list(series.time("year")) == [0, week, 2 * week]
+    assert series.column("cpu", "year")[2] == (336 + 503) / 2
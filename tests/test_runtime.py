@@ -0,0 +1,144 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from mypy import api as mypy
+
+from proxmoxer_types.v9 import ProxmoxAPI, lite
+
+from conftest import Backend, Resource
+
+
+@pytest.fixture
+def lite_api(backend: Backend) -> lite.ProxmoxAPI:
+    api = lite.ProxmoxAPI(backend="local")
+    api.proxmox_api = Resource(backend)  # type: ignore[assignment]
+    return api
+
+
+def test_handles_match_core(
+    api: ProxmoxAPI, lite_api: lite.ProxmoxAPI, backend: Backend
+) -> None:
+    replication = {
+        "id": "100-0",
+        "guest": 100,
+        "jobnum": 0,
+        "target": "pve2",
+        "type": "local",
+        "remove_job": "full",
+    }
+    backend.routes[("GET", "/cluster/replication/100-0")] = replication
+    backend.routes[("GET", "/cluster/backup-info/not-backed-up")] = [
+        {"vmid": 100, "type": "qemu"}
+    ]
+    backend.routes[("POST", "/cluster/config/nodes/pve2")] = {
+        "corosync_authkey": "key",
+        "corosync_conf": "conf",
+        "warnings": [],
+    }
+
+    expected = api.cluster.replication("100-0").get.model().model_dump()
+    calls = []
+    for each in (api, lite_api):
+        backend.calls.clear()
+        assert each.cluster.replication("100-0").get(foo=1, check=False) == replication  # type: ignore[call-arg]
+        assert each.cluster.replication("100-0").get.model().model_dump() == expected
+        assert each.cluster.backup_info.not_backed_up.get.model()[0].vmid == 100
+        assert each.cluster.config.nodes("pve2").create()["warnings"] == []
+        calls.append(list(backend.calls))
+    assert calls[0] == calls[1]
+
+    with pytest.raises(ValueError):
+        backend.routes[("GET", "/cluster/replication/100-0")] = {
+            **replication,
+            "remove_job": "partial",
+        }
+        lite_api.cluster.replication("100-0").get.model()
+
+
+def test_handles_are_cached(lite_api: lite.ProxmoxAPI) -> None:
+    assert lite_api.nodes is lite_api.nodes
+    assert lite_api.nodes("foo") is lite_api.nodes("foo")
+    assert lite_api.nodes("foo").get is lite_api.nodes("foo").get
+    assert lite_api.nodes("foo") is not lite_api.nodes("bar")
+    assert lite_api.storage("local").set is lite_api.storage("local").put
+    # Paths as proxmoxer takes them, core does not declare these
+    assert lite_api("nodes/foo/qemu") is lite_api.nodes("foo").qemu  # type: ignore[operator]
+    assert lite_api("cluster", "replication")("100-0") is lite_api.cluster.replication("100-0")  # type: ignore[operator]
+
+    with pytest.raises(AttributeError):
+        getattr(lite_api.nodes("foo"), "nothing")
+    with pytest.raises(TypeError):
+        lite_api.version("foo")  # type: ignore[operator]
+
+
+def test_lite_does_not_import_core() -> None:
+    code = "import sys, proxmoxer_types.v9.lite; assert 'proxmoxer_types.v9.core' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_star_import_loads_core() -> None:
+    namespace: dict[str, object] = {}
+    exec("from proxmoxer_types.v9 import *", namespace)
+    assert namespace["ProxmoxAPI"] is ProxmoxAPI
+
+
+def test_mypy_plugin_types_handles_from_the_manifest(tmp_path: Path) -> None:
+    root = Path(__file__).parent.parent
+    (tmp_path / "mypy.ini").write_text(
+        f"[mypy]\nmypy_path = {root}\nplugins = proxmoxer_types.mypy_plugin\n"
+        "always_true = PROXMOXER_PLUGIN\n"
+    )
+    (tmp_path / "case.py").write_text("""
+from proxmoxer_types.router import resolve
+from proxmoxer_types.v9.lite import ProxmoxAPI
+
+api = ProxmoxAPI("host")
+reveal_type(api.nodes("pve1").qemu)
+reveal_type(api("nodes/pve1/qemu"))
+reveal_type(resolve(api, "nodes", "pve1", "qemu"))
+reveal_type(api.storage("local").set)
+reveal_type(api.cluster.replication("100-0").get()["remove_job"])
+api.cluster.nothing
+""")
+    stdout, _, _ = mypy.run(
+        [
+            "--config-file",
+            str(tmp_path / "mypy.ini"),
+            "--cache-dir",
+            os.devnull,
+            str(tmp_path / "case.py"),
+        ]
+    )
+    qemu = (
+        "proxmoxer_types.runtime.Resource[Literal['v9'], Literal['/nodes/{node}/qemu']]"
+    )
+    lines = [line.partition(": ")[2] for line in stdout.splitlines()]
+    assert lines[:6] == [
+        f'note: Revealed type is "{qemu}"',
+        f'note: Revealed type is "{qemu}"',
+        f'note: Revealed type is "{qemu}"',
+        "note: Revealed type is \"proxmoxer_types.runtime.Method[Literal['v9'], Literal['/storage/{storage}'], Literal['put']]\"",
+        "note: Revealed type is \"Literal['local'] | Literal['full']\"",
+        'error: "/cluster" has no attribute "nothing"  [misc]',
+    ]
+
+
+def test_mypy_plugin_requires_always_true(tmp_path: Path) -> None:
+    root = Path(__file__).parent.parent
+    (tmp_path / "mypy.ini").write_text(
+        f"[mypy]\nmypy_path = {root}\nplugins = proxmoxer_types.mypy_plugin\n"
+    )
+    (tmp_path / "case.py").write_text("")
+    with pytest.raises(ValueError, match="always_true = PROXMOXER_PLUGIN"):
+        mypy.run(
+            [
+                "--config-file",
+                str(tmp_path / "mypy.ini"),
+                "--cache-dir",
+                os.devnull,
+                str(tmp_path / "case.py"),
+            ]
+        )
@@ -0,0 +1,92 @@
+import threading
+import time
+from typing import Any
+
+from proxmoxer_types.scheduler import Scheduler, wait_for
+from proxmoxer_types.v9 import ProxmoxAPI
+
+from conftest import Backend
+
+UPID = "UPID:pve1:0000C530:001B3E2A:66F1E1D0:qmsnapshot:{}:root@pam:"
+
+
+def test_guests_run_in_parallel_and_their_jobs_in_order(api: ProxmoxAPI, backend: Backend) -> None:
+    lock = threading.Lock()
+    running: dict[str, int] = {"all": 0, "max": 0}
+    order: list[tuple[int, str]] = []
+
+    def snapshot(vmid: int) -> Any:
+        def call(params: dict[str, Any]) -> str:
+            with lock:
+                running["all"] += 1
+                running["max"] = max(running["max"], running["all"])
+                order.append((vmid, params["snapname"]))
+            time.sleep(0.05)
+            with lock:
+                running["all"] -= 1
+            return UPID.format(vmid)
+
+        return call
+
+    for vmid in range(100, 106):
+        backend.routes[("GET", f"/nodes/pve1/qemu/{vmid}/status/current")] = {"status": "running"}
+        backend.routes[("POST", f"/nodes/pve1/qemu/{vmid}/snapshot")] = snapshot(vmid)
+        backend.routes[("GET", f"/nodes/pve1/tasks/{UPID.format(vmid)}/status")] = {"status": "stopped", "exitstatus": "OK"}
+    scheduler = Scheduler(api, node_limit=3, interval=0)
+    for vmid in range(100, 106):
+        scheduler.snapshot("pve1", vmid, "first")
+        scheduler.snapshot("pve1", vmid, "second")
+
+    results = scheduler.run()
+    assert [result.error for result in results] == [None] * 12
+    assert results[0].value["exitstatus"] == "OK"
+    assert running["max"] == 3
+    for vmid in range(100, 106):
+        assert [name for each, name in order if each == vmid] == ["first", "second"]
+
+
+def test_locked_guests_are_retried(api: ProxmoxAPI, backend: Backend) -> None:
+    locks = iter(["backup", "backup"])
+    backend.routes[("GET", "/nodes/pve1/qemu/100/status/current")] = lambda params: {"lock": next(locks, None)}
+    backend.routes[("PUT", "/nodes/pve1/qemu/100/resize")] = lambda params: UPID.format(100)
+    backend.routes[("GET", f"/nodes/pve1/tasks/{UPID.format(100)}/status")] = {"status": "stopped", "exitstatus": "disk full"}
+    backend.routes[("GET", "/nodes/pve1/qemu/101/status/current")] = {"lock": "migrate"}
+    scheduler = Scheduler(api, backoff=0, retries=3, interval=0)
+    resize = scheduler.resize("pve1", 100, "scsi0", "+1G")
+    scheduler.resize("pve1", 101, "scsi0", "+1G")
+
+    [first, second] = scheduler.run()
+    assert resize.attempts == 2
+    assert str(first.error) == f"Task {UPID.format(100)} failed: disk full"
+    assert str(second.error) == "resize of qemu/101 on pve1 stayed locked: migrate"
+    assert [call for call in backend.calls if call[0] == "PUT"] == [("PUT", "/nodes/pve1/qemu/100/resize", {"disk": "scsi0", "size": "+1G"})]
+
+
+def test_migrations_count_against_both_nodes(api: ProxmoxAPI, backend: Backend) -> None:
+    for vmid in (100, 101):
+        backend.routes[("GET", f"/nodes/pve1/qemu/{vmid}/status/current")] = {}
+        backend.routes[("POST", f"/nodes/pve1/qemu/{vmid}/migrate")] = None
+    backend.routes[("GET", "/nodes/pve2/qemu/102/status/current")] = {}
+    backend.routes[("POST", "/nodes/pve2/qemu/102/clone")] = None
+    scheduler = Scheduler(api, node_limits={"pve2": 1}, storage_limits={"ceph": 1})
+    scheduler.migrate("pve1", 100, "pve2")
+    scheduler.clone("pve2", 102, 200, storage="ceph")
+    scheduler.migrate("pve1", 101, "pve3", targetstorage="ceph")
+    first, clone, second = scheduler.run()
+    assert clone.job.storages == ("ceph",) and second.job.nodes == ("pve1", "pve3")
+    assert all(result.error is None for result in (first, clone, second))
+
+
+def test_same_names_of_nodes_and_storages_have_their_own_limits(api: ProxmoxAPI, backend: Backend) -> None:
+    backend.routes[("GET", "/nodes/local/qemu/100/status/current")] = {}
+    backend.routes[("POST", "/nodes/local/qemu/100/clone")] = None
+    scheduler = Scheduler(api, node_limits={"local": 1}, storage_limits={"local": 0})
+    scheduler.clone("local", 100, 200)
+    [result] = scheduler.run()
+    assert result.error is None
+
+
+def test_tasks_with_warnings_succeed(api: ProxmoxAPI, backend: Backend) -> None:
+    status = {"status": "stopped", "exitstatus": "WARNINGS: 2"}
+    backend.routes[("GET", f"/nodes/pve1/tasks/{UPID.format(100)}/status")] = status
+    assert wait_for(api, UPID.format(100)) == status
@@ -0,0 +1,254 @@
+import ast
+import importlib
+import io
+import json
+import re
+import textwrap
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from stubgen import ApiSchema, ApiSchemaItemInfoMethodReturnsObject, Code, Emitter, stream, verbatim
+from stubgen.build import generate_all, load, patch, stitch, subtree, write
+from stubgen.patches import CallType, Patch
+from stubgen.profiling import profile, regressions
+from stubgen.shaking import reachable, shake
+
+
+def test_emitter_indents_like_textwrap() -> None:
+    inner = "class Inner:\n    x: int\n\n    y: int\n"
+    outer = "class Outer:\n{{ emit(inner, indent=True) }}\n    z: int\n"
+    expected = "class Outer:\n" + textwrap.indent(inner, "    ") + "\n    z: int\n"
+
+    dst = io.StringIO()
+    out = Emitter(dst)
+    out.stream(outer, inner=lambda out: out.write(inner))
+    assert dst.getvalue() == expected
+
+    nested = Code(head=stream(outer, inner=stream(outer, inner=lambda out: out.write(inner))))
+    assert str(nested) == "class Outer:\n" + textwrap.indent(expected, "    ") + "\n    z: int\n"
+
+
+def test_emitter_spaces_blank_lines() -> None:
+    text = "\n\nimport typing\n\n\n\nclass A:\n\n    x: int\n\n\n\n    y: int\n\n\n\nclass B: ...\n\n"
+    assert str(verbatim(text)) == "import typing\n\n\nclass A:\n    x: int\n\n    y: int\n\n\nclass B: ...\n"
+
+
+def apidata(tmp_path: Path, *apiversions: str) -> Path:
+    with open("apidata/apidata-v9.json") as src:
+        children = [child for child in json.load(src) if child["path"] in ("/pools", "/storage", "/version")]
+    ret = tmp_path / "apidata"
+    ret.mkdir()
+    for apiversion in apiversions:
+        (ret / f"apidata-{apiversion}.json").write_text(json.dumps(children))
+    return ret
+
+
+def test_generate_all_matches_serial(tmp_path: Path) -> None:
+    data = apidata(tmp_path, "v8", "v9")
+
+    generate_all(data, stubs=tmp_path / "core.pyi", types=str(tmp_path / "{apiversion}.py"), table=None, workers=2)
+
+    for apiversion in ("v8", "v9"):
+        config = data / f"apidata-{apiversion}.json"
+        write(tmp_path / "serial.py", config, ApiSchema.parse(load(config)).types(patch=patch(apiversion), apiversion=apiversion))
+        assert (tmp_path / f"{apiversion}.py").read_text() == (tmp_path / "serial.py").read_text()
+    write(tmp_path / "serial.pyi", config, ApiSchema.parse(load(config)).stubs(patch=patch("v9"), apiversion="v9"))
+    assert (tmp_path / "core.pyi").read_text() == (tmp_path / "serial.pyi").read_text()
+
+
+def test_cached_subtrees_are_reused(tmp_path: Path) -> None:
+    config = apidata(tmp_path, "v9") / "apidata-v9.json"
+    destination = tmp_path / "core.py"
+
+    def generate() -> tuple[str, list[str]]:
+        load.cache_clear()
+        schema = ApiSchema.parse(load(config))
+        parts = [subtree(config, "v9", index, tmp_path / "cache", destination) for index in range(len(schema.children))]
+        write(destination, config, stitch("v9", parts))
+        write(tmp_path / "serial.py", config, schema.types(patch=patch("v9"), apiversion="v9"))
+        assert destination.read_text() == (tmp_path / "serial.py").read_text()
+        return destination.read_text(), [line for _, _, explanation in parts for line in explanation]
+
+    _, explanation = generate()
+    assert explanation == [f"{destination}: /{path}: not cached" for path in ("storage", "pools", "version")]
+    assert generate()[1] == []
+
+    children = json.loads(config.read_text())
+    storage = next(child for child in children[0]["children"] if child["path"] == "/storage/{storage}")
+    storage["info"]["GET"]["returns"]["properties"] = {"storage": {"type": "string"}}
+    config.write_text(json.dumps(children))
+    assert generate()[1] == [
+        f"{destination}: /storage: descendant changed",
+        f"{destination}: /storage/{{storage}}: schema changed",
+    ]
+
+
+def test_patches_dispatch_on_registered_callpaths() -> None:
+    class Registered(Patch):
+        pass
+
+    seen: list[CallType] = []
+
+    @Registered.register(
+        "/version.info.GET.object",
+        "/pools/{poolid}.info.GET.object[members].array.object",
+        reason="Record",
+    )
+    def record(obj: CallType) -> None:
+        seen.append(obj)
+
+    with open("apidata/apidata-v9.json") as src:
+        schema = ApiSchema.parse([child for child in json.load(src) if child["path"] in ("/pools", "/version")])
+    for child in schema.children:
+        for item in child.walk():
+            item.visit(Registered())
+
+    assert [type(obj) for obj in seen] == [ApiSchemaItemInfoMethodReturnsObject] * 2
+    assert not Patch.registry.children
+    assert repr(Registered()(schema.children[0])) == schema.children[0].path
+
+
+def test_identical_returns_share_a_shape() -> None:
+    returns = {"type": "object", "properties": {"node": {"type": "string"}, "uptime": {"type": "integer", "optional": 1}}}
+    schema = ApiSchema.parse([
+        {
+            "path": path,
+            "text": path.strip("/"),
+            "leaf": 1,
+            "info": {"GET": {"method": "GET", "parameters": {"properties": None}, "returns": returns}},
+        }
+        for path in ("/first", "/second")
+    ])
+    code = str(schema.types(patch=Patch(), apiversion="v9"))
+    assert code.count("\nclass _Shape_") == 1
+
+    namespace: dict[str, Any] = {}
+    exec(code, namespace)
+    api = namespace["ProxmoxAPI"]
+    # Each endpoint declares its own types, only their common base is shared
+    assert api.First._Get.Model is not api.Second._Get.Model
+    assert api.First._Get.Model.__mro__[1] is api.Second._Get.Model.__mro__[1]
+    assert api.Second._Get.TypedDict.__required_keys__ == {"node"}
+    assert api.First._Get.Model(node="pve").node == "pve"
+    assert api.First._Get.Model.__name__ == "ProxmoxAPI.First._Get"
+    assert api.Second._Get.Model.__name__ == "ProxmoxAPI.Second._Get"
+    assert api.Second._Get.TypedDict.__qualname__ == "ProxmoxAPI.Second._Get.TypedDict"
+
+
+def test_versions_share_their_shapes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    data = apidata(tmp_path, "v8", "v9")
+    package = tmp_path / "generated"
+    for directory in (package, package / "v8", package / "v9"):
+        directory.mkdir()
+        (directory / "__init__.py").touch()
+
+    generate_all(data, stubs=None, types=str(package / "{apiversion}/core.py"), table=None, shapes=package / "shapes.py")
+
+    def defined(code: str) -> list[str]:
+        return re.findall(r"^class (_Shape_\w+):", code, re.MULTILINE)
+
+    inline = {
+        apiversion: defined(str(ApiSchema.parse(load(data / f"apidata-{apiversion}.json")).types(patch=patch(apiversion), apiversion=apiversion)))
+        for apiversion in ("v8", "v9")
+    }
+    shapes = defined((package / "shapes.py").read_text())
+    assert sorted(shapes) == sorted(set(inline["v8"]) | set(inline["v9"]))
+    assert len(shapes) < len(inline["v8"]) + len(inline["v9"])
+    assert not defined((package / "v9/core.py").read_text())
+
+    monkeypatch.syspath_prepend(tmp_path)
+    v8 = importlib.import_module("generated.v8.core")
+    v9 = importlib.import_module("generated.v9.core")
+    names = set(inline["v8"]) & set(inline["v9"])
+    assert names and all(getattr(v8, name) is getattr(v9, name) for name in names)
+    assert v8.BaseModel is v9.BaseModel
+
+
+def test_generated_code_is_laid_out_by_the_templates(tmp_path: Path) -> None:
+    data = apidata(tmp_path, "v9")
+    generate_all(
+        data, stubs=tmp_path / "core.pyi", types=str(tmp_path / "core.py"), table=str(tmp_path / "table.py"),
+        endpoints=str(tmp_path / "endpoints.py"), workers=1,
+    )
+
+    for name in ("core.py", "table.py", "endpoints.py", "core.pyi"):
+        code = (tmp_path / name).read_text()
+        ast.parse(code)
+        assert not re.search(r"[ \t]$", code, flags=re.MULTILINE)
+        assert not re.search(r":\n\n|\n\n\n\n", code)
+        assert code.endswith(")\n") or code.endswith("...\n") or code.endswith("}\n")
+
+    code = (tmp_path / "core.py").read_text()
+    assert re.search(r"\n( +)def __call__\(\n\1    self, \*args: Any, check: bool = True, \*\*kwargs: (Any|Unpack\[Params\])\n\1\) -> .+:\n", code)
+    assert re.search(r"\n( +)return typing\.cast\(\n\1    .+, data\n\1\)\n", code)
+    assert not any(line.startswith("def") and not line.endswith(":") for line in code.splitlines())
+
+
+def test_profile_measures_phases_and_subtrees(tmp_path: Path) -> None:
+    config = apidata(tmp_path, "v9") / "apidata-v9.json"
+    report = {"v9": profile(config, "v9")}
+
+    phases = report["v9"]["phases"]
+    assert list(phases) == [
+        "load", "parse", "patch", "render types", "render stubs", "render table", "total",
+    ]
+    assert list(report["v9"]["subtrees"]) == ["/storage", "/pools", "/version"]
+    assert all(list(measured) == ["patch", "render"] for measured in report["v9"]["subtrees"].values())
+    assert phases["total"]["peak"] >= max(measurement["peak"] for measurement in phases.values())
+    assert phases["total"]["seconds"] >= phases["render types"]["seconds"]
+
+    assert not list(regressions(report, report, tolerance=0))
+    slower = json.loads(json.dumps(report))
+    slower["v9"]["phases"]["render types"]["seconds"] += 1
+    slower["v9"]["subtrees"]["/pools"]["render"]["peak"] += 2**21
+    assert [line.split(":")[0] for line in regressions(slower, report, tolerance=0.25)] == [
+        "v9 render types seconds",
+        "v9 /pools render peak",
+    ]
+
+
+def test_shaking_keeps_the_endpoints_used(tmp_path: Path) -> None:
+    data = load(apidata(tmp_path, "v9") / "apidata-v9.json")
+    app = tmp_path / "app.py"
+    app.write_text(
+        "def main(api):\n"
+        "    api.storage(name).get.model()\n"
+        '    return resolve(api, "/pools/prod")\n'
+    )
+
+    keep = reachable(data, only=["/vers*"], sources=[app])
+    assert keep == {"/storage", "/storage/{storage}", "/pools", "/pools/{poolid}", "/version"}
+
+    keep = reachable(data, only=["/storage/{storage}"])
+    code = str(ApiSchema.parse(shake(data, keep)).types(patch=patch("v9"), apiversion="v9"))
+    namespace: dict[str, Any] = {}
+    exec(code, namespace)
+    api = namespace["ProxmoxAPI"]
+    assert api.Storage.Storage._Get
+    assert not hasattr(api, "Pools") and not hasattr(api, "Version")
+    # Counted in methods, the parameters of the storage endpoints kept make up most of the text
+    assert code.count("def __call__") < str(ApiSchema.parse(data).types(patch=patch("v9"), apiversion="v9")).count("def __call__") / 2
+
+
+def test_slim_stubs_declare_the_classes_of_the_types(tmp_path: Path) -> None:
+    data = apidata(tmp_path, "v9")
+    generate_all(data, stubs=None, types=str(tmp_path / "core.py"), table=None, workers=1, slim=True)
+
+    def classes(node: ast.AST, prefix: str = "") -> set[str]:
+        ret: set[str] = set()
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.ClassDef):
+                ret |= {prefix + child.name} | classes(child, f"{prefix}{child.name}.")
+        return ret
+
+    core = ast.parse((tmp_path / "core.py").read_text())
+    stubs = {path.stem: ast.parse(path.read_text()) for path in tmp_path.glob("*.pyi")}
+    assert sorted(stubs) == ["_pools", "_shapes", "_storage", "_version", "core"]
+    assert classes(core) == set().union(*map(classes, stubs.values()))
+    assert not [
+        node for stub in stubs.values() for node in ast.walk(stub)
+        if isinstance(node, ast.FunctionDef) and not isinstance(node.body[0].value, ast.Constant)  # type: ignore[attr-defined]
+    ]
+    assert "Pools: TypeAlias = _pools.ProxmoxAPI.Pools" in (tmp_path / "core.pyi").read_text()
@@ -0,0 +1,81 @@
+import pytest
+
+from proxmoxer_types.v9 import ProxmoxAPI, lite
+from proxmoxer_types.validation import UnknownParameterWarning, validator
+
+from conftest import Backend, Resource
+
+
+@pytest.fixture
+def lite_api(backend: Backend) -> lite.ProxmoxAPI:
+    api = lite.ProxmoxAPI(backend="local")
+    api.proxmox_api = Resource(backend)  # type: ignore[assignment]
+    return api
+
+
+CREATE = validator("proxmoxer_types.v9.core", "/nodes/{node}/qemu", "POST")
+
+
+def test_valid_parameters_pass() -> None:
+    CREATE({"vmid": 100, "cores": "2", "ostype": "l26", "start": True, "net0": "virtio,bridge=vmbr0"})
+    CREATE({"vmid": "4711", "description": None})
+
+
+@pytest.mark.parametrize(
+    "params, error",
+    [
+        ({}, "vmid: missing"),
+        ({"vmid": 100, "cores": "two"}, "cores: 'two' is not an integer"),
+        ({"vmid": 100, "cores": 0}, "cores: 0 is below 1"),
+        ({"vmid": 100, "ostype": "l27"}, "ostype: 'l27' is not one of"),
+        ({"vmid": 100, "start": "maybe"}, "start: 'maybe' is not a boolean"),
+        ({"vmid": 42}, "vmid: 42 is below 100"),
+    ],
+)
+def test_invalid_parameters_are_reported(params: dict[str, object], error: str) -> None:
+    with pytest.raises(ValueError, match="Invalid parameters for POST /nodes/{node}/qemu: " + error):
+        CREATE(params)
+
+
+def test_unknown_parameters_warn() -> None:
+    with pytest.warns(UnknownParameterWarning, match="Not parameters of POST /nodes/{node}/qemu in the schema, sent anyway: corse, netx"):
+        CREATE({"vmid": 100, "corse": 2, "netx": "virtio"})
+    with pytest.raises(ValueError, match="cores: 0 is below 1$"):
+        CREATE({"vmid": 100, "cores": 0, "corse": 2})
+
+
+def test_named_formats() -> None:
+    config = validator("proxmoxer_types.v9.core", "/nodes/{node}/qemu/{vmid}/config", "PUT")
+    config({"delete": "net0,ide2;scsi1"})
+    with pytest.raises(ValueError, match="'2net' in '2net,ide2' is not a valid pve-configid"):
+        config({"delete": "2net,ide2"})
+    migrate = validator("proxmoxer_types.v9.core", "/nodes/{node}/qemu/{vmid}/migrate", "POST")
+    migrate({"target": "pve-2"})
+    with pytest.raises(ValueError, match="'pve_2' is not a valid pve-node"):
+        migrate({"target": "pve_2"})
+
+
+def test_additional_parameters() -> None:
+    validator("proxmoxer_types.v9.core", "/nodes/{node}/qemu/{vmid}/agent", "GET")({"command": "ping", "extra": 1})
+
+
+def test_calls_check_before_sending(api: ProxmoxAPI, lite_api: lite.ProxmoxAPI, backend: Backend) -> None:
+    backend.routes[("POST", "/nodes/pve1/qemu")] = "UPID:pve1"
+    backend.routes[("GET", "/cluster/replication/100-0")] = {}
+    for each in (api, lite_api):
+        with pytest.raises(ValueError, match="cores: 0 is below 1"):
+            each.nodes("pve1").qemu.create(vmid=100, cores=0)
+        assert not backend.calls
+        assert each.nodes("pve1").qemu.create(vmid=100, cores=0, check=False) == "UPID:pve1"
+        assert backend.calls.pop() == ("POST", "/nodes/pve1/qemu", {"vmid": 100, "cores": 0})
+        with pytest.warns(UnknownParameterWarning, match="corse"):
+            each.cluster.replication("100-0").get(corse=2)  # type: ignore[call-arg]
+        assert backend.calls.pop() == ("GET", "/cluster/replication/100-0", {"corse": 2})
+
+
+def test_invalid_batch_fails_locally(api: ProxmoxAPI, backend: Backend) -> None:
+    create = api.nodes("pve1").qemu.create
+    for vmid in range(100, 10100):
+        with pytest.raises(ValueError):
+            create(vmid=vmid, cores=0)
+    assert not backend.calls
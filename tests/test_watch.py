@@ -0,0 +1,78 @@
+from proxmoxer_types.v9 import ProxmoxAPI
+from proxmoxer_types.watch import Event, Watcher
+
+from conftest import Backend
+
+
+def test_events(api: ProxmoxAPI, backend: Backend) -> None:
+    vm = {"id": "qemu/100", "type": "qemu", "node": "pve1", "status": "running"}
+    storage = {"id": "storage/pve1/local", "type": "storage", "node": "pve1"}
+    backend.routes[("GET", "/cluster/resources")] = [vm, storage]
+
+    watcher = Watcher(api)
+    seen: list[Event] = []
+    watcher.subscribe(seen.append)
+
+    assert [event.id for event in watcher.poll()] == ["qemu/100", "storage/pve1/local"]
+    assert backend.calls[-1][2] == {}
+
+    backend.routes[("GET", "/cluster/resources")] = [{**vm, "status": "stopped"}]
+    events = watcher.poll()
+    assert [(event.kind, event.id) for event in events] == [("changed", "qemu/100"), ("removed", "storage/pve1/local")]
+    assert events[0].changes == {"status": ("running", "stopped")}
+    assert seen[2:] == events
+
+    interval = watcher.interval
+    watcher.poll()
+    assert watcher.interval > interval
+
+
+def test_subscription_filters(api: ProxmoxAPI, backend: Backend) -> None:
+    vm = {"id": "qemu/100", "type": "qemu", "node": "pve1", "status": "running"}
+    backend.routes[("GET", "/cluster/resources")] = lambda params: [vm]
+
+    watcher = Watcher(api)
+    seen: list[Event] = []
+    watcher.subscribe(seen.append, type="vm", fields=["node"])
+    watcher.poll()
+    assert backend.calls[-1][2] == {"type": "vm"}
+
+    backend.routes[("GET", "/cluster/resources")] = lambda params: [{**vm, "status": "stopped"}]
+    watcher.poll()
+    assert len(seen) == 1
+
+    backend.routes[("GET", "/cluster/resources")] = lambda params: [{**vm, "node": "pve2"}]
+    watcher.poll()
+    assert seen[-1].changes == {"node": ("pve1", "pve2"), "status": ("stopped", "running")}
+
+
+def test_new_subscriptions_get_a_snapshot(api: ProxmoxAPI, backend: Backend) -> None:
+    vm = {"id": "qemu/100", "type": "qemu", "node": "pve1", "status": "running"}
+    storage = {"id": "storage/pve1/local", "type": "storage", "node": "pve1"}
+    backend.routes[("GET", "/cluster/resources")] = lambda params: [
+        row for row in (vm, storage) if params.get("type") in (None, "vm" if row is vm else "storage")
+    ]
+
+    watcher = Watcher(api)
+    vms: list[Event] = []
+    watcher.subscribe(vms.append, type="vm")
+    watcher.poll()
+    assert [event.id for event in vms] == ["qemu/100"]
+
+    # The unfiltered fetch replaces the typed one, only the new subscriber sees its resources
+    everything: list[Event] = []
+    subscription = watcher.subscribe(everything.append)
+    watcher.poll()
+    assert [(event.kind, event.id) for event in everything] == [("added", "qemu/100"), ("added", "storage/pve1/local")]
+    assert len(vms) == 1
+
+    # Another subscriber of an existing filter still gets its snapshot
+    storages: list[Event] = []
+    watcher.subscribe(storages.append, type="storage")
+    watcher.poll()
+    assert [event.id for event in storages] == ["storage/pve1/local"]
+    assert len(everything) == 2
+
+    watcher.unsubscribe(subscription)
+    watcher.poll()
+    assert (len(vms), len(everything), len(storages)) == (1, 2, 1)
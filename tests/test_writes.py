@@ -0,0 +1,88 @@
+from typing import Any
+
+import pytest
+
+from proxmoxer_types.configs import ConfigCache
+from proxmoxer_types.v9 import ProxmoxAPI
+from proxmoxer_types.writes import Batch, BatchError, changes
+
+from conftest import Backend
+
+CONFIG = "/nodes/{node}/qemu/{vmid}/config"
+NET = "virtio=BC:24:11:2E:6A:10,bridge=vmbr0,firewall=1"
+CURRENT = {"digest": "a", "cores": 2, "onboot": 1, "net0": NET, "name": "db", "tags": "prod"}
+
+
+def test_matching_values_are_not_written() -> None:
+    same = {"cores": "2", "onboot": True, "net0": "virtio=BC:24:11:2E:6A:10,firewall=on,bridge=vmbr0", "unused0": None}
+    assert changes("proxmoxer_types.v9.core", CONFIG, "PUT", CURRENT, same) is None
+    assert changes("proxmoxer_types.v9.core", CONFIG, "PUT", CURRENT, {"net0": {"model": "virtio", "macaddr": "BC:24:11:2E:6A:10", "bridge": "vmbr0", "firewall": True}}) is None
+
+
+def test_only_changes_are_written_with_the_digest() -> None:
+    desired = {"cores": 2, "memory": 4096, "net0": "virtio=BC:24:11:2E:6A:10,bridge=vmbr1,firewall=1", "tags": None}
+    assert changes("proxmoxer_types.v9.core", CONFIG, "PUT", CURRENT, desired) == {
+        "memory": 4096,
+        "net0": "virtio=BC:24:11:2E:6A:10,bridge=vmbr1,firewall=1",
+        "delete": "tags",
+        "digest": "a",
+    }
+
+
+def test_missing_keys_have_their_default() -> None:
+    assert changes("proxmoxer_types.v9.core", CONFIG, "PUT", CURRENT, {"protection": False, "numa": "0"}) is None
+    assert changes("proxmoxer_types.v9.core", CONFIG, "PUT", CURRENT, {"protection": True, "description": ""}) == {
+        "protection": True,
+        "description": "",
+        "digest": "a",
+    }
+
+
+def test_update_skips_the_call(api: ProxmoxAPI, backend: Backend) -> None:
+    backend.routes[("GET", "/nodes/pve1/qemu/100/config")] = CURRENT
+    backend.routes[("PUT", "/nodes/pve1/qemu/100/config")] = None
+    config = api.nodes("pve1").qemu(100).config
+    config.put.update(cores=2, name="db")
+    assert backend.calls == [("GET", "/nodes/pve1/qemu/100/config", {})]
+    config.put.update(current=CURRENT, cores=4)
+    assert backend.calls[-1] == ("PUT", "/nodes/pve1/qemu/100/config", {"cores": 4, "digest": "a"})
+
+
+def test_batches_merge_the_changes_of_a_config(api: ProxmoxAPI, backend: Backend) -> None:
+    configs: dict[int, dict[str, Any]] = {vmid: {**CURRENT, "digest": str(vmid)} for vmid in (100, 101)}
+    for vmid in configs:
+        backend.routes[("GET", f"/nodes/pve1/qemu/{vmid}/config")] = configs[vmid]
+        backend.routes[("PUT", f"/nodes/pve1/qemu/{vmid}/config")] = None
+    cache = ConfigCache(api)
+    batch = Batch(api, cache)
+    batch.set("/nodes/pve1/qemu/100/config", cores=4)
+    batch.set("/nodes/pve1/qemu/100/config", memory=2048, cores=8)
+    batch.set("/nodes/pve1/qemu/101/config", cores=2, onboot=1)
+
+    assert batch.flush() == {"/nodes/pve1/qemu/100/config": {"cores": 8, "memory": 2048, "digest": "100"}}
+    assert [call for call in backend.calls if call[0] == "PUT"] == [
+        ("PUT", "/nodes/pve1/qemu/100/config", {"cores": 8, "memory": 2048, "digest": "100"})
+    ]
+    assert (batch.sent, batch.skipped, batch.pending) == (1, 1, {})
+    assert cache.stale == {"/nodes/pve1/qemu/100/config"}
+
+
+def test_batches_report_every_failed_write(api: ProxmoxAPI, backend: Backend) -> None:
+    for vmid in (100, 101, 102):
+        backend.routes[("GET", f"/nodes/pve1/qemu/{vmid}/config")] = {**CURRENT, "digest": str(vmid)}
+    backend.routes[("PUT", "/nodes/pve1/qemu/101/config")] = None
+
+    def rejected(params: dict[str, Any]) -> None:
+        raise RuntimeError("digest mismatch")
+
+    backend.routes[("PUT", "/nodes/pve1/qemu/100/config")] = rejected
+    backend.routes[("PUT", "/nodes/pve1/qemu/102/config")] = rejected
+    batch = Batch(api)
+    for vmid in (100, 101, 102):
+        batch.set(f"/nodes/pve1/qemu/{vmid}/config", cores=4)
+
+    with pytest.raises(BatchError) as raised:
+        batch.flush()
+    assert sorted(raised.value.errors) == ["/nodes/pve1/qemu/100/config", "/nodes/pve1/qemu/102/config"]
+    assert raised.value.written == {"/nodes/pve1/qemu/101/config": {"cores": 4, "digest": "101"}}
+    assert sorted(batch.pending) == ["/nodes/pve1/qemu/100/config", "/nodes/pve1/qemu/102/config"]